@@ -5,3 +5,6 @@ if default := getattr(settings, 'USER_PROFILE_DEFAULT_THEME'):
     USER_PROFILE_DEFAULT_THEME = default
 else:
     USER_PROFILE_DEFAULT_THEME = 'dark'
+
+# Requests without user theme (API)
+USER_PROFILE_THEME_SKIP_PATHS = tuple(getattr(settings, 'USER_PROFILE_THEME_SKIP_PATHS', ('/api/',)))
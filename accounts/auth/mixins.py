@@ -92,6 +92,6 @@ class RoleMixin(LoginRequiredMixin):
         if not request.user.is_authenticated:
             return self.handle_no_permission()
         else:
-            if not roles.has_role(request.user, self.role):
+            if not roles.has_role(request.user, self.role, request.session):
                 raise Http404()
         return super().dispatch(request, *args, **kwargs)
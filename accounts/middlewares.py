@@ -2,28 +2,58 @@
 Page content request middleware
 """
 
-from accounts import app_settings
+from django.utils.functional import SimpleLazyObject
+
+from accounts import app_settings, versions
+
+# Session key of the user profile theme
+THEME_SESSION_KEY = '_user_theme'
+
+
+def get_theme(request):
+    """
+    User profile theme, kept in the session while the user profile version
+    (Redis) is unchanged (bumped when the profile is saved or deleted)
+    Default theme for anonymous users
+    Without Redis, the theme is loaded in every request
+    """
+    user = request.user
+    if not user.is_authenticated:
+        return app_settings.USER_PROFILE_DEFAULT_THEME
+
+    version = versions.get_version(versions.PROFILE, user.pk)
+    cached = request.session.get(THEME_SESSION_KEY) if version is not None else None
+    if cached and cached['user'] == user.pk and cached['version'] == version:
+        return cached['theme']
+
+    if profile := getattr(user, 'userprofile', None):
+        theme = profile.theme
+    else:
+        theme = app_settings.USER_PROFILE_DEFAULT_THEME
+    if version is not None:
+        request.session[THEME_SESSION_KEY] = {
+            'user': user.pk, 'version': version, 'theme': theme}
+    return theme
+
 
 class ThemeMiddleware:
     """
     User profile theme in request
     """
 
-    def __init__(self, get_response):   
+    def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
         """
         Insert color theme in request
+        Resolved only when used (e.g. by a template), API requests get the default
         """
 
-        if profile := getattr(request.user, 'userprofile', None):
-            theme = profile.theme
+        if request.path_info.startswith(app_settings.USER_PROFILE_THEME_SKIP_PATHS):
+            request.theme = app_settings.USER_PROFILE_DEFAULT_THEME
         else:
-            theme = app_settings.USER_PROFILE_DEFAULT_THEME
-
-        request.theme = theme
-
+            request.theme = SimpleLazyObject(lambda: get_theme(request))
 
         response = self.get_response(request)
 
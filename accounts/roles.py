@@ -2,12 +2,16 @@
 Helper methods to handle roles
 """
 
+from . import versions
 # Load Invitations from models. Loadin from .invitations causes error
 # as the model aren't loaded yet.
 from .models import UserRole, Roles, CustomInvitation as Invitation
 
 # TODO log undefined role?
 
+# Session key of the cached user roles
+ROLES_SESSION_KEY = '_user_roles'
+
 
 def create_user_role(user, role):
     """
@@ -17,20 +21,56 @@ def create_user_role(user, role):
     return UserRole.objects.create(user=user, role=role)
 
 
-def has_role(user, role):
+def get_user_roles(user, session=None):
+    """
+    Get the user roles set
+
+    Roles are loaded once per user object (request) and, if a session is
+    given, kept in the session while the user roles version (Redis) is
+    unchanged (bumped when a user role is saved or deleted)
+    Without Redis, roles are loaded in every request
+    """
+    if user is None or user.pk is None:
+        return frozenset()
+
+    roles = getattr(user, '_roles_cache', None)
+    if roles is not None:
+        return roles
+
+    version = versions.get_version(versions.ROLES, user.pk) if session is not None else None
+    cached = session.get(ROLES_SESSION_KEY) if version is not None else None
+    if cached and cached['user'] == user.pk and cached['version'] == version:
+        roles = frozenset(cached['roles'])
+    else:
+        # pylint: disable=no-member
+        roles = frozenset(UserRole.objects.filter(user=user).values_list('role', flat=True))
+        if version is not None:
+            session[ROLES_SESSION_KEY] = {
+                'user': user.pk, 'version': version, 'roles': sorted(roles)}
+
+    user._roles_cache = roles
+    return roles
+
+
+def clear_user_roles(user):
+    """
+    Clear the user object roles cache
+    """
+    user._roles_cache = None
+
+
+def has_role(user, role, session=None):
     """
     Check if user has role
     """
-    # pylint: disable=no-member
-    return UserRole.objects.filter(user=user, role=role).exists()
+    return role in get_user_roles(user, session)
 
 
-def has_role_in(user, role_list):
+def has_role_in(user, role_list, session=None):
     """
     Check if user has role
     """
-    # pylint: disable=no-member
-    return UserRole.objects.filter(user=user, role__in=role_list).exists()
+    return not get_user_roles(user, session).isdisjoint(role_list)
 
 
 def has_active_invitation(email):
@@ -0,0 +1,34 @@
+"""
+Accounts signals
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import roles, versions
+from .models import UserProfile, UserRole
+
+
+@receiver(post_save, sender=UserRole)
+@receiver(post_delete, sender=UserRole)
+#pylint: disable=unused-argument
+def user_roles_changed(sender, instance, **kwargs):
+    """
+    Bump the user roles version (invalidates the session cached roles)
+    """
+    versions.bump_version(versions.ROLES, instance.user_id)
+    # User object related to the role, if loaded (e.g. create_user_role)
+    # pylint: disable=protected-access
+    user = instance._state.fields_cache.get('user')
+    if user is not None:
+        roles.clear_user_roles(user)
+
+
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+#pylint: disable=unused-argument
+def user_profile_changed(sender, instance, **kwargs):
+    """
+    Bump the user profile version (invalidates the session cached theme)
+    """
+    versions.bump_version(versions.PROFILE, instance.user_id)
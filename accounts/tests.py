@@ -1,3 +1,204 @@
-from django.test import TestCase
+"""
+Accounts tests
+"""
 
-# Create your tests here.
+from unittest.mock import patch
+
+import redis
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.backends.db import SessionStore
+from django.http import Http404, HttpResponse
+from django.test import RequestFactory, TestCase
+from django.utils.functional import SimpleLazyObject
+from django.views import View
+
+from accounts import roles, versions
+from accounts.auth.mixins import RoleMixin
+from accounts.middlewares import THEME_SESSION_KEY, ThemeMiddleware
+from accounts.models import UserProfile, UserRole
+from accounts.views import ThemeView
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=no-member
+
+User = get_user_model()
+
+
+class FakeRedis:
+    """
+    Redis client get/set/incr in a dict
+    """
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = str(value).encode()
+        return True
+
+    def incr(self, key):
+        value = int(self.data.get(key, 0)) + 1
+        self.data[key] = str(value).encode()
+        return value
+
+
+class AdminView(RoleMixin, View):
+    """
+    Admin role view
+    """
+    role = roles.Roles.ADMIN
+
+    # pylint: disable=unused-argument
+    def get(self, request, *args, **kwargs):
+        return HttpResponse('ok')
+
+
+class TestRoleCache(TestCase):
+    """
+    User roles per request and session cache
+    """
+
+    def setUp(self) -> None:
+        self.redis = FakeRedis()
+        patcher = patch.object(versions, 'REDIS_CLIENT', self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        user = User.objects.create(username='ana', email='ana@example.com')
+        roles.create_user_role(user, roles.Roles.ADMIN)
+        self.session = SessionStore()
+        return super().setUp()
+
+    def request(self):
+        # New user object as loaded by the authentication middleware
+        request = RequestFactory().get('/')
+        request.user = User.objects.get(username='ana')
+        request.session = self.session
+        return request
+
+    def test_warm_session(self):
+        request = self.request()
+        with self.assertNumQueries(1):
+            self.assertEqual(AdminView.as_view()(request).status_code, 200)
+            self.assertFalse(roles.has_role(request.user, roles.Roles.CLIENT, request.session))
+            self.assertTrue(roles.has_role_in(
+                request.user, [roles.Roles.CLIENT, roles.Roles.ADMIN], request.session))
+
+        request = self.request()
+        with self.assertNumQueries(0):
+            self.assertEqual(AdminView.as_view()(request).status_code, 200)
+            self.assertTrue(roles.has_role(request.user, roles.Roles.ADMIN, request.session))
+            self.assertFalse(roles.has_role_in(
+                request.user, [roles.Roles.CLIENT, roles.Roles.BROKER], request.session))
+
+    def test_invalidate(self):
+        request = self.request()
+        self.assertFalse(roles.has_role(request.user, roles.Roles.CLIENT, request.session))
+
+        # Same request user
+        roles.create_user_role(request.user, roles.Roles.CLIENT)
+        self.assertTrue(roles.has_role(request.user, roles.Roles.CLIENT, request.session))
+
+        # Role deleted elsewhere (e.g. admin)
+        UserRole.objects.get(user__username='ana', role=roles.Roles.ADMIN).delete()
+        request = self.request()
+        with self.assertRaises(Http404):
+            AdminView.as_view()(request)
+        self.assertTrue(roles.has_role(request.user, roles.Roles.CLIENT, request.session))
+
+
+    def test_committed_role_change(self):
+        request = self.request()
+        self.assertFalse(roles.has_role(request.user, roles.Roles.CLIENT, request.session))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            user = User.objects.get(username='ana')
+            roles.create_user_role(user, roles.Roles.CLIENT)
+            # Read by other request (transaction) before the commit
+            self.session[roles.ROLES_SESSION_KEY] = {
+                'user': user.pk, 'version': versions.get_version(versions.ROLES, user.pk),
+                'roles': [roles.Roles.ADMIN]}
+
+        request = self.request()
+        self.assertTrue(roles.has_role(request.user, roles.Roles.CLIENT, request.session))
+
+    def test_without_redis(self):
+        request = self.request()
+        with patch.object(self.redis, 'get', side_effect=redis.ConnectionError), \
+                patch.object(self.redis, 'incr', side_effect=redis.ConnectionError):
+            with self.assertNumQueries(1):
+                self.assertTrue(roles.has_role(request.user, roles.Roles.ADMIN, request.session))
+            self.assertNotIn(roles.ROLES_SESSION_KEY, request.session)
+
+            UserRole.objects.filter(user__username='ana').delete()
+            request = self.request()
+            self.assertFalse(roles.has_role(request.user, roles.Roles.ADMIN, request.session))
+
+
+class TestThemeMiddleware(TestCase):
+    """
+    Lazy user profile theme kept in the session
+    """
+
+    def setUp(self) -> None:
+        self.redis = FakeRedis()
+        patcher = patch.object(versions, 'REDIS_CLIENT', self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.user = User.objects.create(username='ana', email='ana@example.com')
+        UserProfile.objects.create(user=self.user, theme=UserProfile.Theme.LIGHT)
+        self.session = SessionStore()
+        return super().setUp()
+
+    def request(self, path='/'):
+        # User loaded only when used, as by the authentication middleware
+        request = RequestFactory().get(path)
+        request.user = SimpleLazyObject(lambda: User.objects.get(username='ana'))
+        request.session = self.session
+        ThemeMiddleware(lambda request: None)(request)
+        return request
+
+    def test_lazy(self):
+        with self.assertNumQueries(0):
+            request = self.request()
+            api_request = self.request('/api/v1/')
+            self.assertEqual(api_request.theme, 'dark')
+
+        with self.assertNumQueries(2):
+            self.assertEqual(str(request.theme), 'light')
+
+        # Warm session: only the user is loaded
+        with self.assertNumQueries(1):
+            self.assertEqual(str(self.request().theme), 'light')
+
+    def test_profile_save(self):
+        request = RequestFactory().post('/', {'theme': 'on'})
+        request.user = self.user
+        request.session = self.session
+        request.META['HTTP_REFERER'] = '/'
+        str(self.request().theme)
+
+        ThemeView.as_view()(request)
+        self.assertEqual(str(self.request().theme), 'dark')
+
+    def test_profile_changed_elsewhere(self):
+        self.assertEqual(str(self.request().theme), 'light')
+
+        # e.g. admin
+        profile = UserProfile.objects.get(user=self.user)
+        profile.theme = UserProfile.Theme.DARK
+        with self.captureOnCommitCallbacks(execute=True):
+            profile.save()
+        with self.assertNumQueries(2):
+            self.assertEqual(str(self.request().theme), 'dark')
+
+    def test_without_redis(self):
+        with patch.object(self.redis, 'get', side_effect=redis.ConnectionError):
+            self.assertEqual(str(self.request().theme), 'light')
+            self.assertNotIn(THEME_SESSION_KEY, self.session)
+            with self.assertNumQueries(2):
+                self.assertEqual(str(self.request().theme), 'light')
@@ -0,0 +1,48 @@
+"""
+User data versions kept in Redis
+
+Session cached user data (roles, profile theme) is stored with the version
+of the data and reloaded when the version changes. Versions are bumped by
+the signals of the models (accounts.signals).
+"""
+
+import redis
+from django.db import transaction
+
+from scheduler.lock import REDIS_CLIENT
+
+ROLES = 'accounts:roles:version'
+PROFILE = 'accounts:profile:version'
+
+
+def get_version(name, user_id):
+    """
+    User data version, None if Redis is not available
+    A missing version is created, so it is compared as any other version
+    """
+    key = f'{name}:{user_id}'
+    try:
+        version = REDIS_CLIENT.get(key)
+        if version is None:
+            REDIS_CLIENT.set(key, 0, nx=True)
+            version = REDIS_CLIENT.get(key)
+        return int(version)
+    except redis.RedisError:
+        return None
+
+
+def bump_version(name, user_id):
+    """
+    Invalidate the session cached user data
+    Bumped again when committed: data read by other requests before the
+    commit is not kept under the new version
+    """
+    _incr(name, user_id)
+    transaction.on_commit(lambda: _incr(name, user_id))
+
+
+def _incr(name, user_id):
+    try:
+        REDIS_CLIENT.incr(f'{name}:{user_id}')
+    except redis.RedisError:
+        pass
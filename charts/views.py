@@ -34,7 +34,7 @@ class   ChartJsonView(View):
                     {
                         'div_id': chart_data.div_id,
                         'type': chart_data.chart.chart_type,
-                        'data': chart_data.chart.get_json_data(request.theme)
+                        'data': chart_data.chart.get_json_data(str(request.theme))
                     }
                 )
 
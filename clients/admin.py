@@ -5,7 +5,7 @@ Admin models
 from django.contrib import admin
 from simple_history.admin import SimpleHistoryAdmin
 
-from .models import Client
+from .models import AnniversaryEmail, Client
 
 
 @admin.register(Client)
@@ -13,3 +13,13 @@ class ClientAdmin(SimpleHistoryAdmin):
     """
     Admin client model
     """
+
+
+@admin.register(AnniversaryEmail)
+class AnniversaryEmailAdmin(admin.ModelAdmin):
+    """
+    Anniversary email records
+    """
+    list_display = ['date', 'client', 'sent', 'date_sent', 'attempts', 'error_message']
+    list_filter = ['date', 'sent']
+    raw_id_fields = ['client']
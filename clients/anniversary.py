@@ -0,0 +1,151 @@
+"""
+Client anniversary emails
+"""
+
+import smtplib
+from collections import namedtuple
+
+from allauth.account.adapter import DefaultAccountAdapter
+from celery.utils.log import get_task_logger
+from django.db.models import CharField, F, Value
+from django.db.models.functions import Concat
+from django.utils import timezone
+
+from core.email import SenderPool, TemplateMessageFactory, close_connection
+
+from .models import AnniversaryEmail, Client
+
+logger = get_task_logger(__name__)
+
+# Anniversary email data streamed from database
+Recipient = namedtuple('Recipient', ['pk', 'email', 'name', 'attempts'])
+
+
+class AnniversaryEmailSender:
+    """
+    Send the anniversary email to active clients born in date (day and month)
+
+    An AnniversaryEmail record is created for each client before sending (one
+    per client and date): running again only sends the not sent ones, while
+    their attempts are under max_attempts.
+    Records are streamed in chunks (keyset pagination), messages are rendered
+    as they are sent (templates compiled once) and chunks are sent by a pool
+    of SMTP connections. Records status is updated by the calling thread.
+    """
+
+    template_prefix = 'clients/email/client_anniversary'
+
+    def __init__(self, date=None, workers=1, chunk_size=50, max_attempts=3):
+        self.date = date or timezone.localdate(timezone.now())
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.max_attempts = max_attempts
+        self.message_factory = None
+        self.task_lock = None
+        self.sent = 0
+        self.failed = 0
+
+    def clients(self):
+        """
+        Active clients with anniversary in date (client_birth_month_day_idx)
+        """
+        # pylint: disable=no-member
+        return Client.objects.filter(
+            birth_date__month=self.date.month,
+            birth_date__day=self.date.day,
+            user__is_active=True
+        )
+
+    def create_records(self):
+        """
+        Create the date records of clients without one
+        Return the number of records created
+        """
+        client_pks = list(self.clients().exclude(
+            anniversaryemail__date=self.date).values_list('pk', flat=True))
+        # pylint: disable=no-member
+        AnniversaryEmail.objects.bulk_create(
+            [AnniversaryEmail(client_id=pk, date=self.date) for pk in client_pks],
+            batch_size=1000, ignore_conflicts=True)
+        return len(client_pks)
+
+    def send(self, task_lock=None):
+        """
+        Send not sent emails of date, return (sent, failed)
+        The task lock, if given, is renewed as chunks are done
+        """
+        self.task_lock = task_lock
+        created = self.create_records()
+        logger.info('Email anniversary: %s new clients', created)
+
+        self.message_factory = TemplateMessageFactory(
+            self.template_prefix, DefaultAccountAdapter())
+        SenderPool(self._send_chunk, self.workers).run(self._chunks(), self._chunk_done)
+
+        logger.info('Email anniversary: (%s) emails sent, (%s) failed', self.sent, self.failed)
+        return self.sent, self.failed
+
+    def _chunks(self):
+        """
+        Stream (chunk number, recipients) of not sent emails under max attempts
+        """
+        # pylint: disable=no-member
+        queryset = AnniversaryEmail.objects.filter(
+            date=self.date, sent=False, attempts__lt=self.max_attempts
+        ).annotate(
+            name=Concat('client__user__first_name', Value(' '), 'client__user__last_name',
+                        output_field=CharField())
+        ).order_by('pk').values_list('pk', 'client__user__email', 'name', 'attempts')
+
+        last_pk = 0
+        chunk = 0
+        while True:
+            recipients = [Recipient(*row) for row in queryset.filter(
+                pk__gt=last_pk)[:self.chunk_size]]
+            if not recipients:
+                break
+            yield chunk, recipients
+            last_pk = recipients[-1].pk
+            chunk += 1
+
+    def _send_chunk(self, connection, recipients):
+        """
+        Render and send one message per recipient over the connection
+        Return sent recipients and (recipient, error) failures
+        """
+        sent = []
+        failures = []
+        for recipient in recipients:
+            message = self.message_factory.message(
+                recipient.email, {'name': recipient.name, 'email': recipient.email})
+            try:
+                connection.open()
+                connection.send_messages([message])
+                sent.append(recipient)
+            except (smtplib.SMTPException, OSError) as exc:
+                logger.info('Email anniversary: error (%s)', str(exc))
+                failures.append((recipient, exc))
+                # Dropped connection: reopened by the next message
+                if isinstance(exc, smtplib.SMTPServerDisconnected) or \
+                        not isinstance(exc, smtplib.SMTPException):
+                    close_connection(connection)
+        return sent, failures
+
+    def _chunk_done(self, chunk, result):
+        # pylint: disable=no-member
+        sent, failures = result
+        if sent:
+            AnniversaryEmail.objects.filter(
+                pk__in=[recipient.pk for recipient in sent]
+            ).update(sent=True, date_sent=timezone.now(), error_message=None,
+                     attempts=F('attempts') + 1)
+        if failures:
+            AnniversaryEmail.objects.bulk_update(
+                [AnniversaryEmail(pk=recipient.pk, error_message=str(exc),
+                                  attempts=recipient.attempts + 1)
+                 for recipient, exc in failures], ['error_message', 'attempts'])
+        self.sent += len(sent)
+        self.failed += len(failures)
+        if self.task_lock:
+            self.task_lock.reacquire()
+        logger.debug('Email anniversary: chunk %s done', chunk)
@@ -0,0 +1,47 @@
+# Generated by Django 3.2 on 2026-10-18 14:49
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.db.models.functions.datetime
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnniversaryEmail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='Data')),
+                ('sent', models.BooleanField(default=False, verbose_name='Enviado')),
+                ('date_sent', models.DateTimeField(blank=True, null=True, verbose_name='Data de envio')),
+                ('error_message', models.TextField(blank=True, null=True, verbose_name='Mensagem de erro')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='Tentativas')),
+            ],
+            options={
+                'verbose_name': 'Email de aniversário',
+                'verbose_name_plural': 'Emails de aniversário',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(django.db.models.functions.datetime.ExtractMonth('birth_date'), django.db.models.functions.datetime.ExtractDay('birth_date'), name='client_birth_month_day_idx'),
+        ),
+        migrations.AddField(
+            model_name='anniversaryemail',
+            name='client',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='clients.client', verbose_name='Cliente'),
+        ),
+        migrations.AddIndex(
+            model_name='anniversaryemail',
+            index=models.Index(fields=['date', 'id'], name='anniversaryemail_date_id_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='anniversaryemail',
+            constraint=models.UniqueConstraint(fields=('client', 'date'), name='unique_anniversary_email_client_date'),
+        ),
+    ]
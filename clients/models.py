@@ -6,6 +6,7 @@ from allauth.account.models import EmailAddress
 from django.conf import settings
 from django.core.validators import FileExtensionValidator
 from django.db import models
+from django.db.models.functions import ExtractDay, ExtractMonth
 from simple_history.models import HistoricalRecords
 
 from accounts import roles as account_roles
@@ -150,6 +151,12 @@ class Client(ClientBase):
         verbose_name = 'Cliente'
         verbose_name_plural = 'Clientes'
 
+        indexes = [
+            # Anniversary query (birth_date__month and birth_date__day)
+            models.Index(ExtractMonth('birth_date'), ExtractDay('birth_date'),
+                         name='client_birth_month_day_idx'),
+        ]
+
     task_name = 'Aprovação de cadastro de cliente'
     form_view = 'core:client_update'
 
@@ -253,3 +260,39 @@ class Client(ClientBase):
     def __str__(self) -> str:
         # pylint: disable=no-member
         return f'{self.user.get_full_name()} - {self.user.email}'
+
+
+class AnniversaryEmail(models.Model):
+    """
+    Anniversary email of a client in a date
+    Idempotency record: created before sending, a client gets one email per day
+    even if the anniversary task runs again
+    """
+
+    class Meta:
+        """
+        Meta class
+        """
+        verbose_name = 'Email de aniversário'
+        verbose_name_plural = 'Emails de aniversário'
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=['client', 'date'], name='unique_anniversary_email_client_date')
+        ]
+        indexes = [
+            # Keyset pagination of the day emails
+            models.Index(fields=['date', 'id'], name='anniversaryemail_date_id_idx'),
+        ]
+
+    client = models.ForeignKey(Client, verbose_name='Cliente', on_delete=models.CASCADE)
+    date = models.DateField(verbose_name='Data')
+    sent = models.BooleanField(verbose_name='Enviado', default=False)
+    date_sent = models.DateTimeField(verbose_name='Data de envio', null=True, blank=True)
+    error_message = models.TextField(
+        verbose_name='Mensagem de erro', null=True, blank=True)
+    # Failed records are sent again until ANNIVERSARY_EMAIL_MAX_ATTEMPTS
+    attempts = models.PositiveSmallIntegerField(verbose_name='Tentativas', default=0)
+
+    def __str__(self) -> str:
+        return f'{self.client} - {self.date}'
@@ -2,17 +2,14 @@
 Client backgroud tasks
 """
 
-import smtplib
-
-from allauth.account.adapter import DefaultAccountAdapter
 from celery import shared_task
 from celery.utils.log import get_task_logger
-from django.core import mail
-from django.db.models import CharField, F, Value
-from django.db.models.functions import Concat
+from django.conf import settings
 from django.utils import timezone
 
-from clients.models import Client
+from scheduler import lock
+
+from .anniversary import AnniversaryEmailSender
 
 logger = get_task_logger(__name__)
 
@@ -21,54 +18,13 @@ logger = get_task_logger(__name__)
 def send_anniversary_email():
     """
     Send anniversary email to active clients
+    Emails already sent today are not sent again (AnniversaryEmail records)
     """
-    today = timezone.datetime.now()
-    month = today.month
-    day = today.day
-
-    # pylint: disable=no-member
-    clients = Client.objects.filter(
-        birth_date__month=month,
-        birth_date__day=day,
-        user__is_active=True
-    ).annotate(
-        email=F('user__email'),
-        name=Concat(
-            'user__first_name',
-            Value(' '),
-            'user__last_name',
-            output_field=CharField())).values('email', 'name')
-
-    if clients:
-        template_prexix = 'clients/email/client_anniversary'
-        email_list = []
-        adapter = DefaultAccountAdapter()
-
-        for client in clients:
-            context = {
-                'name': client['name'],
-                'email': client['email']
-            }
-            msg = adapter.render_mail(
-                template_prefix=template_prexix,
-                email=client['email'],
-                context=context
-            )
-            email_list.append(msg)
-
-        connection = mail.get_connection()
-        connection.open()
-        sent_count = 0
-
-        for message in email_list:
-            try:
-                sent_count += message.send()
-            except smtplib.SMTPException as exc:
-                logger.info('Email anniversary: error (%s)', str(exc))
-            except ConnectionRefusedError as exc:
-                logger.info('Email anniversary: error (%s)', str(exc))
-
-        logger.info('Email anniversary:  (%s) emails sent', sent_count)
-        connection.close()
-    else:
-        logger.info('Email anniversary: no clients anniversary email to send')
+    sender = AnniversaryEmailSender(
+        timezone.localdate(timezone.now()),
+        workers=settings.ANNIVERSARY_EMAIL_WORKERS,
+        chunk_size=settings.EMAIL_BATCH_CHUNK_SIZE,
+        max_attempts=settings.ANNIVERSARY_EMAIL_MAX_ATTEMPTS)
+
+    key = f'anniversary_email_{sender.date.isoformat()}'
+    lock.lock_task(sender.send, key=key, timeout=settings.EMAIL_BATCH_LOCK_TIMEOUT, bind=True)()
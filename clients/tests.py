@@ -1,3 +1,94 @@
-from django.test import TestCase
+"""
+Clients tests
+"""
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from clients.anniversary import AnniversaryEmailSender
+from clients.models import AnniversaryEmail, Client
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=no-member
+
+User = get_user_model()
+
+
+class TestAnniversaryEmail(TestCase):
+    """
+    Anniversary emails sending and idempotency records
+    """
+
+    fixtures = ['core/fixtures/users.json']
+
+    def setUp(self) -> None:
+        self.date = timezone.datetime(2022, 8, 15).date()
+        operator = User.objects.get(pk=1)
+        birth_dates = {
+            'ana': timezone.datetime(1980, 8, 15).date(),
+            'bia': timezone.datetime(1991, 8, 15).date(),
+            'fail': timezone.datetime(1975, 8, 15).date(),
+            'inactive': timezone.datetime(1985, 8, 15).date(),
+            'other': timezone.datetime(1980, 8, 16).date(),
+            'none': None,
+        }
+        users = [
+            User.objects.create(
+                username=name, email=f'{name}@example.com', first_name=name.title(),
+                last_name='Silva', is_active=name != 'inactive')
+            for name in birth_dates
+        ]
+        Client.objects.bulk_create([
+            Client(user=user, first_name=user.first_name, last_name=user.last_name,
+                   birth_date=birth_dates[user.username], operator=operator)
+            for user in users
+        ])
+        return super().setUp()
+
+    def test_send(self):
+        sender = AnniversaryEmailSender(self.date, workers=2, chunk_size=2)
+
+        self.assertEqual(sender.send(), (3, 0))
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox),
+                         ['ana@example.com', 'bia@example.com', 'fail@example.com'])
+        message = next(message for message in mail.outbox if message.to[0] == 'ana@example.com')
+        self.assertIn('Ana Silva', message.body)
+        self.assertEqual(AnniversaryEmail.objects.filter(date=self.date, sent=True).count(), 3)
+
+        # Running again does not send twice
+        mail.outbox.clear()
+        self.assertEqual(AnniversaryEmailSender(self.date).send(), (0, 0))
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(AnniversaryEmail.objects.count(), 3)
+
+    @override_settings(EMAIL_BACKEND='core.tests.FailingEmailBackend')
+    def test_resend_failed(self):
+        self.assertEqual(AnniversaryEmailSender(self.date).send(), (2, 1))
+        failed = AnniversaryEmail.objects.get(sent=False)
+        self.assertEqual(failed.client.user.username, 'fail')
+        self.assertIn('Refused', failed.error_message)
+
+        mail.outbox.clear()
+        with override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend'):
+            self.assertEqual(AnniversaryEmailSender(self.date).send(), (1, 0))
+        self.assertEqual([message.to[0] for message in mail.outbox], ['fail@example.com'])
+        self.assertFalse(AnniversaryEmail.objects.filter(sent=False).exists())
+        self.assertEqual(AnniversaryEmail.objects.get(client__user__username='fail').attempts, 2)
+
+    @override_settings(EMAIL_BACKEND='core.tests.FailingEmailBackend')
+    def test_max_attempts(self):
+        self.assertEqual(AnniversaryEmailSender(self.date, max_attempts=2).send(), (2, 1))
+        self.assertEqual(AnniversaryEmailSender(self.date, max_attempts=2).send(), (0, 1))
+        failed = AnniversaryEmail.objects.get(sent=False)
+        self.assertEqual(failed.attempts, 2)
+
+        # Not sent again after the attempts limit
+        mail.outbox.clear()
+        with override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend'):
+            self.assertEqual(AnniversaryEmailSender(self.date, max_attempts=2).send(), (0, 0))
+        self.assertEqual(len(mail.outbox), 0)
+        failed.refresh_from_db()
+        self.assertEqual(failed.attempts, 2)
+        self.assertFalse(failed.sent)
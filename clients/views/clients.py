@@ -20,6 +20,7 @@ from common.messages import message_modal_add
 from common.views import generic, mixins
 
 from core import models as core_models
+from core.company import get_company
 from core import workflow
 from investment import models as invest_models
 from investment.views import application as invest_views, bank
@@ -70,7 +71,7 @@ class StartView(CompleteSignUpMixin,
                     application = app_acc.application
                     app_class = application.application_class
                     template = app_class.get_widget_template(
-                        app_acc, self.request.theme)
+                        app_acc, str(self.request.theme))
                     if template:
                         widgets.append(
                             {
@@ -243,7 +244,7 @@ class ProductsView(CompleteSignUpMixin,
 
         for product in products:
             product.application_info = product.application.application_class.get_application_info(
-                product.application, self.request.theme)
+                product.application, str(self.request.theme))
 
         return products
 
@@ -272,7 +273,7 @@ class ProductsPurchaseView(ProductsView):
 
         # get removes application_info
         product.application_info = product.application.application_class.get_application_info(
-            product.application, self.request.theme)
+            product.application, str(self.request.theme))
 
         context['product'] = product
         if investor_profile := self.request.user.investorprofile_set.last():
@@ -666,7 +667,7 @@ class ClientDocsView(auth_mixins.LoginRequiredMixin, generic.FileBaseView):
     def can_access_file(self, request):
         user = request.user
         roles = [accounts_roles.Roles.ADMIN, accounts_roles.Roles.CLIENT]
-        if accounts_roles.has_role_in(user, roles):
+        if accounts_roles.has_role_in(user, roles, request.session):
             return True
         return False
 
@@ -693,9 +694,9 @@ class ClientDocsView(auth_mixins.LoginRequiredMixin, generic.FileBaseView):
 
         user = request.user
 
-        if accounts_roles.has_role(user, accounts_roles.Roles.ADMIN):
+        if accounts_roles.has_role(user, accounts_roles.Roles.ADMIN, request.session):
             return query
-        elif accounts_roles.has_role(user, accounts_roles.Roles.CLIENT):
+        elif accounts_roles.has_role(user, accounts_roles.Roles.CLIENT, request.session):
             return query.filter(user=user)
         return query.none()
 
@@ -722,7 +723,7 @@ class HelpView(CompleteSignUpMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         # pylint: disable=no-member
-        context['company'] = core_models.Company.objects.last()
+        context['company'] = get_company()
         context['faq'] = core_models.FAQConfig.get_faq(target_page=core_models.FAQConfig.Page.CLIENT)
         return context
 
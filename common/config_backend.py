@@ -0,0 +1,130 @@
+"""
+Django constance database backend with an in-process snapshot
+
+All config values are loaded with one query into a process local snapshot and
+reads are served from memory. Writes (config setattr, constance admin) bump a
+version stamp in Redis when committed; other processes compare their snapshot
+version with the stamp at most every CONSTANCE_SNAPSHOT_CHECK_INTERVAL seconds
+and reload lazily when it has changed. Without Redis, the snapshot is reloaded
+every interval.
+
+Missing keys are served with the CONSTANCE_CONFIG default (not written to the
+database on first read).
+"""
+
+import threading
+import time
+
+import redis
+from constance import settings as constance_settings
+from constance.backends.database import DatabaseBackend
+from django.conf import settings
+from django.db import OperationalError, ProgrammingError, connection, transaction
+
+from scheduler.lock import REDIS_CLIENT
+
+
+class SnapshotDatabaseBackend(DatabaseBackend):
+    """
+    Database backend reading from a versioned in-process snapshot
+    """
+
+    version_key = 'constance:version'
+
+    def __init__(self):
+        self._snapshot = None
+        self._version = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+        # Writes not committed yet in the current thread
+        self._local = threading.local()
+        self.check_interval = getattr(settings, 'CONSTANCE_SNAPSHOT_CHECK_INTERVAL', 1.0)
+        super().__init__()
+
+    def get(self, key):
+        return self.snapshot().get(key)
+
+    def mget(self, keys):
+        snapshot = self.snapshot()
+        for key in keys:
+            if key in snapshot:
+                yield key, snapshot[key]
+
+    def snapshot(self):
+        """
+        Config values, reloaded if the version stamp changed
+        """
+        if getattr(self._local, 'pending', False):
+            if connection.in_atomic_block:
+                # Read own writes inside the writing transaction
+                return self._load() or self._defaults()
+            # Rolled back (committed writes clear pending in on_commit)
+            self._local.pending = False
+            self.invalidate()
+
+        now = time.monotonic()
+        snapshot = self._snapshot
+        if snapshot is not None and now - self._checked < self.check_interval:
+            return snapshot
+
+        version = self.stored_version()
+        with self._lock:
+            if self._snapshot is None or version is None or version != self._version:
+                snapshot = self._load()
+                if snapshot is None:
+                    # Database not ready: defaults only, not kept
+                    return self._defaults()
+                self._snapshot = snapshot
+                self._version = version
+            self._checked = now
+            return self._snapshot
+
+    def invalidate(self):
+        """
+        Reload the snapshot in the next read
+        """
+        self._snapshot = None
+
+    def stored_version(self):
+        """
+        Version stamp, None if Redis is not available
+        A missing stamp is created, so it is compared as any other version
+        """
+        try:
+            version = REDIS_CLIENT.get(self.version_key)
+            if version is None:
+                REDIS_CLIENT.set(self.version_key, 0, nx=True)
+                version = REDIS_CLIENT.get(self.version_key)
+            return version
+        except redis.RedisError:
+            return None
+
+    def clear(self, sender, instance, created, **kwargs):
+        super().clear(sender, instance, created, **kwargs)
+        self._local.pending = True
+        self.invalidate()
+        transaction.on_commit(self._committed)
+
+    def _committed(self):
+        self._local.pending = False
+        self.invalidate()
+        try:
+            REDIS_CLIENT.incr(self.version_key)
+        except redis.RedisError:
+            pass
+
+    def _defaults(self):
+        return {key: options[0] for key, options in constance_settings.CONFIG.items()}
+
+    def _load(self):
+        snapshot = self._defaults()
+        prefix = self._prefix
+        try:
+            # pylint: disable=protected-access
+            stored = self._model._default_manager.filter(
+                key__startswith=prefix).values_list('key', 'value')
+            for key, value in stored:
+                snapshot[key[len(prefix):]] = value
+        except (OperationalError, ProgrammingError):
+            return None
+        return snapshot
@@ -0,0 +1,87 @@
+"""
+Helper module to deal with dates
+
+Date ranges are half-open [start, end) aware datetimes in the current
+time zone. Filtering with them (field__gte=start, field__lt=end) is
+sargable: unlike __year/__month/__day/__date lookups, the database can
+use indexes on the field and prune partitions.
+"""
+
+from django.utils import timezone
+
+
+def local_midnight(date):
+    """
+    Aware datetime of the date start in the current time zone
+    """
+    return timezone.make_aware(timezone.datetime.combine(date, timezone.datetime.min.time()))
+
+
+def to_local_date(date):
+    """
+    Date of a date or datetime (aware datetimes in the current time zone)
+    """
+    if isinstance(date, timezone.datetime):
+        return timezone.localdate(date) if timezone.is_aware(date) else date.date()
+    return date
+
+
+def add_months(date, months):
+    """
+    Start of the month of the date shifted by months
+    """
+    date = to_local_date(date)
+    month_index = date.year * 12 + date.month - 1 + months
+    return local_midnight(timezone.datetime(month_index // 12, month_index % 12 + 1, 1).date())
+
+
+def day_range(date):
+    """
+    [start, end) range of the date day
+    """
+    date = to_local_date(date)
+    return local_midnight(date), local_midnight(date + timezone.timedelta(days=1))
+
+
+class MonthWindow:
+    """
+    [start, end) range of a month
+    """
+
+    def __init__(self, date):
+        self.start = add_months(date, 0)
+        self.end = add_months(date, 1)
+
+    def __repr__(self):
+        return f'MonthWindow({self.start.isoformat()}, {self.end.isoformat()})'
+
+    def __eq__(self, other):
+        return isinstance(other, MonthWindow) and \
+            (self.start, self.end) == (other.start, other.end)
+
+    @property
+    def previous(self):
+        """
+        Previous month window (year is adjusted in January)
+        """
+        return MonthWindow(add_months(self.start, -1))
+
+    @property
+    def first_day(self):
+        """
+        [start, end) range of the month first day
+        """
+        return day_range(self.start)
+
+    def lookups(self, field):
+        """
+        Filter keyword arguments: field in the month
+        """
+        return {f'{field}__gte': self.start, f'{field}__lt': self.end}
+
+    def first_day_lookups(self, field):
+        """
+        Filter keyword arguments: field in the month first day
+        """
+        start, end = self.first_day
+        return {f'{field}__gte': start, f'{field}__lt': end}
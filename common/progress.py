@@ -0,0 +1,70 @@
+"""
+Helper module to report progress of long jobs
+"""
+
+import time
+from collections import Counter
+
+
+class ProgressReporter:
+    """
+    Coalesced progress reporter
+
+    Counters are accumulated in memory and passed to flush_callback (a dict of
+    counter: increment) at most every interval_ms or when max_count increments
+    are pending. Closing the reporter (or leaving its context) always flushes.
+
+    Usage:
+        with ProgressReporter(save_and_notify, interval_ms=1000) as progress:
+            for item in items:
+                ...
+                progress.add(sent=1)
+    """
+
+    def __init__(self, flush_callback: callable, interval_ms=1000, max_count=500,
+                 clock: callable = time.monotonic):
+        self.flush_callback = flush_callback
+        self.interval = interval_ms / 1000
+        self.max_count = max_count
+        self.clock = clock
+        self.pending = Counter()
+        self.totals = Counter()
+        self.flushes = 0
+        self._last_flush = clock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add(self, **counters):
+        """
+        Increment counters, flush if due
+        """
+        self.pending.update(counters)
+        if self._flush_due():
+            self.flush()
+
+    def flush(self):
+        """
+        Flush pending counters
+        """
+        self._last_flush = self.clock()
+        if not self.pending:
+            return
+        pending = dict(self.pending)
+        self.pending.clear()
+        self.totals.update(pending)
+        self.flushes += 1
+        self.flush_callback(pending)
+
+    def close(self):
+        """
+        Flush remaining counters
+        """
+        self.flush()
+
+    def _flush_due(self):
+        return sum(self.pending.values()) >= self.max_count or \
+            self.clock() - self._last_flush >= self.interval
@@ -0,0 +1,63 @@
+"""
+Class registries populated at startup
+
+Classes referenced by name in the database (application model classes,
+dashboards) are registered from their modules once, in AppConfig.ready(),
+and looked up from a dict: no import or path resolution in requests.
+"""
+
+import inspect
+from importlib import import_module
+
+from django.core.exceptions import ImproperlyConfigured
+
+
+class ClassRegistry:
+    """
+    Classes by name
+
+    Usage:
+        registry = ClassRegistry('Dashboards')
+        registry.register_module('products.dashboards', AbstractDashboard,
+                                 prefix='products.dashboards.')
+        registry.get('products.dashboards.ProductsDashboard')
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.classes = {}
+
+    def register(self, key, cls):
+        """
+        Register class with key
+        """
+        registered = self.classes.get(key)
+        if registered is not None and registered is not cls:
+            raise ImproperlyConfigured(
+                f'{self.name}: {key} already registered as {registered}')
+        self.classes[key] = cls
+
+    def register_module(self, module_path, base_class, prefix=''):
+        """
+        Register the concrete base class subclasses in the module namespace
+        Keys are prefix + class name. Module import errors are raised
+        """
+        module = import_module(module_path)
+        for name, value in vars(module).items():
+            if name.startswith('_') or not inspect.isclass(value):
+                continue
+            if issubclass(value, base_class) and value is not base_class \
+                    and not inspect.isabstract(value):
+                self.register(f'{prefix}{name}', value)
+
+    def get(self, key, default=None):
+        """
+        Class registered with key
+        """
+        return self.classes.get(key, default)
+
+    def __contains__(self, key):
+        return key in self.classes
+
+    def __len__(self):
+        return len(self.classes)
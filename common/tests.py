@@ -1,3 +1,211 @@
-from django.test import TestCase
+"""
+Common tests
+"""
 
-# Create your tests here.
+from unittest.mock import patch
+
+import redis
+from constance import config
+from constance.backends.database.models import Constance
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, TestCase
+
+from charts.charts.base import AbstractDashboard
+from common import config_backend
+from common.config_backend import SnapshotDatabaseBackend
+from common.progress import ProgressReporter
+from common.registry import ClassRegistry
+from investment.applications.crowdfunding.account_model_class import Crowdfunding
+from investment.checks import check_application_model_classes
+from investment.models import Application, ApplicationModel
+from products.dashboards import ProductsDashboard
+from products.models import Dashboard
+
+# pylint: disable=missing-function-docstring
+
+
+class FakeClock:
+    """
+    Manual clock
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRedis:
+    """
+    Redis client get/set/incr in a dict
+    """
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = str(value).encode()
+        return True
+
+    def incr(self, key):
+        value = int(self.data.get(key, 0)) + 1
+        self.data[key] = str(value).encode()
+        return value
+
+
+class TestProgressReporter(SimpleTestCase):
+    """
+    Coalesced progress flushes
+    """
+
+    def setUp(self) -> None:
+        self.flushed = []
+        self.clock = FakeClock()
+        self.progress = ProgressReporter(
+            self.flushed.append, interval_ms=500, max_count=10, clock=self.clock)
+        return super().setUp()
+
+    def test_flush_by_count(self):
+        for _ in range(25):
+            self.progress.add(sent=1)
+        self.assertEqual(self.flushed, [{'sent': 10}, {'sent': 10}])
+        self.progress.close()
+        self.assertEqual(self.flushed[-1], {'sent': 5})
+        self.assertEqual(self.progress.totals['sent'], 25)
+
+    def test_flush_by_interval(self):
+        self.progress.add(sent=2, failed=1)
+        self.assertEqual(self.flushed, [])
+        self.clock.now = 0.5
+        self.progress.add(sent=1)
+        self.assertEqual(self.flushed, [{'sent': 3, 'failed': 1}])
+
+    def test_close_without_pending(self):
+        with self.progress:
+            pass
+        self.assertEqual(self.flushed, [])
+
+
+class TestConfigSnapshot(TestCase):
+    """
+    Constance config read from the in-process snapshot
+    """
+
+    def setUp(self) -> None:
+        # pylint: disable=protected-access
+        self.backend = config._backend
+        self.backend.invalidate()
+        self.backend.check_interval = 3600
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.backend.check_interval = 1.0
+        self.backend.invalidate()
+        return super().tearDown()
+
+    def test_backend(self):
+        self.assertIsInstance(self.backend, SnapshotDatabaseBackend)
+
+    def test_reads_from_memory(self):
+        with self.assertNumQueries(1):
+            config.ACCOUNT_ENABLE_SIGNIN  # pylint: disable=pointless-statement
+        with self.assertNumQueries(0):
+            self.assertTrue(config.ACCOUNT_ENABLE_SIGNIN)
+            self.assertFalse(config.ACCOUNT_ENABLE_SIGNUP)
+            self.assertEqual(config.ACCOUNT_INVITATION_EXPIRY, 10)
+        # Defaults are not written
+        self.assertFalse(Constance.objects.exists())
+
+    def test_write_invalidates(self):
+        self.assertFalse(config.ACCOUNT_ENABLE_SIGNUP)
+        with patch.object(SnapshotDatabaseBackend, 'stored_version', return_value=b'1'):
+            with self.captureOnCommitCallbacks(execute=True):
+                config.ACCOUNT_ENABLE_SIGNUP = True
+                # Own write read inside the transaction
+                self.assertTrue(config.ACCOUNT_ENABLE_SIGNUP)
+            self.assertTrue(config.ACCOUNT_ENABLE_SIGNUP)
+            with self.assertNumQueries(0):
+                self.assertTrue(config.ACCOUNT_ENABLE_SIGNUP)
+
+    def test_version_change_reloads(self):
+        with patch.object(SnapshotDatabaseBackend, 'stored_version', return_value=b'1'):
+            self.assertFalse(config.ACCOUNT_ENABLE_SIGNUP)
+            # Written by other process (no signal)
+            Constance.objects.bulk_create([Constance(key='ACCOUNT_ENABLE_SIGNUP', value=True)])
+            self.backend.check_interval = 0
+            self.assertFalse(config.ACCOUNT_ENABLE_SIGNUP)
+
+        with patch.object(SnapshotDatabaseBackend, 'stored_version', return_value=b'2'):
+            self.assertTrue(config.ACCOUNT_ENABLE_SIGNUP)
+
+    def test_missing_version_stamp(self):
+        redis_client = FakeRedis()
+        clock = FakeClock()
+        clock.now = 100.0
+        self.backend.check_interval = getattr(
+            settings, 'CONSTANCE_SNAPSHOT_CHECK_INTERVAL', 1.0)
+        with patch.object(config_backend, 'REDIS_CLIENT', redis_client), \
+                patch.object(config_backend.time, 'monotonic', clock):
+            with self.assertNumQueries(1):
+                self.assertTrue(config.ACCOUNT_ENABLE_SIGNIN)
+            self.assertEqual(redis_client.get(self.backend.version_key), b'0')
+
+            # Unchanged stamp: no reload after the interval
+            clock.now += self.backend.check_interval
+            with self.assertNumQueries(0):
+                self.assertTrue(config.ACCOUNT_ENABLE_SIGNIN)
+
+            redis_client.incr(self.backend.version_key)
+            clock.now += self.backend.check_interval
+            with self.assertNumQueries(1):
+                self.assertTrue(config.ACCOUNT_ENABLE_SIGNIN)
+
+            # Redis not available: reload every interval
+            with patch.object(redis_client, 'get', side_effect=redis.ConnectionError):
+                clock.now += self.backend.check_interval
+                with self.assertNumQueries(1):
+                    self.assertTrue(config.ACCOUNT_ENABLE_SIGNIN)
+
+
+class TestClassRegistry(TestCase):
+    """
+    Classes registered at startup
+    """
+
+    fixtures = ['core/fixtures/users.json', 'applications']
+
+    def test_register_module(self):
+        registry = ClassRegistry('Dashboards')
+        registry.register_module('products.dashboards', AbstractDashboard, prefix='p.')
+        self.assertEqual(len(registry), 1)
+        self.assertIs(registry.get('p.ProductsDashboard'), ProductsDashboard)
+        self.assertNotIn('p.ProductDashboardMixin', registry)
+
+        with self.assertRaises(ImproperlyConfigured):
+            registry.register('p.ProductsDashboard', Crowdfunding)
+        with self.assertRaises(ImportError):
+            registry.register_module('products.missing', AbstractDashboard)
+
+    def test_lookups(self):
+        # pylint: disable=no-member
+        application = Application.objects.select_related('application_model').get(pk=2)
+        with self.assertNumQueries(0):
+            self.assertIs(application.application_class, Crowdfunding)
+        dashboard = Dashboard(application='products', dashboard_class='ProductsDashboard')
+        self.assertIs(dashboard.get_class(), ProductsDashboard)
+        dashboard.dashboard_class = 'Missing'
+        self.assertIsNone(dashboard.get_class())
+
+    def test_check(self):
+        self.assertEqual(check_application_model_classes(databases=['default']), [])
+        # pylint: disable=no-member
+        ApplicationModel.objects.filter(pk=1).update(app_model_class='Missing')
+        errors = check_application_model_classes(databases=['default'])
+        self.assertEqual([error.id for error in errors], ['investment.E001'])
@@ -0,0 +1,128 @@
+"""
+Cached company data
+
+The company (last Company record) is kept in process memory and in Redis, as
+a dict of its field values stored under the current company version. The
+process copy is used for COMPANY_CACHE_INTERVAL seconds, then read again from
+Redis; the database is queried only when Redis has no copy of the version.
+Company save/delete (core.signals) bumps the version when committed, so a copy
+written from a read made before the commit is never served, and other
+processes see the change after at most one interval. Without Redis, the
+database is queried every interval.
+"""
+
+import copy
+import json
+import threading
+import time
+
+import redis
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import DEFERRED
+
+from scheduler.lock import REDIS_CLIENT
+
+from .models import Company
+
+CACHE_KEY = 'core:company'
+VERSION_KEY = 'core:company:version'
+
+_lock = threading.Lock()
+# Generation: incremented by invalidations, a load started before one is not stored
+_cached = {'company': None, 'checked': None, 'generation': 0}
+# Company changes not committed yet in the current thread
+_local = threading.local()
+
+
+def get_company():
+    """
+    Company data or None if not registered
+    A copy is returned: changes in the object are not cached
+    """
+    if getattr(_local, 'pending', False):
+        if connection.in_atomic_block:
+            # Own changes not committed yet: read, not cached
+            # pylint: disable=no-member
+            return Company.objects.last()
+        # Rolled back (committed changes clear pending in on_commit)
+        invalidate_company()
+
+    now = time.monotonic()
+    with _lock:
+        checked = _cached['checked']
+        company = _cached['company']
+        generation = _cached['generation']
+    if checked is None or now - checked >= settings.COMPANY_CACHE_INTERVAL:
+        # Loaded without the lock: Redis and database calls do not block
+        # other threads (which may load it too)
+        company = _load()
+        with _lock:
+            if _cached['generation'] == generation:
+                _cached['company'] = company
+                _cached['checked'] = now
+    return copy.copy(company)
+
+
+def invalidate_on_commit():
+    """
+    Company changed in the current transaction: invalidate when committed
+    """
+    _local.pending = True
+    transaction.on_commit(invalidate_company)
+
+
+def invalidate_company():
+    """
+    Remove the cached company (process copy and Redis version)
+    """
+    _local.pending = False
+    with _lock:
+        _cached['checked'] = None
+        _cached['generation'] += 1
+    try:
+        REDIS_CLIENT.incr(VERSION_KEY)
+    except redis.RedisError:
+        pass
+
+
+def _load():
+    try:
+        key = f'{CACHE_KEY}:{int(REDIS_CLIENT.get(VERSION_KEY) or 0)}'
+        data = REDIS_CLIENT.get(key)
+        if data is not None:
+            return _from_fields(json.loads(data))
+    except redis.RedisError:
+        key = None
+
+    # pylint: disable=no-member
+    company = Company.objects.last()
+    if key is not None:
+        try:
+            REDIS_CLIENT.set(key, json.dumps(_to_fields(company)),
+                             ex=settings.COMPANY_CACHE_TIMEOUT)
+        except redis.RedisError:
+            pass
+    return company
+
+
+def _to_fields(company):
+    """
+    Company field values (files as their names), None without company
+    """
+    if company is None:
+        return None
+    # pylint: disable=protected-access
+    return {field.attname: field.get_prep_value(field.value_from_object(company))
+            for field in Company._meta.concrete_fields}
+
+
+def _from_fields(fields):
+    if fields is None:
+        return None
+    # Fields missing in a copy of an older version are loaded if used
+    # pylint: disable=protected-access
+    concrete_fields = Company._meta.concrete_fields
+    return Company.from_db(
+        None, [field.attname for field in concrete_fields],
+        [fields.get(field.attname, DEFERRED) for field in concrete_fields])
@@ -2,15 +2,14 @@
 Core context processors
 """
 
-from .models import Company
+from .company import get_company
 
 
 def site_name_logo_url(request):
     """
     Name logo url
     """
-    #pylint: disable=no-member
-    company = Company.objects.last()
+    company = get_company()
     url = None
     if company and company.name_logo:
         url = company.name_logo.url
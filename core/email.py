@@ -1,19 +1,227 @@
 """
 Email classes
 """
+import copy
+import queue
 import smtplib
+import threading
+from collections import namedtuple
+from email.utils import formatdate, make_msgid
 
 from celery.utils.log import get_task_logger
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core import mail
+from django.core.mail.utils import DNS_NAME
+from django.db import connection, transaction
 from django.db.models import F
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
 from django.utils import timezone
 
+from accounts.models import UserRole
+from common.progress import ProgressReporter
 from scheduler import lock
-from core import models
+from core import models, retention
 
 logger = get_task_logger(__name__)
 
+# Recipient data streamed from database
+Recipient = namedtuple('Recipient', ['pk', 'address'])
+
+# Headers set per recipient by MessageFactory
+RECIPIENT_HEADERS = ('To', 'Date', 'Message-ID')
+
+
+class MessageFactory:
+    """
+    Recipient messages sharing one rendered message
+
+    The MIME message (body, parts and transfer encoding) is built once from the
+    base message; each recipient message clones it setting only the To, Date
+    and Message-ID headers. Clones share the payload: it must not be changed.
+    """
+
+    def __init__(self, base_message: mail.EmailMessage):
+        self.base_message = base_message
+        self.mime = base_message.message()
+        for header in RECIPIENT_HEADERS:
+            del self.mime[header]
+        # Serialize once so multipart boundaries are set before clones are
+        # serialized, possibly from several threads
+        self.mime.as_bytes()
+
+    def message(self, address):
+        """
+        Message to address
+        """
+        base = self.base_message
+        return RecipientEmailMessage(
+            self, subject=base.subject, body=base.body, from_email=base.from_email,
+            to=[address], reply_to=base.reply_to)
+
+    def mime_message(self, to):
+        """
+        Clone of the shared MIME message with the recipient headers
+        """
+        msg = copy.copy(self.mime)
+        # pylint: disable=protected-access
+        msg._headers = list(self.mime._headers)
+        msg['To'] = ', '.join(to)
+        msg['Date'] = formatdate(localtime=settings.EMAIL_USE_LOCALTIME)
+        msg['Message-ID'] = make_msgid(domain=DNS_NAME)
+        return msg
+
+
+class RecipientEmailMessage(mail.EmailMessage):
+    """
+    Email message created by a MessageFactory
+    """
+
+    def __init__(self, factory: MessageFactory, **kwargs):
+        super().__init__(**kwargs)
+        self.factory = factory
+        self.content_subtype = factory.base_message.content_subtype
+
+    def message(self):
+        return self.factory.mime_message(self.to)
+
+
+class TemplateMessageFactory:
+    """
+    Personalised messages from allauth like email templates
+
+    Same templates and message layout of DefaultAccountAdapter.render_mail
+    (<prefix>_subject.txt, <prefix>_message.html and/or <prefix>_message.txt),
+    but templates are loaded and compiled once and the subject prefix and sender
+    are resolved once: only the context is rendered per message.
+    """
+
+    def __init__(self, template_prefix, adapter):
+        self.adapter = adapter
+        self.subject_template = get_template(f'{template_prefix}_subject.txt')
+        self.body_templates = {}
+        for ext in ['html', 'txt']:
+            try:
+                self.body_templates[ext] = get_template(f'{template_prefix}_message.{ext}')
+            except TemplateDoesNotExist:
+                if ext == 'txt' and not self.body_templates:
+                    # At least one body is required
+                    raise
+        self.subject_prefix = adapter.format_email_subject('')
+        self.from_email = adapter.get_from_email()
+
+    def message(self, email, context):
+        """
+        Render the message to email
+        """
+        to = [email] if isinstance(email, str) else email
+        subject = self.subject_template.render(context)
+        subject = self.subject_prefix + ' '.join(subject.splitlines()).strip()
+
+        bodies = {
+            ext: template.render(context, self.adapter.request).strip()
+            for ext, template in self.body_templates.items()
+        }
+        if 'txt' in bodies:
+            msg = mail.EmailMultiAlternatives(subject, bodies['txt'], self.from_email, to)
+            if 'html' in bodies:
+                msg.attach_alternative(bodies['html'], 'text/html')
+        else:
+            msg = mail.EmailMessage(subject, bodies['html'], self.from_email, to)
+            msg.content_subtype = 'html'
+        return msg
+
+
+def close_connection(smtp_connection):
+    """
+    Close connection ignoring errors of a dropped connection
+    """
+    try:
+        smtp_connection.close()
+    except OSError:
+        pass
+
+
+class SenderPool:
+    """
+    Send chunks with a pool of worker threads pulling from a shared queue
+
+    Each worker keeps its own SMTP connection and calls
+    send_chunk(smtp_connection, chunk). Chunks are read from the iterator of (chunk number, chunk) as workers
+    consume them (two per worker at most in flight) and results are passed to
+    chunk_done(chunk number, result) in the calling thread, in completion order.
+    A send_chunk exception stops the pool and is raised in the calling thread.
+    """
+
+    def __init__(self, send_chunk: callable, workers):
+        self.send_chunk = send_chunk
+        self.workers = workers
+
+    def run(self, chunks_iterator, chunk_done: callable):
+        """
+        Send all chunks
+        """
+        chunks = queue.Queue()
+        results = queue.Queue()
+
+        def put_next_chunk():
+            chunk = next(chunks_iterator, None)
+            if chunk:
+                chunks.put(chunk)
+            return chunk is not None
+
+        in_flight = 0
+        while in_flight < 2 * self.workers and put_next_chunk():
+            in_flight += 1
+
+        workers = [
+            threading.Thread(target=self._worker, args=(chunks, results), daemon=True)
+            for _ in range(min(self.workers, in_flight))
+        ]
+        for worker in workers:
+            worker.start()
+
+        try:
+            while in_flight:
+                i, result, exc = results.get()
+                in_flight -= 1
+                if exc is not None:
+                    raise exc
+                chunk_done(i, result)
+                if put_next_chunk():
+                    in_flight += 1
+        finally:
+            # Unexpected error: workers stop after the current chunk
+            while True:
+                try:
+                    chunks.get_nowait()
+                except queue.Empty:
+                    break
+            for _ in workers:
+                chunks.put(None)
+            for worker in workers:
+                worker.join()
+
+    def _worker(self, chunks, results):
+        """
+        Send chunks from queue over a persistent connection until a None chunk
+        """
+        smtp_connection = mail.get_connection()
+        try:
+            while True:
+                chunk = chunks.get()
+                if chunk is None:
+                    break
+                i, items = chunk
+                try:
+                    results.put((i, self.send_chunk(smtp_connection, items), None))
+                # pylint: disable=broad-except
+                except Exception as exc:
+                    results.put((i, None, exc))
+        finally:
+            close_connection(smtp_connection)
+
 
 class BatchEmail:
     """
@@ -23,16 +231,41 @@ class BatchEmail:
     A message list is created from recipients chunk and send
     Email batch recipients are update to indicate if sending succeded
     Failed sendings are grouped with send_failed
-    Only email batch recipients which succeded are deleted
+    Only email batch recipients which succeded are deleted, as chunks are done
 
     A notify method are called, calling notify_callback with email_bach object as argument
-
-    Warning: if chunk_size > 1 and sending fail for some message in chunk line, the sending
-    will stop and remaining messages will not be sent and individual error messages will not
-    be written.
+    Progress (sent counter and notification) is coalesced: written at most every
+    progress_interval_ms or progress_max_messages and always at the end
+
+    Chunk messages are sent one by one over the same connection and the result is recorded
+    per recipient: a refused message does not stop the chunk. If the connection drops, it is
+    reopened (up to max_reconnects times) and only the unsent messages are retried.
+    Chunk size sets how many recipients are updated (and notified) at once.
+    The message is rendered once per batch (MessageFactory), only recipient
+    headers are set per message.
+
+    Sender pool: with workers > 1, chunks are sent by worker threads, each one with its own
+    SMTP connection. Workers only send messages; recipients status, batch counters and
+    notifications are updated by the calling thread as chunks are done.
+
+    Resuming: the batch keeps a high-water mark (last_recipient_pk), written with the
+    status of the chunk that advances it. Chunks are done out of order by the sender
+    pool: the mark only covers contiguous done chunks. A processing batch (interrupted
+    task) resumes after the mark; a finished with error batch resends all not sent.
+    The task lock expires (EMAIL_BATCH_LOCK_TIMEOUT) if the worker dies and is renewed
+    by a heartbeat thread (scheduler.lock.LockHeartbeat); requeue_stale_email_batches task
+    resends unlocked processing batches. If the lock is lost anyway (another sender may
+    own the batch), sending stops before the next message and the batch is left as is.
+    EMAIL_TIMEOUT bounds each SMTP operation below the lock timeout.
     """
 
-    def __init__(self, email_batch_message_pk, users_pk=None, notify_callback: callable = None, chunk_size=1):
+    max_reconnects = 3
+
+    progress_interval_ms = 1000
+    progress_max_messages = 500
+
+    def __init__(self, email_batch_message_pk, users_pk=None, notify_callback: callable = None,
+                 chunk_size=1, workers=1):
         # pylint: disable=no-member
         self.email_batch = models.EmailBatchMessage.objects.get(
             pk=email_batch_message_pk)
@@ -41,76 +274,214 @@ class BatchEmail:
 
         self.notify_callback = notify_callback
         self.chunk_size = chunk_size
+        self.workers = workers
 
         self.subject = self.email_batch.subject
         self.message = self.email_batch.message
+        self.message_factory = None
+
+        # Sent counter and notifications
+        self.progress = None
+
+        # Task lock renewal, lost lock stops the sending
+        self.heartbeat = None
+
+        # Done chunks (chunk number: last recipient pk) after the high-water mark
+        self._chunks_done = {}
+        self._next_chunk = 0
 
-        # Objects with email address and sending status
-        self.recipients = []
+    @staticmethod
+    def lock_key(email_batch_message_pk):
+        """
+        Task lock key of the batch
+        """
+        return f'batch_mail_{email_batch_message_pk}'
 
     def send(self):
         """
         Send batch or resend failed or not sent
         """
-        key = f'batch_mail_{self.email_batch.pk}'
+        key = self.lock_key(self.email_batch.pk)
         logger.info('task key lock = %s', key)
-        lock.lock_task(self._send, key=key)()
+        lock.lock_task(self._send_locked, key=key,
+                       timeout=settings.EMAIL_BATCH_LOCK_TIMEOUT, bind=True)()
+
+    def _send_locked(self, task_lock):
+        self.heartbeat = lock.LockHeartbeat(task_lock)
+        with self.heartbeat:
+            self._send()
+
+    def _lock_lost(self):
+        return self.heartbeat is not None and self.heartbeat.lost.is_set()
 
     def _send(self):
 
         if self.email_batch.status == models.EmailBatchMessage.Status.FINISHED:
             return
         elif self.email_batch.status == models.EmailBatchMessage.Status.WAITING:
-            user_model = get_user_model()
-            role = self.email_batch.role
-            users_pk = self.users_pk
-            if not self.users_pk:
-                users_pk = list(user_model.objects.filter(
-                    is_active=True, userrole__role=role).values_list('pk', flat=True))
-            count = self.create_recipients(users_pk)
-            self.email_batch.total = len(users_pk)
-            self.email_batch.save()
+            if self.users_pk:
+                count = self.create_recipients(self.users_pk)
+            else:
+                count = self.create_role_recipients(self.email_batch.role)
+            self.email_batch.total = count
+            self.email_batch.save(update_fields=['total'])
         else:
-            count = self.load_recipients()
+            count = self._resume()
 
+        logger.info('Email batch %s: %s recipients', self.email_batch.pk, count)
         self._update_batch()
         self._notify()
 
+        self.message_factory = self._create_message_factory()
+
         # To group failed to be sent
         send_failed = self.get_or_create_send_failed(self.chunk_size)
 
-        failed = False
-        connection = mail.get_connection()
-        connection.open()
-        for i in range(0, count, self.chunk_size):
-            recipients_chunk = self._get_recipients_chunk(i)
-            message_list = self._create_messages(recipients_chunk)
+        self.progress = ProgressReporter(
+            self._flush_progress, self.progress_interval_ms, self.progress_max_messages)
+        with self.progress:
+            if self.workers > 1:
+                failed = self._send_chunks_pool(send_failed)
+            else:
+                failed = self._send_chunks(send_failed)
+
+        if self._lock_lost():
+            logger.warning('Email batch %s: task lock lost, sending stopped',
+                           self.email_batch.pk)
+            return
 
-            try:
-                self._send_message_chunk(message_list, connection)
-                self._update_chunk_status(recipients_chunk)
-                self._notify()
-            except smtplib.SMTPException as exc:
-                self._update_chunk_error(send_failed, i, recipients_chunk, exc)
-                failed = True
-            except ConnectionRefusedError as exc:
-                self._update_chunk_error(
-                    send_failed, i,  recipients_chunk, exc)
-                failed = True
-
-        connection.close()
+        # Failures of an interrupted task are kept
+        self.email_batch.failed = self._unsent_recipients().count()
+        failed = failed or bool(self.email_batch.failed)
         self._clean_recipients()
         self._clean_send_failed(send_failed, failed)
         self._finalize(failed)
         self._notify()
 
+    def _send_chunks(self, send_failed):
+        """
+        Send chunks in sequence over one connection
+        """
+        failed = False
+        smtp_connection = mail.get_connection()
+        for i, recipients_chunk in self._recipient_chunks():
+            sent, failures = self._send_recipients(smtp_connection, recipients_chunk)
+            failed |= self._chunk_done(send_failed, i, sent, failures)
+
+        close_connection(smtp_connection)
+        return failed
+
+    def _send_chunks_pool(self, send_failed):
+        """
+        Send chunks with a pool of worker threads (SenderPool)
+        """
+        failed = False
+
+        def chunk_done(i, result):
+            nonlocal failed
+            sent, failures = result
+            failed |= self._chunk_done(send_failed, i, sent, failures)
+
+        SenderPool(self._send_recipients, self.workers).run(self._recipient_chunks(), chunk_done)
+        return failed
+
+    def _send_recipients(self, smtp_connection, recipients_chunk):
+        """
+        Send one message per recipient over the connection
+        Return sent recipients and (recipient, error) failures
+        A dropped connection is reopened and only the unsent messages are retried
+        """
+        pending = list(zip(recipients_chunk, self._create_messages(recipients_chunk)))
+        sent = []
+        failures = []
+        reconnects = 0
+        while pending and not self._lock_lost():
+            recipient, message = pending[0]
+            try:
+                smtp_connection.open()
+                smtp_connection.send_messages([message])
+                sent.append(recipient)
+            except Exception as exc:  # pylint: disable=broad-except
+                if not self._is_connection_error(exc):
+                    if not isinstance(exc, smtplib.SMTPException):
+                        raise
+                    # Message refused: next message in the same connection
+                    failures.append((recipient, exc))
+                elif reconnects < self.max_reconnects:
+                    reconnects += 1
+                    logger.info('Email batch %s: reconnecting (%s)', self.email_batch.pk, exc)
+                    close_connection(smtp_connection)
+                    continue
+                else:
+                    close_connection(smtp_connection)
+                    failures.extend((recipient, exc) for recipient, _ in pending)
+                    break
+            pending.pop(0)
+        return sent, failures
+
+    @staticmethod
+    def _is_connection_error(exc):
+        """
+        Errors that affect the connection, not only the message
+        """
+        if isinstance(exc, smtplib.SMTPServerDisconnected):
+            return True
+        if isinstance(exc, smtplib.SMTPResponseException):
+            # 421: service not available, closing channel
+            return exc.smtp_code == 421
+        return isinstance(exc, OSError) and not isinstance(exc, smtplib.SMTPException)
+
+    def _chunk_done(self, send_failed, chunk, sent, failures):
+        """
+        Update chunk recipients status, return True if some message failed
+        """
+        if not sent and not failures:
+            # Stopped (lock lost) before the first message
+            return False
+        with transaction.atomic():
+            if sent:
+                self._update_chunk_status(sent)
+            if failures:
+                self._update_recipients_error(send_failed, chunk, failures)
+            self._advance_high_water_mark(
+                chunk, sent + [recipient for recipient, _ in failures])
+        self.progress.add(sent=len(sent), failed=len(failures))
+        return bool(failures)
+
+    def _advance_high_water_mark(self, chunk, recipients):
+        """
+        Write the last recipient of the contiguous done chunks
+        """
+        self._chunks_done[chunk] = max(recipient.pk for recipient in recipients)
+        last_pk = None
+        while self._next_chunk in self._chunks_done:
+            last_pk = self._chunks_done.pop(self._next_chunk)
+            self._next_chunk += 1
+        if last_pk is not None:
+            # pylint: disable=no-member
+            models.EmailBatchMessage.objects.filter(
+                pk=self.email_batch.pk).update(last_recipient_pk=last_pk)
+            self.email_batch.last_recipient_pk = last_pk
+
+    def _flush_progress(self, counters):
+        """
+        Write sent counter without saving the whole batch and notify
+        """
+        sent = counters.get('sent', 0)
+        if sent:
+            # pylint: disable=no-member
+            models.EmailBatchMessage.objects.filter(
+                pk=self.email_batch.pk).update(sent=F('sent') + sent)
+            self.email_batch.sent += sent
+        self._notify()
+
     def _notify(self):
         if self.notify_callback:
             self.notify_callback(self.email_batch)
 
     def _update_batch(self):
         self.email_batch.status = models.EmailBatchMessage.Status.PROCESSING
-        self.email_batch.save()
+        self.email_batch.save(update_fields=['status'])
 
     def get_or_create_send_failed(self, chunk_size):
         """
@@ -124,6 +495,59 @@ class BatchEmail:
         )
         return send_failed
 
+    def _recipient_chunks(self):
+        """
+        Stream (chunk number, recipients) of not sent recipients
+        Keyset pagination on pk: each chunk is a constant cost query
+        """
+        # pylint: disable=no-member
+        queryset = models.EmailBatchRecipient.objects.filter(
+            email_batch=self.email_batch, sent=False
+        ).order_by('pk').values_list('pk', 'user__email')
+
+        last_pk = self.email_batch.last_recipient_pk
+        chunk = 0
+        while not self._lock_lost():
+            recipients = [Recipient(*row) for row in queryset.filter(
+                pk__gt=last_pk)[:self.chunk_size]]
+            if not recipients:
+                break
+            yield chunk, recipients
+            last_pk = recipients[-1].pk
+            chunk += 1
+
+    def create_role_recipients(self, role):
+        """
+        Create recipients of active users with the role in database
+        (INSERT ... SELECT, users are not loaded)
+        Return the number of recipients
+        """
+        # pylint: disable=no-member,protected-access
+        quote_name = connection.ops.quote_name
+        recipient_opts = models.EmailBatchRecipient._meta
+        user_opts = get_user_model()._meta
+        role_opts = UserRole._meta
+
+        def column(opts, name):
+            return quote_name(opts.get_field(name).column)
+
+        user_pk = quote_name(user_opts.pk.column)
+
+        # Only quoted identifiers are formatted, values are parameters
+        sql = (
+            f'INSERT INTO {quote_name(recipient_opts.db_table)} '
+            f'({column(recipient_opts, "user")}, {column(recipient_opts, "email_batch")}, '
+            f'{column(recipient_opts, "sent")}) '
+            f'SELECT u.{user_pk}, %s, %s '
+            f'FROM {quote_name(user_opts.db_table)} u '
+            f'INNER JOIN {quote_name(role_opts.db_table)} r '
+            f'ON r.{column(role_opts, "user")} = u.{user_pk} '
+            f'WHERE u.{column(user_opts, "is_active")} = %s AND r.{column(role_opts, "role")} = %s'
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [self.email_batch.pk, False, True, role])
+            return cursor.rowcount
+
     def create_recipients(self, users_pk):
         """
         Create the recipients list batch in database to be sent
@@ -137,74 +561,83 @@ class BatchEmail:
         # pylint: disable=no-member
         models.EmailBatchRecipient.objects.bulk_create(recipient_list)
 
-        # Bulk create return a list of objects without pk (if pk is autofield),
-        #  so it should be retrived from database
-        self.load_recipients()
-
-        return len(self.recipients)
+        return len(recipient_list)
 
     def load_recipients(self):
         """
-        Load the recipients list batch in database to be sent
+        Number of recipients to be sent (after the high-water mark)
+        Recipients are streamed in chunks while sending (_recipient_chunks)
         """
         # pylint: disable=no-member
-        self.recipients = models.EmailBatchRecipient.objects.filter(
-            email_batch=self.email_batch).annotate(address=F('user__email'))
-
-        return len(self.recipients)
+        return models.EmailBatchRecipient.objects.filter(
+            email_batch=self.email_batch, sent=False,
+            pk__gt=self.email_batch.last_recipient_pk).count()
 
-    def _get_recipients_chunk(self, i):
-        recipients_chunk = self.recipients[i:i+self.chunk_size]
-        return recipients_chunk
+    def _resume(self):
+        """
+        Continue a processing batch after the high-water mark or resend a
+        finished with error batch from the start
+        Sent counter is recomputed from recipients: progress not flushed by an
+        interrupted task is lost (sent recipients are deleted as chunks are done)
+        Return the number of recipients to be sent
+        """
+        if self.email_batch.status == models.EmailBatchMessage.Status.FINISHED_ERR:
+            self.email_batch.last_recipient_pk = 0
+        self.email_batch.sent = max(
+            self.email_batch.total - self._unsent_recipients().count(), 0)
+        self.email_batch.save(update_fields=['sent', 'last_recipient_pk'])
+        return self.load_recipients()
+
+    def _unsent_recipients(self):
+        # pylint: disable=no-member
+        return models.EmailBatchRecipient.objects.filter(
+            email_batch=self.email_batch, sent=False)
 
-    def _create_messages(self, recipients_chunk):
+    def _create_message_factory(self):
         """
-        Create the message list from chunk
+        Render the batch message once, recipients messages are cloned from it
         """
-        message_list = []
-        for recipient in recipients_chunk:
-            msg = mail.EmailMessage(
-                self.subject, self.message, to=[recipient.address])
-            msg.content_subtype = "html"
-            message_list.append(msg)
-        return message_list
+        msg = mail.EmailMessage(self.subject, self.message)
+        msg.content_subtype = "html"
+        return MessageFactory(msg)
 
-    def _send_message_chunk(self, message_list, connection):
+    def _create_messages(self, recipients_chunk):
         """
-        Send recipient list messages in chunks for chunk_size
+        Create the message list from chunk
         """
-        sent_count = connection.send_messages(message_list)
-        self.email_batch.sent += sent_count
-        self.email_batch.save()
+        return [self.message_factory.message(recipient.address)
+                for recipient in recipients_chunk]
 
     def _update_chunk_status(self, recipients_chunk):
         """
-        Set sent field of email bath recipient to true to indicate email sent success
-        Succeeded sendings records will be deleted
+        Delete email batch recipients sent with success (bounded by chunk size)
         Faile sending recipients are kept to debug or future resendind
+        (purged after the retention period, core.retention)
         """
         # pylint: disable=no-member
-        for recipient in recipients_chunk:
-            recipient.sent = True
-        models.EmailBatchRecipient.objects.bulk_update(
-            recipients_chunk, ['sent'])
+        models.EmailBatchRecipient.objects.filter(
+            pk__in=[recipient.pk for recipient in recipients_chunk]).delete()
 
-    def _update_chunk_error(self, send_failed, chunk, recipients_chunk, exc):
-        send_failed.error_message += f"{str(exc)} - chunk: {chunk};\n"
+    def _update_recipients_error(self, send_failed, chunk, failures):
+        """
+        Write each failed recipient error
+        """
+        recipients = []
+        for recipient, exc in failures:
+            send_failed.error_message += f"{recipient.address}: {str(exc)} - chunk: {chunk};\n"
+            recipients.append(models.EmailBatchRecipient(
+                pk=recipient.pk, email_send_failed=send_failed, error_message=str(exc)))
         send_failed.save()
         # pylint: disable=no-member
-        for recipient in recipients_chunk:
-            recipient.email_send_failed = send_failed
-            recipient.error_message = str(exc)
         models.EmailBatchRecipient.objects.bulk_update(
-            recipients_chunk, ['email_send_failed', 'error_message'])
+            recipients, ['email_send_failed', 'error_message'])
 
     def _clean_recipients(self):
-        # Delete all send recipient
+        # Delete sent recipients left by tasks interrupted before chunked deletion
         # pylint: disable=no-member
         sent = models.EmailBatchRecipient.objects.filter(
             email_batch=self.email_batch, sent=True)
-        sent.delete()
+        retention.delete_in_chunks(sent, settings.EMAIL_BATCH_PURGE_CHUNK_SIZE)
 
     def _clean_send_failed(self, send_failed, failed):
         # Delete send_failed
@@ -215,4 +648,4 @@ class BatchEmail:
         status = models.EmailBatchMessage.Status
         self.email_batch.status = status.FINISHED_ERR if failed else status.FINISHED
         self.email_batch.date_finished = timezone.localtime(timezone.now())
-        self.email_batch.save()
+        self.email_batch.save(update_fields=['status', 'date_finished', 'failed'])
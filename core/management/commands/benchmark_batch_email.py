@@ -0,0 +1,86 @@
+"""
+Batch email benchmark command
+"""
+
+import json
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import override_settings
+
+from accounts.roles import Roles
+from core import models
+from core.email import BatchEmail
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """
+    Send a batch email to synthetic users through a local SMTP stub
+    Start the stub before, ex:
+        python -m aiosmtpd -n -l localhost:1025
+    """
+
+    help = 'Benchmark batch email sending against a local SMTP server ' \
+        '(generated data is rolled back)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--messages', type=int, default=1000)
+        parser.add_argument('--workers', default='1,2,4,8',
+                            help='Comma separated number of sender workers')
+        parser.add_argument('--chunk-size', type=int, default=1)
+        parser.add_argument('--host', default='localhost')
+        parser.add_argument('--port', type=int, default=1025)
+
+    def handle(self, *args, **options):
+        try:
+            workers_list = [int(workers) for workers in options['workers'].split(',')]
+        except ValueError as error:
+            raise CommandError(error) from error
+
+        sender = User.objects.filter(is_superuser=True).order_by('pk').first()
+        if not sender:
+            raise CommandError('A superuser is required as sender')
+
+        smtp_settings = override_settings(
+            EMAIL_BACKEND='django.core.mail.backends.smtp.EmailBackend',
+            EMAIL_HOST=options['host'], EMAIL_PORT=options['port'],
+            EMAIL_HOST_USER='', EMAIL_HOST_PASSWORD='',
+            EMAIL_USE_TLS=False, EMAIL_USE_SSL=False)
+
+        results = []
+        with smtp_settings, transaction.atomic():
+            prefix = f'benchmark-{int(time.time())}'
+            User.objects.bulk_create([
+                User(username=f'{prefix}-{i}', email=f'{prefix}-{i}@example.com')
+                for i in range(options['messages'])
+            ])
+            users_pk = list(User.objects.filter(
+                username__startswith=prefix).values_list('pk', flat=True))
+
+            for workers in workers_list:
+                # pylint: disable=no-member
+                email_batch = models.EmailBatchMessage.objects.create(
+                    subject='Benchmark', message='<p>Benchmark</p>',
+                    sender=sender, role=Roles.CLIENT)
+                start = time.perf_counter()
+                BatchEmail(email_batch.pk, users_pk=users_pk, workers=workers,
+                           chunk_size=options['chunk_size'])._send()
+                elapsed = time.perf_counter() - start
+                email_batch.refresh_from_db()
+                results.append({
+                    'workers': workers,
+                    'chunk_size': options['chunk_size'],
+                    'messages': email_batch.sent,
+                    'status': email_batch.status,
+                    'elapsed_s': round(elapsed, 4),
+                    'messages_per_s': round(email_batch.sent / elapsed, 1),
+                })
+                self.stderr.write(f"{workers} workers: {results[-1]['messages_per_s']} messages/s")
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(json.dumps(results, indent=2))
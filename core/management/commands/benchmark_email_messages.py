@@ -0,0 +1,91 @@
+"""
+Email message creation microbenchmark command
+"""
+
+import json
+import time
+
+from allauth.account.adapter import DefaultAccountAdapter
+from django.core import mail
+from django.core.management.base import BaseCommand
+
+from core.email import MessageFactory, TemplateMessageFactory
+
+
+class Command(BaseCommand):
+    """
+    Compare messages/s creating and serializing messages (no sending)
+    before (one message rendered per recipient) and after the message factories
+    """
+
+    help = 'Benchmark email messages creation and serialization: batch messages ' \
+        '(EmailMessage per recipient x MessageFactory) and personalised templates ' \
+        '(render_mail x TemplateMessageFactory)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--messages', type=int, default=10000)
+        parser.add_argument('--body-size', type=int, default=20000,
+                            help='Batch message HTML body size (characters)')
+        parser.add_argument('--template-prefix', default='clients/email/client_anniversary')
+
+    def handle(self, *args, **options):
+        count = options['messages']
+        paragraph = '<p>Mensagem de ação</p>'
+        body = paragraph * (options['body_size'] // len(paragraph) + 1)
+        addresses = [f'user{i}@example.com' for i in range(count)]
+
+        def batch_before():
+            for address in addresses:
+                msg = mail.EmailMessage('Assunto', body, to=[address])
+                msg.content_subtype = 'html'
+                yield msg
+
+        def batch_after():
+            msg = mail.EmailMessage('Assunto', body)
+            msg.content_subtype = 'html'
+            factory = MessageFactory(msg)
+            for address in addresses:
+                yield factory.message(address)
+
+        prefix = options['template_prefix']
+        contexts = [{'name': f'Cliente {i}', 'email': address}
+                    for i, address in enumerate(addresses)]
+
+        def template_before():
+            adapter = DefaultAccountAdapter()
+            for context in contexts:
+                yield adapter.render_mail(prefix, context['email'], context)
+
+        def template_after():
+            factory = TemplateMessageFactory(prefix, DefaultAccountAdapter())
+            for context in contexts:
+                yield factory.message(context['email'], context)
+
+        results = []
+        for name, messages in [('batch_before', batch_before), ('batch_after', batch_after),
+                               ('template_before', template_before),
+                               ('template_after', template_after)]:
+            results.append(self.run(name, messages))
+            self.stderr.write(f"{name}: {results[-1]['messages_per_s']} messages/s")
+
+        self.stdout.write(json.dumps(results, indent=2))
+
+    @staticmethod
+    def run(name, messages):
+        """
+        Create and serialize all messages (what the SMTP backend sends)
+        """
+        start = time.perf_counter()
+        size = 0
+        sent = 0
+        for message in messages():
+            size += len(message.message().as_bytes(linesep='\r\n'))
+            sent += 1
+        elapsed = time.perf_counter() - start
+        return {
+            'benchmark': name,
+            'messages': sent,
+            'bytes': size,
+            'elapsed_s': round(elapsed, 4),
+            'messages_per_s': round(sent / elapsed, 1) if elapsed else None,
+        }
@@ -0,0 +1,17 @@
+# Generated by Django 3.2 on 2026-10-18 14:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_auto_20220727_1507'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='emailbatchrecipient',
+            index=models.Index(fields=['email_batch', 'id'], name='emailrecipient_batch_id_idx'),
+        ),
+    ]
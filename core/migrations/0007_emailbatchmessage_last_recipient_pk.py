@@ -0,0 +1,18 @@
+# Generated by Django 3.2 on 2026-10-18 14:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_emailbatchrecipient_batch_id_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emailbatchmessage',
+            name='last_recipient_pk',
+            field=models.PositiveBigIntegerField(default=0, editable=False, verbose_name='Último destinatário processado'),
+        ),
+    ]
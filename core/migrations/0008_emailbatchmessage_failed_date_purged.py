@@ -0,0 +1,23 @@
+# Generated by Django 3.2 on 2026-10-18 14:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_emailbatchmessage_last_recipient_pk'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emailbatchmessage',
+            name='date_purged',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Data de expurgo'),
+        ),
+        migrations.AddField(
+            model_name='emailbatchmessage',
+            name='failed',
+            field=models.PositiveIntegerField(default=0, verbose_name='Falhas'),
+        ),
+    ]
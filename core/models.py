@@ -148,10 +148,18 @@ class EmailBatchMessage(accounts_models.RoleModelMixin):
                               choices=Status.choices, default=Status.WAITING)
     sent = models.PositiveIntegerField(verbose_name='Enviados', default=0)
     total = models.PositiveIntegerField(verbose_name='Total', default=0)
+    # Recipients not sent when the batch finished
+    failed = models.PositiveIntegerField(verbose_name='Falhas', default=0)
+    # High-water mark: recipients up to this pk were processed (sent or failed)
+    last_recipient_pk = models.PositiveBigIntegerField(
+        verbose_name='Último destinatário processado', default=0, editable=False)
     date_created = models.DateTimeField(
         verbose_name='Data de criação', auto_now_add=True)
     date_finished = models.DateTimeField(
         verbose_name='Data de finalização', null=True, blank=True)
+    # Recipients and send failures deleted (core.retention)
+    date_purged = models.DateTimeField(
+        verbose_name='Data de expurgo', null=True, blank=True, editable=False)
     sender = models.ForeignKey(
         settings.AUTH_USER_MODEL, verbose_name='Operador', on_delete=models.CASCADE)
 
@@ -192,6 +200,11 @@ class EmailBatchRecipient(models.Model):
         verbose_name = 'Email agendado'
         verbose_name_plural = 'Emails agendados'
 
+        indexes = [
+            # Keyset pagination of batch recipients
+            models.Index(fields=['email_batch', 'id'], name='emailrecipient_batch_id_idx'),
+        ]
+
     email_batch = models.ForeignKey(
         EmailBatchMessage, verbose_name='Lote de envio', on_delete=models.CASCADE)
     email_send_failed = models.ForeignKey(
@@ -0,0 +1,104 @@
+"""
+Email batches data retention
+
+Batch recipients are temporary: sent ones are deleted as chunks are sent
+(BatchEmail) and failed ones are kept to debug and resend. After the retention
+period, failed recipients and send failures of finished batches are compacted
+into the batch failed counter and deleted.
+
+Rows are deleted in bounded chunks, each one in a short transaction, to avoid
+long lock-heavy deletes.
+"""
+
+import time
+
+from django.db import transaction
+from django.utils import timezone
+
+from core import models
+
+
+def delete_in_chunks(queryset, chunk_size=1000):
+    """
+    Delete queryset rows in chunks of primary keys (keyset pagination)
+    Return the number of rows deleted (cascades not included)
+    """
+    pks = queryset.order_by('pk').values_list('pk', flat=True)
+    deleted = 0
+    last_pk = 0
+    while True:
+        chunk = list(pks.filter(pk__gt=last_pk)[:chunk_size])
+        if not chunk:
+            break
+        with transaction.atomic():
+            queryset.model.objects.filter(pk__in=chunk).delete()
+        deleted += len(chunk)
+        last_pk = chunk[-1]
+    return deleted
+
+
+class EmailBatchPurge:
+    """
+    Compact and purge finished email batches older than retention_days
+    (date_finished)
+
+    Usage:
+        metrics = EmailBatchPurge(retention_days=90).run()
+    """
+
+    def __init__(self, retention_days, chunk_size=1000, now=None):
+        self.retention_days = retention_days
+        self.chunk_size = chunk_size
+        self.now = now or timezone.now()
+
+    def batches(self):
+        """
+        Finished batches to be purged
+        """
+        status = models.EmailBatchMessage.Status
+        # pylint: disable=no-member
+        return models.EmailBatchMessage.objects.filter(
+            status__in=[status.FINISHED, status.FINISHED_ERR],
+            date_finished__lt=self.now - timezone.timedelta(days=self.retention_days),
+            date_purged__isnull=True,
+        ).order_by('pk')
+
+    def run(self):
+        """
+        Purge batches, return throughput metrics
+        """
+        start = time.perf_counter()
+        batches = recipients = send_failed = 0
+        for email_batch in self.batches().iterator():
+            batch_recipients, batch_send_failed = self.purge(email_batch)
+            batches += 1
+            recipients += batch_recipients
+            send_failed += batch_send_failed
+        elapsed = time.perf_counter() - start
+        rows = recipients + send_failed
+        return {
+            'batches': batches,
+            'recipients': recipients,
+            'send_failed': send_failed,
+            'elapsed_s': round(elapsed, 4),
+            'rows_per_s': round(rows / elapsed, 1) if elapsed else None,
+        }
+
+    def purge(self, email_batch):
+        """
+        Compact not sent recipients into the failed counter and delete the
+        batch recipients and send failures
+        Return the number of recipients and send failures deleted
+        """
+        # pylint: disable=no-member
+        recipients = models.EmailBatchRecipient.objects.filter(email_batch=email_batch)
+        email_batch.failed = max(email_batch.failed, recipients.filter(sent=False).count())
+        deleted_recipients = delete_in_chunks(recipients, self.chunk_size)
+
+        with transaction.atomic():
+            deleted_send_failed, _ = models.EmailSendFailed.objects.filter(
+                email_batch=email_batch).delete()
+            email_batch.date_purged = self.now
+            email_batch.save(update_fields=['failed', 'date_purged'])
+
+        return deleted_recipients, deleted_send_failed
@@ -4,11 +4,14 @@ Core signals
 
 from allauth.account.signals import user_signed_up
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from accounts import roles, models
 
+from .company import invalidate_on_commit
+from .models import Company
+
 
 @receiver(post_save, sender=User)
 #pylint: disable=unused-argument
@@ -49,3 +52,13 @@ def finish_signup(sender, **kwargs):
     if not getattr(user, 'userprofile', None):
         # pylint: disable=no-member
         models.UserProfile.objects.create(user=user)
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_delete, sender=Company)
+#pylint: disable=unused-argument
+def company_changed(sender, **kwargs):
+    """
+    Invalidate the cached company when committed
+    """
+    invalidate_on_commit()
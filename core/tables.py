@@ -170,7 +170,7 @@ class EmailBatchTable(tables.Table):
                  "id": "id_email_batch"}
         template_name = "django_tables2/bootstrap-responsive.html"
         fields = ('edit', 'id', 'role', 'subject', 'date_created', 'date_finished',
-                  'total', 'sent', 'sender', 'status', 'logs')
+                  'total', 'sent', 'failed', 'sender', 'status', 'logs')
         order_by = ('-date_created')
 
 
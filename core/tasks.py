@@ -6,6 +6,7 @@ Core backgroud tasks
 import channels.layers
 
 from asgiref.sync import async_to_sync
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from celery import shared_task
 from celery.utils.log import get_task_logger
@@ -13,7 +14,9 @@ from celery.utils.log import get_task_logger
 from core.models import EmailBatchMessage
 from accounts import roles
 
-from . import email
+from scheduler import lock
+
+from . import email, retention
 
 
 logger = get_task_logger(__name__)
@@ -54,7 +57,9 @@ def send_email(email_batch_message_pk):
 
     batch_mail = email.BatchEmail(
         email_batch_message_pk=email_batch_message_pk,
-        notify_callback=_notify_channel)
+        notify_callback=_notify_channel,
+        chunk_size=settings.EMAIL_BATCH_CHUNK_SIZE,
+        workers=settings.EMAIL_BATCH_WORKERS)
 
     batch_mail.send()
 
@@ -80,6 +85,37 @@ def send_client_email(subject:str, message: str, sender_user_pk, users_pk):
         batch_mail = email.BatchEmail(
             email_batch_message_pk=email_batch.pk,
             users_pk=users_pk,
-            notify_callback=_notify_channel)
+            notify_callback=_notify_channel,
+            chunk_size=settings.EMAIL_BATCH_CHUNK_SIZE,
+            workers=settings.EMAIL_BATCH_WORKERS)
 
         batch_mail.send()
+
+
+@shared_task
+def requeue_stale_email_batches():
+    """
+    Resend processing batches whose task lock has expired (worker died)
+    Batches resume after their high-water mark
+    """
+    # pylint: disable=no-member
+    batches_pk = EmailBatchMessage.objects.filter(
+        status=EmailBatchMessage.Status.PROCESSING).values_list('pk', flat=True)
+
+    for batch_pk in batches_pk:
+        if not lock.is_locked(email.BatchEmail.lock_key(batch_pk)):
+            logger.info('Email batch %s: stale, requeued', batch_pk)
+            send_email.delay(batch_pk)
+
+
+@shared_task
+def purge_email_batches():
+    """
+    Compact and purge recipients of batches finished before the retention period
+    """
+    metrics = retention.EmailBatchPurge(
+        settings.EMAIL_BATCH_RETENTION_DAYS,
+        chunk_size=settings.EMAIL_BATCH_PURGE_CHUNK_SIZE).run()
+    logger.info(
+        'Email batches purge: %(batches)s batches, %(recipients)s recipients, '
+        '%(send_failed)s send failures in %(elapsed_s)ss (%(rows_per_s)s rows/s)', metrics)
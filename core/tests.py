@@ -1,3 +1,509 @@
-from django.test import TestCase
+"""
+Core tests
+"""
 
-# Create your tests here.
+import json
+import smtplib
+from unittest.mock import MagicMock, patch
+
+from allauth.account.adapter import DefaultAccountAdapter
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from accounts.models import UserRole
+from accounts.roles import Roles
+from core import company, models, retention, tasks
+from core.context_processors import site_name_logo_url
+from core.email import BatchEmail, MessageFactory, Recipient, TemplateMessageFactory
+from scheduler.lock import LockHeartbeat
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=no-member
+
+User = get_user_model()
+
+
+class FailingEmailBackend(EmailBackend):
+    """
+    Refuse messages to addresses starting with 'fail'
+    """
+
+    def send_messages(self, messages):
+        for message in messages:
+            if message.to[0].startswith('fail'):
+                raise smtplib.SMTPRecipientsRefused({message.to[0]: (550, b'Refused')})
+        return super().send_messages(messages)
+
+
+class DroppingEmailBackend(EmailBackend):
+    """
+    Drop the connection once, when sending to drop@example.com
+    """
+
+    dropped = False
+
+    def send_messages(self, messages):
+        if messages[0].to[0] == 'drop@example.com' and not DroppingEmailBackend.dropped:
+            DroppingEmailBackend.dropped = True
+            raise smtplib.SMTPServerDisconnected('Connection unexpectedly closed')
+        return super().send_messages(messages)
+
+
+class LockLosingEmailBackend(EmailBackend):
+    """
+    Lose the task lock after sending three messages
+    """
+
+    heartbeat = None
+
+    def send_messages(self, messages):
+        sent = super().send_messages(messages)
+        if len(mail.outbox) == 3:
+            LockLosingEmailBackend.heartbeat.lost.set()
+        return sent
+
+
+class TestBatchEmail(TestCase):
+    """
+    Batch email sending and recipients bookkeeping
+    """
+
+    fixtures = ['core/fixtures/users.json']
+
+    def setUp(self) -> None:
+        self.sender = User.objects.get(pk=1)
+        self.users_pk = [
+            User.objects.create(username=f'user{i}', email=f'user{i}@example.com').pk
+            for i in range(10)
+        ]
+        return super().setUp()
+
+    def create_batch(self):
+        return models.EmailBatchMessage.objects.create(
+            subject='Assunto', message='<p>Mensagem</p>', sender=self.sender, role=Roles.CLIENT)
+
+    def send(self, users_pk, **kwargs):
+        email_batch = self.create_batch()
+        notified = []
+        BatchEmail(email_batch.pk, users_pk=users_pk,
+                   notify_callback=lambda batch: notified.append(batch.sent), **kwargs)._send()
+        email_batch.refresh_from_db()
+        return email_batch, notified
+
+    def test_send(self):
+        email_batch, notified = self.send(self.users_pk)
+
+        self.assertEqual(email_batch.status, models.EmailBatchMessage.Status.FINISHED)
+        self.assertEqual(email_batch.sent, 10)
+        self.assertEqual(len(mail.outbox), 10)
+        self.assertEqual(notified[-1], 10)
+        self.assertFalse(models.EmailBatchRecipient.objects.exists())
+        self.assertFalse(models.EmailSendFailed.objects.exists())
+
+    def test_sender_pool(self):
+        email_batch, notified = self.send(self.users_pk, workers=4, chunk_size=2)
+
+        self.assertEqual(email_batch.status, models.EmailBatchMessage.Status.FINISHED)
+        self.assertEqual(email_batch.sent, 10)
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox),
+                         sorted(f'user{i}@example.com' for i in range(10)))
+        self.assertEqual(notified[-1], 10)
+        self.assertFalse(models.EmailBatchRecipient.objects.exists())
+
+    @override_settings(EMAIL_BACKEND='core.tests.FailingEmailBackend')
+    def test_sender_pool_failures(self):
+        failing = User.objects.create(username='fail', email='fail@example.com')
+        email_batch, _ = self.send(self.users_pk + [failing.pk], workers=3)
+
+        self.assertEqual(email_batch.status, models.EmailBatchMessage.Status.FINISHED_ERR)
+        self.assertEqual(email_batch.sent, 10)
+        self.assertEqual(email_batch.failed, 1)
+        recipient = models.EmailBatchRecipient.objects.get()
+        self.assertEqual(recipient.user, failing)
+        self.assertIn('Refused', recipient.error_message)
+        self.assertIsNotNone(recipient.email_send_failed)
+
+    @override_settings(EMAIL_BACKEND='core.tests.FailingEmailBackend')
+    def test_chunk_failure_isolation(self):
+        failing = User.objects.create(username='fail', email='fail@example.com')
+        users_pk = self.users_pk[:3] + [failing.pk] + self.users_pk[3:]
+        email_batch, _ = self.send(users_pk, chunk_size=5)
+
+        self.assertEqual(email_batch.status, models.EmailBatchMessage.Status.FINISHED_ERR)
+        self.assertEqual(email_batch.sent, 10)
+        self.assertEqual(len(mail.outbox), 10)
+        recipient = models.EmailBatchRecipient.objects.get()
+        self.assertEqual(recipient.user, failing)
+        self.assertIn('fail@example.com', recipient.email_send_failed.error_message)
+
+    @override_settings(EMAIL_BACKEND='core.tests.DroppingEmailBackend')
+    def test_reconnect(self):
+        DroppingEmailBackend.dropped = False
+        dropping = User.objects.create(username='drop', email='drop@example.com')
+        users_pk = self.users_pk[:5] + [dropping.pk] + self.users_pk[5:]
+        email_batch, _ = self.send(users_pk, chunk_size=11)
+
+        self.assertTrue(DroppingEmailBackend.dropped)
+        self.assertEqual(email_batch.status, models.EmailBatchMessage.Status.FINISHED)
+        self.assertEqual(email_batch.sent, 11)
+        self.assertEqual(len(mail.outbox), 11)
+        self.assertEqual(len({message.to[0] for message in mail.outbox}), 11)
+        self.assertFalse(models.EmailBatchRecipient.objects.exists())
+
+    @override_settings(EMAIL_BACKEND='core.tests.LockLosingEmailBackend')
+    def test_lock_lost(self):
+        email_batch = self.create_batch()
+        batch_email = BatchEmail(email_batch.pk, users_pk=self.users_pk, chunk_size=2)
+        # Lock without timeout: no renewal thread
+        batch_email.heartbeat = LockHeartbeat(MagicMock(timeout=None))
+        LockLosingEmailBackend.heartbeat = batch_email.heartbeat
+        batch_email._send()  # pylint: disable=protected-access
+        email_batch.refresh_from_db()
+
+        # Stopped in the middle of the second chunk, left for the lock owner
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(email_batch.status, models.EmailBatchMessage.Status.PROCESSING)
+        self.assertEqual(email_batch.sent, 3)
+        self.assertEqual(models.EmailBatchRecipient.objects.filter(
+            email_batch=email_batch, sent=False).count(), 7)
+        self.assertEqual(email_batch.last_recipient_pk, models.EmailBatchRecipient.objects.filter(
+            email_batch=email_batch, sent=False).order_by('pk').first().pk - 1)
+
+    def test_coalesced_progress(self):
+        email_batch = self.create_batch()
+        notified = []
+        batch_email = BatchEmail(email_batch.pk, users_pk=self.users_pk,
+                                 notify_callback=lambda batch: notified.append(batch.sent))
+        batch_email.progress_max_messages = 4
+        batch_email.progress_interval_ms = 60000
+        batch_email._send()  # pylint: disable=protected-access
+        email_batch.refresh_from_db()
+
+        self.assertEqual(email_batch.sent, 10)
+        # Start, every 4 messages, remaining on close and finish
+        self.assertEqual(notified, [0, 4, 8, 10, 10])
+        self.assertEqual(batch_email.progress.flushes, 3)
+
+    def test_recipient_chunks(self):
+        email_batch = self.create_batch()
+        batch_email = BatchEmail(email_batch.pk, chunk_size=3)
+        batch_email.create_recipients(self.users_pk)
+        models.EmailBatchRecipient.objects.filter(user__pk=self.users_pk[0]).update(sent=True)
+
+        chunks = batch_email._recipient_chunks()  # pylint: disable=protected-access
+        addresses = []
+        for _ in range(3):
+            with self.assertNumQueries(1):
+                _, recipients = next(chunks)
+            addresses += [recipient.address for recipient in recipients]
+        with self.assertNumQueries(1):
+            self.assertEqual(next(chunks, None), None)
+
+        self.assertEqual(addresses, [f'user{i}@example.com' for i in range(1, 10)])
+
+    def test_role_recipients(self):
+        UserRole.objects.bulk_create([
+            UserRole(user_id=pk, role=Roles.CLIENT) for pk in self.users_pk[:6]] + [
+            UserRole(user_id=pk, role=Roles.ADMIN) for pk in self.users_pk[4:]])
+        User.objects.filter(pk__in=[self.users_pk[0], self.users_pk[8]]).update(is_active=False)
+        email_batch = self.create_batch()
+
+        batch_email = BatchEmail(email_batch.pk)
+        with self.assertNumQueries(1):
+            count = batch_email.create_role_recipients(Roles.CLIENT)
+
+        self.assertEqual(count, 5)
+        # Same users as the role filter
+        expected = User.objects.filter(is_active=True, userrole__role=Roles.CLIENT)
+        self.assertEqual(
+            sorted(models.EmailBatchRecipient.objects.filter(
+                email_batch=email_batch, sent=False).values_list('user__pk', flat=True)),
+            sorted(expected.values_list('pk', flat=True)))
+        self.assertEqual(sorted(expected.values_list('pk', flat=True)), sorted(self.users_pk[1:6]))
+
+    def test_role_broadcast(self):
+        UserRole.objects.bulk_create([
+            UserRole(user_id=pk, role=Roles.CLIENT) for pk in self.users_pk])
+        email_batch, _ = self.send(None)
+
+        self.assertEqual(email_batch.total, 10)
+        self.assertEqual(email_batch.sent, 10)
+        self.assertEqual(len(mail.outbox), 10)
+
+    def test_resume_after_high_water_mark(self):
+        email_batch = self.create_batch()
+        batch_email = BatchEmail(email_batch.pk)
+        batch_email.create_recipients(self.users_pk)
+        recipients = list(models.EmailBatchRecipient.objects.order_by('pk'))
+        # Interrupted task: 4 sent, 1 failed up to the mark, 1 sent after it
+        send_failed = batch_email.get_or_create_send_failed(1)
+        models.EmailBatchRecipient.objects.filter(
+            pk__in=[recipient.pk for recipient in recipients[:4] + recipients[5:6]]
+        ).update(sent=True)
+        models.EmailBatchRecipient.objects.filter(pk=recipients[4].pk).update(
+            email_send_failed=send_failed, error_message='Refused')
+        models.EmailBatchMessage.objects.filter(pk=email_batch.pk).update(
+            status=models.EmailBatchMessage.Status.PROCESSING, total=10, sent=2,
+            last_recipient_pk=recipients[4].pk)
+
+        BatchEmail(email_batch.pk)._send()  # pylint: disable=protected-access
+        email_batch.refresh_from_db()
+
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox),
+                         sorted(recipient.user.email for recipient in recipients[6:]))
+        self.assertEqual(email_batch.sent, 9)
+        self.assertEqual(email_batch.last_recipient_pk, recipients[-1].pk)
+        self.assertEqual(email_batch.status, models.EmailBatchMessage.Status.FINISHED_ERR)
+        self.assertEqual(models.EmailBatchRecipient.objects.get().pk, recipients[4].pk)
+
+    def test_resend_failed(self):
+        email_batch, _ = self.send(self.users_pk)
+        recipient = models.EmailBatchRecipient.objects.create(
+            email_batch=email_batch, user_id=self.users_pk[0])
+        models.EmailBatchMessage.objects.filter(pk=email_batch.pk).update(
+            status=models.EmailBatchMessage.Status.FINISHED_ERR, total=11)
+        mail.outbox.clear()
+
+        BatchEmail(email_batch.pk)._send()  # pylint: disable=protected-access
+        email_batch.refresh_from_db()
+
+        self.assertEqual(mail.outbox[0].to, [recipient.user.email])
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(email_batch.sent, 11)
+        self.assertEqual(email_batch.status, models.EmailBatchMessage.Status.FINISHED)
+
+    def test_high_water_mark_out_of_order(self):
+        email_batch = self.create_batch()
+        batch_email = BatchEmail(email_batch.pk)
+        # pylint: disable=protected-access
+        batch_email._advance_high_water_mark(1, [Recipient(3, ''), Recipient(4, '')])
+        email_batch.refresh_from_db()
+        self.assertEqual(email_batch.last_recipient_pk, 0)
+
+        batch_email._advance_high_water_mark(0, [Recipient(1, ''), Recipient(2, '')])
+        email_batch.refresh_from_db()
+        self.assertEqual(email_batch.last_recipient_pk, 4)
+
+    @patch('core.tasks.send_email.delay')
+    @patch('scheduler.lock.is_locked')
+    def test_requeue_stale_batches(self, is_locked, delay):
+        processing = models.EmailBatchMessage.Status.PROCESSING
+        locked = self.create_batch()
+        stale = self.create_batch()
+        self.create_batch()
+        models.EmailBatchMessage.objects.filter(
+            pk__in=[locked.pk, stale.pk]).update(status=processing)
+        is_locked.side_effect = lambda key: key == BatchEmail.lock_key(locked.pk)
+
+        tasks.requeue_stale_email_batches()
+
+        delay.assert_called_once_with(stale.pk)
+
+
+class TestEmailBatchPurge(TestCase):
+    """
+    Retention of finished batches recipients
+    """
+
+    fixtures = ['core/fixtures/users.json']
+
+    def create_batch(self, days_finished, status=models.EmailBatchMessage.Status.FINISHED_ERR,
+                     failed=3):
+        email_batch = models.EmailBatchMessage.objects.create(
+            subject='Assunto', message='<p>Mensagem</p>', sender=User.objects.get(pk=1),
+            role=Roles.CLIENT, status=status,
+            date_finished=timezone.now() - timezone.timedelta(days=days_finished))
+        send_failed = models.EmailSendFailed.objects.create(
+            email_batch=email_batch, error_message='')
+        models.EmailBatchRecipient.objects.bulk_create([
+            models.EmailBatchRecipient(
+                email_batch=email_batch, email_send_failed=send_failed,
+                user=User.objects.create(username=f'user{email_batch.pk}-{i}'))
+            for i in range(failed)
+        ])
+        return email_batch
+
+    def test_purge(self):
+        old = self.create_batch(100)
+        recent = self.create_batch(10)
+        processing = self.create_batch(100, status=models.EmailBatchMessage.Status.PROCESSING)
+
+        metrics = retention.EmailBatchPurge(90, chunk_size=2).run()
+
+        self.assertEqual(metrics['batches'], 1)
+        self.assertEqual(metrics['recipients'], 3)
+        self.assertEqual(metrics['send_failed'], 1)
+        old.refresh_from_db()
+        self.assertEqual(old.failed, 3)
+        self.assertIsNotNone(old.date_purged)
+        self.assertFalse(models.EmailBatchRecipient.objects.filter(email_batch=old).exists())
+        self.assertFalse(models.EmailSendFailed.objects.filter(email_batch=old).exists())
+        for email_batch in [recent, processing]:
+            self.assertEqual(
+                models.EmailBatchRecipient.objects.filter(email_batch=email_batch).count(), 3)
+
+        self.assertEqual(retention.EmailBatchPurge(90).run()['batches'], 0)
+
+    def test_delete_in_chunks(self):
+        email_batch = self.create_batch(0, failed=5)
+        recipients = models.EmailBatchRecipient.objects.filter(email_batch=email_batch)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(retention.delete_in_chunks(recipients, 2), 5)
+        self.assertFalse(recipients.exists())
+        deletes = [query['sql'] for query in queries if query['sql'].startswith('DELETE')]
+        self.assertEqual(len(deletes), 3)
+
+
+class TestMessageFactory(TestCase):
+    """
+    Messages cloned from a message rendered once
+    """
+
+    def test_recipient_messages(self):
+        base = mail.EmailMessage('Assunto', '<p>Mensagem de ação</p>')
+        base.content_subtype = 'html'
+        factory = MessageFactory(base)
+
+        first = factory.message('a@example.com').message()
+        second = factory.message('b@example.com').message()
+
+        self.assertEqual(first['To'], 'a@example.com')
+        self.assertEqual(second['To'], 'b@example.com')
+        self.assertNotEqual(first['Message-ID'], second['Message-ID'])
+        self.assertEqual(first.get_payload(), second.get_payload())
+        self.assertIsNone(factory.mime['To'])
+
+        expected = mail.EmailMessage(
+            'Assunto', '<p>Mensagem de ação</p>', to=['a@example.com'])
+        expected.content_subtype = 'html'
+        expected = expected.message()
+        for header in ['Subject', 'From', 'Content-Type', 'Content-Transfer-Encoding']:
+            self.assertEqual(first[header], expected[header])
+        self.assertEqual(first.get_payload(), expected.get_payload())
+
+    def test_template_messages(self):
+        adapter = DefaultAccountAdapter()
+        prefix = 'clients/email/client_anniversary'
+        factory = TemplateMessageFactory(prefix, adapter)
+        context = {'name': 'Maria Silva', 'email': 'maria@example.com'}
+
+        message = factory.message('maria@example.com', context)
+        expected = adapter.render_mail(prefix, 'maria@example.com', context)
+
+        self.assertEqual(message.subject, expected.subject)
+        self.assertEqual(message.body, expected.body)
+        self.assertEqual(message.to, ['maria@example.com'])
+        self.assertIn('Maria Silva', message.body)
+
+
+class FakeRedis:
+    """
+    Redis client get/set/delete/incr in a dict
+    """
+
+    def __init__(self):
+        self.data = {}
+
+    # pylint: disable=unused-argument
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def incr(self, key):
+        self.data[key] = int(self.data.get(key) or 0) + 1
+        return self.data[key]
+
+
+@override_settings(COMPANY_CACHE_INTERVAL=60)
+class TestCompanyCache(TestCase):
+    """
+    Company data from process memory and Redis
+    """
+
+    def setUp(self) -> None:
+        self.redis = FakeRedis()
+        patcher = patch.object(company, 'REDIS_CLIENT', self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(company.invalidate_company)
+        company.invalidate_company()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.company = models.Company.objects.create(
+                name='Speed', cnpj='00.000.000/0001-00')
+        return super().setUp()
+
+    def test_render_without_query(self):
+        request = RequestFactory().get('/')
+        with self.assertNumQueries(1):
+            self.assertEqual(company.get_company().name, 'Speed')
+        with self.assertNumQueries(0):
+            site_name_logo_url(request)
+            self.assertEqual(company.get_company().name, 'Speed')
+
+        # Process copy expired: Redis copy
+        # pylint: disable=protected-access
+        company._cached['checked'] = None
+        with self.assertNumQueries(0):
+            self.assertEqual(company.get_company().pk, self.company.pk)
+
+    def test_invalidate(self):
+        company.get_company().name = 'Changed'
+        self.assertEqual(company.get_company().name, 'Speed')
+
+        self.company.name = 'Speed Seven'
+        self.company.save()
+        self.assertEqual(company.get_company().name, 'Speed Seven')
+
+        self.company.delete()
+        self.assertIsNone(company.get_company())
+
+    def test_stale_copy(self):
+        self.assertEqual(company.get_company().name, 'Speed')
+
+        # Read before a change is committed, cached after the commit
+        # pylint: disable=protected-access
+        stale = company._to_fields(models.Company.objects.last())
+        stale_key = f'{company.CACHE_KEY}:{self.redis.get(company.VERSION_KEY)}'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.company.name = 'Speed Seven'
+            self.company.save()
+            # Own uncommitted change is read, not cached
+            self.assertEqual(company.get_company().name, 'Speed Seven')
+        self.redis.set(stale_key, json.dumps(stale))
+
+        with self.assertNumQueries(1):
+            self.assertEqual(company.get_company().name, 'Speed Seven')
+
+        # Plain field values in Redis
+        data = json.loads(self.redis.get(
+            f'{company.CACHE_KEY}:{self.redis.get(company.VERSION_KEY)}'))
+        self.assertEqual(data['name'], 'Speed Seven')
+        self.assertEqual(data['logo'], '')
+
+    def test_invalidated_while_loading(self):
+        load = company._load
+
+        def concurrent_load():
+            # Other threads are not blocked while loading
+            # pylint: disable=protected-access
+            self.assertFalse(company._lock.locked())
+            stale = load()
+            company.invalidate_company()
+            return stale
+
+        # pylint: disable=protected-access
+        company._cached['checked'] = None
+        with patch.object(company, '_load', side_effect=concurrent_load):
+            self.assertEqual(company.get_company().name, 'Speed')
+        self.assertIsNone(company._cached['checked'])
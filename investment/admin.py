@@ -5,7 +5,8 @@ Admin models
 from django.contrib import admin
 from simple_history.admin import SimpleHistoryAdmin
 
-from .models import Application, ApplicationAccount, ApplicationOp, MoneyTransfer, Bank, BankAccount, AccountOpSchedule
+from .models import (Application, ApplicationAccount, ApplicationOp, MoneyTransfer, Bank,
+                     BankAccount, AccountOpSchedule, AccountBalance, AccountClosingBalance)
 
 
 @admin.register(Application)
@@ -56,3 +57,18 @@ class AccountOpScheduleAdmin(admin.ModelAdmin):
     """
     AccountOpSchedule model admin
     """
+
+
+@admin.register(AccountBalance)
+class AccountBalanceAdmin(admin.ModelAdmin):
+    """
+    AccountBalance model admin
+    """
+    readonly_fields = ['last_op']
+
+
+@admin.register(AccountClosingBalance)
+class AccountClosingBalanceAdmin(admin.ModelAdmin):
+    """
+    AccountClosingBalance model admin
+    """
@@ -11,6 +11,7 @@ from investment.interfaces import enums
 from common.formats import decimal_format
 
 from . import forms, models, agreement_renderer
+from .operations import ApplicationAccountOperation
 
 
 class Crowdfunding(ApplicationModelClassBase):
@@ -23,6 +24,7 @@ class Crowdfunding(ApplicationModelClassBase):
     application_operation_form = forms.OperationForm
     deposit_form = forms.DepositForm
     operation_approval_form = forms.OperationApprovalForm
+    operation_class = ApplicationAccountOperation
 
     @classmethod
     def aplication_post_create(cls, application):
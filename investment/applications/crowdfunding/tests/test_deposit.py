@@ -2,13 +2,15 @@
 Application test
 """
 import os
+import shutil
+import tempfile
 
 from http import HTTPStatus
 from unittest import mock
 
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 
 from clients.views.operations import ClientDepositView
@@ -35,6 +37,16 @@ class TestClientDepositOperation(TestCase):
         'applications'
     ]
 
+    @classmethod
+    def setUpClass(cls):
+        # Uploaded receipts are written to a temporary media root
+        media_root = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        media_settings = override_settings(MEDIA_ROOT=media_root)
+        media_settings.enable()
+        cls.addClassCleanup(media_settings.disable)
+        super().setUpClass()
+
     def setUp(self):
         self.user = User.objects.get(pk=2)
 
@@ -4,6 +4,7 @@ Application definitions
 
 from investment.interfaces.base import ApplicationModelClassBase
 from investment.interfaces.enums import PostCreateState
+from investment.operations.operations import ApplicationAccountOperation
 
 from . import forms, models, agreement_renderer
 
@@ -19,6 +20,7 @@ class SimpleInterestPoolAccount(ApplicationModelClassBase):
     withdraw_form = forms.WithdrawForm
     operation_approval_form = forms.OperationApprovalForm
     operation_completion_form = forms.OperationCompletionForm
+    operation_class = ApplicationAccountOperation
 
 
     @classmethod
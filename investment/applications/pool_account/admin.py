@@ -2,10 +2,17 @@ from django.contrib import admin
 
 # Register your models here.
 
-from .models import IncomeOperation
+from .models import IncomeOperation, IncomeOperationChunk
 
 @admin.register(IncomeOperation)
 class IncomeOperationAdmin(admin.ModelAdmin):
     """
     IncomeOperation model admin
     """
+
+
+@admin.register(IncomeOperationChunk)
+class IncomeOperationChunkAdmin(admin.ModelAdmin):
+    """
+    IncomeOperationChunk model admin
+    """
@@ -0,0 +1,217 @@
+"""
+Income calculation benchmark
+
+Each size runs in a transaction rolled back at the end (unless keep is set):
+synthetic accounts are generated (investment.synthetic), then
+run_income_operation is timed end to end.
+
+Phases:
+    query: database statements out of operation writes
+    write: ApplicationOpBulkWriter batches (COPY/inserts and balances)
+    compute: the remaining time (calculation and rows iteration; rows
+             fetched from server side cursors are counted here)
+
+With memory set, the peak of Python allocations (tracemalloc) during the
+income operation is reported; tracing slows down the run, so its timings are
+not comparable with runs without it.
+"""
+
+import contextlib
+import subprocess
+import threading
+import time
+import tracemalloc
+
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from investment.models import Application, ApplicationModel
+from investment.operations.bulk import ApplicationOpBulkWriter
+from investment.synthetic import LedgerGenerator
+
+from .income import get_income_calculation
+from .models import IncomeOperation
+
+User = get_user_model()
+
+
+class PhaseTimer:
+    """
+    Database statements and operation writes time
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.query_time = 0.0
+        self.write_batches = 0
+        self.write_time = 0.0
+        self._writing = False
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            if not self._writing:
+                self.query_time += time.perf_counter() - start
+
+    @contextlib.contextmanager
+    def timing(self):
+        """
+        Time database statements and bulk writer batches of the current thread
+        The bulk writer method is restored on exit
+        """
+        write_batch = ApplicationOpBulkWriter.write_batch
+        timer = self
+        thread = threading.get_ident()
+
+        def timed_write_batch(writer, batch):
+            if threading.get_ident() != thread:
+                return write_batch(writer, batch)
+            start = time.perf_counter()
+            timer._writing = True  # pylint: disable=protected-access
+            try:
+                return write_batch(writer, batch)
+            finally:
+                timer._writing = False  # pylint: disable=protected-access
+                timer.write_batches += 1
+                timer.write_time += time.perf_counter() - start
+
+        try:
+            ApplicationOpBulkWriter.write_batch = timed_write_batch
+            with connection.execute_wrapper(self):
+                yield self
+        finally:
+            ApplicationOpBulkWriter.write_batch = write_batch
+
+
+@contextlib.contextmanager
+def traced_memory(enabled=True):
+    """
+    Peak traced memory (bytes) of the block, in the yielded dict 'peak' key
+    """
+    memory = {'peak': None}
+    if not enabled:
+        yield memory
+        return
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = tracemalloc.get_traced_memory()[0]
+    try:
+        yield memory
+    finally:
+        memory['peak'] = tracemalloc.get_traced_memory()[1] - start
+        if not tracing:
+            tracemalloc.stop()
+
+
+class IncomeBenchmark:
+    """
+    Time IncomeCalculation.run_income_operation for a list of account counts
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, engine=None, months=3, income_date=None, seed=0, keep=False,
+                 memory=False):
+        self.engine = engine
+        self.income_calculation = get_income_calculation(engine)
+        self.months = months
+        self.income_date = (income_date or timezone.localdate(timezone.now())).replace(day=1)
+        self.seed = seed
+        self.keep = keep
+        self.memory = memory
+        self.operator = User.objects.filter(is_superuser=True).order_by('pk').first()
+
+    def run(self, sizes, progress=None):
+        """
+        Run all sizes, return results
+        """
+        results = []
+        for accounts in sorted(sizes):
+            results.append(self.run_size(accounts))
+            if progress:
+                progress(results[-1])
+        return {
+            'engine': self.income_calculation.__name__,
+            'database': connection.vendor,
+            'commit': self.commit(),
+            'date': timezone.now().isoformat(),
+            'income_date': self.income_date.isoformat(),
+            'months': self.months,
+            'results': results,
+        }
+
+    def run_size(self, accounts):
+        """
+        Generate the accounts and run the income operation
+        """
+        with transaction.atomic():
+            application = self._create_application()
+            generator = LedgerGenerator(
+                application, self.operator, self.income_date,
+                months=self.months, seed=self.seed)
+            start = time.perf_counter()
+            _, ledger_operations = generator.generate(accounts)
+            generate_time = time.perf_counter() - start
+
+            # pylint: disable=no-member
+            income_op = IncomeOperation.objects.create(
+                application=application, income_date=self.income_date,
+                full_rate=4.3, costs_rate=1.7, net_rate=2.6, paid_rate=1.5,
+                operator=self.operator)
+
+            with PhaseTimer().timing() as timer, traced_memory(self.memory) as memory:
+                start = time.perf_counter()
+                self.income_calculation.run_income_operation(income_op, lambda message: None)
+                total_time = time.perf_counter() - start
+
+            income_operations = income_op.chunks.aggregate(
+                total=Sum('operations'))['total'] or 0
+
+            if not self.keep:
+                transaction.set_rollback(True)
+
+        return {
+            'accounts': accounts,
+            'ledger_operations': ledger_operations,
+            'income_operations': income_operations,
+            'state': income_op.state,
+            'generate_s': round(generate_time, 4),
+            'total_s': round(total_time, 4),
+            'query_s': round(timer.query_time, 4),
+            'compute_s': round(total_time - timer.query_time - timer.write_time, 4),
+            'write_s': round(timer.write_time, 4),
+            'queries': timer.queries,
+            'write_batches': timer.write_batches,
+            'accounts_per_s': round(accounts / total_time, 1) if total_time else None,
+            'peak_memory_kb': memory['peak'] // 1024 if self.memory else None,
+        }
+
+    def _create_application(self):
+        # pylint: disable=no-member
+        app_model = ApplicationModel.objects.filter(
+            app_model_class='SimpleInterestPoolAccount').first()
+        if not app_model:
+            app_model = ApplicationModel.objects.create(
+                name='conta_pool', display_text='Conta pool',
+                app_model_class='SimpleInterestPoolAccount', operator=self.operator)
+        return Application.objects.create(
+            name='benchmark', display_text='Benchmark', application_model=app_model,
+            is_active=True, operator=self.operator)
+
+    @staticmethod
+    def commit():
+        """
+        Current git commit, if available
+        """
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
@@ -16,6 +16,7 @@ from common.forms.fields import DatePickerInput
 
 from investment.interfaces.forms import (ApplicationOperationFormBase, MoneyTransfer, MoneyTransferFormBase,
                                          ApplicationSettingsFormMixin, OperationApprovalFormMixin)
+from investment.models import AccountOpSchedule
 from investment.operations.operations import ApplicationAccountOperation
 
 from .models import AccountSettings, ApplicationSettings, IncomeOperation
@@ -286,6 +287,16 @@ class OperationCompletionForm(forms.ModelForm):
         obj = super().save(commit=False)
         if commit:
             with transaction.atomic():
+                # Same locks (and order) of the schedule executor
+                # (investment.operations.schedule): the transfer may be
+                # deposited by it meanwhile
+                # pylint: disable=no-member
+                schedule = AccountOpSchedule.objects.select_for_update(
+                    of=('self', 'money_transfer')
+                ).select_related('money_transfer').get(money_transfer=obj)
+                if schedule.money_transfer.state == MoneyTransfer.State.FINISHED:
+                    return schedule.money_transfer
+
                 if self.cleaned_data.get('do_deposit'):
                     acc_op = ApplicationAccountOperation()
                     acc_op.make_deposit(
@@ -298,7 +309,6 @@ class OperationCompletionForm(forms.ModelForm):
                 obj.state = MoneyTransfer.State.FINISHED
                 obj.save()
                 # Terminating schedule
-                schedule = obj.accountopschedule
                 schedule.trial = 1
                 schedule.processor = self.user
                 # pylint: disable=no-member
@@ -0,0 +1,55 @@
+"""
+Income calculation benchmark command
+"""
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...benchmark import IncomeBenchmark
+
+
+class Command(BaseCommand):
+    """
+    Time income operations over synthetic accounts and output json results
+    """
+
+    help = 'Benchmark income calculation with synthetic accounts ' \
+        '(generated data is rolled back unless --keep is used)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='1000,10000,100000',
+                            help='Comma separated number of accounts')
+        parser.add_argument('--engine', default=None,
+                            help='Income calculation engine (default: INCOME_OPERATION_ENGINE)')
+        parser.add_argument('--months', type=int, default=3,
+                            help='Months of operations history')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--output', default=None, help='Json output file')
+        parser.add_argument('--keep', action='store_true',
+                            help='Keep generated data')
+        parser.add_argument('--memory', action='store_true',
+                            help='Trace the income operation peak memory (slower)')
+
+    def handle(self, *args, **options):
+        try:
+            sizes = [int(size) for size in options['sizes'].split(',')]
+            benchmark = IncomeBenchmark(
+                engine=options['engine'], months=options['months'],
+                seed=options['seed'], keep=options['keep'], memory=options['memory'])
+        except ValueError as error:
+            raise CommandError(error) from error
+        if not benchmark.operator:
+            raise CommandError('A superuser is required as operator')
+
+        def progress(result):
+            self.stderr.write(
+                f"{result['accounts']} accounts: {result['total_s']}s "
+                f"({result['queries']} queries)")
+
+        results = json.dumps(benchmark.run(sizes, progress), indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as output:
+                output.write(results)
+        else:
+            self.stdout.write(results)
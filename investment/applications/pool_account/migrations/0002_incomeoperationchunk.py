@@ -0,0 +1,32 @@
+# Generated by Django 3.2 on 2026-10-18 14:14
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pool_account', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IncomeOperationChunk',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('first_account_id', models.BigIntegerField(verbose_name='Primeira conta')),
+                ('last_account_id', models.BigIntegerField(verbose_name='Última conta')),
+                ('state', models.CharField(choices=[('WAIT', 'Aguardando'), ('FINI', 'Finalizado')], default='WAIT', max_length=4, verbose_name='Situação')),
+                ('operations', models.PositiveIntegerField(default=0, verbose_name='Operações realizadas')),
+                ('date_finished', models.DateTimeField(blank=True, null=True, verbose_name='Fim do bloco')),
+                ('income_operation', models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='chunks', to='pool_account.incomeoperation', verbose_name='Cálculo de rendimento')),
+            ],
+            options={
+                'verbose_name': 'Bloco de cálculo de rendimento',
+                'verbose_name_plural': 'Blocos de cálculo de rendimento',
+                'ordering': ['income_operation', 'first_account_id'],
+                'unique_together': {('income_operation', 'first_account_id')},
+            },
+        ),
+    ]
@@ -150,3 +150,43 @@ class IncomeOperation(models.Model):
 
     operator = models.ForeignKey(settings.AUTH_USER_MODEL,
                                  verbose_name='Operador', on_delete=models.CASCADE)
+
+
+class IncomeOperationChunk(models.Model):
+    """
+    Income operation checkpoint for an application account range
+    Each chunk is saved in its own transaction with its income operations
+    """
+
+    class Meta:
+        """
+        Meta class
+        """
+        verbose_name = 'Bloco de cálculo de rendimento'
+        verbose_name_plural = 'Blocos de cálculo de rendimento'
+        unique_together = [['income_operation', 'first_account_id']]
+        ordering = ['income_operation', 'first_account_id']
+
+    class State(models.TextChoices):
+        """
+        Chunk state
+        """
+        WATING = 'WAIT', 'Aguardando'
+        FINISHED = 'FINI', 'Finalizado'
+
+    income_operation = models.ForeignKey(
+        IncomeOperation, verbose_name='Cálculo de rendimento',
+        related_name='chunks', on_delete=models.CASCADE, editable=False)
+
+    first_account_id = models.BigIntegerField(verbose_name='Primeira conta')
+
+    last_account_id = models.BigIntegerField(verbose_name='Última conta')
+
+    state = models.CharField(verbose_name='Situação', max_length=4, choices=State.choices,
+                             default=State.WATING)
+
+    operations = models.PositiveIntegerField(
+        verbose_name='Operações realizadas', default=0)
+
+    date_finished = models.DateTimeField(
+        verbose_name='Fim do bloco', null=True, blank=True)
@@ -2,11 +2,12 @@
 Aplication tasks
 """
 
-from celery import shared_task
+from celery import group, shared_task
 from celery.utils.log import get_task_logger
+from django.conf import settings
 
 from .models import IncomeOperation
-from .income import IncomeCalculation
+from .income import get_income_calculation
 
 def notify_progress(message):
     """
@@ -14,13 +15,62 @@ def notify_progress(message):
     """
     # TODO: implement websocket
 
+
+def shard_progress(income_operation_pk, shard):
+    """
+    Progress notifyer for one shard of an income operation
+    """
+    def _notify(message):
+        notify_progress(f'Rendimento {income_operation_pk} - parte {shard}: {message}')
+    return _notify
+
+
 @shared_task
 def run_income_operation(income_operation_pk):
     """
     Run income operation in background
+    With INCOME_OPERATION_SHARDS > 1, the operation chunks are split in shards
+    calculated in parallel by run_income_shard tasks
     """
     logger = get_task_logger(__name__)
 
     # pylint: disable=no-member
     income_operation = IncomeOperation.objects.get(pk=income_operation_pk)
-    IncomeCalculation.run_income_operation(income_operation, notify_progress)
+    income_calculation = get_income_calculation()
+
+    shards = getattr(settings, 'INCOME_OPERATION_SHARDS', 1)
+    if shards > 1:
+        income_calculation.start_income_operation(income_operation)
+        if income_operation.state != IncomeOperation.State.RUNNING:
+            return
+
+        shard_chunks = income_calculation.shard_chunks(income_operation, shards)
+        if not shard_chunks:
+            income_calculation.finish_income_operation(income_operation)
+            return
+
+        logger.info('Income operation %s: %s shards',
+                    income_operation_pk, len(shard_chunks))
+        shard_group = group(
+            run_income_shard.s(income_operation_pk, chunk_pks, shard)
+            for shard, chunk_pks in enumerate(shard_chunks, start=1))
+        if settings.INCOME_OPERATION_RUN_IN_BACKGROUND:
+            shard_group.apply_async()
+        else:
+            shard_group.apply()
+    else:
+        income_calculation.run_income_operation(income_operation, notify_progress)
+
+
+@shared_task
+def run_income_shard(income_operation_pk, chunk_pks, shard):
+    """
+    Run income operation chunks of one shard
+    The last finished shard sets the operation as finished
+    """
+    # pylint: disable=no-member
+    income_operation = IncomeOperation.objects.get(pk=income_operation_pk)
+    income_calculation = get_income_calculation()
+    chunks = list(income_operation.chunks.filter(pk__in=chunk_pks))
+    income_calculation.run_income_chunks(
+        income_operation, chunks, shard_progress(income_operation_pk, shard))
@@ -0,0 +1,41 @@
+"""
+Income benchmark test
+"""
+
+import tracemalloc
+
+from django.test import TestCase
+
+from investment.models import ApplicationAccount
+from investment.operations.bulk import ApplicationOpBulkWriter
+from ..benchmark import IncomeBenchmark
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=no-member
+
+
+class TestIncomeBenchmark(TestCase):
+    """
+    Benchmark runs the income operation and rolls back generated data
+    """
+
+    fixtures = [
+        'core/fixtures/users.json',
+        'clients/fixtures/clients.json',
+    ]
+
+    def test_run(self):
+        accounts = ApplicationAccount.objects.count()
+        write_batch = ApplicationOpBulkWriter.write_batch
+        results = IncomeBenchmark(engine='python', memory=True).run([5, 10])
+
+        self.assertEqual(results['engine'], 'IncomeCalculation')
+        self.assertEqual([result['accounts'] for result in results['results']], [5, 10])
+        for result in results['results']:
+            self.assertEqual(result['state'], 'FINI')
+            self.assertEqual(result['income_operations'], result['accounts'])
+            self.assertGreater(result['queries'], 0)
+            self.assertGreater(result['peak_memory_kb'], 0)
+        self.assertEqual(ApplicationAccount.objects.count(), accounts)
+        self.assertIs(ApplicationOpBulkWriter.write_batch, write_batch)
+        self.assertFalse(tracemalloc.is_tracing())
@@ -3,16 +3,22 @@ Application test
 """
 
 from http import HTTPStatus
+from unittest import mock
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.db import transaction
+from django.db.backends.utils import CursorWrapper
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 
-
+from common.dates import MonthWindow
 from investment.models import ApplicationAccount, ApplicationOp
-from ..models import IncomeOperation, AccountSettings
+from investment.synthetic import LedgerGenerator
+from ..income import (IncomeCalculation, StreamingIncomeCalculation,
+                      VectorizedIncomeCalculation, get_income_calculation)
+from ..models import IncomeOperation, IncomeOperationChunk, AccountSettings
 
 #pylint: disable=no-member
 
@@ -553,3 +559,244 @@ class TestIncomeOperation(TestCase):
             application_account=self.app_acc2).last()
         self.assertEqual(acc_op.value, 360)
         self.assertEqual(acc_op.balance, 20360)
+
+
+    def test_resume_running_operation(self):
+        """ A failed run resumes from the unfinished chunks """
+        operation_date = self.operation_date(day=1)
+        self.make_deposit(10000, operation_date, self.app_acc1)
+        self.make_deposit(20000, operation_date, self.app_acc2)
+
+        income_op = IncomeOperation.objects.create(
+            application=self.app_acc1.application,
+            income_date=timezone.datetime(year=2022, month=6, day=1).date(),
+            full_rate=4.3, costs_rate=1.7, net_rate=2.6, paid_rate=1.5,
+            operator=self.operator
+        )
+
+        calculation = get_income_calculation()
+        make_operations = calculation._make_operations
+        calls = []
+
+        def fail_second_chunk(operation_objects, progress_notifyer):
+            calls.append(1)
+            if len(calls) == 2:
+                raise RuntimeError('Worker killed')
+            return make_operations(operation_objects, progress_notifyer)
+
+        with mock.patch.object(calculation, 'checkpoint_chunk_size', 1), \
+                mock.patch.object(calculation, '_make_operations', fail_second_chunk):
+            with self.assertRaises(RuntimeError):
+                calculation.run_income_operation(income_op, lambda msg: None)
+
+        income_op.refresh_from_db()
+        self.assertEqual(income_op.state, IncomeOperation.State.RUNNING)
+        finished = income_op.chunks.filter(
+            state=IncomeOperationChunk.State.FINISHED)
+        self.assertEqual(finished.count(), 1)
+        self.assertEqual(1, ApplicationOp.objects.filter(
+            operation_type=ApplicationOp.OperationType.INCOME).count())
+
+        calculation.run_income_operation(income_op, lambda msg: None)
+
+        income_op.refresh_from_db()
+        self.assertEqual(income_op.state, IncomeOperation.State.FINISHED)
+        self.assertFalse(income_op.chunks.exclude(
+            state=IncomeOperationChunk.State.FINISHED).exists())
+
+        acc_op = ApplicationOp.objects.filter(
+            application_account=self.app_acc1).last()
+        self.assertEqual(acc_op.value, 150)
+        acc_op = ApplicationOp.objects.filter(
+            application_account=self.app_acc2).last()
+        self.assertEqual(acc_op.value, 300)
+        self.assertEqual(2, ApplicationOp.objects.filter(
+            operation_type=ApplicationOp.OperationType.INCOME).count())
+
+
+    def test_resume_running_operation_without_chunks(self):
+        """ A running operation without chunks is calculated, not just finished """
+        operation_date = self.operation_date(day=1)
+        self.make_deposit(10000, operation_date, self.app_acc1)
+
+        income_op = IncomeOperation.objects.create(
+            application=self.app_acc1.application,
+            income_date=timezone.datetime(year=2022, month=6, day=1).date(),
+            full_rate=4.3, costs_rate=1.7, net_rate=2.6, paid_rate=1.5,
+            operator=self.operator, state=IncomeOperation.State.RUNNING
+        )
+
+        calculation = get_income_calculation()
+        calculation.run_income_operation(income_op, lambda msg: None)
+
+        income_op.refresh_from_db()
+        self.assertEqual(income_op.state, IncomeOperation.State.FINISHED)
+        self.assertTrue(income_op.chunks.exists())
+        acc_op = ApplicationOp.objects.filter(
+            application_account=self.app_acc1).last()
+        self.assertEqual(acc_op.operation_type, ApplicationOp.OperationType.INCOME)
+        self.assertEqual(acc_op.value, 150)
+
+        # Running again does not create chunks or income twice
+        chunks = income_op.chunks.count()
+        calculation.start_income_operation(income_op)
+        self.assertEqual(income_op.chunks.count(), chunks)
+        self.assertEqual(1, ApplicationOp.objects.filter(
+            application_account=self.app_acc1,
+            operation_type=ApplicationOp.OperationType.INCOME).count())
+
+
+    @override_settings(INCOME_OPERATION_SHARDS=2)
+    def test_sharded_operation(self):
+        """ Income calculated in shards finishes the operation """
+        operation_date = self.operation_date(day=1)
+        self.make_deposit(10000, operation_date, self.app_acc1)
+        self.make_deposit(20000, operation_date, self.app_acc2)
+
+        calculation = get_income_calculation()
+        with mock.patch.object(calculation, 'checkpoint_chunk_size', 1):
+            response = self.post_income(4.3, 1.7, 2.6, paid_rate=1.5)
+        self.assertEqual(response.status_code, HTTPStatus.FOUND)
+
+        income_op = IncomeOperation.objects.last()
+        self.assertEqual(income_op.state, IncomeOperation.State.FINISHED)
+        self.assertEqual(
+            len(calculation.shard_chunks(income_op, 2)), 0)
+        self.assertEqual(income_op.chunks.count(),
+                         self.app_acc1.application.applicationaccount_set.filter(
+                             is_active=True).count())
+
+        acc_op = ApplicationOp.objects.filter(
+            application_account=self.app_acc1).last()
+        self.assertEqual(acc_op.value, 150)
+        acc_op = ApplicationOp.objects.filter(
+            application_account=self.app_acc2).last()
+        self.assertEqual(acc_op.value, 300)
+
+
+    def test_shard_account_range(self):
+        """ Shard queries only read the accounts of its chunks """
+        operation_date = self.operation_date(day=1)
+        self.make_deposit(10000, operation_date, self.app_acc1)
+        self.make_deposit(20000, operation_date, self.app_acc2)
+
+        application = self.app_acc1.application
+        income_op = IncomeOperation.objects.create(
+            application=application,
+            income_date=timezone.datetime(year=2022, month=6, day=1).date(),
+            full_rate=4.3, costs_rate=1.7, net_rate=2.6, paid_rate=1.5,
+            operator=self.operator
+        )
+        calculation = get_income_calculation()
+        with mock.patch.object(calculation, 'checkpoint_chunk_size', 1):
+            calculation.start_income_operation(income_op)
+        chunk = income_op.chunks.get(first_account_id=self.app_acc2.pk)
+        account_range = (self.app_acc2.pk, self.app_acc2.pk)
+
+        with mock.patch.object(calculation, '_custom_taxes',
+                               wraps=calculation._custom_taxes) as custom_taxes:
+            calculation.run_income_chunks(income_op, [chunk], lambda msg: None)
+        custom_taxes.assert_called_once_with(application, 1.5, account_range)
+
+        month_ops = calculation._current_month_operations(
+            application, income_op.income_date, account_range)
+        self.assertEqual(
+            {op['application_account_id'] for op in month_ops}, {self.app_acc2.pk})
+        self.assertEqual(list(dict(calculation._custom_taxes(
+            application, 1.5, account_range))), [self.app_acc2.pk])
+
+        # Only the shard accounts get income
+        income_ops = ApplicationOp.objects.filter(
+            operation_type=ApplicationOp.OperationType.INCOME)
+        self.assertEqual(
+            list(income_ops.values_list('application_account_id', flat=True)),
+            [self.app_acc2.pk])
+
+
+class TestIncomeEngines(TestCase):
+    """
+    Numpy and streaming engines compared with the python calculation
+    """
+
+    fixtures = [
+        'core/fixtures/users.json',
+        'clients/fixtures/clients.json',
+        'accounts/fixtures/roles.json',
+        'products/fixtures/products.json',
+        'pool_account.json',
+        'applications'
+    ]
+
+    accounts = 30
+
+    def setUp(self):
+        self.operator = User.objects.get(pk=1)
+        self.application = ApplicationAccount.objects.get(pk=1).application
+        self.income_date = timezone.datetime(year=2022, month=6, day=1).date()
+        LedgerGenerator(self.application, self.operator, self.income_date,
+                        months=3, seed=7).generate(self.accounts)
+        for account in self.application.applicationaccount_set.order_by('pk')[:10:3]:
+            AccountSettings.objects.update_or_create(
+                application_account=account, defaults={'custom_rate': 1.37})
+
+    def run_engine(self, calculation):
+        """ Income operations of a full run, rolled back """
+        sid = transaction.savepoint()
+        income_op = IncomeOperation.objects.create(
+            application=self.application, income_date=self.income_date,
+            full_rate=4.3, costs_rate=1.7, net_rate=2.6, paid_rate=1.5,
+            operator=self.operator
+        )
+        with mock.patch.object(calculation, 'checkpoint_chunk_size', 7):
+            calculation.run_income_operation(income_op, lambda msg: None)
+        income_op.refresh_from_db()
+        self.assertEqual(income_op.state, IncomeOperation.State.FINISHED)
+        operations = list(ApplicationOp.objects.filter(
+            operation_type=ApplicationOp.OperationType.INCOME,
+            operation_date__gte=MonthWindow(self.income_date).start
+        ).order_by('application_account_id').values_list(
+            'application_account_id', 'value', 'balance', 'operation_date'))
+        transaction.savepoint_rollback(sid)
+        return operations
+
+    def test_engines_same_values(self):
+        """ All engines save the same rounded operations """
+        expected = self.run_engine(IncomeCalculation)
+        self.assertEqual(len(expected), self.accounts)
+        for engine in (VectorizedIncomeCalculation, StreamingIncomeCalculation):
+            with self.subTest(engine=engine.__name__):
+                self.assertEqual(self.run_engine(engine), expected)
+
+    def test_streaming_bounded_rows(self):
+        """ Streaming engine fetches at most stream_chunk_size rows per query """
+        events = []
+
+        def fetchmany(cursor, size=None):
+            rows = cursor.cursor.fetchmany(size)
+            events.append(('fetch', len(rows)))
+            return rows
+
+        calculation = StreamingIncomeCalculation
+        month_ops = calculation._current_month_operations(
+            self.application, self.income_date)
+        first_day_ops = calculation._first_day_operations(
+            self.application, self.income_date)
+        custom_taxes = calculation._custom_taxes(self.application, 1.5)
+
+        with mock.patch.object(calculation, 'stream_chunk_size', 4), \
+                mock.patch.object(CursorWrapper, 'fetchmany', fetchmany, create=True):
+            for obj in calculation._income_operations(
+                    first_day_ops, month_ops, custom_taxes, self.income_date,
+                    self.operator):
+                events.append(('operation', obj.application_account_id))
+
+        fetched = [count for event, count in events if event == 'fetch']
+        self.assertGreater(len(fetched), self.accounts / 4)
+        self.assertLessEqual(max(fetched), 4)
+        # Operations are yielded while rows are still being fetched
+        first_operation = min(
+            i for i, (event, _) in enumerate(events) if event == 'operation')
+        last_fetch = max(i for i, (event, _) in enumerate(events) if event == 'fetch')
+        self.assertLess(first_operation, last_fetch)
+        self.assertEqual(
+            sum(1 for event, _ in events if event == 'operation'), self.accounts)
@@ -1,6 +1,18 @@
 from django.apps import AppConfig
+from django.core import checks
 
 
 class InvestimentConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'investment'
+
+    def ready(self) -> None:
+        # pylint: disable=import-outside-toplevel
+        from .app_settings import APPLICATION_MODEL_CLASS_ROOT_PATH
+        from .checks import check_application_model_classes
+        from .interfaces.base import ApplicationModelClassBase
+        from .models import application_model_classes
+
+        application_model_classes.register_module(
+            APPLICATION_MODEL_CLASS_ROOT_PATH, ApplicationModelClassBase)
+        checks.register(check_application_model_classes, checks.Tags.database)
@@ -0,0 +1,27 @@
+"""
+Investment system checks
+"""
+
+from django.core import checks
+from django.db import DatabaseError
+
+from .models import ApplicationModel, application_model_classes
+
+
+# pylint: disable=unused-argument
+def check_application_model_classes(app_configs=None, databases=None, **kwargs):
+    """
+    Application models with a class not registered
+    """
+    if not databases:
+        return []
+    try:
+        # pylint: disable=no-member
+        classes = list(ApplicationModel.objects.values_list('pk', 'app_model_class'))
+    except DatabaseError:
+        return []
+    return [
+        checks.Error(f'Classe de modelo de aplicação não encontrada: {class_name}',
+                     obj=f'ApplicationModel {pk}', id='investment.E001')
+        for pk, class_name in classes if class_name not in application_model_classes
+    ]
@@ -46,11 +46,11 @@ class DirectOpFormBase(formats.DecimalFieldFormMixin, forms.ModelForm):
         self.fields['operation_date'].required = False
         self.app_op = ApplicationAccountOperation()
 
-        last_op = self.application_account.applicationop_set.last()
-        if last_op:
-            balance = last_op.balance
+        snapshot = self.application_account.balance_snapshot
+        if snapshot.has_operations:
+            balance = snapshot.balance
             operation_date = timezone.localtime(
-                last_op.operation_date).strftime('%d/%m/%Y %H:%M:%S')
+                snapshot.last_op_date).strftime('%d/%m/%Y %H:%M:%S')
         else:
             balance = 0
             operation_date = '-----'
@@ -42,6 +42,15 @@ class ApplicationModelClassBase:
     withdraw_form = None
     operation_approval_form = None
     operation_completion_form = None
+    # AbstractAccountOperation implementation (scheduled operations executor)
+    operation_class = None
+
+    @classmethod
+    def get_operation_class(cls):
+        """
+        Application account operation class
+        """
+        return cls.operation_class
 
     @classmethod
     def get_form(cls, form: enums.ApplicationFormType, application_account=None):
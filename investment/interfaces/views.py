@@ -10,7 +10,7 @@ from django.urls import reverse_lazy
 from django.shortcuts import get_object_or_404
 
 from common.views import mixins, generic
-from core.models import Company
+from core.company import get_company
 
 from ..models import Application, ApplicationAccount, MoneyTransfer
 from .enums import ApplicationFormType
@@ -243,8 +243,7 @@ class ApplicationDepositBaseView(ApplicationAccountBaseView, generic.CreateView)
         Company context
         """
         context = super().get_context_data(**kwargs)
-        # pylint: disable=no-member
-        company = Company.objects.last()
+        company = get_company()
         if company:
             context['bank_info'] = company
             context['bank_info'].description = 'Conta para depósito'
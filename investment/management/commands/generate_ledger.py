@@ -0,0 +1,55 @@
+"""
+Synthetic ledger generator command
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from investment.models import Application
+from investment.synthetic import LedgerGenerator
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """
+    Generate clients, application accounts and operations for benchmarks
+    """
+
+    help = 'Generate synthetic clients and application accounts with operation ' \
+        'histories (benchmarks only, never use in production databases)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('accounts', type=int, help='Number of accounts')
+        parser.add_argument('--application', type=int, required=True,
+                            help='Application primary key')
+        parser.add_argument('--months', type=int, default=3,
+                            help='Months of history until the current month')
+        parser.add_argument('--seed', type=int, default=None)
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Accounts created per batch')
+
+    def handle(self, *args, **options):
+        # pylint: disable=no-member
+        try:
+            application = Application.objects.get(pk=options['application'])
+        except Application.DoesNotExist as error:
+            raise CommandError('Application not found') from error
+
+        operator = User.objects.filter(is_superuser=True).order_by('pk').first()
+        if not operator:
+            raise CommandError('A superuser is required as operator')
+
+        generator = LedgerGenerator(
+            application, operator, timezone.localdate(timezone.now()),
+            months=options['months'], seed=options['seed'],
+            batch_size=options['batch_size'])
+
+        def progress(accounts, operations):
+            self.stdout.write(f'Accounts: {accounts} Operations: {operations}')
+
+        accounts, operations = generator.generate(options['accounts'], progress)
+        self.stdout.write(self.style.SUCCESS(
+            f'{accounts} accounts and {operations} operations created '
+            f'({generator.writer.rows_per_second:.0f} operations/s)'))
@@ -0,0 +1,44 @@
+"""
+Application operations (ledger) partitions maintenance
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from investment import partitions
+
+
+class Command(BaseCommand):
+    """
+    Create future ledger partitions and archive old ones
+    """
+
+    help = 'Create future monthly partitions of application operations ' \
+        'and (optionally) archive the old ones'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--months-ahead', type=int, default=None,
+            help='Months created in advance (default: LEDGER_PARTITION_MONTHS_AHEAD)')
+        parser.add_argument(
+            '--archive', action='store_true',
+            help='Archive partitions older than the horizon')
+        parser.add_argument(
+            '--horizon', type=int, default=None,
+            help='Months kept in the ledger (default: LEDGER_ARCHIVE_MONTHS)')
+        parser.add_argument('--database', default='default')
+
+    def handle(self, *args, **options):
+        using = options['database']
+        if not partitions.is_partitioned(using):
+            raise CommandError('Application operations table is not partitioned (PostgreSQL only)')
+
+        created = partitions.create_future_partitions(options['months_ahead'], using=using)
+        for name in created:
+            self.stdout.write(f'Created: {name}')
+
+        if options['archive']:
+            archived = partitions.archive_partitions(options['horizon'], using=using)
+            for name in archived:
+                self.stdout.write(f'Archived: {name}')
+
+        self.stdout.write(self.style.SUCCESS('Ledger partitions updated'))
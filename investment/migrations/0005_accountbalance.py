@@ -0,0 +1,58 @@
+# Generated by Django 3.2 on 2026-10-18 14:21
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def build_account_balances(apps, schema_editor):
+    """
+    Build balance snapshots of accounts with operations
+    Same rules of AccountBalance.apply_operation
+    """
+    ApplicationOp = apps.get_model('investment', 'ApplicationOp')
+    AccountBalance = apps.get_model('investment', 'AccountBalance')
+
+    snapshots = {}
+    for operation in ApplicationOp.objects.order_by('pk').iterator():
+        account_id = operation.application_account_id
+        snapshot = snapshots.setdefault(
+            account_id, AccountBalance(application_account_id=account_id))
+        snapshot.balance = operation.balance
+        if operation.operation_type == 'INCO':
+            snapshot.income_value = operation.value
+            snapshot.income_op_balance = operation.balance
+            snapshot.income_balance = operation.value
+        elif operation.operation_type == 'WINC' and snapshot.income_op_balance is not None:
+            snapshot.income_balance = snapshot.income_value - \
+                (snapshot.income_op_balance - operation.balance)
+        snapshot.last_op_id = operation.pk
+        snapshot.last_op_date = operation.operation_date
+
+    AccountBalance.objects.bulk_create(snapshots.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('investment', '0004_auto_20220620_2105'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccountBalance',
+            fields=[
+                ('application_account', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='account_balance', serialize=False, to='investment.applicationaccount', verbose_name='Aplicação')),
+                ('balance', models.FloatField(default=0, verbose_name='Saldo')),
+                ('income_balance', models.FloatField(default=0, verbose_name='Saldo do rendimento')),
+                ('income_value', models.FloatField(blank=True, null=True, verbose_name='Último rendimento')),
+                ('income_op_balance', models.FloatField(blank=True, null=True, verbose_name='Saldo do último rendimento')),
+                ('last_op_date', models.DateTimeField(blank=True, null=True, verbose_name='Data da última operação')),
+                ('last_op', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='investment.applicationop', verbose_name='Última operação')),
+            ],
+            options={
+                'verbose_name': 'Saldo da aplicação',
+                'verbose_name_plural': 'Saldos das aplicações',
+            },
+        ),
+        migrations.RunPython(build_account_balances, migrations.RunPython.noop),
+    ]
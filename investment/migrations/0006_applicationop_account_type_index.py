@@ -0,0 +1,17 @@
+# Generated by Django 3.2 on 2026-10-18 14:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('investment', '0005_accountbalance'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='applicationop',
+            index=models.Index(fields=['application_account', 'operation_type', '-id'], name='appop_account_type_id_idx'),
+        ),
+    ]
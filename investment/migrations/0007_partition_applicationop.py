@@ -0,0 +1,210 @@
+# Generated by Django 3.2 on 2026-10-18 14:27
+
+import datetime
+
+from django.db import migrations, models
+from django.utils import timezone
+import django.db.models.deletion
+
+TABLE = 'investment_applicationop'
+
+# Months partitions created ahead (then by the ledger_partitions command)
+MONTHS_AHEAD = 3
+
+# Unique money transfer per operation: unique keys of a partitioned table
+# must contain the partition key, so the transfer ids are kept unique in a
+# guard table maintained by triggers
+GUARD_TABLE = f'{TABLE}_money_transfer'
+GUARD_FUNCTION = f'{TABLE}_money_transfer_guard'
+MONEY_TRANSFER_UNIQUE = 'UNIQUE (money_transfer_id)'
+MONEY_TRANSFER_PARTITION_UNIQUE = 'UNIQUE (money_transfer_id, operation_date)'
+
+
+# Frozen copies of investment.partitions and common.dates helpers: the
+# migration must not change when they do
+
+
+def _month_start(date, months=0):
+    """
+    Start of the month of the date (current time zone) shifted by months
+    """
+    if isinstance(date, datetime.datetime):
+        date = timezone.localdate(date) if timezone.is_aware(date) else date.date()
+    month_index = date.year * 12 + date.month - 1 + months
+    return timezone.make_aware(datetime.datetime(month_index // 12, month_index % 12 + 1, 1))
+
+
+def _partition_name(month_start):
+    return f'{TABLE}_y{month_start.year:04d}m{month_start.month:02d}'
+
+
+def _table_definition(cursor, table):
+    """
+    Constraints and indexes (not bound to constraints) of the table
+    """
+    cursor.execute(
+        'SELECT conname, contype, pg_get_constraintdef(oid) FROM pg_constraint '
+        'WHERE conrelid = to_regclass(%s)', [table])
+    constraints = cursor.fetchall()
+    cursor.execute(
+        'SELECT pg_get_indexdef(indexrelid) FROM pg_index '
+        'WHERE indrelid = to_regclass(%s) AND NOT EXISTS ('
+        'SELECT 1 FROM pg_constraint WHERE conindid = indexrelid)', [table])
+    indexes = [row[0] for row in cursor.fetchall()]
+    return constraints, indexes
+
+
+def _referencing_foreign_keys(cursor, table):
+    """
+    (table, name, definition) of the foreign keys of other tables referencing the table
+    """
+    cursor.execute(
+        'SELECT conrelid::regclass::text, conname, pg_get_constraintdef(oid) '
+        'FROM pg_constraint WHERE contype = %s AND confrelid = to_regclass(%s) '
+        'AND conrelid <> confrelid', ['f', table])
+    return cursor.fetchall()
+
+
+def _rebuild_table(cursor, partition_clause, create_partitions):
+    """
+    Copy the table to a new one, return the old table constraints and indexes
+    Foreign keys referencing the table must have been dropped
+    """
+    new_table = f'{TABLE}_new'
+    cursor.execute('SELECT pg_get_serial_sequence(%s, %s)', [TABLE, 'id'])
+    sequence = cursor.fetchone()[0]
+    constraints, indexes = _table_definition(cursor, TABLE)
+
+    cursor.execute(f'ALTER SEQUENCE {sequence} OWNED BY NONE')
+    cursor.execute(
+        f'CREATE TABLE "{new_table}" (LIKE "{TABLE}" INCLUDING DEFAULTS) {partition_clause}')
+    create_partitions(cursor, new_table)
+    cursor.execute(f'INSERT INTO "{new_table}" SELECT * FROM "{TABLE}"')
+    # No CASCADE: fails if anything still depends on the table
+    cursor.execute(f'DROP TABLE "{TABLE}"')
+    cursor.execute(f'ALTER TABLE "{new_table}" RENAME TO "{TABLE}"')
+    cursor.execute(f'ALTER SEQUENCE {sequence} OWNED BY "{TABLE}".id')
+    return constraints, indexes
+
+
+def _month_partitions(cursor, new_table):
+    cursor.execute(f'SELECT MIN(operation_date) FROM "{TABLE}"')
+    month_start = _month_start(cursor.fetchone()[0] or timezone.now())
+    last_month = _month_start(timezone.now(), MONTHS_AHEAD)
+    while month_start <= last_month:
+        month_end = _month_start(month_start, 1)
+        cursor.execute(
+            f'CREATE TABLE "{_partition_name(month_start)}" PARTITION OF "{new_table}" '
+            f'FOR VALUES FROM (%s) TO (%s)', [month_start.isoformat(), month_end.isoformat()])
+        month_start = month_end
+    cursor.execute(f'CREATE TABLE "{TABLE}_default" PARTITION OF "{new_table}" DEFAULT')
+
+
+def _create_money_transfer_guard(cursor):
+    cursor.execute(f'CREATE TABLE "{GUARD_TABLE}" (money_transfer_id bigint PRIMARY KEY)')
+    cursor.execute(
+        f'INSERT INTO "{GUARD_TABLE}" SELECT money_transfer_id FROM "{TABLE}" '
+        f'WHERE money_transfer_id IS NOT NULL')
+    cursor.execute(
+        f'CREATE FUNCTION "{GUARD_FUNCTION}"() RETURNS trigger AS $$ '
+        f'BEGIN '
+        f'IF TG_OP <> \'INSERT\' AND OLD.money_transfer_id IS NOT NULL THEN '
+        f'DELETE FROM "{GUARD_TABLE}" WHERE money_transfer_id = OLD.money_transfer_id; '
+        f'END IF; '
+        f'IF TG_OP <> \'DELETE\' AND NEW.money_transfer_id IS NOT NULL THEN '
+        f'INSERT INTO "{GUARD_TABLE}" VALUES (NEW.money_transfer_id); '
+        f'END IF; '
+        f'RETURN NULL; '
+        f'END $$ LANGUAGE plpgsql')
+    cursor.execute(
+        f'CREATE TRIGGER money_transfer_guard AFTER INSERT OR DELETE ON "{TABLE}" '
+        f'FOR EACH ROW EXECUTE PROCEDURE "{GUARD_FUNCTION}"()')
+    cursor.execute(
+        f'CREATE TRIGGER money_transfer_guard_update AFTER UPDATE OF money_transfer_id '
+        f'ON "{TABLE}" FOR EACH ROW '
+        f'WHEN (OLD.money_transfer_id IS DISTINCT FROM NEW.money_transfer_id) '
+        f'EXECUTE PROCEDURE "{GUARD_FUNCTION}"()')
+
+
+def partition_applicationop(apps, schema_editor):
+    """
+    Partition operations by month of operation_date (PostgreSQL only)
+    Unique keys must include the partition key: primary key becomes
+    (id, operation_date), money_transfer unique constraint becomes
+    (money_transfer_id, operation_date) plus the guard table
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        foreign_keys = _referencing_foreign_keys(cursor, TABLE)
+        for table, name, definition in foreign_keys:
+            # Only (..., operation_date) keys can be referenced after partitioning
+            if 'operation_date' not in definition.split('REFERENCES', 1)[1]:
+                raise RuntimeError(
+                    f'{table}.{name} references {TABLE} without operation_date: '
+                    f'set db_constraint=False before partitioning')
+            cursor.execute(f'ALTER TABLE {table} DROP CONSTRAINT "{name}"')
+
+        constraints, indexes = _rebuild_table(
+            cursor, 'PARTITION BY RANGE (operation_date)', _month_partitions)
+
+        for name, contype, definition in constraints:
+            if contype == 'p':
+                definition = 'PRIMARY KEY (id, operation_date)'
+            elif contype == 'u' and 'operation_date' not in definition:
+                if definition != MONEY_TRANSFER_UNIQUE:
+                    raise RuntimeError(f'{name}: {definition} without operation_date')
+                definition = MONEY_TRANSFER_PARTITION_UNIQUE
+            cursor.execute(f'ALTER TABLE "{TABLE}" ADD CONSTRAINT "{name}" {definition}')
+        for definition in indexes:
+            cursor.execute(definition)
+        _create_money_transfer_guard(cursor)
+
+        for table, name, definition in foreign_keys:
+            cursor.execute(f'ALTER TABLE {table} ADD CONSTRAINT "{name}" {definition}')
+
+
+def unpartition_applicationop(apps, schema_editor):
+    """
+    Back to a single table (PostgreSQL only)
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        foreign_keys = _referencing_foreign_keys(cursor, TABLE)
+        for table, name, _ in foreign_keys:
+            cursor.execute(f'ALTER TABLE {table} DROP CONSTRAINT "{name}"')
+
+        constraints, indexes = _rebuild_table(cursor, '', lambda cursor, table: None)
+        cursor.execute(f'DROP TABLE "{GUARD_TABLE}"')
+        cursor.execute(f'DROP FUNCTION "{GUARD_FUNCTION}"()')
+
+        for name, contype, definition in constraints:
+            if contype == 'p':
+                definition = 'PRIMARY KEY (id)'
+            elif definition == MONEY_TRANSFER_PARTITION_UNIQUE:
+                definition = MONEY_TRANSFER_UNIQUE
+            cursor.execute(f'ALTER TABLE "{TABLE}" ADD CONSTRAINT "{name}" {definition}')
+        for definition in indexes:
+            cursor.execute(definition.replace(' ON ONLY ', ' ON ', 1))
+
+        for table, name, definition in foreign_keys:
+            cursor.execute(f'ALTER TABLE {table} ADD CONSTRAINT "{name}" {definition}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('investment', '0006_applicationop_account_type_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='accountbalance',
+            name='last_op',
+            field=models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='investment.applicationop', verbose_name='Última operação'),
+        ),
+        migrations.RunPython(partition_applicationop, unpartition_applicationop),
+    ]
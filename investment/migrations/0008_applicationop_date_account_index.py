@@ -0,0 +1,17 @@
+# Generated by Django 3.2 on 2026-10-18 14:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('investment', '0007_partition_applicationop'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='applicationop',
+            index=models.Index(fields=['operation_date', 'application_account'], name='appop_date_account_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 3.2 on 2026-10-18 14:52
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def set_next_trial_date(apps, schema_editor):
+    """
+    Existing schedules are due at the operation date
+    """
+    AccountOpSchedule = apps.get_model('investment', 'AccountOpSchedule')
+    AccountOpSchedule.objects.using(schema_editor.connection.alias).update(
+        next_trial_date=F('operation_date'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('investment', '0008_applicationop_date_account_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='accountopschedule',
+            name='next_trial_date',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Próxima tentativa'),
+        ),
+        migrations.RunPython(set_next_trial_date, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='accountopschedule',
+            index=models.Index(condition=models.Q(state='WAIT'), fields=['next_trial_date'], name='accopschedule_due_idx'),
+        ),
+    ]
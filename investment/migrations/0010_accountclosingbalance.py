@@ -0,0 +1,30 @@
+# Generated by Django 3.2 on 2026-10-18 15:13
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('investment', '0009_accountopschedule_next_trial_date'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccountClosingBalance',
+            fields=[
+                ('application_account', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='closing_balance', serialize=False, to='investment.applicationaccount', verbose_name='Aplicação')),
+                ('archived_until', models.DateTimeField(verbose_name='Arquivado até')),
+                ('balance', models.FloatField(default=0, verbose_name='Saldo')),
+                ('income_balance', models.FloatField(default=0, verbose_name='Saldo do rendimento')),
+                ('income_value', models.FloatField(blank=True, null=True, verbose_name='Último rendimento')),
+                ('income_op_balance', models.FloatField(blank=True, null=True, verbose_name='Saldo do último rendimento')),
+                ('last_op_date', models.DateTimeField(blank=True, null=True, verbose_name='Data da última operação')),
+            ],
+            options={
+                'verbose_name': 'Saldo arquivado da aplicação',
+                'verbose_name_plural': 'Saldos arquivados das aplicações',
+            },
+        ),
+    ]
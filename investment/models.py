@@ -2,27 +2,35 @@
 Investment a checking accout model
 """
 
-import pydoc
+import logging
+from collections import Counter
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.db import models
-from django.db.models import F, Max, Case, Value, Count, Sum, Q
+from django.db import models, transaction
+from django.db.models import Count, Max, Sum, Q
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.utils.functional import classproperty
 from simple_history.models import HistoricalRecords
 
 from common import validation
+from common.registry import ClassRegistry
 from core import workflow
 
-from .app_settings import APPLICATION_MODEL_CLASS_ROOT_PATH
 from .interfaces.enums import ApplicationFormType, PostCreateState
 from .operations import exceptions as op_except
 
 
+logger = logging.getLogger(__name__)
+
+# Classes of APPLICATION_MODEL_CLASS_ROOT_PATH by name (InvestimentConfig.ready)
+application_model_classes = ClassRegistry('Application model classes')
+
+
 def load_applitcation_model_class(class_name):
-    """ Load application model class based on a root path"""
-    return pydoc.locate(f'{APPLICATION_MODEL_CLASS_ROOT_PATH}.{class_name}')
+    """ Load application model class registered from the root path"""
+    return application_model_classes.get(class_name)
 
 
 class ApplicationModel(models.Model):
@@ -193,41 +201,42 @@ class ApplicationAccount(models.Model):
 
     message = models.TextField(verbose_name='Mensagem', null=True, blank=True)
 
+    @property
+    def balance_snapshot(self):
+        """
+        Current balance snapshot (AccountBalance)
+        Accounts without operations has an empty (not saved) snapshot
+        """
+        try:
+            return self.account_balance
+        except AccountBalance.DoesNotExist:
+            return AccountBalance(application_account=self)
+
+    def refresh_balance_snapshot(self):
+        """
+        Reload balance snapshot from database
+        Operations must use the current balance, not a cached one
+        """
+        # pylint: disable=no-member
+        related = self._meta.get_field('account_balance')
+        if related.is_cached(self):
+            related.delete_cached_value(self)
+        return self.balance_snapshot
+
     @property
     def balance(self):
         """
         Application account object balance
         """
-        # pylint: disable=no-member
-        last_op = self.applicationop_set.last()
-        if last_op:
-            return last_op.balance
-        else:
-            return 0
+        return self.balance_snapshot.balance
 
     @property
     def income_balance(self):
         """
         Application account object income balance
+        Last income value minus income withdraws after it
         """
-        # pylint: disable=no-member
-        last_income_op = self.applicationop_set.filter(
-            operation_type=ApplicationOp.OperationType.INCOME).last()
-
-        value = 0
-        if last_income_op:
-            value = last_income_op.value
-
-            last_income_withdraw_op = self.applicationop_set.filter(
-                operation_type=ApplicationOp.OperationType.WITHDRAW_INCOME,
-                pk__gt=last_income_op.pk
-            ).last()
-
-            if last_income_withdraw_op:
-                value = last_income_op.value - \
-                    (last_income_op.balance - last_income_withdraw_op.balance)
-
-        return value
+        return self.balance_snapshot.income_balance
 
     def post_create(self):
         """
@@ -266,29 +275,25 @@ class ApplicationAccount(models.Model):
     def total_balance(user):
         """
         User total balance in all application accounts
+        Sum of the last deposit/withdraw operation balance of each account
         """
         #pylint: disable=no-member
 
         op = ApplicationOp.OperationType
-        query = ApplicationAccount.objects.filter(
-            Q(applicationop__operation_type=op.DEPOSIT) |
-            Q(applicationop__operation_type=op.OPEN) |
-            Q(applicationop__operation_type=op.WITHDRAW_WALLET) |
-            Q(applicationop__operation_type=op.WITHDRAW_INCOME),
-            user=user,
-        ).annotate(
-            num_ops=Count('applicationop')
-        ).annotate(
-            op_type=Case(
-                default=Value(op.DEPOSIT)
-            )
-        ).annotate(
-            last_pk=Max('applicationop__pk')
+        last_ops = ApplicationOp.objects.filter(
+            application_account__user=user,
+            operation_type__in=[op.DEPOSIT, op.OPEN,
+                                op.WITHDRAW_WALLET, op.WITHDRAW_INCOME]
         ).values(
-            'last_pk', 'pk', 'op_type'
-        ).values_list('last_pk', flat=True)
-        value = ApplicationOp.objects.aggregate(
-            total=Sum('balance', filter=Q(pk__in=list(query)))
+            'application_account'
+        ).annotate(
+            last_pk=Max('pk')
+        ).values('last_pk')
+
+        value = ApplicationOp.objects.filter(
+            pk__in=last_ops
+        ).aggregate(
+            total=Sum('balance')
         )
         if value['total']:
             return value['total']
@@ -304,26 +309,25 @@ class ApplicationAccount(models.Model):
         #pylint: disable=no-member
 
         op = ApplicationOp.OperationType
-        query = ApplicationAccount.objects.filter(
-            Q(applicationop__operation_type=op.INCOME) |
-            Q(applicationop__operation_type=op.WITHDRAW_INCOME),
-            user=user,
-        ).annotate(
-            num_ops=Count('applicationop')
+        # Last operation of each type per account
+        last_ops = ApplicationOp.objects.filter(
+            application_account__user=user,
+            operation_type__in=[op.INCOME, op.WITHDRAW_INCOME]
+        ).values(
+            'application_account', 'operation_type'
         ).annotate(
-            last_pk=Max('applicationop__pk'), op=F('applicationop__operation_type')
-        ).values('last_pk', 'op', 'pk')
-
-        income_ops = list(query.filter(
-            op=op.INCOME).values_list('last_pk', flat=True))
-        withdraw_ops = list(query.filter(
-            op=op.WITHDRAW_INCOME).values_list('last_pk', flat=True))
-
-        value = ApplicationOp.objects.aggregate(
-            income=Sum('value', filter=Q(pk__in=income_ops)),
+            last_pk=Max('pk')
+        ).values('last_pk')
+
+        income = Q(operation_type=op.INCOME)
+        withdraw = Q(operation_type=op.WITHDRAW_INCOME)
+        value = ApplicationOp.objects.filter(
+            pk__in=last_ops
+        ).aggregate(
+            income=Sum('value', filter=income),
             total_withdraw=(
-                Sum('balance', filter=Q(pk__in=income_ops)) -
-                Sum('balance', filter=Q(pk__in=withdraw_ops))
+                Sum('balance', filter=income) -
+                Sum('balance', filter=withdraw)
             )
         )
 
@@ -481,8 +485,19 @@ class ApplicationOp(models.Model):
         verbose_name = 'Operação de aplicação'
         verbose_name_plural = 'Operações de aplicação'
 
+        # Also the (application_account_id, operation_date) index: operations
+        # of an account in a date range (common.dates.MonthWindow)
         unique_together = [['application_account', 'operation_date']]
 
+        indexes = [
+            # Last operation of each type per account
+            models.Index(fields=['application_account', 'operation_type', '-id'],
+                         name='appop_account_type_id_idx'),
+            # Accounts with operations in a date range (index only scans)
+            models.Index(fields=['operation_date', 'application_account'],
+                         name='appop_date_account_idx'),
+        ]
+
     class OperationType(models.TextChoices):
         """
         Operation definitions
@@ -549,9 +564,9 @@ class ApplicationOp(models.Model):
             operation_date = get_operation_date()
 
         #pylint: disable=no-member
-        last_op = application_account.applicationop_set.last()
-        if last_op:
-            balance = last_op.balance + value
+        snapshot = application_account.refresh_balance_snapshot()
+        if snapshot.has_operations:
+            balance = snapshot.balance + value
             operation_type = ApplicationOp.OperationType.DEPOSIT
         else:
             balance = value
@@ -582,14 +597,13 @@ class ApplicationOp(models.Model):
             raise op_except.DepositValueError(
                 {'value': 'O valor do depósito deve ser maior que zero'})
 
-        #pylint: disable=no-member
-        last_op = application_account.applicationop_set.last()
-        if last_op and operation_date:
-            if operation_date == last_op.operation_date:
+        snapshot = application_account.balance_snapshot
+        if snapshot.has_operations and operation_date:
+            if operation_date == snapshot.last_op_date:
                 raise op_except.SameOperationDateError(
                     {'operation_date': 'Já existe uma operação com esta data. Escolha uma data maior'}
                 )
-            elif operation_date < last_op.operation_date:
+            elif operation_date < snapshot.last_op_date:
                 raise op_except.ReatroactiveOperationDateError(
                     {'operation_date': 'Operação com data retroativa. Escolha uma data maior'}
                 )
@@ -604,9 +618,8 @@ class ApplicationOp(models.Model):
         if not operation_date:
             operation_date = get_operation_date()
 
-        #pylint: disable=no-member
-        last_op = application_account.applicationop_set.last()
-        balance = last_op.balance - value
+        snapshot = application_account.refresh_balance_snapshot()
+        balance = snapshot.balance - value
 
         obj = cls._create_operation(
             operator, application_account, value, description,
@@ -622,7 +635,7 @@ class ApplicationOp(models.Model):
             raise op_except.InvalidApplicationError(
                 'Aplicação inválida ou não existe')
         else:
-            if not application_account.applicationop_set.exists():
+            if not application_account.balance_snapshot.has_operations:
                 raise op_except.InactiveApplicationError(
                     'Saldo inexistente. Nenhum aporte foi realizado ainda.')
             elif not application_account.is_active:
@@ -633,25 +646,24 @@ class ApplicationOp(models.Model):
             raise op_except.WithdrawValueError(
                 'O valor do depósito deve ser maior que zero')
 
-        #pylint: disable=no-member
-        last_op = application_account.applicationop_set.last()
+        snapshot = application_account.balance_snapshot
         if operation_date:
-            if operation_date == last_op.operation_date:
+            if operation_date == snapshot.last_op_date:
                 raise op_except.SameOperationDateError(
                     {'operation_date': 'Já existe uma operação com esta data. Escolha uma data maior'}
                 )
-            elif operation_date < last_op.operation_date:
+            elif operation_date < snapshot.last_op_date:
                 raise op_except.ReatroactiveOperationDateError(
                     {'operation_date': 'Operação com data retroativa. Escolha uma data maior'}
                 )
 
         if operation_type == ApplicationOp.OperationType.WITHDRAW_INCOME:
-            if value > application_account.income_balance:
+            if value > snapshot.income_balance:
                 raise op_except.WithdrawNotEnoughBalanceError(
                     'Saldo insuficiente para resgate do rendimento')
 
         elif operation_type == ApplicationOp.OperationType.WITHDRAW_WALLET:
-            blocked_balance = application_account.balance - application_account.income_balance
+            blocked_balance = snapshot.balance - snapshot.income_balance
             if value > blocked_balance:
                 raise op_except.WithdrawNotEnoughBalanceError(
                     'Saldo insuficiente para resgate da carteira')
@@ -667,9 +679,9 @@ class ApplicationOp(models.Model):
         if application_account:
             if application_account.is_active:
                 app_op = None
-                last_op = application_account.applicationop_set.last()
-                if last_op:
-                    balance = last_op.balance
+                snapshot = application_account.refresh_balance_snapshot()
+                if snapshot.has_operations:
+                    balance = snapshot.balance
 
                     if balance > 0:
                         value = balance
@@ -704,15 +716,18 @@ class ApplicationOp(models.Model):
     def _create_operation(cls, operator, application_account, value,
                           description, operation_date, balance, operation_type):
         # pylint: disable=no-member
-        obj = ApplicationOp.objects.create(
-            application_account=application_account,
-            operation_type=operation_type,
-            value=value,
-            balance=balance,
-            description=description,
-            operation_date=operation_date,
-            operator=operator
-        )
+        with transaction.atomic():
+            obj = ApplicationOp.objects.create(
+                application_account=application_account,
+                operation_type=operation_type,
+                value=value,
+                balance=balance,
+                description=description,
+                operation_date=operation_date,
+                operator=operator
+            )
+            snapshots = AccountBalance.update_for_operations([obj])
+        application_account.account_balance = snapshots[application_account.pk]
         return obj
 
     @classmethod
@@ -723,15 +738,17 @@ class ApplicationOp(models.Model):
         Qhick vertion to make deposit without any verification
         """
         # pylint: disable=no-member
-        obj = ApplicationOp.objects.create(
-            application_account_id=application_account_id,
-            operation_type=ApplicationOp.OperationType.INCOME,
-            value=value,
-            balance=balance,
-            description=description,
-            operation_date=operation_date,
-            operator_id=operator_id
-        )
+        with transaction.atomic():
+            obj = ApplicationOp.objects.create(
+                application_account_id=application_account_id,
+                operation_type=ApplicationOp.OperationType.INCOME,
+                value=value,
+                balance=balance,
+                description=description,
+                operation_date=operation_date,
+                operator_id=operator_id
+            )
+            AccountBalance.update_for_operations([obj])
         return obj
 
     def __str__(self):
@@ -739,6 +756,254 @@ class ApplicationOp(models.Model):
         return f'app {self.application_account.pk} - appop {self.pk} - value: {self.balance}'
 
 
+class AccountBalance(models.Model):
+    """
+    Application account balance snapshot
+    Updated with every operation, so balances are read without searching the
+    last operations. Operations must be created with ApplicationOp methods or
+    ApplicationOpBulkWriter to keep it updated; a snapshot missing operations
+    written elsewhere is rebuilt with the next operation of the account.
+    """
+
+    class Meta:
+        """
+        Meta class
+        """
+        verbose_name = 'Saldo da aplicação'
+        verbose_name_plural = 'Saldos das aplicações'
+
+    application_account = models.OneToOneField(
+        ApplicationAccount, verbose_name='Aplicação', primary_key=True,
+        related_name='account_balance', on_delete=models.CASCADE)
+
+    balance = models.FloatField(verbose_name='Saldo', default=0)
+
+    income_balance = models.FloatField(
+        verbose_name='Saldo do rendimento', default=0)
+
+    # Last income operation value and balance, used to calculate
+    # income balance after income withdraws
+    income_value = models.FloatField(
+        verbose_name='Último rendimento', null=True, blank=True)
+
+    income_op_balance = models.FloatField(
+        verbose_name='Saldo do último rendimento', null=True, blank=True)
+
+    # No database constraint: the partitioned ledger (PostgreSQL) has no
+    # unique key on id alone
+    last_op = models.ForeignKey(
+        ApplicationOp, verbose_name='Última operação', related_name='+',
+        on_delete=models.SET_NULL, null=True, blank=True, db_constraint=False)
+
+    last_op_date = models.DateTimeField(
+        verbose_name='Data da última operação', null=True, blank=True)
+
+    @property
+    def has_operations(self):
+        """
+        True if any operation was made
+        """
+        return self.last_op_date is not None
+
+    def apply_operation(self, operation):
+        """
+        Update snapshot with a new operation (must be the last one)
+        """
+        op_type = ApplicationOp.OperationType
+        self.balance = operation.balance
+        if operation.operation_type == op_type.INCOME:
+            self.income_value = operation.value
+            self.income_op_balance = operation.balance
+            self.income_balance = operation.value
+        elif operation.operation_type == op_type.WITHDRAW_INCOME:
+            if self.income_op_balance is not None:
+                self.income_balance = self.income_value - \
+                    (self.income_op_balance - operation.balance)
+        self.last_op_id = operation.pk
+        self.last_op_date = operation.operation_date
+
+    @classmethod
+    def update_for_operations(cls, operations):
+        """
+        Update snapshots with new operations ordered by creation
+        Run it in the same transaction of the operations creation
+        Return a dict of updated snapshots by application account id
+        """
+        # pylint: disable=no-member
+        account_ids = {op.application_account_id for op in operations}
+        snapshots = cls.objects.select_for_update().in_bulk(account_ids)
+
+        missing = account_ids - snapshots.keys()
+        if missing:
+            # Concurrent first operations of an account wait here, so only
+            # one creates the snapshot. NO KEY UPDATE does not conflict with
+            # the key share lock taken by the operations foreign key
+            list(ApplicationAccount.objects.select_for_update(no_key=True).filter(
+                pk__in=missing).order_by('pk').values_list('pk', flat=True))
+            snapshots.update(cls.objects.select_for_update().in_bulk(missing))
+
+        # Accounts without snapshot, or with operations written elsewhere
+        # (stale snapshot), are built from the ledger, already with the new
+        # operations
+        rebuilt = (account_ids - snapshots.keys()) | cls._stale(snapshots, operations)
+        for account_id in rebuilt:
+            snapshots[account_id] = cls.rebuild(account_id)
+
+        updated = set()
+        no_pk = set()
+        for operation in operations:
+            account_id = operation.application_account_id
+            if account_id not in rebuilt:
+                snapshots[account_id].apply_operation(operation)
+                updated.add(account_id)
+                if operation.pk is None:
+                    no_pk.add(account_id)
+
+        cls.objects.bulk_update(
+            [snapshots[pk] for pk in updated],
+            ['balance', 'income_balance', 'income_value',
+             'income_op_balance', 'last_op', 'last_op_date'])
+
+        # Bulk written operations may not have pk (ex: COPY)
+        if no_pk:
+            cls.objects.filter(pk__in=no_pk).update(
+                last_op=models.Subquery(
+                    ApplicationOp.objects.filter(
+                        application_account=models.OuterRef('pk')
+                    ).order_by('-pk').values('pk')[:1]
+                )
+            )
+        return snapshots
+
+    @classmethod
+    def _stale(cls, snapshots, operations):
+        """
+        Accounts whose ledger operations after the snapshot last operation are
+        not the new operations
+        """
+        # pylint: disable=no-member
+        if not snapshots:
+            return set()
+        expected = Counter(op.application_account_id for op in operations
+                           if op.application_account_id in snapshots)
+        found = dict(ApplicationOp.objects.filter(
+            application_account_id__in=snapshots.keys(),
+            pk__gt=Coalesce('application_account__account_balance__last_op_id', 0)
+        ).order_by().values_list('application_account_id').annotate(Count('pk')))
+        stale = {pk for pk, count in expected.items() if found.get(pk, 0) != count}
+        if stale:
+            logger.warning('Stale account balances rebuilt: %s', sorted(stale))
+        return stale
+
+    @classmethod
+    def rebuild(cls, application_account_id):
+        """
+        Build (or fix) an account snapshot from all its operations
+        Archived operations (investment.partitions) are not visible: the
+        snapshot starts from the balance carried when they were archived
+        """
+        # pylint: disable=no-member
+        snapshot = cls(application_account_id=application_account_id)
+        closing = AccountClosingBalance.objects.filter(pk=application_account_id).first()
+        if closing:
+            AccountClosingBalance.copy_balance(closing, snapshot)
+        operations = ApplicationOp.objects.filter(
+            application_account_id=application_account_id).order_by('pk')
+        for operation in operations.iterator():
+            snapshot.apply_operation(operation)
+        snapshot.save()
+        return snapshot
+
+    def __str__(self):
+        return f'app {self.application_account_id} - balance: {self.balance}'
+
+
+class AccountClosingBalance(models.Model):
+    """
+    Account balance at the end of the archived ledger months
+    Carried forward when old operations are archived (investment.partitions)
+    """
+
+    class Meta:
+        """
+        Meta class
+        """
+        verbose_name = 'Saldo arquivado da aplicação'
+        verbose_name_plural = 'Saldos arquivados das aplicações'
+
+    # Fields copied from/to AccountBalance
+    balance_fields = ['balance', 'income_balance', 'income_value',
+                      'income_op_balance', 'last_op_date']
+
+    application_account = models.OneToOneField(
+        ApplicationAccount, verbose_name='Aplicação', primary_key=True,
+        related_name='closing_balance', on_delete=models.CASCADE)
+
+    archived_until = models.DateTimeField(verbose_name='Arquivado até')
+
+    balance = models.FloatField(verbose_name='Saldo', default=0)
+
+    income_balance = models.FloatField(
+        verbose_name='Saldo do rendimento', default=0)
+
+    income_value = models.FloatField(
+        verbose_name='Último rendimento', null=True, blank=True)
+
+    income_op_balance = models.FloatField(
+        verbose_name='Saldo do último rendimento', null=True, blank=True)
+
+    last_op_date = models.DateTimeField(
+        verbose_name='Data da última operação', null=True, blank=True)
+
+    @classmethod
+    def copy_balance(cls, source, target):
+        """
+        Copy balance fields between closing balances and snapshots
+        """
+        for field in cls.balance_fields:
+            setattr(target, field, getattr(source, field))
+
+    @classmethod
+    def carry_forward(cls, operations, archived_until, chunk_size=500):
+        """
+        Update the closing balances with the operations to archive
+        Operations are applied per account in pk order, over the current
+        closing balance. Return the number of accounts updated
+        """
+        # pylint: disable=no-member
+        account_ids = list(operations.order_by().values_list(
+            'application_account_id', flat=True).distinct())
+        for start in range(0, len(account_ids), chunk_size):
+            chunk_ids = account_ids[start:start + chunk_size]
+            closings = cls.objects.select_for_update().in_bulk(chunk_ids)
+            states = {}
+            for operation in operations.filter(
+                    application_account_id__in=chunk_ids).order_by('pk').iterator():
+                account_id = operation.application_account_id
+                if account_id not in states:
+                    states[account_id] = AccountBalance(application_account_id=account_id)
+                    if account_id in closings:
+                        cls.copy_balance(closings[account_id], states[account_id])
+                states[account_id].apply_operation(operation)
+
+            new = []
+            for account_id, state in states.items():
+                closing = closings.get(account_id)
+                if closing is None:
+                    closing = cls(application_account_id=account_id)
+                    new.append(closing)
+                cls.copy_balance(state, closing)
+                closing.archived_until = archived_until
+            cls.objects.bulk_create(new)
+            cls.objects.bulk_update(
+                [closings[pk] for pk in states if pk in closings],
+                cls.balance_fields + ['archived_until'])
+        return len(account_ids)
+
+    def __str__(self):
+        return f'app {self.application_account_id} - balance: {self.balance}'
+
+
 class AccountOpSchedule(models.Model):
 
     """
@@ -752,6 +1017,12 @@ class AccountOpSchedule(models.Model):
         verbose_name = 'Agendamento de operações'
         verbose_name_plural = 'Agendamentos de operaçôes'
 
+        indexes = [
+            # Due schedules claimed by the executor (investment.operations.schedule)
+            models.Index(fields=['next_trial_date'], name='accopschedule_due_idx',
+                         condition=models.Q(state='WAIT')),
+        ]
+
     class State(models.TextChoices):
         """
         Define processing status
@@ -781,6 +1052,10 @@ class AccountOpSchedule(models.Model):
     last_trial_date = models.DateTimeField(
         verbose_name='Última tentativa', editable=False, null=True, blank=True)
 
+    # Operation date or the retry date after a failed trial (backoff)
+    next_trial_date = models.DateTimeField(
+        verbose_name='Próxima tentativa', editable=False, null=True, blank=True)
+
     date_finished = models.DateTimeField(
         verbose_name='Finalização', editable=False, null=True, blank=True)
 
@@ -801,6 +1076,11 @@ class AccountOpSchedule(models.Model):
     is_automatic = models.BooleanField(
         verbose_name='Agendamento automático', default=False)
 
+    def save(self, *args, **kwargs):
+        if self.next_trial_date is None:
+            self.next_trial_date = self.operation_date
+        super().save(*args, **kwargs)
+
 
 class Bank(models.Model):
     """
@@ -0,0 +1,123 @@
+"""
+Bulk application operations writer
+"""
+
+import io
+import time
+from itertools import islice
+
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from ..models import AccountBalance, ApplicationOp
+
+
+class ApplicationOpBulkWriter:
+    """
+    Write many application operations at once
+    PostgreSQL: rows are streamed to the table with COPY FROM STDIN.
+    Other databases: ApplicationOp.objects.bulk_create.
+
+    Account balance snapshots (AccountBalance) are updated in the same
+    transaction of each batch.
+
+    Warning!!!
+    No validation, balance check or signal is made. Primary keys are not set
+    in the written objects when COPY is used.
+    """
+
+    def __init__(self, batch_size=5000, using=DEFAULT_DB_ALIAS, update_balances=True):
+        self.batch_size = batch_size
+        self.using = using
+        self.update_balances = update_balances
+        self.rows = 0
+        self.elapsed = 0.0
+        # pylint: disable=no-member
+        self.fields = [
+            field for field in ApplicationOp._meta.concrete_fields if not field.primary_key]
+
+    @property
+    def connection(self):
+        """
+        Database connection
+        """
+        return connections[self.using]
+
+    @property
+    def use_copy(self):
+        """
+        COPY is available only for PostgreSQL
+        """
+        return self.connection.vendor == 'postgresql'
+
+    @property
+    def rows_per_second(self):
+        """
+        Writing throughput
+        """
+        if self.elapsed:
+            return self.rows / self.elapsed
+        return 0.0
+
+    def write(self, operations):
+        """
+        Write an iterable (or generator) of ApplicationOp objects in batches
+        Return the number of written rows
+        """
+        iterator = iter(operations)
+        written = 0
+        while batch := list(islice(iterator, self.batch_size)):
+            written += self.write_batch(batch)
+        return written
+
+    def write_batch(self, batch):
+        """
+        Write a list of ApplicationOp objects
+        """
+        start = time.perf_counter()
+        with transaction.atomic(using=self.using):
+            if self.use_copy:
+                self._copy(batch)
+            else:
+                # pylint: disable=no-member
+                ApplicationOp.objects.using(self.using).bulk_create(
+                    batch, self.batch_size)
+            if self.update_balances:
+                AccountBalance.update_for_operations(batch)
+        self.elapsed += time.perf_counter() - start
+        self.rows += len(batch)
+        return len(batch)
+
+    def _copy(self, batch):
+        quote_name = self.connection.ops.quote_name
+        # pylint: disable=no-member
+        table = quote_name(ApplicationOp._meta.db_table)
+        columns = ', '.join(quote_name(field.column) for field in self.fields)
+        sql = f'COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)'
+        with self.connection.cursor() as cursor:
+            cursor.copy_expert(sql, self.csv_buffer(batch))
+
+    def csv_buffer(self, batch):
+        """
+        Batch rows as csv
+        """
+        buffer = io.StringIO()
+        for obj in batch:
+            buffer.write(','.join(
+                self.csv_value(field.get_db_prep_save(
+                    getattr(obj, field.attname), self.connection))
+                for field in self.fields
+            ))
+            buffer.write('\n')
+        buffer.seek(0)
+        return buffer
+
+    @staticmethod
+    def csv_value(value):
+        """
+        Csv value for COPY: unquoted empty is null, other values are quoted
+        """
+        if value is None:
+            return ''
+        if isinstance(value, (int, float)):
+            return repr(value)
+        return '"' + str(value).replace('"', '""') + '"'
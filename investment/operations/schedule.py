@@ -0,0 +1,182 @@
+"""
+Scheduled account operations executor
+
+Due deposit schedules (AccountOpSchedule waiting, money transfer waiting the
+operation) are read in batches, then each one is claimed and executed in its
+own transaction: the schedule and its money transfer rows are locked with
+SELECT ... FOR UPDATE SKIP LOCKED, so executors running in parallel and the
+manual deposit (pool_account OperationCompletionForm, same lock order) never
+deposit the same transfer twice. Locks are held during one deposit only.
+
+The deposit runs in a savepoint: a failure rolls back only its operation, and
+the schedule is retried with exponential backoff until max_trials, when the
+schedule and money transfer are set as error. If the executor dies, the
+schedule transaction is rolled back and the schedule is claimed again.
+"""
+
+import time
+
+from django.db import transaction
+from django.utils import timezone
+
+from ..models import AccountOpSchedule, MoneyTransfer
+
+
+class ScheduleExecutor:
+    """
+    Execute due deposit schedules through the application operation class
+
+    Usage:
+        metrics = ScheduleExecutor(batch_size=100).run()
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, processor=None, batch_size=100, backoff_minutes=15,
+                 max_batches=None, now=None):
+        self.processor = processor
+        self.batch_size = batch_size
+        self.backoff = timezone.timedelta(minutes=backoff_minutes)
+        self.max_batches = max_batches
+        self.now = now
+        self.executed = 0
+        self.retried = 0
+        self.failed = 0
+        self.skipped = 0
+
+    def current_time(self):
+        """
+        Execution time (fixed in tests)
+        """
+        return self.now or timezone.localtime(timezone.now())
+
+    def due(self):
+        """
+        Due deposit schedules (accopschedule_due_idx)
+        """
+        # pylint: disable=no-member
+        return AccountOpSchedule.objects.filter(
+            state=AccountOpSchedule.State.WAITING,
+            next_trial_date__lte=self.current_time(),
+            money_transfer__state=MoneyTransfer.State.WAITING_OP,
+            money_transfer__operation=MoneyTransfer.Operation.DEPOSIT,
+        )
+
+    def run(self):
+        """
+        Execute batches until no due schedule is left unlocked
+        Return throughput and backlog metrics
+        """
+        start = time.perf_counter()
+        batches = 0
+        # Stop when no schedule of a batch could be claimed (all locked by
+        # other executors)
+        while self.max_batches is None or batches < self.max_batches:
+            if not self.run_batch():
+                break
+            batches += 1
+        elapsed = time.perf_counter() - start
+
+        backlog = self.due()
+        oldest = backlog.order_by('next_trial_date').values_list(
+            'next_trial_date', flat=True).first()
+        processed = self.executed + self.retried + self.failed
+        return {
+            'batches': batches,
+            'executed': self.executed,
+            'retried': self.retried,
+            'failed': self.failed,
+            'skipped': self.skipped,
+            'elapsed_s': round(elapsed, 4),
+            'schedules_per_s': round(processed / elapsed, 1) if elapsed else None,
+            'backlog': backlog.count(),
+            'backlog_age_s': round(
+                (self.current_time() - oldest).total_seconds()) if oldest else 0,
+        }
+
+    def run_batch(self):
+        """
+        Claim and execute a batch of due schedules, one transaction each
+        Return the number of claimed schedules
+        """
+        pks = list(self.due().order_by('next_trial_date').values_list(
+            'pk', flat=True)[:self.batch_size])
+        claimed = 0
+        for pk in pks:
+            with transaction.atomic():
+                schedule = self.claim(pk)
+                if schedule is None:
+                    self.skipped += 1
+                    continue
+                claimed += 1
+                self.execute(schedule)
+        return claimed
+
+    def claim(self, pk):
+        """
+        Lock the schedule and its money transfer if still due and not locked
+        """
+        return self.due().filter(pk=pk).select_for_update(
+            skip_locked=True, of=('self', 'money_transfer')
+        ).select_related(
+            'money_transfer__application_account__application__application_model'
+        ).first()
+
+    def execute(self, schedule):
+        """
+        Execute the schedule deposit in a savepoint, record the trial
+        """
+        money_transfer = schedule.money_transfer
+        if money_transfer.state != MoneyTransfer.State.WAITING_OP:
+            # Finished meanwhile (checked again after locking)
+            self.skipped += 1
+            return
+
+        now = self.current_time()
+        schedule.trial += 1
+        schedule.last_trial_date = now
+        schedule.processor = self.processor or schedule.operator
+        try:
+            with transaction.atomic():
+                self._make_deposit(schedule, money_transfer)
+                money_transfer.state = MoneyTransfer.State.FINISHED
+                money_transfer.date_finished = now
+                money_transfer.save(update_fields=['state', 'date_finished'])
+        # pylint: disable=broad-except
+        except Exception as exc:
+            self._trial_failed(schedule, money_transfer, exc, now)
+        else:
+            schedule.state = AccountOpSchedule.State.FINISHED
+            schedule.date_finished = now
+            schedule.error_message = None
+            self.executed += 1
+        schedule.save()
+
+    def _make_deposit(self, schedule, money_transfer):
+        application_account = money_transfer.application_account
+        application_class = application_account.application.application_class
+        operation_class = application_class.get_operation_class() if application_class else None
+        if operation_class is None:
+            raise ValueError('Aplicação sem classe de operação')
+
+        app_op = operation_class().make_deposit(
+            operator=schedule.processor,
+            application_account=application_account,
+            value=money_transfer.value,
+            description=money_transfer.display_message,
+            operation_date=None,
+        )
+        app_op.money_transfer = money_transfer
+        app_op.save()
+
+    def _trial_failed(self, schedule, money_transfer, exc, now):
+        schedule.error_message = str(exc)[:1024]
+        if schedule.trial >= schedule.max_trials:
+            schedule.state = AccountOpSchedule.State.ERROR
+            schedule.date_finished = now
+            money_transfer.state = MoneyTransfer.State.ERROR
+            money_transfer.error_message = schedule.error_message
+            money_transfer.save(update_fields=['state', 'error_message'])
+            self.failed += 1
+        else:
+            schedule.next_trial_date = now + self.backoff * 2 ** (schedule.trial - 1)
+            self.retried += 1
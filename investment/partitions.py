@@ -0,0 +1,193 @@
+"""
+Application operations (ledger) monthly partitions
+
+PostgreSQL only: investment_applicationop is partitioned by range of
+operation_date, one partition per month (investment_applicationop_yYYYYmMM)
+and a default partition for rows out of the created months.
+Months are delimited in the current time zone (common.dates.MonthWindow).
+"""
+
+import re
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from common.dates import MonthWindow, add_months
+
+from .models import AccountClosingBalance, ApplicationOp
+
+# pylint: disable=no-member
+PARENT_TABLE = ApplicationOp._meta.db_table
+DEFAULT_PARTITION = f'{PARENT_TABLE}_default'
+PARTITION_NAME_RE = re.compile(r'_y(\d{4})m(\d{2})$')
+
+
+def month_bounds(date):
+    """
+    Half-open [start, end) datetime range of the date month
+    """
+    window = MonthWindow(date)
+    return window.start, window.end
+
+
+def partition_name(month_start, parent=PARENT_TABLE):
+    """
+    Partition table name of the month
+    """
+    return f'{parent}_y{month_start.year:04d}m{month_start.month:02d}'
+
+
+def is_partitioned(using=DEFAULT_DB_ALIAS, table=PARENT_TABLE):
+    """
+    Check if the ledger table is partitioned
+    """
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)', [table])
+        return cursor.fetchone() is not None
+
+
+def month_partitions(using=DEFAULT_DB_ALIAS, table=PARENT_TABLE):
+    """
+    Dict of month start: partition name of the attached month partitions
+    """
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            'SELECT c.relname FROM pg_inherits i '
+            'JOIN pg_class c ON c.oid = i.inhrelid '
+            'WHERE i.inhparent = to_regclass(%s)', [table])
+        names = [row[0] for row in cursor.fetchall()]
+
+    partitions = {}
+    for name in names:
+        match = PARTITION_NAME_RE.search(name)
+        if match:
+            year, month = (int(group) for group in match.groups())
+            partitions[timezone.make_aware(timezone.datetime(year, month, 1))] = name
+    return partitions
+
+
+def create_partition(cursor, month_start, parent=PARENT_TABLE):
+    """
+    Create the month partition
+    Rows of the month found in the default partition are moved to the new one
+    """
+    start, end = month_start, add_months(month_start, 1)
+    name = partition_name(month_start, parent)
+    default = f'{parent}_default'
+
+    cursor.execute(
+        f'CREATE TEMPORARY TABLE "{name}_moved" ON COMMIT DROP AS '
+        f'WITH moved AS (DELETE FROM "{default}" '
+        f'WHERE operation_date >= %s AND operation_date < %s RETURNING *) '
+        f'SELECT * FROM moved', [start, end])
+    cursor.execute(
+        f'CREATE TABLE "{name}" PARTITION OF "{parent}" FOR VALUES FROM (%s) TO (%s)',
+        [start.isoformat(), end.isoformat()])
+    cursor.execute(f'INSERT INTO "{parent}" SELECT * FROM "{name}_moved"')
+    return name
+
+
+def create_future_partitions(months_ahead=None, date=None, using=DEFAULT_DB_ALIAS):
+    """
+    Create the missing partitions from the date month until months ahead
+    Return the created partition names
+    """
+    if months_ahead is None:
+        months_ahead = settings.LEDGER_PARTITION_MONTHS_AHEAD
+    if not is_partitioned(using):
+        return []
+
+    current, _ = month_bounds(date or timezone.now())
+    existing = month_partitions(using)
+    created = []
+    with transaction.atomic(using=using):
+        with connections[using].cursor() as cursor:
+            for months in range(months_ahead + 1):
+                month_start = add_months(current, months)
+                if month_start not in existing:
+                    created.append(create_partition(cursor, month_start))
+    return created
+
+
+def archive_partitions(horizon_months=None, date=None, using=DEFAULT_DB_ALIAS):
+    """
+    Detach the month partitions older than horizon months
+    Detached partitions are moved to the archive schema (and tablespace,
+    if configured) and become read only. The accounts balances at the end
+    of the archived months are carried forward (AccountClosingBalance), so
+    snapshots rebuilt later start from them.
+
+    Warning!!!
+    Archived operations are not visible to the application anymore
+    (statements of the archived months are empty).
+    Return the archived partition names
+    """
+    if horizon_months is None:
+        horizon_months = settings.LEDGER_ARCHIVE_MONTHS
+    if horizon_months is None or not is_partitioned(using):
+        return []
+
+    current, _ = month_bounds(date or timezone.now())
+    horizon = add_months(current, -horizon_months)
+    old_partitions = {
+        month_start: name for month_start, name in sorted(month_partitions(using).items())
+        if month_start < horizon
+    }
+
+    schema = settings.LEDGER_ARCHIVE_SCHEMA
+    tablespace = settings.LEDGER_ARCHIVE_TABLESPACE
+    with transaction.atomic(using=using):
+        if old_partitions:
+            carry_closing_balances(old_partitions, horizon, using)
+        with connections[using].cursor() as cursor:
+            if old_partitions:
+                _create_archive_schema(cursor, schema)
+            for name in old_partitions.values():
+                _archive_partition(cursor, name, schema, tablespace)
+    return list(old_partitions.values())
+
+
+def carry_closing_balances(month_starts, archived_until, using=DEFAULT_DB_ALIAS):
+    """
+    Carry forward the balances of the operations of the months to archive
+    Return the number of accounts updated
+    """
+    periods = Q()
+    for month_start in month_starts:
+        periods |= Q(operation_date__gte=month_start,
+                     operation_date__lt=add_months(month_start, 1))
+    # pylint: disable=no-member
+    operations = ApplicationOp.objects.using(using).filter(periods)
+    return AccountClosingBalance.carry_forward(operations, archived_until)
+
+
+def _create_archive_schema(cursor, schema):
+    cursor.execute(f'CREATE SCHEMA IF NOT EXISTS "{schema}"')
+    cursor.execute(
+        f'CREATE OR REPLACE FUNCTION "{schema}".read_only() RETURNS trigger AS $$ '
+        f'BEGIN RAISE EXCEPTION \'Archived table % is read only\', TG_TABLE_NAME; END; '
+        f'$$ LANGUAGE plpgsql')
+
+
+def _archive_partition(cursor, name, schema, tablespace):
+    cursor.execute(f'ALTER TABLE "{PARENT_TABLE}" DETACH PARTITION "{name}"')
+
+    # Archived rows must not block changes in the live tables
+    cursor.execute(
+        'SELECT conname FROM pg_constraint '
+        'WHERE conrelid = to_regclass(%s) AND contype = %s', [name, 'f'])
+    for (constraint,) in cursor.fetchall():
+        cursor.execute(f'ALTER TABLE "{name}" DROP CONSTRAINT "{constraint}"')
+
+    cursor.execute(f'ALTER TABLE "{name}" SET SCHEMA "{schema}"')
+    if tablespace:
+        cursor.execute(f'ALTER TABLE "{schema}"."{name}" SET TABLESPACE "{tablespace}"')
+    cursor.execute(
+        f'CREATE TRIGGER read_only BEFORE INSERT OR UPDATE OR DELETE OR TRUNCATE '
+        f'ON "{schema}"."{name}" FOR EACH STATEMENT EXECUTE PROCEDURE "{schema}".read_only()')
@@ -0,0 +1,140 @@
+"""
+Synthetic ledger generator
+
+Clients, application accounts and realistic operation histories written
+directly with bulk inserts (COPY in PostgreSQL). Used by benchmarks, never
+in production databases.
+"""
+
+import calendar
+import random
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.utils import timezone
+
+from clients.models import Client
+from common.dates import add_months, local_midnight
+
+from .models import ApplicationAccount, ApplicationOp
+from .operations.bulk import ApplicationOpBulkWriter
+
+User = get_user_model()
+
+
+class LedgerGenerator:
+    """
+    Generate accounts of an application with months of operations
+    Each month has 1 to max_month_operations deposits/withdraws (first one
+    opens the account) and, except the last month, an income operation in
+    the month last day, like the income calculation does.
+    """
+
+    max_month_operations = 3
+    deposit_range = (100, 10000)
+    withdraw_probability = 0.3
+    max_withdraw_rate = 0.3
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, application, operator, end_month, months=3,
+                 income_rate=1.0, seed=None, batch_size=1000):
+        self.application = application
+        self.operator = operator
+        self.end_month = add_months(end_month, 0)
+        self.months = months
+        self.income_rate = income_rate
+        self.batch_size = batch_size
+        self.random = random.Random(seed)
+        self.writer = ApplicationOpBulkWriter(batch_size=batch_size * 10)
+        self.prefix = f'ledger-{uuid.uuid4().hex[:8]}'
+
+    def generate(self, accounts, progress=None):
+        """
+        Generate accounts in batches
+        Return the number of accounts and operations created
+        """
+        created = 0
+        operations = 0
+        while created < accounts:
+            count = min(self.batch_size, accounts - created)
+            account_pks = self._create_accounts(self._create_clients(created, count))
+            operations += self.writer.write(
+                op for pk in account_pks for op in self._account_operations(pk))
+            created += count
+            if progress:
+                progress(created, operations)
+        return created, operations
+
+    def _create_clients(self, start, count):
+        password = make_password(None)
+        users = [
+            User(username=f'{self.prefix}-{index}',
+                 email=f'{self.prefix}-{index}@example.com',
+                 first_name='Cliente', last_name=str(index), password=password)
+            for index in range(start, start + count)
+        ]
+        User.objects.bulk_create(users)
+        # Primary keys are not returned by bulk_create in every database
+        user_pks = list(User.objects.filter(
+            username__in=[user.username for user in users]
+        ).order_by('pk').values_list('pk', flat=True))
+
+        # pylint: disable=no-member
+        Client.objects.bulk_create([
+            Client(user_id=pk, first_name='Cliente', last_name=str(pk),
+                   status=Client.Status.APPROVED, operator=self.operator)
+            for pk in user_pks
+        ])
+        return user_pks
+
+    def _create_accounts(self, user_pks):
+        date_activated = add_months(self.end_month, 1 - self.months)
+        # pylint: disable=no-member
+        ApplicationAccount.objects.bulk_create([
+            ApplicationAccount(
+                user_id=pk, application=self.application, operator=self.operator,
+                date_activated=date_activated,
+                creation_status=ApplicationAccount.CreationStatus.CREATED)
+            for pk in user_pks
+        ])
+        return list(ApplicationAccount.objects.filter(
+            user__pk__in=user_pks, application=self.application
+        ).order_by('pk').values_list('pk', flat=True))
+
+    def _account_operations(self, account_pk):
+        balance = 0.0
+        operation_type = ApplicationOp.OperationType
+        for month in range(self.months):
+            month_start = add_months(self.end_month, month + 1 - self.months)
+            month_days = calendar.monthrange(month_start.year, month_start.month)[1]
+            days = sorted(self.random.sample(
+                range(1, month_days), self.random.randint(1, self.max_month_operations)))
+
+            for day in days:
+                if balance and self.random.random() < self.withdraw_probability:
+                    value = round(balance * self.random.uniform(0.01, self.max_withdraw_rate), 2)
+                    op_type = operation_type.WITHDRAW_WALLET
+                    balance = round(balance - value, 2)
+                else:
+                    value = round(self.random.uniform(*self.deposit_range), 2)
+                    op_type = operation_type.DEPOSIT if balance else operation_type.OPEN
+                    balance = round(balance + value, 2)
+                yield self._operation(
+                    account_pk, op_type, value, balance, month_start, day,
+                    timezone.timedelta(hours=self.random.randint(8, 18),
+                                       minutes=self.random.randint(0, 59)))
+
+            if month < self.months - 1:
+                value = round(balance * self.income_rate / 100, 2)
+                balance = round(balance + value, 2)
+                yield self._operation(
+                    account_pk, operation_type.INCOME, value, balance, month_start,
+                    month_days, timezone.timedelta(hours=23, minutes=59, seconds=59))
+
+    def _operation(self, account_pk, operation_type, value, balance, month_start, day, time):
+        date = local_midnight(month_start.date().replace(day=day)) + time
+        return ApplicationOp(
+            application_account_id=account_pk, operation_type=operation_type,
+            value=value, balance=balance, operation_date=date,
+            description='Operação sintética', operator=self.operator)
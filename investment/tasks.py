@@ -0,0 +1,62 @@
+"""
+Investment background tasks
+"""
+
+from celery import group, shared_task
+from celery.utils.log import get_task_logger
+from django.conf import settings
+from django.contrib.auth import get_user_model
+
+from . import partitions
+from .operations.schedule import ScheduleExecutor
+
+logger = get_task_logger(__name__)
+
+
+@shared_task
+def execute_account_op_schedules():
+    """
+    Execute due account operation schedules
+    With ACCOUNT_OP_SCHEDULE_WORKERS > 1, executors run in parallel tasks
+    (schedules are claimed with SKIP LOCKED)
+    """
+    workers = settings.ACCOUNT_OP_SCHEDULE_WORKERS
+    if workers > 1:
+        group(run_schedule_executor.s(worker) for worker in range(1, workers + 1)).apply_async()
+    else:
+        run_schedule_executor(1)
+
+
+@shared_task
+def run_schedule_executor(worker):
+    """
+    Execute schedules batches until there is no due schedule to claim
+    """
+    processor = None
+    if username := settings.ACCOUNT_OP_SCHEDULE_PROCESSOR:
+        processor = get_user_model().objects.get(username=username)
+
+    metrics = ScheduleExecutor(
+        processor=processor,
+        batch_size=settings.ACCOUNT_OP_SCHEDULE_BATCH_SIZE,
+        backoff_minutes=settings.ACCOUNT_OP_SCHEDULE_BACKOFF_MINUTES).run()
+    logger.info(
+        'Account op schedules (worker %s): %s executed, %s retried, %s failed in %ss '
+        '(%s schedules/s), backlog %s (oldest %ss)', worker, metrics['executed'],
+        metrics['retried'], metrics['failed'], metrics['elapsed_s'],
+        metrics['schedules_per_s'], metrics['backlog'], metrics['backlog_age_s'])
+    return metrics
+
+
+@shared_task
+def maintain_ledger_partitions():
+    """
+    Create the future ledger partitions (PostgreSQL only)
+    Old partitions are archived only if LEDGER_ARCHIVE_MONTHS is set
+    """
+    created = partitions.create_future_partitions()
+    archived = []
+    if settings.LEDGER_ARCHIVE_MONTHS is not None:
+        archived = partitions.archive_partitions()
+    logger.info('Ledger partitions: created %s, archived %s', created, archived)
+    return {'created': created, 'archived': archived}
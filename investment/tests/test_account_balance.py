@@ -0,0 +1,150 @@
+"""
+Test account balance snapshot
+"""
+
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from investment.models import (AccountBalance, AccountClosingBalance, ApplicationAccount,
+                               ApplicationOp)
+from investment.operations.bulk import ApplicationOpBulkWriter
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=no-member
+
+User = get_user_model()
+
+
+class TestAccountBalance(TestCase):
+    """
+    Snapshot must match the balances calculated from the operations
+    """
+
+    fixtures = [
+        'core/fixtures/users.json',
+        'clients/fixtures/clients.json',
+        'applications'
+    ]
+
+    def setUp(self) -> None:
+        self.operator = User.objects.get(pk=1)
+        self.app_acc = ApplicationAccount.objects.get(pk=1)
+        self.date = timezone.localtime(timezone.now()) - timezone.timedelta(days=30)
+        return super().setUp()
+
+    def next_date(self):
+        self.date += timezone.timedelta(days=1)
+        return self.date
+
+    def make_operations(self):
+        ApplicationOp.make_deposit(
+            self.operator, self.app_acc, 10000, operation_date=self.next_date())
+        ApplicationOp.make_income_deposit(
+            self.operator.pk, self.app_acc.pk, 100, 10100, self.next_date())
+        ApplicationOp.make_withdraw(
+            self.app_acc, self.operator, 30,
+            ApplicationOp.OperationType.WITHDRAW_INCOME, operation_date=self.next_date())
+        ApplicationOp.make_deposit(
+            self.operator, self.app_acc, 500, operation_date=self.next_date())
+        ApplicationOp.make_withdraw(
+            self.app_acc, self.operator, 1000,
+            ApplicationOp.OperationType.WITHDRAW_WALLET, operation_date=self.next_date())
+
+    def test_snapshot(self):
+        self.make_operations()
+
+        app_acc = ApplicationAccount.objects.get(pk=self.app_acc.pk)
+        last_op = ApplicationOp.objects.filter(application_account=app_acc).last()
+        self.assertEqual(app_acc.balance, 9570)
+        self.assertEqual(app_acc.income_balance, 70)
+        self.assertEqual(app_acc.balance_snapshot.last_op, last_op)
+        self.assertEqual(app_acc.balance_snapshot.last_op_date, last_op.operation_date)
+
+    def test_rebuild(self):
+        self.make_operations()
+        snapshot = AccountBalance.objects.get(pk=self.app_acc.pk)
+
+        rebuilt = AccountBalance.rebuild(self.app_acc.pk)
+        for field in ['balance', 'income_balance', 'last_op_id', 'last_op_date']:
+            self.assertEqual(getattr(rebuilt, field), getattr(snapshot, field))
+
+    def test_rebuild_after_archival(self):
+        self.make_operations()
+        snapshot = AccountBalance.objects.get(pk=self.app_acc.pk)
+        operations = ApplicationOp.objects.filter(application_account=self.app_acc)
+        archived_until = operations.order_by('pk')[3].operation_date
+
+        # Deposit, income and income withdraw archived
+        archived = operations.filter(operation_date__lt=archived_until)
+        self.assertEqual(AccountClosingBalance.carry_forward(archived, archived_until), 1)
+        archived.delete()
+        closing = AccountClosingBalance.objects.get(pk=self.app_acc.pk)
+        self.assertEqual((closing.balance, closing.income_balance), (10070, 70))
+
+        rebuilt = AccountBalance.rebuild(self.app_acc.pk)
+        for field in ['balance', 'income_balance', 'last_op_id', 'last_op_date']:
+            self.assertEqual(getattr(rebuilt, field), getattr(snapshot, field))
+
+        # All operations archived
+        AccountClosingBalance.carry_forward(operations.all(), self.next_date())
+        operations.delete()
+        rebuilt = AccountBalance.rebuild(self.app_acc.pk)
+        self.assertEqual((rebuilt.balance, rebuilt.income_balance), (9570, 70))
+        self.assertTrue(rebuilt.has_operations)
+
+    def test_stale_snapshot(self):
+        self.make_operations()
+        # Written without updating the snapshot
+        ApplicationOp.objects.create(
+            application_account=self.app_acc,
+            operation_type=ApplicationOp.OperationType.INCOME,
+            value=430, balance=10000, operation_date=self.next_date(),
+            operator=self.operator)
+
+        with self.assertLogs('investment.models', 'WARNING'):
+            ApplicationOp.make_deposit(
+                self.operator, self.app_acc, 1000, operation_date=self.next_date())
+
+        snapshot = AccountBalance.objects.get(pk=self.app_acc.pk)
+        rebuilt = AccountBalance.rebuild(self.app_acc.pk)
+        for field in ['balance', 'income_balance', 'last_op_id', 'last_op_date']:
+            self.assertEqual(getattr(snapshot, field), getattr(rebuilt, field))
+
+        # Up to date snapshot: no ledger rebuild
+        with mock.patch('investment.models.logger') as logger:
+            ApplicationOp.make_deposit(
+                self.operator, self.app_acc, 1000, operation_date=self.next_date())
+        logger.warning.assert_not_called()
+
+    def test_balance_single_query(self):
+        self.make_operations()
+        app_acc = ApplicationAccount.objects.get(pk=self.app_acc.pk)
+        with self.assertNumQueries(1):
+            self.assertEqual(app_acc.balance - app_acc.income_balance, 9500)
+
+    def test_no_operations(self):
+        self.assertEqual(self.app_acc.balance, 0)
+        self.assertEqual(self.app_acc.income_balance, 0)
+        self.assertFalse(AccountBalance.objects.filter(pk=self.app_acc.pk).exists())
+
+    def test_bulk_writer(self):
+        ApplicationOp.make_deposit(
+            self.operator, self.app_acc, 10000, operation_date=self.next_date())
+
+        writer = ApplicationOpBulkWriter()
+        writer.write([ApplicationOp(
+            application_account=self.app_acc,
+            operation_type=ApplicationOp.OperationType.INCOME,
+            value=150, balance=10150,
+            operation_date=self.next_date(),
+            operator=self.operator
+        )])
+
+        snapshot = AccountBalance.objects.get(pk=self.app_acc.pk)
+        last_op = ApplicationOp.objects.filter(application_account=self.app_acc).last()
+        self.assertEqual(snapshot.balance, 10150)
+        self.assertEqual(snapshot.income_balance, 150)
+        self.assertEqual(snapshot.last_op, last_op)
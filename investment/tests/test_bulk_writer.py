@@ -0,0 +1,67 @@
+"""
+Test application operations bulk writer
+"""
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from investment.models import ApplicationAccount, ApplicationOp
+from investment.operations.bulk import ApplicationOpBulkWriter
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=no-member
+
+User = get_user_model()
+
+
+class TestApplicationOpBulkWriter(TestCase):
+    """
+    Test bulk writer (COPY in PostgreSQL, bulk_create in other databases)
+    """
+
+    fixtures = [
+        'core/fixtures/users.json',
+        'clients/fixtures/clients.json',
+        'applications'
+    ]
+
+    def setUp(self) -> None:
+        self.operator = User.objects.get(pk=1)
+        self.app_acc = ApplicationAccount.objects.get(pk=1)
+        return super().setUp()
+
+    def operations(self, count):
+        date = timezone.localtime(timezone.now())
+        for day in range(count):
+            yield ApplicationOp(
+                application_account=self.app_acc,
+                operation_type=ApplicationOp.OperationType.INCOME,
+                value=0.1 + day,
+                balance=1000.37 + day,
+                description='Rendimento "teste", 1' if day else None,
+                operation_date=date - timezone.timedelta(days=day),
+                operator=self.operator
+            )
+
+    def test_write(self):
+        writer = ApplicationOpBulkWriter(batch_size=3)
+        written = writer.write(self.operations(10))
+
+        self.assertEqual(written, 10)
+        self.assertEqual(writer.rows, 10)
+        self.assertGreater(writer.rows_per_second, 0)
+
+        ops = ApplicationOp.objects.filter(
+            application_account=self.app_acc).order_by('-operation_date')
+        self.assertEqual(ops.count(), 10)
+        self.assertIsNone(ops[0].description)
+        self.assertEqual(ops[1].description, 'Rendimento "teste", 1')
+        self.assertEqual(ops[9].value, 9.1)
+        self.assertEqual(ops[9].balance, 1009.37)
+
+    def test_csv_value(self):
+        self.assertEqual(ApplicationOpBulkWriter.csv_value(None), '')
+        self.assertEqual(ApplicationOpBulkWriter.csv_value(0.1), '0.1')
+        self.assertEqual(ApplicationOpBulkWriter.csv_value(12), '12')
+        self.assertEqual(ApplicationOpBulkWriter.csv_value('a "b"'), '"a ""b"""')
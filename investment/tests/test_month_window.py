@@ -0,0 +1,93 @@
+"""
+Test month window date ranges in ledger queries
+"""
+
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from common.dates import MonthWindow
+from investment.applications.pool_account.income import IncomeCalculation
+from investment.models import ApplicationAccount, ApplicationOp
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=no-member
+
+User = get_user_model()
+
+
+def local_datetime(*args):
+    return timezone.make_aware(timezone.datetime(*args))
+
+
+class TestMonthWindow(TestCase):
+    """
+    Half-open month ranges
+    """
+
+    def test_window(self):
+        window = MonthWindow(timezone.datetime(2022, 6, 30).date())
+        self.assertEqual(window.start, local_datetime(2022, 6, 1))
+        self.assertEqual(window.end, local_datetime(2022, 7, 1))
+        self.assertEqual(window.first_day, (local_datetime(2022, 6, 1), local_datetime(2022, 6, 2)))
+
+    def test_previous_in_january(self):
+        window = MonthWindow(local_datetime(2022, 1, 10, 12))
+        self.assertEqual(window.previous, MonthWindow(timezone.datetime(2021, 12, 1).date()))
+        self.assertEqual(window.previous.start, local_datetime(2021, 12, 1))
+        self.assertEqual(window.previous.end, window.start)
+
+    def test_lookups(self):
+        window = MonthWindow(timezone.datetime(2022, 2, 1).date())
+        self.assertEqual(window.lookups('operation_date'), {
+            'operation_date__gte': local_datetime(2022, 2, 1),
+            'operation_date__lt': local_datetime(2022, 3, 1),
+        })
+
+
+class TestLedgerMonthQueries(TestCase):
+    """
+    Income queries with month windows
+    """
+
+    fixtures = [
+        'core/fixtures/users.json',
+        'clients/fixtures/clients.json',
+        'applications'
+    ]
+
+    def setUp(self) -> None:
+        self.operator = User.objects.get(pk=1)
+        self.app_acc = ApplicationAccount.objects.get(pk=1)
+        return super().setUp()
+
+    def test_first_day_operations_in_january(self):
+        ApplicationOp.make_deposit(
+            self.operator, self.app_acc, 10000, operation_date=local_datetime(2021, 12, 10))
+        ApplicationOp.make_income_deposit(
+            self.operator.pk, self.app_acc.pk, 100, 10100, local_datetime(2021, 12, 31, 23))
+        ApplicationOp.make_deposit(
+            self.operator, self.app_acc, 500, operation_date=local_datetime(2022, 1, 5))
+
+        ops = list(IncomeCalculation._first_day_operations(
+            self.app_acc.application, timezone.datetime(2022, 1, 1).date()))
+
+        self.assertEqual(ops, [
+            {'application_account_id': self.app_acc.pk, 'balance': 10100, 'day': 1}])
+
+    @skipUnless(connection.vendor == 'postgresql', 'EXPLAIN plans are PostgreSQL specific')
+    def test_month_query_uses_index(self):
+        window = MonthWindow(timezone.now())
+        queryset = ApplicationOp.objects.filter(
+            application_account=self.app_acc, **window.lookups('operation_date'))
+
+        with connection.cursor() as cursor:
+            # Tiny test tables: force the planner to show index usage
+            cursor.execute('SET LOCAL enable_seqscan = off')
+        plan = queryset.explain()
+
+        self.assertNotIn('Seq Scan', plan)
+        self.assertRegex(plan, r'Index Cond: .*operation_date >=')
@@ -0,0 +1,179 @@
+"""
+Test ledger partitions helpers
+"""
+
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.db import DatabaseError, connection, transaction
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from investment import partitions, tasks
+from investment.models import AccountClosingBalance, ApplicationAccount, ApplicationOp
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=no-member
+
+User = get_user_model()
+GUARD_TABLE = f'{partitions.PARENT_TABLE}_money_transfer'
+
+
+class TestPartitions(TestCase):
+    """
+    Partition bounds and names
+    """
+
+    def test_month_bounds(self):
+        start, end = partitions.month_bounds(timezone.datetime(2022, 12, 15).date())
+        self.assertEqual(start, timezone.make_aware(timezone.datetime(2022, 12, 1)))
+        self.assertEqual(end, timezone.make_aware(timezone.datetime(2023, 1, 1)))
+
+    def test_month_bounds_local_time(self):
+        # 2022-07-01 01:00 UTC is still June in America/Sao_Paulo
+        date = timezone.datetime(2022, 7, 1, 1, tzinfo=timezone.utc)
+        start, end = partitions.month_bounds(date)
+        self.assertEqual(start, timezone.make_aware(timezone.datetime(2022, 6, 1)))
+        self.assertEqual(end, timezone.make_aware(timezone.datetime(2022, 7, 1)))
+
+    def test_add_months(self):
+        month_start = timezone.make_aware(timezone.datetime(2022, 1, 1))
+        self.assertEqual(partitions.add_months(month_start, -1),
+                         timezone.make_aware(timezone.datetime(2021, 12, 1)))
+        self.assertEqual(partitions.add_months(month_start, 14),
+                         timezone.make_aware(timezone.datetime(2023, 3, 1)))
+
+    def test_partition_name(self):
+        month_start = timezone.make_aware(timezone.datetime(2022, 3, 1))
+        self.assertEqual(partitions.partition_name(month_start),
+                         'investment_applicationop_y2022m03')
+
+    def test_not_partitioned(self):
+        if partitions.is_partitioned():
+            self.skipTest('Partitioned database')
+        self.assertEqual(partitions.create_future_partitions(), [])
+        self.assertEqual(partitions.archive_partitions(1), [])
+        with self.assertRaises(CommandError):
+            call_command('ledger_partitions')
+
+    @override_settings(LEDGER_ARCHIVE_MONTHS=None)
+    @mock.patch('investment.partitions.archive_partitions')
+    @mock.patch('investment.partitions.create_future_partitions', return_value=[])
+    def test_task_without_archival(self, create_mock, archive_mock):
+        tasks.maintain_ledger_partitions()
+        create_mock.assert_called_once_with()
+        archive_mock.assert_not_called()
+
+    @override_settings(LEDGER_ARCHIVE_MONTHS=12)
+    @mock.patch('investment.partitions.archive_partitions', return_value=[])
+    @mock.patch('investment.partitions.create_future_partitions', return_value=[])
+    def test_task_with_archival(self, create_mock, archive_mock):
+        tasks.maintain_ledger_partitions()
+        create_mock.assert_called_once_with()
+        archive_mock.assert_called_once_with()
+
+
+@skipUnless(connection.vendor == 'postgresql', 'Partitions are PostgreSQL specific')
+class TestPostgresPartitions(TransactionTestCase):
+    """
+    Partitioning migration and partitions maintenance with operations
+    Partitions and schemas are DDL: dropped after each test
+    """
+
+    fixtures = [
+        'core/fixtures/users.json',
+        'clients/fixtures/clients.json',
+        'applications'
+    ]
+
+    def setUp(self) -> None:
+        self.operator = User.objects.get(pk=1)
+        self.app_acc = ApplicationAccount.objects.get(pk=1)
+        self.current, _ = partitions.month_bounds(timezone.now())
+        self.existing = set(partitions.month_partitions().values())
+        self.addCleanup(self.drop_created_tables)
+        return super().setUp()
+
+    def drop_created_tables(self):
+        with connection.cursor() as cursor:
+            # Flush truncates the ledger without the guard table triggers
+            cursor.execute(f'TRUNCATE "{GUARD_TABLE}"')
+            cursor.execute(
+                f'DROP SCHEMA IF EXISTS "{settings.LEDGER_ARCHIVE_SCHEMA}" CASCADE')
+            for name in set(partitions.month_partitions().values()) - self.existing:
+                cursor.execute(f'DROP TABLE "{name}"')
+
+    def make_deposits(self, *dates):
+        for date in dates:
+            ApplicationOp.make_deposit(
+                self.operator, self.app_acc, 1000, operation_date=date)
+
+    def table_rows(self, table):
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT id FROM {table} ORDER BY id')
+            return [row[0] for row in cursor.fetchall()]
+
+    def migrate(self, target):
+        executor = MigrationExecutor(connection)
+        executor.migrate(target)
+        executor.loader.build_graph()
+
+    def test_migration_with_operations(self):
+        self.make_deposits(partitions.add_months(self.current, -2),
+                           partitions.add_months(self.current, -1), timezone.now())
+        operation_ids = self.table_rows(partitions.PARENT_TABLE)
+        self.addCleanup(self.migrate, MigrationExecutor(connection).loader.graph.leaf_nodes())
+
+        self.migrate([('investment', '0006_applicationop_account_type_index')])
+        self.assertFalse(partitions.is_partitioned())
+        self.assertEqual(self.table_rows(partitions.PARENT_TABLE), operation_ids)
+
+        self.migrate([('investment', '0007_partition_applicationop')])
+        self.assertTrue(partitions.is_partitioned())
+        self.assertEqual(self.table_rows(partitions.PARENT_TABLE), operation_ids)
+        # Partitions start at the oldest operation month
+        oldest = partitions.partition_name(partitions.add_months(self.current, -2))
+        self.assertEqual(self.table_rows(f'"{oldest}"'), operation_ids[:1])
+        self.assertEqual(self.table_rows(f'"{partitions.DEFAULT_PARTITION}"'), [])
+        self.existing = set(partitions.month_partitions().values())
+
+    def test_create_future_partitions_moves_default_rows(self):
+        months_ahead = settings.LEDGER_PARTITION_MONTHS_AHEAD + 2
+        month_start = partitions.add_months(self.current, months_ahead)
+        self.make_deposits(month_start + timezone.timedelta(days=3))
+        operation_ids = self.table_rows(partitions.PARENT_TABLE)
+        self.assertEqual(self.table_rows(f'"{partitions.DEFAULT_PARTITION}"'), operation_ids)
+
+        created = partitions.create_future_partitions(months_ahead)
+
+        name = partitions.partition_name(month_start)
+        self.assertIn(name, created)
+        self.assertEqual(self.table_rows(f'"{name}"'), operation_ids)
+        self.assertEqual(self.table_rows(f'"{partitions.DEFAULT_PARTITION}"'), [])
+        self.assertEqual(partitions.create_future_partitions(months_ahead), [])
+
+    def test_archive_partitions(self):
+        old_month = partitions.add_months(self.current, -3)
+        self.make_deposits(old_month + timezone.timedelta(days=1),
+                           old_month + timezone.timedelta(days=2), timezone.now())
+        partitions.create_future_partitions(0, date=old_month)
+        name = partitions.partition_name(old_month)
+
+        archived = partitions.archive_partitions(2)
+
+        self.assertEqual(archived, [name])
+        self.assertNotIn(name, partitions.month_partitions().values())
+        self.assertEqual(ApplicationOp.objects.count(), 1)
+        closing = AccountClosingBalance.objects.get(application_account=self.app_acc)
+        self.assertEqual(closing.balance, 2000)
+        self.assertEqual(closing.archived_until, partitions.add_months(self.current, -2))
+
+        schema = settings.LEDGER_ARCHIVE_SCHEMA
+        self.assertEqual(len(self.table_rows(f'"{schema}"."{name}"')), 2)
+        with self.assertRaises(DatabaseError), transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(f'DELETE FROM "{schema}"."{name}"')
+        self.assertEqual(partitions.archive_partitions(2), [])
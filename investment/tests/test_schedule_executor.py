@@ -0,0 +1,126 @@
+"""
+Test scheduled operations executor
+"""
+
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from investment.models import (AccountOpSchedule, ApplicationAccount, ApplicationOp,
+                               MoneyTransfer)
+from investment.applications.pool_account.forms import OperationCompletionForm
+from investment.operations.operations import ApplicationAccountOperation
+from investment.operations.schedule import ScheduleExecutor
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=no-member
+
+User = get_user_model()
+
+
+class TestScheduleExecutor(TestCase):
+    """
+    Due deposit schedules execution, retries and metrics
+    """
+
+    fixtures = [
+        'core/fixtures/users.json',
+        'clients/fixtures/clients.json',
+        'applications',
+        'products/fixtures/products.json'
+    ]
+
+    def setUp(self) -> None:
+        self.operator = User.objects.get(pk=1)
+        self.app_acc = ApplicationAccount.objects.get(pk=1)
+        self.now = timezone.localtime(timezone.now())
+        return super().setUp()
+
+    def schedule(self, days, value=1000, operation=MoneyTransfer.Operation.DEPOSIT):
+        money_transfer = MoneyTransfer.objects.create(
+            application_account=self.app_acc, operation=operation, value=value,
+            state=MoneyTransfer.State.WAITING_OP, operator=self.operator)
+        return ApplicationAccountOperation().schedule_operation(
+            money_transfer, self.now + timezone.timedelta(days=days), self.operator)
+
+    def test_execute_due(self):
+        due = [self.schedule(-2, 1000), self.schedule(-1, 500)]
+        future = self.schedule(3)
+        withdraw = self.schedule(-1, operation=MoneyTransfer.Operation.WITHDRAW_WALLET)
+
+        metrics = ScheduleExecutor(batch_size=1, now=self.now).run()
+
+        self.assertEqual(metrics['executed'], 2)
+        self.assertEqual(metrics['batches'], 2)
+        self.assertEqual(metrics['backlog'], 0)
+        for schedule in due:
+            schedule.refresh_from_db()
+            self.assertEqual(schedule.state, AccountOpSchedule.State.FINISHED)
+            self.assertEqual(schedule.trial, 1)
+            self.assertEqual(schedule.processor, self.operator)
+            self.assertEqual(schedule.money_transfer.state, MoneyTransfer.State.FINISHED)
+            self.assertTrue(ApplicationOp.objects.filter(
+                money_transfer=schedule.money_transfer).exists())
+        self.assertEqual(self.app_acc.refresh_balance_snapshot().balance, 1500)
+        for schedule in [future, withdraw]:
+            schedule.refresh_from_db()
+            self.assertEqual(schedule.state, AccountOpSchedule.State.WAITING)
+
+    @patch.object(ApplicationAccountOperation, 'make_deposit')
+    def test_retry_backoff(self, make_deposit):
+        make_deposit.side_effect = ValueError('Falha no depósito')
+        schedule = self.schedule(-1)
+
+        metrics = ScheduleExecutor(now=self.now).run()
+        schedule.refresh_from_db()
+        self.assertEqual(metrics['retried'], 1)
+        self.assertEqual(schedule.trial, 1)
+        self.assertEqual(schedule.state, AccountOpSchedule.State.WAITING)
+        self.assertEqual(schedule.next_trial_date, self.now + timezone.timedelta(minutes=15))
+        self.assertEqual(schedule.error_message, 'Falha no depósito')
+
+        # Not due before the backoff
+        self.assertEqual(ScheduleExecutor(now=self.now).run()['batches'], 0)
+
+        now = self.now + timezone.timedelta(minutes=15)
+        ScheduleExecutor(now=now).run()
+        schedule.refresh_from_db()
+        self.assertEqual(schedule.next_trial_date, now + timezone.timedelta(minutes=30))
+
+        metrics = ScheduleExecutor(now=now + timezone.timedelta(minutes=30)).run()
+        schedule.refresh_from_db()
+        self.assertEqual(metrics['failed'], 1)
+        self.assertEqual(schedule.trial, 3)
+        self.assertEqual(schedule.state, AccountOpSchedule.State.ERROR)
+        self.assertEqual(schedule.money_transfer.state, MoneyTransfer.State.ERROR)
+        self.assertFalse(ApplicationOp.objects.filter(
+            money_transfer=schedule.money_transfer).exists())
+
+    def test_manual_deposit_not_repeated(self):
+        schedule = self.schedule(-1)
+        # Form opened before the executor deposit
+        money_transfer = MoneyTransfer.objects.get(pk=schedule.money_transfer.pk)
+        form = OperationCompletionForm(
+            {'do_deposit': 'on'}, instance=money_transfer,
+            user=self.operator, application_account=self.app_acc)
+
+        self.assertEqual(ScheduleExecutor(now=self.now).run()['executed'], 1)
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.save().state, MoneyTransfer.State.FINISHED)
+
+        self.assertEqual(ApplicationOp.objects.filter(application_account=self.app_acc).count(), 1)
+        self.assertEqual(self.app_acc.refresh_balance_snapshot().balance, 1000)
+
+    def test_finished_meanwhile(self):
+        schedule = self.schedule(-1)
+        executor = ScheduleExecutor(now=self.now)
+        claimed = executor.claim(schedule.pk)
+        MoneyTransfer.objects.filter(pk=schedule.money_transfer.pk).update(
+            state=MoneyTransfer.State.FINISHED)
+        claimed.money_transfer.refresh_from_db()
+
+        executor.execute(claimed)
+        self.assertEqual(executor.skipped, 1)
+        self.assertFalse(ApplicationOp.objects.filter(application_account=self.app_acc).exists())
@@ -0,0 +1,56 @@
+"""
+Test synthetic ledger generator
+"""
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from investment.models import AccountBalance, Application, ApplicationAccount, ApplicationOp
+from investment.synthetic import LedgerGenerator
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=no-member
+
+User = get_user_model()
+
+
+class TestLedgerGenerator(TestCase):
+    """
+    Generated histories must be consistent ledgers
+    """
+
+    fixtures = [
+        'core/fixtures/users.json',
+        'clients/fixtures/clients.json',
+        'applications'
+    ]
+
+    def setUp(self) -> None:
+        self.operator = User.objects.get(pk=1)
+        self.application = Application.objects.get(pk=1)
+        return super().setUp()
+
+    def test_generate(self):
+        generator = LedgerGenerator(
+            self.application, self.operator, timezone.datetime(2022, 6, 1).date(),
+            months=3, seed=1, batch_size=4)
+        accounts, operations = generator.generate(10)
+
+        new_accounts = ApplicationAccount.objects.filter(
+            user__username__startswith=generator.prefix)
+        self.assertEqual(accounts, 10)
+        self.assertEqual(new_accounts.count(), 10)
+        self.assertEqual(
+            ApplicationOp.objects.filter(application_account__in=new_accounts).count(),
+            operations)
+
+        for app_acc in new_accounts:
+            ops = list(ApplicationOp.objects.filter(
+                application_account=app_acc).order_by('operation_date'))
+            self.assertEqual(ops[0].operation_type, ApplicationOp.OperationType.OPEN)
+            self.assertEqual(
+                [op.operation_type for op in ops].count(ApplicationOp.OperationType.INCOME), 2)
+            self.assertTrue(all(op.balance > 0 for op in ops))
+            self.assertEqual(
+                AccountBalance.objects.get(pk=app_acc.pk).balance, ops[-1].balance)
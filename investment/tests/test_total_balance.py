@@ -0,0 +1,137 @@
+"""
+Test user total balances
+"""
+
+from django.contrib.auth import get_user_model
+from django.db.models import Case, Count, F, Max, Q, Sum, Value
+from django.test import TestCase
+from django.utils import timezone
+
+from investment.models import ApplicationAccount, ApplicationOp
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=no-member
+
+User = get_user_model()
+
+
+def previous_total_balance(user):
+    """ Reference implementation (pk lists pulled into python) """
+    op = ApplicationOp.OperationType
+    query = ApplicationAccount.objects.filter(
+        Q(applicationop__operation_type=op.DEPOSIT) |
+        Q(applicationop__operation_type=op.OPEN) |
+        Q(applicationop__operation_type=op.WITHDRAW_WALLET) |
+        Q(applicationop__operation_type=op.WITHDRAW_INCOME),
+        user=user,
+    ).annotate(
+        num_ops=Count('applicationop')
+    ).annotate(
+        op_type=Case(default=Value(op.DEPOSIT))
+    ).annotate(
+        last_pk=Max('applicationop__pk')
+    ).values('last_pk', 'pk', 'op_type').values_list('last_pk', flat=True)
+    value = ApplicationOp.objects.aggregate(
+        total=Sum('balance', filter=Q(pk__in=list(query))))
+    return value['total'] or 0
+
+
+def previous_total_income_balance(user):
+    """ Reference implementation (pk lists pulled into python) """
+    op = ApplicationOp.OperationType
+    query = ApplicationAccount.objects.filter(
+        Q(applicationop__operation_type=op.INCOME) |
+        Q(applicationop__operation_type=op.WITHDRAW_INCOME),
+        user=user,
+    ).annotate(
+        num_ops=Count('applicationop')
+    ).annotate(
+        last_pk=Max('applicationop__pk'), op=F('applicationop__operation_type')
+    ).values('last_pk', 'op', 'pk')
+
+    income_ops = list(query.filter(
+        op=op.INCOME).values_list('last_pk', flat=True))
+    withdraw_ops = list(query.filter(
+        op=op.WITHDRAW_INCOME).values_list('last_pk', flat=True))
+
+    value = ApplicationOp.objects.aggregate(
+        income=Sum('value', filter=Q(pk__in=income_ops)),
+        total_withdraw=(
+            Sum('balance', filter=Q(pk__in=income_ops)) -
+            Sum('balance', filter=Q(pk__in=withdraw_ops))
+        )
+    )
+    if value['income'] and value['total_withdraw']:
+        return value['income'] - value['total_withdraw']
+    return 0
+
+
+class TestTotalBalance(TestCase):
+    """
+    Set based totals must match the previous implementation
+    """
+
+    fixtures = [
+        'core/fixtures/users.json',
+        'clients/fixtures/clients.json',
+        'applications'
+    ]
+
+    def setUp(self) -> None:
+        self.operator = User.objects.get(pk=1)
+        self.user = User.objects.get(pk=2)
+        self.app_acc1 = ApplicationAccount.objects.get(pk=1)
+        self.app_acc2 = ApplicationAccount.objects.get(pk=2)
+        self.date = timezone.localtime(timezone.now()) - timezone.timedelta(days=60)
+        return super().setUp()
+
+    def next_date(self):
+        self.date += timezone.timedelta(days=1)
+        return self.date
+
+    def deposit(self, app_acc, value):
+        ApplicationOp.make_deposit(
+            self.operator, app_acc, value, operation_date=self.next_date())
+
+    def income(self, app_acc, value):
+        ApplicationOp.make_income_deposit(
+            self.operator.pk, app_acc.pk, value, app_acc.refresh_balance_snapshot().balance + value,
+            self.next_date())
+
+    def withdraw(self, app_acc, value, operation_type):
+        ApplicationOp.make_withdraw(
+            app_acc, self.operator, value, operation_type, operation_date=self.next_date())
+
+    def assert_same_totals(self):
+        with self.assertNumQueries(1):
+            total_balance = ApplicationAccount.total_balance(self.user)
+        with self.assertNumQueries(1):
+            total_income_balance = ApplicationAccount.total_income_balance(self.user)
+        self.assertEqual(total_balance, previous_total_balance(self.user))
+        self.assertEqual(total_income_balance, previous_total_income_balance(self.user))
+        return total_balance, total_income_balance
+
+    def test_no_operations(self):
+        self.assertEqual(self.assert_same_totals(), (0, 0))
+
+    def test_deposits(self):
+        self.deposit(self.app_acc1, 10000)
+        self.deposit(self.app_acc2, 2000)
+        self.deposit(self.app_acc1, 500)
+        self.assertEqual(self.assert_same_totals(), (12500, 0))
+
+    def test_income_and_withdraws(self):
+        self.deposit(self.app_acc1, 10000)
+        self.deposit(self.app_acc2, 20000)
+        self.income(self.app_acc1, 100)
+        self.income(self.app_acc2, 200)
+        self.withdraw(self.app_acc1, 30, ApplicationOp.OperationType.WITHDRAW_INCOME)
+        self.income(self.app_acc1, 101)
+        self.withdraw(self.app_acc2, 50, ApplicationOp.OperationType.WITHDRAW_INCOME)
+        self.withdraw(self.app_acc2, 1000, ApplicationOp.OperationType.WITHDRAW_WALLET)
+        self.withdraw(self.app_acc1, 11, ApplicationOp.OperationType.WITHDRAW_INCOME)
+        self.deposit(self.app_acc2, 3000)
+
+        total_balance, total_income_balance = self.assert_same_totals()
+        self.assertGreater(total_balance, 0)
+        self.assertGreater(total_income_balance, 0)
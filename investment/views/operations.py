@@ -113,6 +113,6 @@ class ReceiptsView(auth_mixins.LoginRequiredMixin, generic.FileBaseView):
     def can_access_file(self, request):
         user = request.user
         roles = [accounts_roles.Roles.ADMIN, accounts_roles.Roles.CLIENT]
-        if accounts_roles.has_role_in(user, roles):
+        if accounts_roles.has_role_in(user, roles, request.session):
             return True
         return False
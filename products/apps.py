@@ -1,6 +1,22 @@
-from django.apps import AppConfig
+from django.apps import AppConfig, apps
+from django.core import checks
+from django.utils.module_loading import module_has_submodule
 
 
 class ProductsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'products'
+
+    def ready(self) -> None:
+        # pylint: disable=import-outside-toplevel
+        from charts.charts.base import AbstractDashboard
+
+        from .checks import check_dashboard_classes
+        from .models import dashboard_classes
+
+        for app_config in apps.get_app_configs():
+            if module_has_submodule(app_config.module, 'dashboards'):
+                module_path = f'{app_config.name}.dashboards'
+                dashboard_classes.register_module(
+                    module_path, AbstractDashboard, prefix=f'{module_path}.')
+        checks.register(check_dashboard_classes, checks.Tags.database)
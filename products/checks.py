@@ -0,0 +1,27 @@
+"""
+Products system checks
+"""
+
+from django.core import checks
+from django.db import DatabaseError
+
+from .models import Dashboard
+
+
+# pylint: disable=unused-argument
+def check_dashboard_classes(app_configs=None, databases=None, **kwargs):
+    """
+    Dashboards with a class not registered
+    """
+    if not databases:
+        return []
+    try:
+        # pylint: disable=no-member
+        dashboards = list(Dashboard.objects.all())
+    except DatabaseError:
+        return []
+    return [
+        checks.Error(f'Classe do dashboard não encontrada: {dashboard.dashboard_class}',
+                     obj=dashboard, id='products.E001')
+        for dashboard in dashboards if not dashboard.get_class()
+    ]
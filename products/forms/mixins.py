@@ -4,6 +4,9 @@ Core mixins
 
 """
 
+from django.utils import timezone
+
+from common.dates import local_midnight
 from common.forms.mixins import FilterFormViewMixin
 
 from. import filters
@@ -37,10 +40,30 @@ class OperationsFilterMixin(FilterFormViewMixin):
             filter_form.add_error(
                 '', 'A data inicial deve ser menor que a final')
 
+        return self.filter_period(queryset, init_date, final_date)
+
+    def get_queryset(self):
+        """
+        Without filter, list the default period shown in the filter form
+        """
+        queryset = super().get_queryset()
+        if self.filter_form is not None and not self.filter_form.is_bound:
+            queryset = self.filter_period(
+                queryset,
+                self.filter_form.fields['init_date'].initial,
+                self.filter_form.fields['final_date'].initial)
+        return queryset
+
+    @staticmethod
+    def filter_period(queryset, init_date, final_date):
+        """
+        Filter operations by date range (partition pruning in PostgreSQL)
+        """
         if init_date:
-            queryset = queryset.filter(operation_date__date__gte=init_date)
+            queryset = queryset.filter(operation_date__gte=local_midnight(init_date))
 
         if final_date:
-            queryset = queryset.filter(operation_date__date__lte=final_date)
+            queryset = queryset.filter(
+                operation_date__lt=local_midnight(final_date + timezone.timedelta(days=1)))
 
         return queryset
@@ -3,17 +3,22 @@ Products models
 """
 
 from collections import OrderedDict
-import pydoc
 
 from dateutil.relativedelta import relativedelta
 from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils import timezone
 from tinymce import models as tinymce_models
 
+from common.registry import ClassRegistry
 from investorprofile import models as invprof_models
 from investment import models as invest_models
 
+# Dashboard classes of installed apps dashboards modules by path
+# (<app>.dashboards.<class>, ProductsConfig.ready)
+dashboard_classes = ClassRegistry('Dashboard classes')
+
 
 class ProductCategory(models.Model):
     """
@@ -300,12 +305,16 @@ class Dashboard(models.Model):
     description = models.TextField(
         verbose_name='Descrição', null=True, blank=True)
 
-    # TODO: try to cache
+    def clean(self) -> None:
+        if not self.get_class():
+            raise ValidationError({'dashboard_class': 'Classe do dashboard não encontrada'})
+        return super().clean()
+
     def get_class(self):
         """
         Get the dashboard python class
         """
-        return pydoc.locate(f'{self.application}.dashboards.{str(self.dashboard_class)}')
+        return dashboard_classes.get(f'{self.application}.dashboards.{self.dashboard_class}')
 
     def __str__(self) -> str:
         return str(self.display_text)
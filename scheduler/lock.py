@@ -2,13 +2,24 @@
 Lock a task with key
 """
 
+import logging
+import threading
+
 import redis
 
 REDIS_CLIENT = redis.Redis()
 
+logger = logging.getLogger(__name__)
+
 
-def lock_task(function=None, key="", timeout=None):
-    """Enforce only one celery task at a time."""
+def lock_task(function=None, key="", timeout=None, bind=False):
+    """Enforce only one celery task at a time.
+
+    With a timeout the lock expires if the worker dies; long tasks must be
+    bound (bind=True, the lock is passed as first argument) and keep it
+    (lock.reacquire() or LockHeartbeat). The lock token is not thread local,
+    so it can be renewed from other threads.
+    """
 
     def _dec(run_func):
         """Decorator."""
@@ -17,17 +28,75 @@ def lock_task(function=None, key="", timeout=None):
             """Caller."""
             ret_value = None
             have_lock = False
-            lock = REDIS_CLIENT.lock(key, timeout=timeout)
+            lock = REDIS_CLIENT.lock(key, timeout=timeout, thread_local=False)
             try:
                 have_lock = lock.acquire(blocking=False)
                 if have_lock:
+                    if bind:
+                        args = (lock,) + args
                     ret_value = run_func(*args, **kwargs)
             finally:
                 if have_lock:
-                    lock.release()
+                    try:
+                        lock.release()
+                    except redis.exceptions.LockError:
+                        # Expired and maybe taken by another worker
+                        logger.warning('Task lock %s lost before release', key)
 
             return ret_value
 
         return _caller
 
     return _dec(function) if function is not None else _dec
+
+
+def is_locked(key):
+    """Return True if a task holds the lock with key."""
+    return REDIS_CLIENT.lock(key).locked()
+
+
+class LockHeartbeat:
+    """
+    Renew a task lock from a background thread while the task runs
+
+    The lock is reacquired every interval (a third of its timeout by default),
+    so a slow step does not let it expire. If it can not be renewed (expired,
+    maybe taken by another worker) lost is set: the task must stop.
+    Redis errors are retried in the next interval.
+
+    Usage:
+        with LockHeartbeat(task_lock) as heartbeat:
+            for item in items:
+                if heartbeat.lost.is_set():
+                    break
+                ...
+    """
+
+    def __init__(self, task_lock, interval=None):
+        self.task_lock = task_lock
+        self.interval = interval or (task_lock.timeout or 0) / 3
+        self.lost = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        if self.interval:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.task_lock.reacquire()
+            except redis.exceptions.LockError:
+                logger.warning('Task lock %s lost', self.task_lock.name)
+                self.lost.set()
+                return
+            except redis.RedisError as exc:
+                logger.warning('Task lock %s not renewed (%s)', self.task_lock.name, exc)
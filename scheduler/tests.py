@@ -1,3 +1,42 @@
-from django.test import TestCase
+"""
+Scheduler tests
+"""
 
-# Create your tests here.
+from unittest.mock import MagicMock, patch
+
+import redis
+from django.test import SimpleTestCase
+
+from scheduler import lock
+
+# pylint: disable=missing-function-docstring
+
+
+class TestLockHeartbeat(SimpleTestCase):
+    """
+    Task lock renewal
+    """
+
+    def test_renew_until_lost(self):
+        task_lock = MagicMock(timeout=0.03)
+        task_lock.reacquire.side_effect = [True, True, redis.exceptions.LockNotOwnedError()]
+
+        with lock.LockHeartbeat(task_lock) as heartbeat:
+            self.assertTrue(heartbeat.lost.wait(1))
+        self.assertEqual(task_lock.reacquire.call_count, 3)
+
+    def test_redis_error_retried(self):
+        task_lock = MagicMock(timeout=0.03)
+        task_lock.reacquire.side_effect = [redis.ConnectionError(), True, True]
+
+        with lock.LockHeartbeat(task_lock) as heartbeat:
+            while task_lock.reacquire.call_count < 3:
+                heartbeat.lost.wait(0.01)
+        self.assertFalse(heartbeat.lost.is_set())
+
+    def test_release_lost_lock(self):
+        task_lock = MagicMock()
+        task_lock.release.side_effect = redis.exceptions.LockNotOwnedError()
+        with patch.object(lock.REDIS_CLIENT, 'lock', return_value=task_lock):
+            self.assertEqual(lock.lock_task(lambda: 'done', key='key', timeout=1)(), 'done')
+        task_lock.release.assert_called_once()
@@ -15,6 +15,7 @@ from datetime import timedelta
 from pathlib import Path
 
 import environ
+from celery.schedules import crontab
 
 env = environ.Env(DEBUG=(bool, False))
 
@@ -190,7 +191,17 @@ STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 ##########
 # Django constance
 
-CONSTANCE_BACKEND = 'constance.backends.database.DatabaseBackend'
+# Database backend read from an in-process snapshot (common.config_backend)
+# Writes bump a version stamp in Redis, checked at most every interval (seconds)
+CONSTANCE_BACKEND = 'common.config_backend.SnapshotDatabaseBackend'
+CONSTANCE_SNAPSHOT_CHECK_INTERVAL = env.float('CONSTANCE_SNAPSHOT_CHECK_INTERVAL', 1.0)
+
+##########
+# Company data cache (core.company)
+
+# Process copy lifetime and Redis copy expiration (seconds)
+COMPANY_CACHE_INTERVAL = env.float('COMPANY_CACHE_INTERVAL', 5.0)
+COMPANY_CACHE_TIMEOUT = env.int('COMPANY_CACHE_TIMEOUT', 3600)
 
 
 ##########
@@ -303,8 +314,33 @@ EMAIL_HOST = env.str('EMAIL_HOST')
 EMAIL_HOST_USER = env.str('EMAIL_HOST_USER')
 EMAIL_HOST_PASSWORD = env.str('EMAIL_HOST_PASSWORD')
 EMAIL_PORT = env.int('EMAIL_PORT')
+# SMTP operations timeout (seconds), must be lower than the task locks timeout
+EMAIL_TIMEOUT = env.int('EMAIL_TIMEOUT', 60)
 DEFAULT_FROM_EMAIL = EMAIL_HOST_USER
 
+# Batch email sender threads, each one with its own SMTP connection
+EMAIL_BATCH_WORKERS = env.int('EMAIL_BATCH_WORKERS', 1)
+
+# Batch email recipients sent (and updated) per chunk
+EMAIL_BATCH_CHUNK_SIZE = env.int('EMAIL_BATCH_CHUNK_SIZE', 50)
+
+# Anniversary email sender threads (chunks of EMAIL_BATCH_CHUNK_SIZE)
+ANNIVERSARY_EMAIL_WORKERS = env.int('ANNIVERSARY_EMAIL_WORKERS', 4)
+
+# Sending attempts of an anniversary email (failed ones are sent again by the
+# next task runs of the day until this limit)
+ANNIVERSARY_EMAIL_MAX_ATTEMPTS = env.int('ANNIVERSARY_EMAIL_MAX_ATTEMPTS', 3)
+
+# Batch email task lock expiration (seconds), renewed while sending
+# Processing batches without lock are resent (requeue_stale_email_batches)
+EMAIL_BATCH_LOCK_TIMEOUT = env.int('EMAIL_BATCH_LOCK_TIMEOUT', 300)
+EMAIL_BATCH_STALE_CHECK_INTERVAL = env.int('EMAIL_BATCH_STALE_CHECK_INTERVAL', 600)
+
+# Failed recipients of finished batches are compacted into the batch failed
+# counter and deleted after the retention period (purge_email_batches task)
+EMAIL_BATCH_RETENTION_DAYS = env.int('EMAIL_BATCH_RETENTION_DAYS', 90)
+EMAIL_BATCH_PURGE_CHUNK_SIZE = env.int('EMAIL_BATCH_PURGE_CHUNK_SIZE', 1000)
+
 
 ##########
 # flatpickr
@@ -358,6 +394,35 @@ CELERYBEAT_SCHEDULER = 'django_celery_beat.schedulers:DatabaseScheduler'
 CELERY_ENABLE_UTC = False
 CELERY_TIMEZONE = 'America/Sao_Paulo'
 
+# Account operation schedules executor (deposits after the deposit term)
+# Processor username: the schedule operator if not set
+# Each schedule is locked during its deposit only (one transaction each)
+ACCOUNT_OP_SCHEDULE_INTERVAL = env.int('ACCOUNT_OP_SCHEDULE_INTERVAL', 300)
+ACCOUNT_OP_SCHEDULE_WORKERS = env.int('ACCOUNT_OP_SCHEDULE_WORKERS', 1)
+ACCOUNT_OP_SCHEDULE_BATCH_SIZE = env.int('ACCOUNT_OP_SCHEDULE_BATCH_SIZE', 100)
+ACCOUNT_OP_SCHEDULE_BACKOFF_MINUTES = env.int('ACCOUNT_OP_SCHEDULE_BACKOFF_MINUTES', 15)
+ACCOUNT_OP_SCHEDULE_PROCESSOR = env.str('ACCOUNT_OP_SCHEDULE_PROCESSOR', None)
+
+# Periodic tasks synchronized to database scheduler
+CELERY_BEAT_SCHEDULE = {
+    'requeue-stale-email-batches': {
+        'task': 'core.tasks.requeue_stale_email_batches',
+        'schedule': EMAIL_BATCH_STALE_CHECK_INTERVAL,
+    },
+    'purge-email-batches': {
+        'task': 'core.tasks.purge_email_batches',
+        'schedule': crontab(hour=3, minute=0),
+    },
+    'execute-account-op-schedules': {
+        'task': 'investment.tasks.execute_account_op_schedules',
+        'schedule': ACCOUNT_OP_SCHEDULE_INTERVAL,
+    },
+    'maintain-ledger-partitions': {
+        'task': 'investment.tasks.maintain_ledger_partitions',
+        'schedule': crontab(day_of_month=1, hour=2, minute=0),
+    },
+}
+
 
 ##########
 # Django channels (websocket)
@@ -430,6 +495,31 @@ USER_PROFILE_DEFAULT_THEME = 'dark'
 INCOME_OPERATION_RUN_IN_BACKGROUND = env.bool(
     'INCOME_OPERATION_RUN_IN_BACKGROUND', True)
 
+# Income calculation engine: 'python' (default), 'numpy' (vectorized)
+# or 'streaming' (bounded memory, server side cursors)
+INCOME_OPERATION_ENGINE = env.str('INCOME_OPERATION_ENGINE', 'python')
+
+# Number of parallel tasks (account shards) for each income operation
+INCOME_OPERATION_SHARDS = env.int('INCOME_OPERATION_SHARDS', 1)
+
+
+##########
+# Application operations (ledger) monthly partitions (PostgreSQL only)
+# See investment.partitions, ledger_partitions command and the monthly
+# maintain-ledger-partitions periodic task
+
+# Partitions created in advance
+LEDGER_PARTITION_MONTHS_AHEAD = env.int('LEDGER_PARTITION_MONTHS_AHEAD', 3)
+
+# Months kept in the ledger, older partitions are archived (None: no archival)
+# Archived operations are not visible to the application anymore
+LEDGER_ARCHIVE_MONTHS = env.int('LEDGER_ARCHIVE_MONTHS', None)
+
+# Archive schema and tablespace (None: default tablespace).
+# Use a tablespace in a compressed filesystem to compress archived months
+LEDGER_ARCHIVE_SCHEMA = env.str('LEDGER_ARCHIVE_SCHEMA', 'ledger_archive')
+LEDGER_ARCHIVE_TABLESPACE = env.str('LEDGER_ARCHIVE_TABLESPACE', None)
+
 
 ##########
 # Loggin in database and sending email
@@ -0,0 +1,2 @@
+/*! For license information please see main.js.LICENSE.txt */
+(()=>{var t={927:(t,e,i)=>{"use strict";var n;function a(t,e){var i=Object.keys(t);if(Object.getOwnPropertySymbols){var n=Object.getOwnPropertySymbols(t);e&&(n=n.filter((function(e){return Object.getOwnPropertyDescriptor(t,e).enumerable}))),i.push.apply(i,n)}return i}function r(t){for(var e=1;e<arguments.length;e++){var i=null!=arguments[e]?arguments[e]:{};e%2?a(Object(i),!0).forEach((function(e){h(t,e,i[e])})):Object.getOwnPropertyDescriptors?Object.defineProperties(t,Object.getOwnPropertyDescriptors(i)):a(Object(i)).forEach((function(e){Object.defineProperty(t,e,Object.getOwnPropertyDescriptor(i,e))}))}return t}function s(t){return(s="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t})(t)}function o(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}function l(t,e){for(var i=0;i<e.length;i++){var n=e[i];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,n.key,n)}}function c(t,e,i){return e&&l(t.prototype,e),i&&l(t,i),t}function h(t,e,i){return e in t?Object.defineProperty(t,e,{value:i,enumerable:!0,configurable:!0,writable:!0}):t[e]=i,t}function u(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),e&&f(t,e)}function d(t){return(d=Object.setPrototypeOf?Object.getPrototypeOf:function(t){return t.__proto__||Object.getPrototypeOf(t)})(t)}function f(t,e){return(f=Object.setPrototypeOf||function(t,e){return t.__proto__=e,t})(t,e)}function g(t,e){if(e&&("object"==typeof e||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}function p(t){var e=function(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(t){return!1}}();return function(){var i,n=d(t);if(e){var a=d(this).constructor;i=Reflect.construct(n,arguments,a)}else i=n.apply(this,arguments);return g(this,i)}}function m(t){return function(t){if(Array.isArray(t))return v(t)}(t)||function(t){if("undefined"!=typeof Symbol&&null!=t[Symbol.iterator]||null!=t["@@iterator"])return Array.from(t)}(t)||function(t,e){if(t){if("string"==typeof t)return v(t,e);var i=Object.prototype.toString.call(t).slice(8,-1);return"Object"===i&&t.constructor&&(i=t.constructor.name),"Map"===i||"Set"===i?Array.from(t):"Arguments"===i||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(i)?v(t,e):void 0}}(t)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function v(t,e){(null==e||e>t.length)&&(e=t.length);for(var i=0,n=new Array(e);i<e;i++)n[i]=t[i];return n}var x=function(){function t(){o(this,t)}return c(t,[{key:"shadeRGBColor",value:function(t,e){var i=e.split(","),n=t<0?0:255,a=t<0?-1*t:t,r=parseInt(i[0].slice(4),10),s=parseInt(i[1],10),o=parseInt(i[2],10);return"rgb("+(Math.round((n-r)*a)+r)+","+(Math.round((n-s)*a)+s)+","+(Math.round((n-o)*a)+o)+")"}},{key:"shadeHexColor",value:function(t,e){var i=parseInt(e.slice(1),16),n=t<0?0:255,a=t<0?-1*t:t,r=i>>16,s=i>>8&255,o=255&i;return"#"+(16777216+65536*(Math.round((n-r)*a)+r)+256*(Math.round((n-s)*a)+s)+(Math.round((n-o)*a)+o)).toString(16).slice(1)}},{key:"shadeColor",value:function(e,i){return t.isColorHex(i)?this.shadeHexColor(e,i):this.shadeRGBColor(e,i)}}],[{key:"bind",value:function(t,e){return function(){return t.apply(e,arguments)}}},{key:"isObject",value:function(t){return t&&"object"===s(t)&&!Array.isArray(t)&&null!=t}},{key:"is",value:function(t,e){return Object.prototype.toString.call(e)==="[object "+t+"]"}},{key:"listToArray",value:function(t){var e,i=[];for(e=0;e<t.length;e++)i[e]=t[e];return i}},{key:"extend",value:function(t,e){var i=this;"function"!=typeof Object.assign&&(Object.assign=function(t){if(null==t)throw new TypeError("Cannot convert undefined or null to object");for(var e=Object(t),i=1;i<arguments.length;i++){var n=arguments[i];if(null!=n)for(var a in n)n.hasOwnProperty(a)&&(e[a]=n[a])}return e});var n=Object.assign({},t);return this.isObject(t)&&this.isObject(e)&&Object.keys(e).forEach((function(a){i.isObject(e[a])&&a in t?n[a]=i.extend(t[a],e[a]):Object.assign(n,h({},a,e[a]))})),n}},{key:"extendArray",value:function(e,i){var n=[];return e.map((function(e){n.push(t.extend(i,e))})),n}},{key:"monthMod",value:function(t){return t%12}},{key:"clone",value:function(e){if(t.is("Array",e)){for(var i=[],n=0;n<e.length;n++)i[n]=this.clone(e[n]);return i}if(t.is("Null",e))return null;if(t.is("Date",e))return e;if("object"===s(e)){var a={};for(var r in e)e.hasOwnProperty(r)&&(a[r]=this.clone(e[r]));return a}return e}},{key:"log10",value:function(t){return Math.log(t)/Math.LN10}},{key:"roundToBase10",value:function(t){return Math.pow(10,Math.floor(Math.log10(t)))}},{key:"roundToBase",value:function(t,e){return Math.pow(e,Math.floor(Math.log(t)/Math.log(e)))}},{key:"parseNumber",value:function(t){return null===t?t:parseFloat(t)}},{key:"randomId",value:function(){return(Math.random()+1).toString(36).substring(4)}},{key:"noExponents",value:function(t){var e=String(t).split(/[eE]/);if(1===e.length)return e[0];var i="",n=t<0?"-":"",a=e[0].replace(".",""),r=Number(e[1])+1;if(r<0){for(i=n+"0.";r++;)i+="0";return i+a.replace(/^-/,"")}for(r-=a.length;r--;)i+="0";return a+i}},{key:"getDimensions",value:function(t){var e=getComputedStyle(t,null),i=t.clientHeight,n=t.clientWidth;return i-=parseFloat(e.paddingTop)+parseFloat(e.paddingBottom),[n-=parseFloat(e.paddingLeft)+parseFloat(e.paddingRight),i]}},{key:"getBoundingClientRect",value:function(t){var e=t.getBoundingClientRect();return{top:e.top,right:e.right,bottom:e.bottom,left:e.left,width:t.clientWidth,height:t.clientHeight,x:e.left,y:e.top}}},{key:"getLargestStringFromArr",value:function(t){return t.reduce((function(t,e){return Array.isArray(e)&&(e=e.reduce((function(t,e){return t.length>e.length?t:e}))),t.length>e.length?t:e}),0)}},{key:"hexToRgba",value:function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:"#999999",e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:.6;"#"!==t.substring(0,1)&&(t="#999999");var i=t.replace("#","");i=i.match(new RegExp("(.{"+i.length/3+"})","g"));for(var n=0;n<i.length;n++)i[n]=parseInt(1===i[n].length?i[n]+i[n]:i[n],16);return void 0!==e&&i.push(e),"rgba("+i.join(",")+")"}},{key:"getOpacityFromRGBA",value:function(t){return parseFloat(t.replace(/^.*,(.+)\)/,"$1"))}},{key:"rgb2hex",value:function(t){return(t=t.match(/^rgba?[\s+]?\([\s+]?(\d+)[\s+]?,[\s+]?(\d+)[\s+]?,[\s+]?(\d+)[\s+]?/i))&&4===t.length?"#"+("0"+parseInt(t[1],10).toString(16)).slice(-2)+("0"+parseInt(t[2],10).toString(16)).slice(-2)+("0"+parseInt(t[3],10).toString(16)).slice(-2):""}},{key:"isColorHex",value:function(t){return/(^#[0-9A-F]{6}$)|(^#[0-9A-F]{3}$)|(^#[0-9A-F]{8}$)/i.test(t)}},{key:"getPolygonPos",value:function(t,e){for(var i=[],n=2*Math.PI/e,a=0;a<e;a++){var r={};r.x=t*Math.sin(a*n),r.y=-t*Math.cos(a*n),i.push(r)}return i}},{key:"polarToCartesian",value:function(t,e,i,n){var a=(n-90)*Math.PI/180;return{x:t+i*Math.cos(a),y:e+i*Math.sin(a)}}},{key:"escapeString",value:function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"x",i=t.toString().slice();return i.replace(/[` ~!@#$%^&*()_|+\-=?;:'",.<>{}[\]\\/]/gi,e)}},{key:"negToZero",value:function(t){return t<0?0:t}},{key:"moveIndexInArray",value:function(t,e,i){if(i>=t.length)for(var n=i-t.length+1;n--;)t.push(void 0);return t.splice(i,0,t.splice(e,1)[0]),t}},{key:"extractNumber",value:function(t){return parseFloat(t.replace(/[^\d.]*/g,""))}},{key:"findAncestor",value:function(t,e){for(;(t=t.parentElement)&&!t.classList.contains(e););return t}},{key:"setELstyles",value:function(t,e){for(var i in e)e.hasOwnProperty(i)&&(t.style.key=e[i])}},{key:"isNumber",value:function(t){return!isNaN(t)&&parseFloat(Number(t))===t&&!isNaN(parseInt(t,10))}},{key:"isFloat",value:function(t){return Number(t)===t&&t%1!=0}},{key:"isSafari",value:function(){return/^((?!chrome|android).)*safari/i.test(navigator.userAgent)}},{key:"isFirefox",value:function(){return navigator.userAgent.toLowerCase().indexOf("firefox")>-1}},{key:"isIE11",value:function(){if(-1!==window.navigator.userAgent.indexOf("MSIE")||window.navigator.appVersion.indexOf("Trident/")>-1)return!0}},{key:"isIE",value:function(){var t=window.navigator.userAgent,e=t.indexOf("MSIE ");if(e>0)return parseInt(t.substring(e+5,t.indexOf(".",e)),10);if(t.indexOf("Trident/")>0){var i=t.indexOf("rv:");return parseInt(t.substring(i+3,t.indexOf(".",i)),10)}var n=t.indexOf("Edge/");return n>0&&parseInt(t.substring(n+5,t.indexOf(".",n)),10)}}]),t}(),b=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w,this.setEasingFunctions()}return c(t,[{key:"setEasingFunctions",value:function(){var t;if(!this.w.globals.easing){switch(this.w.config.chart.animations.easing){case"linear":t="-";break;case"easein":t="<";break;case"easeout":t=">";break;case"easeinout":default:t="<>";break;case"swing":t=function(t){var e=1.70158;return(t-=1)*t*((e+1)*t+e)+1};break;case"bounce":t=function(t){return t<1/2.75?7.5625*t*t:t<2/2.75?7.5625*(t-=1.5/2.75)*t+.75:t<2.5/2.75?7.5625*(t-=2.25/2.75)*t+.9375:7.5625*(t-=2.625/2.75)*t+.984375};break;case"elastic":t=function(t){return t===!!t?t:Math.pow(2,-10*t)*Math.sin((t-.075)*(2*Math.PI)/.3)+1}}this.w.globals.easing=t}}},{key:"animateLine",value:function(t,e,i,n){t.attr(e).animate(n).attr(i)}},{key:"animateMarker",value:function(t,e,i,n,a,r){e||(e=0),t.attr({r:e,width:e,height:e}).animate(n,a).attr({r:i,width:i.width,height:i.height}).afterAll((function(){r()}))}},{key:"animateCircle",value:function(t,e,i,n,a){t.attr({r:e.r,cx:e.cx,cy:e.cy}).animate(n,a).attr({r:i.r,cx:i.cx,cy:i.cy})}},{key:"animateRect",value:function(t,e,i,n,a){t.attr(e).animate(n).attr(i).afterAll((function(){return a()}))}},{key:"animatePathsGradually",value:function(t){var e=t.el,i=t.realIndex,n=t.j,a=t.fill,r=t.pathFrom,s=t.pathTo,o=t.speed,l=t.delay,c=this.w,h=0;c.config.chart.animations.animateGradually.enabled&&(h=c.config.chart.animations.animateGradually.delay),c.config.chart.animations.dynamicAnimation.enabled&&c.globals.dataChanged&&"bar"!==c.config.chart.type&&(h=0),this.morphSVG(e,i,n,"line"!==c.config.chart.type||c.globals.comboCharts?a:"stroke",r,s,o,l*h)}},{key:"showDelayedElements",value:function(){this.w.globals.delayedElements.forEach((function(t){t.el.classList.remove("apexcharts-element-hidden")}))}},{key:"animationCompleted",value:function(t){var e=this.w;e.globals.animationEnded||(e.globals.animationEnded=!0,this.showDelayedElements(),"function"==typeof e.config.chart.events.animationEnd&&e.config.chart.events.animationEnd(this.ctx,{el:t,w:e}))}},{key:"morphSVG",value:function(t,e,i,n,a,r,s,o){var l=this,c=this.w;a||(a=t.attr("pathFrom")),r||(r=t.attr("pathTo"));var h=function(t){return"radar"===c.config.chart.type&&(s=1),"M 0 ".concat(c.globals.gridHeight)};(!a||a.indexOf("undefined")>-1||a.indexOf("NaN")>-1)&&(a=h()),(!r||r.indexOf("undefined")>-1||r.indexOf("NaN")>-1)&&(r=h()),c.globals.shouldAnimate||(s=1),t.plot(a).animate(1,c.globals.easing,o).plot(a).animate(s,c.globals.easing,o).plot(r).afterAll((function(){x.isNumber(i)?i===c.globals.series[c.globals.maxValsInArrayIndex].length-2&&c.globals.shouldAnimate&&l.animationCompleted(t):"none"!==n&&c.globals.shouldAnimate&&(!c.globals.comboCharts&&e===c.globals.series.length-1||c.globals.comboCharts)&&l.animationCompleted(t),l.showDelayedElements()}))}}]),t}(),y=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w}return c(t,[{key:"getDefaultFilter",value:function(t,e){var i=this.w;t.unfilter(!0),(new window.SVG.Filter).size("120%","180%","-5%","-40%"),"none"!==i.config.states.normal.filter?this.applyFilter(t,e,i.config.states.normal.filter.type,i.config.states.normal.filter.value):i.config.chart.dropShadow.enabled&&this.dropShadow(t,i.config.chart.dropShadow,e)}},{key:"addNormalFilter",value:function(t,e){var i=this.w;i.config.chart.dropShadow.enabled&&!t.node.classList.contains("apexcharts-marker")&&this.dropShadow(t,i.config.chart.dropShadow,e)}},{key:"addLightenFilter",value:function(t,e,i){var n=this,a=this.w,r=i.intensity;t.unfilter(!0),new window.SVG.Filter,t.filter((function(t){var i=a.config.chart.dropShadow;(i.enabled?n.addShadow(t,e,i):t).componentTransfer({rgb:{type:"linear",slope:1.5,intercept:r}})})),t.filterer.node.setAttribute("filterUnits","userSpaceOnUse"),this._scaleFilterSize(t.filterer.node)}},{key:"addDarkenFilter",value:function(t,e,i){var n=this,a=this.w,r=i.intensity;t.unfilter(!0),new window.SVG.Filter,t.filter((function(t){var i=a.config.chart.dropShadow;(i.enabled?n.addShadow(t,e,i):t).componentTransfer({rgb:{type:"linear",slope:r}})})),t.filterer.node.setAttribute("filterUnits","userSpaceOnUse"),this._scaleFilterSize(t.filterer.node)}},{key:"applyFilter",value:function(t,e,i){var n=arguments.length>3&&void 0!==arguments[3]?arguments[3]:.5;switch(i){case"none":this.addNormalFilter(t,e);break;case"lighten":this.addLightenFilter(t,e,{intensity:n});break;case"darken":this.addDarkenFilter(t,e,{intensity:n})}}},{key:"addShadow",value:function(t,e,i){var n=i.blur,a=i.top,r=i.left,s=i.color,o=i.opacity,l=t.flood(Array.isArray(s)?s[e]:s,o).composite(t.sourceAlpha,"in").offset(r,a).gaussianBlur(n).merge(t.source);return t.blend(t.source,l)}},{key:"dropShadow",value:function(t,e){var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0,n=e.top,a=e.left,r=e.blur,s=e.color,o=e.opacity,l=e.noUserSpaceOnUse,c=this.w;return t.unfilter(!0),x.isIE()&&"radialBar"===c.config.chart.type||(s=Array.isArray(s)?s[i]:s,t.filter((function(t){var e;e=x.isSafari()||x.isFirefox()||x.isIE()?t.flood(s,o).composite(t.sourceAlpha,"in").offset(a,n).gaussianBlur(r):t.flood(s,o).composite(t.sourceAlpha,"in").offset(a,n).gaussianBlur(r).merge(t.source),t.blend(t.source,e)})),l||t.filterer.node.setAttribute("filterUnits","userSpaceOnUse"),this._scaleFilterSize(t.filterer.node)),t}},{key:"setSelectionFilter",value:function(t,e,i){var n=this.w;if(void 0!==n.globals.selectedDataPoints[e]&&n.globals.selectedDataPoints[e].indexOf(i)>-1){t.node.setAttribute("selected",!0);var a=n.config.states.active.filter;"none"!==a&&this.applyFilter(t,e,a.type,a.value)}}},{key:"_scaleFilterSize",value:function(t){!function(e){for(var i in e)e.hasOwnProperty(i)&&t.setAttribute(i,e[i])}({width:"200%",height:"200%",x:"-50%",y:"-50%"})}}]),t}(),w=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w}return c(t,[{key:"drawLine",value:function(t,e,i,n){var a=arguments.length>4&&void 0!==arguments[4]?arguments[4]:"#a8a8a8",r=arguments.length>5&&void 0!==arguments[5]?arguments[5]:0,s=arguments.length>6&&void 0!==arguments[6]?arguments[6]:null,o=arguments.length>7&&void 0!==arguments[7]?arguments[7]:"butt",l=this.w,c=l.globals.dom.Paper.line().attr({x1:t,y1:e,x2:i,y2:n,stroke:a,"stroke-dasharray":r,"stroke-width":s,"stroke-linecap":o});return c}},{key:"drawRect",value:function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:0,e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0,i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0,n=arguments.length>3&&void 0!==arguments[3]?arguments[3]:0,a=arguments.length>4&&void 0!==arguments[4]?arguments[4]:0,r=arguments.length>5&&void 0!==arguments[5]?arguments[5]:"#fefefe",s=arguments.length>6&&void 0!==arguments[6]?arguments[6]:1,o=arguments.length>7&&void 0!==arguments[7]?arguments[7]:null,l=arguments.length>8&&void 0!==arguments[8]?arguments[8]:null,c=arguments.length>9&&void 0!==arguments[9]?arguments[9]:0,h=this.w,u=h.globals.dom.Paper.rect();return u.attr({x:t,y:e,width:i>0?i:0,height:n>0?n:0,rx:a,ry:a,opacity:s,"stroke-width":null!==o?o:0,stroke:null!==l?l:"none","stroke-dasharray":c}),u.node.setAttribute("fill",r),u}},{key:"drawPolygon",value:function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"#e1e1e1",i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:1,n=arguments.length>3&&void 0!==arguments[3]?arguments[3]:"none",a=this.w,r=a.globals.dom.Paper.polygon(t).attr({fill:n,stroke:e,"stroke-width":i});return r}},{key:"drawCircle",value:function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:null,i=this.w;t<0&&(t=0);var n=i.globals.dom.Paper.circle(2*t);return null!==e&&n.attr(e),n}},{key:"drawPath",value:function(t){var e=t.d,i=void 0===e?"":e,n=t.stroke,a=void 0===n?"#a8a8a8":n,r=t.strokeWidth,s=void 0===r?1:r,o=t.fill,l=t.fillOpacity,c=void 0===l?1:l,h=t.strokeOpacity,u=void 0===h?1:h,d=t.classes,f=t.strokeLinecap,g=void 0===f?null:f,p=t.strokeDashArray,m=void 0===p?0:p,v=this.w;return null===g&&(g=v.config.stroke.lineCap),(i.indexOf("undefined")>-1||i.indexOf("NaN")>-1)&&(i="M 0 ".concat(v.globals.gridHeight)),v.globals.dom.Paper.path(i).attr({fill:o,"fill-opacity":c,stroke:a,"stroke-opacity":u,"stroke-linecap":g,"stroke-width":s,"stroke-dasharray":m,class:d})}},{key:"group",value:function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:null,e=this.w,i=e.globals.dom.Paper.group();return null!==t&&i.attr(t),i}},{key:"move",value:function(t,e){return["M",t,e].join(" ")}},{key:"line",value:function(t,e){var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:null,n=null;return null===i?n=["L",t,e].join(" "):"H"===i?n=["H",t].join(" "):"V"===i&&(n=["V",e].join(" ")),n}},{key:"curve",value:function(t,e,i,n,a,r){return["C",t,e,i,n,a,r].join(" ")}},{key:"quadraticCurve",value:function(t,e,i,n){return["Q",t,e,i,n].join(" ")}},{key:"arc",value:function(t,e,i,n,a,r,s){var o=arguments.length>7&&void 0!==arguments[7]&&arguments[7],l="A";o&&(l="a");var c=[l,t,e,i,n,a,r,s].join(" ");return c}},{key:"renderPaths",value:function(t){var e,i=t.j,n=t.realIndex,a=t.pathFrom,s=t.pathTo,o=t.stroke,l=t.strokeWidth,c=t.strokeLinecap,h=t.fill,u=t.animationDelay,d=t.initialSpeed,f=t.dataChangeSpeed,g=t.className,p=t.shouldClipToGrid,m=void 0===p||p,v=t.bindEventsOnPaths,x=void 0===v||v,w=t.drawShadow,k=void 0===w||w,A=this.w,S=new y(this.ctx),_=new b(this.ctx),C=this.w.config.chart.animations.enabled,E=C&&this.w.config.chart.animations.dynamicAnimation.enabled,T=!!(C&&!A.globals.resized||E&&A.globals.dataChanged&&A.globals.shouldAnimate);T?e=a:(e=s,A.globals.animationEnded=!0);var P,M=A.config.stroke.dashArray;P=Array.isArray(M)?M[n]:A.config.stroke.dashArray;var L=this.drawPath({d:e,stroke:o,strokeWidth:l,fill:h,fillOpacity:1,classes:g,strokeLinecap:c,strokeDashArray:P});if(L.attr("index",n),m&&L.attr({"clip-path":"url(#gridRectMask".concat(A.globals.cuid,")")}),"none"!==A.config.states.normal.filter.type)S.getDefaultFilter(L,n);else if(A.config.chart.dropShadow.enabled&&k&&(!A.config.chart.dropShadow.enabledOnSeries||A.config.chart.dropShadow.enabledOnSeries&&-1!==A.config.chart.dropShadow.enabledOnSeries.indexOf(n))){var D=A.config.chart.dropShadow;S.dropShadow(L,D,n)}x&&(L.node.addEventListener("mouseenter",this.pathMouseEnter.bind(this,L)),L.node.addEventListener("mouseleave",this.pathMouseLeave.bind(this,L)),L.node.addEventListener("mousedown",this.pathMouseDown.bind(this,L))),L.attr({pathTo:s,pathFrom:a});var I={el:L,j:i,realIndex:n,pathFrom:a,pathTo:s,fill:h,strokeWidth:l,delay:u};return!C||A.globals.resized||A.globals.dataChanged?!A.globals.resized&&A.globals.dataChanged||_.showDelayedElements():_.animatePathsGradually(r(r({},I),{},{speed:d})),A.globals.dataChanged&&E&&T&&_.animatePathsGradually(r(r({},I),{},{speed:f})),L}},{key:"drawPattern",value:function(t,e,i){var n=arguments.length>3&&void 0!==arguments[3]?arguments[3]:"#a8a8a8",a=arguments.length>4&&void 0!==arguments[4]?arguments[4]:0,r=this.w,s=r.globals.dom.Paper.pattern(e,i,(function(r){"horizontalLines"===t?r.line(0,0,i,0).stroke({color:n,width:a+1}):"verticalLines"===t?r.line(0,0,0,e).stroke({color:n,width:a+1}):"slantedLines"===t?r.line(0,0,e,i).stroke({color:n,width:a}):"squares"===t?r.rect(e,i).fill("none").stroke({color:n,width:a}):"circles"===t&&r.circle(e).fill("none").stroke({color:n,width:a})}));return s}},{key:"drawGradient",value:function(t,e,i,n,a){var r,s=arguments.length>5&&void 0!==arguments[5]?arguments[5]:null,o=arguments.length>6&&void 0!==arguments[6]?arguments[6]:null,l=arguments.length>7&&void 0!==arguments[7]?arguments[7]:null,c=arguments.length>8&&void 0!==arguments[8]?arguments[8]:0,h=this.w;e.length<9&&0===e.indexOf("#")&&(e=x.hexToRgba(e,n)),i.length<9&&0===i.indexOf("#")&&(i=x.hexToRgba(i,a));var u=0,d=1,f=1,g=null;null!==o&&(u=void 0!==o[0]?o[0]/100:0,d=void 0!==o[1]?o[1]/100:1,f=void 0!==o[2]?o[2]/100:1,g=void 0!==o[3]?o[3]/100:null);var p=!("donut"!==h.config.chart.type&&"pie"!==h.config.chart.type&&"polarArea"!==h.config.chart.type&&"bubble"!==h.config.chart.type);if(r=null===l||0===l.length?h.globals.dom.Paper.gradient(p?"radial":"linear",(function(t){t.at(u,e,n),t.at(d,i,a),t.at(f,i,a),null!==g&&t.at(g,e,n)})):h.globals.dom.Paper.gradient(p?"radial":"linear",(function(t){(Array.isArray(l[c])?l[c]:l).forEach((function(e){t.at(e.offset/100,e.color,e.opacity)}))})),p){var m=h.globals.gridWidth/2,v=h.globals.gridHeight/2;"bubble"!==h.config.chart.type?r.attr({gradientUnits:"userSpaceOnUse",cx:m,cy:v,r:s}):r.attr({cx:.5,cy:.5,r:.8,fx:.2,fy:.2})}else"vertical"===t?r.from(0,0).to(0,1):"diagonal"===t?r.from(0,0).to(1,1):"horizontal"===t?r.from(0,1).to(1,1):"diagonal2"===t&&r.from(1,0).to(0,1);return r}},{key:"drawText",value:function(t){var e,i=t.x,n=t.y,a=t.text,r=t.textAnchor,s=t.fontSize,o=t.fontFamily,l=t.fontWeight,c=t.foreColor,h=t.opacity,u=t.cssClass,d=void 0===u?"":u,f=t.isPlainText,g=void 0===f||f,p=this.w;return void 0===a&&(a=""),r||(r="start"),c&&c.length||(c=p.config.chart.foreColor),o=o||p.config.chart.fontFamily,l=l||"regular",(e=Array.isArray(a)?p.globals.dom.Paper.text((function(t){for(var e=0;e<a.length;e++)0===e?t.tspan(a[e]):t.tspan(a[e]).newLine()})):g?p.globals.dom.Paper.plain(a):p.globals.dom.Paper.text((function(t){return t.tspan(a)}))).attr({x:i,y:n,"text-anchor":r,"dominant-baseline":"auto","font-size":s,"font-family":o,"font-weight":l,fill:c,class:"apexcharts-text "+d}),e.node.style.fontFamily=o,e.node.style.opacity=h,e}},{key:"drawMarker",value:function(t,e,i){t=t||0;var n=i.pSize||0,a=null;if("square"===i.shape||"rect"===i.shape){var r=void 0===i.pRadius?n/2:i.pRadius;null!==e&&n||(n=0,r=0);var s=1.2*n+r,o=this.drawRect(s,s,s,s,r);o.attr({x:t-s/2,y:e-s/2,cx:t,cy:e,class:i.class?i.class:"",fill:i.pointFillColor,"fill-opacity":i.pointFillOpacity?i.pointFillOpacity:1,stroke:i.pointStrokeColor,"stroke-width":i.pointStrokeWidth?i.pointStrokeWidth:0,"stroke-opacity":i.pointStrokeOpacity?i.pointStrokeOpacity:1}),a=o}else"circle"!==i.shape&&i.shape||(x.isNumber(e)||(n=0,e=0),a=this.drawCircle(n,{cx:t,cy:e,class:i.class?i.class:"",stroke:i.pointStrokeColor,fill:i.pointFillColor,"fill-opacity":i.pointFillOpacity?i.pointFillOpacity:1,"stroke-width":i.pointStrokeWidth?i.pointStrokeWidth:0,"stroke-opacity":i.pointStrokeOpacity?i.pointStrokeOpacity:1}));return a}},{key:"pathMouseEnter",value:function(t,e){var i=this.w,n=new y(this.ctx),a=parseInt(t.node.getAttribute("index"),10),r=parseInt(t.node.getAttribute("j"),10);if("function"==typeof i.config.chart.events.dataPointMouseEnter&&i.config.chart.events.dataPointMouseEnter(e,this.ctx,{seriesIndex:a,dataPointIndex:r,w:i}),this.ctx.events.fireEvent("dataPointMouseEnter",[e,this.ctx,{seriesIndex:a,dataPointIndex:r,w:i}]),("none"===i.config.states.active.filter.type||"true"!==t.node.getAttribute("selected"))&&"none"!==i.config.states.hover.filter.type&&!i.globals.isTouchDevice){var s=i.config.states.hover.filter;n.applyFilter(t,a,s.type,s.value)}}},{key:"pathMouseLeave",value:function(t,e){var i=this.w,n=new y(this.ctx),a=parseInt(t.node.getAttribute("index"),10),r=parseInt(t.node.getAttribute("j"),10);"function"==typeof i.config.chart.events.dataPointMouseLeave&&i.config.chart.events.dataPointMouseLeave(e,this.ctx,{seriesIndex:a,dataPointIndex:r,w:i}),this.ctx.events.fireEvent("dataPointMouseLeave",[e,this.ctx,{seriesIndex:a,dataPointIndex:r,w:i}]),"none"!==i.config.states.active.filter.type&&"true"===t.node.getAttribute("selected")||"none"!==i.config.states.hover.filter.type&&n.getDefaultFilter(t,a)}},{key:"pathMouseDown",value:function(t,e){var i=this.w,n=new y(this.ctx),a=parseInt(t.node.getAttribute("index"),10),r=parseInt(t.node.getAttribute("j"),10),s="false";if("true"===t.node.getAttribute("selected")){if(t.node.setAttribute("selected","false"),i.globals.selectedDataPoints[a].indexOf(r)>-1){var o=i.globals.selectedDataPoints[a].indexOf(r);i.globals.selectedDataPoints[a].splice(o,1)}}else{if(!i.config.states.active.allowMultipleDataPointsSelection&&i.globals.selectedDataPoints.length>0){i.globals.selectedDataPoints=[];var l=i.globals.dom.Paper.select(".apexcharts-series path").members,c=i.globals.dom.Paper.select(".apexcharts-series circle, .apexcharts-series rect").members,h=function(t){Array.prototype.forEach.call(t,(function(t){t.node.setAttribute("selected","false"),n.getDefaultFilter(t,a)}))};h(l),h(c)}t.node.setAttribute("selected","true"),s="true",void 0===i.globals.selectedDataPoints[a]&&(i.globals.selectedDataPoints[a]=[]),i.globals.selectedDataPoints[a].push(r)}if("true"===s){var u=i.config.states.active.filter;"none"!==u&&n.applyFilter(t,a,u.type,u.value)}else"none"!==i.config.states.active.filter.type&&n.getDefaultFilter(t,a);"function"==typeof i.config.chart.events.dataPointSelection&&i.config.chart.events.dataPointSelection(e,this.ctx,{selectedDataPoints:i.globals.selectedDataPoints,seriesIndex:a,dataPointIndex:r,w:i}),e&&this.ctx.events.fireEvent("dataPointSelection",[e,this.ctx,{selectedDataPoints:i.globals.selectedDataPoints,seriesIndex:a,dataPointIndex:r,w:i}])}},{key:"rotateAroundCenter",value:function(t){var e={};return t&&"function"==typeof t.getBBox&&(e=t.getBBox()),{x:e.x+e.width/2,y:e.y+e.height/2}}},{key:"getTextRects",value:function(t,e,i,n){var a=!(arguments.length>4&&void 0!==arguments[4])||arguments[4],r=this.w,s=this.drawText({x:-200,y:-200,text:t,textAnchor:"start",fontSize:e,fontFamily:i,foreColor:"#fff",opacity:0});n&&s.attr("transform",n),r.globals.dom.Paper.add(s);var o=s.bbox();return a||(o=s.node.getBoundingClientRect()),s.remove(),{width:o.width,height:o.height}}},{key:"placeTextWithEllipsis",value:function(t,e,i){if("function"==typeof t.getComputedTextLength&&(t.textContent=e,e.length>0&&t.getComputedTextLength()>=i/1.1)){for(var n=e.length-3;n>0;n-=3)if(t.getSubStringLength(0,n)<=i/1.1)return void(t.textContent=e.substring(0,n)+"...");t.textContent="."}}}],[{key:"setAttrs",value:function(t,e){for(var i in e)e.hasOwnProperty(i)&&t.setAttribute(i,e[i])}}]),t}(),k=function(){function t(e){o(this,t),this.w=e.w,this.annoCtx=e}return c(t,[{key:"setOrientations",value:function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:null,i=this.w;if("vertical"===t.label.orientation){var n=null!==e?e:0,a=i.globals.dom.baseEl.querySelector(".apexcharts-xaxis-annotations .apexcharts-xaxis-annotation-label[rel='".concat(n,"']"));if(null!==a){var r=a.getBoundingClientRect();a.setAttribute("x",parseFloat(a.getAttribute("x"))-r.height+4),"top"===t.label.position?a.setAttribute("y",parseFloat(a.getAttribute("y"))+r.width):a.setAttribute("y",parseFloat(a.getAttribute("y"))-r.width);var s=this.annoCtx.graphics.rotateAroundCenter(a),o=s.x,l=s.y;a.setAttribute("transform","rotate(-90 ".concat(o," ").concat(l,")"))}}}},{key:"addBackgroundToAnno",value:function(t,e){var i=this.w;if(!t||void 0===e.label.text||void 0!==e.label.text&&!String(e.label.text).trim())return null;var n=i.globals.dom.baseEl.querySelector(".apexcharts-grid").getBoundingClientRect(),a=t.getBoundingClientRect(),r=e.label.style.padding.left,s=e.label.style.padding.right,o=e.label.style.padding.top,l=e.label.style.padding.bottom;"vertical"===e.label.orientation&&(o=e.label.style.padding.left,l=e.label.style.padding.right,r=e.label.style.padding.top,s=e.label.style.padding.bottom);var c=a.left-n.left-r,h=a.top-n.top-o,u=this.annoCtx.graphics.drawRect(c-i.globals.barPadForNumericAxis,h,a.width+r+s,a.height+o+l,e.label.borderRadius,e.label.style.background,1,e.label.borderWidth,e.label.borderColor,0);return e.id&&u.node.classList.add(x.escapeString(e.id)),u}},{key:"annotationsBackground",value:function(){var t=this,e=this.w,i=function(i,n,a){var r=e.globals.dom.baseEl.querySelector(".apexcharts-".concat(a,"-annotations .apexcharts-").concat(a,"-annotation-label[rel='").concat(n,"']"));if(r){var s=r.parentNode,o=t.addBackgroundToAnno(r,i);o&&(s.insertBefore(o.node,r),i.label.mouseEnter&&o.node.addEventListener("mouseenter",i.label.mouseEnter.bind(t,i)),i.label.mouseLeave&&o.node.addEventListener("mouseleave",i.label.mouseLeave.bind(t,i)))}};e.config.annotations.xaxis.map((function(t,e){i(t,e,"xaxis")})),e.config.annotations.yaxis.map((function(t,e){i(t,e,"yaxis")})),e.config.annotations.points.map((function(t,e){i(t,e,"point")}))}},{key:"getStringX",value:function(t){var e=this.w,i=t;e.config.xaxis.convertedCatToNumeric&&e.globals.categoryLabels.length&&(t=e.globals.categoryLabels.indexOf(t)+1);var n=e.globals.labels.indexOf(t),a=e.globals.dom.baseEl.querySelector(".apexcharts-xaxis-texts-g text:nth-child("+(n+1)+")");return a&&(i=parseFloat(a.getAttribute("x"))),i}}]),t}(),A=function(){function t(e){o(this,t),this.w=e.w,this.annoCtx=e,this.invertAxis=this.annoCtx.invertAxis}return c(t,[{key:"addXaxisAnnotation",value:function(t,e,i){var n=this.w,a=this.invertAxis?n.globals.minY:n.globals.minX,r=this.invertAxis?n.globals.maxY:n.globals.maxX,s=this.invertAxis?n.globals.yRange[0]:n.globals.xRange,o=(t.x-a)/(s/n.globals.gridWidth);this.annoCtx.inversedReversedAxis&&(o=(r-t.x)/(s/n.globals.gridWidth));var l=t.label.text;"category"!==n.config.xaxis.type&&!n.config.xaxis.convertedCatToNumeric||this.invertAxis||n.globals.dataFormatXNumeric||(o=this.annoCtx.helpers.getStringX(t.x));var c=t.strokeDashArray;if(x.isNumber(o)){if(null===t.x2||void 0===t.x2){var h=this.annoCtx.graphics.drawLine(o+t.offsetX,0+t.offsetY,o+t.offsetX,n.globals.gridHeight+t.offsetY,t.borderColor,c,t.borderWidth);e.appendChild(h.node),t.id&&h.node.classList.add(t.id)}else{var u=(t.x2-a)/(s/n.globals.gridWidth);if(this.annoCtx.inversedReversedAxis&&(u=(r-t.x2)/(s/n.globals.gridWidth)),"category"!==n.config.xaxis.type&&!n.config.xaxis.convertedCatToNumeric||this.invertAxis||n.globals.dataFormatXNumeric||(u=this.annoCtx.helpers.getStringX(t.x2)),u<o){var d=o;o=u,u=d}var f=this.annoCtx.graphics.drawRect(o+t.offsetX,0+t.offsetY,u-o,n.globals.gridHeight+t.offsetY,0,t.fillColor,t.opacity,1,t.borderColor,c);f.node.classList.add("apexcharts-annotation-rect"),f.attr("clip-path","url(#gridRectMask".concat(n.globals.cuid,")")),e.appendChild(f.node),t.id&&f.node.classList.add(t.id)}var g="top"===t.label.position?4:n.globals.gridHeight,p=this.annoCtx.graphics.getTextRects(l,parseFloat(t.label.style.fontSize)),m=this.annoCtx.graphics.drawText({x:o+t.label.offsetX,y:g+t.label.offsetY-("vertical"===t.label.orientation?"top"===t.label.position?p.width/2-12:-p.width/2:0),text:l,textAnchor:t.label.textAnchor,fontSize:t.label.style.fontSize,fontFamily:t.label.style.fontFamily,fontWeight:t.label.style.fontWeight,foreColor:t.label.style.color,cssClass:"apexcharts-xaxis-annotation-label ".concat(t.label.style.cssClass," ").concat(t.id?t.id:"")});m.attr({rel:i}),e.appendChild(m.node),this.annoCtx.helpers.setOrientations(t,i)}}},{key:"drawXAxisAnnotations",value:function(){var t=this,e=this.w,i=this.annoCtx.graphics.group({class:"apexcharts-xaxis-annotations"});return e.config.annotations.xaxis.map((function(e,n){t.addXaxisAnnotation(e,i.node,n)})),i}}]),t}(),S=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w}return c(t,[{key:"getStackedSeriesTotals",value:function(){var t=this.w,e=[];if(0===t.globals.series.length)return e;for(var i=0;i<t.globals.series[t.globals.maxValsInArrayIndex].length;i++){for(var n=0,a=0;a<t.globals.series.length;a++)void 0!==t.globals.series[a][i]&&(n+=t.globals.series[a][i]);e.push(n)}return t.globals.stackedSeriesTotals=e,e}},{key:"getSeriesTotalByIndex",value:function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:null;return null===t?this.w.config.series.reduce((function(t,e){return t+e}),0):this.w.globals.series[t].reduce((function(t,e){return t+e}),0)}},{key:"isSeriesNull",value:function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:null;return 0===(null===t?this.w.config.series.filter((function(t){return null!==t})):this.w.config.series[t].data.filter((function(t){return null!==t}))).length}},{key:"seriesHaveSameValues",value:function(t){return this.w.globals.series[t].every((function(t,e,i){return t===i[0]}))}},{key:"getCategoryLabels",value:function(t){var e=this.w,i=t.slice();return e.config.xaxis.convertedCatToNumeric&&(i=t.map((function(t,i){return e.config.xaxis.labels.formatter(t-e.globals.minX+1)}))),i}},{key:"getLargestSeries",value:function(){var t=this.w;t.globals.maxValsInArrayIndex=t.globals.series.map((function(t){return t.length})).indexOf(Math.max.apply(Math,t.globals.series.map((function(t){return t.length}))))}},{key:"getLargestMarkerSize",value:function(){var t=this.w,e=0;return t.globals.markers.size.forEach((function(t){e=Math.max(e,t)})),t.globals.markers.largestSize=e,e}},{key:"getSeriesTotals",value:function(){var t=this.w;t.globals.seriesTotals=t.globals.series.map((function(t,e){var i=0;if(Array.isArray(t))for(var n=0;n<t.length;n++)i+=t[n];else i+=t;return i}))}},{key:"getSeriesTotalsXRange",value:function(t,e){var i=this.w;return i.globals.series.map((function(n,a){for(var r=0,s=0;s<n.length;s++)i.globals.seriesX[a][s]>t&&i.globals.seriesX[a][s]<e&&(r+=n[s]);return r}))}},{key:"getPercentSeries",value:function(){var t=this.w;t.globals.seriesPercent=t.globals.series.map((function(e,i){var n=[];if(Array.isArray(e))for(var a=0;a<e.length;a++){var r=t.globals.stackedSeriesTotals[a],s=0;r&&(s=100*e[a]/r),n.push(s)}else{var o=100*e/t.globals.seriesTotals.reduce((function(t,e){return t+e}),0);n.push(o)}return n}))}},{key:"getCalculatedRatios",value:function(){var t,e,i,n,a=this.w.globals,r=[],s=0,o=[],l=.1,c=0;if(a.yRange=[],a.isMultipleYAxis)for(var h=0;h<a.minYArr.length;h++)a.yRange.push(Math.abs(a.minYArr[h]-a.maxYArr[h])),o.push(0);else a.yRange.push(Math.abs(a.minY-a.maxY));a.xRange=Math.abs(a.maxX-a.minX),a.zRange=Math.abs(a.maxZ-a.minZ);for(var u=0;u<a.yRange.length;u++)r.push(a.yRange[u]/a.gridHeight);if(e=a.xRange/a.gridWidth,i=Math.abs(a.initialMaxX-a.initialMinX)/a.gridWidth,t=a.yRange/a.gridWidth,n=a.xRange/a.gridHeight,(s=a.zRange/a.gridHeight*16)||(s=1),a.minY!==Number.MIN_VALUE&&0!==Math.abs(a.minY)&&(a.hasNegs=!0),a.isMultipleYAxis){o=[];for(var d=0;d<r.length;d++)o.push(-a.minYArr[d]/r[d])}else o.push(-a.minY/r[0]),a.minY!==Number.MIN_VALUE&&0!==Math.abs(a.minY)&&(l=-a.minY/t,c=a.minX/e);return{yRatio:r,invertedYRatio:t,zRatio:s,xRatio:e,initialXRatio:i,invertedXRatio:n,baseLineInvertedY:l,baseLineY:o,baseLineX:c}}},{key:"getLogSeries",value:function(t){var e=this,i=this.w;return i.globals.seriesLog=t.map((function(t,n){return i.config.yaxis[n]&&i.config.yaxis[n].logarithmic?t.map((function(t){return null===t?null:e.getLogVal(t,n)})):t})),i.globals.invalidLogScale?t:i.globals.seriesLog}},{key:"getLogVal",value:function(t,e){var i=this.w,n=(Math.log(t)-Math.log(i.globals.minYArr[e]))/(Math.log(i.globals.maxYArr[e])-Math.log(i.globals.minYArr[e]));return isNaN(n)?t:n}},{key:"getLogYRatios",value:function(t){var e=this,i=this.w,n=this.w.globals;return n.yLogRatio=t.slice(),n.logYRange=n.yRange.map((function(t,a){if(i.config.yaxis[a]&&e.w.config.yaxis[a].logarithmic){var r,s=-Number.MAX_VALUE,o=Number.MIN_VALUE;return n.seriesLog.forEach((function(t,e){t.forEach((function(t){i.config.yaxis[e]&&i.config.yaxis[e].logarithmic&&(s=Math.max(t,s),o=Math.min(t,o))}))})),r=Math.pow(n.yRange[a],Math.abs(o-s)/n.yRange[a]),n.yLogRatio[a]=r/n.gridHeight,r}})),n.invalidLogScale?t.slice():n.yLogRatio}}],[{key:"checkComboSeries",value:function(t){var e=!1,i=0,n=0;return t.length&&void 0!==t[0].type&&t.forEach((function(t){"bar"!==t.type&&"column"!==t.type&&"candlestick"!==t.type&&"boxPlot"!==t.type||i++,void 0!==t.type&&n++})),n>0&&(e=!0),{comboBarCount:i,comboCharts:e}}},{key:"extendArrayProps",value:function(t,e,i){return e.yaxis&&(e=t.extendYAxis(e,i)),e.annotations&&(e.annotations.yaxis&&(e=t.extendYAxisAnnotations(e)),e.annotations.xaxis&&(e=t.extendXAxisAnnotations(e)),e.annotations.points&&(e=t.extendPointAnnotations(e))),e}}]),t}(),_=function(){function t(e){o(this,t),this.w=e.w,this.annoCtx=e}return c(t,[{key:"addYaxisAnnotation",value:function(t,e,i){var n,a=this.w,r=t.strokeDashArray,s=this._getY1Y2("y1",t),o=t.label.text;if(null===t.y2||void 0===t.y2){var l=this.annoCtx.graphics.drawLine(0+t.offsetX,s+t.offsetY,this._getYAxisAnnotationWidth(t),s+t.offsetY,t.borderColor,r,t.borderWidth);e.appendChild(l.node),t.id&&l.node.classList.add(t.id)}else{if((n=this._getY1Y2("y2",t))>s){var c=s;s=n,n=c}var h=this.annoCtx.graphics.drawRect(0+t.offsetX,n+t.offsetY,this._getYAxisAnnotationWidth(t),s-n,0,t.fillColor,t.opacity,1,t.borderColor,r);h.node.classList.add("apexcharts-annotation-rect"),h.attr("clip-path","url(#gridRectMask".concat(a.globals.cuid,")")),e.appendChild(h.node),t.id&&h.node.classList.add(t.id)}var u="right"===t.label.position?a.globals.gridWidth:0,d=this.annoCtx.graphics.drawText({x:u+t.label.offsetX,y:(null!=n?n:s)+t.label.offsetY-3,text:o,textAnchor:t.label.textAnchor,fontSize:t.label.style.fontSize,fontFamily:t.label.style.fontFamily,fontWeight:t.label.style.fontWeight,foreColor:t.label.style.color,cssClass:"apexcharts-yaxis-annotation-label ".concat(t.label.style.cssClass," ").concat(t.id?t.id:"")});d.attr({rel:i}),e.appendChild(d.node)}},{key:"_getY1Y2",value:function(t,e){var i,n="y1"===t?e.y:e.y2,a=this.w;if(this.annoCtx.invertAxis){var r=a.globals.labels.indexOf(n);a.config.xaxis.convertedCatToNumeric&&(r=a.globals.categoryLabels.indexOf(n));var s=a.globals.dom.baseEl.querySelector(".apexcharts-yaxis-texts-g text:nth-child("+(r+1)+")");s&&(i=parseFloat(s.getAttribute("y")))}else{var o;o=a.config.yaxis[e.yAxisIndex].logarithmic?(n=new S(this.annoCtx.ctx).getLogVal(n,e.yAxisIndex))/a.globals.yLogRatio[e.yAxisIndex]:(n-a.globals.minYArr[e.yAxisIndex])/(a.globals.yRange[e.yAxisIndex]/a.globals.gridHeight),i=a.globals.gridHeight-o,a.config.yaxis[e.yAxisIndex]&&a.config.yaxis[e.yAxisIndex].reversed&&(i=o)}return i}},{key:"_getYAxisAnnotationWidth",value:function(t){var e=this.w;return e.globals.gridWidth,(t.width.indexOf("%")>-1?e.globals.gridWidth*parseInt(t.width,10)/100:parseInt(t.width,10))+t.offsetX}},{key:"drawYAxisAnnotations",value:function(){var t=this,e=this.w,i=this.annoCtx.graphics.group({class:"apexcharts-yaxis-annotations"});return e.config.annotations.yaxis.map((function(e,n){t.addYaxisAnnotation(e,i.node,n)})),i}}]),t}(),C=function(){function t(e){o(this,t),this.w=e.w,this.annoCtx=e}return c(t,[{key:"addPointAnnotation",value:function(t,e,i){var n=this.w,a=0,r=0,s=0;this.annoCtx.invertAxis&&console.warn("Point annotation is not supported in horizontal bar charts.");var o=parseFloat(t.y);if("string"==typeof t.x||"category"===n.config.xaxis.type||n.config.xaxis.convertedCatToNumeric){var l=n.globals.labels.indexOf(t.x);n.config.xaxis.convertedCatToNumeric&&(l=n.globals.categoryLabels.indexOf(t.x)),a=this.annoCtx.helpers.getStringX(t.x),null===t.y&&(o=n.globals.series[t.seriesIndex][l])}else a=(t.x-n.globals.minX)/(n.globals.xRange/n.globals.gridWidth);for(var c,h=[],u=0,d=0;d<=t.seriesIndex;d++){var f=n.config.yaxis[d].seriesName;if(f)for(var g=d+1;g<=t.seriesIndex;g++)n.config.yaxis[g].seriesName===f&&-1===h.indexOf(f)&&(u++,h.push(f))}if(n.config.yaxis[t.yAxisIndex].logarithmic)c=(o=new S(this.annoCtx.ctx).getLogVal(o,t.yAxisIndex))/n.globals.yLogRatio[t.yAxisIndex];else{var p=t.yAxisIndex+u;c=(o-n.globals.minYArr[p])/(n.globals.yRange[p]/n.globals.gridHeight)}if(r=n.globals.gridHeight-c-parseFloat(t.label.style.fontSize)-t.marker.size,s=n.globals.gridHeight-c,n.config.yaxis[t.yAxisIndex]&&n.config.yaxis[t.yAxisIndex].reversed&&(r=c+parseFloat(t.label.style.fontSize)+t.marker.size,s=c),x.isNumber(a)){var m={pSize:t.marker.size,pointStrokeWidth:t.marker.strokeWidth,pointFillColor:t.marker.fillColor,pointStrokeColor:t.marker.strokeColor,shape:t.marker.shape,pRadius:t.marker.radius,class:"apexcharts-point-annotation-marker ".concat(t.marker.cssClass," ").concat(t.id?t.id:"")},v=this.annoCtx.graphics.drawMarker(a+t.marker.offsetX,s+t.marker.offsetY,m);e.appendChild(v.node);var b=t.label.text?t.label.text:"",y=this.annoCtx.graphics.drawText({x:a+t.label.offsetX,y:r+t.label.offsetY,text:b,textAnchor:t.label.textAnchor,fontSize:t.label.style.fontSize,fontFamily:t.label.style.fontFamily,fontWeight:t.label.style.fontWeight,foreColor:t.label.style.color,cssClass:"apexcharts-point-annotation-label ".concat(t.label.style.cssClass," ").concat(t.id?t.id:"")});if(y.attr({rel:i}),e.appendChild(y.node),t.customSVG.SVG){var w=this.annoCtx.graphics.group({class:"apexcharts-point-annotations-custom-svg "+t.customSVG.cssClass});w.attr({transform:"translate(".concat(a+t.customSVG.offsetX,", ").concat(r+t.customSVG.offsetY,")")}),w.node.innerHTML=t.customSVG.SVG,e.appendChild(w.node)}if(t.image.path){var k=t.image.width?t.image.width:20,A=t.image.height?t.image.height:20;v=this.annoCtx.addImage({x:a+t.image.offsetX-k/2,y:r+t.image.offsetY-A/2,width:k,height:A,path:t.image.path,appendTo:".apexcharts-point-annotations"})}t.mouseEnter&&v.node.addEventListener("mouseenter",t.mouseEnter.bind(this,t)),t.mouseLeave&&v.node.addEventListener("mouseleave",t.mouseLeave.bind(this,t))}}},{key:"drawPointAnnotations",value:function(){var t=this,e=this.w,i=this.annoCtx.graphics.group({class:"apexcharts-point-annotations"});return e.config.annotations.points.map((function(e,n){t.addPointAnnotation(e,i.node,n)})),i}}]),t}(),E={name:"en",options:{months:["January","February","March","April","May","June","July","August","September","October","November","December"],shortMonths:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],days:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],shortDays:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],toolbar:{exportToSVG:"Download SVG",exportToPNG:"Download PNG",exportToCSV:"Download CSV",menu:"Menu",selection:"Selection",selectionZoom:"Selection Zoom",zoomIn:"Zoom In",zoomOut:"Zoom Out",pan:"Panning",reset:"Reset Zoom"}}},T=function(){function t(){o(this,t),this.yAxis={show:!0,showAlways:!1,showForNullSeries:!0,seriesName:void 0,opposite:!1,reversed:!1,logarithmic:!1,logBase:10,tickAmount:void 0,forceNiceScale:!1,max:void 0,min:void 0,floating:!1,decimalsInFloat:void 0,labels:{show:!0,minWidth:0,maxWidth:160,offsetX:0,offsetY:0,align:void 0,rotate:0,padding:20,style:{colors:[],fontSize:"11px",fontWeight:400,fontFamily:void 0,cssClass:""},formatter:void 0},axisBorder:{show:!1,color:"#e0e0e0",width:1,offsetX:0,offsetY:0},axisTicks:{show:!1,color:"#e0e0e0",width:6,offsetX:0,offsetY:0},title:{text:void 0,rotate:-90,offsetY:0,offsetX:0,style:{color:void 0,fontSize:"11px",fontWeight:900,fontFamily:void 0,cssClass:""}},tooltip:{enabled:!1,offsetX:0},crosshairs:{show:!0,position:"front",stroke:{color:"#b6b6b6",width:1,dashArray:0}}},this.pointAnnotation={id:void 0,x:0,y:null,yAxisIndex:0,seriesIndex:0,mouseEnter:void 0,mouseLeave:void 0,marker:{size:4,fillColor:"#fff",strokeWidth:2,strokeColor:"#333",shape:"circle",offsetX:0,offsetY:0,radius:2,cssClass:""},label:{borderColor:"#c2c2c2",borderWidth:1,borderRadius:2,text:void 0,textAnchor:"middle",offsetX:0,offsetY:0,mouseEnter:void 0,mouseLeave:void 0,style:{background:"#fff",color:void 0,fontSize:"11px",fontFamily:void 0,fontWeight:400,cssClass:"",padding:{left:5,right:5,top:2,bottom:2}}},customSVG:{SVG:void 0,cssClass:void 0,offsetX:0,offsetY:0},image:{path:void 0,width:20,height:20,offsetX:0,offsetY:0}},this.yAxisAnnotation={id:void 0,y:0,y2:null,strokeDashArray:1,fillColor:"#c2c2c2",borderColor:"#c2c2c2",borderWidth:1,opacity:.3,offsetX:0,offsetY:0,width:"100%",yAxisIndex:0,label:{borderColor:"#c2c2c2",borderWidth:1,borderRadius:2,text:void 0,textAnchor:"end",position:"right",offsetX:0,offsetY:-3,mouseEnter:void 0,mouseLeave:void 0,style:{background:"#fff",color:void 0,fontSize:"11px",fontFamily:void 0,fontWeight:400,cssClass:"",padding:{left:5,right:5,top:2,bottom:2}}}},this.xAxisAnnotation={id:void 0,x:0,x2:null,strokeDashArray:1,fillColor:"#c2c2c2",borderColor:"#c2c2c2",borderWidth:1,opacity:.3,offsetX:0,offsetY:0,label:{borderColor:"#c2c2c2",borderWidth:1,borderRadius:2,text:void 0,textAnchor:"middle",orientation:"vertical",position:"top",offsetX:0,offsetY:0,mouseEnter:void 0,mouseLeave:void 0,style:{background:"#fff",color:void 0,fontSize:"11px",fontFamily:void 0,fontWeight:400,cssClass:"",padding:{left:5,right:5,top:2,bottom:2}}}},this.text={x:0,y:0,text:"",textAnchor:"start",foreColor:void 0,fontSize:"13px",fontFamily:void 0,fontWeight:400,appendTo:".apexcharts-annotations",backgroundColor:"transparent",borderColor:"#c2c2c2",borderRadius:0,borderWidth:0,paddingLeft:4,paddingRight:4,paddingTop:2,paddingBottom:2}}return c(t,[{key:"init",value:function(){return{annotations:{position:"front",yaxis:[this.yAxisAnnotation],xaxis:[this.xAxisAnnotation],points:[this.pointAnnotation],texts:[],images:[],shapes:[]},chart:{animations:{enabled:!0,easing:"easeinout",speed:800,animateGradually:{delay:150,enabled:!0},dynamicAnimation:{enabled:!0,speed:350}},background:"transparent",locales:[E],defaultLocale:"en",dropShadow:{enabled:!1,enabledOnSeries:void 0,top:2,left:2,blur:4,color:"#000",opacity:.35},events:{animationEnd:void 0,beforeMount:void 0,mounted:void 0,updated:void 0,click:void 0,mouseMove:void 0,mouseLeave:void 0,legendClick:void 0,markerClick:void 0,selection:void 0,dataPointSelection:void 0,dataPointMouseEnter:void 0,dataPointMouseLeave:void 0,beforeZoom:void 0,beforeResetZoom:void 0,zoomed:void 0,scrolled:void 0,brushScrolled:void 0},foreColor:"#373d3f",fontFamily:"Helvetica, Arial, sans-serif",height:"auto",parentHeightOffset:15,redrawOnParentResize:!0,redrawOnWindowResize:!0,id:void 0,group:void 0,offsetX:0,offsetY:0,selection:{enabled:!1,type:"x",fill:{color:"#24292e",opacity:.1},stroke:{width:1,color:"#24292e",opacity:.4,dashArray:3},xaxis:{min:void 0,max:void 0},yaxis:{min:void 0,max:void 0}},sparkline:{enabled:!1},brush:{enabled:!1,autoScaleYaxis:!0,target:void 0},stacked:!1,stackType:"normal",toolbar:{show:!0,offsetX:0,offsetY:0,tools:{download:!0,selection:!0,zoom:!0,zoomin:!0,zoomout:!0,pan:!0,reset:!0,customIcons:[]},export:{csv:{filename:void 0,columnDelimiter:",",headerCategory:"category",headerValue:"value",dateFormatter:function(t){return new Date(t).toDateString()}},png:{filename:void 0},svg:{filename:void 0}},autoSelected:"zoom"},type:"line",width:"100%",zoom:{enabled:!0,type:"x",autoScaleYaxis:!1,zoomedArea:{fill:{color:"#90CAF9",opacity:.4},stroke:{color:"#0D47A1",opacity:.4,width:1}}}},plotOptions:{area:{fillTo:"origin"},bar:{horizontal:!1,columnWidth:"70%",barHeight:"70%",distributed:!1,borderRadius:0,rangeBarOverlap:!0,rangeBarGroupRows:!1,colors:{ranges:[],backgroundBarColors:[],backgroundBarOpacity:1,backgroundBarRadius:0},dataLabels:{position:"top",maxItems:100,hideOverflowingLabels:!0,orientation:"horizontal"}},bubble:{minBubbleRadius:void 0,maxBubbleRadius:void 0},candlestick:{colors:{upward:"#00B746",downward:"#EF403C"},wick:{useFillColor:!0}},boxPlot:{colors:{upper:"#00E396",lower:"#008FFB"}},heatmap:{radius:2,enableShades:!0,shadeIntensity:.5,reverseNegativeShade:!1,distributed:!1,useFillColorAsStroke:!1,colorScale:{inverse:!1,ranges:[],min:void 0,max:void 0}},treemap:{enableShades:!0,shadeIntensity:.5,distributed:!1,reverseNegativeShade:!1,useFillColorAsStroke:!1,colorScale:{inverse:!1,ranges:[],min:void 0,max:void 0}},radialBar:{inverseOrder:!1,startAngle:0,endAngle:360,offsetX:0,offsetY:0,hollow:{margin:5,size:"50%",background:"transparent",image:void 0,imageWidth:150,imageHeight:150,imageOffsetX:0,imageOffsetY:0,imageClipped:!0,position:"front",dropShadow:{enabled:!1,top:0,left:0,blur:3,color:"#000",opacity:.5}},track:{show:!0,startAngle:void 0,endAngle:void 0,background:"#f2f2f2",strokeWidth:"97%",opacity:1,margin:5,dropShadow:{enabled:!1,top:0,left:0,blur:3,color:"#000",opacity:.5}},dataLabels:{show:!0,name:{show:!0,fontSize:"16px",fontFamily:void 0,fontWeight:600,color:void 0,offsetY:0,formatter:function(t){return t}},value:{show:!0,fontSize:"14px",fontFamily:void 0,fontWeight:400,color:void 0,offsetY:16,formatter:function(t){return t+"%"}},total:{show:!1,label:"Total",fontSize:"16px",fontWeight:600,fontFamily:void 0,color:void 0,formatter:function(t){return t.globals.seriesTotals.reduce((function(t,e){return t+e}),0)/t.globals.series.length+"%"}}}},pie:{customScale:1,offsetX:0,offsetY:0,startAngle:0,endAngle:360,expandOnClick:!0,dataLabels:{offset:0,minAngleToShowLabel:10},donut:{size:"65%",background:"transparent",labels:{show:!1,name:{show:!0,fontSize:"16px",fontFamily:void 0,fontWeight:600,color:void 0,offsetY:-10,formatter:function(t){return t}},value:{show:!0,fontSize:"20px",fontFamily:void 0,fontWeight:400,color:void 0,offsetY:10,formatter:function(t){return t}},total:{show:!1,showAlways:!1,label:"Total",fontSize:"16px",fontWeight:400,fontFamily:void 0,color:void 0,formatter:function(t){return t.globals.seriesTotals.reduce((function(t,e){return t+e}),0)}}}}},polarArea:{rings:{strokeWidth:1,strokeColor:"#e8e8e8"},spokes:{strokeWidth:1,connectorColors:"#e8e8e8"}},radar:{size:void 0,offsetX:0,offsetY:0,polygons:{strokeWidth:1,strokeColors:"#e8e8e8",connectorColors:"#e8e8e8",fill:{colors:void 0}}}},colors:void 0,dataLabels:{enabled:!0,enabledOnSeries:void 0,formatter:function(t){return null!==t?t:""},textAnchor:"middle",distributed:!1,offsetX:0,offsetY:0,style:{fontSize:"12px",fontFamily:void 0,fontWeight:600,colors:void 0},background:{enabled:!0,foreColor:"#fff",borderRadius:2,padding:4,opacity:.9,borderWidth:1,borderColor:"#fff",dropShadow:{enabled:!1,top:1,left:1,blur:1,color:"#000",opacity:.45}},dropShadow:{enabled:!1,top:1,left:1,blur:1,color:"#000",opacity:.45}},fill:{type:"solid",colors:void 0,opacity:.85,gradient:{shade:"dark",type:"horizontal",shadeIntensity:.5,gradientToColors:void 0,inverseColors:!0,opacityFrom:1,opacityTo:1,stops:[0,50,100],colorStops:[]},image:{src:[],width:void 0,height:void 0},pattern:{style:"squares",width:6,height:6,strokeWidth:2}},forecastDataPoints:{count:0,fillOpacity:.5,strokeWidth:void 0,dashArray:4},grid:{show:!0,borderColor:"#e0e0e0",strokeDashArray:0,position:"back",xaxis:{lines:{show:!1}},yaxis:{lines:{show:!0}},row:{colors:void 0,opacity:.5},column:{colors:void 0,opacity:.5},padding:{top:0,right:10,bottom:0,left:12}},labels:[],legend:{show:!0,showForSingleSeries:!1,showForNullSeries:!0,showForZeroSeries:!0,floating:!1,position:"bottom",horizontalAlign:"center",inverseOrder:!1,fontSize:"12px",fontFamily:void 0,fontWeight:400,width:void 0,height:void 0,formatter:void 0,tooltipHoverFormatter:void 0,offsetX:-20,offsetY:4,customLegendItems:[],labels:{colors:void 0,useSeriesColors:!1},markers:{width:12,height:12,strokeWidth:0,fillColors:void 0,strokeColor:"#fff",radius:12,customHTML:void 0,offsetX:0,offsetY:0,onClick:void 0},itemMargin:{horizontal:5,vertical:2},onItemClick:{toggleDataSeries:!0},onItemHover:{highlightDataSeries:!0}},markers:{discrete:[],size:0,colors:void 0,strokeColors:"#fff",strokeWidth:2,strokeOpacity:.9,strokeDashArray:0,fillOpacity:1,shape:"circle",width:8,height:8,radius:2,offsetX:0,offsetY:0,onClick:void 0,onDblClick:void 0,showNullDataPoints:!0,hover:{size:void 0,sizeOffset:3}},noData:{text:void 0,align:"center",verticalAlign:"middle",offsetX:0,offsetY:0,style:{color:void 0,fontSize:"14px",fontFamily:void 0}},responsive:[],series:void 0,states:{normal:{filter:{type:"none",value:0}},hover:{filter:{type:"lighten",value:.1}},active:{allowMultipleDataPointsSelection:!1,filter:{type:"darken",value:.5}}},title:{text:void 0,align:"left",margin:5,offsetX:0,offsetY:0,floating:!1,style:{fontSize:"14px",fontWeight:900,fontFamily:void 0,color:void 0}},subtitle:{text:void 0,align:"left",margin:5,offsetX:0,offsetY:30,floating:!1,style:{fontSize:"12px",fontWeight:400,fontFamily:void 0,color:void 0}},stroke:{show:!0,curve:"smooth",lineCap:"butt",width:2,colors:void 0,dashArray:0},tooltip:{enabled:!0,enabledOnSeries:void 0,shared:!0,followCursor:!1,intersect:!1,inverseOrder:!1,custom:void 0,fillSeriesColor:!1,theme:"light",style:{fontSize:"12px",fontFamily:void 0},onDatasetHover:{highlightDataSeries:!1},x:{show:!0,format:"dd MMM",formatter:void 0},y:{formatter:void 0,title:{formatter:function(t){return t?t+": ":""}}},z:{formatter:void 0,title:"Size: "},marker:{show:!0,fillColors:void 0},items:{display:"flex"},fixed:{enabled:!1,position:"topRight",offsetX:0,offsetY:0}},xaxis:{type:"category",categories:[],convertedCatToNumeric:!1,offsetX:0,offsetY:0,overwriteCategories:void 0,labels:{show:!0,rotate:-45,rotateAlways:!1,hideOverlappingLabels:!0,trim:!1,minHeight:void 0,maxHeight:120,showDuplicates:!0,style:{colors:[],fontSize:"12px",fontWeight:400,fontFamily:void 0,cssClass:""},offsetX:0,offsetY:0,format:void 0,formatter:void 0,datetimeUTC:!0,datetimeFormatter:{year:"yyyy",month:"MMM 'yy",day:"dd MMM",hour:"HH:mm",minute:"HH:mm:ss",second:"HH:mm:ss"}},axisBorder:{show:!0,color:"#e0e0e0",width:"100%",height:1,offsetX:0,offsetY:0},axisTicks:{show:!0,color:"#e0e0e0",height:6,offsetX:0,offsetY:0},tickAmount:void 0,tickPlacement:"on",min:void 0,max:void 0,range:void 0,floating:!1,decimalsInFloat:void 0,position:"bottom",title:{text:void 0,offsetX:0,offsetY:0,style:{color:void 0,fontSize:"12px",fontWeight:900,fontFamily:void 0,cssClass:""}},crosshairs:{show:!0,width:1,position:"back",opacity:.9,stroke:{color:"#b6b6b6",width:1,dashArray:3},fill:{type:"solid",color:"#B1B9C4",gradient:{colorFrom:"#D8E3F0",colorTo:"#BED1E6",stops:[0,100],opacityFrom:.4,opacityTo:.5}},dropShadow:{enabled:!1,left:0,top:0,blur:1,opacity:.4}},tooltip:{enabled:!0,offsetY:0,formatter:void 0,style:{fontSize:"12px",fontFamily:void 0}}},yaxis:this.yAxis,theme:{mode:"light",palette:"palette1",monochrome:{enabled:!1,color:"#008FFB",shadeTo:"light",shadeIntensity:.65}}}}}]),t}(),P=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w,this.graphics=new w(this.ctx),this.w.globals.isBarHorizontal&&(this.invertAxis=!0),this.helpers=new k(this),this.xAxisAnnotations=new A(this),this.yAxisAnnotations=new _(this),this.pointsAnnotations=new C(this),this.w.globals.isBarHorizontal&&this.w.config.yaxis[0].reversed&&(this.inversedReversedAxis=!0),this.xDivision=this.w.globals.gridWidth/this.w.globals.dataPoints}return c(t,[{key:"drawAxesAnnotations",value:function(){var t=this.w;if(t.globals.axisCharts){for(var e=this.yAxisAnnotations.drawYAxisAnnotations(),i=this.xAxisAnnotations.drawXAxisAnnotations(),n=this.pointsAnnotations.drawPointAnnotations(),a=t.config.chart.animations.enabled,r=[e,i,n],s=[i.node,e.node,n.node],o=0;o<3;o++)t.globals.dom.elGraphical.add(r[o]),!a||t.globals.resized||t.globals.dataChanged||"scatter"!==t.config.chart.type&&"bubble"!==t.config.chart.type&&t.globals.dataPoints>1&&s[o].classList.add("apexcharts-element-hidden"),t.globals.delayedElements.push({el:s[o],index:0});this.helpers.annotationsBackground()}}},{key:"drawImageAnnos",value:function(){var t=this;this.w.config.annotations.images.map((function(e,i){t.addImage(e,i)}))}},{key:"drawTextAnnos",value:function(){var t=this;this.w.config.annotations.texts.map((function(e,i){t.addText(e,i)}))}},{key:"addXaxisAnnotation",value:function(t,e,i){this.xAxisAnnotations.addXaxisAnnotation(t,e,i)}},{key:"addYaxisAnnotation",value:function(t,e,i){this.yAxisAnnotations.addYaxisAnnotation(t,e,i)}},{key:"addPointAnnotation",value:function(t,e,i){this.pointsAnnotations.addPointAnnotation(t,e,i)}},{key:"addText",value:function(t,e){var i=t.x,n=t.y,a=t.text,r=t.textAnchor,s=t.foreColor,o=t.fontSize,l=t.fontFamily,c=t.fontWeight,h=t.cssClass,u=t.backgroundColor,d=t.borderWidth,f=t.strokeDashArray,g=t.borderRadius,p=t.borderColor,m=t.appendTo,v=void 0===m?".apexcharts-annotations":m,x=t.paddingLeft,b=void 0===x?4:x,y=t.paddingRight,w=void 0===y?4:y,k=t.paddingBottom,A=void 0===k?2:k,S=t.paddingTop,_=void 0===S?2:S,C=this.w,E=this.graphics.drawText({x:i,y:n,text:a,textAnchor:r||"start",fontSize:o||"12px",fontWeight:c||"regular",fontFamily:l||C.config.chart.fontFamily,foreColor:s||C.config.chart.foreColor,cssClass:h}),T=C.globals.dom.baseEl.querySelector(v);T&&T.appendChild(E.node);var P=E.bbox();if(a){var M=this.graphics.drawRect(P.x-b,P.y-_,P.width+b+w,P.height+A+_,g,u||"transparent",1,d,p,f);T.insertBefore(M.node,E.node)}}},{key:"addImage",value:function(t,e){var i=this.w,n=t.path,a=t.x,r=void 0===a?0:a,s=t.y,o=void 0===s?0:s,l=t.width,c=void 0===l?20:l,h=t.height,u=void 0===h?20:h,d=t.appendTo,f=void 0===d?".apexcharts-annotations":d,g=i.globals.dom.Paper.image(n);g.size(c,u).move(r,o);var p=i.globals.dom.baseEl.querySelector(f);return p&&p.appendChild(g.node),g}},{key:"addXaxisAnnotationExternal",value:function(t,e,i){return this.addAnnotationExternal({params:t,pushToMemory:e,context:i,type:"xaxis",contextMethod:i.addXaxisAnnotation}),i}},{key:"addYaxisAnnotationExternal",value:function(t,e,i){return this.addAnnotationExternal({params:t,pushToMemory:e,context:i,type:"yaxis",contextMethod:i.addYaxisAnnotation}),i}},{key:"addPointAnnotationExternal",value:function(t,e,i){return void 0===this.invertAxis&&(this.invertAxis=i.w.globals.isBarHorizontal),this.addAnnotationExternal({params:t,pushToMemory:e,context:i,type:"point",contextMethod:i.addPointAnnotation}),i}},{key:"addAnnotationExternal",value:function(t){var e=t.params,i=t.pushToMemory,n=t.context,a=t.type,r=t.contextMethod,s=n,o=s.w,l=o.globals.dom.baseEl.querySelector(".apexcharts-".concat(a,"-annotations")),c=l.childNodes.length+1,h=new T,u=Object.assign({},"xaxis"===a?h.xAxisAnnotation:"yaxis"===a?h.yAxisAnnotation:h.pointAnnotation),d=x.extend(u,e);switch(a){case"xaxis":this.addXaxisAnnotation(d,l,c);break;case"yaxis":this.addYaxisAnnotation(d,l,c);break;case"point":this.addPointAnnotation(d,l,c)}var f=o.globals.dom.baseEl.querySelector(".apexcharts-".concat(a,"-annotations .apexcharts-").concat(a,"-annotation-label[rel='").concat(c,"']")),g=this.helpers.addBackgroundToAnno(f,d);return g&&l.insertBefore(g.node,f),i&&o.globals.memory.methodsToExec.push({context:s,id:d.id?d.id:x.randomId(),method:r,label:"addAnnotation",params:e}),n}},{key:"clearAnnotations",value:function(t){var e=t.w,i=e.globals.dom.baseEl.querySelectorAll(".apexcharts-yaxis-annotations, .apexcharts-xaxis-annotations, .apexcharts-point-annotations");e.globals.memory.methodsToExec.map((function(t,i){"addText"!==t.label&&"addAnnotation"!==t.label||e.globals.memory.methodsToExec.splice(i,1)})),i=x.listToArray(i),Array.prototype.forEach.call(i,(function(t){for(;t.firstChild;)t.removeChild(t.firstChild)}))}},{key:"removeAnnotation",value:function(t,e){var i=t.w,n=i.globals.dom.baseEl.querySelectorAll(".".concat(e));n&&(i.globals.memory.methodsToExec.map((function(t,n){t.id===e&&i.globals.memory.methodsToExec.splice(n,1)})),Array.prototype.forEach.call(n,(function(t){t.parentElement.removeChild(t)})))}}]),t}(),M=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w,this.opts=null,this.seriesIndex=0}return c(t,[{key:"clippedImgArea",value:function(t){var e=this.w,i=e.config,n=parseInt(e.globals.gridWidth,10),a=parseInt(e.globals.gridHeight,10),r=n>a?n:a,s=t.image,o=0,l=0;void 0===t.width&&void 0===t.height?void 0!==i.fill.image.width&&void 0!==i.fill.image.height?(o=i.fill.image.width+1,l=i.fill.image.height):(o=r+1,l=r):(o=t.width,l=t.height);var c=document.createElementNS(e.globals.SVGNS,"pattern");w.setAttrs(c,{id:t.patternID,patternUnits:t.patternUnits?t.patternUnits:"userSpaceOnUse",width:o+"px",height:l+"px"});var h=document.createElementNS(e.globals.SVGNS,"image");c.appendChild(h),h.setAttributeNS(window.SVG.xlink,"href",s),w.setAttrs(h,{x:0,y:0,preserveAspectRatio:"none",width:o+"px",height:l+"px"}),h.style.opacity=t.opacity,e.globals.dom.elDefs.node.appendChild(c)}},{key:"getSeriesIndex",value:function(t){var e=this.w;return("bar"===e.config.chart.type||"rangeBar"===e.config.chart.type)&&e.config.plotOptions.bar.distributed||"heatmap"===e.config.chart.type||"treemap"===e.config.chart.type?this.seriesIndex=t.seriesNumber:this.seriesIndex=t.seriesNumber%e.globals.series.length,this.seriesIndex}},{key:"fillPath",value:function(t){var e=this.w;this.opts=t;var i,n,a,r=this.w.config;this.seriesIndex=this.getSeriesIndex(t);var s=this.getFillColors()[this.seriesIndex];void 0!==e.globals.seriesColors[this.seriesIndex]&&(s=e.globals.seriesColors[this.seriesIndex]),"function"==typeof s&&(s=s({seriesIndex:this.seriesIndex,dataPointIndex:t.dataPointIndex,value:t.value,w:e}));var o=this.getFillType(this.seriesIndex),l=Array.isArray(r.fill.opacity)?r.fill.opacity[this.seriesIndex]:r.fill.opacity;t.color&&(s=t.color);var c=s;if(-1===s.indexOf("rgb")?s.length<9&&(c=x.hexToRgba(s,l)):s.indexOf("rgba")>-1&&(l=x.getOpacityFromRGBA(s)),t.opacity&&(l=t.opacity),"pattern"===o&&(n=this.handlePatternFill(n,s,l,c)),"gradient"===o&&(a=this.handleGradientFill(s,l,this.seriesIndex)),"image"===o){var h=r.fill.image.src,u=t.patternID?t.patternID:"";this.clippedImgArea({opacity:l,image:Array.isArray(h)?t.seriesNumber<h.length?h[t.seriesNumber]:h[0]:h,width:t.width?t.width:void 0,height:t.height?t.height:void 0,patternUnits:t.patternUnits,patternID:"pattern".concat(e.globals.cuid).concat(t.seriesNumber+1).concat(u)}),i="url(#pattern".concat(e.globals.cuid).concat(t.seriesNumber+1).concat(u,")")}else i="gradient"===o?a:"pattern"===o?n:c;return t.solid&&(i=c),i}},{key:"getFillType",value:function(t){var e=this.w;return Array.isArray(e.config.fill.type)?e.config.fill.type[t]:e.config.fill.type}},{key:"getFillColors",value:function(){var t=this.w,e=t.config,i=this.opts,n=[];return t.globals.comboCharts?"line"===t.config.series[this.seriesIndex].type?Array.isArray(t.globals.stroke.colors)?n=t.globals.stroke.colors:n.push(t.globals.stroke.colors):Array.isArray(t.globals.fill.colors)?n=t.globals.fill.colors:n.push(t.globals.fill.colors):"line"===e.chart.type?Array.isArray(t.globals.stroke.colors)?n=t.globals.stroke.colors:n.push(t.globals.stroke.colors):Array.isArray(t.globals.fill.colors)?n=t.globals.fill.colors:n.push(t.globals.fill.colors),void 0!==i.fillColors&&(n=[],Array.isArray(i.fillColors)?n=i.fillColors.slice():n.push(i.fillColors)),n}},{key:"handlePatternFill",value:function(t,e,i,n){var a=this.w.config,r=this.opts,s=new w(this.ctx),o=void 0===a.fill.pattern.strokeWidth?Array.isArray(a.stroke.width)?a.stroke.width[this.seriesIndex]:a.stroke.width:Array.isArray(a.fill.pattern.strokeWidth)?a.fill.pattern.strokeWidth[this.seriesIndex]:a.fill.pattern.strokeWidth,l=e;return Array.isArray(a.fill.pattern.style)?void 0!==a.fill.pattern.style[r.seriesNumber]?s.drawPattern(a.fill.pattern.style[r.seriesNumber],a.fill.pattern.width,a.fill.pattern.height,l,o,i):n:s.drawPattern(a.fill.pattern.style,a.fill.pattern.width,a.fill.pattern.height,l,o,i)}},{key:"handleGradientFill",value:function(t,e,i){var n,a=this.w.config,r=this.opts,s=new w(this.ctx),o=new x,l=a.fill.gradient.type,c=t,h=void 0===a.fill.gradient.opacityFrom?e:Array.isArray(a.fill.gradient.opacityFrom)?a.fill.gradient.opacityFrom[i]:a.fill.gradient.opacityFrom;c.indexOf("rgba")>-1&&(h=x.getOpacityFromRGBA(c));var u=void 0===a.fill.gradient.opacityTo?e:Array.isArray(a.fill.gradient.opacityTo)?a.fill.gradient.opacityTo[i]:a.fill.gradient.opacityTo;if(void 0===a.fill.gradient.gradientToColors||0===a.fill.gradient.gradientToColors.length)n="dark"===a.fill.gradient.shade?o.shadeColor(-1*parseFloat(a.fill.gradient.shadeIntensity),t.indexOf("rgb")>-1?x.rgb2hex(t):t):o.shadeColor(parseFloat(a.fill.gradient.shadeIntensity),t.indexOf("rgb")>-1?x.rgb2hex(t):t);else if(a.fill.gradient.gradientToColors[r.seriesNumber]){var d=a.fill.gradient.gradientToColors[r.seriesNumber];n=d,d.indexOf("rgba")>-1&&(u=x.getOpacityFromRGBA(d))}else n=t;if(a.fill.gradient.inverseColors){var f=c;c=n,n=f}return c.indexOf("rgb")>-1&&(c=x.rgb2hex(c)),n.indexOf("rgb")>-1&&(n=x.rgb2hex(n)),s.drawGradient(l,c,n,h,u,r.size,a.fill.gradient.stops,a.fill.gradient.colorStops,i)}}]),t}(),L=function(){function t(e,i){o(this,t),this.ctx=e,this.w=e.w}return c(t,[{key:"setGlobalMarkerSize",value:function(){var t=this.w;if(t.globals.markers.size=Array.isArray(t.config.markers.size)?t.config.markers.size:[t.config.markers.size],t.globals.markers.size.length>0){if(t.globals.markers.size.length<t.globals.series.length+1)for(var e=0;e<=t.globals.series.length;e++)void 0===t.globals.markers.size[e]&&t.globals.markers.size.push(t.globals.markers.size[0])}else t.globals.markers.size=t.config.series.map((function(e){return t.config.markers.size}))}},{key:"plotChartMarkers",value:function(t,e,i,n){var a,r=arguments.length>4&&void 0!==arguments[4]&&arguments[4],s=this.w,o=e,l=t,c=null,h=new w(this.ctx);if((s.globals.markers.size[e]>0||r)&&(c=h.group({class:r?"":"apexcharts-series-markers"})).attr("clip-path","url(#gridRectMarkerMask".concat(s.globals.cuid,")")),Array.isArray(l.x))for(var u=0;u<l.x.length;u++){var d=i;1===i&&0===u&&(d=0),1===i&&1===u&&(d=1);var f="apexcharts-marker";"line"!==s.config.chart.type&&"area"!==s.config.chart.type||s.globals.comboCharts||s.config.tooltip.intersect||(f+=" no-pointer-events");var g=Array.isArray(s.config.markers.size)?s.globals.markers.size[e]>0:s.config.markers.size>0;if(g||r){x.isNumber(l.y[u])?f+=" w".concat(x.randomId()):f="apexcharts-nullpoint";var p=this.getMarkerConfig({cssClass:f,seriesIndex:e,dataPointIndex:d});s.config.series[o].data[d]&&(s.config.series[o].data[d].fillColor&&(p.pointFillColor=s.config.series[o].data[d].fillColor),s.config.series[o].data[d].strokeColor&&(p.pointStrokeColor=s.config.series[o].data[d].strokeColor)),n&&(p.pSize=n),(a=h.drawMarker(l.x[u],l.y[u],p)).attr("rel",d),a.attr("j",d),a.attr("index",e),a.node.setAttribute("default-marker-size",p.pSize);var m=new y(this.ctx);m.setSelectionFilter(a,e,d),this.addEvents(a),c&&c.add(a)}else void 0===s.globals.pointsArray[e]&&(s.globals.pointsArray[e]=[]),s.globals.pointsArray[e].push([l.x[u],l.y[u]])}return c}},{key:"getMarkerConfig",value:function(t){var e=t.cssClass,i=t.seriesIndex,n=t.dataPointIndex,a=void 0===n?null:n,r=t.finishRadius,s=void 0===r?null:r,o=this.w,l=this.getMarkerStyle(i),c=o.globals.markers.size[i],h=o.config.markers;return null!==a&&h.discrete.length&&h.discrete.map((function(t){t.seriesIndex===i&&t.dataPointIndex===a&&(l.pointStrokeColor=t.strokeColor,l.pointFillColor=t.fillColor,c=t.size,l.pointShape=t.shape)})),{pSize:null===s?c:s,pRadius:h.radius,width:Array.isArray(h.width)?h.width[i]:h.width,height:Array.isArray(h.height)?h.height[i]:h.height,pointStrokeWidth:Array.isArray(h.strokeWidth)?h.strokeWidth[i]:h.strokeWidth,pointStrokeColor:l.pointStrokeColor,pointFillColor:l.pointFillColor,shape:l.pointShape||(Array.isArray(h.shape)?h.shape[i]:h.shape),class:e,pointStrokeOpacity:Array.isArray(h.strokeOpacity)?h.strokeOpacity[i]:h.strokeOpacity,pointStrokeDashArray:Array.isArray(h.strokeDashArray)?h.strokeDashArray[i]:h.strokeDashArray,pointFillOpacity:Array.isArray(h.fillOpacity)?h.fillOpacity[i]:h.fillOpacity,seriesIndex:i}}},{key:"addEvents",value:function(t){var e=this.w,i=new w(this.ctx);t.node.addEventListener("mouseenter",i.pathMouseEnter.bind(this.ctx,t)),t.node.addEventListener("mouseleave",i.pathMouseLeave.bind(this.ctx,t)),t.node.addEventListener("mousedown",i.pathMouseDown.bind(this.ctx,t)),t.node.addEventListener("click",e.config.markers.onClick),t.node.addEventListener("dblclick",e.config.markers.onDblClick),t.node.addEventListener("touchstart",i.pathMouseDown.bind(this.ctx,t),{passive:!0})}},{key:"getMarkerStyle",value:function(t){var e=this.w,i=e.globals.markers.colors,n=e.config.markers.strokeColor||e.config.markers.strokeColors;return{pointStrokeColor:Array.isArray(n)?n[t]:n,pointFillColor:Array.isArray(i)?i[t]:i}}}]),t}(),D=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w,this.initialAnim=this.w.config.chart.animations.enabled,this.dynamicAnim=this.initialAnim&&this.w.config.chart.animations.dynamicAnimation.enabled}return c(t,[{key:"draw",value:function(t,e,i){var n=this.w,a=new w(this.ctx),r=i.realIndex,s=i.pointsPos,o=i.zRatio,l=i.elParent,c=a.group({class:"apexcharts-series-markers apexcharts-series-".concat(n.config.chart.type)});if(c.attr("clip-path","url(#gridRectMarkerMask".concat(n.globals.cuid,")")),Array.isArray(s.x))for(var h=0;h<s.x.length;h++){var u=e+1,d=!0;0===e&&0===h&&(u=0),0===e&&1===h&&(u=1);var f=0,g=n.globals.markers.size[r];if(o!==1/0){g=n.globals.seriesZ[r][u]/o;var p=n.config.plotOptions.bubble;p.minBubbleRadius&&g<p.minBubbleRadius&&(g=p.minBubbleRadius),p.maxBubbleRadius&&g>p.maxBubbleRadius&&(g=p.maxBubbleRadius)}n.config.chart.animations.enabled||(f=g);var m=s.x[h],v=s.y[h];if(f=f||0,null!==v&&void 0!==n.globals.series[r][u]||(d=!1),d){var x=this.drawPoint(m,v,f,g,r,u,e);c.add(x)}l.add(c)}}},{key:"drawPoint",value:function(t,e,i,n,a,r,s){var o=this.w,l=a,c=new b(this.ctx),h=new y(this.ctx),u=new M(this.ctx),d=new L(this.ctx),f=new w(this.ctx),g=d.getMarkerConfig({cssClass:"apexcharts-marker",seriesIndex:l,dataPointIndex:r,finishRadius:"bubble"===o.config.chart.type||o.globals.comboCharts&&o.config.series[a]&&"bubble"===o.config.series[a].type?n:null});n=g.pSize;var p,m=u.fillPath({seriesNumber:a,dataPointIndex:r,color:g.pointFillColor,patternUnits:"objectBoundingBox",value:o.globals.series[a][s]});if("circle"===g.shape?p=f.drawCircle(i):"square"!==g.shape&&"rect"!==g.shape||(p=f.drawRect(0,0,g.width-g.pointStrokeWidth/2,g.height-g.pointStrokeWidth/2,g.pRadius)),o.config.series[l].data[r]&&o.config.series[l].data[r].fillColor&&(m=o.config.series[l].data[r].fillColor),p.attr({x:t-g.width/2-g.pointStrokeWidth/2,y:e-g.height/2-g.pointStrokeWidth/2,cx:t,cy:e,fill:m,"fill-opacity":g.pointFillOpacity,stroke:g.pointStrokeColor,r:n,"stroke-width":g.pointStrokeWidth,"stroke-dasharray":g.pointStrokeDashArray,"stroke-opacity":g.pointStrokeOpacity}),o.config.chart.dropShadow.enabled){var v=o.config.chart.dropShadow;h.dropShadow(p,v,a)}if(!this.initialAnim||o.globals.dataChanged||o.globals.resized)o.globals.animationEnded=!0;else{var x=o.config.chart.animations.speed;c.animateMarker(p,0,"circle"===g.shape?n:{width:g.width,height:g.height},x,o.globals.easing,(function(){window.setTimeout((function(){c.animationCompleted(p)}),100)}))}if(o.globals.dataChanged&&"circle"===g.shape)if(this.dynamicAnim){var k,A,S,_,C=o.config.chart.animations.dynamicAnimation.speed;null!=(_=o.globals.previousPaths[a]&&o.globals.previousPaths[a][s])&&(k=_.x,A=_.y,S=void 0!==_.r?_.r:n);for(var E=0;E<o.globals.collapsedSeries.length;E++)o.globals.collapsedSeries[E].index===a&&(C=1,n=0);0===t&&0===e&&(n=0),c.animateCircle(p,{cx:k,cy:A,r:S},{cx:t,cy:e,r:n},C,o.globals.easing)}else p.attr({r:n});return p.attr({rel:r,j:r,index:a,"default-marker-size":n}),h.setSelectionFilter(p,a,r),d.addEvents(p),p.node.classList.add("apexcharts-marker"),p}},{key:"centerTextInBubble",value:function(t){var e=this.w;return{y:t+=parseInt(e.config.dataLabels.style.fontSize,10)/4}}}]),t}(),I=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w}return c(t,[{key:"dataLabelsCorrection",value:function(t,e,i,n,a,r,s){var o=this.w,l=!1,c=new w(this.ctx).getTextRects(i,s),h=c.width,u=c.height;e<0&&(e=0),e>o.globals.gridHeight+u&&(e=o.globals.gridHeight+u/2),void 0===o.globals.dataLabelsRects[n]&&(o.globals.dataLabelsRects[n]=[]),o.globals.dataLabelsRects[n].push({x:t,y:e,width:h,height:u});var d=o.globals.dataLabelsRects[n].length-2,f=void 0!==o.globals.lastDrawnDataLabelsIndexes[n]?o.globals.lastDrawnDataLabelsIndexes[n][o.globals.lastDrawnDataLabelsIndexes[n].length-1]:0;if(void 0!==o.globals.dataLabelsRects[n][d]){var g=o.globals.dataLabelsRects[n][f];(t>g.x+g.width+2||e>g.y+g.height+2||t+h<g.x)&&(l=!0)}return(0===a||r)&&(l=!0),{x:t,y:e,textRects:c,drawnextLabel:l}}},{key:"drawDataLabel",value:function(t,e,i){var n=this,a=arguments.length>4&&void 0!==arguments[4]?arguments[4]:2,r=this.w,s=new w(this.ctx),o=r.config.dataLabels,l=0,c=0,h=i,u=null;if(!o.enabled||!Array.isArray(t.x))return u;u=s.group({class:"apexcharts-data-labels"});for(var d=0;d<t.x.length;d++)if(l=t.x[d]+o.offsetX,c=t.y[d]+o.offsetY+a,!isNaN(l)){1===i&&0===d&&(h=0),1===i&&1===d&&(h=1);var f=r.globals.series[e][h],g="",p=function(t){return r.config.dataLabels.formatter(t,{ctx:n.ctx,seriesIndex:e,dataPointIndex:h,w:r})};if("bubble"===r.config.chart.type){g=p(f=r.globals.seriesZ[e][h]),c=t.y[d];var m=new D(this.ctx),v=m.centerTextInBubble(c,e,h);c=v.y}else void 0!==f&&(g=p(f));this.plotDataLabelsText({x:l,y:c,text:g,i:e,j:h,parent:u,offsetCorrection:!0,dataLabelsConfig:r.config.dataLabels})}return u}},{key:"plotDataLabelsText",value:function(t){var e=this.w,i=new w(this.ctx),n=t.x,a=t.y,r=t.i,s=t.j,o=t.text,l=t.textAnchor,c=t.fontSize,h=t.parent,u=t.dataLabelsConfig,d=t.color,f=t.alwaysDrawDataLabel,g=t.offsetCorrection;if(!(Array.isArray(e.config.dataLabels.enabledOnSeries)&&e.config.dataLabels.enabledOnSeries.indexOf(r)<0)){var p={x:n,y:a,drawnextLabel:!0,textRects:null};g&&(p=this.dataLabelsCorrection(n,a,o,r,s,f,parseInt(u.style.fontSize,10))),e.globals.zoomed||(n=p.x,a=p.y),p.textRects&&(n<-10-p.textRects.width||n>e.globals.gridWidth+p.textRects.width+10)&&(o="");var m=e.globals.dataLabels.style.colors[r];(("bar"===e.config.chart.type||"rangeBar"===e.config.chart.type)&&e.config.plotOptions.bar.distributed||e.config.dataLabels.distributed)&&(m=e.globals.dataLabels.style.colors[s]),"function"==typeof m&&(m=m({series:e.globals.series,seriesIndex:r,dataPointIndex:s,w:e})),d&&(m=d);var v=u.offsetX,x=u.offsetY;if("bar"!==e.config.chart.type&&"rangeBar"!==e.config.chart.type||(v=0,x=0),p.drawnextLabel){var b=i.drawText({width:100,height:parseInt(u.style.fontSize,10),x:n+v,y:a+x,foreColor:m,textAnchor:l||u.textAnchor,text:o,fontSize:c||u.style.fontSize,fontFamily:u.style.fontFamily,fontWeight:u.style.fontWeight||"normal"});if(b.attr({class:"apexcharts-datalabel",cx:n,cy:a}),u.dropShadow.enabled){var k=u.dropShadow;new y(this.ctx).dropShadow(b,k)}h.add(b),void 0===e.globals.lastDrawnDataLabelsIndexes[r]&&(e.globals.lastDrawnDataLabelsIndexes[r]=[]),e.globals.lastDrawnDataLabelsIndexes[r].push(s)}}}},{key:"addBackgroundToDataLabel",value:function(t,e){var i=this.w,n=i.config.dataLabels.background,a=n.padding,r=n.padding/2,s=e.width,o=e.height,l=new w(this.ctx).drawRect(e.x-a,e.y-r/2,s+2*a,o+r,n.borderRadius,"transparent"===i.config.chart.background?"#fff":i.config.chart.background,n.opacity,n.borderWidth,n.borderColor);return n.dropShadow.enabled&&new y(this.ctx).dropShadow(l,n.dropShadow),l}},{key:"dataLabelsBackground",value:function(){var t=this.w;if("bubble"!==t.config.chart.type)for(var e=t.globals.dom.baseEl.querySelectorAll(".apexcharts-datalabels text"),i=0;i<e.length;i++){var n=e[i],a=n.getBBox(),r=null;if(a.width&&a.height&&(r=this.addBackgroundToDataLabel(n,a)),r){n.parentNode.insertBefore(r.node,n);var s=n.getAttribute("fill");!t.config.chart.animations.enabled||t.globals.resized||t.globals.dataChanged?r.attr({fill:s}):r.animate().attr({fill:s}),n.setAttribute("fill",t.config.dataLabels.background.foreColor)}}}},{key:"bringForward",value:function(){for(var t=this.w,e=t.globals.dom.baseEl.querySelectorAll(".apexcharts-datalabels"),i=t.globals.dom.baseEl.querySelector(".apexcharts-plot-series:last-child"),n=0;n<e.length;n++)i&&i.insertBefore(e[n],i.nextSibling)}}]),t}(),O=function(){function t(e){o(this,t),this.w=e.w,this.barCtx=e}return c(t,[{key:"handleBarDataLabels",value:function(t){var e=t.x,i=t.y,n=t.y1,a=t.y2,r=t.i,s=t.j,o=t.realIndex,l=t.series,c=t.barHeight,h=t.barWidth,u=t.barYPosition,d=t.visibleSeries,f=t.renderedPath,g=this.w,p=new w(this.barCtx.ctx),m=Array.isArray(this.barCtx.strokeWidth)?this.barCtx.strokeWidth[o]:this.barCtx.strokeWidth,v=e+parseFloat(h*d),x=i+parseFloat(c*d);g.globals.isXNumeric&&!g.globals.isBarHorizontal&&(v=e+parseFloat(h*(d+1)),x=i+parseFloat(c*(d+1))-m);var b,y=e,k=i,A=g.config.dataLabels,S=this.barCtx.barOptions.dataLabels;void 0!==u&&this.barCtx.isRangeBar&&(x=u,k=u);var _=A.offsetX,C=A.offsetY,E={width:0,height:0};if(g.config.dataLabels.enabled){var T=this.barCtx.series[r][s];E=p.getTextRects(g.globals.yLabelFormatters[0](T),parseFloat(A.style.fontSize))}var P={x:e,y:i,i:r,j:s,renderedPath:f,bcx:v,bcy:x,barHeight:c,barWidth:h,textRects:E,strokeWidth:m,dataLabelsX:y,dataLabelsY:k,barDataLabelsConfig:S,offX:_,offY:C};return b=this.barCtx.isHorizontal?this.calculateBarsDataLabelsPosition(P):this.calculateColumnsDataLabelsPosition(P),f.attr({cy:b.bcy,cx:b.bcx,j:s,val:l[r][s],barHeight:c,barWidth:h}),this.drawCalculatedDataLabels({x:b.dataLabelsX,y:b.dataLabelsY,val:this.barCtx.isRangeBar?[n,a]:l[r][s],i:o,j:s,barWidth:h,barHeight:c,textRects:E,dataLabelsConfig:A})}},{key:"calculateColumnsDataLabelsPosition",value:function(t){var e,i=this.w,n=t.i,a=t.j,r=t.y,s=t.bcx,o=t.barWidth,l=t.barHeight,c=t.textRects,h=t.dataLabelsY,u=t.barDataLabelsConfig,d=t.strokeWidth,f=t.offX,g=t.offY;l=Math.abs(l);var p="vertical"===i.config.plotOptions.bar.dataLabels.orientation;s-=d/2;var m=i.globals.gridWidth/i.globals.dataPoints;e=i.globals.isXNumeric?s-o/2+f:s-m+o/2+f,p&&(e=e+c.height/2-d/2-2);var v=this.barCtx.series[n][a]<0,x=r;switch(this.barCtx.isReversed&&(x=r-l+(v?2*l:0),r-=l),u.position){case"center":h=p?v?x+l/2+g:x+l/2-g:v?x-l/2+c.height/2+g:x+l/2+c.height/2-g;break;case"bottom":h=p?v?x+l+g:x+l-g:v?x-l+c.height+d+g:x+l-c.height/2+d-g;break;case"top":h=p?v?x+g:x-g:v?x-c.height/2-g:x+c.height+g}return i.config.chart.stacked||(h<0?h=0+d:h+c.height/3>i.globals.gridHeight&&(h=i.globals.gridHeight-d)),{bcx:s,bcy:r,dataLabelsX:e,dataLabelsY:h}}},{key:"calculateBarsDataLabelsPosition",value:function(t){var e=this.w,i=t.x,n=t.i,a=t.j,r=t.bcy,s=t.barHeight,o=t.barWidth,l=t.textRects,c=t.dataLabelsX,h=t.strokeWidth,u=t.barDataLabelsConfig,d=t.offX,f=t.offY,g=e.globals.gridHeight/e.globals.dataPoints;o=Math.abs(o);var p=r-(this.barCtx.isRangeBar?0:g)+s/2+l.height/2+f-3,m=this.barCtx.series[n][a]<0,v=i;switch(this.barCtx.isReversed&&(v=i+o-(m?2*o:0),i=e.globals.gridWidth-o),u.position){case"center":c=m?v+o/2-d:Math.max(l.width/2,v-o/2)+d;break;case"bottom":c=m?v+o-h-Math.round(l.width/2)-d:v-o+h+Math.round(l.width/2)+d;break;case"top":c=m?v-h+Math.round(l.width/2)-d:v-h-Math.round(l.width/2)+d}return e.config.chart.stacked||(c<0?c=c+l.width+h:c+l.width/2>e.globals.gridWidth&&(c=e.globals.gridWidth-l.width-h)),{bcx:i,bcy:r,dataLabelsX:c,dataLabelsY:p}}},{key:"drawCalculatedDataLabels",value:function(t){var e=t.x,i=t.y,n=t.val,a=t.i,s=t.j,o=t.textRects,l=t.barHeight,c=t.barWidth,h=t.dataLabelsConfig,u=this.w,d="rotate(0)";"vertical"===u.config.plotOptions.bar.dataLabels.orientation&&(d="rotate(-90, ".concat(e,", ").concat(i,")"));var f=new I(this.barCtx.ctx),g=new w(this.barCtx.ctx),p=h.formatter,m=null,v=u.globals.collapsedSeriesIndices.indexOf(a)>-1;if(h.enabled&&!v){m=g.group({class:"apexcharts-data-labels",transform:d});var x="";void 0!==n&&(x=p(n,{seriesIndex:a,dataPointIndex:s,w:u}));var b=u.globals.series[a][s]<0,y=u.config.plotOptions.bar.dataLabels.position;"vertical"===u.config.plotOptions.bar.dataLabels.orientation&&("top"===y&&(h.textAnchor=b?"end":"start"),"center"===y&&(h.textAnchor="middle"),"bottom"===y&&(h.textAnchor=b?"end":"start")),this.barCtx.isRangeBar&&this.barCtx.barOptions.dataLabels.hideOverflowingLabels&&c<g.getTextRects(x,parseFloat(h.style.fontSize)).width&&(x=""),u.config.chart.stacked&&this.barCtx.barOptions.dataLabels.hideOverflowingLabels&&(this.barCtx.isHorizontal?o.width/1.6>Math.abs(c)&&(x=""):o.height/1.6>Math.abs(l)&&(x=""));var k=r({},h);this.barCtx.isHorizontal&&n<0&&("start"===h.textAnchor?k.textAnchor="end":"end"===h.textAnchor&&(k.textAnchor="start")),f.plotDataLabelsText({x:e,y:i,text:x,i:a,j:s,parent:m,dataLabelsConfig:k,alwaysDrawDataLabel:!0,offsetCorrection:!0})}return m}}]),t}(),N=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w,this.legendInactiveClass="legend-mouseover-inactive"}return c(t,[{key:"getAllSeriesEls",value:function(){return this.w.globals.dom.baseEl.getElementsByClassName("apexcharts-series")}},{key:"getSeriesByName",value:function(t){return this.w.globals.dom.baseEl.querySelector(".apexcharts-inner .apexcharts-series[seriesName='".concat(x.escapeString(t),"']"))}},{key:"isSeriesHidden",value:function(t){var e=this.getSeriesByName(t),i=parseInt(e.getAttribute("data:realIndex"),10);return{isHidden:e.classList.contains("apexcharts-series-collapsed"),realIndex:i}}},{key:"addCollapsedClassToSeries",value:function(t,e){var i=this.w;function n(i){for(var n=0;n<i.length;n++)i[n].index===e&&t.node.classList.add("apexcharts-series-collapsed")}n(i.globals.collapsedSeries),n(i.globals.ancillaryCollapsedSeries)}},{key:"toggleSeries",value:function(t){var e=this.isSeriesHidden(t);return this.ctx.legend.legendHelpers.toggleDataSeries(e.realIndex,e.isHidden),e.isHidden}},{key:"showSeries",value:function(t){var e=this.isSeriesHidden(t);e.isHidden&&this.ctx.legend.legendHelpers.toggleDataSeries(e.realIndex,!0)}},{key:"hideSeries",value:function(t){var e=this.isSeriesHidden(t);e.isHidden||this.ctx.legend.legendHelpers.toggleDataSeries(e.realIndex,!1)}},{key:"resetSeries",value:function(){var t=!(arguments.length>0&&void 0!==arguments[0])||arguments[0],e=!(arguments.length>1&&void 0!==arguments[1])||arguments[1],i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],n=this.w,a=x.clone(n.globals.initialSeries);n.globals.previousPaths=[],i?(n.globals.collapsedSeries=[],n.globals.ancillaryCollapsedSeries=[],n.globals.collapsedSeriesIndices=[],n.globals.ancillaryCollapsedSeriesIndices=[]):a=this.emptyCollapsedSeries(a),n.config.series=a,t&&(e&&(n.globals.zoomed=!1,this.ctx.updateHelpers.revertDefaultAxisMinMax()),this.ctx.updateHelpers._updateSeries(a,n.config.chart.animations.dynamicAnimation.enabled))}},{key:"emptyCollapsedSeries",value:function(t){for(var e=this.w,i=0;i<t.length;i++)e.globals.collapsedSeriesIndices.indexOf(i)>-1&&(t[i].data=[]);return t}},{key:"toggleSeriesOnHover",value:function(t,e){var i=this.w;e||(e=t.target);var n=i.globals.dom.baseEl.querySelectorAll(".apexcharts-series, .apexcharts-datalabels");if("mousemove"===t.type){var a=parseInt(e.getAttribute("rel"),10)-1,r=null,s=null;i.globals.axisCharts||"radialBar"===i.config.chart.type?i.globals.axisCharts?(r=i.globals.dom.baseEl.querySelector(".apexcharts-series[data\\:realIndex='".concat(a,"']")),s=i.globals.dom.baseEl.querySelector(".apexcharts-datalabels[data\\:realIndex='".concat(a,"']"))):r=i.globals.dom.baseEl.querySelector(".apexcharts-series[rel='".concat(a+1,"']")):r=i.globals.dom.baseEl.querySelector(".apexcharts-series[rel='".concat(a+1,"'] path"));for(var o=0;o<n.length;o++)n[o].classList.add(this.legendInactiveClass);null!==r&&(i.globals.axisCharts||r.parentNode.classList.remove(this.legendInactiveClass),r.classList.remove(this.legendInactiveClass),null!==s&&s.classList.remove(this.legendInactiveClass))}else if("mouseout"===t.type)for(var l=0;l<n.length;l++)n[l].classList.remove(this.legendInactiveClass)}},{key:"highlightRangeInSeries",value:function(t,e){var i=this,n=this.w,a=n.globals.dom.baseEl.getElementsByClassName("apexcharts-heatmap-rect"),r=function(t){for(var e=0;e<a.length;e++)a[e].classList[t](i.legendInactiveClass)};if("mousemove"===t.type){var s=parseInt(e.getAttribute("rel"),10)-1;r("add"),function(t){for(var e=0;e<a.length;e++){var n=parseInt(a[e].getAttribute("val"),10);n>=t.from&&n<=t.to&&a[e].classList.remove(i.legendInactiveClass)}}(n.config.plotOptions.heatmap.colorScale.ranges[s])}else"mouseout"===t.type&&r("remove")}},{key:"getActiveConfigSeriesIndex",value:function(){var t=arguments.length>0&&void 0!==arguments[0]&&arguments[0],e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"asc",i=this.w,n=0;if(i.config.series.length>1)for(var a=i.config.series.map((function(e,n){var a=!1;return t&&(a="bar"===i.config.series[n].type||"column"===i.config.series[n].type),e.data&&e.data.length>0&&!a?n:-1})),r="asc"===e?0:a.length-1;"asc"===e?r<a.length:r>=0;"asc"===e?r++:r--)if(-1!==a[r]){n=a[r];break}return n}},{key:"getPreviousPaths",value:function(){var t=this.w;function e(e,i,n){for(var a=e[i].childNodes,r={type:n,paths:[],realIndex:e[i].getAttribute("data:realIndex")},s=0;s<a.length;s++)if(a[s].hasAttribute("pathTo")){var o=a[s].getAttribute("pathTo");r.paths.push({d:o})}t.globals.previousPaths.push(r)}t.globals.previousPaths=[],["line","area","bar","rangebar","candlestick","radar"].forEach((function(i){for(var n,a=(n=i,t.globals.dom.baseEl.querySelectorAll(".apexcharts-".concat(n,"-series .apexcharts-series"))),r=0;r<a.length;r++)e(a,r,i)})),this.handlePrevBubbleScatterPaths("bubble"),this.handlePrevBubbleScatterPaths("scatter");var i=t.globals.dom.baseEl.querySelectorAll(".apexcharts-".concat(t.config.chart.type," .apexcharts-series"));if(i.length>0)for(var n=function(e){for(var i=t.globals.dom.baseEl.querySelectorAll(".apexcharts-".concat(t.config.chart.type," .apexcharts-series[data\\:realIndex='").concat(e,"'] rect")),n=[],a=function(t){var e=function(e){return i[t].getAttribute(e)},a={x:parseFloat(e("x")),y:parseFloat(e("y")),width:parseFloat(e("width")),height:parseFloat(e("height"))};n.push({rect:a,color:i[t].getAttribute("color")})},r=0;r<i.length;r++)a(r);t.globals.previousPaths.push(n)},a=0;a<i.length;a++)n(a);t.globals.axisCharts||(t.globals.previousPaths=t.globals.series)}},{key:"handlePrevBubbleScatterPaths",value:function(t){var e=this.w,i=e.globals.dom.baseEl.querySelectorAll(".apexcharts-".concat(t,"-series .apexcharts-series"));if(i.length>0)for(var n=0;n<i.length;n++){for(var a=e.globals.dom.baseEl.querySelectorAll(".apexcharts-".concat(t,"-series .apexcharts-series[data\\:realIndex='").concat(n,"'] circle")),r=[],s=0;s<a.length;s++)r.push({x:a[s].getAttribute("cx"),y:a[s].getAttribute("cy"),r:a[s].getAttribute("r")});e.globals.previousPaths.push(r)}}},{key:"clearPreviousPaths",value:function(){var t=this.w;t.globals.previousPaths=[],t.globals.allSeriesCollapsed=!1}},{key:"handleNoData",value:function(){var t=this.w,e=t.config.noData,i=new w(this.ctx),n=t.globals.svgWidth/2,a=t.globals.svgHeight/2,r="middle";if(t.globals.noData=!0,t.globals.animationEnded=!0,"left"===e.align?(n=10,r="start"):"right"===e.align&&(n=t.globals.svgWidth-10,r="end"),"top"===e.verticalAlign?a=50:"bottom"===e.verticalAlign&&(a=t.globals.svgHeight-50),n+=e.offsetX,a=a+parseInt(e.style.fontSize,10)+2+e.offsetY,void 0!==e.text&&""!==e.text){var s=i.drawText({x:n,y:a,text:e.text,textAnchor:r,fontSize:e.style.fontSize,fontFamily:e.style.fontFamily,foreColor:e.style.color,opacity:1,class:"apexcharts-text-nodata"});t.globals.dom.Paper.add(s)}}},{key:"setNullSeriesToZeroValues",value:function(t){for(var e=this.w,i=0;i<t.length;i++)if(0===t[i].length)for(var n=0;n<t[e.globals.maxValsInArrayIndex].length;n++)t[i].push(0);return t}},{key:"hasAllSeriesEqualX",value:function(){for(var t=!0,e=this.w,i=this.filteredSeriesX(),n=0;n<i.length-1;n++)if(i[n][0]!==i[n+1][0]){t=!1;break}return e.globals.allSeriesHasEqualX=t,t}},{key:"filteredSeriesX",value:function(){return this.w.globals.seriesX.map((function(t){return t.length>0?t:[]}))}}]),t}(),F=function(){function t(e){o(this,t),this.w=e.w,this.barCtx=e}return c(t,[{key:"initVariables",value:function(t){var e=this.w;this.barCtx.series=t,this.barCtx.totalItems=0,this.barCtx.seriesLen=0,this.barCtx.visibleI=-1,this.barCtx.visibleItems=1;for(var i=0;i<t.length;i++)if(t[i].length>0&&(this.barCtx.seriesLen=this.barCtx.seriesLen+1,this.barCtx.totalItems+=t[i].length),e.globals.isXNumeric)for(var n=0;n<t[i].length;n++)e.globals.seriesX[i][n]>e.globals.minX&&e.globals.seriesX[i][n]<e.globals.maxX&&this.barCtx.visibleItems++;else this.barCtx.visibleItems=e.globals.dataPoints;0===this.barCtx.seriesLen&&(this.barCtx.seriesLen=1),this.barCtx.zeroSerieses=[],this.barCtx.radiusOnSeriesNumber=t.length-1,e.globals.comboCharts||this.checkZeroSeries({series:t})}},{key:"initialPositions",value:function(){var t,e,i,n,a,r,s,o,l=this.w,c=l.globals.dataPoints;this.barCtx.isRangeBar&&(c=l.globals.labels.length);var h=this.barCtx.seriesLen;if(l.config.plotOptions.bar.rangeBarGroupRows&&(h=1),this.barCtx.isHorizontal)a=(i=l.globals.gridHeight/c)/h,l.globals.isXNumeric&&(a=(i=l.globals.gridHeight/this.barCtx.totalItems)/this.barCtx.seriesLen),a=a*parseInt(this.barCtx.barOptions.barHeight,10)/100,o=this.barCtx.baseLineInvertedY+l.globals.padHorizontal+(this.barCtx.isReversed?l.globals.gridWidth:0)-(this.barCtx.isReversed?2*this.barCtx.baseLineInvertedY:0),e=(i-a*this.barCtx.seriesLen)/2;else{if(n=l.globals.gridWidth/this.barCtx.visibleItems,l.config.xaxis.convertedCatToNumeric&&(n=l.globals.gridWidth/l.globals.dataPoints),r=n/this.barCtx.seriesLen*parseInt(this.barCtx.barOptions.columnWidth,10)/100,l.globals.isXNumeric){var u=this.barCtx.xRatio;l.config.xaxis.convertedCatToNumeric&&(u=this.barCtx.initialXRatio),l.globals.minXDiff&&.5!==l.globals.minXDiff&&l.globals.minXDiff/u>0&&(n=l.globals.minXDiff/u),(r=n/this.barCtx.seriesLen*parseInt(this.barCtx.barOptions.columnWidth,10)/100)<1&&(r=1)}s=l.globals.gridHeight-this.barCtx.baseLineY[this.barCtx.yaxisIndex]-(this.barCtx.isReversed?l.globals.gridHeight:0)+(this.barCtx.isReversed?2*this.barCtx.baseLineY[this.barCtx.yaxisIndex]:0),t=l.globals.padHorizontal+(n-r*this.barCtx.seriesLen)/2}return{x:t,y:e,yDivision:i,xDivision:n,barHeight:a,barWidth:r,zeroH:s,zeroW:o}}},{key:"getPathFillColor",value:function(t,e,i,n){var a=this.w,r=new M(this.barCtx.ctx),s=null,o=this.barCtx.barOptions.distributed?i:e;return this.barCtx.barOptions.colors.ranges.length>0&&this.barCtx.barOptions.colors.ranges.map((function(n){t[e][i]>=n.from&&t[e][i]<=n.to&&(s=n.color)})),a.config.series[e].data[i]&&a.config.series[e].data[i].fillColor&&(s=a.config.series[e].data[i].fillColor),r.fillPath({seriesNumber:this.barCtx.barOptions.distributed?o:n,dataPointIndex:i,color:s,value:t[e][i]})}},{key:"getStrokeWidth",value:function(t,e,i){var n=0,a=this.w;return void 0===this.barCtx.series[t][e]||null===this.barCtx.series[t][e]?this.barCtx.isNullValue=!0:this.barCtx.isNullValue=!1,a.config.stroke.show&&(this.barCtx.isNullValue||(n=Array.isArray(this.barCtx.strokeWidth)?this.barCtx.strokeWidth[i]:this.barCtx.strokeWidth)),n}},{key:"barBackground",value:function(t){var e=t.j,i=t.i,n=t.x1,a=t.x2,r=t.y1,s=t.y2,o=t.elSeries,l=this.w,c=new w(this.barCtx.ctx),h=new N(this.barCtx.ctx).getActiveConfigSeriesIndex();if(this.barCtx.barOptions.colors.backgroundBarColors.length>0&&h===i){e>=this.barCtx.barOptions.colors.backgroundBarColors.length&&(e-=this.barCtx.barOptions.colors.backgroundBarColors.length);var u=this.barCtx.barOptions.colors.backgroundBarColors[e],d=c.drawRect(void 0!==n?n:0,void 0!==r?r:0,void 0!==a?a:l.globals.gridWidth,void 0!==s?s:l.globals.gridHeight,this.barCtx.barOptions.colors.backgroundBarRadius,u,this.barCtx.barOptions.colors.backgroundBarOpacity);o.add(d),d.node.classList.add("apexcharts-backgroundBar")}}},{key:"getColumnPaths",value:function(t){var e=t.barWidth,i=t.barXPosition,n=t.yRatio,a=t.y1,r=t.y2,s=t.strokeWidth,o=t.series,l=t.realIndex,c=t.i,h=t.j,u=t.w,d=new w(this.barCtx.ctx);(s=Array.isArray(s)?s[l]:s)||(s=0);var f={barWidth:e,strokeWidth:s,yRatio:n,barXPosition:i,y1:a,y2:r},g=this.getRoundedBars(u,f,o,c,h),p=i,m=i+e,v=d.move(p,a),x=d.move(p,a),b=d.line(m-s,a);return u.globals.previousPaths.length>0&&(x=this.barCtx.getPreviousPath(l,h,!1)),v=v+d.line(p,g.y2)+g.pathWithRadius+d.line(m-s,g.y2)+b+b+"z",x=x+d.line(p,a)+b+b+b+b+b+d.line(p,a),u.config.chart.stacked&&(this.barCtx.yArrj.push(g.y2),this.barCtx.yArrjF.push(Math.abs(a-g.y2)),this.barCtx.yArrjVal.push(this.barCtx.series[c][h])),{pathTo:v,pathFrom:x}}},{key:"getBarpaths",value:function(t){var e=t.barYPosition,i=t.barHeight,n=t.x1,a=t.x2,r=t.strokeWidth,s=t.series,o=t.realIndex,l=t.i,c=t.j,h=t.w,u=new w(this.barCtx.ctx);(r=Array.isArray(r)?r[o]:r)||(r=0);var d={barHeight:i,strokeWidth:r,barYPosition:e,x2:a,x1:n},f=this.getRoundedBars(h,d,s,l,c),g=u.move(n,e),p=u.move(n,e);h.globals.previousPaths.length>0&&(p=this.barCtx.getPreviousPath(o,c,!1));var m=e,v=e+i,x=u.line(n,v-r);return g=g+u.line(f.x2,m)+f.pathWithRadius+u.line(f.x2,v-r)+x+x+"z",p=p+u.line(n,m)+x+x+x+x+x+u.line(n,m),h.config.chart.stacked&&(this.barCtx.xArrj.push(f.x2),this.barCtx.xArrjF.push(Math.abs(n-f.x2)),this.barCtx.xArrjVal.push(this.barCtx.series[l][c])),{pathTo:g,pathFrom:p}}},{key:"getRoundedBars",value:function(t,e,i,n,a){var r=new w(this.barCtx.ctx),s=0,o=t.config.plotOptions.bar.borderRadius,l=Array.isArray(o);if(s=l?o[n>o.length-1?o.length-1:n]:o,t.config.chart.stacked&&i.length>1&&n!==this.barCtx.radiusOnSeriesNumber&&!l&&(s=0),this.barCtx.isHorizontal){var c="",h=e.x2;if(Math.abs(e.x1-e.x2)<s&&(s=Math.abs(e.x1-e.x2)),void 0!==i[n][a]||null!==i[n][a]){var u=this.barCtx.isReversed?i[n][a]>0:i[n][a]<0;u&&(s*=-1),h-=s,c=r.quadraticCurve(h+s,e.barYPosition,h+s,e.barYPosition+(u?-1*s:s))+r.line(h+s,e.barYPosition+e.barHeight-e.strokeWidth-(u?-1*s:s))+r.quadraticCurve(h+s,e.barYPosition+e.barHeight-e.strokeWidth,h,e.barYPosition+e.barHeight-e.strokeWidth)}return{pathWithRadius:c,x2:h}}var d="",f=e.y2;if(Math.abs(e.y1-e.y2)<s&&(s=Math.abs(e.y1-e.y2)),void 0!==i[n][a]||null!==i[n][a]){var g=i[n][a]<0;g&&(s*=-1),f+=s,d=r.quadraticCurve(e.barXPosition,f-s,e.barXPosition+(g?-1*s:s),f-s)+r.line(e.barXPosition+e.barWidth-e.strokeWidth-(g?-1*s:s),f-s)+r.quadraticCurve(e.barXPosition+e.barWidth-e.strokeWidth,f-s,e.barXPosition+e.barWidth-e.strokeWidth,f)}return{pathWithRadius:d,y2:f}}},{key:"checkZeroSeries",value:function(t){for(var e=t.series,i=this.w,n=0;n<e.length;n++){for(var a=0,r=0;r<e[i.globals.maxValsInArrayIndex].length;r++)a+=e[n][r];0===a&&this.barCtx.zeroSerieses.push(n)}for(var s=e.length-1;s>=0;s--)this.barCtx.zeroSerieses.indexOf(s)>-1&&s===this.radiusOnSeriesNumber&&(this.barCtx.radiusOnSeriesNumber-=1);for(var o=e.length-1;o>=0;o--)i.globals.collapsedSeriesIndices.indexOf(this.barCtx.radiusOnSeriesNumber)>-1&&(this.barCtx.radiusOnSeriesNumber-=1)}},{key:"getXForValue",value:function(t,e){var i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],n=i?e:null;return null!=t&&(n=e+t/this.barCtx.invertedYRatio-2*(this.barCtx.isReversed?t/this.barCtx.invertedYRatio:0)),n}},{key:"getYForValue",value:function(t,e){var i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],n=i?e:null;return null!=t&&(n=e-t/this.barCtx.yRatio[this.barCtx.yaxisIndex]+2*(this.barCtx.isReversed?t/this.barCtx.yRatio[this.barCtx.yaxisIndex]:0)),n}},{key:"getGoalValues",value:function(t,e,i,n,a){var r=this,s=this.w,o=[];return s.globals.seriesGoals[n]&&s.globals.seriesGoals[n][a]&&Array.isArray(s.globals.seriesGoals[n][a])&&s.globals.seriesGoals[n][a].forEach((function(n){var a;o.push((h(a={},t,"x"===t?r.getXForValue(n.value,e,!1):r.getYForValue(n.value,i,!1)),h(a,"attrs",n),a))})),o}},{key:"drawGoalLine",value:function(t){var e=t.barXPosition,i=t.barYPosition,n=t.goalX,a=t.goalY,r=t.barWidth,s=t.barHeight,o=new w(this.barCtx.ctx),l=o.group({className:"apexcharts-bar-goals-groups"}),c=null;return this.barCtx.isHorizontal?Array.isArray(n)&&n.forEach((function(t){var e=void 0!==t.attrs.strokeHeight?t.attrs.strokeHeight:s/2,n=i+e+s/2;c=o.drawLine(t.x,n-2*e,t.x,n,t.attrs.strokeColor?t.attrs.strokeColor:void 0,t.attrs.strokeDashArray,t.attrs.strokeWidth?t.attrs.strokeWidth:2,t.attrs.strokeLineCap),l.add(c)})):Array.isArray(a)&&a.forEach((function(t){var i=void 0!==t.attrs.strokeWidth?t.attrs.strokeWidth:r/2,n=e+i+r/2;c=o.drawLine(n-2*i,t.y,n,t.y,t.attrs.strokeColor?t.attrs.strokeColor:void 0,t.attrs.strokeDashArray,t.attrs.strokeHeight?t.attrs.strokeHeight:2,t.attrs.strokeLineCap),l.add(c)})),l}}]),t}(),R=function(){function t(e,i){o(this,t),this.ctx=e,this.w=e.w;var n=this.w;this.barOptions=n.config.plotOptions.bar,this.isHorizontal=this.barOptions.horizontal,this.strokeWidth=n.config.stroke.width,this.isNullValue=!1,this.isRangeBar=n.globals.seriesRangeBar.length&&this.isHorizontal,this.xyRatios=i,null!==this.xyRatios&&(this.xRatio=i.xRatio,this.initialXRatio=i.initialXRatio,this.yRatio=i.yRatio,this.invertedXRatio=i.invertedXRatio,this.invertedYRatio=i.invertedYRatio,this.baseLineY=i.baseLineY,this.baseLineInvertedY=i.baseLineInvertedY),this.yaxisIndex=0,this.seriesLen=0,this.barHelpers=new F(this)}return c(t,[{key:"draw",value:function(t,e){var i=this.w,n=new w(this.ctx),a=new S(this.ctx,i);t=a.getLogSeries(t),this.series=t,this.yRatio=a.getLogYRatios(this.yRatio),this.barHelpers.initVariables(t);var s=n.group({class:"apexcharts-bar-series apexcharts-plot-series"});i.config.dataLabels.enabled&&this.totalItems>this.barOptions.dataLabels.maxItems&&console.warn("WARNING: DataLabels are enabled but there are too many to display. This may cause performance issue when rendering.");for(var o=0,l=0;o<t.length;o++,l++){var c,h,u,d,f=void 0,g=void 0,p=[],m=[],v=i.globals.comboCharts?e[o]:o,b=n.group({class:"apexcharts-series",rel:o+1,seriesName:x.escapeString(i.globals.seriesNames[v]),"data:realIndex":v});this.ctx.series.addCollapsedClassToSeries(b,v),t[o].length>0&&(this.visibleI=this.visibleI+1);var y=0,k=0;this.yRatio.length>1&&(this.yaxisIndex=v),this.isReversed=i.config.yaxis[this.yaxisIndex]&&i.config.yaxis[this.yaxisIndex].reversed;var A=this.barHelpers.initialPositions();g=A.y,y=A.barHeight,h=A.yDivision,d=A.zeroW,f=A.x,k=A.barWidth,c=A.xDivision,u=A.zeroH,this.horizontal||m.push(f+k/2);for(var _=n.group({class:"apexcharts-datalabels","data:realIndex":v}),C=n.group({class:"apexcharts-bar-goals-markers",style:"pointer-events: none"}),E=0;E<i.globals.dataPoints;E++){var T=this.barHelpers.getStrokeWidth(o,E,v),P=null,M={indexes:{i:o,j:E,realIndex:v,bc:l},x:f,y:g,strokeWidth:T,elSeries:b};this.isHorizontal?(P=this.drawBarPaths(r(r({},M),{},{barHeight:y,zeroW:d,yDivision:h})),k=this.series[o][E]/this.invertedYRatio):(P=this.drawColumnPaths(r(r({},M),{},{xDivision:c,barWidth:k,zeroH:u})),y=this.series[o][E]/this.yRatio[this.yaxisIndex]);var L=this.barHelpers.drawGoalLine({barXPosition:P.barXPosition,barYPosition:P.barYPosition,goalX:P.goalX,goalY:P.goalY,barHeight:y,barWidth:k});L&&C.add(L),g=P.y,f=P.x,E>0&&m.push(f+k/2),p.push(g);var D=this.barHelpers.getPathFillColor(t,o,E,v);this.renderSeries({realIndex:v,pathFill:D,j:E,i:o,pathFrom:P.pathFrom,pathTo:P.pathTo,strokeWidth:T,elSeries:b,x:f,y:g,series:t,barHeight:y,barWidth:k,elDataLabelsWrap:_,elGoalsMarkers:C,visibleSeries:this.visibleI,type:"bar"})}i.globals.seriesXvalues[v]=m,i.globals.seriesYvalues[v]=p,s.add(b)}return s}},{key:"renderSeries",value:function(t){var e=t.realIndex,i=t.pathFill,n=t.lineFill,a=t.j,r=t.i,s=t.pathFrom,o=t.pathTo,l=t.strokeWidth,c=t.elSeries,h=t.x,u=t.y,d=t.y1,f=t.y2,g=t.series,p=t.barHeight,m=t.barWidth,v=t.barYPosition,x=t.elDataLabelsWrap,b=t.elGoalsMarkers,k=t.visibleSeries,A=t.type,S=this.w,_=new w(this.ctx);n||(n=this.barOptions.distributed?S.globals.stroke.colors[a]:S.globals.stroke.colors[e]),S.config.series[r].data[a]&&S.config.series[r].data[a].strokeColor&&(n=S.config.series[r].data[a].strokeColor),this.isNullValue&&(i="none");var C=a/S.config.chart.animations.animateGradually.delay*(S.config.chart.animations.speed/S.globals.dataPoints)/2.4,E=_.renderPaths({i:r,j:a,realIndex:e,pathFrom:s,pathTo:o,stroke:n,strokeWidth:l,strokeLineCap:S.config.stroke.lineCap,fill:i,animationDelay:C,initialSpeed:S.config.chart.animations.speed,dataChangeSpeed:S.config.chart.animations.dynamicAnimation.speed,className:"apexcharts-".concat(A,"-area")});E.attr("clip-path","url(#gridRectMask".concat(S.globals.cuid,")"));var T=S.config.forecastDataPoints;T.count>0&&a>=S.globals.dataPoints-T.count&&(E.node.setAttribute("stroke-dasharray",T.dashArray),E.node.setAttribute("stroke-width",T.strokeWidth),E.node.setAttribute("fill-opacity",T.fillOpacity)),void 0!==d&&void 0!==f&&(E.attr("data-range-y1",d),E.attr("data-range-y2",f)),new y(this.ctx).setSelectionFilter(E,e,a),c.add(E);var P=new O(this).handleBarDataLabels({x:h,y:u,y1:d,y2:f,i:r,j:a,series:g,realIndex:e,barHeight:p,barWidth:m,barYPosition:v,renderedPath:E,visibleSeries:k});return null!==P&&x.add(P),c.add(x),b&&c.add(b),c}},{key:"drawBarPaths",value:function(t){var e=t.indexes,i=t.barHeight,n=t.strokeWidth,a=t.zeroW,r=t.x,s=t.y,o=t.yDivision,l=t.elSeries,c=this.w,h=e.i,u=e.j;c.globals.isXNumeric&&(s=(c.globals.seriesX[h][u]-c.globals.minX)/this.invertedXRatio-i);var d=s+i*this.visibleI;r=this.barHelpers.getXForValue(this.series[h][u],a);var f=this.barHelpers.getBarpaths({barYPosition:d,barHeight:i,x1:a,x2:r,strokeWidth:n,series:this.series,realIndex:e.realIndex,i:h,j:u,w:c});return c.globals.isXNumeric||(s+=o),this.barHelpers.barBackground({j:u,i:h,y1:d-i*this.visibleI,y2:i*this.seriesLen,elSeries:l}),{pathTo:f.pathTo,pathFrom:f.pathFrom,x:r,y:s,goalX:this.barHelpers.getGoalValues("x",a,null,h,u),barYPosition:d}}},{key:"drawColumnPaths",value:function(t){var e=t.indexes,i=t.x,n=t.y,a=t.xDivision,r=t.barWidth,s=t.zeroH,o=t.strokeWidth,l=t.elSeries,c=this.w,h=e.realIndex,u=e.i,d=e.j,f=e.bc;if(c.globals.isXNumeric){var g=h;c.globals.seriesX[h].length||(g=c.globals.maxValsInArrayIndex),i=(c.globals.seriesX[g][d]-c.globals.minX)/this.xRatio-r*this.seriesLen/2}var p=i+r*this.visibleI;n=this.barHelpers.getYForValue(this.series[u][d],s);var m=this.barHelpers.getColumnPaths({barXPosition:p,barWidth:r,y1:s,y2:n,strokeWidth:o,series:this.series,realIndex:e.realIndex,i:u,j:d,w:c});return c.globals.isXNumeric||(i+=a),this.barHelpers.barBackground({bc:f,j:d,i:u,x1:p-o/2-r*this.visibleI,x2:r*this.seriesLen+o/2,elSeries:l}),{pathTo:m.pathTo,pathFrom:m.pathFrom,x:i,y:n,goalY:this.barHelpers.getGoalValues("y",null,s,u,d),barXPosition:p}}},{key:"getPreviousPath",value:function(t,e){for(var i,n=this.w,a=0;a<n.globals.previousPaths.length;a++){var r=n.globals.previousPaths[a];r.paths&&r.paths.length>0&&parseInt(r.realIndex,10)===parseInt(t,10)&&void 0!==n.globals.previousPaths[a].paths[e]&&(i=n.globals.previousPaths[a].paths[e].d)}return i}}]),t}(),z=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w,this.months31=[1,3,5,7,8,10,12],this.months30=[2,4,6,9,11],this.daysCntOfYear=[0,31,59,90,120,151,181,212,243,273,304,334]}return c(t,[{key:"isValidDate",value:function(t){return!isNaN(this.parseDate(t))}},{key:"getTimeStamp",value:function(t){return Date.parse(t)?this.w.config.xaxis.labels.datetimeUTC?new Date(new Date(t).toISOString().substr(0,25)).getTime():new Date(t).getTime():t}},{key:"getDate",value:function(t){return this.w.config.xaxis.labels.datetimeUTC?new Date(new Date(t).toUTCString()):new Date(t)}},{key:"parseDate",value:function(t){var e=Date.parse(t);if(!isNaN(e))return this.getTimeStamp(t);var i=Date.parse(t.replace(/-/g,"/").replace(/[a-z]+/gi," "));return this.getTimeStamp(i)}},{key:"parseDateWithTimezone",value:function(t){return Date.parse(t.replace(/-/g,"/").replace(/[a-z]+/gi," "))}},{key:"formatDate",value:function(t,e){var i=this.w.globals.locale,n=this.w.config.xaxis.labels.datetimeUTC,a=["\0"].concat(m(i.months)),r=[""].concat(m(i.shortMonths)),s=[""].concat(m(i.days)),o=[""].concat(m(i.shortDays));function l(t,e){var i=t+"";for(e=e||2;i.length<e;)i="0"+i;return i}var c=n?t.getUTCFullYear():t.getFullYear();e=(e=(e=e.replace(/(^|[^\\])yyyy+/g,"$1"+c)).replace(/(^|[^\\])yy/g,"$1"+c.toString().substr(2,2))).replace(/(^|[^\\])y/g,"$1"+c);var h=(n?t.getUTCMonth():t.getMonth())+1;e=(e=(e=(e=e.replace(/(^|[^\\])MMMM+/g,"$1"+a[0])).replace(/(^|[^\\])MMM/g,"$1"+r[0])).replace(/(^|[^\\])MM/g,"$1"+l(h))).replace(/(^|[^\\])M/g,"$1"+h);var u=n?t.getUTCDate():t.getDate();e=(e=(e=(e=e.replace(/(^|[^\\])dddd+/g,"$1"+s[0])).replace(/(^|[^\\])ddd/g,"$1"+o[0])).replace(/(^|[^\\])dd/g,"$1"+l(u))).replace(/(^|[^\\])d/g,"$1"+u);var d=n?t.getUTCHours():t.getHours(),f=d>12?d-12:0===d?12:d;e=(e=(e=(e=e.replace(/(^|[^\\])HH+/g,"$1"+l(d))).replace(/(^|[^\\])H/g,"$1"+d)).replace(/(^|[^\\])hh+/g,"$1"+l(f))).replace(/(^|[^\\])h/g,"$1"+f);var g=n?t.getUTCMinutes():t.getMinutes();e=(e=e.replace(/(^|[^\\])mm+/g,"$1"+l(g))).replace(/(^|[^\\])m/g,"$1"+g);var p=n?t.getUTCSeconds():t.getSeconds();e=(e=e.replace(/(^|[^\\])ss+/g,"$1"+l(p))).replace(/(^|[^\\])s/g,"$1"+p);var v=n?t.getUTCMilliseconds():t.getMilliseconds();e=e.replace(/(^|[^\\])fff+/g,"$1"+l(v,3)),v=Math.round(v/10),e=e.replace(/(^|[^\\])ff/g,"$1"+l(v)),v=Math.round(v/10);var x=d<12?"AM":"PM";e=(e=(e=e.replace(/(^|[^\\])f/g,"$1"+v)).replace(/(^|[^\\])TT+/g,"$1"+x)).replace(/(^|[^\\])T/g,"$1"+x.charAt(0));var b=x.toLowerCase();e=(e=e.replace(/(^|[^\\])tt+/g,"$1"+b)).replace(/(^|[^\\])t/g,"$1"+b.charAt(0));var y=-t.getTimezoneOffset(),w=n||!y?"Z":y>0?"+":"-";if(!n){var k=(y=Math.abs(y))%60;w+=l(Math.floor(y/60))+":"+l(k)}e=e.replace(/(^|[^\\])K/g,"$1"+w);var A=(n?t.getUTCDay():t.getDay())+1;return(e=(e=(e=(e=e.replace(new RegExp(s[0],"g"),s[A])).replace(new RegExp(o[0],"g"),o[A])).replace(new RegExp(a[0],"g"),a[h])).replace(new RegExp(r[0],"g"),r[h])).replace(/\\(.)/g,"$1")}},{key:"getTimeUnitsfromTimestamp",value:function(t,e,i){var n=this.w;void 0!==n.config.xaxis.min&&(t=n.config.xaxis.min),void 0!==n.config.xaxis.max&&(e=n.config.xaxis.max);var a=this.getDate(t),r=this.getDate(e),s=this.formatDate(a,"yyyy MM dd HH mm ss fff").split(" "),o=this.formatDate(r,"yyyy MM dd HH mm ss fff").split(" ");return{minMillisecond:parseInt(s[6],10),maxMillisecond:parseInt(o[6],10),minSecond:parseInt(s[5],10),maxSecond:parseInt(o[5],10),minMinute:parseInt(s[4],10),maxMinute:parseInt(o[4],10),minHour:parseInt(s[3],10),maxHour:parseInt(o[3],10),minDate:parseInt(s[2],10),maxDate:parseInt(o[2],10),minMonth:parseInt(s[1],10)-1,maxMonth:parseInt(o[1],10)-1,minYear:parseInt(s[0],10),maxYear:parseInt(o[0],10)}}},{key:"isLeapYear",value:function(t){return t%4==0&&t%100!=0||t%400==0}},{key:"calculcateLastDaysOfMonth",value:function(t,e,i){return this.determineDaysOfMonths(t,e)-i}},{key:"determineDaysOfYear",value:function(t){var e=365;return this.isLeapYear(t)&&(e=366),e}},{key:"determineRemainingDaysOfYear",value:function(t,e,i){var n=this.daysCntOfYear[e]+i;return e>1&&this.isLeapYear()&&n++,n}},{key:"determineDaysOfMonths",value:function(t,e){var i=30;switch(t=x.monthMod(t),!0){case this.months30.indexOf(t)>-1:2===t&&(i=this.isLeapYear(e)?29:28);break;case this.months31.indexOf(t)>-1:default:i=31}return i}}]),t}(),H=function(t){u(i,R);var e=p(i);function i(){return o(this,i),e.apply(this,arguments)}return c(i,[{key:"draw",value:function(t,e){var i=this.w,n=new w(this.ctx);this.rangeBarOptions=this.w.config.plotOptions.rangeBar,this.series=t,this.seriesRangeStart=i.globals.seriesRangeStart,this.seriesRangeEnd=i.globals.seriesRangeEnd,this.barHelpers.initVariables(t);for(var a=n.group({class:"apexcharts-rangebar-series apexcharts-plot-series"}),s=0;s<t.length;s++){var o,l,c,h=void 0,u=void 0,d=void 0,f=i.globals.comboCharts?e[s]:s,g=n.group({class:"apexcharts-series",seriesName:x.escapeString(i.globals.seriesNames[f]),rel:s+1,"data:realIndex":f});this.ctx.series.addCollapsedClassToSeries(g,f),t[s].length>0&&(this.visibleI=this.visibleI+1);var p=0,m=0;this.yRatio.length>1&&(this.yaxisIndex=f);var v=this.barHelpers.initialPositions();u=v.y,c=v.zeroW,h=v.x,m=v.barWidth,o=v.xDivision,l=v.zeroH;for(var b=n.group({class:"apexcharts-datalabels","data:realIndex":f}),y=n.group({class:"apexcharts-rangebar-goals-markers",style:"pointer-events: none"}),k=0;k<i.globals.dataPoints;k++){var A=this.barHelpers.getStrokeWidth(s,k,f),S=this.seriesRangeStart[s][k],_=this.seriesRangeEnd[s][k],C=null,E=null,T={x:h,y:u,strokeWidth:A,elSeries:g};if(d=v.yDivision,p=v.barHeight,this.isHorizontal){E=u+p*this.visibleI;var P=this.seriesLen;i.config.plotOptions.bar.rangeBarGroupRows&&(P=1);var M=(d-p*P)/2;if(void 0===i.config.series[s].data[k])break;if(i.config.series[s].data[k].x){var L=this.detectOverlappingBars({i:s,j:k,barYPosition:E,srty:M,barHeight:p,yDivision:d,initPositions:v});p=L.barHeight,E=L.barYPosition}m=(C=this.drawRangeBarPaths(r({indexes:{i:s,j:k,realIndex:f},barHeight:p,barYPosition:E,zeroW:c,yDivision:d,y1:S,y2:_},T))).barWidth}else p=(C=this.drawRangeColumnPaths(r({indexes:{i:s,j:k,realIndex:f},zeroH:l,barWidth:m,xDivision:o},T))).barHeight;var D=this.barHelpers.drawGoalLine({barXPosition:C.barXPosition,barYPosition:E,goalX:C.goalX,goalY:C.goalY,barHeight:p,barWidth:m});D&&y.add(D),u=C.y,h=C.x;var I=this.barHelpers.getPathFillColor(t,s,k,f),O=i.globals.stroke.colors[f];this.renderSeries({realIndex:f,pathFill:I,lineFill:O,j:k,i:s,x:h,y:u,y1:S,y2:_,pathFrom:C.pathFrom,pathTo:C.pathTo,strokeWidth:A,elSeries:g,series:t,barHeight:p,barYPosition:E,barWidth:m,elDataLabelsWrap:b,elGoalsMarkers:y,visibleSeries:this.visibleI,type:"rangebar"})}a.add(g)}return a}},{key:"detectOverlappingBars",value:function(t){var e=t.i,i=t.j,n=t.barYPosition,a=t.srty,r=t.barHeight,s=t.yDivision,o=t.initPositions,l=this.w,c=[],h=l.config.series[e].data[i].rangeName,u=l.config.series[e].data[i].x,d=l.globals.labels.indexOf(u),f=l.globals.seriesRangeBar[e].findIndex((function(t){return t.x===u&&t.overlaps.length>0}));return n=l.config.plotOptions.bar.rangeBarGroupRows?a+s*d:a+r*this.visibleI+s*d,f>-1&&!l.config.plotOptions.bar.rangeBarOverlap&&(c=l.globals.seriesRangeBar[e][f].overlaps).indexOf(h)>-1&&(n=(r=o.barHeight/c.length)*this.visibleI+s*(100-parseInt(this.barOptions.barHeight,10))/100/2+r*(this.visibleI+c.indexOf(h))+s*d),{barYPosition:n,barHeight:r}}},{key:"drawRangeColumnPaths",value:function(t){var e=t.indexes,i=t.x;t.strokeWidth;var n=t.xDivision,a=t.barWidth,r=t.zeroH,s=this.w,o=e.i,l=e.j,c=this.yRatio[this.yaxisIndex],h=e.realIndex,u=this.getRangeValue(h,l),d=Math.min(u.start,u.end),f=Math.max(u.start,u.end);s.globals.isXNumeric&&(i=(s.globals.seriesX[o][l]-s.globals.minX)/this.xRatio-a/2);var g=i+a*this.visibleI;void 0===this.series[o][l]||null===this.series[o][l]?d=r:(d=r-d/c,f=r-f/c);var p=Math.abs(f-d),m=this.barHelpers.getColumnPaths({barXPosition:g,barWidth:a,y1:d,y2:f,strokeWidth:this.strokeWidth,series:this.seriesRangeEnd,realIndex:e.realIndex,i:h,j:l,w:s});return s.globals.isXNumeric||(i+=n),{pathTo:m.pathTo,pathFrom:m.pathFrom,barHeight:p,x:i,y:f,goalY:this.barHelpers.getGoalValues("y",null,r,o,l),barXPosition:g}}},{key:"drawRangeBarPaths",value:function(t){var e=t.indexes,i=t.y,n=t.y1,a=t.y2,r=t.yDivision,s=t.barHeight,o=t.barYPosition,l=t.zeroW,c=this.w,h=l+n/this.invertedYRatio,u=l+a/this.invertedYRatio,d=Math.abs(u-h),f=this.barHelpers.getBarpaths({barYPosition:o,barHeight:s,x1:h,x2:u,strokeWidth:this.strokeWidth,series:this.seriesRangeEnd,i:e.realIndex,realIndex:e.realIndex,j:e.j,w:c});return c.globals.isXNumeric||(i+=r),{pathTo:f.pathTo,pathFrom:f.pathFrom,barWidth:d,x:u,goalX:this.barHelpers.getGoalValues("x",l,null,e.realIndex,e.j),y:i}}},{key:"getRangeValue",value:function(t,e){var i=this.w;return{start:i.globals.seriesRangeStart[t][e],end:i.globals.seriesRangeEnd[t][e]}}},{key:"getTooltipValues",value:function(t){var e=t.ctx,i=t.seriesIndex,n=t.dataPointIndex,a=t.y1,r=t.y2,s=t.w,o=s.globals.seriesRangeStart[i][n],l=s.globals.seriesRangeEnd[i][n],c=s.globals.labels[n],h=s.config.series[i].name?s.config.series[i].name:"",u=s.config.tooltip.y.formatter,d=s.config.tooltip.y.title.formatter,f={w:s,seriesIndex:i,dataPointIndex:n,start:o,end:l};"function"==typeof d&&(h=d(h,f)),Number.isFinite(a)&&Number.isFinite(r)&&(o=a,l=r,s.config.series[i].data[n].x&&(c=s.config.series[i].data[n].x+":"),"function"==typeof u&&(c=u(c,f)));var g="",p="",m=s.globals.colors[i];if(void 0===s.config.tooltip.x.formatter)if("datetime"===s.config.xaxis.type){var v=new z(e);g=v.formatDate(v.getDate(o),s.config.tooltip.x.format),p=v.formatDate(v.getDate(l),s.config.tooltip.x.format)}else g=o,p=l;else g=s.config.tooltip.x.formatter(o),p=s.config.tooltip.x.formatter(l);return{start:o,end:l,startVal:g,endVal:p,ylabel:c,color:m,seriesName:h}}},{key:"buildCustomTooltipHTML",value:function(t){return'<div class="apexcharts-tooltip-rangebar"><div> <span class="series-name" style="color: '+t.color+'">'+(t.seriesName||"")+'</span></div><div> <span class="category">'+t.ylabel+' </span> <span class="value start-value">'+t.start+'</span> <span class="separator">-</span> <span class="value end-value">'+t.end+"</span></div></div>"}}]),i}(),Y=function(){function t(e){o(this,t),this.opts=e}return c(t,[{key:"line",value:function(){return{chart:{animations:{easing:"swing"}},dataLabels:{enabled:!1},stroke:{width:5,curve:"straight"},markers:{size:0,hover:{sizeOffset:6}},xaxis:{crosshairs:{width:1}}}}},{key:"sparkline",value:function(t){return this.opts.yaxis[0].show=!1,this.opts.yaxis[0].title.text="",this.opts.yaxis[0].axisBorder.show=!1,this.opts.yaxis[0].axisTicks.show=!1,this.opts.yaxis[0].floating=!0,x.extend(t,{grid:{show:!1,padding:{left:0,right:0,top:0,bottom:0}},legend:{show:!1},xaxis:{labels:{show:!1},tooltip:{enabled:!1},axisBorder:{show:!1},axisTicks:{show:!1}},chart:{toolbar:{show:!1},zoom:{enabled:!1}},dataLabels:{enabled:!1}})}},{key:"bar",value:function(){return{chart:{stacked:!1,animations:{easing:"swing"}},plotOptions:{bar:{dataLabels:{position:"center"}}},dataLabels:{style:{colors:["#fff"]},background:{enabled:!1}},stroke:{width:0,lineCap:"round"},fill:{opacity:.85},legend:{markers:{shape:"square",radius:2,size:8}},tooltip:{shared:!1,intersect:!0},xaxis:{tooltip:{enabled:!1},tickPlacement:"between",crosshairs:{width:"barWidth",position:"back",fill:{type:"gradient"},dropShadow:{enabled:!1},stroke:{width:0}}}}}},{key:"candlestick",value:function(){var t=this;return{stroke:{width:1,colors:["#333"]},fill:{opacity:1},dataLabels:{enabled:!1},tooltip:{shared:!0,custom:function(e){var i=e.seriesIndex,n=e.dataPointIndex,a=e.w;return t._getBoxTooltip(a,i,n,["Open","High","","Low","Close"],"candlestick")}},states:{active:{filter:{type:"none"}}},xaxis:{crosshairs:{width:1}}}}},{key:"boxPlot",value:function(){var t=this;return{chart:{animations:{dynamicAnimation:{enabled:!1}}},stroke:{width:1,colors:["#24292e"]},dataLabels:{enabled:!1},tooltip:{shared:!0,custom:function(e){var i=e.seriesIndex,n=e.dataPointIndex,a=e.w;return t._getBoxTooltip(a,i,n,["Minimum","Q1","Median","Q3","Maximum"],"boxPlot")}},markers:{size:5,strokeWidth:1,strokeColors:"#111"},xaxis:{crosshairs:{width:1}}}}},{key:"rangeBar",value:function(){return{stroke:{width:0,lineCap:"square"},plotOptions:{bar:{borderRadius:0,dataLabels:{position:"center"}}},dataLabels:{enabled:!1,formatter:function(t,e){e.ctx;var i=e.seriesIndex,n=e.dataPointIndex,a=e.w,r=a.globals.seriesRangeStart[i][n];return a.globals.seriesRangeEnd[i][n]-r},background:{enabled:!1},style:{colors:["#fff"]}},tooltip:{shared:!1,followCursor:!0,custom:function(t){return t.w.config.plotOptions&&t.w.config.plotOptions.bar&&t.w.config.plotOptions.bar.horizontal?function(t){var e=new H(t.ctx,null),i=e.getTooltipValues(t),n=i.color,a=i.seriesName,r=i.ylabel,s=i.startVal,o=i.endVal;return e.buildCustomTooltipHTML({color:n,seriesName:a,ylabel:r,start:s,end:o})}(t):function(t){var e=new H(t.ctx,null),i=e.getTooltipValues(t),n=i.color,a=i.seriesName,r=i.ylabel,s=i.start,o=i.end;return e.buildCustomTooltipHTML({color:n,seriesName:a,ylabel:r,start:s,end:o})}(t)}},xaxis:{tickPlacement:"between",tooltip:{enabled:!1},crosshairs:{stroke:{width:0}}}}}},{key:"area",value:function(){return{stroke:{width:4},fill:{type:"gradient",gradient:{inverseColors:!1,shade:"light",type:"vertical",opacityFrom:.65,opacityTo:.5,stops:[0,100,100]}},markers:{size:0,hover:{sizeOffset:6}},tooltip:{followCursor:!1}}}},{key:"brush",value:function(t){return x.extend(t,{chart:{toolbar:{autoSelected:"selection",show:!1},zoom:{enabled:!1}},dataLabels:{enabled:!1},stroke:{width:1},tooltip:{enabled:!1},xaxis:{tooltip:{enabled:!1}}})}},{key:"stacked100",value:function(t){t.dataLabels=t.dataLabels||{},t.dataLabels.formatter=t.dataLabels.formatter||void 0;var e=t.dataLabels.formatter;return t.yaxis.forEach((function(e,i){t.yaxis[i].min=0,t.yaxis[i].max=100})),"bar"===t.chart.type&&(t.dataLabels.formatter=e||function(t){return"number"==typeof t&&t?t.toFixed(0)+"%":t}),t}},{key:"convertCatToNumeric",value:function(t){return t.xaxis.convertedCatToNumeric=!0,t}},{key:"convertCatToNumericXaxis",value:function(t,e,i){t.xaxis.type="numeric",t.xaxis.labels=t.xaxis.labels||{},t.xaxis.labels.formatter=t.xaxis.labels.formatter||function(t){return x.isNumber(t)?Math.floor(t):t};var n=t.xaxis.labels.formatter,a=t.xaxis.categories&&t.xaxis.categories.length?t.xaxis.categories:t.labels;return i&&i.length&&(a=i.map((function(t){return Array.isArray(t)?t:String(t)}))),a&&a.length&&(t.xaxis.labels.formatter=function(t){return x.isNumber(t)?n(a[Math.floor(t)-1]):n(t)}),t.xaxis.categories=[],t.labels=[],t.xaxis.tickAmount=t.xaxis.tickAmount||"dataPoints",t}},{key:"bubble",value:function(){return{dataLabels:{style:{colors:["#fff"]}},tooltip:{shared:!1,intersect:!0},xaxis:{crosshairs:{width:0}},fill:{type:"solid",gradient:{shade:"light",inverse:!0,shadeIntensity:.55,opacityFrom:.4,opacityTo:.8}}}}},{key:"scatter",value:function(){return{dataLabels:{enabled:!1},tooltip:{shared:!1,intersect:!0},markers:{size:6,strokeWidth:1,hover:{sizeOffset:2}}}}},{key:"heatmap",value:function(){return{chart:{stacked:!1},fill:{opacity:1},dataLabels:{style:{colors:["#fff"]}},stroke:{colors:["#fff"]},tooltip:{followCursor:!0,marker:{show:!1},x:{show:!1}},legend:{position:"top",markers:{shape:"square",size:10,offsetY:2}},grid:{padding:{right:20}}}}},{key:"treemap",value:function(){return{chart:{zoom:{enabled:!1}},dataLabels:{style:{fontSize:14,fontWeight:600,colors:["#fff"]}},stroke:{show:!0,width:2,colors:["#fff"]},legend:{show:!1},fill:{gradient:{stops:[0,100]}},tooltip:{followCursor:!0,x:{show:!1}},grid:{padding:{left:0,right:0}},xaxis:{crosshairs:{show:!1},tooltip:{enabled:!1}}}}},{key:"pie",value:function(){return{chart:{toolbar:{show:!1}},plotOptions:{pie:{donut:{labels:{show:!1}}}},dataLabels:{formatter:function(t){return t.toFixed(1)+"%"},style:{colors:["#fff"]},background:{enabled:!1},dropShadow:{enabled:!0}},stroke:{colors:["#fff"]},fill:{opacity:1,gradient:{shade:"light",stops:[0,100]}},tooltip:{theme:"dark",fillSeriesColor:!0},legend:{position:"right"}}}},{key:"donut",value:function(){return{chart:{toolbar:{show:!1}},dataLabels:{formatter:function(t){return t.toFixed(1)+"%"},style:{colors:["#fff"]},background:{enabled:!1},dropShadow:{enabled:!0}},stroke:{colors:["#fff"]},fill:{opacity:1,gradient:{shade:"light",shadeIntensity:.35,stops:[80,100],opacityFrom:1,opacityTo:1}},tooltip:{theme:"dark",fillSeriesColor:!0},legend:{position:"right"}}}},{key:"polarArea",value:function(){return this.opts.yaxis[0].tickAmount=this.opts.yaxis[0].tickAmount?this.opts.yaxis[0].tickAmount:6,{chart:{toolbar:{show:!1}},dataLabels:{formatter:function(t){return t.toFixed(1)+"%"},enabled:!1},stroke:{show:!0,width:2},fill:{opacity:.7},tooltip:{theme:"dark",fillSeriesColor:!0},legend:{position:"right"}}}},{key:"radar",value:function(){return this.opts.yaxis[0].labels.offsetY=this.opts.yaxis[0].labels.offsetY?this.opts.yaxis[0].labels.offsetY:6,{dataLabels:{enabled:!1,style:{fontSize:"11px"}},stroke:{width:2},markers:{size:3,strokeWidth:1,strokeOpacity:1},fill:{opacity:.2},tooltip:{shared:!1,intersect:!0,followCursor:!0},grid:{show:!1},xaxis:{labels:{formatter:function(t){return t},style:{colors:["#a8a8a8"],fontSize:"11px"}},tooltip:{enabled:!1},crosshairs:{show:!1}}}}},{key:"radialBar",value:function(){return{chart:{animations:{dynamicAnimation:{enabled:!0,speed:800}},toolbar:{show:!1}},fill:{gradient:{shade:"dark",shadeIntensity:.4,inverseColors:!1,type:"diagonal2",opacityFrom:1,opacityTo:1,stops:[70,98,100]}},legend:{show:!1,position:"right"},tooltip:{enabled:!1,fillSeriesColor:!0}}}},{key:"_getBoxTooltip",value:function(t,e,i,n,a){var r=t.globals.seriesCandleO[e][i],s=t.globals.seriesCandleH[e][i],o=t.globals.seriesCandleM[e][i],l=t.globals.seriesCandleL[e][i],c=t.globals.seriesCandleC[e][i];return t.config.series[e].type&&t.config.series[e].type!==a?'<div class="apexcharts-custom-tooltip">\n          '.concat(t.config.series[e].name?t.config.series[e].name:"series-"+(e+1),": <strong>").concat(t.globals.series[e][i],"</strong>\n        </div>"):'<div class="apexcharts-tooltip-box apexcharts-tooltip-'.concat(t.config.chart.type,'">')+"<div>".concat(n[0],': <span class="value">')+r+"</span></div>"+"<div>".concat(n[1],': <span class="value">')+s+"</span></div>"+(o?"<div>".concat(n[2],': <span class="value">')+o+"</span></div>":"")+"<div>".concat(n[3],': <span class="value">')+l+"</span></div>"+"<div>".concat(n[4],': <span class="value">')+c+"</span></div></div>"}}]),t}(),X=function(){function t(e){o(this,t),this.opts=e}return c(t,[{key:"init",value:function(t){var e=t.responsiveOverride,i=this.opts,n=new T,a=new Y(i);this.chartType=i.chart.type,"histogram"===this.chartType&&(i.chart.type="bar",i=x.extend({plotOptions:{bar:{columnWidth:"99.99%"}}},i)),i=this.extendYAxis(i),i=this.extendAnnotations(i);var r=n.init(),o={};if(i&&"object"===s(i)){var l={};l=-1!==["line","area","bar","candlestick","boxPlot","rangeBar","histogram","bubble","scatter","heatmap","treemap","pie","polarArea","donut","radar","radialBar"].indexOf(i.chart.type)?a[i.chart.type]():a.line(),i.chart.brush&&i.chart.brush.enabled&&(l=a.brush(l)),i.chart.stacked&&"100%"===i.chart.stackType&&(i=a.stacked100(i)),this.checkForDarkTheme(window.Apex),this.checkForDarkTheme(i),i.xaxis=i.xaxis||window.Apex.xaxis||{},e||(i.xaxis.convertedCatToNumeric=!1),((i=this.checkForCatToNumericXAxis(this.chartType,l,i)).chart.sparkline&&i.chart.sparkline.enabled||window.Apex.chart&&window.Apex.chart.sparkline&&window.Apex.chart.sparkline.enabled)&&(l=a.sparkline(l)),o=x.extend(r,l)}var c=x.extend(o,window.Apex);return r=x.extend(c,i),this.handleUserInputErrors(r)}},{key:"checkForCatToNumericXAxis",value:function(t,e,i){var n=new Y(i),a=("bar"===t||"boxPlot"===t)&&i.plotOptions&&i.plotOptions.bar&&i.plotOptions.bar.horizontal,r="pie"===t||"polarArea"===t||"donut"===t||"radar"===t||"radialBar"===t||"heatmap"===t,s="datetime"!==i.xaxis.type&&"numeric"!==i.xaxis.type,o=i.xaxis.tickPlacement?i.xaxis.tickPlacement:e.xaxis&&e.xaxis.tickPlacement;return a||r||!s||"between"===o||(i=n.convertCatToNumeric(i)),i}},{key:"extendYAxis",value:function(t,e){var i=new T;(void 0===t.yaxis||!t.yaxis||Array.isArray(t.yaxis)&&0===t.yaxis.length)&&(t.yaxis={}),t.yaxis.constructor!==Array&&window.Apex.yaxis&&window.Apex.yaxis.constructor!==Array&&(t.yaxis=x.extend(t.yaxis,window.Apex.yaxis)),t.yaxis.constructor!==Array?t.yaxis=[x.extend(i.yAxis,t.yaxis)]:t.yaxis=x.extendArray(t.yaxis,i.yAxis);var n=!1;t.yaxis.forEach((function(t){t.logarithmic&&(n=!0)}));var a=t.series;return e&&!a&&(a=e.config.series),n&&a.length!==t.yaxis.length&&a.length&&(t.yaxis=a.map((function(e,n){if(e.name||(a[n].name="series-".concat(n+1)),t.yaxis[n])return t.yaxis[n].seriesName=a[n].name,t.yaxis[n];var r=x.extend(i.yAxis,t.yaxis[0]);return r.show=!1,r}))),n&&a.length>1&&a.length!==t.yaxis.length&&console.warn("A multi-series logarithmic chart should have equal number of series and y-axes. Please make sure to equalize both."),t}},{key:"extendAnnotations",value:function(t){return void 0===t.annotations&&(t.annotations={},t.annotations.yaxis=[],t.annotations.xaxis=[],t.annotations.points=[]),t=this.extendYAxisAnnotations(t),t=this.extendXAxisAnnotations(t),this.extendPointAnnotations(t)}},{key:"extendYAxisAnnotations",value:function(t){var e=new T;return t.annotations.yaxis=x.extendArray(void 0!==t.annotations.yaxis?t.annotations.yaxis:[],e.yAxisAnnotation),t}},{key:"extendXAxisAnnotations",value:function(t){var e=new T;return t.annotations.xaxis=x.extendArray(void 0!==t.annotations.xaxis?t.annotations.xaxis:[],e.xAxisAnnotation),t}},{key:"extendPointAnnotations",value:function(t){var e=new T;return t.annotations.points=x.extendArray(void 0!==t.annotations.points?t.annotations.points:[],e.pointAnnotation),t}},{key:"checkForDarkTheme",value:function(t){t.theme&&"dark"===t.theme.mode&&(t.tooltip||(t.tooltip={}),"light"!==t.tooltip.theme&&(t.tooltip.theme="dark"),t.chart.foreColor||(t.chart.foreColor="#f6f7f8"),t.chart.background||(t.chart.background="#424242"),t.theme.palette||(t.theme.palette="palette4"))}},{key:"handleUserInputErrors",value:function(t){var e=t;if(e.tooltip.shared&&e.tooltip.intersect)throw new Error("tooltip.shared cannot be enabled when tooltip.intersect is true. Turn off any other option by setting it to false.");if("bar"===e.chart.type&&e.plotOptions.bar.horizontal){if(e.yaxis.length>1)throw new Error("Multiple Y Axis for bars are not supported. Switch to column chart by setting plotOptions.bar.horizontal=false");e.yaxis[0].reversed&&(e.yaxis[0].opposite=!0),e.xaxis.tooltip.enabled=!1,e.yaxis[0].tooltip.enabled=!1,e.chart.zoom.enabled=!1}return"bar"!==e.chart.type&&"rangeBar"!==e.chart.type||e.tooltip.shared&&"barWidth"===e.xaxis.crosshairs.width&&e.series.length>1&&(e.xaxis.crosshairs.width="tickWidth"),"candlestick"!==e.chart.type&&"boxPlot"!==e.chart.type||e.yaxis[0].reversed&&(console.warn("Reversed y-axis in ".concat(e.chart.type," chart is not supported.")),e.yaxis[0].reversed=!1),e}}]),t}(),B=function(){function t(){o(this,t)}return c(t,[{key:"initGlobalVars",value:function(t){t.series=[],t.seriesCandleO=[],t.seriesCandleH=[],t.seriesCandleM=[],t.seriesCandleL=[],t.seriesCandleC=[],t.seriesRangeStart=[],t.seriesRangeEnd=[],t.seriesRangeBar=[],t.seriesPercent=[],t.seriesGoals=[],t.seriesX=[],t.seriesZ=[],t.seriesNames=[],t.seriesTotals=[],t.seriesLog=[],t.seriesColors=[],t.stackedSeriesTotals=[],t.seriesXvalues=[],t.seriesYvalues=[],t.labels=[],t.categoryLabels=[],t.timescaleLabels=[],t.noLabelsProvided=!1,t.resizeTimer=null,t.selectionResizeTimer=null,t.delayedElements=[],t.pointsArray=[],t.dataLabelsRects=[],t.isXNumeric=!1,t.xaxisLabelsCount=0,t.skipLastTimelinelabel=!1,t.skipFirstTimelinelabel=!1,t.isDataXYZ=!1,t.isMultiLineX=!1,t.isMultipleYAxis=!1,t.maxY=-Number.MAX_VALUE,t.minY=Number.MIN_VALUE,t.minYArr=[],t.maxYArr=[],t.maxX=-Number.MAX_VALUE,t.minX=Number.MAX_VALUE,t.initialMaxX=-Number.MAX_VALUE,t.initialMinX=Number.MAX_VALUE,t.maxDate=0,t.minDate=Number.MAX_VALUE,t.minZ=Number.MAX_VALUE,t.maxZ=-Number.MAX_VALUE,t.minXDiff=Number.MAX_VALUE,t.yAxisScale=[],t.xAxisScale=null,t.xAxisTicksPositions=[],t.yLabelsCoords=[],t.yTitleCoords=[],t.barPadForNumericAxis=0,t.padHorizontal=0,t.xRange=0,t.yRange=[],t.zRange=0,t.dataPoints=0,t.xTickAmount=0}},{key:"globalVars",value:function(t){return{chartID:null,cuid:null,events:{beforeMount:[],mounted:[],updated:[],clicked:[],selection:[],dataPointSelection:[],zoomed:[],scrolled:[]},colors:[],clientX:null,clientY:null,fill:{colors:[]},stroke:{colors:[]},dataLabels:{style:{colors:[]}},radarPolygons:{fill:{colors:[]}},markers:{colors:[],size:t.markers.size,largestSize:0},animationEnded:!1,isTouchDevice:"ontouchstart"in window||navigator.msMaxTouchPoints,isDirty:!1,isExecCalled:!1,initialConfig:null,initialSeries:[],lastXAxis:[],lastYAxis:[],columnSeries:null,labels:[],timescaleLabels:[],noLabelsProvided:!1,allSeriesCollapsed:!1,collapsedSeries:[],collapsedSeriesIndices:[],ancillaryCollapsedSeries:[],ancillaryCollapsedSeriesIndices:[],risingSeries:[],dataFormatXNumeric:!1,capturedSeriesIndex:-1,capturedDataPointIndex:-1,selectedDataPoints:[],goldenPadding:35,invalidLogScale:!1,ignoreYAxisIndexes:[],yAxisSameScaleIndices:[],maxValsInArrayIndex:0,radialSize:0,selection:void 0,zoomEnabled:"zoom"===t.chart.toolbar.autoSelected&&t.chart.toolbar.tools.zoom&&t.chart.zoom.enabled,panEnabled:"pan"===t.chart.toolbar.autoSelected&&t.chart.toolbar.tools.pan,selectionEnabled:"selection"===t.chart.toolbar.autoSelected&&t.chart.toolbar.tools.selection,yaxis:null,mousedown:!1,lastClientPosition:{},visibleXRange:void 0,yValueDecimal:0,total:0,SVGNS:"http://www.w3.org/2000/svg",svgWidth:0,svgHeight:0,noData:!1,locale:{},dom:{},memory:{methodsToExec:[]},shouldAnimate:!0,skipLastTimelinelabel:!1,skipFirstTimelinelabel:!1,delayedElements:[],axisCharts:!0,isDataXYZ:!1,resized:!1,resizeTimer:null,comboCharts:!1,dataChanged:!1,previousPaths:[],allSeriesHasEqualX:!0,pointsArray:[],dataLabelsRects:[],lastDrawnDataLabelsIndexes:[],hasNullValues:!1,easing:null,zoomed:!1,gridWidth:0,gridHeight:0,rotateXLabels:!1,defaultLabels:!1,xLabelFormatter:void 0,yLabelFormatters:[],xaxisTooltipFormatter:void 0,ttKeyFormatter:void 0,ttVal:void 0,ttZFormatter:void 0,LINE_HEIGHT_RATIO:1.618,xAxisLabelsHeight:0,xAxisLabelsWidth:0,yAxisLabelsWidth:0,scaleX:1,scaleY:1,translateX:0,translateY:0,translateYAxisX:[],yAxisWidths:[],translateXAxisY:0,translateXAxisX:0,tooltip:null}}},{key:"init",value:function(t){var e=this.globalVars(t);return this.initGlobalVars(e),e.initialConfig=x.extend({},t),e.initialSeries=x.clone(t.series),e.lastXAxis=x.clone(e.initialConfig.xaxis),e.lastYAxis=x.clone(e.initialConfig.yaxis),e}}]),t}(),j=function(){function t(e){o(this,t),this.opts=e}return c(t,[{key:"init",value:function(){var t=new X(this.opts).init({responsiveOverride:!1});return{config:t,globals:(new B).init(t)}}}]),t}(),W=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w,this.twoDSeries=[],this.threeDSeries=[],this.twoDSeriesX=[],this.seriesGoals=[],this.coreUtils=new S(this.ctx)}return c(t,[{key:"isMultiFormat",value:function(){return this.isFormatXY()||this.isFormat2DArray()}},{key:"isFormatXY",value:function(){var t=this.w.config.series.slice(),e=new N(this.ctx);if(this.activeSeriesIndex=e.getActiveConfigSeriesIndex(),void 0!==t[this.activeSeriesIndex].data&&t[this.activeSeriesIndex].data.length>0&&null!==t[this.activeSeriesIndex].data[0]&&void 0!==t[this.activeSeriesIndex].data[0].x&&null!==t[this.activeSeriesIndex].data[0])return!0}},{key:"isFormat2DArray",value:function(){var t=this.w.config.series.slice(),e=new N(this.ctx);if(this.activeSeriesIndex=e.getActiveConfigSeriesIndex(),void 0!==t[this.activeSeriesIndex].data&&t[this.activeSeriesIndex].data.length>0&&void 0!==t[this.activeSeriesIndex].data[0]&&null!==t[this.activeSeriesIndex].data[0]&&t[this.activeSeriesIndex].data[0].constructor===Array)return!0}},{key:"handleFormat2DArray",value:function(t,e){for(var i=this.w.config,n=this.w.globals,a="boxPlot"===i.chart.type||"boxPlot"===i.series[e].type,r=0;r<t[e].data.length;r++)if(void 0!==t[e].data[r][1]&&(Array.isArray(t[e].data[r][1])&&4===t[e].data[r][1].length&&!a?this.twoDSeries.push(x.parseNumber(t[e].data[r][1][3])):t[e].data[r].length>=5?this.twoDSeries.push(x.parseNumber(t[e].data[r][4])):this.twoDSeries.push(x.parseNumber(t[e].data[r][1])),n.dataFormatXNumeric=!0),"datetime"===i.xaxis.type){var s=new Date(t[e].data[r][0]);s=new Date(s).getTime(),this.twoDSeriesX.push(s)}else this.twoDSeriesX.push(t[e].data[r][0]);for(var o=0;o<t[e].data.length;o++)void 0!==t[e].data[o][2]&&(this.threeDSeries.push(t[e].data[o][2]),n.isDataXYZ=!0)}},{key:"handleFormatXY",value:function(t,e){var i=this.w.config,n=this.w.globals,a=new z(this.ctx),r=e;n.collapsedSeriesIndices.indexOf(e)>-1&&(r=this.activeSeriesIndex);for(var s=0;s<t[e].data.length;s++)void 0!==t[e].data[s].y&&(Array.isArray(t[e].data[s].y)?this.twoDSeries.push(x.parseNumber(t[e].data[s].y[t[e].data[s].y.length-1])):this.twoDSeries.push(x.parseNumber(t[e].data[s].y))),void 0!==t[e].data[s].goals&&Array.isArray(t[e].data[s].goals)?(void 0===this.seriesGoals[e]&&(this.seriesGoals[e]=[]),this.seriesGoals[e].push(t[e].data[s].goals)):(void 0===this.seriesGoals[e]&&(this.seriesGoals[e]=[]),this.seriesGoals[e].push(null));for(var o=0;o<t[r].data.length;o++){var l="string"==typeof t[r].data[o].x,c=Array.isArray(t[r].data[o].x),h=!c&&!!a.isValidDate(t[r].data[o].x.toString());if(l||h)if(l||i.xaxis.convertedCatToNumeric){var u=n.isBarHorizontal&&n.isRangeData;"datetime"!==i.xaxis.type||u?(this.fallbackToCategory=!0,this.twoDSeriesX.push(t[r].data[o].x)):this.twoDSeriesX.push(a.parseDate(t[r].data[o].x))}else"datetime"===i.xaxis.type?this.twoDSeriesX.push(a.parseDate(t[r].data[o].x.toString())):(n.dataFormatXNumeric=!0,n.isXNumeric=!0,this.twoDSeriesX.push(parseFloat(t[r].data[o].x)));else c?(this.fallbackToCategory=!0,this.twoDSeriesX.push(t[r].data[o].x)):(n.isXNumeric=!0,n.dataFormatXNumeric=!0,this.twoDSeriesX.push(t[r].data[o].x))}if(t[e].data[0]&&void 0!==t[e].data[0].z){for(var d=0;d<t[e].data.length;d++)this.threeDSeries.push(t[e].data[d].z);n.isDataXYZ=!0}}},{key:"handleRangeData",value:function(t,e){var i=this.w.globals,n={};return this.isFormat2DArray()?n=this.handleRangeDataFormat("array",t,e):this.isFormatXY()&&(n=this.handleRangeDataFormat("xy",t,e)),i.seriesRangeStart.push(n.start),i.seriesRangeEnd.push(n.end),i.seriesRangeBar.push(n.rangeUniques),i.seriesRangeBar.forEach((function(t,e){t&&t.forEach((function(t,e){t.y.forEach((function(e,i){for(var n=0;n<t.y.length;n++)if(i!==n){var a=e.y1,r=e.y2,s=t.y[n].y1;a<=t.y[n].y2&&s<=r&&(t.overlaps.indexOf(e.rangeName)<0&&t.overlaps.push(e.rangeName),t.overlaps.indexOf(t.y[n].rangeName)<0&&t.overlaps.push(t.y[n].rangeName))}}))}))})),n}},{key:"handleCandleStickBoxData",value:function(t,e){var i=this.w.globals,n={};return this.isFormat2DArray()?n=this.handleCandleStickBoxDataFormat("array",t,e):this.isFormatXY()&&(n=this.handleCandleStickBoxDataFormat("xy",t,e)),i.seriesCandleO[e]=n.o,i.seriesCandleH[e]=n.h,i.seriesCandleM[e]=n.m,i.seriesCandleL[e]=n.l,i.seriesCandleC[e]=n.c,n}},{key:"handleRangeDataFormat",value:function(t,e,i){var n=[],a=[],r=e[i].data.filter((function(t,e,i){return e===i.findIndex((function(e){return e.x===t.x}))})).map((function(t,e){return{x:t.x,overlaps:[],y:[]}})),s="Please provide [Start, End] values in valid format. Read more https://apexcharts.com/docs/series/#rangecharts",o=new N(this.ctx).getActiveConfigSeriesIndex();if("array"===t){if(2!==e[o].data[0][1].length)throw new Error(s);for(var l=0;l<e[i].data.length;l++)n.push(e[i].data[l][1][0]),a.push(e[i].data[l][1][1])}else if("xy"===t){if(2!==e[o].data[0].y.length)throw new Error(s);for(var c=function(t){var s=x.randomId(),o=e[i].data[t].x,l={y1:e[i].data[t].y[0],y2:e[i].data[t].y[1],rangeName:s};e[i].data[t].rangeName=s;var c=r.findIndex((function(t){return t.x===o}));r[c].y.push(l),n.push(l.y1),a.push(l.y2)},h=0;h<e[i].data.length;h++)c(h)}return{start:n,end:a,rangeUniques:r}}},{key:"handleCandleStickBoxDataFormat",value:function(t,e,i){var n=this.w,a="boxPlot"===n.config.chart.type||"boxPlot"===n.config.series[i].type,r=[],s=[],o=[],l=[],c=[];if("array"===t)if(a&&6===e[i].data[0].length||!a&&5===e[i].data[0].length)for(var h=0;h<e[i].data.length;h++)r.push(e[i].data[h][1]),s.push(e[i].data[h][2]),a?(o.push(e[i].data[h][3]),l.push(e[i].data[h][4]),c.push(e[i].data[h][5])):(l.push(e[i].data[h][3]),c.push(e[i].data[h][4]));else for(var u=0;u<e[i].data.length;u++)Array.isArray(e[i].data[u][1])&&(r.push(e[i].data[u][1][0]),s.push(e[i].data[u][1][1]),a?(o.push(e[i].data[u][1][2]),l.push(e[i].data[u][1][3]),c.push(e[i].data[u][1][4])):(l.push(e[i].data[u][1][2]),c.push(e[i].data[u][1][3])));else if("xy"===t)for(var d=0;d<e[i].data.length;d++)Array.isArray(e[i].data[d].y)&&(r.push(e[i].data[d].y[0]),s.push(e[i].data[d].y[1]),a?(o.push(e[i].data[d].y[2]),l.push(e[i].data[d].y[3]),c.push(e[i].data[d].y[4])):(l.push(e[i].data[d].y[2]),c.push(e[i].data[d].y[3])));return{o:r,h:s,m:o,l,c}}},{key:"parseDataAxisCharts",value:function(t){var e=this,i=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.ctx,n=this.w.config,a=this.w.globals,r=new z(i),s=n.labels.length>0?n.labels.slice():n.xaxis.categories.slice();a.isRangeBar="rangeBar"===n.chart.type&&a.isBarHorizontal;for(var o=function(){for(var t=0;t<s.length;t++)if("string"==typeof s[t]){if(!r.isValidDate(s[t]))throw new Error("You have provided invalid Date format. Please provide a valid JavaScript Date");e.twoDSeriesX.push(r.parseDate(s[t]))}else e.twoDSeriesX.push(s[t])},l=0;l<t.length;l++){if(this.twoDSeries=[],this.twoDSeriesX=[],this.threeDSeries=[],void 0===t[l].data)return void console.error("It is a possibility that you may have not included 'data' property in series.");if("rangeBar"!==n.chart.type&&"rangeArea"!==n.chart.type&&"rangeBar"!==t[l].type&&"rangeArea"!==t[l].type||(a.isRangeData=!0,this.handleRangeData(t,l)),this.isMultiFormat())this.isFormat2DArray()?this.handleFormat2DArray(t,l):this.isFormatXY()&&this.handleFormatXY(t,l),"candlestick"!==n.chart.type&&"candlestick"!==t[l].type&&"boxPlot"!==n.chart.type&&"boxPlot"!==t[l].type||this.handleCandleStickBoxData(t,l),a.series.push(this.twoDSeries),a.labels.push(this.twoDSeriesX),a.seriesX.push(this.twoDSeriesX),a.seriesGoals=this.seriesGoals,l!==this.activeSeriesIndex||this.fallbackToCategory||(a.isXNumeric=!0);else{"datetime"===n.xaxis.type?(a.isXNumeric=!0,o(),a.seriesX.push(this.twoDSeriesX)):"numeric"===n.xaxis.type&&(a.isXNumeric=!0,s.length>0&&(this.twoDSeriesX=s,a.seriesX.push(this.twoDSeriesX))),a.labels.push(this.twoDSeriesX);var c=t[l].data.map((function(t){return x.parseNumber(t)}));a.series.push(c)}a.seriesZ.push(this.threeDSeries),void 0!==t[l].name?a.seriesNames.push(t[l].name):a.seriesNames.push("series-"+parseInt(l+1,10)),void 0!==t[l].color?a.seriesColors.push(t[l].color):a.seriesColors.push(void 0)}return this.w}},{key:"parseDataNonAxisCharts",value:function(t){var e=this.w.globals,i=this.w.config;e.series=t.slice(),e.seriesNames=i.labels.slice();for(var n=0;n<e.series.length;n++)void 0===e.seriesNames[n]&&e.seriesNames.push("series-"+(n+1));return this.w}},{key:"handleExternalLabelsData",value:function(t){var e=this.w.config,i=this.w.globals;e.xaxis.categories.length>0?i.labels=e.xaxis.categories:e.labels.length>0?i.labels=e.labels.slice():this.fallbackToCategory?(i.labels=i.labels[0],i.seriesRangeBar.length&&(i.seriesRangeBar.map((function(t){t.forEach((function(t){i.labels.indexOf(t.x)<0&&t.x&&i.labels.push(t.x)}))})),i.labels=i.labels.filter((function(t,e,i){return i.indexOf(t)===e}))),e.xaxis.convertedCatToNumeric&&(new Y(e).convertCatToNumericXaxis(e,this.ctx,i.seriesX[0]),this._generateExternalLabels(t))):this._generateExternalLabels(t)}},{key:"_generateExternalLabels",value:function(t){var e=this.w.globals,i=this.w.config,n=[];if(e.axisCharts){if(e.series.length>0)if(this.isFormatXY())for(var a=i.series.map((function(t,e){return t.data.filter((function(t,e,i){return i.findIndex((function(e){return e.x===t.x}))===e}))})),r=a.reduce((function(t,e,i,n){return n[t].length>e.length?t:i}),0),s=0;s<a[r].length;s++)n.push(s+1);else for(var o=0;o<e.series[e.maxValsInArrayIndex].length;o++)n.push(o+1);e.seriesX=[];for(var l=0;l<t.length;l++)e.seriesX.push(n);e.isXNumeric=!0}if(0===n.length){n=e.axisCharts?[]:e.series.map((function(t,e){return e+1}));for(var c=0;c<t.length;c++)e.seriesX.push(n)}e.labels=n,i.xaxis.convertedCatToNumeric&&(e.categoryLabels=n.map((function(t){return i.xaxis.labels.formatter(t)}))),e.noLabelsProvided=!0}},{key:"parseData",value:function(t){var e=this.w,i=e.config,n=e.globals;if(this.excludeCollapsedSeriesInYAxis(),this.fallbackToCategory=!1,this.ctx.core.resetGlobals(),this.ctx.core.isMultipleY(),n.axisCharts?this.parseDataAxisCharts(t):this.parseDataNonAxisCharts(t),this.coreUtils.getLargestSeries(),"bar"===i.chart.type&&i.chart.stacked){var a=new N(this.ctx);n.series=a.setNullSeriesToZeroValues(n.series)}this.coreUtils.getSeriesTotals(),n.axisCharts&&this.coreUtils.getStackedSeriesTotals(),this.coreUtils.getPercentSeries(),n.dataFormatXNumeric||n.isXNumeric&&("numeric"!==i.xaxis.type||0!==i.labels.length||0!==i.xaxis.categories.length)||this.handleExternalLabelsData(t);for(var r=this.coreUtils.getCategoryLabels(n.labels),s=0;s<r.length;s++)if(Array.isArray(r[s])){n.isMultiLineX=!0;break}}},{key:"excludeCollapsedSeriesInYAxis",value:function(){var t=this,e=this.w;e.globals.ignoreYAxisIndexes=e.globals.collapsedSeries.map((function(i,n){if(t.w.globals.isMultipleYAxis&&!e.config.chart.stacked)return i.index}))}}]),t}(),V=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w,this.tooltipKeyFormat="dd MMM"}return c(t,[{key:"xLabelFormat",value:function(t,e,i,n){var a=this.w;if("datetime"===a.config.xaxis.type&&void 0===a.config.xaxis.labels.formatter&&void 0===a.config.tooltip.x.formatter){var r=new z(this.ctx);return r.formatDate(r.getDate(e),a.config.tooltip.x.format)}return t(e,i,n)}},{key:"defaultGeneralFormatter",value:function(t){return Array.isArray(t)?t.map((function(t){return t})):t}},{key:"defaultYFormatter",value:function(t,e,i){var n=this.w;return x.isNumber(t)&&(t=0!==n.globals.yValueDecimal?t.toFixed(void 0!==e.decimalsInFloat?e.decimalsInFloat:n.globals.yValueDecimal):n.globals.maxYArr[i]-n.globals.minYArr[i]<5?t.toFixed(1):t.toFixed(0)),t}},{key:"setLabelFormatters",value:function(){var t=this,e=this.w;return e.globals.xaxisTooltipFormatter=function(e){return t.defaultGeneralFormatter(e)},e.globals.ttKeyFormatter=function(e){return t.defaultGeneralFormatter(e)},e.globals.ttZFormatter=function(t){return t},e.globals.legendFormatter=function(e){return t.defaultGeneralFormatter(e)},void 0!==e.config.xaxis.labels.formatter?e.globals.xLabelFormatter=e.config.xaxis.labels.formatter:e.globals.xLabelFormatter=function(t){if(x.isNumber(t)){if(!e.config.xaxis.convertedCatToNumeric&&"numeric"===e.config.xaxis.type){if(x.isNumber(e.config.xaxis.decimalsInFloat))return t.toFixed(e.config.xaxis.decimalsInFloat);var i=e.globals.maxX-e.globals.minX;return i>0&&i<100?t.toFixed(1):t.toFixed(0)}return e.globals.isBarHorizontal&&e.globals.maxY-e.globals.minYArr<4?t.toFixed(1):t.toFixed(0)}return t},"function"==typeof e.config.tooltip.x.formatter?e.globals.ttKeyFormatter=e.config.tooltip.x.formatter:e.globals.ttKeyFormatter=e.globals.xLabelFormatter,"function"==typeof e.config.xaxis.tooltip.formatter&&(e.globals.xaxisTooltipFormatter=e.config.xaxis.tooltip.formatter),(Array.isArray(e.config.tooltip.y)||void 0!==e.config.tooltip.y.formatter)&&(e.globals.ttVal=e.config.tooltip.y),void 0!==e.config.tooltip.z.formatter&&(e.globals.ttZFormatter=e.config.tooltip.z.formatter),void 0!==e.config.legend.formatter&&(e.globals.legendFormatter=e.config.legend.formatter),e.config.yaxis.forEach((function(i,n){void 0!==i.labels.formatter?e.globals.yLabelFormatters[n]=i.labels.formatter:e.globals.yLabelFormatters[n]=function(a){return e.globals.xyCharts?Array.isArray(a)?a.map((function(e){return t.defaultYFormatter(e,i,n)})):t.defaultYFormatter(a,i,n):a}})),e.globals}},{key:"heatmapLabelFormatters",value:function(){var t=this.w;if("heatmap"===t.config.chart.type){t.globals.yAxisScale[0].result=t.globals.seriesNames.slice();var e=t.globals.seriesNames.reduce((function(t,e){return t.length>e.length?t:e}),0);t.globals.yAxisScale[0].niceMax=e,t.globals.yAxisScale[0].niceMin=e}}}]),t}(),G=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w}return c(t,[{key:"getLabel",value:function(t,e,i,n){var a=arguments.length>4&&void 0!==arguments[4]?arguments[4]:[],r=arguments.length>5&&void 0!==arguments[5]?arguments[5]:"12px",s=this.w,o=void 0===t[n]?"":t[n],l=o,c=s.globals.xLabelFormatter,h=s.config.xaxis.labels.formatter,u=!1,d=new V(this.ctx),f=o;l=d.xLabelFormat(c,o,f,{i:n,dateFormatter:new z(this.ctx).formatDate,w:s}),void 0!==h&&(l=h(o,t[n],{i:n,dateFormatter:new z(this.ctx).formatDate,w:s}));var g=function(t){var i=null;return e.forEach((function(t){"month"===t.unit?i="year":"day"===t.unit?i="month":"hour"===t.unit?i="day":"minute"===t.unit&&(i="hour")})),i===t};e.length>0?(u=g(e[n].unit),i=e[n].position,l=e[n].value):"datetime"===s.config.xaxis.type&&void 0===h&&(l=""),void 0===l&&(l=""),l=Array.isArray(l)?l:l.toString();var p=new w(this.ctx),m={};m=s.globals.rotateXLabels?p.getTextRects(l,parseInt(r,10),null,"rotate(".concat(s.config.xaxis.labels.rotate," 0 0)"),!1):p.getTextRects(l,parseInt(r,10));var v=!s.config.xaxis.labels.showDuplicates&&this.ctx.timeScale;return!Array.isArray(l)&&(0===l.indexOf("NaN")||0===l.toLowerCase().indexOf("invalid")||l.toLowerCase().indexOf("infinity")>=0||a.indexOf(l)>=0&&v)&&(l=""),{x:i,text:l,textRect:m,isBold:u}}},{key:"checkLabelBasedOnTickamount",value:function(t,e,i){var n=this.w,a=n.config.xaxis.tickAmount;return"dataPoints"===a&&(a=Math.round(n.globals.gridWidth/120)),a>i||t%Math.round(i/(a+1))==0||(e.text=""),e}},{key:"checkForOverflowingLabels",value:function(t,e,i,n,a){var r=this.w;if(0===t&&r.globals.skipFirstTimelinelabel&&(e.text=""),t===i-1&&r.globals.skipLastTimelinelabel&&(e.text=""),r.config.xaxis.labels.hideOverlappingLabels&&n.length>0){var s=a[a.length-1];e.x<s.textRect.width/(r.globals.rotateXLabels?Math.abs(r.config.xaxis.labels.rotate)/12:1.01)+s.x&&(e.text="")}return e}},{key:"checkForReversedLabels",value:function(t,e){var i=this.w;return i.config.yaxis[t]&&i.config.yaxis[t].reversed&&e.reverse(),e}},{key:"isYAxisHidden",value:function(t){var e=this.w,i=new S(this.ctx);return!e.config.yaxis[t].show||!e.config.yaxis[t].showForNullSeries&&i.isSeriesNull(t)&&-1===e.globals.collapsedSeriesIndices.indexOf(t)}},{key:"getYAxisForeColor",value:function(t,e){var i=this.w;return Array.isArray(t)&&i.globals.yAxisScale[e]&&this.ctx.theme.pushExtraColors(t,i.globals.yAxisScale[e].result.length,!1),t}},{key:"drawYAxisTicks",value:function(t,e,i,n,a,r,s){var o=this.w,l=new w(this.ctx),c=o.globals.translateY;if(n.show&&e>0){!0===o.config.yaxis[a].opposite&&(t+=n.width);for(var h=e;h>=0;h--){var u=c+e/10+o.config.yaxis[a].labels.offsetY-1;o.globals.isBarHorizontal&&(u=r*h),"heatmap"===o.config.chart.type&&(u+=r/2);var d=l.drawLine(t+i.offsetX-n.width+n.offsetX,u+n.offsetY,t+i.offsetX+n.offsetX,u+n.offsetY,n.color);s.add(d),c+=r}}}}]),t}(),U=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w}return c(t,[{key:"scaleSvgNode",value:function(t,e){var i=parseFloat(t.getAttributeNS(null,"width")),n=parseFloat(t.getAttributeNS(null,"height"));t.setAttributeNS(null,"width",i*e),t.setAttributeNS(null,"height",n*e),t.setAttributeNS(null,"viewBox","0 0 "+i+" "+n)}},{key:"fixSvgStringForIe11",value:function(t){if(!x.isIE11())return t.replace(/&nbsp;/g,"&#160;");var e=0,i=t.replace(/xmlns="http:\/\/www.w3.org\/2000\/svg"/g,(function(t){return 2==++e?'xmlns:xlink="http://www.w3.org/1999/xlink" xmlns:svgjs="http://svgjs.dev"':t}));return(i=i.replace(/xmlns:NS\d+=""/g,"")).replace(/NS\d+:(\w+:\w+=")/g,"$1")}},{key:"getSvgString",value:function(t){var e=this.w.globals.dom.Paper.svg();if(1!==t){var i=this.w.globals.dom.Paper.node.cloneNode(!0);this.scaleSvgNode(i,t),e=(new XMLSerializer).serializeToString(i)}return this.fixSvgStringForIe11(e)}},{key:"cleanup",value:function(){var t=this.w,e=t.globals.dom.baseEl.getElementsByClassName("apexcharts-xcrosshairs"),i=t.globals.dom.baseEl.getElementsByClassName("apexcharts-ycrosshairs"),n=t.globals.dom.baseEl.querySelectorAll(".apexcharts-zoom-rect, .apexcharts-selection-rect");Array.prototype.forEach.call(n,(function(t){t.setAttribute("width",0)})),e&&e[0]&&(e[0].setAttribute("x",-500),e[0].setAttribute("x1",-500),e[0].setAttribute("x2",-500)),i&&i[0]&&(i[0].setAttribute("y",-100),i[0].setAttribute("y1",-100),i[0].setAttribute("y2",-100))}},{key:"svgUrl",value:function(){this.cleanup();var t=this.getSvgString(),e=new Blob([t],{type:"image/svg+xml;charset=utf-8"});return URL.createObjectURL(e)}},{key:"dataURI",value:function(t){var e=this;return new Promise((function(i){var n=e.w,a=t?t.scale||t.width/n.globals.svgWidth:1;e.cleanup();var r=document.createElement("canvas");r.width=n.globals.svgWidth*a,r.height=parseInt(n.globals.dom.elWrap.style.height,10)*a;var s="transparent"===n.config.chart.background?"#fff":n.config.chart.background,o=r.getContext("2d");o.fillStyle=s,o.fillRect(0,0,r.width*a,r.height*a);var l=e.getSvgString(a);if(window.canvg&&x.isIE11()){var c=window.canvg.Canvg.fromString(o,l,{ignoreClear:!0,ignoreDimensions:!0});c.start();var h=r.msToBlob();c.stop(),i({blob:h})}else{var u="data:image/svg+xml,"+encodeURIComponent(l),d=new Image;d.crossOrigin="anonymous",d.onload=function(){if(o.drawImage(d,0,0),r.msToBlob){var t=r.msToBlob();i({blob:t})}else{var e=r.toDataURL("image/png");i({imgURI:e})}},d.src=u}}))}},{key:"exportToSVG",value:function(){this.triggerDownload(this.svgUrl(),this.w.config.chart.toolbar.export.svg.filename,".svg")}},{key:"exportToPng",value:function(){var t=this;this.dataURI().then((function(e){var i=e.imgURI,n=e.blob;n?navigator.msSaveOrOpenBlob(n,t.w.globals.chartID+".png"):t.triggerDownload(i,t.w.config.chart.toolbar.export.png.filename,".png")}))}},{key:"exportToCSV",value:function(t){var e=this,i=t.series,n=t.columnDelimiter,a=t.lineDelimiter,r=void 0===a?"\n":a,s=this.w,o=[],l=[],c="",h=new W(this.ctx),u=new G(this.ctx),d=function(t){var i="";if(s.globals.axisCharts){if("category"===s.config.xaxis.type||s.config.xaxis.convertedCatToNumeric)if(s.globals.isBarHorizontal){var a=s.globals.yLabelFormatters[0],r=new N(e.ctx).getActiveConfigSeriesIndex();i=a(s.globals.labels[t],{seriesIndex:r,dataPointIndex:t,w:s})}else i=u.getLabel(s.globals.labels,s.globals.timescaleLabels,0,t).text;"datetime"===s.config.xaxis.type&&(s.config.xaxis.categories.length?i=s.config.xaxis.categories[t]:s.config.labels.length&&(i=s.config.labels[t]))}else i=s.config.labels[t];return Array.isArray(i)&&(i=i.join(" ")),x.isNumber(i)?i:i.split(n).join("")};o.push(s.config.chart.toolbar.export.csv.headerCategory),i.map((function(t,e){var i=t.name?t.name:"series-".concat(e);s.globals.axisCharts&&o.push(i.split(n).join("")?i.split(n).join(""):"series-".concat(e))})),s.globals.axisCharts||(o.push(s.config.chart.toolbar.export.csv.headerValue),l.push(o.join(n))),i.map((function(t,e){s.globals.axisCharts?function(t,e){if(o.length&&0===e&&l.push(o.join(n)),t.data&&t.data.length)for(var a=0;a<t.data.length;a++){o=[];var r=d(a);if(r||(h.isFormatXY()?r=i[e].data[a].x:h.isFormat2DArray()&&(r=i[e].data[a]?i[e].data[a][0]:"")),0===e){o.push((u=r,"datetime"===s.config.xaxis.type&&String(u).length>=10?s.config.chart.toolbar.export.csv.dateFormatter(r):x.isNumber(r)?r:r.split(n).join("")));for(var c=0;c<s.globals.series.length;c++)o.push(s.globals.series[c][a])}("candlestick"===s.config.chart.type||t.type&&"candlestick"===t.type)&&(o.pop(),o.push(s.globals.seriesCandleO[e][a]),o.push(s.globals.seriesCandleH[e][a]),o.push(s.globals.seriesCandleL[e][a]),o.push(s.globals.seriesCandleC[e][a])),("boxPlot"===s.config.chart.type||t.type&&"boxPlot"===t.type)&&(o.pop(),o.push(s.globals.seriesCandleO[e][a]),o.push(s.globals.seriesCandleH[e][a]),o.push(s.globals.seriesCandleM[e][a]),o.push(s.globals.seriesCandleL[e][a]),o.push(s.globals.seriesCandleC[e][a])),"rangeBar"===s.config.chart.type&&(o.pop(),o.push(s.globals.seriesRangeStart[e][a]),o.push(s.globals.seriesRangeEnd[e][a])),o.length&&l.push(o.join(n))}var u}(t,e):((o=[]).push(s.globals.labels[e].split(n).join("")),o.push(s.globals.series[e]),l.push(o.join(n)))})),c+=l.join(r),this.triggerDownload("data:text/csv; charset=utf-8,"+encodeURIComponent("\ufeff"+c),s.config.chart.toolbar.export.csv.filename,".csv")}},{key:"triggerDownload",value:function(t,e,i){var n=document.createElement("a");n.href=t,n.download=(e||this.w.globals.chartID)+i,document.body.appendChild(n),n.click(),document.body.removeChild(n)}}]),t}(),q=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w;var i=this.w;this.axesUtils=new G(e),this.xaxisLabels=i.globals.labels.slice(),i.globals.timescaleLabels.length>0&&!i.globals.isBarHorizontal&&(this.xaxisLabels=i.globals.timescaleLabels.slice()),i.config.xaxis.overwriteCategories&&(this.xaxisLabels=i.config.xaxis.overwriteCategories),this.drawnLabels=[],this.drawnLabelsRects=[],"top"===i.config.xaxis.position?this.offY=0:this.offY=i.globals.gridHeight+1,this.offY=this.offY+i.config.xaxis.axisBorder.offsetY,this.isCategoryBarHorizontal="bar"===i.config.chart.type&&i.config.plotOptions.bar.horizontal,this.xaxisFontSize=i.config.xaxis.labels.style.fontSize,this.xaxisFontFamily=i.config.xaxis.labels.style.fontFamily,this.xaxisForeColors=i.config.xaxis.labels.style.colors,this.xaxisBorderWidth=i.config.xaxis.axisBorder.width,this.isCategoryBarHorizontal&&(this.xaxisBorderWidth=i.config.yaxis[0].axisBorder.width.toString()),this.xaxisBorderWidth.indexOf("%")>-1?this.xaxisBorderWidth=i.globals.gridWidth*parseInt(this.xaxisBorderWidth,10)/100:this.xaxisBorderWidth=parseInt(this.xaxisBorderWidth,10),this.xaxisBorderHeight=i.config.xaxis.axisBorder.height,this.yaxis=i.config.yaxis[0]}return c(t,[{key:"drawXaxis",value:function(){var t,e=this,i=this.w,n=new w(this.ctx),a=n.group({class:"apexcharts-xaxis",transform:"translate(".concat(i.config.xaxis.offsetX,", ").concat(i.config.xaxis.offsetY,")")}),r=n.group({class:"apexcharts-xaxis-texts-g",transform:"translate(".concat(i.globals.translateXAxisX,", ").concat(i.globals.translateXAxisY,")")});a.add(r);for(var s=i.globals.padHorizontal,o=[],l=0;l<this.xaxisLabels.length;l++)o.push(this.xaxisLabels[l]);var c=o.length;if(i.globals.isXNumeric){var h=c>1?c-1:c;t=i.globals.gridWidth/h,s=s+t/2+i.config.xaxis.labels.offsetX}else t=i.globals.gridWidth/o.length,s=s+t+i.config.xaxis.labels.offsetX;for(var u=function(a){var l=s-t/2+i.config.xaxis.labels.offsetX;0===a&&1===c&&t/2===s&&1===i.globals.dataPoints&&(l=i.globals.gridWidth/2);var h=e.axesUtils.getLabel(o,i.globals.timescaleLabels,l,a,e.drawnLabels,e.xaxisFontSize),u=28;if(i.globals.rotateXLabels&&(u=22),(h=void 0!==i.config.xaxis.tickAmount&&"dataPoints"!==i.config.xaxis.tickAmount&&"datetime"!==i.config.xaxis.type?e.axesUtils.checkLabelBasedOnTickamount(a,h,c):e.axesUtils.checkForOverflowingLabels(a,h,c,e.drawnLabels,e.drawnLabelsRects)).text&&i.globals.xaxisLabelsCount++,i.config.xaxis.labels.show){var d=n.drawText({x:h.x,y:e.offY+i.config.xaxis.labels.offsetY+u-("top"===i.config.xaxis.position?i.globals.xAxisHeight+i.config.xaxis.axisTicks.height-2:0),text:h.text,textAnchor:"middle",fontWeight:h.isBold?600:i.config.xaxis.labels.style.fontWeight,fontSize:e.xaxisFontSize,fontFamily:e.xaxisFontFamily,foreColor:Array.isArray(e.xaxisForeColors)?i.config.xaxis.convertedCatToNumeric?e.xaxisForeColors[i.globals.minX+a-1]:e.xaxisForeColors[a]:e.xaxisForeColors,isPlainText:!1,cssClass:"apexcharts-xaxis-label "+i.config.xaxis.labels.style.cssClass});r.add(d);var f=document.createElementNS(i.globals.SVGNS,"title");f.textContent=Array.isArray(h.text)?h.text.join(" "):h.text,d.node.appendChild(f),""!==h.text&&(e.drawnLabels.push(h.text),e.drawnLabelsRects.push(h))}s+=t},d=0;d<=c-1;d++)u(d);if(void 0!==i.config.xaxis.title.text){var f=n.group({class:"apexcharts-xaxis-title"}),g=n.drawText({x:i.globals.gridWidth/2+i.config.xaxis.title.offsetX,y:this.offY+parseFloat(this.xaxisFontSize)+i.globals.xAxisLabelsHeight+i.config.xaxis.title.offsetY,text:i.config.xaxis.title.text,textAnchor:"middle",fontSize:i.config.xaxis.title.style.fontSize,fontFamily:i.config.xaxis.title.style.fontFamily,fontWeight:i.config.xaxis.title.style.fontWeight,foreColor:i.config.xaxis.title.style.color,cssClass:"apexcharts-xaxis-title-text "+i.config.xaxis.title.style.cssClass});f.add(g),a.add(f)}if(i.config.xaxis.axisBorder.show){var p=i.globals.barPadForNumericAxis,m=n.drawLine(i.globals.padHorizontal+i.config.xaxis.axisBorder.offsetX-p,this.offY,this.xaxisBorderWidth+p,this.offY,i.config.xaxis.axisBorder.color,0,this.xaxisBorderHeight);a.add(m)}return a}},{key:"drawXaxisInversed",value:function(t){var e,i,n=this,a=this.w,r=new w(this.ctx),s=a.config.yaxis[0].opposite?a.globals.translateYAxisX[t]:0,o=r.group({class:"apexcharts-yaxis apexcharts-xaxis-inversed",rel:t}),l=r.group({class:"apexcharts-yaxis-texts-g apexcharts-xaxis-inversed-texts-g",transform:"translate("+s+", 0)"});o.add(l);var c=[];if(a.config.yaxis[t].show)for(var h=0;h<this.xaxisLabels.length;h++)c.push(this.xaxisLabels[h]);e=a.globals.gridHeight/c.length,i=-e/2.2;var u=a.globals.yLabelFormatters[0],d=a.config.yaxis[0].labels;if(d.show)for(var f=function(s){var o=void 0===c[s]?"":c[s];o=u(o,{seriesIndex:t,dataPointIndex:s,w:a});var h=n.axesUtils.getYAxisForeColor(d.style.colors,t),f=0;Array.isArray(o)&&(f=o.length/2*parseInt(d.style.fontSize,10));var g=r.drawText({x:d.offsetX-15,y:i+e+d.offsetY-f,text:o,textAnchor:n.yaxis.opposite?"start":"end",foreColor:Array.isArray(h)?h[s]:h,fontSize:d.style.fontSize,fontFamily:d.style.fontFamily,fontWeight:d.style.fontWeight,isPlainText:!1,cssClass:"apexcharts-yaxis-label "+d.style.cssClass});l.add(g);var p=document.createElementNS(a.globals.SVGNS,"title");if(p.textContent=Array.isArray(o)?o.join(" "):o,g.node.appendChild(p),0!==a.config.yaxis[t].labels.rotate){var m=r.rotateAroundCenter(g.node);g.node.setAttribute("transform","rotate(".concat(a.config.yaxis[t].labels.rotate," 0 ").concat(m.y,")"))}i+=e},g=0;g<=c.length-1;g++)f(g);if(void 0!==a.config.yaxis[0].title.text){var p=r.group({class:"apexcharts-yaxis-title apexcharts-xaxis-title-inversed",transform:"translate("+s+", 0)"}),m=r.drawText({x:0,y:a.globals.gridHeight/2,text:a.config.yaxis[0].title.text,textAnchor:"middle",foreColor:a.config.yaxis[0].title.style.color,fontSize:a.config.yaxis[0].title.style.fontSize,fontWeight:a.config.yaxis[0].title.style.fontWeight,fontFamily:a.config.yaxis[0].title.style.fontFamily,cssClass:"apexcharts-yaxis-title-text "+a.config.yaxis[0].title.style.cssClass});p.add(m),o.add(p)}var v=0;this.isCategoryBarHorizontal&&a.config.yaxis[0].opposite&&(v=a.globals.gridWidth);var x=a.config.xaxis.axisBorder;if(x.show){var b=r.drawLine(a.globals.padHorizontal+x.offsetX+v,1+x.offsetY,a.globals.padHorizontal+x.offsetX+v,a.globals.gridHeight+x.offsetY,x.color,0);o.add(b)}return a.config.yaxis[0].axisTicks.show&&this.axesUtils.drawYAxisTicks(v,c.length,a.config.yaxis[0].axisBorder,a.config.yaxis[0].axisTicks,0,e,o),o}},{key:"drawXaxisTicks",value:function(t,e){var i=this.w,n=t;if(!(t<0||t-2>i.globals.gridWidth)){var a=this.offY+i.config.xaxis.axisTicks.offsetY,r=a+i.config.xaxis.axisTicks.height;if("top"===i.config.xaxis.position&&(r=a-i.config.xaxis.axisTicks.height),i.config.xaxis.axisTicks.show){var s=new w(this.ctx).drawLine(t+i.config.xaxis.axisTicks.offsetX,a+i.config.xaxis.offsetY,n+i.config.xaxis.axisTicks.offsetX,r+i.config.xaxis.offsetY,i.config.xaxis.axisTicks.color);e.add(s),s.node.classList.add("apexcharts-xaxis-tick")}}}},{key:"getXAxisTicksPositions",value:function(){var t=this.w,e=[],i=this.xaxisLabels.length,n=t.globals.padHorizontal;if(t.globals.timescaleLabels.length>0)for(var a=0;a<i;a++)n=this.xaxisLabels[a].position,e.push(n);else for(var r=i,s=0;s<r;s++){var o=r;t.globals.isXNumeric&&"bar"!==t.config.chart.type&&(o-=1),n+=t.globals.gridWidth/o,e.push(n)}return e}},{key:"xAxisLabelCorrections",value:function(){var t=this.w,e=new w(this.ctx),i=t.globals.dom.baseEl.querySelector(".apexcharts-xaxis-texts-g"),n=t.globals.dom.baseEl.querySelectorAll(".apexcharts-xaxis-texts-g text"),a=t.globals.dom.baseEl.querySelectorAll(".apexcharts-yaxis-inversed text"),r=t.globals.dom.baseEl.querySelectorAll(".apexcharts-xaxis-inversed-texts-g text tspan");if(t.globals.rotateXLabels||t.config.xaxis.labels.rotateAlways)for(var s=0;s<n.length;s++){var o=e.rotateAroundCenter(n[s]);o.y=o.y-1,o.x=o.x+1,n[s].setAttribute("transform","rotate(".concat(t.config.xaxis.labels.rotate," ").concat(o.x," ").concat(o.y,")")),n[s].setAttribute("text-anchor","end"),i.setAttribute("transform","translate(0, ".concat(-10,")"));var l=n[s].childNodes;t.config.xaxis.labels.trim&&Array.prototype.forEach.call(l,(function(i){e.placeTextWithEllipsis(i,i.textContent,t.globals.xAxisLabelsHeight-("bottom"===t.config.legend.position?20:10))}))}else!function(){for(var i=t.globals.gridWidth/(t.globals.labels.length+1),a=0;a<n.length;a++){var r=n[a].childNodes;t.config.xaxis.labels.trim&&"datetime"!==t.config.xaxis.type&&Array.prototype.forEach.call(r,(function(t){e.placeTextWithEllipsis(t,t.textContent,i)}))}}();if(a.length>0){var c=a[a.length-1].getBBox(),h=a[0].getBBox();c.x<-20&&a[a.length-1].parentNode.removeChild(a[a.length-1]),h.x+h.width>t.globals.gridWidth&&!t.globals.isBarHorizontal&&a[0].parentNode.removeChild(a[0]);for(var u=0;u<r.length;u++)e.placeTextWithEllipsis(r[u],r[u].textContent,t.config.yaxis[0].labels.maxWidth-2*parseFloat(t.config.yaxis[0].title.style.fontSize)-20)}}}]),t}(),$=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w;var i=this.w;this.xaxisLabels=i.globals.labels.slice(),this.axesUtils=new G(e),this.isRangeBar=i.globals.seriesRangeBar.length,i.globals.timescaleLabels.length>0&&(this.xaxisLabels=i.globals.timescaleLabels.slice())}return c(t,[{key:"drawGridArea",value:function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:null,e=this.w,i=new w(this.ctx);null===t&&(t=i.group({class:"apexcharts-grid"}));var n=i.drawLine(e.globals.padHorizontal,1,e.globals.padHorizontal,e.globals.gridHeight,"transparent"),a=i.drawLine(e.globals.padHorizontal,e.globals.gridHeight,e.globals.gridWidth,e.globals.gridHeight,"transparent");return t.add(a),t.add(n),t}},{key:"drawGrid",value:function(){var t=null;return this.w.globals.axisCharts&&(t=this.renderGrid(),this.drawGridArea(t.el)),t}},{key:"createGridMask",value:function(){var t=this.w,e=t.globals,i=new w(this.ctx),n=Array.isArray(t.config.stroke.width)?0:t.config.stroke.width;if(Array.isArray(t.config.stroke.width)){var a=0;t.config.stroke.width.forEach((function(t){a=Math.max(a,t)})),n=a}e.dom.elGridRectMask=document.createElementNS(e.SVGNS,"clipPath"),e.dom.elGridRectMask.setAttribute("id","gridRectMask".concat(e.cuid)),e.dom.elGridRectMarkerMask=document.createElementNS(e.SVGNS,"clipPath"),e.dom.elGridRectMarkerMask.setAttribute("id","gridRectMarkerMask".concat(e.cuid)),e.dom.elForecastMask=document.createElementNS(e.SVGNS,"clipPath"),e.dom.elForecastMask.setAttribute("id","forecastMask".concat(e.cuid)),e.dom.elNonForecastMask=document.createElementNS(e.SVGNS,"clipPath"),e.dom.elNonForecastMask.setAttribute("id","nonForecastMask".concat(e.cuid));var r=t.config.chart.type,s=0,o=0;("bar"===r||"rangeBar"===r||"candlestick"===r||"boxPlot"===r||t.globals.comboBarCount>0)&&t.globals.isXNumeric&&!t.globals.isBarHorizontal&&(s=t.config.grid.padding.left,o=t.config.grid.padding.right,e.barPadForNumericAxis>s&&(s=e.barPadForNumericAxis,o=e.barPadForNumericAxis)),e.dom.elGridRect=i.drawRect(-n/2-s-2,-n/2,e.gridWidth+n+o+s+4,e.gridHeight+n,0,"#fff"),new S(this).getLargestMarkerSize();var l=t.globals.markers.largestSize+1;e.dom.elGridRectMarker=i.drawRect(2*-l,2*-l,e.gridWidth+4*l,e.gridHeight+4*l,0,"#fff"),e.dom.elGridRectMask.appendChild(e.dom.elGridRect.node),e.dom.elGridRectMarkerMask.appendChild(e.dom.elGridRectMarker.node);var c=e.dom.baseEl.querySelector("defs");c.appendChild(e.dom.elGridRectMask),c.appendChild(e.dom.elForecastMask),c.appendChild(e.dom.elNonForecastMask),c.appendChild(e.dom.elGridRectMarkerMask)}},{key:"_drawGridLines",value:function(t){var e=t.i,i=t.x1,n=t.y1,a=t.x2,r=t.y2,s=t.xCount,o=t.parent,l=this.w;0===e&&l.globals.skipFirstTimelinelabel||e===s-1&&l.globals.skipLastTimelinelabel&&!l.config.xaxis.labels.formatter||"radar"===l.config.chart.type||(l.config.grid.xaxis.lines.show&&this._drawGridLine({x1:i,y1:n,x2:a,y2:r,parent:o}),new q(this.ctx).drawXaxisTicks(i,this.elg))}},{key:"_drawGridLine",value:function(t){var e=t.x1,i=t.y1,n=t.x2,a=t.y2,r=t.parent,s=this.w,o=r.node.classList.contains("apexcharts-gridlines-horizontal"),l=s.config.grid.strokeDashArray,c=s.globals.barPadForNumericAxis,h=new w(this).drawLine(e-(o?c:0),i,n+(o?c:0),a,s.config.grid.borderColor,l);h.node.classList.add("apexcharts-gridline"),r.add(h)}},{key:"_drawGridBandRect",value:function(t){var e=t.c,i=t.x1,n=t.y1,a=t.x2,r=t.y2,s=t.type,o=this.w,l=new w(this.ctx),c=o.globals.barPadForNumericAxis;if("column"!==s||"datetime"!==o.config.xaxis.type){var h=o.config.grid[s].colors[e],u=l.drawRect(i-("row"===s?c:0),n,a+("row"===s?2*c:0),r,0,h,o.config.grid[s].opacity);this.elg.add(u),u.attr("clip-path","url(#gridRectMask".concat(o.globals.cuid,")")),u.node.classList.add("apexcharts-grid-".concat(s))}}},{key:"_drawXYLines",value:function(t){var e=this,i=t.xCount,n=t.tickAmount,a=this.w;if(a.config.grid.xaxis.lines.show||a.config.xaxis.axisTicks.show){var r,s=a.globals.padHorizontal,o=a.globals.gridHeight;a.globals.timescaleLabels.length?function(t){for(var n=t.xC,a=t.x1,r=t.y1,s=t.x2,o=t.y2,l=0;l<n;l++)a=e.xaxisLabels[l].position,s=e.xaxisLabels[l].position,e._drawGridLines({i:l,x1:a,y1:r,x2:s,y2:o,xCount:i,parent:e.elgridLinesV})}({xC:i,x1:s,y1:0,x2:r,y2:o}):(a.globals.isXNumeric&&(i=a.globals.xAxisScale.result.length),a.config.xaxis.convertedCatToNumeric&&(i=a.globals.xaxisLabelsCount),function(t){var n=t.xC,r=t.x1,s=t.y1,o=t.x2,l=t.y2;if(void 0!==a.config.xaxis.tickAmount&&"dataPoints"!==a.config.xaxis.tickAmount)a.globals.dom.baseEl.querySelectorAll(".apexcharts-text.apexcharts-xaxis-label tspan:not(:empty)").forEach((function(t,n){var a=t.getBBox();e._drawGridLines({i:n,x1:a.x+a.width/2,y1:s,x2:a.x+a.width/2,y2:l,xCount:i,parent:e.elgridLinesV})}));else for(var c=0;c<n+(a.globals.isXNumeric?0:1);c++)0===c&&1===n&&1===a.globals.dataPoints&&(o=r=a.globals.gridWidth/2),e._drawGridLines({i:c,x1:r,y1:s,x2:o,y2:l,xCount:i,parent:e.elgridLinesV}),o=r+=a.globals.gridWidth/(a.globals.isXNumeric?n-1:n)}({xC:i,x1:s,y1:0,x2:r,y2:o}))}if(a.config.grid.yaxis.lines.show){var l=0,c=0,h=a.globals.gridWidth,u=n+1;this.isRangeBar&&(u=a.globals.labels.length);for(var d=0;d<u+(this.isRangeBar?1:0);d++)this._drawGridLine({x1:0,y1:l,x2:h,y2:c,parent:this.elgridLinesH}),c=l+=a.globals.gridHeight/(this.isRangeBar?u:n)}}},{key:"_drawInvertedXYLines",value:function(t){var e=t.xCount,i=this.w;if(i.config.grid.xaxis.lines.show||i.config.xaxis.axisTicks.show)for(var n,a=i.globals.padHorizontal,r=i.globals.gridHeight,s=0;s<e+1;s++)i.config.grid.xaxis.lines.show&&this._drawGridLine({x1:a,y1:0,x2:n,y2:r,parent:this.elgridLinesV}),new q(this.ctx).drawXaxisTicks(a,this.elg),n=a=a+i.globals.gridWidth/e+.3;if(i.config.grid.yaxis.lines.show)for(var o=0,l=0,c=i.globals.gridWidth,h=0;h<i.globals.dataPoints+1;h++)this._drawGridLine({x1:0,y1:o,x2:c,y2:l,parent:this.elgridLinesH}),l=o+=i.globals.gridHeight/i.globals.dataPoints}},{key:"renderGrid",value:function(){var t=this.w,e=new w(this.ctx);this.elg=e.group({class:"apexcharts-grid"}),this.elgridLinesH=e.group({class:"apexcharts-gridlines-horizontal"}),this.elgridLinesV=e.group({class:"apexcharts-gridlines-vertical"}),this.elg.add(this.elgridLinesH),this.elg.add(this.elgridLinesV),t.config.grid.show||(this.elgridLinesV.hide(),this.elgridLinesH.hide());for(var i,n=t.globals.yAxisScale.length?t.globals.yAxisScale[0].result.length-1:5,a=0;a<t.globals.series.length&&(void 0!==t.globals.yAxisScale[a]&&(n=t.globals.yAxisScale[a].result.length-1),!(n>2));a++);return!t.globals.isBarHorizontal||this.isRangeBar?(i=this.xaxisLabels.length,this.isRangeBar&&(n=t.globals.labels.length,t.config.xaxis.tickAmount&&t.config.xaxis.labels.formatter&&(i=t.config.xaxis.tickAmount)),this._drawXYLines({xCount:i,tickAmount:n})):(i=n,n=t.globals.xTickAmount,this._drawInvertedXYLines({xCount:i,tickAmount:n})),this.drawGridBands(i,n),{el:this.elg,xAxisTickWidth:t.globals.gridWidth/i}}},{key:"drawGridBands",value:function(t,e){var i=this.w;if(void 0!==i.config.grid.row.colors&&i.config.grid.row.colors.length>0)for(var n=0,a=i.globals.gridHeight/e,r=i.globals.gridWidth,s=0,o=0;s<e;s++,o++)o>=i.config.grid.row.colors.length&&(o=0),this._drawGridBandRect({c:o,x1:0,y1:n,x2:r,y2:a,type:"row"}),n+=i.globals.gridHeight/e;if(void 0!==i.config.grid.column.colors&&i.config.grid.column.colors.length>0)for(var l=i.globals.isBarHorizontal||"category"!==i.config.xaxis.type&&!i.config.xaxis.convertedCatToNumeric?t:t-1,c=i.globals.padHorizontal,h=i.globals.padHorizontal+i.globals.gridWidth/l,u=i.globals.gridHeight,d=0,f=0;d<t;d++,f++)f>=i.config.grid.column.colors.length&&(f=0),this._drawGridBandRect({c:f,x1:c,y1:0,x2:h,y2:u,type:"column"}),c+=i.globals.gridWidth/l}}]),t}(),Z=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w}return c(t,[{key:"niceScale",value:function(t,e){var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:10,n=arguments.length>3&&void 0!==arguments[3]?arguments[3]:0,a=arguments.length>4?arguments[4]:void 0,r=this.w,s=Math.abs(e-t);if("dataPoints"===(i=this._adjustTicksForSmallRange(i,n,s))&&(i=r.globals.dataPoints-1),t===Number.MIN_VALUE&&0===e||!x.isNumber(t)&&!x.isNumber(e)||t===Number.MIN_VALUE&&e===-Number.MAX_VALUE){t=0,e=i;var o=this.linearScale(t,e,i);return o}t>e?(console.warn("axis.min cannot be greater than axis.max"),e=t+.1):t===e&&(t=0===t?0:t-.5,e=0===e?2:e+.5);var l=[];s<1&&a&&("candlestick"===r.config.chart.type||"candlestick"===r.config.series[n].type||"boxPlot"===r.config.chart.type||"boxPlot"===r.config.series[n].type||r.globals.isRangeData)&&(e*=1.01);var c=i+1;c<2?c=2:c>2&&(c-=2);var h=s/c,u=Math.floor(x.log10(h)),d=Math.pow(10,u),f=Math.round(h/d);f<1&&(f=1);var g=f*d,p=g*Math.floor(t/g),m=g*Math.ceil(e/g),v=p;if(a&&s>2){for(;l.push(v),!((v+=g)>m););return{result:l,niceMin:l[0],niceMax:l[l.length-1]}}var b=t;(l=[]).push(b);for(var y=Math.abs(e-t)/i,w=0;w<=i;w++)b+=y,l.push(b);return l[l.length-2]>=e&&l.pop(),{result:l,niceMin:l[0],niceMax:l[l.length-1]}}},{key:"linearScale",value:function(t,e){var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:10,n=arguments.length>3?arguments[3]:void 0,a=Math.abs(e-t);"dataPoints"===(i=this._adjustTicksForSmallRange(i,n,a))&&(i=this.w.globals.dataPoints-1);var r=a/i;i===Number.MAX_VALUE&&(i=10,r=1);for(var s=[],o=t;i>=0;)s.push(o),o+=r,i-=1;return{result:s,niceMin:s[0],niceMax:s[s.length-1]}}},{key:"logarithmicScale",value:function(t,e,i){for(var n=[],a=Math.ceil(Math.log(e)/Math.log(i))+1,r=0;r<a;r++)n.push(Math.pow(i,r));return 0===t&&n.unshift(t),{result:n,niceMin:n[0],niceMax:n[n.length-1]}}},{key:"_adjustTicksForSmallRange",value:function(t,e,i){var n=t;if(void 0!==e&&this.w.config.yaxis[e].labels.formatter&&void 0===this.w.config.yaxis[e].tickAmount){var a=this.w.config.yaxis[e].labels.formatter(1);x.isNumber(Number(a))&&!x.isFloat(a)&&(n=Math.ceil(i))}return n<t?n:t}},{key:"setYScaleForIndex",value:function(t,e,i){var n=this.w.globals,a=this.w.config,r=n.isBarHorizontal?a.xaxis:a.yaxis[t];void 0===n.yAxisScale[t]&&(n.yAxisScale[t]=[]);var s=Math.abs(i-e);if(r.logarithmic&&s<=5&&(n.invalidLogScale=!0),r.logarithmic&&s>5)n.allSeriesCollapsed=!1,n.yAxisScale[t]=this.logarithmicScale(e,i,r.logBase);else if(i!==-Number.MAX_VALUE&&x.isNumber(i))if(n.allSeriesCollapsed=!1,void 0===r.min&&void 0===r.max||r.forceNiceScale){var o=void 0===a.yaxis[t].max&&void 0===a.yaxis[t].min||a.yaxis[t].forceNiceScale;n.yAxisScale[t]=this.niceScale(e,i,r.tickAmount?r.tickAmount:s<5&&s>1?s+1:5,t,o)}else n.yAxisScale[t]=this.linearScale(e,i,r.tickAmount,t);else n.yAxisScale[t]=this.linearScale(0,5,5)}},{key:"setXScale",value:function(t,e){var i=this.w,n=i.globals,a=i.config.xaxis,r=Math.abs(e-t);return e!==-Number.MAX_VALUE&&x.isNumber(e)?n.xAxisScale=this.linearScale(t,e,a.tickAmount?a.tickAmount:r<5&&r>1?r+1:5,0):n.xAxisScale=this.linearScale(0,5,5),n.xAxisScale}},{key:"setMultipleYScales",value:function(){var t=this,e=this.w.globals,i=this.w.config,n=e.minYArr.concat([]),a=e.maxYArr.concat([]),r=[];i.yaxis.forEach((function(e,s){var o=s;i.series.forEach((function(t,i){t.name===e.seriesName&&(o=i,s!==i?r.push({index:i,similarIndex:s,alreadyExists:!0}):r.push({index:i}))}));var l=n[o],c=a[o];t.setYScaleForIndex(s,l,c)})),this.sameScaleInMultipleAxes(n,a,r)}},{key:"sameScaleInMultipleAxes",value:function(t,e,i){var n=this,a=this.w.config,r=this.w.globals,s=[];i.forEach((function(t){t.alreadyExists&&(void 0===s[t.index]&&(s[t.index]=[]),s[t.index].push(t.index),s[t.index].push(t.similarIndex))})),r.yAxisSameScaleIndices=s,s.forEach((function(t,e){s.forEach((function(i,n){var a,r;e!==n&&(a=t,r=i,a.filter((function(t){return-1!==r.indexOf(t)}))).length>0&&(s[e]=s[e].concat(s[n]))}))}));var o=s.map((function(t){return t.filter((function(e,i){return t.indexOf(e)===i}))})).map((function(t){return t.sort()}));s=s.filter((function(t){return!!t}));var l=o.slice(),c=l.map((function(t){return JSON.stringify(t)}));l=l.filter((function(t,e){return c.indexOf(JSON.stringify(t))===e}));var h=[],u=[];t.forEach((function(t,i){l.forEach((function(n,a){n.indexOf(i)>-1&&(void 0===h[a]&&(h[a]=[],u[a]=[]),h[a].push({key:i,value:t}),u[a].push({key:i,value:e[i]}))}))}));var d=Array.apply(null,Array(l.length)).map(Number.prototype.valueOf,Number.MIN_VALUE),f=Array.apply(null,Array(l.length)).map(Number.prototype.valueOf,-Number.MAX_VALUE);h.forEach((function(t,e){t.forEach((function(t,i){d[e]=Math.min(t.value,d[e])}))})),u.forEach((function(t,e){t.forEach((function(t,i){f[e]=Math.max(t.value,f[e])}))})),t.forEach((function(t,e){u.forEach((function(t,i){var s=d[i],o=f[i];a.chart.stacked&&(o=0,t.forEach((function(t,e){t.value!==-Number.MAX_VALUE&&(o+=t.value),s!==Number.MIN_VALUE&&(s+=h[i][e].value)}))),t.forEach((function(i,l){t[l].key===e&&(void 0!==a.yaxis[e].min&&(s="function"==typeof a.yaxis[e].min?a.yaxis[e].min(r.minY):a.yaxis[e].min),void 0!==a.yaxis[e].max&&(o="function"==typeof a.yaxis[e].max?a.yaxis[e].max(r.maxY):a.yaxis[e].max),n.setYScaleForIndex(e,s,o))}))}))}))}},{key:"autoScaleY",value:function(t,e,i){t||(t=this);var n=t.w;if(n.globals.isMultipleYAxis||n.globals.collapsedSeries.length)return console.warn("autoScaleYaxis is not supported in a multi-yaxis chart."),e;var a=n.globals.seriesX[0],r=n.config.chart.stacked;return e.forEach((function(t,s){for(var o=0,l=0;l<a.length;l++)if(a[l]>=i.xaxis.min){o=l;break}var c,h,u=n.globals.minYArr[s],d=n.globals.maxYArr[s],f=n.globals.stackedSeriesTotals;n.globals.series.forEach((function(s,l){var g=s[o];r?(g=f[o],c=h=g,f.forEach((function(t,e){a[e]<=i.xaxis.max&&a[e]>=i.xaxis.min&&(t>h&&null!==t&&(h=t),s[e]<c&&null!==s[e]&&(c=s[e]))}))):(c=h=g,s.forEach((function(t,e){if(a[e]<=i.xaxis.max&&a[e]>=i.xaxis.min){var r=t,s=t;n.globals.series.forEach((function(i,n){null!==t&&(r=Math.min(i[e],r),s=Math.max(i[e],s))})),s>h&&null!==s&&(h=s),r<c&&null!==r&&(c=r)}}))),void 0===c&&void 0===h&&(c=u,h=d),(h*=h<0?.9:1.1)<0&&h<d&&(h=d),(c*=c<0?1.1:.9)<0&&c>u&&(c=u),e.length>1?(e[l].min=void 0===t.min?c:t.min,e[l].max=void 0===t.max?h:t.max):(e[0].min=void 0===t.min?c:t.min,e[0].max=void 0===t.max?h:t.max)}))})),e}}]),t}(),K=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w,this.scales=new Z(e)}return c(t,[{key:"init",value:function(){this.setYRange(),this.setXRange(),this.setZRange()}},{key:"getMinYMaxY",value:function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:Number.MAX_VALUE,i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:-Number.MAX_VALUE,n=arguments.length>3&&void 0!==arguments[3]?arguments[3]:null,a=this.w.config,r=this.w.globals,s=-Number.MAX_VALUE,o=Number.MIN_VALUE;null===n&&(n=t+1);var l=r.series,c=l,h=l;"candlestick"===a.chart.type?(c=r.seriesCandleL,h=r.seriesCandleH):"boxPlot"===a.chart.type?(c=r.seriesCandleO,h=r.seriesCandleC):r.isRangeData&&(c=r.seriesRangeStart,h=r.seriesRangeEnd);for(var u=t;u<n;u++){r.dataPoints=Math.max(r.dataPoints,l[u].length),r.categoryLabels.length&&(r.dataPoints=r.categoryLabels.filter((function(t){return void 0!==t})).length);for(var d=0;d<r.series[u].length;d++){var f=l[u][d];null!==f&&x.isNumber(f)?(void 0!==h[u][d]&&(s=Math.max(s,h[u][d]),e=Math.min(e,h[u][d])),void 0!==c[u][d]&&(e=Math.min(e,c[u][d]),i=Math.max(i,c[u][d])),"candlestick"!==this.w.config.chart.type&&"boxPlot"!==this.w.config.chart.type||(void 0!==r.seriesCandleC[u][d]&&(s=Math.max(s,r.seriesCandleO[u][d]),s=Math.max(s,r.seriesCandleH[u][d]),s=Math.max(s,r.seriesCandleL[u][d]),s=Math.max(s,r.seriesCandleC[u][d]),"boxPlot"===this.w.config.chart.type&&(s=Math.max(s,r.seriesCandleM[u][d]))),!a.series[u].type||"candlestick"===a.series[u].type&&"boxPlot"===a.series[u].type||(s=Math.max(s,r.series[u][d]),e=Math.min(e,r.series[u][d])),i=s),r.seriesGoals[u]&&r.seriesGoals[u][d]&&Array.isArray(r.seriesGoals[u][d])&&r.seriesGoals[u][d].forEach((function(t){o!==Number.MIN_VALUE&&(o=Math.min(o,t.value),e=o),s=Math.max(s,t.value),i=s})),x.isFloat(f)&&(f=x.noExponents(f),r.yValueDecimal=Math.max(r.yValueDecimal,f.toString().split(".")[1].length)),o>c[u][d]&&c[u][d]<0&&(o=c[u][d])):r.hasNullValues=!0}}return"rangeBar"===a.chart.type&&r.seriesRangeStart.length&&r.isBarHorizontal&&(o=e),"bar"===a.chart.type&&(o<0&&s<0&&(s=0),o===Number.MIN_VALUE&&(o=0)),{minY:o,maxY:s,lowestY:e,highestY:i}}},{key:"setYRange",value:function(){var t=this.w.globals,e=this.w.config;t.maxY=-Number.MAX_VALUE,t.minY=Number.MIN_VALUE;var i=Number.MAX_VALUE;if(t.isMultipleYAxis)for(var n=0;n<t.series.length;n++){var a=this.getMinYMaxY(n,i,null,n+1);t.minYArr.push(a.minY),t.maxYArr.push(a.maxY),i=a.lowestY}var r=this.getMinYMaxY(0,i,null,t.series.length);if(t.minY=r.minY,t.maxY=r.maxY,i=r.lowestY,e.chart.stacked&&this._setStackedMinMax(),("line"===e.chart.type||"area"===e.chart.type||"candlestick"===e.chart.type||"boxPlot"===e.chart.type||"rangeBar"===e.chart.type&&!t.isBarHorizontal)&&t.minY===Number.MIN_VALUE&&i!==-Number.MAX_VALUE&&i!==t.maxY){var s=t.maxY-i;(i>=0&&i<=10||void 0!==e.yaxis[0].min||void 0!==e.yaxis[0].max)&&(s=0),t.minY=i-5*s/100,i>0&&t.minY<0&&(t.minY=0),t.maxY=t.maxY+5*s/100}return e.yaxis.forEach((function(e,i){void 0!==e.max&&("number"==typeof e.max?t.maxYArr[i]=e.max:"function"==typeof e.max&&(t.maxYArr[i]=e.max(t.isMultipleYAxis?t.maxYArr[i]:t.maxY)),t.maxY=t.maxYArr[i]),void 0!==e.min&&("number"==typeof e.min?t.minYArr[i]=e.min:"function"==typeof e.min&&(t.minYArr[i]=e.min(t.isMultipleYAxis?t.minYArr[i]===Number.MIN_VALUE?0:t.minYArr[i]:t.minY)),t.minY=t.minYArr[i])})),t.isBarHorizontal&&["min","max"].forEach((function(i){void 0!==e.xaxis[i]&&"number"==typeof e.xaxis[i]&&("min"===i?t.minY=e.xaxis[i]:t.maxY=e.xaxis[i])})),t.isMultipleYAxis?(this.scales.setMultipleYScales(),t.minY=i,t.yAxisScale.forEach((function(e,i){t.minYArr[i]=e.niceMin,t.maxYArr[i]=e.niceMax}))):(this.scales.setYScaleForIndex(0,t.minY,t.maxY),t.minY=t.yAxisScale[0].niceMin,t.maxY=t.yAxisScale[0].niceMax,t.minYArr[0]=t.yAxisScale[0].niceMin,t.maxYArr[0]=t.yAxisScale[0].niceMax),{minY:t.minY,maxY:t.maxY,minYArr:t.minYArr,maxYArr:t.maxYArr,yAxisScale:t.yAxisScale}}},{key:"setXRange",value:function(){var t=this.w.globals,e=this.w.config,i="numeric"===e.xaxis.type||"datetime"===e.xaxis.type||"category"===e.xaxis.type&&!t.noLabelsProvided||t.noLabelsProvided||t.isXNumeric;if(t.isXNumeric&&function(){for(var e=0;e<t.series.length;e++)if(t.labels[e])for(var i=0;i<t.labels[e].length;i++)null!==t.labels[e][i]&&x.isNumber(t.labels[e][i])&&(t.maxX=Math.max(t.maxX,t.labels[e][i]),t.initialMaxX=Math.max(t.maxX,t.labels[e][i]),t.minX=Math.min(t.minX,t.labels[e][i]),t.initialMinX=Math.min(t.minX,t.labels[e][i]))}(),t.noLabelsProvided&&0===e.xaxis.categories.length&&(t.maxX=t.labels[t.labels.length-1],t.initialMaxX=t.labels[t.labels.length-1],t.minX=1,t.initialMinX=1),t.isXNumeric||t.noLabelsProvided||t.dataFormatXNumeric){var n;if(void 0===e.xaxis.tickAmount?(n=Math.round(t.svgWidth/150),"numeric"===e.xaxis.type&&t.dataPoints<30&&(n=t.dataPoints-1),n>t.dataPoints&&0!==t.dataPoints&&(n=t.dataPoints-1)):"dataPoints"===e.xaxis.tickAmount?(t.series.length>1&&(n=t.series[t.maxValsInArrayIndex].length-1),t.isXNumeric&&(n=t.maxX-t.minX-1)):n=e.xaxis.tickAmount,t.xTickAmount=n,void 0!==e.xaxis.max&&"number"==typeof e.xaxis.max&&(t.maxX=e.xaxis.max),void 0!==e.xaxis.min&&"number"==typeof e.xaxis.min&&(t.minX=e.xaxis.min),void 0!==e.xaxis.range&&(t.minX=t.maxX-e.xaxis.range),t.minX!==Number.MAX_VALUE&&t.maxX!==-Number.MAX_VALUE)if(e.xaxis.convertedCatToNumeric&&!t.dataFormatXNumeric){for(var a=[],r=t.minX-1;r<t.maxX;r++)a.push(r+1);t.xAxisScale={result:a,niceMin:a[0],niceMax:a[a.length-1]}}else t.xAxisScale=this.scales.setXScale(t.minX,t.maxX);else t.xAxisScale=this.scales.linearScale(1,n,n),t.noLabelsProvided&&t.labels.length>0&&(t.xAxisScale=this.scales.linearScale(1,t.labels.length,n-1),t.seriesX=t.labels.slice());i&&(t.labels=t.xAxisScale.result.slice())}return t.isBarHorizontal&&t.labels.length&&(t.xTickAmount=t.labels.length),this._handleSingleDataPoint(),this._getMinXDiff(),{minX:t.minX,maxX:t.maxX}}},{key:"setZRange",value:function(){var t=this.w.globals;if(t.isDataXYZ)for(var e=0;e<t.series.length;e++)if(void 0!==t.seriesZ[e])for(var i=0;i<t.seriesZ[e].length;i++)null!==t.seriesZ[e][i]&&x.isNumber(t.seriesZ[e][i])&&(t.maxZ=Math.max(t.maxZ,t.seriesZ[e][i]),t.minZ=Math.min(t.minZ,t.seriesZ[e][i]))}},{key:"_handleSingleDataPoint",value:function(){var t=this.w.globals,e=this.w.config;if(t.minX===t.maxX){var i=new z(this.ctx);if("datetime"===e.xaxis.type){var n=i.getDate(t.minX);e.xaxis.labels.datetimeUTC?n.setUTCDate(n.getUTCDate()-2):n.setDate(n.getDate()-2),t.minX=new Date(n).getTime();var a=i.getDate(t.maxX);e.xaxis.labels.datetimeUTC?a.setUTCDate(a.getUTCDate()+2):a.setDate(a.getDate()+2),t.maxX=new Date(a).getTime()}else("numeric"===e.xaxis.type||"category"===e.xaxis.type&&!t.noLabelsProvided)&&(t.minX=t.minX-2,t.initialMinX=t.minX,t.maxX=t.maxX+2,t.initialMaxX=t.maxX)}}},{key:"_getMinXDiff",value:function(){var t=this.w.globals;t.isXNumeric&&t.seriesX.forEach((function(e,i){1===e.length&&e.push(t.seriesX[t.maxValsInArrayIndex][t.seriesX[t.maxValsInArrayIndex].length-1]);var n=e.slice();n.sort((function(t,e){return t-e})),n.forEach((function(e,i){if(i>0){var a=e-n[i-1];a>0&&(t.minXDiff=Math.min(a,t.minXDiff))}})),1!==t.dataPoints&&t.minXDiff!==Number.MAX_VALUE||(t.minXDiff=.5)}))}},{key:"_setStackedMinMax",value:function(){var t=this.w.globals,e=[],i=[];if(t.series.length)for(var n=0;n<t.series[t.maxValsInArrayIndex].length;n++)for(var a=0,r=0,s=0;s<t.series.length;s++)null!==t.series[s][n]&&x.isNumber(t.series[s][n])&&(t.series[s][n]>0?a=a+parseFloat(t.series[s][n])+1e-4:r+=parseFloat(t.series[s][n])),s===t.series.length-1&&(e.push(a),i.push(r));for(var o=0;o<e.length;o++)t.maxY=Math.max(t.maxY,e[o]),t.minY=Math.min(t.minY,i[o])}}]),t}(),Q=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w;var i=this.w;this.xaxisFontSize=i.config.xaxis.labels.style.fontSize,this.axisFontFamily=i.config.xaxis.labels.style.fontFamily,this.xaxisForeColors=i.config.xaxis.labels.style.colors,this.isCategoryBarHorizontal="bar"===i.config.chart.type&&i.config.plotOptions.bar.horizontal,this.xAxisoffX=0,"bottom"===i.config.xaxis.position&&(this.xAxisoffX=i.globals.gridHeight),this.drawnLabels=[],this.axesUtils=new G(e)}return c(t,[{key:"drawYaxis",value:function(t){var e=this,i=this.w,n=new w(this.ctx),a=i.config.yaxis[t].labels.style,r=a.fontSize,s=a.fontFamily,o=a.fontWeight,l=n.group({class:"apexcharts-yaxis",rel:t,transform:"translate("+i.globals.translateYAxisX[t]+", 0)"});if(this.axesUtils.isYAxisHidden(t))return l;var c=n.group({class:"apexcharts-yaxis-texts-g"});l.add(c);var h=i.globals.yAxisScale[t].result.length-1,u=i.globals.gridHeight/h,d=i.globals.translateY,f=i.globals.yLabelFormatters[t],g=i.globals.yAxisScale[t].result.slice();g=this.axesUtils.checkForReversedLabels(t,g);var p="";if(i.config.yaxis[t].labels.show)for(var m=function(l){var m=g[l];m=f(m,l,i);var v=i.config.yaxis[t].labels.padding;i.config.yaxis[t].opposite&&0!==i.config.yaxis.length&&(v*=-1);var x=e.axesUtils.getYAxisForeColor(a.colors,t),b=n.drawText({x:v,y:d+h/10+i.config.yaxis[t].labels.offsetY+1,text:m,textAnchor:i.config.yaxis[t].opposite?"start":"end",fontSize:r,fontFamily:s,fontWeight:o,foreColor:Array.isArray(x)?x[l]:x,isPlainText:!1,cssClass:"apexcharts-yaxis-label "+a.cssClass});l===h&&(p=b),c.add(b);var y=document.createElementNS(i.globals.SVGNS,"title");if(y.textContent=Array.isArray(m)?m.join(" "):m,b.node.appendChild(y),0!==i.config.yaxis[t].labels.rotate){var w=n.rotateAroundCenter(p.node),k=n.rotateAroundCenter(b.node);b.node.setAttribute("transform","rotate(".concat(i.config.yaxis[t].labels.rotate," ").concat(w.x," ").concat(k.y,")"))}d+=u},v=h;v>=0;v--)m(v);if(void 0!==i.config.yaxis[t].title.text){var x=n.group({class:"apexcharts-yaxis-title"}),b=0;i.config.yaxis[t].opposite&&(b=i.globals.translateYAxisX[t]);var y=n.drawText({x:b,y:i.globals.gridHeight/2+i.globals.translateY+i.config.yaxis[t].title.offsetY,text:i.config.yaxis[t].title.text,textAnchor:"end",foreColor:i.config.yaxis[t].title.style.color,fontSize:i.config.yaxis[t].title.style.fontSize,fontWeight:i.config.yaxis[t].title.style.fontWeight,fontFamily:i.config.yaxis[t].title.style.fontFamily,cssClass:"apexcharts-yaxis-title-text "+i.config.yaxis[t].title.style.cssClass});x.add(y),l.add(x)}var k=i.config.yaxis[t].axisBorder,A=31+k.offsetX;if(i.config.yaxis[t].opposite&&(A=-31-k.offsetX),k.show){var S=n.drawLine(A,i.globals.translateY+k.offsetY-2,A,i.globals.gridHeight+i.globals.translateY+k.offsetY+2,k.color,0,k.width);l.add(S)}return i.config.yaxis[t].axisTicks.show&&this.axesUtils.drawYAxisTicks(A,h,k,i.config.yaxis[t].axisTicks,t,u,l),l}},{key:"drawYaxisInversed",value:function(t){var e=this.w,i=new w(this.ctx),n=i.group({class:"apexcharts-xaxis apexcharts-yaxis-inversed"}),a=i.group({class:"apexcharts-xaxis-texts-g",transform:"translate(".concat(e.globals.translateXAxisX,", ").concat(e.globals.translateXAxisY,")")});n.add(a);var r=e.globals.yAxisScale[t].result.length-1,s=e.globals.gridWidth/r+.1,o=s+e.config.xaxis.labels.offsetX,l=e.globals.xLabelFormatter,c=e.globals.yAxisScale[t].result.slice(),h=e.globals.timescaleLabels;h.length>0&&(this.xaxisLabels=h.slice(),r=(c=h.slice()).length),c=this.axesUtils.checkForReversedLabels(t,c);var u=h.length;if(e.config.xaxis.labels.show)for(var d=u?0:r;u?d<u:d>=0;u?d++:d--){var f=c[d];f=l(f,d,e);var g=e.globals.gridWidth+e.globals.padHorizontal-(o-s+e.config.xaxis.labels.offsetX);if(h.length){var p=this.axesUtils.getLabel(c,h,g,d,this.drawnLabels,this.xaxisFontSize);g=p.x,f=p.text,this.drawnLabels.push(p.text),0===d&&e.globals.skipFirstTimelinelabel&&(f=""),d===c.length-1&&e.globals.skipLastTimelinelabel&&(f="")}var m=i.drawText({x:g,y:this.xAxisoffX+e.config.xaxis.labels.offsetY+30-("top"===e.config.xaxis.position?e.globals.xAxisHeight+e.config.xaxis.axisTicks.height-2:0),text:f,textAnchor:"middle",foreColor:Array.isArray(this.xaxisForeColors)?this.xaxisForeColors[t]:this.xaxisForeColors,fontSize:this.xaxisFontSize,fontFamily:this.xaxisFontFamily,fontWeight:e.config.xaxis.labels.style.fontWeight,isPlainText:!1,cssClass:"apexcharts-xaxis-label "+e.config.xaxis.labels.style.cssClass});a.add(m),m.tspan(f);var v=document.createElementNS(e.globals.SVGNS,"title");v.textContent=f,m.node.appendChild(v),o+=s}return this.inversedYAxisTitleText(n),this.inversedYAxisBorder(n),n}},{key:"inversedYAxisBorder",value:function(t){var e=this.w,i=new w(this.ctx),n=e.config.xaxis.axisBorder;if(n.show){var a=0;"bar"===e.config.chart.type&&e.globals.isXNumeric&&(a-=15);var r=i.drawLine(e.globals.padHorizontal+a+n.offsetX,this.xAxisoffX,e.globals.gridWidth,this.xAxisoffX,n.color,0,n.height);t.add(r)}}},{key:"inversedYAxisTitleText",value:function(t){var e=this.w,i=new w(this.ctx);if(void 0!==e.config.xaxis.title.text){var n=i.group({class:"apexcharts-xaxis-title apexcharts-yaxis-title-inversed"}),a=i.drawText({x:e.globals.gridWidth/2+e.config.xaxis.title.offsetX,y:this.xAxisoffX+parseFloat(this.xaxisFontSize)+parseFloat(e.config.xaxis.title.style.fontSize)+e.config.xaxis.title.offsetY+20,text:e.config.xaxis.title.text,textAnchor:"middle",fontSize:e.config.xaxis.title.style.fontSize,fontFamily:e.config.xaxis.title.style.fontFamily,fontWeight:e.config.xaxis.title.style.fontWeight,foreColor:e.config.xaxis.title.style.color,cssClass:"apexcharts-xaxis-title-text "+e.config.xaxis.title.style.cssClass});n.add(a),t.add(n)}}},{key:"yAxisTitleRotate",value:function(t,e){var i=this.w,n=new w(this.ctx),a={width:0,height:0},r={width:0,height:0},s=i.globals.dom.baseEl.querySelector(" .apexcharts-yaxis[rel='".concat(t,"'] .apexcharts-yaxis-texts-g"));null!==s&&(a=s.getBoundingClientRect());var o=i.globals.dom.baseEl.querySelector(".apexcharts-yaxis[rel='".concat(t,"'] .apexcharts-yaxis-title text"));if(null!==o&&(r=o.getBoundingClientRect()),null!==o){var l=this.xPaddingForYAxisTitle(t,a,r,e);o.setAttribute("x",l.xPos-(e?10:0))}if(null!==o){var c=n.rotateAroundCenter(o);o.setAttribute("transform","rotate(".concat(e?-1*i.config.yaxis[t].title.rotate:i.config.yaxis[t].title.rotate," ").concat(c.x," ").concat(c.y,")"))}}},{key:"xPaddingForYAxisTitle",value:function(t,e,i,n){var a=this.w,r=0,s=0,o=10;return void 0===a.config.yaxis[t].title.text||t<0?{xPos:s,padd:0}:(n?(s=e.width+a.config.yaxis[t].title.offsetX+i.width/2+o/2,0===(r+=1)&&(s-=o/2)):(s=-1*e.width+a.config.yaxis[t].title.offsetX+o/2+i.width/2,a.globals.isBarHorizontal&&(o=25,s=-1*e.width-a.config.yaxis[t].title.offsetX-o)),{xPos:s,padd:o})}},{key:"setYAxisXPosition",value:function(t,e){var i=this.w,n=0,a=0,r=18,s=1;i.config.yaxis.length>1&&(this.multipleYs=!0),i.config.yaxis.map((function(o,l){var c=i.globals.ignoreYAxisIndexes.indexOf(l)>-1||!o.show||o.floating||0===t[l].width,h=t[l].width+e[l].width;o.opposite?i.globals.isBarHorizontal?(a=i.globals.gridWidth+i.globals.translateX-1,i.globals.translateYAxisX[l]=a-o.labels.offsetX):(a=i.globals.gridWidth+i.globals.translateX+s,c||(s=s+h+20),i.globals.translateYAxisX[l]=a-o.labels.offsetX+20):(n=i.globals.translateX-r,c||(r=r+h+20),i.globals.translateYAxisX[l]=n+o.labels.offsetX)}))}},{key:"setYAxisTextAlignments",value:function(){var t=this.w,e=t.globals.dom.baseEl.getElementsByClassName("apexcharts-yaxis");(e=x.listToArray(e)).forEach((function(e,i){var n=t.config.yaxis[i];if(n&&void 0!==n.labels.align){var a=t.globals.dom.baseEl.querySelector(".apexcharts-yaxis[rel='".concat(i,"'] .apexcharts-yaxis-texts-g")),r=t.globals.dom.baseEl.querySelectorAll(".apexcharts-yaxis[rel='".concat(i,"'] .apexcharts-yaxis-label"));r=x.listToArray(r);var s=a.getBoundingClientRect();"left"===n.labels.align?(r.forEach((function(t,e){t.setAttribute("text-anchor","start")})),n.opposite||a.setAttribute("transform","translate(-".concat(s.width,", 0)"))):"center"===n.labels.align?(r.forEach((function(t,e){t.setAttribute("text-anchor","middle")})),a.setAttribute("transform","translate(".concat(s.width/2*(n.opposite?1:-1),", 0)"))):"right"===n.labels.align&&(r.forEach((function(t,e){t.setAttribute("text-anchor","end")})),n.opposite&&a.setAttribute("transform","translate(".concat(s.width,", 0)")))}}))}}]),t}(),J=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w,this.documentEvent=x.bind(this.documentEvent,this)}return c(t,[{key:"addEventListener",value:function(t,e){var i=this.w;i.globals.events.hasOwnProperty(t)?i.globals.events[t].push(e):i.globals.events[t]=[e]}},{key:"removeEventListener",value:function(t,e){var i=this.w;if(i.globals.events.hasOwnProperty(t)){var n=i.globals.events[t].indexOf(e);-1!==n&&i.globals.events[t].splice(n,1)}}},{key:"fireEvent",value:function(t,e){var i=this.w;if(i.globals.events.hasOwnProperty(t)){e&&e.length||(e=[]);for(var n=i.globals.events[t],a=n.length,r=0;r<a;r++)n[r].apply(null,e)}}},{key:"setupEventHandlers",value:function(){var t=this,e=this.w,i=this.ctx,n=e.globals.dom.baseEl.querySelector(e.globals.chartClass);this.ctx.eventList.forEach((function(t){n.addEventListener(t,(function(t){var n=Object.assign({},e,{seriesIndex:e.globals.capturedSeriesIndex,dataPointIndex:e.globals.capturedDataPointIndex});"mousemove"===t.type||"touchmove"===t.type?"function"==typeof e.config.chart.events.mouseMove&&e.config.chart.events.mouseMove(t,i,n):"mouseleave"===t.type||"touchleave"===t.type?"function"==typeof e.config.chart.events.mouseLeave&&e.config.chart.events.mouseLeave(t,i,n):("mouseup"===t.type&&1===t.which||"touchend"===t.type)&&("function"==typeof e.config.chart.events.click&&e.config.chart.events.click(t,i,n),i.ctx.events.fireEvent("click",[t,i,n]))}),{capture:!1,passive:!0})})),this.ctx.eventList.forEach((function(i){e.globals.dom.baseEl.addEventListener(i,t.documentEvent,{passive:!0})})),this.ctx.core.setupBrushHandler()}},{key:"documentEvent",value:function(t){var e=this.w,i=t.target.className;if("click"===t.type){var n=e.globals.dom.baseEl.querySelector(".apexcharts-menu");n&&n.classList.contains("apexcharts-menu-open")&&"apexcharts-menu-icon"!==i&&n.classList.remove("apexcharts-menu-open")}e.globals.clientX="touchmove"===t.type?t.touches[0].clientX:t.clientX,e.globals.clientY="touchmove"===t.type?t.touches[0].clientY:t.clientY}}]),t}(),tt=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w}return c(t,[{key:"setCurrentLocaleValues",value:function(t){var e=this.w.config.chart.locales;window.Apex.chart&&window.Apex.chart.locales&&window.Apex.chart.locales.length>0&&(e=this.w.config.chart.locales.concat(window.Apex.chart.locales));var i=e.filter((function(e){return e.name===t}))[0];if(!i)throw new Error("Wrong locale name provided. Please make sure you set the correct locale name in options");var n=x.extend(E,i);this.w.globals.locale=n.options}}]),t}(),et=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w}return c(t,[{key:"drawAxis",value:function(t,e){var i,n,a=this.w.globals,r=this.w.config,s=new q(this.ctx),o=new Q(this.ctx);a.axisCharts&&"radar"!==t&&(a.isBarHorizontal?(n=o.drawYaxisInversed(0),i=s.drawXaxisInversed(0),a.dom.elGraphical.add(i),a.dom.elGraphical.add(n)):(i=s.drawXaxis(),a.dom.elGraphical.add(i),r.yaxis.map((function(t,e){-1===a.ignoreYAxisIndexes.indexOf(e)&&(n=o.drawYaxis(e),a.dom.Paper.add(n))}))))}}]),t}(),it=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w}return c(t,[{key:"drawXCrosshairs",value:function(){var t=this.w,e=new w(this.ctx),i=new y(this.ctx),n=t.config.xaxis.crosshairs.fill.gradient,a=t.config.xaxis.crosshairs.dropShadow,r=t.config.xaxis.crosshairs.fill.type,s=n.colorFrom,o=n.colorTo,l=n.opacityFrom,c=n.opacityTo,h=n.stops,u=a.enabled,d=a.left,f=a.top,g=a.blur,p=a.color,m=a.opacity,v=t.config.xaxis.crosshairs.fill.color;if(t.config.xaxis.crosshairs.show){"gradient"===r&&(v=e.drawGradient("vertical",s,o,l,c,null,h,null));var b=e.drawRect();1===t.config.xaxis.crosshairs.width&&(b=e.drawLine());var k=t.globals.gridHeight;(!x.isNumber(k)||k<0)&&(k=0);var A=t.config.xaxis.crosshairs.width;(!x.isNumber(A)||A<0)&&(A=0),b.attr({class:"apexcharts-xcrosshairs",x:0,y:0,y2:k,width:A,height:k,fill:v,filter:"none","fill-opacity":t.config.xaxis.crosshairs.opacity,stroke:t.config.xaxis.crosshairs.stroke.color,"stroke-width":t.config.xaxis.crosshairs.stroke.width,"stroke-dasharray":t.config.xaxis.crosshairs.stroke.dashArray}),u&&(b=i.dropShadow(b,{left:d,top:f,blur:g,color:p,opacity:m})),t.globals.dom.elGraphical.add(b)}}},{key:"drawYCrosshairs",value:function(){var t=this.w,e=new w(this.ctx),i=t.config.yaxis[0].crosshairs,n=t.globals.barPadForNumericAxis;if(t.config.yaxis[0].crosshairs.show){var a=e.drawLine(-n,0,t.globals.gridWidth+n,0,i.stroke.color,i.stroke.dashArray,i.stroke.width);a.attr({class:"apexcharts-ycrosshairs"}),t.globals.dom.elGraphical.add(a)}var r=e.drawLine(-n,0,t.globals.gridWidth+n,0,i.stroke.color,0,0);r.attr({class:"apexcharts-ycrosshairs-hidden"}),t.globals.dom.elGraphical.add(r)}}]),t}(),nt=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w}return c(t,[{key:"checkResponsiveConfig",value:function(t){var e=this,i=this.w,n=i.config;if(0!==n.responsive.length){var a=n.responsive.slice();a.sort((function(t,e){return t.breakpoint>e.breakpoint?1:e.breakpoint>t.breakpoint?-1:0})).reverse();var r=new X({}),s=function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},n=a[0].breakpoint,s=window.innerWidth>0?window.innerWidth:screen.width;if(s>n){var o=S.extendArrayProps(r,i.globals.initialConfig,i);t=x.extend(o,t),t=x.extend(i.config,t),e.overrideResponsiveOptions(t)}else for(var l=0;l<a.length;l++)s<a[l].breakpoint&&(t=S.extendArrayProps(r,a[l].options,i),t=x.extend(i.config,t),e.overrideResponsiveOptions(t))};if(t){var o=S.extendArrayProps(r,t,i);o=x.extend(i.config,o),s(o=x.extend(o,t))}else s({})}}},{key:"overrideResponsiveOptions",value:function(t){var e=new X(t).init({responsiveOverride:!0});this.w.config=e}}]),t}(),at=function(){function t(e){o(this,t),this.ctx=e,this.colors=[],this.w=e.w;var i=this.w;this.isColorFn=!1,this.isHeatmapDistributed="treemap"===i.config.chart.type&&i.config.plotOptions.treemap.distributed||"heatmap"===i.config.chart.type&&i.config.plotOptions.heatmap.distributed,this.isBarDistributed=i.config.plotOptions.bar.distributed&&("bar"===i.config.chart.type||"rangeBar"===i.config.chart.type)}return c(t,[{key:"init",value:function(){this.setDefaultColors()}},{key:"setDefaultColors",value:function(){var t=this,e=this.w,i=new x;if(e.globals.dom.elWrap.classList.add("apexcharts-theme-".concat(e.config.theme.mode)),void 0===e.config.colors?e.globals.colors=this.predefined():(e.globals.colors=e.config.colors,Array.isArray(e.config.colors)&&e.config.colors.length>0&&"function"==typeof e.config.colors[0]&&(e.globals.colors=e.config.series.map((function(i,n){var a=e.config.colors[n];return a||(a=e.config.colors[0]),"function"==typeof a?(t.isColorFn=!0,a({value:e.globals.axisCharts?e.globals.series[n][0]?e.globals.series[n][0]:0:e.globals.series[n],seriesIndex:n,dataPointIndex:n,w:e})):a})))),e.globals.seriesColors.map((function(t,i){t&&(e.globals.colors[i]=t)})),e.config.theme.monochrome.enabled){var n=[],a=e.globals.series.length;(this.isBarDistributed||this.isHeatmapDistributed)&&(a=e.globals.series[0].length*e.globals.series.length);for(var r=e.config.theme.monochrome.color,s=1/(a/e.config.theme.monochrome.shadeIntensity),o=e.config.theme.monochrome.shadeTo,l=0,c=0;c<a;c++){var h=void 0;"dark"===o?(h=i.shadeColor(-1*l,r),l+=s):(h=i.shadeColor(l,r),l+=s),n.push(h)}e.globals.colors=n.slice()}var u=e.globals.colors.slice();this.pushExtraColors(e.globals.colors),["fill","stroke"].forEach((function(i){void 0===e.config[i].colors?e.globals[i].colors=t.isColorFn?e.config.colors:u:e.globals[i].colors=e.config[i].colors.slice(),t.pushExtraColors(e.globals[i].colors)})),void 0===e.config.dataLabels.style.colors?e.globals.dataLabels.style.colors=u:e.globals.dataLabels.style.colors=e.config.dataLabels.style.colors.slice(),this.pushExtraColors(e.globals.dataLabels.style.colors,50),void 0===e.config.plotOptions.radar.polygons.fill.colors?e.globals.radarPolygons.fill.colors=["dark"===e.config.theme.mode?"#424242":"none"]:e.globals.radarPolygons.fill.colors=e.config.plotOptions.radar.polygons.fill.colors.slice(),this.pushExtraColors(e.globals.radarPolygons.fill.colors,20),void 0===e.config.markers.colors?e.globals.markers.colors=u:e.globals.markers.colors=e.config.markers.colors.slice(),this.pushExtraColors(e.globals.markers.colors)}},{key:"pushExtraColors",value:function(t,e){var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:null,n=this.w,a=e||n.globals.series.length;if(null===i&&(i=this.isBarDistributed||this.isHeatmapDistributed||"heatmap"===n.config.chart.type&&n.config.plotOptions.heatmap.colorScale.inverse),i&&n.globals.series.length&&(a=n.globals.series[n.globals.maxValsInArrayIndex].length*n.globals.series.length),t.length<a)for(var r=a-t.length,s=0;s<r;s++)t.push(t[s])}},{key:"updateThemeOptions",value:function(t){t.chart=t.chart||{},t.tooltip=t.tooltip||{};var e=t.theme.mode||"light",i=t.theme.palette?t.theme.palette:"dark"===e?"palette4":"palette1",n=t.chart.foreColor?t.chart.foreColor:"dark"===e?"#f6f7f8":"#373d3f";return t.tooltip.theme=e,t.chart.foreColor=n,t.theme.palette=i,t}},{key:"predefined",value:function(){switch(this.w.config.theme.palette){case"palette1":default:this.colors=["#008FFB","#00E396","#FEB019","#FF4560","#775DD0"];break;case"palette2":this.colors=["#3f51b5","#03a9f4","#4caf50","#f9ce1d","#FF9800"];break;case"palette3":this.colors=["#33b2df","#546E7A","#d4526e","#13d8aa","#A5978B"];break;case"palette4":this.colors=["#4ecdc4","#c7f464","#81D4FA","#fd6a6a","#546E7A"];break;case"palette5":this.colors=["#2b908f","#f9a3a4","#90ee7e","#fa4443","#69d2e7"];break;case"palette6":this.colors=["#449DD1","#F86624","#EA3546","#662E9B","#C5D86D"];break;case"palette7":this.colors=["#D7263D","#1B998B","#2E294E","#F46036","#E2C044"];break;case"palette8":this.colors=["#662E9B","#F86624","#F9C80E","#EA3546","#43BCCD"];break;case"palette9":this.colors=["#5C4742","#A5978B","#8D5B4C","#5A2A27","#C4BBAF"];break;case"palette10":this.colors=["#A300D6","#7D02EB","#5653FE","#2983FF","#00B1F2"]}return this.colors}}]),t}(),rt=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w}return c(t,[{key:"draw",value:function(){this.drawTitleSubtitle("title"),this.drawTitleSubtitle("subtitle")}},{key:"drawTitleSubtitle",value:function(t){var e=this.w,i="title"===t?e.config.title:e.config.subtitle,n=e.globals.svgWidth/2,a=i.offsetY,r="middle";if("left"===i.align?(n=10,r="start"):"right"===i.align&&(n=e.globals.svgWidth-10,r="end"),n+=i.offsetX,a=a+parseInt(i.style.fontSize,10)+i.margin/2,void 0!==i.text){var s=new w(this.ctx).drawText({x:n,y:a,text:i.text,textAnchor:r,fontSize:i.style.fontSize,fontFamily:i.style.fontFamily,fontWeight:i.style.fontWeight,foreColor:i.style.color,opacity:1});s.node.setAttribute("class","apexcharts-".concat(t,"-text")),e.globals.dom.Paper.add(s)}}}]),t}(),st=function(){function t(e){o(this,t),this.w=e.w,this.dCtx=e}return c(t,[{key:"getTitleSubtitleCoords",value:function(t){var e=this.w,i=0,n=0,a="title"===t?e.config.title.floating:e.config.subtitle.floating,r=e.globals.dom.baseEl.querySelector(".apexcharts-".concat(t,"-text"));if(null!==r&&!a){var s=r.getBoundingClientRect();i=s.width,n=e.globals.axisCharts?s.height+5:s.height}return{width:i,height:n}}},{key:"getLegendsRect",value:function(){var t=this.w,e=t.globals.dom.baseEl.querySelector(".apexcharts-legend");t.config.legend.height||"top"!==t.config.legend.position&&"bottom"!==t.config.legend.position||(e.style.maxHeight=t.globals.svgHeight/2+"px");var i=Object.assign({},x.getBoundingClientRect(e));return null!==e&&!t.config.legend.floating&&t.config.legend.show?this.dCtx.lgRect={x:i.x,y:i.y,height:i.height,width:0===i.height?0:i.width}:this.dCtx.lgRect={x:0,y:0,height:0,width:0},"left"!==t.config.legend.position&&"right"!==t.config.legend.position||1.5*this.dCtx.lgRect.width>t.globals.svgWidth&&(this.dCtx.lgRect.width=t.globals.svgWidth/1.5),this.dCtx.lgRect}},{key:"getLargestStringFromMultiArr",value:function(t,e){var i=t;if(this.w.globals.isMultiLineX){var n=e.map((function(t,e){return Array.isArray(t)?t.length:1})),a=Math.max.apply(Math,m(n));i=e[n.indexOf(a)]}return i}}]),t}(),ot=function(){function t(e){o(this,t),this.w=e.w,this.dCtx=e}return c(t,[{key:"getxAxisLabelsCoords",value:function(){var t,e=this.w,i=e.globals.labels.slice();if(e.config.xaxis.convertedCatToNumeric&&0===i.length&&(i=e.globals.categoryLabels),e.globals.timescaleLabels.length>0){var n=this.getxAxisTimeScaleLabelsCoords();t={width:n.width,height:n.height},e.globals.rotateXLabels=!1}else{this.dCtx.lgWidthForSideLegends="left"!==e.config.legend.position&&"right"!==e.config.legend.position||e.config.legend.floating?0:this.dCtx.lgRect.width;var a=e.globals.xLabelFormatter,r=x.getLargestStringFromArr(i),s=this.dCtx.dimHelpers.getLargestStringFromMultiArr(r,i);e.globals.isBarHorizontal&&(s=r=e.globals.yAxisScale[0].result.reduce((function(t,e){return t.length>e.length?t:e}),0));var o=new V(this.dCtx.ctx),l=r;r=o.xLabelFormat(a,r,l,{i:void 0,dateFormatter:new z(this.dCtx.ctx).formatDate,w:e}),s=o.xLabelFormat(a,s,l,{i:void 0,dateFormatter:new z(this.dCtx.ctx).formatDate,w:e}),(e.config.xaxis.convertedCatToNumeric&&void 0===r||""===String(r).trim())&&(s=r="1");var c=new w(this.dCtx.ctx),h=c.getTextRects(r,e.config.xaxis.labels.style.fontSize),u=h;if(r!==s&&(u=c.getTextRects(s,e.config.xaxis.labels.style.fontSize)),(t={width:h.width>=u.width?h.width:u.width,height:h.height>=u.height?h.height:u.height}).width*i.length>e.globals.svgWidth-this.dCtx.lgWidthForSideLegends-this.dCtx.yAxisWidth-this.dCtx.gridPad.left-this.dCtx.gridPad.right&&0!==e.config.xaxis.labels.rotate||e.config.xaxis.labels.rotateAlways){if(!e.globals.isBarHorizontal){e.globals.rotateXLabels=!0;var d=function(t){return c.getTextRects(t,e.config.xaxis.labels.style.fontSize,e.config.xaxis.labels.style.fontFamily,"rotate(".concat(e.config.xaxis.labels.rotate," 0 0)"),!1)};h=d(r),r!==s&&(u=d(s)),t.height=(h.height>u.height?h.height:u.height)/1.5,t.width=h.width>u.width?h.width:u.width}}else e.globals.rotateXLabels=!1}return e.config.xaxis.labels.show||(t={width:0,height:0}),{width:t.width,height:t.height}}},{key:"getxAxisTitleCoords",value:function(){var t=this.w,e=0,i=0;if(void 0!==t.config.xaxis.title.text){var n=new w(this.dCtx.ctx).getTextRects(t.config.xaxis.title.text,t.config.xaxis.title.style.fontSize);e=n.width,i=n.height}return{width:e,height:i}}},{key:"getxAxisTimeScaleLabelsCoords",value:function(){var t,e=this.w;this.dCtx.timescaleLabels=e.globals.timescaleLabels.slice();var i=this.dCtx.timescaleLabels.map((function(t){return t.value})),n=i.reduce((function(t,e){return void 0===t?(console.error("You have possibly supplied invalid Date format. Please supply a valid JavaScript Date"),0):t.length>e.length?t:e}),0);return 1.05*(t=new w(this.dCtx.ctx).getTextRects(n,e.config.xaxis.labels.style.fontSize)).width*i.length>e.globals.gridWidth&&0!==e.config.xaxis.labels.rotate&&(e.globals.overlappingXLabels=!0),t}},{key:"additionalPaddingXLabels",value:function(t){var e=this,i=this.w,n=i.globals,a=i.config,r=a.xaxis.type,s=t.width;n.skipLastTimelinelabel=!1,n.skipFirstTimelinelabel=!1;var o=i.config.yaxis[0].opposite&&i.globals.isBarHorizontal,l=function(t,o){(function(t){return-1!==n.collapsedSeriesIndices.indexOf(t)})(o)||function(t){if(e.dCtx.timescaleLabels&&e.dCtx.timescaleLabels.length){var o=e.dCtx.timescaleLabels[0],l=e.dCtx.timescaleLabels[e.dCtx.timescaleLabels.length-1].position+s/1.75-e.dCtx.yAxisWidthRight,c=o.position-s/1.75+e.dCtx.yAxisWidthLeft,h="right"===i.config.legend.position&&e.dCtx.lgRect.width>0?e.dCtx.lgRect.width:0;l>n.svgWidth-n.translateX-h&&(n.skipLastTimelinelabel=!0),c<-(t.show&&!t.floating||"bar"!==a.chart.type&&"candlestick"!==a.chart.type&&"rangeBar"!==a.chart.type&&"boxPlot"!==a.chart.type?10:s/1.75)&&(n.skipFirstTimelinelabel=!0)}else"datetime"===r?e.dCtx.gridPad.right<s&&!n.rotateXLabels&&(n.skipLastTimelinelabel=!0):"datetime"!==r&&e.dCtx.gridPad.right<s/2-e.dCtx.yAxisWidthRight&&!n.rotateXLabels&&!i.config.xaxis.labels.trim&&("between"!==i.config.xaxis.tickPlacement||i.globals.isBarHorizontal)&&(e.dCtx.xPadRight=s/2+1)}(t)};a.yaxis.forEach((function(t,i){o?(e.dCtx.gridPad.left<s&&(e.dCtx.xPadLeft=s/2+1),e.dCtx.xPadRight=s/2+1):l(t,i)}))}}]),t}(),lt=function(){function t(e){o(this,t),this.w=e.w,this.dCtx=e}return c(t,[{key:"getyAxisLabelsCoords",value:function(){var t=this,e=this.w,i=[],n=10,a=new G(this.dCtx.ctx);return e.config.yaxis.map((function(r,s){var o=e.globals.yAxisScale[s],l=0;if(!a.isYAxisHidden(s)&&r.labels.show&&void 0!==r.labels.minWidth&&(l=r.labels.minWidth),!a.isYAxisHidden(s)&&r.labels.show&&o.result.length){var c=e.globals.yLabelFormatters[s],h=o.niceMin===Number.MIN_VALUE?0:o.niceMin,u=String(h).length>String(o.niceMax).length?h:o.niceMax,d=c(u,{seriesIndex:s,dataPointIndex:-1,w:e}),f=d;if(void 0!==d&&0!==d.length||(d=u),e.globals.isBarHorizontal){n=0;var g=e.globals.labels.slice();d=c(d=x.getLargestStringFromArr(g),{seriesIndex:s,dataPointIndex:-1,w:e}),f=t.dCtx.dimHelpers.getLargestStringFromMultiArr(d,g)}var p=new w(t.dCtx.ctx),m="rotate(".concat(r.labels.rotate," 0 0)"),v=p.getTextRects(d,r.labels.style.fontSize,r.labels.style.fontFamily,m,!1),b=v;d!==f&&(b=p.getTextRects(f,r.labels.style.fontSize,r.labels.style.fontFamily,m,!1)),i.push({width:(l>b.width||l>v.width?l:b.width>v.width?b.width:v.width)+n,height:b.height>v.height?b.height:v.height})}else i.push({width:0,height:0})})),i}},{key:"getyAxisTitleCoords",value:function(){var t=this,e=this.w,i=[];return e.config.yaxis.map((function(e,n){if(e.show&&void 0!==e.title.text){var a=new w(t.dCtx.ctx),r="rotate(".concat(e.title.rotate," 0 0)"),s=a.getTextRects(e.title.text,e.title.style.fontSize,e.title.style.fontFamily,r,!1);i.push({width:s.width,height:s.height})}else i.push({width:0,height:0})})),i}},{key:"getTotalYAxisWidth",value:function(){var t=this.w,e=0,i=0,n=0,a=t.globals.yAxisScale.length>1?10:0,r=new G(this.dCtx.ctx),s=function(s,o){var l=t.config.yaxis[o].floating,c=0;s.width>0&&!l?(c=s.width+a,function(e){return t.globals.ignoreYAxisIndexes.indexOf(e)>-1}(o)&&(c=c-s.width-a)):c=l||r.isYAxisHidden(o)?0:5,t.config.yaxis[o].opposite?n+=c:i+=c,e+=c};return t.globals.yLabelsCoords.map((function(t,e){s(t,e)})),t.globals.yTitleCoords.map((function(t,e){s(t,e)})),t.globals.isBarHorizontal&&!t.config.yaxis[0].floating&&(e=t.globals.yLabelsCoords[0].width+t.globals.yTitleCoords[0].width+15),this.dCtx.yAxisWidthLeft=i,this.dCtx.yAxisWidthRight=n,e}}]),t}(),ct=function(){function t(e){o(this,t),this.w=e.w,this.dCtx=e}return c(t,[{key:"gridPadForColumnsInNumericAxis",value:function(t){var e=this.w;if(e.globals.noData||e.globals.allSeriesCollapsed)return 0;var i=function(t){return"bar"===t||"rangeBar"===t||"candlestick"===t||"boxPlot"===t},n=e.config.chart.type,a=0,r=i(n)?e.config.series.length:1;if(e.globals.comboBarCount>0&&(r=e.globals.comboBarCount),e.globals.collapsedSeries.forEach((function(t){i(t.type)&&(r-=1)})),e.config.chart.stacked&&(r=1),(i(n)||e.globals.comboBarCount>0)&&e.globals.isXNumeric&&!e.globals.isBarHorizontal&&r>0){var s,o,l=Math.abs(e.globals.initialMaxX-e.globals.initialMinX);l<=3&&(l=e.globals.dataPoints),s=l/t,e.globals.minXDiff&&e.globals.minXDiff/s>0&&(o=e.globals.minXDiff/s),o>t/2&&(o/=2),(a=o/r*parseInt(e.config.plotOptions.bar.columnWidth,10)/100)<1&&(a=1),a=a/(r>1?1:1.5)+5,e.globals.barPadForNumericAxis=a}return a}},{key:"gridPadFortitleSubtitle",value:function(){var t=this,e=this.w,i=e.globals,n=this.dCtx.isSparkline||!e.globals.axisCharts?0:10;["title","subtitle"].forEach((function(i){void 0!==e.config[i].text?n+=e.config[i].margin:n+=t.dCtx.isSparkline||!e.globals.axisCharts?0:5})),!e.config.legend.show||"bottom"!==e.config.legend.position||e.config.legend.floating||e.globals.axisCharts||(n+=10);var a=this.dCtx.dimHelpers.getTitleSubtitleCoords("title"),r=this.dCtx.dimHelpers.getTitleSubtitleCoords("subtitle");i.gridHeight=i.gridHeight-a.height-r.height-n,i.translateY=i.translateY+a.height+r.height+n}},{key:"setGridXPosForDualYAxis",value:function(t,e){var i=this.w,n=new G(this.dCtx.ctx);i.config.yaxis.map((function(a,r){-1!==i.globals.ignoreYAxisIndexes.indexOf(r)||a.floating||n.isYAxisHidden(r)||(a.opposite&&(i.globals.translateX=i.globals.translateX-(e[r].width+t[r].width)-parseInt(i.config.yaxis[r].labels.style.fontSize,10)/1.2-12),i.globals.translateX<2&&(i.globals.translateX=2))}))}}]),t}(),ht=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w,this.lgRect={},this.yAxisWidth=0,this.yAxisWidthLeft=0,this.yAxisWidthRight=0,this.xAxisHeight=0,this.isSparkline=this.w.config.chart.sparkline.enabled,this.dimHelpers=new st(this),this.dimYAxis=new lt(this),this.dimXAxis=new ot(this),this.dimGrid=new ct(this),this.lgWidthForSideLegends=0,this.gridPad=this.w.config.grid.padding,this.xPadRight=0,this.xPadLeft=0}return c(t,[{key:"plotCoords",value:function(){var t=this.w.globals;this.lgRect=this.dimHelpers.getLegendsRect(),t.axisCharts?this.setDimensionsForAxisCharts():this.setDimensionsForNonAxisCharts(),this.dimGrid.gridPadFortitleSubtitle(),t.gridHeight=t.gridHeight-this.gridPad.top-this.gridPad.bottom,t.gridWidth=t.gridWidth-this.gridPad.left-this.gridPad.right-this.xPadRight-this.xPadLeft;var e=this.dimGrid.gridPadForColumnsInNumericAxis(t.gridWidth);t.gridWidth=t.gridWidth-2*e,t.translateX=t.translateX+this.gridPad.left+this.xPadLeft+(e>0?e+4:0),t.translateY=t.translateY+this.gridPad.top}},{key:"setDimensionsForAxisCharts",value:function(){var t=this,e=this.w,i=e.globals,n=this.dimYAxis.getyAxisLabelsCoords(),a=this.dimYAxis.getyAxisTitleCoords();e.globals.yLabelsCoords=[],e.globals.yTitleCoords=[],e.config.yaxis.map((function(t,i){e.globals.yLabelsCoords.push({width:n[i].width,index:i}),e.globals.yTitleCoords.push({width:a[i].width,index:i})})),this.yAxisWidth=this.dimYAxis.getTotalYAxisWidth();var r=this.dimXAxis.getxAxisLabelsCoords(),s=this.dimXAxis.getxAxisTitleCoords();this.conditionalChecksForAxisCoords(r,s),i.translateXAxisY=e.globals.rotateXLabels?this.xAxisHeight/8:-4,i.translateXAxisX=e.globals.rotateXLabels&&e.globals.isXNumeric&&e.config.xaxis.labels.rotate<=-45?-this.xAxisWidth/4:0,e.globals.isBarHorizontal&&(i.rotateXLabels=!1,i.translateXAxisY=parseInt(e.config.xaxis.labels.style.fontSize,10)/1.5*-1),i.translateXAxisY=i.translateXAxisY+e.config.xaxis.labels.offsetY,i.translateXAxisX=i.translateXAxisX+e.config.xaxis.labels.offsetX;var o=this.yAxisWidth,l=this.xAxisHeight;i.xAxisLabelsHeight=this.xAxisHeight-s.height,i.xAxisLabelsWidth=this.xAxisWidth,i.xAxisHeight=this.xAxisHeight;var c=10;("radar"===e.config.chart.type||this.isSparkline)&&(o=0,l=i.goldenPadding),this.isSparkline&&(this.lgRect={height:0,width:0}),(this.isSparkline||"treemap"===e.config.chart.type)&&(o=0,l=0,c=0),this.isSparkline||this.dimXAxis.additionalPaddingXLabels(r);var h=function(){i.translateX=o,i.gridHeight=i.svgHeight-t.lgRect.height-l-(t.isSparkline||"treemap"===e.config.chart.type?0:e.globals.rotateXLabels?10:15),i.gridWidth=i.svgWidth-o};switch("top"===e.config.xaxis.position&&(c=i.xAxisHeight-e.config.xaxis.axisTicks.height-5),e.config.legend.position){case"bottom":i.translateY=c,h();break;case"top":i.translateY=this.lgRect.height+c,h();break;case"left":i.translateY=c,i.translateX=this.lgRect.width+o,i.gridHeight=i.svgHeight-l-12,i.gridWidth=i.svgWidth-this.lgRect.width-o;break;case"right":i.translateY=c,i.translateX=o,i.gridHeight=i.svgHeight-l-12,i.gridWidth=i.svgWidth-this.lgRect.width-o-5;break;default:throw new Error("Legend position not supported")}this.dimGrid.setGridXPosForDualYAxis(a,n),new Q(this.ctx).setYAxisXPosition(n,a)}},{key:"setDimensionsForNonAxisCharts",value:function(){var t=this.w,e=t.globals,i=t.config,n=0;t.config.legend.show&&!t.config.legend.floating&&(n=20);var a="pie"===i.chart.type||"polarArea"===i.chart.type||"donut"===i.chart.type?"pie":"radialBar",r=i.plotOptions[a].offsetY,s=i.plotOptions[a].offsetX;if(!i.legend.show||i.legend.floating)return e.gridHeight=e.svgHeight-i.grid.padding.left+i.grid.padding.right,e.gridWidth=e.gridHeight,e.translateY=r,void(e.translateX=s+(e.svgWidth-e.gridWidth)/2);switch(i.legend.position){case"bottom":e.gridHeight=e.svgHeight-this.lgRect.height-e.goldenPadding,e.gridWidth=e.svgWidth,e.translateY=r-10,e.translateX=s+(e.svgWidth-e.gridWidth)/2;break;case"top":e.gridHeight=e.svgHeight-this.lgRect.height-e.goldenPadding,e.gridWidth=e.svgWidth,e.translateY=this.lgRect.height+r+10,e.translateX=s+(e.svgWidth-e.gridWidth)/2;break;case"left":e.gridWidth=e.svgWidth-this.lgRect.width-n,e.gridHeight="auto"!==i.chart.height?e.svgHeight:e.gridWidth,e.translateY=r,e.translateX=s+this.lgRect.width+n;break;case"right":e.gridWidth=e.svgWidth-this.lgRect.width-n-5,e.gridHeight="auto"!==i.chart.height?e.svgHeight:e.gridWidth,e.translateY=r,e.translateX=s+10;break;default:throw new Error("Legend position not supported")}}},{key:"conditionalChecksForAxisCoords",value:function(t,e){var i=this.w,n=t.height+e.height,a=i.globals.isMultiLineX?1.2:i.globals.LINE_HEIGHT_RATIO,r=i.globals.rotateXLabels?22:10,s=i.globals.rotateXLabels&&"bottom"===i.config.legend.position?10:0;this.xAxisHeight=n*a+r+s,this.xAxisWidth=t.width,this.xAxisHeight-e.height>i.config.xaxis.labels.maxHeight&&(this.xAxisHeight=i.config.xaxis.labels.maxHeight),i.config.xaxis.labels.minHeight&&this.xAxisHeight<i.config.xaxis.labels.minHeight&&(this.xAxisHeight=i.config.xaxis.labels.minHeight),i.config.xaxis.floating&&(this.xAxisHeight=0);var o=0,l=0;i.config.yaxis.forEach((function(t){o+=t.labels.minWidth,l+=t.labels.maxWidth})),this.yAxisWidth<o&&(this.yAxisWidth=o),this.yAxisWidth>l&&(this.yAxisWidth=l)}}]),t}(),ut=function(){function t(e){o(this,t),this.w=e.w,this.lgCtx=e}return c(t,[{key:"getLegendStyles",value:function(){var t=document.createElement("style");t.setAttribute("type","text/css");var e=document.createTextNode("\t\n    \t\n      .apexcharts-legend {\t\n        display: flex;\t\n        overflow: auto;\t\n        padding: 0 10px;\t\n      }\t\n      .apexcharts-legend.apx-legend-position-bottom, .apexcharts-legend.apx-legend-position-top {\t\n        flex-wrap: wrap\t\n      }\t\n      .apexcharts-legend.apx-legend-position-right, .apexcharts-legend.apx-legend-position-left {\t\n        flex-direction: column;\t\n        bottom: 0;\t\n      }\t\n      .apexcharts-legend.apx-legend-position-bottom.apexcharts-align-left, .apexcharts-legend.apx-legend-position-top.apexcharts-align-left, .apexcharts-legend.apx-legend-position-right, .apexcharts-legend.apx-legend-position-left {\t\n        justify-content: flex-start;\t\n      }\t\n      .apexcharts-legend.apx-legend-position-bottom.apexcharts-align-center, .apexcharts-legend.apx-legend-position-top.apexcharts-align-center {\t\n        justify-content: center;  \t\n      }\t\n      .apexcharts-legend.apx-legend-position-bottom.apexcharts-align-right, .apexcharts-legend.apx-legend-position-top.apexcharts-align-right {\t\n        justify-content: flex-end;\t\n      }\t\n      .apexcharts-legend-series {\t\n        cursor: pointer;\t\n        line-height: normal;\t\n      }\t\n      .apexcharts-legend.apx-legend-position-bottom .apexcharts-legend-series, .apexcharts-legend.apx-legend-position-top .apexcharts-legend-series{\t\n        display: flex;\t\n        align-items: center;\t\n      }\t\n      .apexcharts-legend-text {\t\n        position: relative;\t\n        font-size: 14px;\t\n      }\t\n      .apexcharts-legend-text *, .apexcharts-legend-marker * {\t\n        pointer-events: none;\t\n      }\t\n      .apexcharts-legend-marker {\t\n        position: relative;\t\n        display: inline-block;\t\n        cursor: pointer;\t\n        margin-right: 3px;\t\n        border-style: solid;\n      }\t\n      \t\n      .apexcharts-legend.apexcharts-align-right .apexcharts-legend-series, .apexcharts-legend.apexcharts-align-left .apexcharts-legend-series{\t\n        display: inline-block;\t\n      }\t\n      .apexcharts-legend-series.apexcharts-no-click {\t\n        cursor: auto;\t\n      }\t\n      .apexcharts-legend .apexcharts-hidden-zero-series, .apexcharts-legend .apexcharts-hidden-null-series {\t\n        display: none !important;\t\n      }\t\n      .apexcharts-inactive-legend {\t\n        opacity: 0.45;\t\n      }");return t.appendChild(e),t}},{key:"getLegendBBox",value:function(){var t=this.w.globals.dom.baseEl.querySelector(".apexcharts-legend").getBoundingClientRect(),e=t.width;return{clwh:t.height,clww:e}}},{key:"appendToForeignObject",value:function(){var t=this.w.globals;t.dom.elLegendForeign=document.createElementNS(t.SVGNS,"foreignObject");var e=t.dom.elLegendForeign;e.setAttribute("x",0),e.setAttribute("y",0),e.setAttribute("width",t.svgWidth),e.setAttribute("height",t.svgHeight),t.dom.elLegendWrap.setAttribute("xmlns","http://www.w3.org/1999/xhtml"),e.appendChild(t.dom.elLegendWrap),e.appendChild(this.getLegendStyles()),t.dom.Paper.node.insertBefore(e,t.dom.elGraphical.node)}},{key:"toggleDataSeries",value:function(t,e){var i=this,n=this.w;if(n.globals.axisCharts||"radialBar"===n.config.chart.type){n.globals.resized=!0;var a=null,r=null;n.globals.risingSeries=[],n.globals.axisCharts?(a=n.globals.dom.baseEl.querySelector(".apexcharts-series[data\\:realIndex='".concat(t,"']")),r=parseInt(a.getAttribute("data:realIndex"),10)):(a=n.globals.dom.baseEl.querySelector(".apexcharts-series[rel='".concat(t+1,"']")),r=parseInt(a.getAttribute("rel"),10)-1),e?[{cs:n.globals.collapsedSeries,csi:n.globals.collapsedSeriesIndices},{cs:n.globals.ancillaryCollapsedSeries,csi:n.globals.ancillaryCollapsedSeriesIndices}].forEach((function(t){i.riseCollapsedSeries(t.cs,t.csi,r)})):this.hideSeries({seriesEl:a,realIndex:r})}else{var s=n.globals.dom.Paper.select(" .apexcharts-series[rel='".concat(t+1,"'] path")),o=n.config.chart.type;if("pie"===o||"polarArea"===o||"donut"===o){var l=n.config.plotOptions.pie.donut.labels;new w(this.lgCtx.ctx).pathMouseDown(s.members[0],null),this.lgCtx.ctx.pie.printDataLabelsInner(s.members[0].node,l)}s.fire("click")}}},{key:"hideSeries",value:function(t){var e=t.seriesEl,i=t.realIndex,n=this.w,a=x.clone(n.config.series);if(n.globals.axisCharts){var r=!1;if(n.config.yaxis[i]&&n.config.yaxis[i].show&&n.config.yaxis[i].showAlways&&(r=!0,n.globals.ancillaryCollapsedSeriesIndices.indexOf(i)<0&&(n.globals.ancillaryCollapsedSeries.push({index:i,data:a[i].data.slice(),type:e.parentNode.className.baseVal.split("-")[1]}),n.globals.ancillaryCollapsedSeriesIndices.push(i))),!r){n.globals.collapsedSeries.push({index:i,data:a[i].data.slice(),type:e.parentNode.className.baseVal.split("-")[1]}),n.globals.collapsedSeriesIndices.push(i);var s=n.globals.risingSeries.indexOf(i);n.globals.risingSeries.splice(s,1)}}else n.globals.collapsedSeries.push({index:i,data:a[i]}),n.globals.collapsedSeriesIndices.push(i);for(var o=e.childNodes,l=0;l<o.length;l++)o[l].classList.contains("apexcharts-series-markers-wrap")&&(o[l].classList.contains("apexcharts-hide")?o[l].classList.remove("apexcharts-hide"):o[l].classList.add("apexcharts-hide"));n.globals.allSeriesCollapsed=n.globals.collapsedSeries.length===n.config.series.length,a=this._getSeriesBasedOnCollapsedState(a),this.lgCtx.ctx.updateHelpers._updateSeries(a,n.config.chart.animations.dynamicAnimation.enabled)}},{key:"riseCollapsedSeries",value:function(t,e,i){var n=this.w,a=x.clone(n.config.series);if(t.length>0){for(var r=0;r<t.length;r++)t[r].index===i&&(n.globals.axisCharts?(a[i].data=t[r].data.slice(),t.splice(r,1),e.splice(r,1),n.globals.risingSeries.push(i)):(a[i]=t[r].data,t.splice(r,1),e.splice(r,1),n.globals.risingSeries.push(i)));a=this._getSeriesBasedOnCollapsedState(a),this.lgCtx.ctx.updateHelpers._updateSeries(a,n.config.chart.animations.dynamicAnimation.enabled)}}},{key:"_getSeriesBasedOnCollapsedState",value:function(t){var e=this.w;return e.globals.axisCharts?t.forEach((function(i,n){e.globals.collapsedSeriesIndices.indexOf(n)>-1&&(t[n].data=[])})):t.forEach((function(i,n){e.globals.collapsedSeriesIndices.indexOf(n)>-1&&(t[n]=0)})),t}}]),t}(),dt=function(){function t(e,i){o(this,t),this.ctx=e,this.w=e.w,this.onLegendClick=this.onLegendClick.bind(this),this.onLegendHovered=this.onLegendHovered.bind(this),this.isBarsDistributed="bar"===this.w.config.chart.type&&this.w.config.plotOptions.bar.distributed&&1===this.w.config.series.length,this.legendHelpers=new ut(this)}return c(t,[{key:"init",value:function(){var t=this.w,e=t.globals,i=t.config;if((i.legend.showForSingleSeries&&1===e.series.length||this.isBarsDistributed||e.series.length>1||!e.axisCharts)&&i.legend.show){for(;e.dom.elLegendWrap.firstChild;)e.dom.elLegendWrap.removeChild(e.dom.elLegendWrap.firstChild);this.drawLegends(),x.isIE11()?document.getElementsByTagName("head")[0].appendChild(this.legendHelpers.getLegendStyles()):this.legendHelpers.appendToForeignObject(),"bottom"===i.legend.position||"top"===i.legend.position?this.legendAlignHorizontal():"right"!==i.legend.position&&"left"!==i.legend.position||this.legendAlignVertical()}}},{key:"drawLegends",value:function(){var t=this,e=this.w,i=e.config.legend.fontFamily,n=e.globals.seriesNames,a=e.globals.colors.slice();if("heatmap"===e.config.chart.type){var r=e.config.plotOptions.heatmap.colorScale.ranges;n=r.map((function(t){return t.name?t.name:t.from+" - "+t.to})),a=r.map((function(t){return t.color}))}else this.isBarsDistributed&&(n=e.globals.labels.slice());e.config.legend.customLegendItems.length&&(n=e.config.legend.customLegendItems);for(var s=e.globals.legendFormatter,o=e.config.legend.inverseOrder,l=o?n.length-1:0;o?l>=0:l<=n.length-1;o?l--:l++){var c=s(n[l],{seriesIndex:l,w:e}),h=!1,u=!1;if(e.globals.collapsedSeries.length>0)for(var d=0;d<e.globals.collapsedSeries.length;d++)e.globals.collapsedSeries[d].index===l&&(h=!0);if(e.globals.ancillaryCollapsedSeriesIndices.length>0)for(var f=0;f<e.globals.ancillaryCollapsedSeriesIndices.length;f++)e.globals.ancillaryCollapsedSeriesIndices[f]===l&&(u=!0);var g=document.createElement("span");g.classList.add("apexcharts-legend-marker");var p=e.config.legend.markers.offsetX,m=e.config.legend.markers.offsetY,v=e.config.legend.markers.height,b=e.config.legend.markers.width,y=e.config.legend.markers.strokeWidth,k=e.config.legend.markers.strokeColor,A=e.config.legend.markers.radius,_=g.style;_.background=a[l],_.color=a[l],_.setProperty("background",a[l],"important"),e.config.legend.markers.fillColors&&e.config.legend.markers.fillColors[l]&&(_.background=e.config.legend.markers.fillColors[l]),void 0!==e.globals.seriesColors[l]&&(_.background=e.globals.seriesColors[l],_.color=e.globals.seriesColors[l]),_.height=Array.isArray(v)?parseFloat(v[l])+"px":parseFloat(v)+"px",_.width=Array.isArray(b)?parseFloat(b[l])+"px":parseFloat(b)+"px",_.left=(Array.isArray(p)?parseFloat(p[l]):parseFloat(p))+"px",_.top=(Array.isArray(m)?parseFloat(m[l]):parseFloat(m))+"px",_.borderWidth=Array.isArray(y)?y[l]:y,_.borderColor=Array.isArray(k)?k[l]:k,_.borderRadius=Array.isArray(A)?parseFloat(A[l])+"px":parseFloat(A)+"px",e.config.legend.markers.customHTML&&(Array.isArray(e.config.legend.markers.customHTML)?e.config.legend.markers.customHTML[l]&&(g.innerHTML=e.config.legend.markers.customHTML[l]()):g.innerHTML=e.config.legend.markers.customHTML()),w.setAttrs(g,{rel:l+1,"data:collapsed":h||u}),(h||u)&&g.classList.add("apexcharts-inactive-legend");var C=document.createElement("div"),E=document.createElement("span");E.classList.add("apexcharts-legend-text"),E.innerHTML=Array.isArray(c)?c.join(" "):c;var T=e.config.legend.labels.useSeriesColors?e.globals.colors[l]:e.config.legend.labels.colors;T||(T=e.config.chart.foreColor),E.style.color=T,E.style.fontSize=parseFloat(e.config.legend.fontSize)+"px",E.style.fontWeight=e.config.legend.fontWeight,E.style.fontFamily=i||e.config.chart.fontFamily,w.setAttrs(E,{rel:l+1,i:l,"data:default-text":encodeURIComponent(c),"data:collapsed":h||u}),C.appendChild(g),C.appendChild(E);var P=new S(this.ctx);e.config.legend.showForZeroSeries||0===P.getSeriesTotalByIndex(l)&&P.seriesHaveSameValues(l)&&!P.isSeriesNull(l)&&-1===e.globals.collapsedSeriesIndices.indexOf(l)&&-1===e.globals.ancillaryCollapsedSeriesIndices.indexOf(l)&&C.classList.add("apexcharts-hidden-zero-series"),e.config.legend.showForNullSeries||P.isSeriesNull(l)&&-1===e.globals.collapsedSeriesIndices.indexOf(l)&&-1===e.globals.ancillaryCollapsedSeriesIndices.indexOf(l)&&C.classList.add("apexcharts-hidden-null-series"),e.globals.dom.elLegendWrap.appendChild(C),e.globals.dom.elLegendWrap.classList.add("apexcharts-align-".concat(e.config.legend.horizontalAlign)),e.globals.dom.elLegendWrap.classList.add("apx-legend-position-"+e.config.legend.position),C.classList.add("apexcharts-legend-series"),C.style.margin="".concat(e.config.legend.itemMargin.vertical,"px ").concat(e.config.legend.itemMargin.horizontal,"px"),e.globals.dom.elLegendWrap.style.width=e.config.legend.width?e.config.legend.width+"px":"",e.globals.dom.elLegendWrap.style.height=e.config.legend.height?e.config.legend.height+"px":"",w.setAttrs(C,{rel:l+1,seriesName:x.escapeString(n[l]),"data:collapsed":h||u}),(h||u)&&C.classList.add("apexcharts-inactive-legend"),e.config.legend.onItemClick.toggleDataSeries||C.classList.add("apexcharts-no-click")}e.globals.dom.elWrap.addEventListener("click",t.onLegendClick,!0),e.config.legend.onItemHover.highlightDataSeries&&0===e.config.legend.customLegendItems.length&&(e.globals.dom.elWrap.addEventListener("mousemove",t.onLegendHovered,!0),e.globals.dom.elWrap.addEventListener("mouseout",t.onLegendHovered,!0))}},{key:"setLegendWrapXY",value:function(t,e){var i=this.w,n=i.globals.dom.baseEl.querySelector(".apexcharts-legend"),a=n.getBoundingClientRect(),r=0,s=0;if("bottom"===i.config.legend.position)s+=i.globals.svgHeight-a.height/2;else if("top"===i.config.legend.position){var o=new ht(this.ctx),l=o.dimHelpers.getTitleSubtitleCoords("title").height,c=o.dimHelpers.getTitleSubtitleCoords("subtitle").height;s=s+(l>0?l-10:0)+(c>0?c-10:0)}n.style.position="absolute",r=r+t+i.config.legend.offsetX,s=s+e+i.config.legend.offsetY,n.style.left=r+"px",n.style.top=s+"px","bottom"===i.config.legend.position?(n.style.top="auto",n.style.bottom=5-i.config.legend.offsetY+"px"):"right"===i.config.legend.position&&(n.style.left="auto",n.style.right=25+i.config.legend.offsetX+"px"),["width","height"].forEach((function(t){n.style[t]&&(n.style[t]=parseInt(i.config.legend[t],10)+"px")}))}},{key:"legendAlignHorizontal",value:function(){var t=this.w;t.globals.dom.baseEl.querySelector(".apexcharts-legend").style.right=0;var e=this.legendHelpers.getLegendBBox(),i=new ht(this.ctx),n=i.dimHelpers.getTitleSubtitleCoords("title"),a=i.dimHelpers.getTitleSubtitleCoords("subtitle"),r=0;"bottom"===t.config.legend.position?r=-e.clwh/1.8:"top"===t.config.legend.position&&(r=n.height+a.height+t.config.title.margin+t.config.subtitle.margin-10),this.setLegendWrapXY(20,r)}},{key:"legendAlignVertical",value:function(){var t=this.w,e=this.legendHelpers.getLegendBBox(),i=0;"left"===t.config.legend.position&&(i=20),"right"===t.config.legend.position&&(i=t.globals.svgWidth-e.clww-10),this.setLegendWrapXY(i,20)}},{key:"onLegendHovered",value:function(t){var e=this.w,i=t.target.classList.contains("apexcharts-legend-text")||t.target.classList.contains("apexcharts-legend-marker");if("heatmap"===e.config.chart.type||this.isBarsDistributed){if(i){var n=parseInt(t.target.getAttribute("rel"),10)-1;this.ctx.events.fireEvent("legendHover",[this.ctx,n,this.w]),new N(this.ctx).highlightRangeInSeries(t,t.target)}}else!t.target.classList.contains("apexcharts-inactive-legend")&&i&&new N(this.ctx).toggleSeriesOnHover(t,t.target)}},{key:"onLegendClick",value:function(t){var e=this.w;if(!e.config.legend.customLegendItems.length&&(t.target.classList.contains("apexcharts-legend-text")||t.target.classList.contains("apexcharts-legend-marker"))){var i=parseInt(t.target.getAttribute("rel"),10)-1,n="true"===t.target.getAttribute("data:collapsed"),a=this.w.config.chart.events.legendClick;"function"==typeof a&&a(this.ctx,i,this.w),this.ctx.events.fireEvent("legendClick",[this.ctx,i,this.w]);var r=this.w.config.legend.markers.onClick;"function"==typeof r&&t.target.classList.contains("apexcharts-legend-marker")&&(r(this.ctx,i,this.w),this.ctx.events.fireEvent("legendMarkerClick",[this.ctx,i,this.w])),"treemap"!==e.config.chart.type&&"heatmap"!==e.config.chart.type&&!this.isBarsDistributed&&e.config.legend.onItemClick.toggleDataSeries&&this.legendHelpers.toggleDataSeries(i,n)}}}]),t}(),ft=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w;var i=this.w;this.ev=this.w.config.chart.events,this.selectedClass="apexcharts-selected",this.localeValues=this.w.globals.locale.toolbar,this.minX=i.globals.minX,this.maxX=i.globals.maxX}return c(t,[{key:"createToolbar",value:function(){var t=this,e=this.w,i=function(){return document.createElement("div")},n=i();if(n.setAttribute("class","apexcharts-toolbar"),n.style.top=e.config.chart.toolbar.offsetY+"px",n.style.right=3-e.config.chart.toolbar.offsetX+"px",e.globals.dom.elWrap.appendChild(n),this.elZoom=i(),this.elZoomIn=i(),this.elZoomOut=i(),this.elPan=i(),this.elSelection=i(),this.elZoomReset=i(),this.elMenuIcon=i(),this.elMenu=i(),this.elCustomIcons=[],this.t=e.config.chart.toolbar.tools,Array.isArray(this.t.customIcons))for(var a=0;a<this.t.customIcons.length;a++)this.elCustomIcons.push(i());var r=[],s=function(i,n,a){var s=i.toLowerCase();t.t[s]&&e.config.chart.zoom.enabled&&r.push({el:n,icon:"string"==typeof t.t[s]?t.t[s]:a,title:t.localeValues[i],class:"apexcharts-".concat(s,"-icon")})};s("zoomIn",this.elZoomIn,'<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24">\n    <path d="M0 0h24v24H0z" fill="none"/>\n    <path d="M13 7h-2v4H7v2h4v4h2v-4h4v-2h-4V7zm-1-5C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm0 18c-4.41 0-8-3.59-8-8s3.59-8 8-8 8 3.59 8 8-3.59 8-8 8z"/>\n</svg>\n'),s("zoomOut",this.elZoomOut,'<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24">\n    <path d="M0 0h24v24H0z" fill="none"/>\n    <path d="M7 11v2h10v-2H7zm5-9C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm0 18c-4.41 0-8-3.59-8-8s3.59-8 8-8 8 3.59 8 8-3.59 8-8 8z"/>\n</svg>\n');var o=function(i){t.t[i]&&e.config.chart[i].enabled&&r.push({el:"zoom"===i?t.elZoom:t.elSelection,icon:"string"==typeof t.t[i]?t.t[i]:"zoom"===i?'<svg xmlns="http://www.w3.org/2000/svg" fill="#000000" height="24" viewBox="0 0 24 24" width="24">\n    <path d="M15.5 14h-.79l-.28-.27C15.41 12.59 16 11.11 16 9.5 16 5.91 13.09 3 9.5 3S3 5.91 3 9.5 5.91 16 9.5 16c1.61 0 3.09-.59 4.23-1.57l.27.28v.79l5 4.99L20.49 19l-4.99-5zm-6 0C7.01 14 5 11.99 5 9.5S7.01 5 9.5 5 14 7.01 14 9.5 11.99 14 9.5 14z"/>\n    <path d="M0 0h24v24H0V0z" fill="none"/>\n    <path d="M12 10h-2v2H9v-2H7V9h2V7h1v2h2v1z"/>\n</svg>':'<svg fill="#6E8192" height="24" viewBox="0 0 24 24" width="24" xmlns="http://www.w3.org/2000/svg">\n    <path d="M0 0h24v24H0z" fill="none"/>\n    <path d="M3 5h2V3c-1.1 0-2 .9-2 2zm0 8h2v-2H3v2zm4 8h2v-2H7v2zM3 9h2V7H3v2zm10-6h-2v2h2V3zm6 0v2h2c0-1.1-.9-2-2-2zM5 21v-2H3c0 1.1.9 2 2 2zm-2-4h2v-2H3v2zM9 3H7v2h2V3zm2 18h2v-2h-2v2zm8-8h2v-2h-2v2zm0 8c1.1 0 2-.9 2-2h-2v2zm0-12h2V7h-2v2zm0 8h2v-2h-2v2zm-4 4h2v-2h-2v2zm0-16h2V3h-2v2z"/>\n</svg>',title:t.localeValues["zoom"===i?"selectionZoom":"selection"],class:e.globals.isTouchDevice?"apexcharts-element-hidden":"apexcharts-".concat(i,"-icon")})};o("zoom"),o("selection"),this.t.pan&&e.config.chart.zoom.enabled&&r.push({el:this.elPan,icon:"string"==typeof this.t.pan?this.t.pan:'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" fill="#000000" height="24" viewBox="0 0 24 24" width="24">\n    <defs>\n        <path d="M0 0h24v24H0z" id="a"/>\n    </defs>\n    <clipPath id="b">\n        <use overflow="visible" xlink:href="#a"/>\n    </clipPath>\n    <path clip-path="url(#b)" d="M23 5.5V20c0 2.2-1.8 4-4 4h-7.3c-1.08 0-2.1-.43-2.85-1.19L1 14.83s1.26-1.23 1.3-1.25c.22-.19.49-.29.79-.29.22 0 .42.06.6.16.04.01 4.31 2.46 4.31 2.46V4c0-.83.67-1.5 1.5-1.5S11 3.17 11 4v7h1V1.5c0-.83.67-1.5 1.5-1.5S15 .67 15 1.5V11h1V2.5c0-.83.67-1.5 1.5-1.5s1.5.67 1.5 1.5V11h1V5.5c0-.83.67-1.5 1.5-1.5s1.5.67 1.5 1.5z"/>\n</svg>',title:this.localeValues.pan,class:e.globals.isTouchDevice?"apexcharts-element-hidden":"apexcharts-pan-icon"}),s("reset",this.elZoomReset,'<svg fill="#000000" height="24" viewBox="0 0 24 24" width="24" xmlns="http://www.w3.org/2000/svg">\n    <path d="M10 20v-6h4v6h5v-8h3L12 3 2 12h3v8z"/>\n    <path d="M0 0h24v24H0z" fill="none"/>\n</svg>'),this.t.download&&r.push({el:this.elMenuIcon,icon:"string"==typeof this.t.download?this.t.download:'<svg xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24"><path fill="none" d="M0 0h24v24H0V0z"/><path d="M3 18h18v-2H3v2zm0-5h18v-2H3v2zm0-7v2h18V6H3z"/></svg>',title:this.localeValues.menu,class:"apexcharts-menu-icon"});for(var l=0;l<this.elCustomIcons.length;l++)r.push({el:this.elCustomIcons[l],icon:this.t.customIcons[l].icon,title:this.t.customIcons[l].title,index:this.t.customIcons[l].index,class:"apexcharts-toolbar-custom-icon "+this.t.customIcons[l].class});r.forEach((function(t,e){t.index&&x.moveIndexInArray(r,e,t.index)}));for(var c=0;c<r.length;c++)w.setAttrs(r[c].el,{class:r[c].class,title:r[c].title}),r[c].el.innerHTML=r[c].icon,n.appendChild(r[c].el);this._createHamburgerMenu(n),e.globals.zoomEnabled?this.elZoom.classList.add(this.selectedClass):e.globals.panEnabled?this.elPan.classList.add(this.selectedClass):e.globals.selectionEnabled&&this.elSelection.classList.add(this.selectedClass),this.addToolbarEventListeners()}},{key:"_createHamburgerMenu",value:function(t){this.elMenuItems=[],t.appendChild(this.elMenu),w.setAttrs(this.elMenu,{class:"apexcharts-menu"});var e=[{name:"exportSVG",title:this.localeValues.exportToSVG},{name:"exportPNG",title:this.localeValues.exportToPNG},{name:"exportCSV",title:this.localeValues.exportToCSV}];this.w.globals.allSeriesHasEqualX||e.splice(2,1);for(var i=0;i<e.length;i++)this.elMenuItems.push(document.createElement("div")),this.elMenuItems[i].innerHTML=e[i].title,w.setAttrs(this.elMenuItems[i],{class:"apexcharts-menu-item ".concat(e[i].name),title:e[i].title}),this.elMenu.appendChild(this.elMenuItems[i])}},{key:"addToolbarEventListeners",value:function(){var t=this;this.elZoomReset.addEventListener("click",this.handleZoomReset.bind(this)),this.elSelection.addEventListener("click",this.toggleZoomSelection.bind(this,"selection")),this.elZoom.addEventListener("click",this.toggleZoomSelection.bind(this,"zoom")),this.elZoomIn.addEventListener("click",this.handleZoomIn.bind(this)),this.elZoomOut.addEventListener("click",this.handleZoomOut.bind(this)),this.elPan.addEventListener("click",this.togglePanning.bind(this)),this.elMenuIcon.addEventListener("click",this.toggleMenu.bind(this)),this.elMenuItems.forEach((function(e){e.classList.contains("exportSVG")?e.addEventListener("click",t.handleDownload.bind(t,"svg")):e.classList.contains("exportPNG")?e.addEventListener("click",t.handleDownload.bind(t,"png")):e.classList.contains("exportCSV")&&e.addEventListener("click",t.handleDownload.bind(t,"csv"))}));for(var e=0;e<this.t.customIcons.length;e++)this.elCustomIcons[e].addEventListener("click",this.t.customIcons[e].click.bind(this,this.ctx,this.ctx.w))}},{key:"toggleZoomSelection",value:function(t){this.ctx.getSyncedCharts().forEach((function(e){e.ctx.toolbar.toggleOtherControls();var i="selection"===t?e.ctx.toolbar.elSelection:e.ctx.toolbar.elZoom,n="selection"===t?"selectionEnabled":"zoomEnabled";e.w.globals[n]=!e.w.globals[n],i.classList.contains(e.ctx.toolbar.selectedClass)?i.classList.remove(e.ctx.toolbar.selectedClass):i.classList.add(e.ctx.toolbar.selectedClass)}))}},{key:"getToolbarIconsReference",value:function(){var t=this.w;this.elZoom||(this.elZoom=t.globals.dom.baseEl.querySelector(".apexcharts-zoom-icon")),this.elPan||(this.elPan=t.globals.dom.baseEl.querySelector(".apexcharts-pan-icon")),this.elSelection||(this.elSelection=t.globals.dom.baseEl.querySelector(".apexcharts-selection-icon"))}},{key:"enableZoomPanFromToolbar",value:function(t){this.toggleOtherControls(),"pan"===t?this.w.globals.panEnabled=!0:this.w.globals.zoomEnabled=!0;var e="pan"===t?this.elPan:this.elZoom,i="pan"===t?this.elZoom:this.elPan;e&&e.classList.add(this.selectedClass),i&&i.classList.remove(this.selectedClass)}},{key:"togglePanning",value:function(){this.ctx.getSyncedCharts().forEach((function(t){t.ctx.toolbar.toggleOtherControls(),t.w.globals.panEnabled=!t.w.globals.panEnabled,t.ctx.toolbar.elPan.classList.contains(t.ctx.toolbar.selectedClass)?t.ctx.toolbar.elPan.classList.remove(t.ctx.toolbar.selectedClass):t.ctx.toolbar.elPan.classList.add(t.ctx.toolbar.selectedClass)}))}},{key:"toggleOtherControls",value:function(){var t=this,e=this.w;e.globals.panEnabled=!1,e.globals.zoomEnabled=!1,e.globals.selectionEnabled=!1,this.getToolbarIconsReference(),[this.elPan,this.elSelection,this.elZoom].forEach((function(e){e&&e.classList.remove(t.selectedClass)}))}},{key:"handleZoomIn",value:function(){var t=this.w;t.globals.isRangeBar&&(this.minX=t.globals.minY,this.maxX=t.globals.maxY);var e=(this.minX+this.maxX)/2,i=(this.minX+e)/2,n=(this.maxX+e)/2,a=this._getNewMinXMaxX(i,n);t.globals.disableZoomIn||this.zoomUpdateOptions(a.minX,a.maxX)}},{key:"handleZoomOut",value:function(){var t=this.w;if(t.globals.isRangeBar&&(this.minX=t.globals.minY,this.maxX=t.globals.maxY),!("datetime"===t.config.xaxis.type&&new Date(this.minX).getUTCFullYear()<1e3)){var e=(this.minX+this.maxX)/2,i=this.minX-(e-this.minX),n=this.maxX-(e-this.maxX),a=this._getNewMinXMaxX(i,n);t.globals.disableZoomOut||this.zoomUpdateOptions(a.minX,a.maxX)}}},{key:"_getNewMinXMaxX",value:function(t,e){var i=this.w.config.xaxis.convertedCatToNumeric;return{minX:i?Math.floor(t):t,maxX:i?Math.floor(e):e}}},{key:"zoomUpdateOptions",value:function(t,e){var i=this.w;if(void 0!==t||void 0!==e){if(!(i.config.xaxis.convertedCatToNumeric&&(t<1&&(t=1,e=i.globals.dataPoints),e-t<2))){var n={min:t,max:e},a=this.getBeforeZoomRange(n);a&&(n=a.xaxis);var r={xaxis:n},s=x.clone(i.globals.initialConfig.yaxis);i.config.chart.zoom.autoScaleYaxis&&(s=new Z(this.ctx).autoScaleY(this.ctx,s,{xaxis:n})),i.config.chart.group||(r.yaxis=s),this.w.globals.zoomed=!0,this.ctx.updateHelpers._updateOptions(r,!1,this.w.config.chart.animations.dynamicAnimation.enabled),this.zoomCallback(n,s)}}else this.handleZoomReset()}},{key:"zoomCallback",value:function(t,e){"function"==typeof this.ev.zoomed&&this.ev.zoomed(this.ctx,{xaxis:t,yaxis:e})}},{key:"getBeforeZoomRange",value:function(t,e){var i=null;return"function"==typeof this.ev.beforeZoom&&(i=this.ev.beforeZoom(this,{xaxis:t,yaxis:e})),i}},{key:"toggleMenu",value:function(){var t=this;window.setTimeout((function(){t.elMenu.classList.contains("apexcharts-menu-open")?t.elMenu.classList.remove("apexcharts-menu-open"):t.elMenu.classList.add("apexcharts-menu-open")}),0)}},{key:"handleDownload",value:function(t){var e=this.w,i=new U(this.ctx);switch(t){case"svg":i.exportToSVG(this.ctx);break;case"png":i.exportToPng(this.ctx);break;case"csv":i.exportToCSV({series:e.config.series,columnDelimiter:e.config.chart.toolbar.export.csv.columnDelimiter})}}},{key:"handleZoomReset",value:function(t){this.ctx.getSyncedCharts().forEach((function(t){var e=t.w;if(e.globals.lastXAxis.min=void 0,e.globals.lastXAxis.max=void 0,t.updateHelpers.revertDefaultAxisMinMax(),"function"==typeof e.config.chart.events.beforeResetZoom){var i=e.config.chart.events.beforeResetZoom(t,e);i&&t.updateHelpers.revertDefaultAxisMinMax(i)}"function"==typeof e.config.chart.events.zoomed&&t.ctx.toolbar.zoomCallback({min:e.config.xaxis.min,max:e.config.xaxis.max}),e.globals.zoomed=!1;var n=t.ctx.series.emptyCollapsedSeries(x.clone(e.globals.initialSeries));t.updateHelpers._updateSeries(n,e.config.chart.animations.dynamicAnimation.enabled)}))}},{key:"destroy",value:function(){this.elZoom=null,this.elZoomIn=null,this.elZoomOut=null,this.elPan=null,this.elSelection=null,this.elZoomReset=null,this.elMenuIcon=null}}]),t}(),gt=function(t){u(i,ft);var e=p(i);function i(t){var n;return o(this,i),(n=e.call(this,t)).ctx=t,n.w=t.w,n.dragged=!1,n.graphics=new w(n.ctx),n.eventList=["mousedown","mouseleave","mousemove","touchstart","touchmove","mouseup","touchend"],n.clientX=0,n.clientY=0,n.startX=0,n.endX=0,n.dragX=0,n.startY=0,n.endY=0,n.dragY=0,n.moveDirection="none",n}return c(i,[{key:"init",value:function(t){var e=this,i=t.xyRatios,n=this.w,a=this;this.xyRatios=i,this.zoomRect=this.graphics.drawRect(0,0,0,0),this.selectionRect=this.graphics.drawRect(0,0,0,0),this.gridRect=n.globals.dom.baseEl.querySelector(".apexcharts-grid"),this.zoomRect.node.classList.add("apexcharts-zoom-rect"),this.selectionRect.node.classList.add("apexcharts-selection-rect"),n.globals.dom.elGraphical.add(this.zoomRect),n.globals.dom.elGraphical.add(this.selectionRect),"x"===n.config.chart.selection.type?this.slDraggableRect=this.selectionRect.draggable({minX:0,minY:0,maxX:n.globals.gridWidth,maxY:n.globals.gridHeight}).on("dragmove",this.selectionDragging.bind(this,"dragging")):"y"===n.config.chart.selection.type?this.slDraggableRect=this.selectionRect.draggable({minX:0,maxX:n.globals.gridWidth}).on("dragmove",this.selectionDragging.bind(this,"dragging")):this.slDraggableRect=this.selectionRect.draggable().on("dragmove",this.selectionDragging.bind(this,"dragging")),this.preselectedSelection(),this.hoverArea=n.globals.dom.baseEl.querySelector("".concat(n.globals.chartClass," .apexcharts-svg")),this.hoverArea.classList.add("apexcharts-zoomable"),this.eventList.forEach((function(t){e.hoverArea.addEventListener(t,a.svgMouseEvents.bind(a,i),{capture:!1,passive:!0})}))}},{key:"destroy",value:function(){this.slDraggableRect&&(this.slDraggableRect.draggable(!1),this.slDraggableRect.off(),this.selectionRect.off()),this.selectionRect=null,this.zoomRect=null,this.gridRect=null}},{key:"svgMouseEvents",value:function(t,e){var i=this.w,n=this,a=this.ctx.toolbar,r=i.globals.zoomEnabled?i.config.chart.zoom.type:i.config.chart.selection.type,s=i.config.chart.toolbar.autoSelected;if(e.shiftKey?(this.shiftWasPressed=!0,a.enableZoomPanFromToolbar("pan"===s?"zoom":"pan")):this.shiftWasPressed&&(a.enableZoomPanFromToolbar(s),this.shiftWasPressed=!1),e.target){var o,l=e.target.classList;if(e.target.parentNode&&null!==e.target.parentNode&&(o=e.target.parentNode.classList),!(l.contains("apexcharts-selection-rect")||l.contains("apexcharts-legend-marker")||l.contains("apexcharts-legend-text")||o&&o.contains("apexcharts-toolbar"))){if(n.clientX="touchmove"===e.type||"touchstart"===e.type?e.touches[0].clientX:"touchend"===e.type?e.changedTouches[0].clientX:e.clientX,n.clientY="touchmove"===e.type||"touchstart"===e.type?e.touches[0].clientY:"touchend"===e.type?e.changedTouches[0].clientY:e.clientY,"mousedown"===e.type&&1===e.which){var c=n.gridRect.getBoundingClientRect();n.startX=n.clientX-c.left,n.startY=n.clientY-c.top,n.dragged=!1,n.w.globals.mousedown=!0}if(("mousemove"===e.type&&1===e.which||"touchmove"===e.type)&&(n.dragged=!0,i.globals.panEnabled?(i.globals.selection=null,n.w.globals.mousedown&&n.panDragging({context:n,zoomtype:r,xyRatios:t})):(n.w.globals.mousedown&&i.globals.zoomEnabled||n.w.globals.mousedown&&i.globals.selectionEnabled)&&(n.selection=n.selectionDrawing({context:n,zoomtype:r}))),"mouseup"===e.type||"touchend"===e.type||"mouseleave"===e.type){var h=n.gridRect.getBoundingClientRect();n.w.globals.mousedown&&(n.endX=n.clientX-h.left,n.endY=n.clientY-h.top,n.dragX=Math.abs(n.endX-n.startX),n.dragY=Math.abs(n.endY-n.startY),(i.globals.zoomEnabled||i.globals.selectionEnabled)&&n.selectionDrawn({context:n,zoomtype:r}),i.globals.panEnabled&&i.config.xaxis.convertedCatToNumeric&&n.delayedPanScrolled()),i.globals.zoomEnabled&&n.hideSelectionRect(this.selectionRect),n.dragged=!1,n.w.globals.mousedown=!1}this.makeSelectionRectDraggable()}}}},{key:"makeSelectionRectDraggable",value:function(){var t=this.w;if(this.selectionRect){var e=this.selectionRect.node.getBoundingClientRect();e.width>0&&e.height>0&&this.slDraggableRect.selectize({points:"l, r",pointSize:8,pointType:"rect"}).resize({constraint:{minX:0,minY:0,maxX:t.globals.gridWidth,maxY:t.globals.gridHeight}}).on("resizing",this.selectionDragging.bind(this,"resizing"))}}},{key:"preselectedSelection",value:function(){var t=this.w,e=this.xyRatios;if(!t.globals.zoomEnabled)if(void 0!==t.globals.selection&&null!==t.globals.selection)this.drawSelectionRect(t.globals.selection);else if(void 0!==t.config.chart.selection.xaxis.min&&void 0!==t.config.chart.selection.xaxis.max){var i=(t.config.chart.selection.xaxis.min-t.globals.minX)/e.xRatio,n={x:i,y:0,width:t.globals.gridWidth-(t.globals.maxX-t.config.chart.selection.xaxis.max)/e.xRatio-i,height:t.globals.gridHeight,translateX:0,translateY:0,selectionEnabled:!0};this.drawSelectionRect(n),this.makeSelectionRectDraggable(),"function"==typeof t.config.chart.events.selection&&t.config.chart.events.selection(this.ctx,{xaxis:{min:t.config.chart.selection.xaxis.min,max:t.config.chart.selection.xaxis.max},yaxis:{}})}}},{key:"drawSelectionRect",value:function(t){var e=t.x,i=t.y,n=t.width,a=t.height,r=t.translateX,s=void 0===r?0:r,o=t.translateY,l=void 0===o?0:o,c=this.w,h=this.zoomRect,u=this.selectionRect;if(this.dragged||null!==c.globals.selection){var d={transform:"translate("+s+", "+l+")"};c.globals.zoomEnabled&&this.dragged&&(n<0&&(n=1),h.attr({x:e,y:i,width:n,height:a,fill:c.config.chart.zoom.zoomedArea.fill.color,"fill-opacity":c.config.chart.zoom.zoomedArea.fill.opacity,stroke:c.config.chart.zoom.zoomedArea.stroke.color,"stroke-width":c.config.chart.zoom.zoomedArea.stroke.width,"stroke-opacity":c.config.chart.zoom.zoomedArea.stroke.opacity}),w.setAttrs(h.node,d)),c.globals.selectionEnabled&&(u.attr({x:e,y:i,width:n>0?n:0,height:a>0?a:0,fill:c.config.chart.selection.fill.color,"fill-opacity":c.config.chart.selection.fill.opacity,stroke:c.config.chart.selection.stroke.color,"stroke-width":c.config.chart.selection.stroke.width,"stroke-dasharray":c.config.chart.selection.stroke.dashArray,"stroke-opacity":c.config.chart.selection.stroke.opacity}),w.setAttrs(u.node,d))}}},{key:"hideSelectionRect",value:function(t){t&&t.attr({x:0,y:0,width:0,height:0})}},{key:"selectionDrawing",value:function(t){var e,i=t.context,n=t.zoomtype,a=this.w,r=i,s=this.gridRect.getBoundingClientRect(),o=r.startX-1,l=r.startY,c=!1,h=!1,u=r.clientX-s.left-o,d=r.clientY-s.top-l;return Math.abs(u+o)>a.globals.gridWidth?u=a.globals.gridWidth-o:r.clientX-s.left<0&&(u=o),o>r.clientX-s.left&&(c=!0,u=Math.abs(u)),l>r.clientY-s.top&&(h=!0,d=Math.abs(d)),e="x"===n?{x:c?o-u:o,y:0,width:u,height:a.globals.gridHeight}:"y"===n?{x:0,y:h?l-d:l,width:a.globals.gridWidth,height:d}:{x:c?o-u:o,y:h?l-d:l,width:u,height:d},r.drawSelectionRect(e),r.selectionDragging("resizing"),e}},{key:"selectionDragging",value:function(t,e){var i=this,n=this.w,a=this.xyRatios,r=this.selectionRect,s=0;"resizing"===t&&(s=30);var o=function(t){return parseFloat(r.node.getAttribute(t))},l={x:o("x"),y:o("y"),width:o("width"),height:o("height")};n.globals.selection=l,"function"==typeof n.config.chart.events.selection&&n.globals.selectionEnabled&&(clearTimeout(this.w.globals.selectionResizeTimer),this.w.globals.selectionResizeTimer=window.setTimeout((function(){var t=i.gridRect.getBoundingClientRect(),e=r.node.getBoundingClientRect(),s={xaxis:{min:n.globals.xAxisScale.niceMin+(e.left-t.left)*a.xRatio,max:n.globals.xAxisScale.niceMin+(e.right-t.left)*a.xRatio},yaxis:{min:n.globals.yAxisScale[0].niceMin+(t.bottom-e.bottom)*a.yRatio[0],max:n.globals.yAxisScale[0].niceMax-(e.top-t.top)*a.yRatio[0]}};n.config.chart.events.selection(i.ctx,s),n.config.chart.brush.enabled&&void 0!==n.config.chart.events.brushScrolled&&n.config.chart.events.brushScrolled(i.ctx,s)}),s))}},{key:"selectionDrawn",value:function(t){var e=t.context,i=t.zoomtype,n=this.w,a=e,r=this.xyRatios,s=this.ctx.toolbar;if(a.startX>a.endX){var o=a.startX;a.startX=a.endX,a.endX=o}if(a.startY>a.endY){var l=a.startY;a.startY=a.endY,a.endY=l}var c=void 0,h=void 0;n.globals.isRangeBar?(c=n.globals.yAxisScale[0].niceMin+a.startX*r.invertedYRatio,h=n.globals.yAxisScale[0].niceMin+a.endX*r.invertedYRatio):(c=n.globals.xAxisScale.niceMin+a.startX*r.xRatio,h=n.globals.xAxisScale.niceMin+a.endX*r.xRatio);var u=[],d=[];if(n.config.yaxis.forEach((function(t,e){u.push(n.globals.yAxisScale[e].niceMax-r.yRatio[e]*a.startY),d.push(n.globals.yAxisScale[e].niceMax-r.yRatio[e]*a.endY)})),a.dragged&&(a.dragX>10||a.dragY>10)&&c!==h)if(n.globals.zoomEnabled){var f=x.clone(n.globals.initialConfig.yaxis),g=x.clone(n.globals.initialConfig.xaxis);if(n.globals.zoomed=!0,n.config.xaxis.convertedCatToNumeric&&(c=Math.floor(c),h=Math.floor(h),c<1&&(c=1,h=n.globals.dataPoints),h-c<2&&(h=c+1)),"xy"!==i&&"x"!==i||(g={min:c,max:h}),"xy"!==i&&"y"!==i||f.forEach((function(t,e){f[e].min=d[e],f[e].max=u[e]})),n.config.chart.zoom.autoScaleYaxis){var p=new Z(a.ctx);f=p.autoScaleY(a.ctx,f,{xaxis:g})}if(s){var m=s.getBeforeZoomRange(g,f);m&&(g=m.xaxis?m.xaxis:g,f=m.yaxis?m.yaxis:f)}var v={xaxis:g};n.config.chart.group||(v.yaxis=f),a.ctx.updateHelpers._updateOptions(v,!1,a.w.config.chart.animations.dynamicAnimation.enabled),"function"==typeof n.config.chart.events.zoomed&&s.zoomCallback(g,f)}else if(n.globals.selectionEnabled){var b,y=null;b={min:c,max:h},"xy"!==i&&"y"!==i||(y=x.clone(n.config.yaxis)).forEach((function(t,e){y[e].min=d[e],y[e].max=u[e]})),n.globals.selection=a.selection,"function"==typeof n.config.chart.events.selection&&n.config.chart.events.selection(a.ctx,{xaxis:b,yaxis:y})}}},{key:"panDragging",value:function(t){var e=t.context,i=this.w,n=e;if(void 0!==i.globals.lastClientPosition.x){var a=i.globals.lastClientPosition.x-n.clientX,r=i.globals.lastClientPosition.y-n.clientY;Math.abs(a)>Math.abs(r)&&a>0?this.moveDirection="left":Math.abs(a)>Math.abs(r)&&a<0?this.moveDirection="right":Math.abs(r)>Math.abs(a)&&r>0?this.moveDirection="up":Math.abs(r)>Math.abs(a)&&r<0&&(this.moveDirection="down")}i.globals.lastClientPosition={x:n.clientX,y:n.clientY};var s=i.globals.isRangeBar?i.globals.minY:i.globals.minX,o=i.globals.isRangeBar?i.globals.maxY:i.globals.maxX;i.config.xaxis.convertedCatToNumeric||n.panScrolled(s,o)}},{key:"delayedPanScrolled",value:function(){var t=this.w,e=t.globals.minX,i=t.globals.maxX,n=(t.globals.maxX-t.globals.minX)/2;"left"===this.moveDirection?(e=t.globals.minX+n,i=t.globals.maxX+n):"right"===this.moveDirection&&(e=t.globals.minX-n,i=t.globals.maxX-n),e=Math.floor(e),i=Math.floor(i),this.updateScrolledChart({xaxis:{min:e,max:i}},e,i)}},{key:"panScrolled",value:function(t,e){var i=this.w,n=this.xyRatios,a=x.clone(i.globals.initialConfig.yaxis),r=n.xRatio,s=i.globals.minX,o=i.globals.maxX;i.globals.isRangeBar&&(r=n.invertedYRatio,s=i.globals.minY,o=i.globals.maxY),"left"===this.moveDirection?(t=s+i.globals.gridWidth/15*r,e=o+i.globals.gridWidth/15*r):"right"===this.moveDirection&&(t=s-i.globals.gridWidth/15*r,e=o-i.globals.gridWidth/15*r),i.globals.isRangeBar||(t<i.globals.initialMinX||e>i.globals.initialMaxX)&&(t=s,e=o);var l={min:t,max:e};i.config.chart.zoom.autoScaleYaxis&&(a=new Z(this.ctx).autoScaleY(this.ctx,a,{xaxis:l}));var c={xaxis:{min:t,max:e}};i.config.chart.group||(c.yaxis=a),this.updateScrolledChart(c,t,e)}},{key:"updateScrolledChart",value:function(t,e,i){var n=this.w;this.ctx.updateHelpers._updateOptions(t,!1,!1),"function"==typeof n.config.chart.events.scrolled&&n.config.chart.events.scrolled(this.ctx,{xaxis:{min:e,max:i}})}}]),i}(),pt=function(){function t(e){o(this,t),this.w=e.w,this.ttCtx=e,this.ctx=e.ctx}return c(t,[{key:"getNearestValues",value:function(t){var e=t.hoverArea,i=t.elGrid,n=t.clientX,a=t.clientY,r=this.w,s=i.getBoundingClientRect(),o=s.width,l=s.height,c=o/(r.globals.dataPoints-1),h=l/r.globals.dataPoints,u=this.hasBars();!r.globals.comboCharts&&!u||r.config.xaxis.convertedCatToNumeric||(c=o/r.globals.dataPoints);var d=n-s.left-r.globals.barPadForNumericAxis,f=a-s.top;d<0||f<0||d>o||f>l?(e.classList.remove("hovering-zoom"),e.classList.remove("hovering-pan")):r.globals.zoomEnabled?(e.classList.remove("hovering-pan"),e.classList.add("hovering-zoom")):r.globals.panEnabled&&(e.classList.remove("hovering-zoom"),e.classList.add("hovering-pan"));var g=Math.round(d/c),p=Math.floor(f/h);u&&!r.config.xaxis.convertedCatToNumeric&&(g=Math.ceil(d/c),g-=1);for(var m,v=null,b=null,y=[],w=0;w<r.globals.seriesXvalues.length;w++)y.push([r.globals.seriesXvalues[w][0]-1e-6].concat(r.globals.seriesXvalues[w]));if(y=y.map((function(t){return t.filter((function(t){return t}))})),m=r.globals.seriesYvalues.map((function(t){return t.filter((function(t){return x.isNumber(t)}))})),r.globals.isXNumeric){var k=this.ttCtx.getElGrid().getBoundingClientRect(),A=d*(k.width/o),S=f*(k.height/l);v=(b=this.closestInMultiArray(A,S,y,m)).index,g=b.j,null!==v&&(y=r.globals.seriesXvalues[v],g=(b=this.closestInArray(A,y)).index)}return r.globals.capturedSeriesIndex=null===v?-1:v,(!g||g<1)&&(g=0),r.globals.isBarHorizontal?r.globals.capturedDataPointIndex=p:r.globals.capturedDataPointIndex=g,{capturedSeries:v,j:r.globals.isBarHorizontal?p:g,hoverX:d,hoverY:f}}},{key:"closestInMultiArray",value:function(t,e,i,n){var a=this.w,r=0,s=null,o=-1;a.globals.series.length>1?r=this.getFirstActiveXArray(i):s=0;var l=n[r][0],c=i[r][0],h=Math.abs(t-c),u=Math.abs(e-l),d=u+h;return n.map((function(a,r){a.map((function(a,l){var c=Math.abs(e-n[r][l]),f=Math.abs(t-i[r][l]),g=f+c;g<d&&(d=g,h=f,u=c,s=r,o=l)}))})),{index:s,j:o}}},{key:"getFirstActiveXArray",value:function(t){for(var e=this.w,i=0,n=t.map((function(t,e){return t.length>0?e:-1})),a=0;a<n.length;a++)if(-1!==n[a]&&-1===e.globals.collapsedSeriesIndices.indexOf(a)&&-1===e.globals.ancillaryCollapsedSeriesIndices.indexOf(a)){i=n[a];break}return i}},{key:"closestInArray",value:function(t,e){for(var i=e[0],n=null,a=Math.abs(t-i),r=0;r<e.length;r++){var s=Math.abs(t-e[r]);s<a&&(a=s,n=r)}return{index:n}}},{key:"isXoverlap",value:function(t){var e=[],i=this.w.globals.seriesX.filter((function(t){return void 0!==t[0]}));if(i.length>0)for(var n=0;n<i.length-1;n++)void 0!==i[n][t]&&void 0!==i[n+1][t]&&i[n][t]!==i[n+1][t]&&e.push("unEqual");return 0===e.length}},{key:"isInitialSeriesSameLen",value:function(){for(var t=!0,e=this.w.globals.initialSeries,i=0;i<e.length-1;i++)if(e[i].data.length!==e[i+1].data.length){t=!1;break}return t}},{key:"getBarsHeight",value:function(t){return m(t).reduce((function(t,e){return t+e.getBBox().height}),0)}},{key:"getElMarkers",value:function(){return this.w.globals.dom.baseEl.querySelectorAll(" .apexcharts-series-markers")}},{key:"getAllMarkers",value:function(){var t=this.w.globals.dom.baseEl.querySelectorAll(".apexcharts-series-markers-wrap");(t=m(t)).sort((function(t,e){return Number(e.getAttribute("data:realIndex"))<Number(t.getAttribute("data:realIndex"))?0:-1}));var e=[];return t.forEach((function(t){e.push(t.querySelector(".apexcharts-marker"))})),e}},{key:"hasMarkers",value:function(){return this.getElMarkers().length>0}},{key:"getElBars",value:function(){return this.w.globals.dom.baseEl.querySelectorAll(".apexcharts-bar-series,  .apexcharts-candlestick-series, .apexcharts-boxPlot-series, .apexcharts-rangebar-series")}},{key:"hasBars",value:function(){return this.getElBars().length>0}},{key:"getHoverMarkerSize",value:function(t){var e=this.w,i=e.config.markers.hover.size;return void 0===i&&(i=e.globals.markers.size[t]+e.config.markers.hover.sizeOffset),i}},{key:"toggleAllTooltipSeriesGroups",value:function(t){var e=this.w,i=this.ttCtx;0===i.allTooltipSeriesGroups.length&&(i.allTooltipSeriesGroups=e.globals.dom.baseEl.querySelectorAll(".apexcharts-tooltip-series-group"));for(var n=i.allTooltipSeriesGroups,a=0;a<n.length;a++)"enable"===t?(n[a].classList.add("apexcharts-active"),n[a].style.display=e.config.tooltip.items.display):(n[a].classList.remove("apexcharts-active"),n[a].style.display="none")}}]),t}(),mt=function(){function t(e){o(this,t),this.w=e.w,this.ctx=e.ctx,this.ttCtx=e,this.tooltipUtil=new pt(e)}return c(t,[{key:"drawSeriesTexts",value:function(t){var e=t.shared,i=void 0===e||e,n=t.ttItems,a=t.i,r=void 0===a?0:a,s=t.j,o=void 0===s?null:s,l=t.y1,c=t.y2,h=t.e,u=this.w;void 0!==u.config.tooltip.custom?this.handleCustomTooltip({i:r,j:o,y1:l,y2:c,w:u}):this.toggleActiveInactiveSeries(i);var d=this.getValuesToPrint({i:r,j:o});this.printLabels({i:r,j:o,values:d,ttItems:n,shared:i,e:h});var f=this.ttCtx.getElTooltip();this.ttCtx.tooltipRect.ttWidth=f.getBoundingClientRect().width,this.ttCtx.tooltipRect.ttHeight=f.getBoundingClientRect().height}},{key:"printLabels",value:function(t){var e,i=this,n=t.i,a=t.j,s=t.values,o=t.ttItems,l=t.shared,c=t.e,h=this.w,u=[],d=function(t){return h.globals.seriesGoals[t]&&h.globals.seriesGoals[t][a]&&Array.isArray(h.globals.seriesGoals[t][a])},f=s.xVal,g=s.zVal,p=s.xAxisTTVal,m="",v=h.globals.colors[n];null!==a&&h.config.plotOptions.bar.distributed&&(v=h.globals.colors[a]);for(var x=function(t,s){var x=i.getFormatters(n);m=i.getSeriesName({fn:x.yLbTitleFormatter,index:n,seriesIndex:n,j:a}),"treemap"===h.config.chart.type&&(m=x.yLbTitleFormatter(String(h.config.series[n].data[a].x),{series:h.globals.series,seriesIndex:n,dataPointIndex:a,w:h}));var b=h.config.tooltip.inverseOrder?s:t;if(h.globals.axisCharts){var y=function(t){return x.yLbFormatter(h.globals.series[t][a],{series:h.globals.series,seriesIndex:t,dataPointIndex:a,w:h})};l?(x=i.getFormatters(b),m=i.getSeriesName({fn:x.yLbTitleFormatter,index:b,seriesIndex:n,j:a}),v=h.globals.colors[b],e=y(b),d(b)&&(u=h.globals.seriesGoals[b][a].map((function(t){return{attrs:t,val:x.yLbFormatter(t.value,{seriesIndex:b,dataPointIndex:a,w:h})}})))):(c&&c.target&&c.target.getAttribute("fill")&&(v=c.target.getAttribute("fill")),e=y(n),d(n)&&Array.isArray(h.globals.seriesGoals[n][a])&&(u=h.globals.seriesGoals[n][a].map((function(t){return{attrs:t,val:x.yLbFormatter(t.value,{seriesIndex:n,dataPointIndex:a,w:h})}}))))}null===a&&(e=x.yLbFormatter(h.globals.series[n],r(r({},h),{},{seriesIndex:n,dataPointIndex:n}))),i.DOMHandling({i:n,t:b,j:a,ttItems:o,values:{val:e,goalVals:u,xVal:f,xAxisTTVal:p,zVal:g},seriesName:m,shared:l,pColor:v})},b=0,y=h.globals.series.length-1;b<h.globals.series.length;b++,y--)x(b,y)}},{key:"getFormatters",value:function(t){var e,i=this.w,n=i.globals.yLabelFormatters[t];return void 0!==i.globals.ttVal?Array.isArray(i.globals.ttVal)?(n=i.globals.ttVal[t]&&i.globals.ttVal[t].formatter,e=i.globals.ttVal[t]&&i.globals.ttVal[t].title&&i.globals.ttVal[t].title.formatter):(n=i.globals.ttVal.formatter,"function"==typeof i.globals.ttVal.title.formatter&&(e=i.globals.ttVal.title.formatter)):e=i.config.tooltip.y.title.formatter,"function"!=typeof n&&(n=i.globals.yLabelFormatters[0]?i.globals.yLabelFormatters[0]:function(t){return t}),"function"!=typeof e&&(e=function(t){return t}),{yLbFormatter:n,yLbTitleFormatter:e}}},{key:"getSeriesName",value:function(t){var e=t.fn,i=t.index,n=t.seriesIndex,a=t.j,r=this.w;return e(String(r.globals.seriesNames[i]),{series:r.globals.series,seriesIndex:n,dataPointIndex:a,w:r})}},{key:"DOMHandling",value:function(t){t.i;var e=t.t,i=t.j,n=t.ttItems,a=t.values,r=t.seriesName,s=t.shared,o=t.pColor,l=this.w,c=this.ttCtx,h=a.val,u=a.goalVals,d=a.xVal,f=a.xAxisTTVal,g=a.zVal,p=null;p=n[e].children,l.config.tooltip.fillSeriesColor&&(n[e].style.backgroundColor=o,p[0].style.display="none"),c.showTooltipTitle&&(null===c.tooltipTitle&&(c.tooltipTitle=l.globals.dom.baseEl.querySelector(".apexcharts-tooltip-title")),c.tooltipTitle.innerHTML=d),c.isXAxisTooltipEnabled&&(c.xaxisTooltipText.innerHTML=""!==f?f:d);var m=n[e].querySelector(".apexcharts-tooltip-text-y-label");m&&(m.innerHTML=r||"");var v=n[e].querySelector(".apexcharts-tooltip-text-y-value");v&&(v.innerHTML=void 0!==h?h:""),p[0]&&p[0].classList.contains("apexcharts-tooltip-marker")&&(l.config.tooltip.marker.fillColors&&Array.isArray(l.config.tooltip.marker.fillColors)&&(o=l.config.tooltip.marker.fillColors[e]),p[0].style.backgroundColor=o),l.config.tooltip.marker.show||(p[0].style.display="none");var x=n[e].querySelector(".apexcharts-tooltip-text-goals-label"),b=n[e].querySelector(".apexcharts-tooltip-text-goals-value");if(u.length&&l.globals.seriesGoals[e]){var y=function(){var t="<div >",e="<div>";u.forEach((function(i,n){t+=' <div style="display: flex"><span class="apexcharts-tooltip-marker" style="background-color: '.concat(i.attrs.strokeColor,'; height: 3px; border-radius: 0; top: 5px;"></span> ').concat(i.attrs.name,"</div>"),e+="<div>".concat(i.val,"</div>")})),x.innerHTML=t+"</div>",b.innerHTML=e+"</div>"};s?l.globals.seriesGoals[e][i]&&Array.isArray(l.globals.seriesGoals[e][i])?y():(x.innerHTML="",b.innerHTML=""):y()}else x.innerHTML="",b.innerHTML="";null!==g&&(n[e].querySelector(".apexcharts-tooltip-text-z-label").innerHTML=l.config.tooltip.z.title,n[e].querySelector(".apexcharts-tooltip-text-z-value").innerHTML=void 0!==g?g:""),s&&p[0]&&(null==h||l.globals.ancillaryCollapsedSeriesIndices.indexOf(e)>-1||l.globals.collapsedSeriesIndices.indexOf(e)>-1?p[0].parentNode.style.display="none":p[0].parentNode.style.display=l.config.tooltip.items.display)}},{key:"toggleActiveInactiveSeries",value:function(t){var e=this.w;if(t)this.tooltipUtil.toggleAllTooltipSeriesGroups("enable");else{this.tooltipUtil.toggleAllTooltipSeriesGroups("disable");var i=e.globals.dom.baseEl.querySelector(".apexcharts-tooltip-series-group");i&&(i.classList.add("apexcharts-active"),i.style.display=e.config.tooltip.items.display)}}},{key:"getValuesToPrint",value:function(t){var e=t.i,i=t.j,n=this.w,a=this.ctx.series.filteredSeriesX(),r="",s="",o=null,l=null,c={series:n.globals.series,seriesIndex:e,dataPointIndex:i,w:n},h=n.globals.ttZFormatter;null===i?l=n.globals.series[e]:n.globals.isXNumeric&&"treemap"!==n.config.chart.type?(r=a[e][i],0===a[e].length&&(r=a[this.tooltipUtil.getFirstActiveXArray(a)][i])):r=void 0!==n.globals.labels[i]?n.globals.labels[i]:"";var u=r;return r=n.globals.isXNumeric&&"datetime"===n.config.xaxis.type?new V(this.ctx).xLabelFormat(n.globals.ttKeyFormatter,u,u,{i:void 0,dateFormatter:new z(this.ctx).formatDate,w:this.w}):n.globals.isBarHorizontal?n.globals.yLabelFormatters[0](u,c):n.globals.xLabelFormatter(u,c),void 0!==n.config.tooltip.x.formatter&&(r=n.globals.ttKeyFormatter(u,c)),n.globals.seriesZ.length>0&&n.globals.seriesZ[e].length>0&&(o=h(n.globals.seriesZ[e][i],n)),s="function"==typeof n.config.xaxis.tooltip.formatter?n.globals.xaxisTooltipFormatter(u,c):r,{val:Array.isArray(l)?l.join(" "):l,xVal:Array.isArray(r)?r.join(" "):r,xAxisTTVal:Array.isArray(s)?s.join(" "):s,zVal:o}}},{key:"handleCustomTooltip",value:function(t){var e=t.i,i=t.j,n=t.y1,a=t.y2,r=t.w,s=this.ttCtx.getElTooltip(),o=r.config.tooltip.custom;Array.isArray(o)&&o[e]&&(o=o[e]),s.innerHTML=o({ctx:this.ctx,series:r.globals.series,seriesIndex:e,dataPointIndex:i,y1:n,y2:a,w:r})}}]),t}(),vt=function(){function t(e){o(this,t),this.ttCtx=e,this.ctx=e.ctx,this.w=e.w}return c(t,[{key:"moveXCrosshairs",value:function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:null,i=this.ttCtx,n=this.w,a=i.getElXCrosshairs(),r=t-i.xcrosshairsWidth/2,s=n.globals.labels.slice().length;if(null!==e&&(r=n.globals.gridWidth/s*e),null===a||n.globals.isBarHorizontal||(a.setAttribute("x",r),a.setAttribute("x1",r),a.setAttribute("x2",r),a.setAttribute("y2",n.globals.gridHeight),a.classList.add("apexcharts-active")),r<0&&(r=0),r>n.globals.gridWidth&&(r=n.globals.gridWidth),i.isXAxisTooltipEnabled){var o=r;"tickWidth"!==n.config.xaxis.crosshairs.width&&"barWidth"!==n.config.xaxis.crosshairs.width||(o=r+i.xcrosshairsWidth/2),this.moveXAxisTooltip(o)}}},{key:"moveYCrosshairs",value:function(t){var e=this.ttCtx;null!==e.ycrosshairs&&w.setAttrs(e.ycrosshairs,{y1:t,y2:t}),null!==e.ycrosshairsHidden&&w.setAttrs(e.ycrosshairsHidden,{y1:t,y2:t})}},{key:"moveXAxisTooltip",value:function(t){var e=this.w,i=this.ttCtx;if(null!==i.xaxisTooltip&&0!==i.xcrosshairsWidth){i.xaxisTooltip.classList.add("apexcharts-active");var n,a=i.xaxisOffY+e.config.xaxis.tooltip.offsetY+e.globals.translateY+1+e.config.xaxis.offsetY;t-=i.xaxisTooltip.getBoundingClientRect().width/2,isNaN(t)||(t+=e.globals.translateX,n=new w(this.ctx).getTextRects(i.xaxisTooltipText.innerHTML),i.xaxisTooltipText.style.minWidth=n.width+"px",i.xaxisTooltip.style.left=t+"px",i.xaxisTooltip.style.top=a+"px")}}},{key:"moveYAxisTooltip",value:function(t){var e=this.w,i=this.ttCtx;null===i.yaxisTTEls&&(i.yaxisTTEls=e.globals.dom.baseEl.querySelectorAll(".apexcharts-yaxistooltip"));var n=parseInt(i.ycrosshairsHidden.getAttribute("y1"),10),a=e.globals.translateY+n,r=i.yaxisTTEls[t].getBoundingClientRect().height,s=e.globals.translateYAxisX[t]-2;e.config.yaxis[t].opposite&&(s-=26),a-=r/2,-1===e.globals.ignoreYAxisIndexes.indexOf(t)?(i.yaxisTTEls[t].classList.add("apexcharts-active"),i.yaxisTTEls[t].style.top=a+"px",i.yaxisTTEls[t].style.left=s+e.config.yaxis[t].tooltip.offsetX+"px"):i.yaxisTTEls[t].classList.remove("apexcharts-active")}},{key:"moveTooltip",value:function(t,e){var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:null,n=this.w,a=this.ttCtx,r=a.getElTooltip(),s=a.tooltipRect,o=null!==i?parseFloat(i):1,l=parseFloat(t)+o+5,c=parseFloat(e)+o/2;if(l>n.globals.gridWidth/2&&(l=l-s.ttWidth-o-15),l>n.globals.gridWidth-s.ttWidth-10&&(l=n.globals.gridWidth-s.ttWidth),l<-20&&(l=-20),n.config.tooltip.followCursor){var h=a.getElGrid(),u=h.getBoundingClientRect();c=a.e.clientY+n.globals.translateY-u.top-s.ttHeight/2}else n.globals.isBarHorizontal||(s.ttHeight/2+c>n.globals.gridHeight&&(c=n.globals.gridHeight-s.ttHeight+n.globals.translateY),c<0&&(c=0));isNaN(l)||(l+=n.globals.translateX,r.style.left=l+"px",r.style.top=c+"px")}},{key:"moveMarkers",value:function(t,e){var i=this.w,n=this.ttCtx;if(i.globals.markers.size[t]>0)for(var a=i.globals.dom.baseEl.querySelectorAll(" .apexcharts-series[data\\:realIndex='".concat(t,"'] .apexcharts-marker")),r=0;r<a.length;r++)parseInt(a[r].getAttribute("rel"),10)===e&&(n.marker.resetPointsSize(),n.marker.enlargeCurrentPoint(e,a[r]));else n.marker.resetPointsSize(),this.moveDynamicPointOnHover(e,t)}},{key:"moveDynamicPointOnHover",value:function(t,e){var i,n,a=this.w,r=this.ttCtx,s=a.globals.pointsArray,o=r.tooltipUtil.getHoverMarkerSize(e),l=a.config.series[e].type;if(!l||"column"!==l&&"candlestick"!==l&&"boxPlot"!==l){i=s[e][t][0],n=s[e][t][1]?s[e][t][1]:0;var c=a.globals.dom.baseEl.querySelector(".apexcharts-series[data\\:realIndex='".concat(e,"'] .apexcharts-series-markers circle"));c&&n<a.globals.gridHeight&&n>0&&(c.setAttribute("r",o),c.setAttribute("cx",i),c.setAttribute("cy",n)),this.moveXCrosshairs(i),r.fixedTooltip||this.moveTooltip(i,n,o)}}},{key:"moveDynamicPointsOnHover",value:function(t){var e,i=this.ttCtx,n=i.w,a=0,r=0,s=n.globals.pointsArray;e=new N(this.ctx).getActiveConfigSeriesIndex(!0);var o=i.tooltipUtil.getHoverMarkerSize(e);s[e]&&(a=s[e][t][0],r=s[e][t][1]);var l=i.tooltipUtil.getAllMarkers();if(null!==l)for(var c=0;c<n.globals.series.length;c++){var h=s[c];if(n.globals.comboCharts&&void 0===h&&l.splice(c,0,null),h&&h.length){var u=s[c][t][1];l[c].setAttribute("cx",a),null!==u&&!isNaN(u)&&u<n.globals.gridHeight+o&&u+o>0?(l[c]&&l[c].setAttribute("r",o),l[c]&&l[c].setAttribute("cy",u)):l[c]&&l[c].setAttribute("r",0)}}if(this.moveXCrosshairs(a),!i.fixedTooltip){var d=r||n.globals.gridHeight;this.moveTooltip(a,d,o)}}},{key:"moveStickyTooltipOverBars",value:function(t){var e=this.w,i=this.ttCtx,n=e.globals.columnSeries?e.globals.columnSeries.length:e.globals.series.length,a=n>=2&&n%2==0?Math.floor(n/2):Math.floor(n/2)+1;e.globals.isBarHorizontal&&(a=new N(this.ctx).getActiveConfigSeriesIndex(!1,"desc")+1);var r=e.globals.dom.baseEl.querySelector(".apexcharts-bar-series .apexcharts-series[rel='".concat(a,"'] path[j='").concat(t,"'], .apexcharts-candlestick-series .apexcharts-series[rel='").concat(a,"'] path[j='").concat(t,"'], .apexcharts-boxPlot-series .apexcharts-series[rel='").concat(a,"'] path[j='").concat(t,"'], .apexcharts-rangebar-series .apexcharts-series[rel='").concat(a,"'] path[j='").concat(t,"']")),s=r?parseFloat(r.getAttribute("cx")):0,o=r?parseFloat(r.getAttribute("cy")):0,l=r?parseFloat(r.getAttribute("barWidth")):0,c=r?parseFloat(r.getAttribute("barHeight")):0,h=i.getElGrid().getBoundingClientRect(),u=r.classList.contains("apexcharts-candlestick-area")||r.classList.contains("apexcharts-boxPlot-area");if(e.globals.isXNumeric?(r&&!u&&(s-=n%2!=0?l/2:0),r&&u&&e.globals.comboCharts&&(s-=l/2)):e.globals.isBarHorizontal||(s=i.xAxisTicksPositions[t-1]+i.dataPointsDividedWidth/2,isNaN(s)&&(s=i.xAxisTicksPositions[t]-i.dataPointsDividedWidth/2)),e.globals.isBarHorizontal?o+=c/3:o=i.e.clientY-h.top-i.tooltipRect.ttHeight/2,e.globals.isBarHorizontal||this.moveXCrosshairs(s),!i.fixedTooltip){var d=o||e.globals.gridHeight;this.moveTooltip(s,d)}}}]),t}(),xt=function(){function t(e){o(this,t),this.w=e.w,this.ttCtx=e,this.ctx=e.ctx,this.tooltipPosition=new vt(e)}return c(t,[{key:"drawDynamicPoints",value:function(){var t=this.w,e=new w(this.ctx),i=new L(this.ctx),n=t.globals.dom.baseEl.querySelectorAll(".apexcharts-series");n=m(n),t.config.chart.stacked&&n.sort((function(t,e){return parseFloat(t.getAttribute("data:realIndex"))-parseFloat(e.getAttribute("data:realIndex"))}));for(var a=0;a<n.length;a++){var r=n[a].querySelector(".apexcharts-series-markers-wrap");if(null!==r){var s=void 0,o="apexcharts-marker w".concat((Math.random()+1).toString(36).substring(4));"line"!==t.config.chart.type&&"area"!==t.config.chart.type||t.globals.comboCharts||t.config.tooltip.intersect||(o+=" no-pointer-events");var l=i.getMarkerConfig({cssClass:o,seriesIndex:Number(r.getAttribute("data:realIndex"))});(s=e.drawMarker(0,0,l)).node.setAttribute("default-marker-size",0);var c=document.createElementNS(t.globals.SVGNS,"g");c.classList.add("apexcharts-series-markers"),c.appendChild(s.node),r.appendChild(c)}}}},{key:"enlargeCurrentPoint",value:function(t,e){var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:null,n=arguments.length>3&&void 0!==arguments[3]?arguments[3]:null,a=this.w;"bubble"!==a.config.chart.type&&this.newPointSize(t,e);var r=e.getAttribute("cx"),s=e.getAttribute("cy");if(null!==i&&null!==n&&(r=i,s=n),this.tooltipPosition.moveXCrosshairs(r),!this.fixedTooltip){if("radar"===a.config.chart.type){var o=this.ttCtx.getElGrid(),l=o.getBoundingClientRect();r=this.ttCtx.e.clientX-l.left}this.tooltipPosition.moveTooltip(r,s,a.config.markers.hover.size)}}},{key:"enlargePoints",value:function(t){for(var e=this.w,i=this,n=this.ttCtx,a=t,r=e.globals.dom.baseEl.querySelectorAll(".apexcharts-series:not(.apexcharts-series-collapsed) .apexcharts-marker"),s=e.config.markers.hover.size,o=0;o<r.length;o++){var l=r[o].getAttribute("rel"),c=r[o].getAttribute("index");if(void 0===s&&(s=e.globals.markers.size[c]+e.config.markers.hover.sizeOffset),a===parseInt(l,10)){i.newPointSize(a,r[o]);var h=r[o].getAttribute("cx"),u=r[o].getAttribute("cy");i.tooltipPosition.moveXCrosshairs(h),n.fixedTooltip||i.tooltipPosition.moveTooltip(h,u,s)}else i.oldPointSize(r[o])}}},{key:"newPointSize",value:function(t,e){var i=this.w,n=i.config.markers.hover.size,a=0===t?e.parentNode.firstChild:e.parentNode.lastChild;if("0"!==a.getAttribute("default-marker-size")){var r=parseInt(a.getAttribute("index"),10);void 0===n&&(n=i.globals.markers.size[r]+i.config.markers.hover.sizeOffset),n<0&&(n=0),a.setAttribute("r",n)}}},{key:"oldPointSize",value:function(t){var e=parseFloat(t.getAttribute("default-marker-size"));t.setAttribute("r",e)}},{key:"resetPointsSize",value:function(){for(var t=this.w.globals.dom.baseEl.querySelectorAll(".apexcharts-series:not(.apexcharts-series-collapsed) .apexcharts-marker"),e=0;e<t.length;e++){var i=parseFloat(t[e].getAttribute("default-marker-size"));x.isNumber(i)&&i>=0?t[e].setAttribute("r",i):t[e].setAttribute("r",0)}}}]),t}(),bt=function(){function t(e){o(this,t),this.w=e.w,this.ttCtx=e}return c(t,[{key:"getAttr",value:function(t,e){return parseFloat(t.target.getAttribute(e))}},{key:"handleHeatTreeTooltip",value:function(t){var e=t.e,i=t.opt,n=t.x,a=t.y,r=t.type,s=this.ttCtx,o=this.w;if(e.target.classList.contains("apexcharts-".concat(r,"-rect"))){var l=this.getAttr(e,"i"),c=this.getAttr(e,"j"),h=this.getAttr(e,"cx"),u=this.getAttr(e,"cy"),d=this.getAttr(e,"width"),f=this.getAttr(e,"height");if(s.tooltipLabels.drawSeriesTexts({ttItems:i.ttItems,i:l,j:c,shared:!1,e}),o.globals.capturedSeriesIndex=l,o.globals.capturedDataPointIndex=c,n=h+s.tooltipRect.ttWidth/2+d,a=u+s.tooltipRect.ttHeight/2-f/2,s.tooltipPosition.moveXCrosshairs(h+d/2),n>o.globals.gridWidth/2&&(n=h-s.tooltipRect.ttWidth/2+d),s.w.config.tooltip.followCursor){var g=o.globals.dom.elWrap.getBoundingClientRect();n=o.globals.clientX-g.left-(n>o.globals.gridWidth/2?s.tooltipRect.ttWidth:0),a=o.globals.clientY-g.top}}return{x:n,y:a}}},{key:"handleMarkerTooltip",value:function(t){var e,i,n=t.e,a=t.opt,r=t.x,s=t.y,o=this.w,l=this.ttCtx;if(n.target.classList.contains("apexcharts-marker")){var c=parseInt(a.paths.getAttribute("cx"),10),h=parseInt(a.paths.getAttribute("cy"),10),u=parseFloat(a.paths.getAttribute("val"));if(i=parseInt(a.paths.getAttribute("rel"),10),e=parseInt(a.paths.parentNode.parentNode.parentNode.getAttribute("rel"),10)-1,l.intersect){var d=x.findAncestor(a.paths,"apexcharts-series");d&&(e=parseInt(d.getAttribute("data:realIndex"),10))}if(l.tooltipLabels.drawSeriesTexts({ttItems:a.ttItems,i:e,j:i,shared:!l.showOnIntersect&&o.config.tooltip.shared,e:n}),"mouseup"===n.type&&l.markerClick(n,e,i),o.globals.capturedSeriesIndex=e,o.globals.capturedDataPointIndex=i,r=c,s=h+o.globals.translateY-1.4*l.tooltipRect.ttHeight,l.w.config.tooltip.followCursor){var f=l.getElGrid().getBoundingClientRect();s=l.e.clientY+o.globals.translateY-f.top}u<0&&(s=h),l.marker.enlargeCurrentPoint(i,a.paths,r,s)}return{x:r,y:s}}},{key:"handleBarTooltip",value:function(t){var e,i,n=t.e,a=t.opt,r=this.w,s=this.ttCtx,o=s.getElTooltip(),l=0,c=0,h=0,u=this.getBarTooltipXY({e:n,opt:a});e=u.i;var d=u.barHeight,f=u.j;r.globals.capturedSeriesIndex=e,r.globals.capturedDataPointIndex=f,r.globals.isBarHorizontal&&s.tooltipUtil.hasBars()||!r.config.tooltip.shared?(c=u.x,h=u.y,i=Array.isArray(r.config.stroke.width)?r.config.stroke.width[e]:r.config.stroke.width,l=c):r.globals.comboCharts||r.config.tooltip.shared||(l/=2),isNaN(h)?h=r.globals.svgHeight-s.tooltipRect.ttHeight:h<0&&(h=0);var g=parseInt(a.paths.parentNode.getAttribute("data:realIndex"),10),p=r.globals.isMultipleYAxis?r.config.yaxis[g]&&r.config.yaxis[g].reversed:r.config.yaxis[0].reversed;if(c+s.tooltipRect.ttWidth>r.globals.gridWidth&&!p?c-=s.tooltipRect.ttWidth:c<0&&(c=0),s.w.config.tooltip.followCursor){var m=s.getElGrid().getBoundingClientRect();h=s.e.clientY-m.top}null===s.tooltip&&(s.tooltip=r.globals.dom.baseEl.querySelector(".apexcharts-tooltip")),r.config.tooltip.shared||(r.globals.comboBarCount>0?s.tooltipPosition.moveXCrosshairs(l+i/2):s.tooltipPosition.moveXCrosshairs(l)),!s.fixedTooltip&&(!r.config.tooltip.shared||r.globals.isBarHorizontal&&s.tooltipUtil.hasBars())&&(p&&(c-=s.tooltipRect.ttWidth)<0&&(c=0),!p||r.globals.isBarHorizontal&&s.tooltipUtil.hasBars()||(h=h+d-2*(r.globals.series[e][f]<0?d:0)),s.tooltipRect.ttHeight+h>r.globals.gridHeight?h=r.globals.gridHeight-s.tooltipRect.ttHeight+r.globals.translateY:(h=h+r.globals.translateY-s.tooltipRect.ttHeight/2)<0&&(h=0),o.style.left=c+r.globals.translateX+"px",o.style.top=h+"px")}},{key:"getBarTooltipXY",value:function(t){var e=t.e,i=t.opt,n=this.w,a=null,r=this.ttCtx,s=0,o=0,l=0,c=0,h=0,u=e.target.classList;if(u.contains("apexcharts-bar-area")||u.contains("apexcharts-candlestick-area")||u.contains("apexcharts-boxPlot-area")||u.contains("apexcharts-rangebar-area")){var d=e.target,f=d.getBoundingClientRect(),g=i.elGrid.getBoundingClientRect(),p=f.height;h=f.height;var m=f.width,v=parseInt(d.getAttribute("cx"),10),x=parseInt(d.getAttribute("cy"),10);c=parseFloat(d.getAttribute("barWidth"));var b="touchmove"===e.type?e.touches[0].clientX:e.clientX;a=parseInt(d.getAttribute("j"),10),s=parseInt(d.parentNode.getAttribute("rel"),10)-1;var y=d.getAttribute("data-range-y1"),w=d.getAttribute("data-range-y2");n.globals.comboCharts&&(s=parseInt(d.parentNode.getAttribute("data:realIndex"),10)),r.tooltipLabels.drawSeriesTexts({ttItems:i.ttItems,i:s,j:a,y1:y?parseInt(y,10):null,y2:w?parseInt(w,10):null,shared:!r.showOnIntersect&&n.config.tooltip.shared,e}),n.config.tooltip.followCursor?n.globals.isBarHorizontal?(o=b-g.left+15,l=x-r.dataPointsDividedHeight+p/2-r.tooltipRect.ttHeight/2):(o=n.globals.isXNumeric?v-m/2:v-r.dataPointsDividedWidth+m/2,l=e.clientY-g.top-r.tooltipRect.ttHeight/2-15):n.globals.isBarHorizontal?((o=v)<r.xyRatios.baseLineInvertedY&&(o=v-r.tooltipRect.ttWidth),l=x-r.dataPointsDividedHeight+p/2-r.tooltipRect.ttHeight/2):(o=n.globals.isXNumeric?v-m/2:v-r.dataPointsDividedWidth+m/2,l=x)}return{x:o,y:l,barHeight:h,barWidth:c,i:s,j:a}}}]),t}(),yt=function(){function t(e){o(this,t),this.w=e.w,this.ttCtx=e}return c(t,[{key:"drawXaxisTooltip",value:function(){var t=this.w,e=this.ttCtx,i="bottom"===t.config.xaxis.position;e.xaxisOffY=i?t.globals.gridHeight+1:-t.globals.xAxisHeight-t.config.xaxis.axisTicks.height+3;var n=i?"apexcharts-xaxistooltip apexcharts-xaxistooltip-bottom":"apexcharts-xaxistooltip apexcharts-xaxistooltip-top",a=t.globals.dom.elWrap;e.isXAxisTooltipEnabled&&null===t.globals.dom.baseEl.querySelector(".apexcharts-xaxistooltip")&&(e.xaxisTooltip=document.createElement("div"),e.xaxisTooltip.setAttribute("class",n+" apexcharts-theme-"+t.config.tooltip.theme),a.appendChild(e.xaxisTooltip),e.xaxisTooltipText=document.createElement("div"),e.xaxisTooltipText.classList.add("apexcharts-xaxistooltip-text"),e.xaxisTooltipText.style.fontFamily=t.config.xaxis.tooltip.style.fontFamily||t.config.chart.fontFamily,e.xaxisTooltipText.style.fontSize=t.config.xaxis.tooltip.style.fontSize,e.xaxisTooltip.appendChild(e.xaxisTooltipText))}},{key:"drawYaxisTooltip",value:function(){for(var t=this.w,e=this.ttCtx,i=function(i){var n=t.config.yaxis[i].opposite||t.config.yaxis[i].crosshairs.opposite;e.yaxisOffX=n?t.globals.gridWidth+1:1;var a="apexcharts-yaxistooltip apexcharts-yaxistooltip-".concat(i,n?" apexcharts-yaxistooltip-right":" apexcharts-yaxistooltip-left");t.globals.yAxisSameScaleIndices.map((function(e,n){e.map((function(e,n){n===i&&(a+=t.config.yaxis[n].show?" ":" apexcharts-yaxistooltip-hidden")}))}));var r=t.globals.dom.elWrap;null===t.globals.dom.baseEl.querySelector(".apexcharts-yaxistooltip apexcharts-yaxistooltip-".concat(i))&&(e.yaxisTooltip=document.createElement("div"),e.yaxisTooltip.setAttribute("class",a+" apexcharts-theme-"+t.config.tooltip.theme),r.appendChild(e.yaxisTooltip),0===i&&(e.yaxisTooltipText=[]),e.yaxisTooltipText[i]=document.createElement("div"),e.yaxisTooltipText[i].classList.add("apexcharts-yaxistooltip-text"),e.yaxisTooltip.appendChild(e.yaxisTooltipText[i]))},n=0;n<t.config.yaxis.length;n++)i(n)}},{key:"setXCrosshairWidth",value:function(){var t=this.w,e=this.ttCtx,i=e.getElXCrosshairs();if(e.xcrosshairsWidth=parseInt(t.config.xaxis.crosshairs.width,10),t.globals.comboCharts){var n=t.globals.dom.baseEl.querySelector(".apexcharts-bar-area");if(null!==n&&"barWidth"===t.config.xaxis.crosshairs.width){var a=parseFloat(n.getAttribute("barWidth"));e.xcrosshairsWidth=a}else if("tickWidth"===t.config.xaxis.crosshairs.width){var r=t.globals.labels.length;e.xcrosshairsWidth=t.globals.gridWidth/r}}else if("tickWidth"===t.config.xaxis.crosshairs.width){var s=t.globals.labels.length;e.xcrosshairsWidth=t.globals.gridWidth/s}else if("barWidth"===t.config.xaxis.crosshairs.width){var o=t.globals.dom.baseEl.querySelector(".apexcharts-bar-area");if(null!==o){var l=parseFloat(o.getAttribute("barWidth"));e.xcrosshairsWidth=l}else e.xcrosshairsWidth=1}t.globals.isBarHorizontal&&(e.xcrosshairsWidth=0),null!==i&&e.xcrosshairsWidth>0&&i.setAttribute("width",e.xcrosshairsWidth)}},{key:"handleYCrosshair",value:function(){var t=this.w,e=this.ttCtx;e.ycrosshairs=t.globals.dom.baseEl.querySelector(".apexcharts-ycrosshairs"),e.ycrosshairsHidden=t.globals.dom.baseEl.querySelector(".apexcharts-ycrosshairs-hidden")}},{key:"drawYaxisTooltipText",value:function(t,e,i){var n=this.ttCtx,a=this.w,r=a.globals.yLabelFormatters[t];if(n.yaxisTooltips[t]){var s=n.getElGrid().getBoundingClientRect(),o=(e-s.top)*i.yRatio[t],l=a.globals.maxYArr[t]-a.globals.minYArr[t],c=a.globals.minYArr[t]+(l-o);n.tooltipPosition.moveYCrosshairs(e-s.top),n.yaxisTooltipText[t].innerHTML=r(c),n.tooltipPosition.moveYAxisTooltip(t)}}}]),t}(),wt=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w;var i=this.w;this.tConfig=i.config.tooltip,this.tooltipUtil=new pt(this),this.tooltipLabels=new mt(this),this.tooltipPosition=new vt(this),this.marker=new xt(this),this.intersect=new bt(this),this.axesTooltip=new yt(this),this.showOnIntersect=this.tConfig.intersect,this.showTooltipTitle=this.tConfig.x.show,this.fixedTooltip=this.tConfig.fixed.enabled,this.xaxisTooltip=null,this.yaxisTTEls=null,this.isBarShared=!i.globals.isBarHorizontal&&this.tConfig.shared,this.lastHoverTime=Date.now()}return c(t,[{key:"getElTooltip",value:function(t){return t||(t=this),t.w.globals.dom.baseEl?t.w.globals.dom.baseEl.querySelector(".apexcharts-tooltip"):null}},{key:"getElXCrosshairs",value:function(){return this.w.globals.dom.baseEl.querySelector(".apexcharts-xcrosshairs")}},{key:"getElGrid",value:function(){return this.w.globals.dom.baseEl.querySelector(".apexcharts-grid")}},{key:"drawTooltip",value:function(t){var e=this.w;this.xyRatios=t,this.isXAxisTooltipEnabled=e.config.xaxis.tooltip.enabled&&e.globals.axisCharts,this.yaxisTooltips=e.config.yaxis.map((function(t,i){return!!(t.show&&t.tooltip.enabled&&e.globals.axisCharts)})),this.allTooltipSeriesGroups=[],e.globals.axisCharts||(this.showTooltipTitle=!1);var i=document.createElement("div");if(i.classList.add("apexcharts-tooltip"),i.classList.add("apexcharts-theme-".concat(this.tConfig.theme)),e.globals.dom.elWrap.appendChild(i),e.globals.axisCharts){this.axesTooltip.drawXaxisTooltip(),this.axesTooltip.drawYaxisTooltip(),this.axesTooltip.setXCrosshairWidth(),this.axesTooltip.handleYCrosshair();var n=new q(this.ctx);this.xAxisTicksPositions=n.getXAxisTicksPositions()}if(!e.globals.comboCharts&&!this.tConfig.intersect&&"rangeBar"!==e.config.chart.type||this.tConfig.shared||(this.showOnIntersect=!0),0!==e.config.markers.size&&0!==e.globals.markers.largestSize||this.marker.drawDynamicPoints(this),e.globals.collapsedSeries.length!==e.globals.series.length){this.dataPointsDividedHeight=e.globals.gridHeight/e.globals.dataPoints,this.dataPointsDividedWidth=e.globals.gridWidth/e.globals.dataPoints,this.showTooltipTitle&&(this.tooltipTitle=document.createElement("div"),this.tooltipTitle.classList.add("apexcharts-tooltip-title"),this.tooltipTitle.style.fontFamily=this.tConfig.style.fontFamily||e.config.chart.fontFamily,this.tooltipTitle.style.fontSize=this.tConfig.style.fontSize,i.appendChild(this.tooltipTitle));var a=e.globals.series.length;(e.globals.xyCharts||e.globals.comboCharts)&&this.tConfig.shared&&(a=this.showOnIntersect?1:e.globals.series.length),this.legendLabels=e.globals.dom.baseEl.querySelectorAll(".apexcharts-legend-text"),this.ttItems=this.createTTElements(a),this.addSVGEvents()}}},{key:"createTTElements",value:function(t){for(var e=this,i=this.w,n=[],a=this.getElTooltip(),r=function(r){var s=document.createElement("div");s.classList.add("apexcharts-tooltip-series-group"),s.style.order=i.config.tooltip.inverseOrder?t-r:r+1,e.tConfig.shared&&e.tConfig.enabledOnSeries&&Array.isArray(e.tConfig.enabledOnSeries)&&e.tConfig.enabledOnSeries.indexOf(r)<0&&s.classList.add("apexcharts-tooltip-series-group-hidden");var o=document.createElement("span");o.classList.add("apexcharts-tooltip-marker"),o.style.backgroundColor=i.globals.colors[r],s.appendChild(o);var l=document.createElement("div");l.classList.add("apexcharts-tooltip-text"),l.style.fontFamily=e.tConfig.style.fontFamily||i.config.chart.fontFamily,l.style.fontSize=e.tConfig.style.fontSize,["y","goals","z"].forEach((function(t){var e=document.createElement("div");e.classList.add("apexcharts-tooltip-".concat(t,"-group"));var i=document.createElement("span");i.classList.add("apexcharts-tooltip-text-".concat(t,"-label")),e.appendChild(i);var n=document.createElement("span");n.classList.add("apexcharts-tooltip-text-".concat(t,"-value")),e.appendChild(n),l.appendChild(e)})),s.appendChild(l),a.appendChild(s),n.push(s)},s=0;s<t;s++)r(s);return n}},{key:"addSVGEvents",value:function(){var t=this.w,e=t.config.chart.type,i=this.getElTooltip(),n=!("bar"!==e&&"candlestick"!==e&&"boxPlot"!==e&&"rangeBar"!==e),a="area"===e||"line"===e||"scatter"===e||"bubble"===e||"radar"===e,r=t.globals.dom.Paper.node,s=this.getElGrid();s&&(this.seriesBound=s.getBoundingClientRect());var o,l=[],c=[],h={hoverArea:r,elGrid:s,tooltipEl:i,tooltipY:l,tooltipX:c,ttItems:this.ttItems};if(t.globals.axisCharts&&(a?o=t.globals.dom.baseEl.querySelectorAll(".apexcharts-series[data\\:longestSeries='true'] .apexcharts-marker"):n?o=t.globals.dom.baseEl.querySelectorAll(".apexcharts-series .apexcharts-bar-area, .apexcharts-series .apexcharts-candlestick-area, .apexcharts-series .apexcharts-boxPlot-area, .apexcharts-series .apexcharts-rangebar-area"):"heatmap"!==e&&"treemap"!==e||(o=t.globals.dom.baseEl.querySelectorAll(".apexcharts-series .apexcharts-heatmap, .apexcharts-series .apexcharts-treemap")),o&&o.length))for(var u=0;u<o.length;u++)l.push(o[u].getAttribute("cy")),c.push(o[u].getAttribute("cx"));if(t.globals.xyCharts&&!this.showOnIntersect||t.globals.comboCharts&&!this.showOnIntersect||n&&this.tooltipUtil.hasBars()&&this.tConfig.shared)this.addPathsEventListeners([r],h);else if(n&&!t.globals.comboCharts||a&&this.showOnIntersect)this.addDatapointEventsListeners(h);else if(!t.globals.axisCharts||"heatmap"===e||"treemap"===e){var d=t.globals.dom.baseEl.querySelectorAll(".apexcharts-series");this.addPathsEventListeners(d,h)}if(this.showOnIntersect){var f=t.globals.dom.baseEl.querySelectorAll(".apexcharts-line-series .apexcharts-marker, .apexcharts-area-series .apexcharts-marker");f.length>0&&this.addPathsEventListeners(f,h),this.tooltipUtil.hasBars()&&!this.tConfig.shared&&this.addDatapointEventsListeners(h)}}},{key:"drawFixedTooltipRect",value:function(){var t=this.w,e=this.getElTooltip(),i=e.getBoundingClientRect(),n=i.width+10,a=i.height+10,r=this.tConfig.fixed.offsetX,s=this.tConfig.fixed.offsetY,o=this.tConfig.fixed.position.toLowerCase();return o.indexOf("right")>-1&&(r=r+t.globals.svgWidth-n+10),o.indexOf("bottom")>-1&&(s=s+t.globals.svgHeight-a-10),e.style.left=r+"px",e.style.top=s+"px",{x:r,y:s,ttWidth:n,ttHeight:a}}},{key:"addDatapointEventsListeners",value:function(t){var e=this.w.globals.dom.baseEl.querySelectorAll(".apexcharts-series-markers .apexcharts-marker, .apexcharts-bar-area, .apexcharts-candlestick-area, .apexcharts-boxPlot-area, .apexcharts-rangebar-area");this.addPathsEventListeners(e,t)}},{key:"addPathsEventListeners",value:function(t,e){for(var i=this,n=function(n){var a={paths:t[n],tooltipEl:e.tooltipEl,tooltipY:e.tooltipY,tooltipX:e.tooltipX,elGrid:e.elGrid,hoverArea:e.hoverArea,ttItems:e.ttItems};["mousemove","mouseup","touchmove","mouseout","touchend"].map((function(e){return t[n].addEventListener(e,i.onSeriesHover.bind(i,a),{capture:!1,passive:!0})}))},a=0;a<t.length;a++)n(a)}},{key:"onSeriesHover",value:function(t,e){var i=this,n=Date.now()-this.lastHoverTime;n>=100?this.seriesHover(t,e):(clearTimeout(this.seriesHoverTimeout),this.seriesHoverTimeout=setTimeout((function(){i.seriesHover(t,e)}),100-n))}},{key:"seriesHover",value:function(t,e){var i=this;this.lastHoverTime=Date.now();var n=[],a=this.w;a.config.chart.group&&(n=this.ctx.getGroupedCharts()),a.globals.axisCharts&&(a.globals.minX===-1/0&&a.globals.maxX===1/0||0===a.globals.dataPoints)||(n.length?n.forEach((function(n){var a=i.getElTooltip(n),r={paths:t.paths,tooltipEl:a,tooltipY:t.tooltipY,tooltipX:t.tooltipX,elGrid:t.elGrid,hoverArea:t.hoverArea,ttItems:n.w.globals.tooltip.ttItems};n.w.globals.minX===i.w.globals.minX&&n.w.globals.maxX===i.w.globals.maxX&&n.w.globals.tooltip.seriesHoverByContext({chartCtx:n,ttCtx:n.w.globals.tooltip,opt:r,e})})):this.seriesHoverByContext({chartCtx:this.ctx,ttCtx:this.w.globals.tooltip,opt:t,e}))}},{key:"seriesHoverByContext",value:function(t){var e=t.chartCtx,i=t.ttCtx,n=t.opt,a=t.e,r=e.w,s=this.getElTooltip();s&&(i.tooltipRect={x:0,y:0,ttWidth:s.getBoundingClientRect().width,ttHeight:s.getBoundingClientRect().height},i.e=a,!i.tooltipUtil.hasBars()||r.globals.comboCharts||i.isBarShared||this.tConfig.onDatasetHover.highlightDataSeries&&new N(e).toggleSeriesOnHover(a,a.target.parentNode),i.fixedTooltip&&i.drawFixedTooltipRect(),r.globals.axisCharts?i.axisChartsTooltips({e:a,opt:n,tooltipRect:i.tooltipRect}):i.nonAxisChartsTooltips({e:a,opt:n,tooltipRect:i.tooltipRect}))}},{key:"axisChartsTooltips",value:function(t){var e,i,n=t.e,a=t.opt,r=this.w,s=a.elGrid.getBoundingClientRect(),o="touchmove"===n.type?n.touches[0].clientX:n.clientX,l="touchmove"===n.type?n.touches[0].clientY:n.clientY;if(this.clientY=l,this.clientX=o,r.globals.capturedSeriesIndex=-1,r.globals.capturedDataPointIndex=-1,l<s.top||l>s.top+s.height)this.handleMouseOut(a);else{if(Array.isArray(this.tConfig.enabledOnSeries)&&!r.config.tooltip.shared){var c=parseInt(a.paths.getAttribute("index"),10);if(this.tConfig.enabledOnSeries.indexOf(c)<0)return void this.handleMouseOut(a)}var h=this.getElTooltip(),u=this.getElXCrosshairs(),d=r.globals.xyCharts||"bar"===r.config.chart.type&&!r.globals.isBarHorizontal&&this.tooltipUtil.hasBars()&&this.tConfig.shared||r.globals.comboCharts&&this.tooltipUtil.hasBars();if("mousemove"===n.type||"touchmove"===n.type||"mouseup"===n.type){if(r.globals.collapsedSeries.length+r.globals.ancillaryCollapsedSeries.length===r.globals.series.length)return;null!==u&&u.classList.add("apexcharts-active");var f=this.yaxisTooltips.filter((function(t){return!0===t}));if(null!==this.ycrosshairs&&f.length&&this.ycrosshairs.classList.add("apexcharts-active"),d&&!this.showOnIntersect)this.handleStickyTooltip(n,o,l,a);else if("heatmap"===r.config.chart.type||"treemap"===r.config.chart.type){var g=this.intersect.handleHeatTreeTooltip({e:n,opt:a,x:e,y:i,type:r.config.chart.type});e=g.x,i=g.y,h.style.left=e+"px",h.style.top=i+"px"}else this.tooltipUtil.hasBars()&&this.intersect.handleBarTooltip({e:n,opt:a}),this.tooltipUtil.hasMarkers()&&this.intersect.handleMarkerTooltip({e:n,opt:a,x:e,y:i});if(this.yaxisTooltips.length)for(var p=0;p<r.config.yaxis.length;p++)this.axesTooltip.drawYaxisTooltipText(p,l,this.xyRatios);a.tooltipEl.classList.add("apexcharts-active")}else"mouseout"!==n.type&&"touchend"!==n.type||this.handleMouseOut(a)}}},{key:"nonAxisChartsTooltips",value:function(t){var e=t.e,i=t.opt,n=t.tooltipRect,a=this.w,r=i.paths.getAttribute("rel"),s=this.getElTooltip(),o=a.globals.dom.elWrap.getBoundingClientRect();if("mousemove"===e.type||"touchmove"===e.type){s.classList.add("apexcharts-active"),this.tooltipLabels.drawSeriesTexts({ttItems:i.ttItems,i:parseInt(r,10)-1,shared:!1});var l=a.globals.clientX-o.left-n.ttWidth/2,c=a.globals.clientY-o.top-n.ttHeight-10;if(s.style.left=l+"px",s.style.top=c+"px",a.config.legend.tooltipHoverFormatter){var h=r-1,u=(0,a.config.legend.tooltipHoverFormatter)(this.legendLabels[h].getAttribute("data:default-text"),{seriesIndex:h,dataPointIndex:h,w:a});this.legendLabels[h].innerHTML=u}}else"mouseout"!==e.type&&"touchend"!==e.type||(s.classList.remove("apexcharts-active"),a.config.legend.tooltipHoverFormatter&&this.legendLabels.forEach((function(t){var e=t.getAttribute("data:default-text");t.innerHTML=decodeURIComponent(e)})))}},{key:"handleStickyTooltip",value:function(t,e,i,n){var a=this.w,r=this.tooltipUtil.getNearestValues({context:this,hoverArea:n.hoverArea,elGrid:n.elGrid,clientX:e,clientY:i}),s=r.j,o=r.capturedSeries,l=n.elGrid.getBoundingClientRect();r.hoverX<0||r.hoverX>l.width?this.handleMouseOut(n):null!==o?this.handleStickyCapturedSeries(t,o,n,s):(this.tooltipUtil.isXoverlap(s)||a.globals.isBarHorizontal)&&this.create(t,this,0,s,n.ttItems)}},{key:"handleStickyCapturedSeries",value:function(t,e,i,n){var a=this.w;this.tConfig.shared||null!==a.globals.series[e][n]?void 0!==a.globals.series[e][n]?this.tConfig.shared&&this.tooltipUtil.isXoverlap(n)&&this.tooltipUtil.isInitialSeriesSameLen()?this.create(t,this,e,n,i.ttItems):this.create(t,this,e,n,i.ttItems,!1):this.tooltipUtil.isXoverlap(n)&&this.create(t,this,0,n,i.ttItems):this.handleMouseOut(i)}},{key:"deactivateHoverFilter",value:function(){for(var t=this.w,e=new w(this.ctx),i=t.globals.dom.Paper.select(".apexcharts-bar-area"),n=0;n<i.length;n++)e.pathMouseLeave(i[n])}},{key:"handleMouseOut",value:function(t){var e=this.w,i=this.getElXCrosshairs();if(t.tooltipEl.classList.remove("apexcharts-active"),this.deactivateHoverFilter(),"bubble"!==e.config.chart.type&&this.marker.resetPointsSize(),null!==i&&i.classList.remove("apexcharts-active"),null!==this.ycrosshairs&&this.ycrosshairs.classList.remove("apexcharts-active"),this.isXAxisTooltipEnabled&&this.xaxisTooltip.classList.remove("apexcharts-active"),this.yaxisTooltips.length){null===this.yaxisTTEls&&(this.yaxisTTEls=e.globals.dom.baseEl.querySelectorAll(".apexcharts-yaxistooltip"));for(var n=0;n<this.yaxisTTEls.length;n++)this.yaxisTTEls[n].classList.remove("apexcharts-active")}e.config.legend.tooltipHoverFormatter&&this.legendLabels.forEach((function(t){var e=t.getAttribute("data:default-text");t.innerHTML=decodeURIComponent(e)}))}},{key:"markerClick",value:function(t,e,i){var n=this.w;"function"==typeof n.config.chart.events.markerClick&&n.config.chart.events.markerClick(t,this.ctx,{seriesIndex:e,dataPointIndex:i,w:n}),this.ctx.events.fireEvent("markerClick",[t,this.ctx,{seriesIndex:e,dataPointIndex:i,w:n}])}},{key:"create",value:function(t,e,i,n,a){var r=arguments.length>5&&void 0!==arguments[5]?arguments[5]:null,s=this.w,o=e;"mouseup"===t.type&&this.markerClick(t,i,n),null===r&&(r=this.tConfig.shared);var l=this.tooltipUtil.hasMarkers(),c=this.tooltipUtil.getElBars();if(s.config.legend.tooltipHoverFormatter){var h=s.config.legend.tooltipHoverFormatter,u=Array.from(this.legendLabels);u.forEach((function(t){var e=t.getAttribute("data:default-text");t.innerHTML=decodeURIComponent(e)}));for(var d=0;d<u.length;d++){var f=u[d],g=parseInt(f.getAttribute("i"),10),p=decodeURIComponent(f.getAttribute("data:default-text")),m=h(p,{seriesIndex:r?g:i,dataPointIndex:n,w:s});if(r)f.innerHTML=s.globals.collapsedSeriesIndices.indexOf(g)<0?m:p;else if(f.innerHTML=g===i?m:p,i===g)break}}if(r){if(o.tooltipLabels.drawSeriesTexts({ttItems:a,i,j:n,shared:!this.showOnIntersect&&this.tConfig.shared}),l&&(s.globals.markers.largestSize>0?o.marker.enlargePoints(n):o.tooltipPosition.moveDynamicPointsOnHover(n)),this.tooltipUtil.hasBars()&&(this.barSeriesHeight=this.tooltipUtil.getBarsHeight(c),this.barSeriesHeight>0)){var v=new w(this.ctx),x=s.globals.dom.Paper.select(".apexcharts-bar-area[j='".concat(n,"']"));this.deactivateHoverFilter(),this.tooltipPosition.moveStickyTooltipOverBars(n);for(var b=0;b<x.length;b++)v.pathMouseEnter(x[b])}}else o.tooltipLabels.drawSeriesTexts({shared:!1,ttItems:a,i,j:n}),this.tooltipUtil.hasBars()&&o.tooltipPosition.moveStickyTooltipOverBars(n),l&&o.tooltipPosition.moveMarkers(i,n)}}]),t}(),kt=function(t){u(i,R);var e=p(i);function i(){return o(this,i),e.apply(this,arguments)}return c(i,[{key:"draw",value:function(t,e){var i=this,n=this.w;this.graphics=new w(this.ctx),this.bar=new R(this.ctx,this.xyRatios);var a=new S(this.ctx,n);t=a.getLogSeries(t),this.yRatio=a.getLogYRatios(this.yRatio),this.barHelpers.initVariables(t),"100%"===n.config.chart.stackType&&(t=n.globals.seriesPercent.slice()),this.series=t,this.totalItems=0,this.prevY=[],this.prevX=[],this.prevYF=[],this.prevXF=[],this.prevYVal=[],this.prevXVal=[],this.xArrj=[],this.xArrjF=[],this.xArrjVal=[],this.yArrj=[],this.yArrjF=[],this.yArrjVal=[];for(var s=0;s<t.length;s++)t[s].length>0&&(this.totalItems+=t[s].length);for(var o=this.graphics.group({class:"apexcharts-bar-series apexcharts-plot-series"}),l=0,c=0,h=function(a,s){var h=void 0,u=void 0,d=void 0,f=void 0,g=[],p=[],m=n.globals.comboCharts?e[a]:a;i.yRatio.length>1&&(i.yaxisIndex=m),i.isReversed=n.config.yaxis[i.yaxisIndex]&&n.config.yaxis[i.yaxisIndex].reversed;var v=i.graphics.group({class:"apexcharts-series",seriesName:x.escapeString(n.globals.seriesNames[m]),rel:a+1,"data:realIndex":m});i.ctx.series.addCollapsedClassToSeries(v,m);var b=i.graphics.group({class:"apexcharts-datalabels","data:realIndex":m}),y=0,w=0,k=i.initialPositions(l,c,h,u,d,f);c=k.y,y=k.barHeight,u=k.yDivision,f=k.zeroW,l=k.x,w=k.barWidth,h=k.xDivision,d=k.zeroH,i.yArrj=[],i.yArrjF=[],i.yArrjVal=[],i.xArrj=[],i.xArrjF=[],i.xArrjVal=[],1===i.prevY.length&&i.prevY[0].every((function(t){return isNaN(t)}))&&(i.prevY[0]=i.prevY[0].map((function(t){return d})),i.prevYF[0]=i.prevYF[0].map((function(t){return 0})));for(var A=0;A<n.globals.dataPoints;A++){var S=i.barHelpers.getStrokeWidth(a,A,m),_={indexes:{i:a,j:A,realIndex:m,bc:s},strokeWidth:S,x:l,y:c,elSeries:v},C=null;i.isHorizontal?(C=i.drawStackedBarPaths(r(r({},_),{},{zeroW:f,barHeight:y,yDivision:u})),w=i.series[a][A]/i.invertedYRatio):(C=i.drawStackedColumnPaths(r(r({},_),{},{xDivision:h,barWidth:w,zeroH:d})),y=i.series[a][A]/i.yRatio[i.yaxisIndex]),c=C.y,l=C.x,g.push(l),p.push(c);var E=i.barHelpers.getPathFillColor(t,a,A,m);v=i.renderSeries({realIndex:m,pathFill:E,j:A,i:a,pathFrom:C.pathFrom,pathTo:C.pathTo,strokeWidth:S,elSeries:v,x:l,y:c,series:t,barHeight:y,barWidth:w,elDataLabelsWrap:b,type:"bar",visibleSeries:0})}n.globals.seriesXvalues[m]=g,n.globals.seriesYvalues[m]=p,i.prevY.push(i.yArrj),i.prevYF.push(i.yArrjF),i.prevYVal.push(i.yArrjVal),i.prevX.push(i.xArrj),i.prevXF.push(i.xArrjF),i.prevXVal.push(i.xArrjVal),o.add(v)},u=0,d=0;u<t.length;u++,d++)h(u,d);return o}},{key:"initialPositions",value:function(t,e,i,n,a,r){var s,o,l=this.w;return this.isHorizontal?(s=(s=n=l.globals.gridHeight/l.globals.dataPoints)*parseInt(l.config.plotOptions.bar.barHeight,10)/100,r=this.baseLineInvertedY+l.globals.padHorizontal+(this.isReversed?l.globals.gridWidth:0)-(this.isReversed?2*this.baseLineInvertedY:0),e=(n-s)/2):(o=i=l.globals.gridWidth/l.globals.dataPoints,o=l.globals.isXNumeric&&l.globals.dataPoints>1?(i=l.globals.minXDiff/this.xRatio)*parseInt(this.barOptions.columnWidth,10)/100:o*parseInt(l.config.plotOptions.bar.columnWidth,10)/100,a=this.baseLineY[this.yaxisIndex]+(this.isReversed?l.globals.gridHeight:0)-(this.isReversed?2*this.baseLineY[this.yaxisIndex]:0),t=l.globals.padHorizontal+(i-o)/2),{x:t,y:e,yDivision:n,xDivision:i,barHeight:s,barWidth:o,zeroH:a,zeroW:r}}},{key:"drawStackedBarPaths",value:function(t){for(var e,i=t.indexes,n=t.barHeight,a=t.strokeWidth,r=t.zeroW,s=t.x,o=t.y,l=t.yDivision,c=t.elSeries,h=this.w,u=o,d=i.i,f=i.j,g=0,p=0;p<this.prevXF.length;p++)g+=this.prevXF[p][f];if(d>0){var m=r;this.prevXVal[d-1][f]<0?m=this.series[d][f]>=0?this.prevX[d-1][f]+g-2*(this.isReversed?g:0):this.prevX[d-1][f]:this.prevXVal[d-1][f]>=0&&(m=this.series[d][f]>=0?this.prevX[d-1][f]:this.prevX[d-1][f]-g+2*(this.isReversed?g:0)),e=m}else e=r;s=null===this.series[d][f]?e:e+this.series[d][f]/this.invertedYRatio-2*(this.isReversed?this.series[d][f]/this.invertedYRatio:0);var v=this.barHelpers.getBarpaths({barYPosition:u,barHeight:n,x1:e,x2:s,strokeWidth:a,series:this.series,realIndex:i.realIndex,i:d,j:f,w:h});return this.barHelpers.barBackground({j:f,i:d,y1:u,y2:n,elSeries:c}),o+=l,{pathTo:v.pathTo,pathFrom:v.pathFrom,x:s,y:o}}},{key:"drawStackedColumnPaths",value:function(t){var e=t.indexes,i=t.x,n=t.y,a=t.xDivision,r=t.barWidth,s=t.zeroH;t.strokeWidth;var o=t.elSeries,l=this.w,c=e.i,h=e.j,u=e.bc;if(l.globals.isXNumeric){var d=l.globals.seriesX[c][h];d||(d=0),i=(d-l.globals.minX)/this.xRatio-r/2}for(var f,g=i,p=0,m=0;m<this.prevYF.length;m++)p+=isNaN(this.prevYF[m][h])?0:this.prevYF[m][h];if(c>0&&!l.globals.isXNumeric||c>0&&l.globals.isXNumeric&&l.globals.seriesX[c-1][h]===l.globals.seriesX[c][h]){var v,x,b=Math.min(this.yRatio.length+1,c+1);if(void 0!==this.prevY[c-1])for(var y=1;y<b;y++)if(!isNaN(this.prevY[c-y][h])){x=this.prevY[c-y][h];break}for(var w=1;w<b;w++){if(this.prevYVal[c-w][h]<0){v=this.series[c][h]>=0?x-p+2*(this.isReversed?p:0):x;break}if(this.prevYVal[c-w][h]>=0){v=this.series[c][h]>=0?x:x+p-2*(this.isReversed?p:0);break}}void 0===v&&(v=l.globals.gridHeight),f=this.prevYF[0].every((function(t){return 0===t}))&&this.prevYF.slice(1,c).every((function(t){return t.every((function(t){return isNaN(t)}))}))?l.globals.gridHeight-s:v}else f=l.globals.gridHeight-s;n=f-this.series[c][h]/this.yRatio[this.yaxisIndex]+2*(this.isReversed?this.series[c][h]/this.yRatio[this.yaxisIndex]:0);var k=this.barHelpers.getColumnPaths({barXPosition:g,barWidth:r,y1:f,y2:n,yRatio:this.yRatio[this.yaxisIndex],strokeWidth:this.strokeWidth,series:this.series,realIndex:e.realIndex,i:c,j:h,w:l});return this.barHelpers.barBackground({bc:u,j:h,i:c,x1:g,x2:r,elSeries:o}),i+=a,{pathTo:k.pathTo,pathFrom:k.pathFrom,x:l.globals.isXNumeric?i-a:i,y:n}}}]),i}(),At=function(t){u(i,R);var e=p(i);function i(){return o(this,i),e.apply(this,arguments)}return c(i,[{key:"draw",value:function(t,e){var i=this,n=this.w,a=new w(this.ctx),s=new M(this.ctx);this.candlestickOptions=this.w.config.plotOptions.candlestick,this.boxOptions=this.w.config.plotOptions.boxPlot,this.isHorizontal=n.config.plotOptions.bar.horizontal;var o=new S(this.ctx,n);t=o.getLogSeries(t),this.series=t,this.yRatio=o.getLogYRatios(this.yRatio),this.barHelpers.initVariables(t);for(var l=a.group({class:"apexcharts-".concat(n.config.chart.type,"-series apexcharts-plot-series")}),c=function(o){i.isBoxPlot="boxPlot"===n.config.chart.type||"boxPlot"===n.config.series[o].type;var c,h,u,d,f,g,p=void 0,m=void 0,v=[],b=[],y=n.globals.comboCharts?e[o]:o,w=a.group({class:"apexcharts-series",seriesName:x.escapeString(n.globals.seriesNames[y]),rel:o+1,"data:realIndex":y});i.ctx.series.addCollapsedClassToSeries(w,y),t[o].length>0&&(i.visibleI=i.visibleI+1),i.yRatio.length>1&&(i.yaxisIndex=y);var k=i.barHelpers.initialPositions();m=k.y,f=k.barHeight,h=k.yDivision,d=k.zeroW,p=k.x,g=k.barWidth,c=k.xDivision,u=k.zeroH,b.push(p+g/2);for(var A=a.group({class:"apexcharts-datalabels","data:realIndex":y}),S=function(e){var a=i.barHelpers.getStrokeWidth(o,e,y),l=null,x={indexes:{i:o,j:e,realIndex:y},x:p,y:m,strokeWidth:a,elSeries:w};l=i.isHorizontal?i.drawHorizontalBoxPaths(r(r({},x),{},{yDivision:h,barHeight:f,zeroW:d})):i.drawVerticalBoxPaths(r(r({},x),{},{xDivision:c,barWidth:g,zeroH:u})),m=l.y,p=l.x,e>0&&b.push(p+g/2),v.push(m),l.pathTo.forEach((function(r,c){var h=!i.isBoxPlot&&i.candlestickOptions.wick.useFillColor?l.color[c]:n.globals.stroke.colors[o],u=s.fillPath({seriesNumber:y,dataPointIndex:e,color:l.color[c],value:t[o][e]});i.renderSeries({realIndex:y,pathFill:u,lineFill:h,j:e,i:o,pathFrom:l.pathFrom,pathTo:r,strokeWidth:a,elSeries:w,x:p,y:m,series:t,barHeight:f,barWidth:g,elDataLabelsWrap:A,visibleSeries:i.visibleI,type:n.config.chart.type})}))},_=0;_<n.globals.dataPoints;_++)S(_);n.globals.seriesXvalues[y]=b,n.globals.seriesYvalues[y]=v,l.add(w)},h=0;h<t.length;h++)c(h);return l}},{key:"drawVerticalBoxPaths",value:function(t){var e=t.indexes,i=t.x;t.y;var n=t.xDivision,a=t.barWidth,r=t.zeroH,s=t.strokeWidth,o=this.w,l=new w(this.ctx),c=e.i,h=e.j,u=!0,d=o.config.plotOptions.candlestick.colors.upward,f=o.config.plotOptions.candlestick.colors.downward,g="";this.isBoxPlot&&(g=[this.boxOptions.colors.lower,this.boxOptions.colors.upper]);var p=this.yRatio[this.yaxisIndex],m=e.realIndex,v=this.getOHLCValue(m,h),x=r,b=r;v.o>v.c&&(u=!1);var y=Math.min(v.o,v.c),k=Math.max(v.o,v.c),A=v.m;o.globals.isXNumeric&&(i=(o.globals.seriesX[m][h]-o.globals.minX)/this.xRatio-a/2);var S=i+a*this.visibleI;void 0===this.series[c][h]||null===this.series[c][h]?(y=r,k=r):(y=r-y/p,k=r-k/p,x=r-v.h/p,b=r-v.l/p,A=r-v.m/p);var _=l.move(S,r),C=l.move(S+a/2,y);return o.globals.previousPaths.length>0&&(C=this.getPreviousPath(m,h,!0)),_=this.isBoxPlot?[l.move(S,y)+l.line(S+a/2,y)+l.line(S+a/2,x)+l.line(S+a/4,x)+l.line(S+a-a/4,x)+l.line(S+a/2,x)+l.line(S+a/2,y)+l.line(S+a,y)+l.line(S+a,A)+l.line(S,A)+l.line(S,y+s/2),l.move(S,A)+l.line(S+a,A)+l.line(S+a,k)+l.line(S+a/2,k)+l.line(S+a/2,b)+l.line(S+a-a/4,b)+l.line(S+a/4,b)+l.line(S+a/2,b)+l.line(S+a/2,k)+l.line(S,k)+l.line(S,A)+"z"]:[l.move(S,k)+l.line(S+a/2,k)+l.line(S+a/2,x)+l.line(S+a/2,k)+l.line(S+a,k)+l.line(S+a,y)+l.line(S+a/2,y)+l.line(S+a/2,b)+l.line(S+a/2,y)+l.line(S,y)+l.line(S,k-s/2)],C+=l.move(S,y),o.globals.isXNumeric||(i+=n),{pathTo:_,pathFrom:C,x:i,y:k,barXPosition:S,color:this.isBoxPlot?g:u?[d]:[f]}}},{key:"drawHorizontalBoxPaths",value:function(t){var e=t.indexes;t.x;var i=t.y,n=t.yDivision,a=t.barHeight,r=t.zeroW,s=t.strokeWidth,o=this.w,l=new w(this.ctx),c=e.i,h=e.j,u=this.boxOptions.colors.lower;this.isBoxPlot&&(u=[this.boxOptions.colors.lower,this.boxOptions.colors.upper]);var d=this.invertedYRatio,f=e.realIndex,g=this.getOHLCValue(f,h),p=r,m=r,v=Math.min(g.o,g.c),x=Math.max(g.o,g.c),b=g.m;o.globals.isXNumeric&&(i=(o.globals.seriesX[f][h]-o.globals.minX)/this.invertedXRatio-a/2);var y=i+a*this.visibleI;void 0===this.series[c][h]||null===this.series[c][h]?(v=r,x=r):(v=r+v/d,x=r+x/d,p=r+g.h/d,m=r+g.l/d,b=r+g.m/d);var k=l.move(r,y),A=l.move(v,y+a/2);return o.globals.previousPaths.length>0&&(A=this.getPreviousPath(f,h,!0)),k=[l.move(v,y)+l.line(v,y+a/2)+l.line(p,y+a/2)+l.line(p,y+a/2-a/4)+l.line(p,y+a/2+a/4)+l.line(p,y+a/2)+l.line(v,y+a/2)+l.line(v,y+a)+l.line(b,y+a)+l.line(b,y)+l.line(v+s/2,y),l.move(b,y)+l.line(b,y+a)+l.line(x,y+a)+l.line(x,y+a/2)+l.line(m,y+a/2)+l.line(m,y+a-a/4)+l.line(m,y+a/4)+l.line(m,y+a/2)+l.line(x,y+a/2)+l.line(x,y)+l.line(b,y)+"z"],A+=l.move(v,y),o.globals.isXNumeric||(i+=n),{pathTo:k,pathFrom:A,x,y:i,barYPosition:y,color:u}}},{key:"getOHLCValue",value:function(t,e){var i=this.w;return{o:this.isBoxPlot?i.globals.seriesCandleH[t][e]:i.globals.seriesCandleO[t][e],h:this.isBoxPlot?i.globals.seriesCandleO[t][e]:i.globals.seriesCandleH[t][e],m:i.globals.seriesCandleM[t][e],l:this.isBoxPlot?i.globals.seriesCandleC[t][e]:i.globals.seriesCandleL[t][e],c:this.isBoxPlot?i.globals.seriesCandleL[t][e]:i.globals.seriesCandleC[t][e]}}}]),i}(),St=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w}return c(t,[{key:"checkColorRange",value:function(){var t=this.w,e=!1,i=t.config.plotOptions[t.config.chart.type];return i.colorScale.ranges.length>0&&i.colorScale.ranges.map((function(t,i){t.from<=0&&(e=!0)})),e}},{key:"getShadeColor",value:function(t,e,i,n){var a=this.w,r=1,s=a.config.plotOptions[t].shadeIntensity,o=this.determineColor(t,e,i);a.globals.hasNegs||n?r=a.config.plotOptions[t].reverseNegativeShade?o.percent<0?o.percent/100*(1.25*s):(1-o.percent/100)*(1.25*s):o.percent<=0?1-(1+o.percent/100)*s:(1-o.percent/100)*s:(r=1-o.percent/100,"treemap"===t&&(r=(1-o.percent/100)*(1.25*s)));var l=o.color,c=new x;return a.config.plotOptions[t].enableShades&&(l="dark"===this.w.config.theme.mode?x.hexToRgba(c.shadeColor(-1*r,o.color),a.config.fill.opacity):x.hexToRgba(c.shadeColor(r,o.color),a.config.fill.opacity)),{color:l,colorProps:o}}},{key:"determineColor",value:function(t,e,i){var n=this.w,a=n.globals.series[e][i],r=n.config.plotOptions[t],s=r.colorScale.inverse?i:e;r.distributed&&"treemap"===n.config.chart.type&&(s=i);var o=n.globals.colors[s],l=null,c=Math.min.apply(Math,m(n.globals.series[e])),h=Math.max.apply(Math,m(n.globals.series[e]));r.distributed||"heatmap"!==t||(c=n.globals.minY,h=n.globals.maxY),void 0!==r.colorScale.min&&(c=r.colorScale.min<n.globals.minY?r.colorScale.min:n.globals.minY,h=r.colorScale.max>n.globals.maxY?r.colorScale.max:n.globals.maxY);var u=Math.abs(h)+Math.abs(c),d=100*a/(0===u?u-1e-6:u);return r.colorScale.ranges.length>0&&r.colorScale.ranges.map((function(t,e){if(a>=t.from&&a<=t.to){o=t.color,l=t.foreColor?t.foreColor:null,c=t.from,h=t.to;var i=Math.abs(h)+Math.abs(c);d=100*a/(0===i?i-1e-6:i)}})),{color:o,foreColor:l,percent:d}}},{key:"calculateDataLabels",value:function(t){var e=t.text,i=t.x,n=t.y,a=t.i,r=t.j,s=t.colorProps,o=t.fontSize,l=this.w.config.dataLabels,c=new w(this.ctx),h=new I(this.ctx),u=null;if(l.enabled){u=c.group({class:"apexcharts-data-labels"});var d=l.offsetX,f=l.offsetY,g=i+d,p=n+parseFloat(l.style.fontSize)/3+f;h.plotDataLabelsText({x:g,y:p,text:e,i:a,j:r,color:s.foreColor,parent:u,fontSize:o,dataLabelsConfig:l})}return u}},{key:"addListeners",value:function(t){var e=new w(this.ctx);t.node.addEventListener("mouseenter",e.pathMouseEnter.bind(this,t)),t.node.addEventListener("mouseleave",e.pathMouseLeave.bind(this,t)),t.node.addEventListener("mousedown",e.pathMouseDown.bind(this,t))}}]),t}(),_t=function(){function t(e,i){o(this,t),this.ctx=e,this.w=e.w,this.xRatio=i.xRatio,this.yRatio=i.yRatio,this.dynamicAnim=this.w.config.chart.animations.dynamicAnimation,this.helpers=new St(e),this.rectRadius=this.w.config.plotOptions.heatmap.radius,this.strokeWidth=this.w.config.stroke.show?this.w.config.stroke.width:0}return c(t,[{key:"draw",value:function(t){var e=this.w,i=new w(this.ctx),n=i.group({class:"apexcharts-heatmap"});n.attr("clip-path","url(#gridRectMask".concat(e.globals.cuid,")"));var a=e.globals.gridWidth/e.globals.dataPoints,r=e.globals.gridHeight/e.globals.series.length,s=0,o=!1;this.negRange=this.helpers.checkColorRange();var l=t.slice();e.config.yaxis[0].reversed&&(o=!0,l.reverse());for(var c=o?0:l.length-1;o?c<l.length:c>=0;o?c++:c--){var h=i.group({class:"apexcharts-series apexcharts-heatmap-series",seriesName:x.escapeString(e.globals.seriesNames[c]),rel:c+1,"data:realIndex":c});if(this.ctx.series.addCollapsedClassToSeries(h,c),e.config.chart.dropShadow.enabled){var u=e.config.chart.dropShadow;new y(this.ctx).dropShadow(h,u,c)}for(var d=0,f=e.config.plotOptions.heatmap.shadeIntensity,g=0;g<l[c].length;g++){var p=this.helpers.getShadeColor(e.config.chart.type,c,g,this.negRange),m=p.color,v=p.colorProps;"image"===e.config.fill.type&&(m=new M(this.ctx).fillPath({seriesNumber:c,dataPointIndex:g,opacity:e.globals.hasNegs?v.percent<0?1-(1+v.percent/100):f+v.percent/100:v.percent/100,patternID:x.randomId(),width:e.config.fill.image.width?e.config.fill.image.width:a,height:e.config.fill.image.height?e.config.fill.image.height:r}));var b=this.rectRadius,k=i.drawRect(d,s,a,r,b);if(k.attr({cx:d,cy:s}),k.node.classList.add("apexcharts-heatmap-rect"),h.add(k),k.attr({fill:m,i:c,index:c,j:g,val:l[c][g],"stroke-width":this.strokeWidth,stroke:e.config.plotOptions.heatmap.useFillColorAsStroke?m:e.globals.stroke.colors[0],color:m}),this.helpers.addListeners(k),e.config.chart.animations.enabled&&!e.globals.dataChanged){var A=1;e.globals.resized||(A=e.config.chart.animations.speed),this.animateHeatMap(k,d,s,a,r,A)}if(e.globals.dataChanged){var S=1;if(this.dynamicAnim.enabled&&e.globals.shouldAnimate){S=this.dynamicAnim.speed;var _=e.globals.previousPaths[c]&&e.globals.previousPaths[c][g]&&e.globals.previousPaths[c][g].color;_||(_="rgba(255, 255, 255, 0)"),this.animateHeatColor(k,x.isColorHex(_)?_:x.rgb2hex(_),x.isColorHex(m)?m:x.rgb2hex(m),S)}}var C=(0,e.config.dataLabels.formatter)(e.globals.series[c][g],{value:e.globals.series[c][g],seriesIndex:c,dataPointIndex:g,w:e}),E=this.helpers.calculateDataLabels({text:C,x:d+a/2,y:s+r/2,i:c,j:g,colorProps:v,series:l});null!==E&&h.add(E),d+=a}s+=r,n.add(h)}var T=e.globals.yAxisScale[0].result.slice();e.config.yaxis[0].reversed?T.unshift(""):T.push(""),e.globals.yAxisScale[0].result=T;var P=e.globals.gridHeight/e.globals.series.length;return e.config.yaxis[0].labels.offsetY=-P/2,n}},{key:"animateHeatMap",value:function(t,e,i,n,a,r){var s=new b(this.ctx);s.animateRect(t,{x:e+n/2,y:i+a/2,width:0,height:0},{x:e,y:i,width:n,height:a},r,(function(){s.animationCompleted(t)}))}},{key:"animateHeatColor",value:function(t,e,i,n){t.attr({fill:e}).animate(n).attr({fill:i})}}]),t}(),Ct=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w}return c(t,[{key:"drawYAxisTexts",value:function(t,e,i,n){var a=this.w,r=a.config.yaxis[0],s=a.globals.yLabelFormatters[0];return new w(this.ctx).drawText({x:t+r.labels.offsetX,y:e+r.labels.offsetY,text:s(n,i),textAnchor:"middle",fontSize:r.labels.style.fontSize,fontFamily:r.labels.style.fontFamily,foreColor:Array.isArray(r.labels.style.colors)?r.labels.style.colors[i]:r.labels.style.colors})}}]),t}(),Et=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w;var i=this.w;this.chartType=this.w.config.chart.type,this.initialAnim=this.w.config.chart.animations.enabled,this.dynamicAnim=this.initialAnim&&this.w.config.chart.animations.dynamicAnimation.enabled,this.animBeginArr=[0],this.animDur=0,this.donutDataLabels=this.w.config.plotOptions.pie.donut.labels,this.lineColorArr=void 0!==i.globals.stroke.colors?i.globals.stroke.colors:i.globals.colors,this.defaultSize=Math.min(i.globals.gridWidth,i.globals.gridHeight),this.centerY=this.defaultSize/2,this.centerX=i.globals.gridWidth/2,"radialBar"===i.config.chart.type?this.fullAngle=360:this.fullAngle=Math.abs(i.config.plotOptions.pie.endAngle-i.config.plotOptions.pie.startAngle),this.initialAngle=i.config.plotOptions.pie.startAngle%this.fullAngle,i.globals.radialSize=this.defaultSize/2.05-i.config.stroke.width-(i.config.chart.sparkline.enabled?0:i.config.chart.dropShadow.blur),this.donutSize=i.globals.radialSize*parseInt(i.config.plotOptions.pie.donut.size,10)/100,this.maxY=0,this.sliceLabels=[],this.sliceSizes=[],this.prevSectorAngleArr=[]}return c(t,[{key:"draw",value:function(t){var e=this,i=this.w,n=new w(this.ctx);if(this.ret=n.group({class:"apexcharts-pie"}),i.globals.noData)return this.ret;for(var a=0,r=0;r<t.length;r++)a+=x.negToZero(t[r]);var s=[],o=n.group();0===a&&(a=1e-5),t.forEach((function(t){e.maxY=Math.max(e.maxY,t)})),i.config.yaxis[0].max&&(this.maxY=i.config.yaxis[0].max),"back"===i.config.grid.position&&"polarArea"===this.chartType&&this.drawPolarElements(this.ret);for(var l=0;l<t.length;l++){var c=this.fullAngle*x.negToZero(t[l])/a;s.push(c),"polarArea"===this.chartType?(s[l]=this.fullAngle/t.length,this.sliceSizes.push(i.globals.radialSize*t[l]/this.maxY)):this.sliceSizes.push(i.globals.radialSize)}if(i.globals.dataChanged){for(var h,u=0,d=0;d<i.globals.previousPaths.length;d++)u+=x.negToZero(i.globals.previousPaths[d]);for(var f=0;f<i.globals.previousPaths.length;f++)h=this.fullAngle*x.negToZero(i.globals.previousPaths[f])/u,this.prevSectorAngleArr.push(h)}this.donutSize<0&&(this.donutSize=0);var g=i.config.plotOptions.pie.customScale,p=i.globals.gridWidth/2,m=i.globals.gridHeight/2,v=p-i.globals.gridWidth/2*g,b=m-i.globals.gridHeight/2*g;if("donut"===this.chartType){var y=n.drawCircle(this.donutSize);y.attr({cx:this.centerX,cy:this.centerY,fill:i.config.plotOptions.pie.donut.background?i.config.plotOptions.pie.donut.background:"transparent"}),o.add(y)}var k=this.drawArcs(s,t);if(this.sliceLabels.forEach((function(t){k.add(t)})),o.attr({transform:"translate(".concat(v,", ").concat(b,") scale(").concat(g,")")}),o.add(k),this.ret.add(o),this.donutDataLabels.show){var A=this.renderInnerDataLabels(this.donutDataLabels,{hollowSize:this.donutSize,centerX:this.centerX,centerY:this.centerY,opacity:this.donutDataLabels.show,translateX:v,translateY:b});this.ret.add(A)}return"front"===i.config.grid.position&&"polarArea"===this.chartType&&this.drawPolarElements(this.ret),this.ret}},{key:"drawArcs",value:function(t,e){var i=this.w,n=new y(this.ctx),a=new w(this.ctx),r=new M(this.ctx),s=a.group({class:"apexcharts-slices"}),o=this.initialAngle,l=this.initialAngle,c=this.initialAngle,h=this.initialAngle;this.strokeWidth=i.config.stroke.show?i.config.stroke.width:0;for(var u=0;u<t.length;u++){var d=a.group({class:"apexcharts-series apexcharts-pie-series",seriesName:x.escapeString(i.globals.seriesNames[u]),rel:u+1,"data:realIndex":u});s.add(d),l=h,c=(o=c)+t[u],h=l+this.prevSectorAngleArr[u];var f=c<o?this.fullAngle+c-o:c-o,g=r.fillPath({seriesNumber:u,size:this.sliceSizes[u],value:e[u]}),p=this.getChangedPath(l,h),m=a.drawPath({d:p,stroke:Array.isArray(this.lineColorArr)?this.lineColorArr[u]:this.lineColorArr,strokeWidth:0,fill:g,fillOpacity:i.config.fill.opacity,classes:"apexcharts-pie-area apexcharts-".concat(this.chartType.toLowerCase(),"-slice-").concat(u)});if(m.attr({index:0,j:u}),n.setSelectionFilter(m,0,u),i.config.chart.dropShadow.enabled){var v=i.config.chart.dropShadow;n.dropShadow(m,v,u)}this.addListeners(m,this.donutDataLabels),w.setAttrs(m.node,{"data:angle":f,"data:startAngle":o,"data:strokeWidth":this.strokeWidth,"data:value":e[u]});var b={x:0,y:0};"pie"===this.chartType||"polarArea"===this.chartType?b=x.polarToCartesian(this.centerX,this.centerY,i.globals.radialSize/1.25+i.config.plotOptions.pie.dataLabels.offset,(o+f/2)%this.fullAngle):"donut"===this.chartType&&(b=x.polarToCartesian(this.centerX,this.centerY,(i.globals.radialSize+this.donutSize)/2+i.config.plotOptions.pie.dataLabels.offset,(o+f/2)%this.fullAngle)),d.add(m);var k=0;if(!this.initialAnim||i.globals.resized||i.globals.dataChanged?this.animBeginArr.push(0):(0==(k=f/this.fullAngle*i.config.chart.animations.speed)&&(k=1),this.animDur=k+this.animDur,this.animBeginArr.push(this.animDur)),this.dynamicAnim&&i.globals.dataChanged?this.animatePaths(m,{size:this.sliceSizes[u],endAngle:c,startAngle:o,prevStartAngle:l,prevEndAngle:h,animateStartingPos:!0,i:u,animBeginArr:this.animBeginArr,shouldSetPrevPaths:!0,dur:i.config.chart.animations.dynamicAnimation.speed}):this.animatePaths(m,{size:this.sliceSizes[u],endAngle:c,startAngle:o,i:u,totalItems:t.length-1,animBeginArr:this.animBeginArr,dur:k}),i.config.plotOptions.pie.expandOnClick&&"polarArea"!==this.chartType&&m.click(this.pieClicked.bind(this,u)),void 0!==i.globals.selectedDataPoints[0]&&i.globals.selectedDataPoints[0].indexOf(u)>-1&&this.pieClicked(u),i.config.dataLabels.enabled){var A=b.x,S=b.y,_=100*f/this.fullAngle+"%";if(0!==f&&i.config.plotOptions.pie.dataLabels.minAngleToShowLabel<t[u]){var C=i.config.dataLabels.formatter;void 0!==C&&(_=C(i.globals.seriesPercent[u][0],{seriesIndex:u,w:i}));var E=i.globals.dataLabels.style.colors[u],T=a.group({class:"apexcharts-datalabels"}),P=a.drawText({x:A,y:S,text:_,textAnchor:"middle",fontSize:i.config.dataLabels.style.fontSize,fontFamily:i.config.dataLabels.style.fontFamily,fontWeight:i.config.dataLabels.style.fontWeight,foreColor:E});if(T.add(P),i.config.dataLabels.dropShadow.enabled){var L=i.config.dataLabels.dropShadow;n.dropShadow(P,L)}P.node.classList.add("apexcharts-pie-label"),i.config.chart.animations.animate&&!1===i.globals.resized&&(P.node.classList.add("apexcharts-pie-label-delay"),P.node.style.animationDelay=i.config.chart.animations.speed/940+"s"),this.sliceLabels.push(T)}}}return s}},{key:"addListeners",value:function(t,e){var i=new w(this.ctx);t.node.addEventListener("mouseenter",i.pathMouseEnter.bind(this,t)),t.node.addEventListener("mouseleave",i.pathMouseLeave.bind(this,t)),t.node.addEventListener("mouseleave",this.revertDataLabelsInner.bind(this,t.node,e)),t.node.addEventListener("mousedown",i.pathMouseDown.bind(this,t)),this.donutDataLabels.total.showAlways||(t.node.addEventListener("mouseenter",this.printDataLabelsInner.bind(this,t.node,e)),t.node.addEventListener("mousedown",this.printDataLabelsInner.bind(this,t.node,e)))}},{key:"animatePaths",value:function(t,e){var i=this.w,n=e.endAngle<e.startAngle?this.fullAngle+e.endAngle-e.startAngle:e.endAngle-e.startAngle,a=n,r=e.startAngle,s=e.startAngle;void 0!==e.prevStartAngle&&void 0!==e.prevEndAngle&&(r=e.prevEndAngle,a=e.prevEndAngle<e.prevStartAngle?this.fullAngle+e.prevEndAngle-e.prevStartAngle:e.prevEndAngle-e.prevStartAngle),e.i===i.config.series.length-1&&(n+s>this.fullAngle?e.endAngle=e.endAngle-(n+s):n+s<this.fullAngle&&(e.endAngle=e.endAngle+(this.fullAngle-(n+s)))),n===this.fullAngle&&(n=this.fullAngle-.01),this.animateArc(t,r,s,n,a,e)}},{key:"animateArc",value:function(t,e,i,n,a,r){var s,o=this,l=this.w,c=new b(this.ctx),h=r.size;(isNaN(e)||isNaN(a))&&(e=i,a=n,r.dur=0);var u=n,d=i,f=e<i?this.fullAngle+e-i:e-i;l.globals.dataChanged&&r.shouldSetPrevPaths&&r.prevEndAngle&&(s=o.getPiePath({me:o,startAngle:r.prevStartAngle,angle:r.prevEndAngle<r.prevStartAngle?this.fullAngle+r.prevEndAngle-r.prevStartAngle:r.prevEndAngle-r.prevStartAngle,size:h}),t.attr({d:s})),0!==r.dur?t.animate(r.dur,l.globals.easing,r.animBeginArr[r.i]).afterAll((function(){"pie"!==o.chartType&&"donut"!==o.chartType&&"polarArea"!==o.chartType||this.animate(l.config.chart.animations.dynamicAnimation.speed).attr({"stroke-width":o.strokeWidth}),r.i===l.config.series.length-1&&c.animationCompleted(t)})).during((function(l){u=f+(n-f)*l,r.animateStartingPos&&(u=a+(n-a)*l,d=e-a+(i-(e-a))*l),s=o.getPiePath({me:o,startAngle:d,angle:u,size:h}),t.node.setAttribute("data:pathOrig",s),t.attr({d:s})})):(s=o.getPiePath({me:o,startAngle:d,angle:n,size:h}),r.isTrack||(l.globals.animationEnded=!0),t.node.setAttribute("data:pathOrig",s),t.attr({d:s,"stroke-width":o.strokeWidth}))}},{key:"pieClicked",value:function(t){var e,i=this.w,n=this,a=n.sliceSizes[t]+(i.config.plotOptions.pie.expandOnClick?4:0),r=i.globals.dom.Paper.select(".apexcharts-".concat(n.chartType.toLowerCase(),"-slice-").concat(t)).members[0];if("true"!==r.attr("data:pieClicked")){var s=i.globals.dom.baseEl.getElementsByClassName("apexcharts-pie-area");Array.prototype.forEach.call(s,(function(t){t.setAttribute("data:pieClicked","false");var e=t.getAttribute("data:pathOrig");t.setAttribute("d",e)})),r.attr("data:pieClicked","true");var o=parseInt(r.attr("data:startAngle"),10),l=parseInt(r.attr("data:angle"),10);e=n.getPiePath({me:n,startAngle:o,angle:l,size:a}),360!==l&&r.plot(e)}else{r.attr({"data:pieClicked":"false"}),this.revertDataLabelsInner(r.node,this.donutDataLabels);var c=r.attr("data:pathOrig");r.attr({d:c})}}},{key:"getChangedPath",value:function(t,e){var i="";return this.dynamicAnim&&this.w.globals.dataChanged&&(i=this.getPiePath({me:this,startAngle:t,angle:e-t,size:this.size})),i}},{key:"getPiePath",value:function(t){var e=t.me,i=t.startAngle,n=t.angle,a=t.size,r=i,s=Math.PI*(r-90)/180,o=n+i;Math.ceil(o)>=this.fullAngle+this.w.config.plotOptions.pie.startAngle%this.fullAngle&&(o=this.fullAngle+this.w.config.plotOptions.pie.startAngle%this.fullAngle-.01),Math.ceil(o)>this.fullAngle&&(o-=this.fullAngle);var l=Math.PI*(o-90)/180,c=e.centerX+a*Math.cos(s),h=e.centerY+a*Math.sin(s),u=e.centerX+a*Math.cos(l),d=e.centerY+a*Math.sin(l),f=x.polarToCartesian(e.centerX,e.centerY,e.donutSize,o),g=x.polarToCartesian(e.centerX,e.centerY,e.donutSize,r),p=n>180?1:0,m=["M",c,h,"A",a,a,0,p,1,u,d];return"donut"===e.chartType?[].concat(m,["L",f.x,f.y,"A",e.donutSize,e.donutSize,0,p,0,g.x,g.y,"L",c,h,"z"]).join(" "):"pie"===e.chartType||"polarArea"===e.chartType?[].concat(m,["L",e.centerX,e.centerY,"L",c,h]).join(" "):[].concat(m).join(" ")}},{key:"drawPolarElements",value:function(t){var e=this.w,i=new Z(this.ctx),n=new w(this.ctx),a=new Ct(this.ctx),r=n.group(),s=n.group(),o=i.niceScale(0,Math.ceil(this.maxY),e.config.yaxis[0].tickAmount,0,!0),l=o.result.reverse(),c=o.result.length;this.maxY=o.niceMax;for(var h=e.globals.radialSize,u=h/(c-1),d=0;d<c-1;d++){var f=n.drawCircle(h);if(f.attr({cx:this.centerX,cy:this.centerY,fill:"none","stroke-width":e.config.plotOptions.polarArea.rings.strokeWidth,stroke:e.config.plotOptions.polarArea.rings.strokeColor}),e.config.yaxis[0].show){var g=a.drawYAxisTexts(this.centerX,this.centerY-h+parseInt(e.config.yaxis[0].labels.style.fontSize,10)/2,d,l[d]);s.add(g)}r.add(f),h-=u}this.drawSpokes(t),t.add(r),t.add(s)}},{key:"renderInnerDataLabels",value:function(t,e){var i=this.w,n=new w(this.ctx),a=n.group({class:"apexcharts-datalabels-group",transform:"translate(".concat(e.translateX?e.translateX:0,", ").concat(e.translateY?e.translateY:0,") scale(").concat(i.config.plotOptions.pie.customScale,")")}),r=t.total.show;a.node.style.opacity=e.opacity;var s,o,l=e.centerX,c=e.centerY;s=void 0===t.name.color?i.globals.colors[0]:t.name.color;var h=t.name.fontSize,u=t.name.fontFamily,d=t.name.fontWeight;o=void 0===t.value.color?i.config.chart.foreColor:t.value.color;var f=t.value.formatter,g="",p="";if(r?(s=t.total.color,h=t.total.fontSize,u=t.total.fontFamily,d=t.total.fontWeight,p=t.total.label,g=t.total.formatter(i)):1===i.globals.series.length&&(g=f(i.globals.series[0],i),p=i.globals.seriesNames[0]),p&&(p=t.name.formatter(p,t.total.show,i)),t.name.show){var m=n.drawText({x:l,y:c+parseFloat(t.name.offsetY),text:p,textAnchor:"middle",foreColor:s,fontSize:h,fontWeight:d,fontFamily:u});m.node.classList.add("apexcharts-datalabel-label"),a.add(m)}if(t.value.show){var v=t.name.show?parseFloat(t.value.offsetY)+16:t.value.offsetY,x=n.drawText({x:l,y:c+v,text:g,textAnchor:"middle",foreColor:o,fontWeight:t.value.fontWeight,fontSize:t.value.fontSize,fontFamily:t.value.fontFamily});x.node.classList.add("apexcharts-datalabel-value"),a.add(x)}return a}},{key:"printInnerLabels",value:function(t,e,i,n){var a,r=this.w;n?a=void 0===t.name.color?r.globals.colors[parseInt(n.parentNode.getAttribute("rel"),10)-1]:t.name.color:r.globals.series.length>1&&t.total.show&&(a=t.total.color);var s=r.globals.dom.baseEl.querySelector(".apexcharts-datalabel-label"),o=r.globals.dom.baseEl.querySelector(".apexcharts-datalabel-value");i=(0,t.value.formatter)(i,r),n||"function"!=typeof t.total.formatter||(i=t.total.formatter(r));var l=e===t.total.label;e=t.name.formatter(e,l,r),null!==s&&(s.textContent=e),null!==o&&(o.textContent=i),null!==s&&(s.style.fill=a)}},{key:"printDataLabelsInner",value:function(t,e){var i=this.w,n=t.getAttribute("data:value"),a=i.globals.seriesNames[parseInt(t.parentNode.getAttribute("rel"),10)-1];i.globals.series.length>1&&this.printInnerLabels(e,a,n,t);var r=i.globals.dom.baseEl.querySelector(".apexcharts-datalabels-group");null!==r&&(r.style.opacity=1)}},{key:"drawSpokes",value:function(t){var e=this,i=this.w,n=new w(this.ctx),a=i.config.plotOptions.polarArea.spokes;if(0!==a.strokeWidth){for(var r=[],s=360/i.globals.series.length,o=0;o<i.globals.series.length;o++)r.push(x.polarToCartesian(this.centerX,this.centerY,i.globals.radialSize,i.config.plotOptions.pie.startAngle+s*o));r.forEach((function(i,r){var s=n.drawLine(i.x,i.y,e.centerX,e.centerY,Array.isArray(a.connectorColors)?a.connectorColors[r]:a.connectorColors);t.add(s)}))}}},{key:"revertDataLabelsInner",value:function(t,e,i){var n=this,a=this.w,r=a.globals.dom.baseEl.querySelector(".apexcharts-datalabels-group"),s=!1,o=a.globals.dom.baseEl.getElementsByClassName("apexcharts-pie-area"),l=function(t){var i=t.makeSliceOut,a=t.printLabel;Array.prototype.forEach.call(o,(function(t){"true"===t.getAttribute("data:pieClicked")&&(i&&(s=!0),a&&n.printDataLabelsInner(t,e))}))};if(l({makeSliceOut:!0,printLabel:!1}),e.total.show&&a.globals.series.length>1)s&&!e.total.showAlways?l({makeSliceOut:!1,printLabel:!0}):this.printInnerLabels(e,e.total.label,e.total.formatter(a));else if(l({makeSliceOut:!1,printLabel:!0}),!s)if(a.globals.selectedDataPoints.length&&a.globals.series.length>1)if(a.globals.selectedDataPoints[0].length>0){var c=a.globals.selectedDataPoints[0],h=a.globals.dom.baseEl.querySelector(".apexcharts-".concat(this.chartType.toLowerCase(),"-slice-").concat(c));this.printDataLabelsInner(h,e)}else r&&a.globals.selectedDataPoints.length&&0===a.globals.selectedDataPoints[0].length&&(r.style.opacity=0);else r&&a.globals.series.length>1&&(r.style.opacity=0)}}]),t}(),Tt=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w,this.chartType=this.w.config.chart.type,this.initialAnim=this.w.config.chart.animations.enabled,this.dynamicAnim=this.initialAnim&&this.w.config.chart.animations.dynamicAnimation.enabled,this.animDur=0;var i=this.w;this.graphics=new w(this.ctx),this.lineColorArr=void 0!==i.globals.stroke.colors?i.globals.stroke.colors:i.globals.colors,this.defaultSize=i.globals.svgHeight<i.globals.svgWidth?i.globals.gridHeight+1.5*i.globals.goldenPadding:i.globals.gridWidth,this.isLog=i.config.yaxis[0].logarithmic,this.coreUtils=new S(this.ctx),this.maxValue=this.isLog?this.coreUtils.getLogVal(i.globals.maxY,0):i.globals.maxY,this.minValue=this.isLog?this.coreUtils.getLogVal(this.w.globals.minY,0):i.globals.minY,this.polygons=i.config.plotOptions.radar.polygons,this.strokeWidth=i.config.stroke.show?i.config.stroke.width:0,this.size=this.defaultSize/2.1-this.strokeWidth-i.config.chart.dropShadow.blur,i.config.xaxis.labels.show&&(this.size=this.size-i.globals.xAxisLabelsWidth/1.75),void 0!==i.config.plotOptions.radar.size&&(this.size=i.config.plotOptions.radar.size),this.dataRadiusOfPercent=[],this.dataRadius=[],this.angleArr=[],this.yaxisLabelsTextsPos=[]}return c(t,[{key:"draw",value:function(t){var e=this,i=this.w,n=new M(this.ctx),a=[],s=new I(this.ctx);t.length&&(this.dataPointsLen=t[i.globals.maxValsInArrayIndex].length),this.disAngle=2*Math.PI/this.dataPointsLen;var o=i.globals.gridWidth/2,l=i.globals.gridHeight/2,c=o+i.config.plotOptions.radar.offsetX,h=l+i.config.plotOptions.radar.offsetY,u=this.graphics.group({class:"apexcharts-radar-series apexcharts-plot-series",transform:"translate(".concat(c||0,", ").concat(h||0,")")}),d=[],f=null,g=null;if(this.yaxisLabels=this.graphics.group({class:"apexcharts-yaxis"}),t.forEach((function(t,o){var l=t.length===i.globals.dataPoints,c=e.graphics.group().attr({class:"apexcharts-series","data:longestSeries":l,seriesName:x.escapeString(i.globals.seriesNames[o]),rel:o+1,"data:realIndex":o});e.dataRadiusOfPercent[o]=[],e.dataRadius[o]=[],e.angleArr[o]=[],t.forEach((function(t,i){var n=Math.abs(e.maxValue-e.minValue);t+=Math.abs(e.minValue),e.isLog&&(t=e.coreUtils.getLogVal(t,0)),e.dataRadiusOfPercent[o][i]=t/n,e.dataRadius[o][i]=e.dataRadiusOfPercent[o][i]*e.size,e.angleArr[o][i]=i*e.disAngle})),d=e.getDataPointsPos(e.dataRadius[o],e.angleArr[o]);var h=e.createPaths(d,{x:0,y:0});f=e.graphics.group({class:"apexcharts-series-markers-wrap apexcharts-element-hidden"}),g=e.graphics.group({class:"apexcharts-datalabels","data:realIndex":o}),i.globals.delayedElements.push({el:f.node,index:o});var u={i:o,realIndex:o,animationDelay:o,initialSpeed:i.config.chart.animations.speed,dataChangeSpeed:i.config.chart.animations.dynamicAnimation.speed,className:"apexcharts-radar",shouldClipToGrid:!1,bindEventsOnPaths:!1,stroke:i.globals.stroke.colors[o],strokeLineCap:i.config.stroke.lineCap},p=null;i.globals.previousPaths.length>0&&(p=e.getPreviousPath(o));for(var m=0;m<h.linePathsTo.length;m++){var v=e.graphics.renderPaths(r(r({},u),{},{pathFrom:null===p?h.linePathsFrom[m]:p,pathTo:h.linePathsTo[m],strokeWidth:Array.isArray(e.strokeWidth)?e.strokeWidth[o]:e.strokeWidth,fill:"none",drawShadow:!1}));c.add(v);var b=n.fillPath({seriesNumber:o}),w=e.graphics.renderPaths(r(r({},u),{},{pathFrom:null===p?h.areaPathsFrom[m]:p,pathTo:h.areaPathsTo[m],strokeWidth:0,fill:b,drawShadow:!1}));if(i.config.chart.dropShadow.enabled){var k=new y(e.ctx),A=i.config.chart.dropShadow;k.dropShadow(w,Object.assign({},A,{noUserSpaceOnUse:!0}),o)}c.add(w)}t.forEach((function(t,n){var a=new L(e.ctx).getMarkerConfig({cssClass:"apexcharts-marker",seriesIndex:o,dataPointIndex:n}),l=e.graphics.drawMarker(d[n].x,d[n].y,a);l.attr("rel",n),l.attr("j",n),l.attr("index",o),l.node.setAttribute("default-marker-size",a.pSize);var h=e.graphics.group({class:"apexcharts-series-markers"});h&&h.add(l),f.add(h),c.add(f);var u=i.config.dataLabels;if(u.enabled){var p=u.formatter(i.globals.series[o][n],{seriesIndex:o,dataPointIndex:n,w:i});s.plotDataLabelsText({x:d[n].x,y:d[n].y,text:p,textAnchor:"middle",i:o,j:o,parent:g,offsetCorrection:!1,dataLabelsConfig:r({},u)})}c.add(g)})),a.push(c)})),this.drawPolygons({parent:u}),i.config.xaxis.labels.show){var p=this.drawXAxisTexts();u.add(p)}return a.forEach((function(t){u.add(t)})),u.add(this.yaxisLabels),u}},{key:"drawPolygons",value:function(t){for(var e=this,i=this.w,n=t.parent,a=new Ct(this.ctx),r=i.globals.yAxisScale[0].result.reverse(),s=r.length,o=[],l=this.size/(s-1),c=0;c<s;c++)o[c]=l*c;o.reverse();var h=[],u=[];o.forEach((function(t,i){var n=x.getPolygonPos(t,e.dataPointsLen),a="";n.forEach((function(t,n){if(0===i){var r=e.graphics.drawLine(t.x,t.y,0,0,Array.isArray(e.polygons.connectorColors)?e.polygons.connectorColors[n]:e.polygons.connectorColors);u.push(r)}0===n&&e.yaxisLabelsTextsPos.push({x:t.x,y:t.y}),a+=t.x+","+t.y+" "})),h.push(a)})),h.forEach((function(t,a){var r=e.polygons.strokeColors,s=e.polygons.strokeWidth,o=e.graphics.drawPolygon(t,Array.isArray(r)?r[a]:r,Array.isArray(s)?s[a]:s,i.globals.radarPolygons.fill.colors[a]);n.add(o)})),u.forEach((function(t){n.add(t)})),i.config.yaxis[0].show&&this.yaxisLabelsTextsPos.forEach((function(t,i){var n=a.drawYAxisTexts(t.x,t.y,i,r[i]);e.yaxisLabels.add(n)}))}},{key:"drawXAxisTexts",value:function(){var t=this,e=this.w,i=e.config.xaxis.labels,n=this.graphics.group({class:"apexcharts-xaxis"}),a=x.getPolygonPos(this.size,this.dataPointsLen);return e.globals.labels.forEach((function(s,o){var l=e.config.xaxis.labels.formatter,c=new I(t.ctx);if(a[o]){var h=t.getTextPos(a[o],t.size),u=l(s,{seriesIndex:-1,dataPointIndex:o,w:e});c.plotDataLabelsText({x:h.newX,y:h.newY,text:u,textAnchor:h.textAnchor,i:o,j:o,parent:n,color:Array.isArray(i.style.colors)&&i.style.colors[o]?i.style.colors[o]:"#a8a8a8",dataLabelsConfig:r({textAnchor:h.textAnchor,dropShadow:{enabled:!1}},i),offsetCorrection:!1})}})),n}},{key:"createPaths",value:function(t,e){var i=this,n=[],a=[],r=[],s=[];if(t.length){a=[this.graphics.move(e.x,e.y)],s=[this.graphics.move(e.x,e.y)];var o=this.graphics.move(t[0].x,t[0].y),l=this.graphics.move(t[0].x,t[0].y);t.forEach((function(e,n){o+=i.graphics.line(e.x,e.y),l+=i.graphics.line(e.x,e.y),n===t.length-1&&(o+="Z",l+="Z")})),n.push(o),r.push(l)}return{linePathsFrom:a,linePathsTo:n,areaPathsFrom:s,areaPathsTo:r}}},{key:"getTextPos",value:function(t,e){var i="middle",n=t.x,a=t.y;return Math.abs(t.x)>=10?t.x>0?(i="start",n+=10):t.x<0&&(i="end",n-=10):i="middle",Math.abs(t.y)>=e-10&&(t.y<0?a-=10:t.y>0&&(a+=10)),{textAnchor:i,newX:n,newY:a}}},{key:"getPreviousPath",value:function(t){for(var e=this.w,i=null,n=0;n<e.globals.previousPaths.length;n++){var a=e.globals.previousPaths[n];a.paths.length>0&&parseInt(a.realIndex,10)===parseInt(t,10)&&void 0!==e.globals.previousPaths[n].paths[0]&&(i=e.globals.previousPaths[n].paths[0].d)}return i}},{key:"getDataPointsPos",value:function(t,e){var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:this.dataPointsLen;t=t||[],e=e||[];for(var n=[],a=0;a<i;a++){var r={};r.x=t[a]*Math.sin(e[a]),r.y=-t[a]*Math.cos(e[a]),n.push(r)}return n}}]),t}(),Pt=function(t){u(i,Et);var e=p(i);function i(t){var n;o(this,i),(n=e.call(this,t)).ctx=t,n.w=t.w,n.animBeginArr=[0],n.animDur=0;var a=n.w;return n.startAngle=a.config.plotOptions.radialBar.startAngle,n.endAngle=a.config.plotOptions.radialBar.endAngle,n.totalAngle=Math.abs(a.config.plotOptions.radialBar.endAngle-a.config.plotOptions.radialBar.startAngle),n.trackStartAngle=a.config.plotOptions.radialBar.track.startAngle,n.trackEndAngle=a.config.plotOptions.radialBar.track.endAngle,n.donutDataLabels=n.w.config.plotOptions.radialBar.dataLabels,n.radialDataLabels=n.donutDataLabels,n.trackStartAngle||(n.trackStartAngle=n.startAngle),n.trackEndAngle||(n.trackEndAngle=n.endAngle),360===n.endAngle&&(n.endAngle=359.99),n.margin=parseInt(a.config.plotOptions.radialBar.track.margin,10),n}return c(i,[{key:"draw",value:function(t){var e=this.w,i=new w(this.ctx),n=i.group({class:"apexcharts-radialbar"});if(e.globals.noData)return n;var a=i.group(),r=this.defaultSize/2,s=e.globals.gridWidth/2,o=this.defaultSize/2.05;e.config.chart.sparkline.enabled||(o=o-e.config.stroke.width-e.config.chart.dropShadow.blur);var l=e.globals.fill.colors;if(e.config.plotOptions.radialBar.track.show){var c=this.drawTracks({size:o,centerX:s,centerY:r,colorArr:l,series:t});a.add(c)}var h=this.drawArcs({size:o,centerX:s,centerY:r,colorArr:l,series:t}),u=360;e.config.plotOptions.radialBar.startAngle<0&&(u=this.totalAngle);var d=(360-u)/360;if(e.globals.radialSize=o-o*d,this.radialDataLabels.value.show){var f=Math.max(this.radialDataLabels.value.offsetY,this.radialDataLabels.name.offsetY);e.globals.radialSize+=f*d}return a.add(h.g),"front"===e.config.plotOptions.radialBar.hollow.position&&(h.g.add(h.elHollow),h.dataLabels&&h.g.add(h.dataLabels)),n.add(a),n}},{key:"drawTracks",value:function(t){var e=this.w,i=new w(this.ctx),n=i.group({class:"apexcharts-tracks"}),a=new y(this.ctx),r=new M(this.ctx),s=this.getStrokeWidth(t);t.size=t.size-s/2;for(var o=0;o<t.series.length;o++){var l=i.group({class:"apexcharts-radialbar-track apexcharts-track"});n.add(l),l.attr({rel:o+1}),t.size=t.size-s-this.margin;var c=e.config.plotOptions.radialBar.track,h=r.fillPath({seriesNumber:0,size:t.size,fillColors:Array.isArray(c.background)?c.background[o]:c.background,solid:!0}),u=this.trackStartAngle,d=this.trackEndAngle;Math.abs(d)+Math.abs(u)>=360&&(d=360-Math.abs(this.startAngle)-.1);var f=i.drawPath({d:"",stroke:h,strokeWidth:s*parseInt(c.strokeWidth,10)/100,fill:"none",strokeOpacity:c.opacity,classes:"apexcharts-radialbar-area"});if(c.dropShadow.enabled){var g=c.dropShadow;a.dropShadow(f,g)}l.add(f),f.attr("id","apexcharts-radialbarTrack-"+o),this.animatePaths(f,{centerX:t.centerX,centerY:t.centerY,endAngle:d,startAngle:u,size:t.size,i:o,totalItems:2,animBeginArr:0,dur:0,isTrack:!0,easing:e.globals.easing})}return n}},{key:"drawArcs",value:function(t){var e=this.w,i=new w(this.ctx),n=new M(this.ctx),a=new y(this.ctx),r=i.group(),s=this.getStrokeWidth(t);t.size=t.size-s/2;var o=e.config.plotOptions.radialBar.hollow.background,l=t.size-s*t.series.length-this.margin*t.series.length-s*parseInt(e.config.plotOptions.radialBar.track.strokeWidth,10)/100/2,c=l-e.config.plotOptions.radialBar.hollow.margin;void 0!==e.config.plotOptions.radialBar.hollow.image&&(o=this.drawHollowImage(t,r,l,o));var h=this.drawHollow({size:c,centerX:t.centerX,centerY:t.centerY,fill:o||"transparent"});if(e.config.plotOptions.radialBar.hollow.dropShadow.enabled){var u=e.config.plotOptions.radialBar.hollow.dropShadow;a.dropShadow(h,u)}var d=1;!this.radialDataLabels.total.show&&e.globals.series.length>1&&(d=0);var f=null;this.radialDataLabels.show&&(f=this.renderInnerDataLabels(this.radialDataLabels,{hollowSize:l,centerX:t.centerX,centerY:t.centerY,opacity:d})),"back"===e.config.plotOptions.radialBar.hollow.position&&(r.add(h),f&&r.add(f));var g=!1;e.config.plotOptions.radialBar.inverseOrder&&(g=!0);for(var p=g?t.series.length-1:0;g?p>=0:p<t.series.length;g?p--:p++){var m=i.group({class:"apexcharts-series apexcharts-radial-series",seriesName:x.escapeString(e.globals.seriesNames[p])});r.add(m),m.attr({rel:p+1,"data:realIndex":p}),this.ctx.series.addCollapsedClassToSeries(m,p),t.size=t.size-s-this.margin;var v=n.fillPath({seriesNumber:p,size:t.size,value:t.series[p]}),b=this.startAngle,k=void 0,A=x.negToZero(t.series[p]>100?100:t.series[p])/100,S=Math.round(this.totalAngle*A)+this.startAngle,_=void 0;e.globals.dataChanged&&(k=this.startAngle,_=Math.round(this.totalAngle*x.negToZero(e.globals.previousPaths[p])/100)+k),Math.abs(S)+Math.abs(b)>=360&&(S-=.01),Math.abs(_)+Math.abs(k)>=360&&(_-=.01);var C=S-b,E=Array.isArray(e.config.stroke.dashArray)?e.config.stroke.dashArray[p]:e.config.stroke.dashArray,T=i.drawPath({d:"",stroke:v,strokeWidth:s,fill:"none",fillOpacity:e.config.fill.opacity,classes:"apexcharts-radialbar-area apexcharts-radialbar-slice-"+p,strokeDashArray:E});if(w.setAttrs(T.node,{"data:angle":C,"data:value":t.series[p]}),e.config.chart.dropShadow.enabled){var P=e.config.chart.dropShadow;a.dropShadow(T,P,p)}a.setSelectionFilter(T,0,p),this.addListeners(T,this.radialDataLabels),m.add(T),T.attr({index:0,j:p});var L=0;!this.initialAnim||e.globals.resized||e.globals.dataChanged||(L=e.config.chart.animations.speed),e.globals.dataChanged&&(L=e.config.chart.animations.dynamicAnimation.speed),this.animDur=L/(1.2*t.series.length)+this.animDur,this.animBeginArr.push(this.animDur),this.animatePaths(T,{centerX:t.centerX,centerY:t.centerY,endAngle:S,startAngle:b,prevEndAngle:_,prevStartAngle:k,size:t.size,i:p,totalItems:2,animBeginArr:this.animBeginArr,dur:L,shouldSetPrevPaths:!0,easing:e.globals.easing})}return{g:r,elHollow:h,dataLabels:f}}},{key:"drawHollow",value:function(t){var e=new w(this.ctx).drawCircle(2*t.size);return e.attr({class:"apexcharts-radialbar-hollow",cx:t.centerX,cy:t.centerY,r:t.size,fill:t.fill}),e}},{key:"drawHollowImage",value:function(t,e,i,n){var a=this.w,r=new M(this.ctx),s=x.randomId(),o=a.config.plotOptions.radialBar.hollow.image;if(a.config.plotOptions.radialBar.hollow.imageClipped)r.clippedImgArea({width:i,height:i,image:o,patternID:"pattern".concat(a.globals.cuid).concat(s)}),n="url(#pattern".concat(a.globals.cuid).concat(s,")");else{var l=a.config.plotOptions.radialBar.hollow.imageWidth,c=a.config.plotOptions.radialBar.hollow.imageHeight;if(void 0===l&&void 0===c){var h=a.globals.dom.Paper.image(o).loaded((function(e){this.move(t.centerX-e.width/2+a.config.plotOptions.radialBar.hollow.imageOffsetX,t.centerY-e.height/2+a.config.plotOptions.radialBar.hollow.imageOffsetY)}));e.add(h)}else{var u=a.globals.dom.Paper.image(o).loaded((function(e){this.move(t.centerX-l/2+a.config.plotOptions.radialBar.hollow.imageOffsetX,t.centerY-c/2+a.config.plotOptions.radialBar.hollow.imageOffsetY),this.size(l,c)}));e.add(u)}}return n}},{key:"getStrokeWidth",value:function(t){var e=this.w;return t.size*(100-parseInt(e.config.plotOptions.radialBar.hollow.size,10))/100/(t.series.length+1)-this.margin}}]),i}(),Mt=function(){function t(e){o(this,t),this.w=e.w,this.lineCtx=e}return c(t,[{key:"sameValueSeriesFix",value:function(t,e){var i=this.w;if("line"===i.config.chart.type&&("gradient"===i.config.fill.type||"gradient"===i.config.fill.type[t])&&new S(this.lineCtx.ctx,i).seriesHaveSameValues(t)){var n=e[t].slice();n[n.length-1]=n[n.length-1]+1e-6,e[t]=n}return e}},{key:"calculatePoints",value:function(t){var e=t.series,i=t.realIndex,n=t.x,a=t.y,r=t.i,s=t.j,o=t.prevY,l=this.w,c=[],h=[];if(0===s){var u=this.lineCtx.categoryAxisCorrection+l.config.markers.offsetX;l.globals.isXNumeric&&(u=(l.globals.seriesX[i][0]-l.globals.minX)/this.lineCtx.xRatio+l.config.markers.offsetX),c.push(u),h.push(x.isNumber(e[r][0])?o+l.config.markers.offsetY:null),c.push(n+l.config.markers.offsetX),h.push(x.isNumber(e[r][s+1])?a+l.config.markers.offsetY:null)}else c.push(n+l.config.markers.offsetX),h.push(x.isNumber(e[r][s+1])?a+l.config.markers.offsetY:null);return{x:c,y:h}}},{key:"checkPreviousPaths",value:function(t){for(var e=t.pathFromLine,i=t.pathFromArea,n=t.realIndex,a=this.w,r=0;r<a.globals.previousPaths.length;r++){var s=a.globals.previousPaths[r];("line"===s.type||"area"===s.type)&&s.paths.length>0&&parseInt(s.realIndex,10)===parseInt(n,10)&&("line"===s.type?(this.lineCtx.appendPathFrom=!1,e=a.globals.previousPaths[r].paths[0].d):"area"===s.type&&(this.lineCtx.appendPathFrom=!1,i=a.globals.previousPaths[r].paths[0].d,a.config.stroke.show&&a.globals.previousPaths[r].paths[1]&&(e=a.globals.previousPaths[r].paths[1].d)))}return{pathFromLine:e,pathFromArea:i}}},{key:"determineFirstPrevY",value:function(t){var e=t.i,i=t.series,n=t.prevY,a=t.lineYPosition,r=this.w;if(void 0!==i[e][0])n=(a=r.config.chart.stacked&&e>0?this.lineCtx.prevSeriesY[e-1][0]:this.lineCtx.zeroY)-i[e][0]/this.lineCtx.yRatio[this.lineCtx.yaxisIndex]+2*(this.lineCtx.isReversed?i[e][0]/this.lineCtx.yRatio[this.lineCtx.yaxisIndex]:0);else if(r.config.chart.stacked&&e>0&&void 0===i[e][0])for(var s=e-1;s>=0;s--)if(null!==i[s][0]&&void 0!==i[s][0]){n=a=this.lineCtx.prevSeriesY[s][0];break}return{prevY:n,lineYPosition:a}}}]),t}(),Lt=function(){function t(e,i,n){o(this,t),this.ctx=e,this.w=e.w,this.xyRatios=i,this.pointsChart=!("bubble"!==this.w.config.chart.type&&"scatter"!==this.w.config.chart.type)||n,this.scatter=new D(this.ctx),this.noNegatives=this.w.globals.minX===Number.MAX_VALUE,this.lineHelpers=new Mt(this),this.markers=new L(this.ctx),this.prevSeriesY=[],this.categoryAxisCorrection=0,this.yaxisIndex=0}return c(t,[{key:"draw",value:function(t,e,i){var n=this.w,a=new w(this.ctx),r=n.globals.comboCharts?e:n.config.chart.type,s=a.group({class:"apexcharts-".concat(r,"-series apexcharts-plot-series")}),o=new S(this.ctx,n);this.yRatio=this.xyRatios.yRatio,this.zRatio=this.xyRatios.zRatio,this.xRatio=this.xyRatios.xRatio,this.baseLineY=this.xyRatios.baseLineY,t=o.getLogSeries(t),this.yRatio=o.getLogYRatios(this.yRatio);for(var l=[],c=0;c<t.length;c++){t=this.lineHelpers.sameValueSeriesFix(c,t);var h=n.globals.comboCharts?i[c]:c;this._initSerieVariables(t,c,h);var u=[],d=[],f=n.globals.padHorizontal+this.categoryAxisCorrection;this.ctx.series.addCollapsedClassToSeries(this.elSeries,h),n.globals.isXNumeric&&n.globals.seriesX.length>0&&(f=(n.globals.seriesX[h][0]-n.globals.minX)/this.xRatio),d.push(f);var g,p=f,m=p,v=this.zeroY;v=this.lineHelpers.determineFirstPrevY({i:c,series:t,prevY:v,lineYPosition:0}).prevY,u.push(v),g=v;var x=this._calculatePathsFrom({series:t,i:c,realIndex:h,prevX:m,prevY:v}),b=this._iterateOverDataPoints({series:t,realIndex:h,i:c,x:f,y:1,pX:p,pY:g,pathsFrom:x,linePaths:[],areaPaths:[],seriesIndex:i,lineYPosition:0,xArrj:d,yArrj:u});this._handlePaths({type:r,realIndex:h,i:c,paths:b}),this.elSeries.add(this.elPointsMain),this.elSeries.add(this.elDataLabelsWrap),l.push(this.elSeries)}if(n.config.chart.stacked)for(var y=l.length;y>0;y--)s.add(l[y-1]);else for(var k=0;k<l.length;k++)s.add(l[k]);return s}},{key:"_initSerieVariables",value:function(t,e,i){var n=this.w,a=new w(this.ctx);this.xDivision=n.globals.gridWidth/(n.globals.dataPoints-("on"===n.config.xaxis.tickPlacement?1:0)),this.strokeWidth=Array.isArray(n.config.stroke.width)?n.config.stroke.width[i]:n.config.stroke.width,this.yRatio.length>1&&(this.yaxisIndex=i),this.isReversed=n.config.yaxis[this.yaxisIndex]&&n.config.yaxis[this.yaxisIndex].reversed,this.zeroY=n.globals.gridHeight-this.baseLineY[this.yaxisIndex]-(this.isReversed?n.globals.gridHeight:0)+(this.isReversed?2*this.baseLineY[this.yaxisIndex]:0),this.areaBottomY=this.zeroY,(this.zeroY>n.globals.gridHeight||"end"===n.config.plotOptions.area.fillTo)&&(this.areaBottomY=n.globals.gridHeight),this.categoryAxisCorrection=this.xDivision/2,this.elSeries=a.group({class:"apexcharts-series",seriesName:x.escapeString(n.globals.seriesNames[i])}),this.elPointsMain=a.group({class:"apexcharts-series-markers-wrap","data:realIndex":i}),this.elDataLabelsWrap=a.group({class:"apexcharts-datalabels","data:realIndex":i});var r=t[e].length===n.globals.dataPoints;this.elSeries.attr({"data:longestSeries":r,rel:e+1,"data:realIndex":i}),this.appendPathFrom=!0}},{key:"_calculatePathsFrom",value:function(t){var e,i,n,a,r=t.series,s=t.i,o=t.realIndex,l=t.prevX,c=t.prevY,h=this.w,u=new w(this.ctx);if(null===r[s][0]){for(var d=0;d<r[s].length;d++)if(null!==r[s][d]){l=this.xDivision*d,c=this.zeroY-r[s][d]/this.yRatio[this.yaxisIndex],e=u.move(l,c),i=u.move(l,this.areaBottomY);break}}else e=u.move(l,c),i=u.move(l,this.areaBottomY)+u.line(l,c);if(n=u.move(-1,this.zeroY)+u.line(-1,this.zeroY),a=u.move(-1,this.zeroY)+u.line(-1,this.zeroY),h.globals.previousPaths.length>0){var f=this.lineHelpers.checkPreviousPaths({pathFromLine:n,pathFromArea:a,realIndex:o});n=f.pathFromLine,a=f.pathFromArea}return{prevX:l,prevY:c,linePath:e,areaPath:i,pathFromLine:n,pathFromArea:a}}},{key:"_handlePaths",value:function(t){var e=t.type,i=t.realIndex,n=t.i,a=t.paths,s=this.w,o=new w(this.ctx),l=new M(this.ctx);this.prevSeriesY.push(a.yArrj),s.globals.seriesXvalues[i]=a.xArrj,s.globals.seriesYvalues[i]=a.yArrj;var c=s.config.forecastDataPoints;if(c.count>0){var h=s.globals.seriesXvalues[i][s.globals.seriesXvalues[i].length-c.count-1],u=o.drawRect(h,0,s.globals.gridWidth,s.globals.gridHeight,0);s.globals.dom.elForecastMask.appendChild(u.node);var d=o.drawRect(0,0,h,s.globals.gridHeight,0);s.globals.dom.elNonForecastMask.appendChild(d.node)}this.pointsChart||s.globals.delayedElements.push({el:this.elPointsMain.node,index:i});var f={i:n,realIndex:i,animationDelay:n,initialSpeed:s.config.chart.animations.speed,dataChangeSpeed:s.config.chart.animations.dynamicAnimation.speed,className:"apexcharts-".concat(e)};if("area"===e)for(var g=l.fillPath({seriesNumber:i}),p=0;p<a.areaPaths.length;p++){var m=o.renderPaths(r(r({},f),{},{pathFrom:a.pathFromArea,pathTo:a.areaPaths[p],stroke:"none",strokeWidth:0,strokeLineCap:null,fill:g}));this.elSeries.add(m)}if(s.config.stroke.show&&!this.pointsChart){var v;v="line"===e?l.fillPath({seriesNumber:i,i:n}):s.globals.stroke.colors[i];for(var x=0;x<a.linePaths.length;x++){var b=r(r({},f),{},{pathFrom:a.pathFromLine,pathTo:a.linePaths[x],stroke:v,strokeWidth:this.strokeWidth,strokeLineCap:s.config.stroke.lineCap,fill:"none"}),y=o.renderPaths(b);if(this.elSeries.add(y),c.count>0){var k=o.renderPaths(b);k.node.setAttribute("stroke-dasharray",c.dashArray),c.strokeWidth&&k.node.setAttribute("stroke-width",c.strokeWidth),this.elSeries.add(k),k.attr("clip-path","url(#forecastMask".concat(s.globals.cuid,")")),y.attr("clip-path","url(#nonForecastMask".concat(s.globals.cuid,")"))}}}}},{key:"_iterateOverDataPoints",value:function(t){for(var e=t.series,i=t.realIndex,n=t.i,a=t.x,r=t.y,s=t.pX,o=t.pY,l=t.pathsFrom,c=t.linePaths,h=t.areaPaths,u=t.seriesIndex,d=t.lineYPosition,f=t.xArrj,g=t.yArrj,p=this.w,m=new w(this.ctx),v=this.yRatio,b=l.prevY,y=l.linePath,k=l.areaPath,A=l.pathFromLine,S=l.pathFromArea,_=x.isNumber(p.globals.minYArr[i])?p.globals.minYArr[i]:p.globals.minY,C=p.globals.dataPoints>1?p.globals.dataPoints-1:p.globals.dataPoints,E=0;E<C;E++){var T=void 0===e[n][E+1]||null===e[n][E+1];if(p.globals.isXNumeric){var P=p.globals.seriesX[i][E+1];void 0===p.globals.seriesX[i][E+1]&&(P=p.globals.seriesX[i][C-1]),a=(P-p.globals.minX)/this.xRatio}else a+=this.xDivision;d=p.config.chart.stacked&&n>0&&p.globals.collapsedSeries.length<p.config.series.length-1?this.prevSeriesY[function(t){for(var e=t,i=0;i<p.globals.series.length;i++)if(p.globals.collapsedSeriesIndices.indexOf(t)>-1){e--;break}return e>=0?e:0}(n-1)][E+1]:this.zeroY,r=T?d-_/v[this.yaxisIndex]+2*(this.isReversed?_/v[this.yaxisIndex]:0):d-e[n][E+1]/v[this.yaxisIndex]+2*(this.isReversed?e[n][E+1]/v[this.yaxisIndex]:0),f.push(a),g.push(r);var M=this.lineHelpers.calculatePoints({series:e,x:a,y:r,realIndex:i,i:n,j:E,prevY:b}),L=this._createPaths({series:e,i:n,realIndex:i,j:E,x:a,y:r,pX:s,pY:o,linePath:y,areaPath:k,linePaths:c,areaPaths:h,seriesIndex:u});h=L.areaPaths,c=L.linePaths,s=L.pX,o=L.pY,k=L.areaPath,y=L.linePath,this.appendPathFrom&&(A+=m.line(a,this.zeroY),S+=m.line(a,this.zeroY)),this.handleNullDataPoints(e,M,n,E,i),this._handleMarkersAndLabels({pointsPos:M,series:e,x:a,y:r,prevY:b,i:n,j:E,realIndex:i})}return{yArrj:g,xArrj:f,pathFromArea:S,areaPaths:h,pathFromLine:A,linePaths:c}}},{key:"_handleMarkersAndLabels",value:function(t){var e=t.pointsPos;t.series,t.x,t.y,t.prevY;var i=t.i,n=t.j,a=t.realIndex,r=this.w,s=new I(this.ctx);if(this.pointsChart)this.scatter.draw(this.elSeries,n,{realIndex:a,pointsPos:e,zRatio:this.zRatio,elParent:this.elPointsMain});else{r.globals.series[i].length>1&&this.elPointsMain.node.classList.add("apexcharts-element-hidden");var o=this.markers.plotChartMarkers(e,a,n+1);null!==o&&this.elPointsMain.add(o)}var l=s.drawDataLabel(e,a,n+1,null);null!==l&&this.elDataLabelsWrap.add(l)}},{key:"_createPaths",value:function(t){var e=t.series,i=t.i,n=t.realIndex,a=t.j,r=t.x,s=t.y,o=t.pX,l=t.pY,c=t.linePath,h=t.areaPath,u=t.linePaths,d=t.areaPaths,f=t.seriesIndex,g=this.w,p=new w(this.ctx),m=g.config.stroke.curve,v=this.areaBottomY;if(Array.isArray(g.config.stroke.curve)&&(m=Array.isArray(f)?g.config.stroke.curve[f[i]]:g.config.stroke.curve[i]),"smooth"===m){var x=.35*(r-o);g.globals.hasNullValues?(null!==e[i][a]&&(null!==e[i][a+1]?(c=p.move(o,l)+p.curve(o+x,l,r-x,s,r+1,s),h=p.move(o+1,l)+p.curve(o+x,l,r-x,s,r+1,s)+p.line(r,v)+p.line(o,v)+"z"):(c=p.move(o,l),h=p.move(o,l)+"z")),u.push(c),d.push(h)):(c+=p.curve(o+x,l,r-x,s,r,s),h+=p.curve(o+x,l,r-x,s,r,s)),o=r,l=s,a===e[i].length-2&&(h=h+p.curve(o,l,r,s,r,v)+p.move(r,s)+"z",g.globals.hasNullValues||(u.push(c),d.push(h)))}else{if(null===e[i][a+1]){c+=p.move(r,s);var b=g.globals.isXNumeric?(g.globals.seriesX[n][a]-g.globals.minX)/this.xRatio:r-this.xDivision;h=h+p.line(b,v)+p.move(r,s)+"z"}null===e[i][a]&&(c+=p.move(r,s),h+=p.move(r,v)),"stepline"===m?(c=c+p.line(r,null,"H")+p.line(null,s,"V"),h=h+p.line(r,null,"H")+p.line(null,s,"V")):"straight"===m&&(c+=p.line(r,s),h+=p.line(r,s)),a===e[i].length-2&&(h=h+p.line(r,v)+p.move(r,s)+"z",u.push(c),d.push(h))}return{linePaths:u,areaPaths:d,pX:o,pY:l,linePath:c,areaPath:h}}},{key:"handleNullDataPoints",value:function(t,e,i,n,a){var r=this.w;if(null===t[i][n]&&r.config.markers.showNullDataPoints||1===t[i].length){var s=this.markers.plotChartMarkers(e,a,n+1,this.strokeWidth-r.config.markers.strokeWidth/2,!0);null!==s&&this.elPointsMain.add(s)}}}]),t}();window.TreemapSquared={},window.TreemapSquared.generate=function(){function t(e,i,n,a){this.xoffset=e,this.yoffset=i,this.height=a,this.width=n,this.shortestEdge=function(){return Math.min(this.height,this.width)},this.getCoordinates=function(t){var e,i=[],n=this.xoffset,a=this.yoffset,s=r(t)/this.height,o=r(t)/this.width;if(this.width>=this.height)for(e=0;e<t.length;e++)i.push([n,a,n+s,a+t[e]/s]),a+=t[e]/s;else for(e=0;e<t.length;e++)i.push([n,a,n+t[e]/o,a+o]),n+=t[e]/o;return i},this.cutArea=function(e){var i;if(this.width>=this.height){var n=e/this.height,a=this.width-n;i=new t(this.xoffset+n,this.yoffset,a,this.height)}else{var r=e/this.width,s=this.height-r;i=new t(this.xoffset,this.yoffset+r,this.width,s)}return i}}function e(e,n,a,s,o){return s=void 0===s?0:s,o=void 0===o?0:o,function(t){var e,i,n=[];for(e=0;e<t.length;e++)for(i=0;i<t[e].length;i++)n.push(t[e][i]);return n}(i(function(t,e){var i,n=[],a=e/r(t);for(i=0;i<t.length;i++)n[i]=t[i]*a;return n}(e,n*a),[],new t(s,o,n,a),[]))}function i(t,e,a,s){var o,l,c;if(0!==t.length)return o=a.shortestEdge(),function(t,e,i){var a;return 0===t.length||((a=t.slice()).push(e),n(t,i)>=n(a,i))}(e,l=t[0],o)?(e.push(l),i(t.slice(1),e,a,s)):(c=a.cutArea(r(e),s),s.push(a.getCoordinates(e)),i(t,[],c,s)),s;s.push(a.getCoordinates(e))}function n(t,e){var i=Math.min.apply(Math,t),n=Math.max.apply(Math,t),a=r(t);return Math.max(Math.pow(e,2)*n/Math.pow(a,2),Math.pow(a,2)/(Math.pow(e,2)*i))}function a(t){return t&&t.constructor===Array}function r(t){var e,i=0;for(e=0;e<t.length;e++)i+=t[e];return i}function s(t){var e,i=0;if(a(t[0]))for(e=0;e<t.length;e++)i+=s(t[e]);else i=r(t);return i}return function t(i,n,r,o,l){o=void 0===o?0:o,l=void 0===l?0:l;var c,h,u=[],d=[];if(a(i[0])){for(h=0;h<i.length;h++)u[h]=s(i[h]);for(c=e(u,n,r,o,l),h=0;h<i.length;h++)d.push(t(i[h],c[h][2]-c[h][0],c[h][3]-c[h][1],c[h][0],c[h][1]))}else d=e(i,n,r,o,l);return d}}();var Dt,It,Ot=function(){function t(e,i){o(this,t),this.ctx=e,this.w=e.w,this.strokeWidth=this.w.config.stroke.width,this.helpers=new St(e),this.dynamicAnim=this.w.config.chart.animations.dynamicAnimation,this.labels=[]}return c(t,[{key:"draw",value:function(t){var e=this,i=this.w,n=new w(this.ctx),a=new M(this.ctx),r=n.group({class:"apexcharts-treemap"});if(i.globals.noData)return r;var s=[];return t.forEach((function(t){var e=t.map((function(t){return Math.abs(t)}));s.push(e)})),this.negRange=this.helpers.checkColorRange(),i.config.series.forEach((function(t,i){t.data.forEach((function(t){Array.isArray(e.labels[i])||(e.labels[i]=[]),e.labels[i].push(t.x)}))})),window.TreemapSquared.generate(s,i.globals.gridWidth,i.globals.gridHeight).forEach((function(s,o){var l=n.group({class:"apexcharts-series apexcharts-treemap-series",seriesName:x.escapeString(i.globals.seriesNames[o]),rel:o+1,"data:realIndex":o});if(i.config.chart.dropShadow.enabled){var c=i.config.chart.dropShadow;new y(e.ctx).dropShadow(r,c,o)}var h=n.group({class:"apexcharts-data-labels"});s.forEach((function(r,s){var c=r[0],h=r[1],u=r[2],d=r[3],f=n.drawRect(c,h,u-c,d-h,0,"#fff",1,e.strokeWidth,i.config.plotOptions.treemap.useFillColorAsStroke?p:i.globals.stroke.colors[o]);f.attr({cx:c,cy:h,index:o,i:o,j:s,width:u-c,height:d-h});var g=e.helpers.getShadeColor(i.config.chart.type,o,s,e.negRange),p=g.color;void 0!==i.config.series[o].data[s]&&i.config.series[o].data[s].fillColor&&(p=i.config.series[o].data[s].fillColor);var m=a.fillPath({color:p,seriesNumber:o,dataPointIndex:s});f.node.classList.add("apexcharts-treemap-rect"),f.attr({fill:m}),e.helpers.addListeners(f);var v={x:c+(u-c)/2,y:h+(d-h)/2,width:0,height:0},x={x:c,y:h,width:u-c,height:d-h};if(i.config.chart.animations.enabled&&!i.globals.dataChanged){var b=1;i.globals.resized||(b=i.config.chart.animations.speed),e.animateTreemap(f,v,x,b)}if(i.globals.dataChanged){var y=1;e.dynamicAnim.enabled&&i.globals.shouldAnimate&&(y=e.dynamicAnim.speed,i.globals.previousPaths[o]&&i.globals.previousPaths[o][s]&&i.globals.previousPaths[o][s].rect&&(v=i.globals.previousPaths[o][s].rect),e.animateTreemap(f,v,x,y))}var w=e.getFontSize(r),k=i.config.dataLabels.formatter(e.labels[o][s],{value:i.globals.series[o][s],seriesIndex:o,dataPointIndex:s,w:i}),A=e.helpers.calculateDataLabels({text:k,x:(c+u)/2,y:(h+d)/2+e.strokeWidth/2+w/3,i:o,j:s,colorProps:g,fontSize:w,series:t});i.config.dataLabels.enabled&&A&&e.rotateToFitLabel(A,k,c,h,u,d),l.add(f),null!==A&&l.add(A)})),l.add(h),r.add(l)})),r}},{key:"getFontSize",value:function(t){var e,i,n=this.w,a=function t(e){var i,n=0;if(Array.isArray(e[0]))for(i=0;i<e.length;i++)n+=t(e[i]);else for(i=0;i<e.length;i++)n+=e[i].length;return n}(this.labels)/function t(e){var i,n=0;if(Array.isArray(e[0]))for(i=0;i<e.length;i++)n+=t(e[i]);else for(i=0;i<e.length;i++)n+=1;return n}(this.labels);return e=(t[2]-t[0])*(t[3]-t[1]),i=Math.pow(e,.5),Math.min(i/a,parseInt(n.config.dataLabels.style.fontSize,10))}},{key:"rotateToFitLabel",value:function(t,e,i,n,a,r){var s=new w(this.ctx),o=s.getTextRects(e);if(o.width+5>a-i&&o.width<=r-n){var l=s.rotateAroundCenter(t.node);t.node.setAttribute("transform","rotate(-90 ".concat(l.x," ").concat(l.y,")"))}}},{key:"animateTreemap",value:function(t,e,i,n){var a=new b(this.ctx);a.animateRect(t,{x:e.x,y:e.y,width:e.width,height:e.height},{x:i.x,y:i.y,width:i.width,height:i.height},n,(function(){a.animationCompleted(t)}))}}]),t}(),Nt=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w,this.timeScaleArray=[],this.utc=this.w.config.xaxis.labels.datetimeUTC}return c(t,[{key:"calculateTimeScaleTicks",value:function(t,e){var i=this,n=this.w;if(n.globals.allSeriesCollapsed)return n.globals.labels=[],n.globals.timescaleLabels=[],[];var a=new z(this.ctx),s=(e-t)/864e5;this.determineInterval(s),n.globals.disableZoomIn=!1,n.globals.disableZoomOut=!1,s<.00011574074074074075?n.globals.disableZoomIn=!0:s>5e4&&(n.globals.disableZoomOut=!0);var o=a.getTimeUnitsfromTimestamp(t,e,this.utc),l=n.globals.gridWidth/s,c=l/24,h=c/60,u=h/60,d=Math.floor(24*s),f=Math.floor(1440*s),g=Math.floor(86400*s),p=Math.floor(s),m=Math.floor(s/30),v=Math.floor(s/365),x={minMillisecond:o.minMillisecond,minSecond:o.minSecond,minMinute:o.minMinute,minHour:o.minHour,minDate:o.minDate,minMonth:o.minMonth,minYear:o.minYear},b={firstVal:x,currentMillisecond:x.minMillisecond,currentSecond:x.minSecond,currentMinute:x.minMinute,currentHour:x.minHour,currentMonthDate:x.minDate,currentDate:x.minDate,currentMonth:x.minMonth,currentYear:x.minYear,daysWidthOnXAxis:l,hoursWidthOnXAxis:c,minutesWidthOnXAxis:h,secondsWidthOnXAxis:u,numberOfSeconds:g,numberOfMinutes:f,numberOfHours:d,numberOfDays:p,numberOfMonths:m,numberOfYears:v};switch(this.tickInterval){case"years":this.generateYearScale(b);break;case"months":case"half_year":this.generateMonthScale(b);break;case"months_days":case"months_fortnight":case"days":case"week_days":this.generateDayScale(b);break;case"hours":this.generateHourScale(b);break;case"minutes_fives":case"minutes":this.generateMinuteScale(b);break;case"seconds_tens":case"seconds_fives":case"seconds":this.generateSecondScale(b)}var y=this.timeScaleArray.map((function(t){var e={position:t.position,unit:t.unit,year:t.year,day:t.day?t.day:1,hour:t.hour?t.hour:0,month:t.month+1};return"month"===t.unit?r(r({},e),{},{day:1,value:t.value+1}):"day"===t.unit||"hour"===t.unit?r(r({},e),{},{value:t.value}):"minute"===t.unit?r(r({},e),{},{value:t.value,minute:t.value}):"second"===t.unit?r(r({},e),{},{value:t.value,minute:t.minute,second:t.second}):t}));return y.filter((function(t){var e=1,a=Math.ceil(n.globals.gridWidth/120),r=t.value;void 0!==n.config.xaxis.tickAmount&&(a=n.config.xaxis.tickAmount),y.length>a&&(e=Math.floor(y.length/a));var s=!1,o=!1;switch(i.tickInterval){case"years":"year"===t.unit&&(s=!0);break;case"half_year":e=7,"year"===t.unit&&(s=!0);break;case"months":e=1,"year"===t.unit&&(s=!0);break;case"months_fortnight":e=15,"year"!==t.unit&&"month"!==t.unit||(s=!0),30===r&&(o=!0);break;case"months_days":e=10,"month"===t.unit&&(s=!0),30===r&&(o=!0);break;case"week_days":e=8,"month"===t.unit&&(s=!0);break;case"days":e=1,"month"===t.unit&&(s=!0);break;case"hours":"day"===t.unit&&(s=!0);break;case"minutes_fives":case"seconds_fives":r%5!=0&&(o=!0);break;case"seconds_tens":r%10!=0&&(o=!0)}if("hours"===i.tickInterval||"minutes_fives"===i.tickInterval||"seconds_tens"===i.tickInterval||"seconds_fives"===i.tickInterval){if(!o)return!0}else if((r%e==0||s)&&!o)return!0}))}},{key:"recalcDimensionsBasedOnFormat",value:function(t,e){var i=this.w,n=this.formatDates(t),a=this.removeOverlappingTS(n);i.globals.timescaleLabels=a.slice(),new ht(this.ctx).plotCoords()}},{key:"determineInterval",value:function(t){var e=24*t,i=60*e;switch(!0){case t/365>5:this.tickInterval="years";break;case t>800:this.tickInterval="half_year";break;case t>180:this.tickInterval="months";break;case t>90:this.tickInterval="months_fortnight";break;case t>60:this.tickInterval="months_days";break;case t>30:this.tickInterval="week_days";break;case t>2:this.tickInterval="days";break;case e>2.4:this.tickInterval="hours";break;case i>15:this.tickInterval="minutes_fives";break;case i>5:this.tickInterval="minutes";break;case i>1:this.tickInterval="seconds_tens";break;case 60*i>20:this.tickInterval="seconds_fives";break;default:this.tickInterval="seconds"}}},{key:"generateYearScale",value:function(t){var e=t.firstVal,i=t.currentMonth,n=t.currentYear,a=t.daysWidthOnXAxis,r=t.numberOfYears,s=e.minYear,o=0,l=new z(this.ctx),c="year";if(e.minDate>1||e.minMonth>0){var h=l.determineRemainingDaysOfYear(e.minYear,e.minMonth,e.minDate);o=(l.determineDaysOfYear(e.minYear)-h+1)*a,s=e.minYear+1,this.timeScaleArray.push({position:o,value:s,unit:c,year:s,month:x.monthMod(i+1)})}else 1===e.minDate&&0===e.minMonth&&this.timeScaleArray.push({position:o,value:s,unit:c,year:n,month:x.monthMod(i+1)});for(var u=s,d=o,f=0;f<r;f++)u++,d=l.determineDaysOfYear(u-1)*a+d,this.timeScaleArray.push({position:d,value:u,unit:c,year:u,month:1})}},{key:"generateMonthScale",value:function(t){var e=t.firstVal,i=t.currentMonthDate,n=t.currentMonth,a=t.currentYear,r=t.daysWidthOnXAxis,s=t.numberOfMonths,o=n,l=0,c=new z(this.ctx),h="month",u=0;if(e.minDate>1){l=(c.determineDaysOfMonths(n+1,e.minYear)-i+1)*r,o=x.monthMod(n+1);var d=a+u,f=x.monthMod(o),g=o;0===o&&(h="year",g=d,f=1,d+=u+=1),this.timeScaleArray.push({position:l,value:g,unit:h,year:d,month:f})}else this.timeScaleArray.push({position:l,value:o,unit:h,year:a,month:x.monthMod(n)});for(var p=o+1,m=l,v=0,b=1;v<s;v++,b++){0===(p=x.monthMod(p))?(h="year",u+=1):h="month";var y=this._getYear(a,p,u);m=c.determineDaysOfMonths(p,y)*r+m;var w=0===p?y:p;this.timeScaleArray.push({position:m,value:w,unit:h,year:y,month:0===p?1:p}),p++}}},{key:"generateDayScale",value:function(t){var e=t.firstVal,i=t.currentMonth,n=t.currentYear,a=t.hoursWidthOnXAxis,r=t.numberOfDays,s=new z(this.ctx),o="day",l=e.minDate+1,c=l,h=function(t,e,i){return t>s.determineDaysOfMonths(e+1,i)?(c=1,o="month",d=e+=1,e):e},u=(24-e.minHour)*a,d=l,f=h(c,i,n);0===e.minHour&&1===e.minDate?(u=0,d=x.monthMod(e.minMonth),o="month",c=e.minDate,r++):1!==e.minDate&&0===e.minHour&&0===e.minMinute&&(u=0,l=e.minDate,d=l,f=h(c=l,i,n)),this.timeScaleArray.push({position:u,value:d,unit:o,year:this._getYear(n,f,0),month:x.monthMod(f),day:c});for(var g=u,p=0;p<r;p++){o="day",f=h(c+=1,f,this._getYear(n,f,0));var m=this._getYear(n,f,0);g=24*a+g;var v=1===c?x.monthMod(f):c;this.timeScaleArray.push({position:g,value:v,unit:o,year:m,month:x.monthMod(f),day:v})}}},{key:"generateHourScale",value:function(t){var e=t.firstVal,i=t.currentDate,n=t.currentMonth,a=t.currentYear,r=t.minutesWidthOnXAxis,s=t.numberOfHours,o=new z(this.ctx),l="hour",c=function(t,e){return t>o.determineDaysOfMonths(e+1,a)&&(p=1,e+=1),{month:e,date:p}},h=function(t,e){return t>o.determineDaysOfMonths(e+1,a)?e+=1:e},u=60-(e.minMinute+e.minSecond/60),d=u*r,f=e.minHour+1,g=f+1;60===u&&(d=0,g=(f=e.minHour)+1);var p=i,m=h(p,n);this.timeScaleArray.push({position:d,value:f,unit:l,day:p,hour:g,year:a,month:x.monthMod(m)});for(var v=d,b=0;b<s;b++){l="hour",g>=24&&(g=0,l="day",m=c(p+=1,m).month,m=h(p,m));var y=this._getYear(a,m,0);v=0===g&&0===b?u*r:60*r+v;var w=0===g?p:g;this.timeScaleArray.push({position:v,value:w,unit:l,hour:g,day:p,year:y,month:x.monthMod(m)}),g++}}},{key:"generateMinuteScale",value:function(t){for(var e=t.currentMillisecond,i=t.currentSecond,n=t.currentMinute,a=t.currentHour,r=t.currentDate,s=t.currentMonth,o=t.currentYear,l=t.minutesWidthOnXAxis,c=t.secondsWidthOnXAxis,h=t.numberOfMinutes,u=n+1,d=r,f=s,g=o,p=a,m=(60-i-e/1e3)*c,v=0;v<h;v++)u>=60&&(u=0,24===(p+=1)&&(p=0)),this.timeScaleArray.push({position:m,value:u,unit:"minute",hour:p,minute:u,day:d,year:this._getYear(g,f,0),month:x.monthMod(f)}),m+=l,u++}},{key:"generateSecondScale",value:function(t){for(var e=t.currentMillisecond,i=t.currentSecond,n=t.currentMinute,a=t.currentHour,r=t.currentDate,s=t.currentMonth,o=t.currentYear,l=t.secondsWidthOnXAxis,c=t.numberOfSeconds,h=i+1,u=n,d=r,f=s,g=o,p=a,m=(1e3-e)/1e3*l,v=0;v<c;v++)h>=60&&(h=0,++u>=60&&(u=0,24==++p&&(p=0))),this.timeScaleArray.push({position:m,value:h,unit:"second",hour:p,minute:u,second:h,day:d,year:this._getYear(g,f,0),month:x.monthMod(f)}),m+=l,h++}},{key:"createRawDateString",value:function(t,e){var i=t.year;return 0===t.month&&(t.month=1),i+="-"+("0"+t.month.toString()).slice(-2),"day"===t.unit?i+="day"===t.unit?"-"+("0"+e).slice(-2):"-01":i+="-"+("0"+(t.day?t.day:"1")).slice(-2),"hour"===t.unit?i+="hour"===t.unit?"T"+("0"+e).slice(-2):"T00":i+="T"+("0"+(t.hour?t.hour:"0")).slice(-2),"minute"===t.unit?i+=":"+("0"+e).slice(-2):i+=":"+(t.minute?("0"+t.minute).slice(-2):"00"),"second"===t.unit?i+=":"+("0"+e).slice(-2):i+=":00",this.utc&&(i+=".000Z"),i}},{key:"formatDates",value:function(t){var e=this,i=this.w;return t.map((function(t){var n=t.value.toString(),a=new z(e.ctx),r=e.createRawDateString(t,n),s=a.getDate(a.parseDate(r));if(e.utc||(s=a.getDate(a.parseDateWithTimezone(r))),void 0===i.config.xaxis.labels.format){var o="dd MMM",l=i.config.xaxis.labels.datetimeFormatter;"year"===t.unit&&(o=l.year),"month"===t.unit&&(o=l.month),"day"===t.unit&&(o=l.day),"hour"===t.unit&&(o=l.hour),"minute"===t.unit&&(o=l.minute),"second"===t.unit&&(o=l.second),n=a.formatDate(s,o)}else n=a.formatDate(s,i.config.xaxis.labels.format);return{dateString:r,position:t.position,value:n,unit:t.unit,year:t.year,month:t.month}}))}},{key:"removeOverlappingTS",value:function(t){var e,i=this,n=new w(this.ctx),a=!1;t.length>0&&t[0].value&&t.every((function(e){return e.value.length===t[0].value.length}))&&(a=!0,e=n.getTextRects(t[0].value).width);var r=0,s=t.map((function(s,o){if(o>0&&i.w.config.xaxis.labels.hideOverlappingLabels){var l=a?e:n.getTextRects(t[r].value).width,c=t[r].position;return s.position>c+l+10?(r=o,s):null}return s}));return s.filter((function(t){return null!==t}))}},{key:"_getYear",value:function(t,e,i){return t+Math.floor(e/12)+i}}]),t}(),Ft=function(){function t(e,i){o(this,t),this.ctx=i,this.w=i.w,this.el=e}return c(t,[{key:"setupElements",value:function(){var t=this.w.globals,e=this.w.config,i=e.chart.type;t.axisCharts=["line","area","bar","rangeBar","candlestick","boxPlot","scatter","bubble","radar","heatmap","treemap"].indexOf(i)>-1,t.xyCharts=["line","area","bar","rangeBar","candlestick","boxPlot","scatter","bubble"].indexOf(i)>-1,t.isBarHorizontal=("bar"===e.chart.type||"rangeBar"===e.chart.type||"boxPlot"===e.chart.type)&&e.plotOptions.bar.horizontal,t.chartClass=".apexcharts"+t.chartID,t.dom.baseEl=this.el,t.dom.elWrap=document.createElement("div"),w.setAttrs(t.dom.elWrap,{id:t.chartClass.substring(1),class:"apexcharts-canvas "+t.chartClass.substring(1)}),this.el.appendChild(t.dom.elWrap),t.dom.Paper=new window.SVG.Doc(t.dom.elWrap),t.dom.Paper.attr({class:"apexcharts-svg","xmlns:data":"ApexChartsNS",transform:"translate(".concat(e.chart.offsetX,", ").concat(e.chart.offsetY,")")}),t.dom.Paper.node.style.background=e.chart.background,this.setSVGDimensions(),t.dom.elGraphical=t.dom.Paper.group().attr({class:"apexcharts-inner apexcharts-graphical"}),t.dom.elAnnotations=t.dom.Paper.group().attr({class:"apexcharts-annotations"}),t.dom.elDefs=t.dom.Paper.defs(),t.dom.elLegendWrap=document.createElement("div"),t.dom.elLegendWrap.classList.add("apexcharts-legend"),t.dom.elWrap.appendChild(t.dom.elLegendWrap),t.dom.Paper.add(t.dom.elGraphical),t.dom.elGraphical.add(t.dom.elDefs)}},{key:"plotChartType",value:function(t,e){var i=this.w,n=i.config,a=i.globals,r={series:[],i:[]},s={series:[],i:[]},o={series:[],i:[]},l={series:[],i:[]},c={series:[],i:[]},h={series:[],i:[]},u={series:[],i:[]};a.series.map((function(e,d){var f=0;void 0!==t[d].type?("column"===t[d].type||"bar"===t[d].type?(a.series.length>1&&n.plotOptions.bar.horizontal&&console.warn("Horizontal bars are not supported in a mixed/combo chart. Please turn off `plotOptions.bar.horizontal`"),c.series.push(e),c.i.push(d),f++,i.globals.columnSeries=c.series):"area"===t[d].type?(s.series.push(e),s.i.push(d),f++):"line"===t[d].type?(r.series.push(e),r.i.push(d),f++):"scatter"===t[d].type?(o.series.push(e),o.i.push(d)):"bubble"===t[d].type?(l.series.push(e),l.i.push(d),f++):"candlestick"===t[d].type?(h.series.push(e),h.i.push(d),f++):"boxPlot"===t[d].type?(u.series.push(e),u.i.push(d),f++):console.warn("You have specified an unrecognized chart type. Available types for this property are line/area/column/bar/scatter/bubble"),f>1&&(a.comboCharts=!0)):(r.series.push(e),r.i.push(d))}));var d=new Lt(this.ctx,e),f=new At(this.ctx,e);this.ctx.pie=new Et(this.ctx);var g=new Pt(this.ctx);this.ctx.rangeBar=new H(this.ctx,e);var p=new Tt(this.ctx),m=[];if(a.comboCharts){if(s.series.length>0&&m.push(d.draw(s.series,"area",s.i)),c.series.length>0)if(i.config.chart.stacked){var v=new kt(this.ctx,e);m.push(v.draw(c.series,c.i))}else this.ctx.bar=new R(this.ctx,e),m.push(this.ctx.bar.draw(c.series,c.i));if(r.series.length>0&&m.push(d.draw(r.series,"line",r.i)),h.series.length>0&&m.push(f.draw(h.series,h.i)),u.series.length>0&&m.push(f.draw(u.series,u.i)),o.series.length>0){var x=new Lt(this.ctx,e,!0);m.push(x.draw(o.series,"scatter",o.i))}if(l.series.length>0){var b=new Lt(this.ctx,e,!0);m.push(b.draw(l.series,"bubble",l.i))}}else switch(n.chart.type){case"line":m=d.draw(a.series,"line");break;case"area":m=d.draw(a.series,"area");break;case"bar":n.chart.stacked?m=new kt(this.ctx,e).draw(a.series):(this.ctx.bar=new R(this.ctx,e),m=this.ctx.bar.draw(a.series));break;case"candlestick":case"boxPlot":m=new At(this.ctx,e).draw(a.series);break;case"rangeBar":m=this.ctx.rangeBar.draw(a.series);break;case"heatmap":m=new _t(this.ctx,e).draw(a.series);break;case"treemap":m=new Ot(this.ctx,e).draw(a.series);break;case"pie":case"donut":case"polarArea":m=this.ctx.pie.draw(a.series);break;case"radialBar":m=g.draw(a.series);break;case"radar":m=p.draw(a.series);break;default:m=d.draw(a.series)}return m}},{key:"setSVGDimensions",value:function(){var t=this.w.globals,e=this.w.config;t.svgWidth=e.chart.width,t.svgHeight=e.chart.height;var i=x.getDimensions(this.el),n=e.chart.width.toString().split(/[0-9]+/g).pop();"%"===n?x.isNumber(i[0])&&(0===i[0].width&&(i=x.getDimensions(this.el.parentNode)),t.svgWidth=i[0]*parseInt(e.chart.width,10)/100):"px"!==n&&""!==n||(t.svgWidth=parseInt(e.chart.width,10));var a=e.chart.height.toString().split(/[0-9]+/g).pop();if("auto"!==t.svgHeight&&""!==t.svgHeight)if("%"===a){var r=x.getDimensions(this.el.parentNode);t.svgHeight=r[1]*parseInt(e.chart.height,10)/100}else t.svgHeight=parseInt(e.chart.height,10);else t.axisCharts?t.svgHeight=t.svgWidth/1.61:t.svgHeight=t.svgWidth/1.2;if(t.svgWidth<0&&(t.svgWidth=0),t.svgHeight<0&&(t.svgHeight=0),w.setAttrs(t.dom.Paper.node,{width:t.svgWidth,height:t.svgHeight}),"%"!==a){var s=e.chart.sparkline.enabled?0:t.axisCharts?e.chart.parentHeightOffset:0;t.dom.Paper.node.parentNode.parentNode.style.minHeight=t.svgHeight+s+"px"}t.dom.elWrap.style.width=t.svgWidth+"px",t.dom.elWrap.style.height=t.svgHeight+"px"}},{key:"shiftGraphPosition",value:function(){var t=this.w.globals,e=t.translateY,i={transform:"translate("+t.translateX+", "+e+")"};w.setAttrs(t.dom.elGraphical.node,i)}},{key:"resizeNonAxisCharts",value:function(){var t=this.w,e=t.globals,i=0,n=t.config.chart.sparkline.enabled?1:15;n+=t.config.grid.padding.bottom,"top"!==t.config.legend.position&&"bottom"!==t.config.legend.position||!t.config.legend.show||t.config.legend.floating||(i=new dt(this.ctx).legendHelpers.getLegendBBox().clwh+10);var a=t.globals.dom.baseEl.querySelector(".apexcharts-radialbar, .apexcharts-pie"),r=2.05*t.globals.radialSize;if(a&&!t.config.chart.sparkline.enabled&&0!==t.config.plotOptions.radialBar.startAngle){var s=x.getBoundingClientRect(a);r=s.bottom;var o=s.bottom-s.top;r=Math.max(2.05*t.globals.radialSize,o)}var l=r+e.translateY+i+n;e.dom.elLegendForeign&&e.dom.elLegendForeign.setAttribute("height",l),e.dom.elWrap.style.height=l+"px",w.setAttrs(e.dom.Paper.node,{height:l}),e.dom.Paper.node.parentNode.parentNode.style.minHeight=l+"px"}},{key:"coreCalculations",value:function(){new K(this.ctx).init()}},{key:"resetGlobals",value:function(){var t=this,e=function(){return t.w.config.series.map((function(t){return[]}))},i=new B,n=this.w.globals;i.initGlobalVars(n),n.seriesXvalues=e(),n.seriesYvalues=e()}},{key:"isMultipleY",value:function(){if(this.w.config.yaxis.constructor===Array&&this.w.config.yaxis.length>1)return this.w.globals.isMultipleYAxis=!0,!0}},{key:"xySettings",value:function(){var t=null,e=this.w;if(e.globals.axisCharts){if("back"===e.config.xaxis.crosshairs.position&&new it(this.ctx).drawXCrosshairs(),"back"===e.config.yaxis[0].crosshairs.position&&new it(this.ctx).drawYCrosshairs(),"datetime"===e.config.xaxis.type&&void 0===e.config.xaxis.labels.formatter){this.ctx.timeScale=new Nt(this.ctx);var i=[];isFinite(e.globals.minX)&&isFinite(e.globals.maxX)&&!e.globals.isBarHorizontal?i=this.ctx.timeScale.calculateTimeScaleTicks(e.globals.minX,e.globals.maxX):e.globals.isBarHorizontal&&(i=this.ctx.timeScale.calculateTimeScaleTicks(e.globals.minY,e.globals.maxY)),this.ctx.timeScale.recalcDimensionsBasedOnFormat(i)}t=new S(this.ctx).getCalculatedRatios()}return t}},{key:"updateSourceChart",value:function(t){this.ctx.w.globals.selection=void 0,this.ctx.updateHelpers._updateOptions({chart:{selection:{xaxis:{min:t.w.globals.minX,max:t.w.globals.maxX}}}},!1,!1)}},{key:"setupBrushHandler",value:function(){var t=this,e=this.w;if(e.config.chart.brush.enabled&&"function"!=typeof e.config.chart.events.selection){var i=e.config.chart.brush.targets||[e.config.chart.brush.target];i.forEach((function(e){var i=ApexCharts.getChartByID(e);i.w.globals.brushSource=t.ctx,"function"!=typeof i.w.config.chart.events.zoomed&&(i.w.config.chart.events.zoomed=function(){t.updateSourceChart(i)}),"function"!=typeof i.w.config.chart.events.scrolled&&(i.w.config.chart.events.scrolled=function(){t.updateSourceChart(i)})})),e.config.chart.events.selection=function(t,n){i.forEach((function(t){var i=ApexCharts.getChartByID(t),a=x.clone(e.config.yaxis);if(e.config.chart.brush.autoScaleYaxis&&1===i.w.globals.series.length){var s=new Z(i);a=s.autoScaleY(i,a,n)}var o=i.w.config.yaxis.reduce((function(t,e,n){return[].concat(m(t),[r(r({},i.w.config.yaxis[n]),{},{min:a[0].min,max:a[0].max})])}),[]);i.ctx.updateHelpers._updateOptions({xaxis:{min:n.xaxis.min,max:n.xaxis.max},yaxis:o},!1,!1,!1,!1)}))}}}}]),t}(),Rt=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w}return c(t,[{key:"_updateOptions",value:function(t){var e=this,i=arguments.length>1&&void 0!==arguments[1]&&arguments[1],n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],a=!(arguments.length>3&&void 0!==arguments[3])||arguments[3],r=arguments.length>4&&void 0!==arguments[4]&&arguments[4];return new Promise((function(o){var l=[e.ctx];a&&(l=e.ctx.getSyncedCharts()),e.ctx.w.globals.isExecCalled&&(l=[e.ctx],e.ctx.w.globals.isExecCalled=!1),l.forEach((function(a,c){var h=a.w;return h.globals.shouldAnimate=n,i||(h.globals.resized=!0,h.globals.dataChanged=!0,n&&a.series.getPreviousPaths()),t&&"object"===s(t)&&(a.config=new X(t),t=S.extendArrayProps(a.config,t,h),a.w.globals.chartID!==e.ctx.w.globals.chartID&&delete t.series,h.config=x.extend(h.config,t),r&&(h.globals.lastXAxis=t.xaxis?x.clone(t.xaxis):[],h.globals.lastYAxis=t.yaxis?x.clone(t.yaxis):[],h.globals.initialConfig=x.extend({},h.config),h.globals.initialSeries=x.clone(h.config.series))),a.update(t).then((function(){c===l.length-1&&o(a)}))}))}))}},{key:"_updateSeries",value:function(t,e){var i=this,n=arguments.length>2&&void 0!==arguments[2]&&arguments[2];return new Promise((function(a){var r,s=i.w;return s.globals.shouldAnimate=e,s.globals.dataChanged=!0,e&&i.ctx.series.getPreviousPaths(),s.globals.axisCharts?(0===(r=t.map((function(t,e){return i._extendSeries(t,e)}))).length&&(r=[{data:[]}]),s.config.series=r):s.config.series=t.slice(),n&&(s.globals.initialSeries=x.clone(s.config.series)),i.ctx.update().then((function(){a(i.ctx)}))}))}},{key:"_extendSeries",value:function(t,e){var i=this.w,n=i.config.series[e];return r(r({},i.config.series[e]),{},{name:t.name?t.name:n&&n.name,color:t.color?t.color:n&&n.color,type:t.type?t.type:n&&n.type,data:t.data?t.data:n&&n.data})}},{key:"toggleDataPointSelection",value:function(t,e){var i=this.w,n=null,a=".apexcharts-series[data\\:realIndex='".concat(t,"']");return i.globals.axisCharts?n=i.globals.dom.Paper.select("".concat(a," path[j='").concat(e,"'], ").concat(a," circle[j='").concat(e,"'], ").concat(a," rect[j='").concat(e,"']")).members[0]:void 0===e&&(n=i.globals.dom.Paper.select("".concat(a," path[j='").concat(t,"']")).members[0],"pie"!==i.config.chart.type&&"polarArea"!==i.config.chart.type&&"donut"!==i.config.chart.type||this.ctx.pie.pieClicked(t)),n?(new w(this.ctx).pathMouseDown(n,null),n.node?n.node:null):(console.warn("toggleDataPointSelection: Element not found"),null)}},{key:"forceXAxisUpdate",value:function(t){var e=this.w;if(["min","max"].forEach((function(i){void 0!==t.xaxis[i]&&(e.config.xaxis[i]=t.xaxis[i],e.globals.lastXAxis[i]=t.xaxis[i])})),t.xaxis.categories&&t.xaxis.categories.length&&(e.config.xaxis.categories=t.xaxis.categories),e.config.xaxis.convertedCatToNumeric){var i=new Y(t);t=i.convertCatToNumericXaxis(t,this.ctx)}return t}},{key:"forceYAxisUpdate",value:function(t){var e=this.w;return e.config.chart.stacked&&"100%"===e.config.chart.stackType&&(Array.isArray(t.yaxis)?t.yaxis.forEach((function(e,i){t.yaxis[i].min=0,t.yaxis[i].max=100})):(t.yaxis.min=0,t.yaxis.max=100)),t}},{key:"revertDefaultAxisMinMax",value:function(t){var e=this,i=this.w,n=i.globals.lastXAxis,a=i.globals.lastYAxis;t&&t.xaxis&&(n=t.xaxis),t&&t.yaxis&&(a=t.yaxis),i.config.xaxis.min=n.min,i.config.xaxis.max=n.max,i.config.yaxis.map((function(t,n){i.globals.zoomed||void 0!==a[n]?function(t){void 0!==a[t]&&(i.config.yaxis[t].min=a[t].min,i.config.yaxis[t].max=a[t].max)}(n):void 0!==e.ctx.opts.yaxis[n]&&(t.min=e.ctx.opts.yaxis[n].min,t.max=e.ctx.opts.yaxis[n].max)}))}}]),t}();Dt="undefined"!=typeof window?window:void 0,It=function(t,e){var i=(void 0!==this?this:t).SVG=function(t){if(i.supported)return t=new i.Doc(t),i.parser.draw||i.prepare(),t};if(i.ns="http://www.w3.org/2000/svg",i.xmlns="http://www.w3.org/2000/xmlns/",i.xlink="http://www.w3.org/1999/xlink",i.svgjs="http://svgjs.dev",i.supported=!0,!i.supported)return!1;i.did=1e3,i.eid=function(t){return"Svgjs"+u(t)+i.did++},i.create=function(t){var i=e.createElementNS(this.ns,t);return i.setAttribute("id",this.eid(t)),i},i.extend=function(){var t,e;e=(t=[].slice.call(arguments)).pop();for(var n=t.length-1;n>=0;n--)if(t[n])for(var a in e)t[n].prototype[a]=e[a];i.Set&&i.Set.inherit&&i.Set.inherit()},i.invent=function(t){var e="function"==typeof t.create?t.create:function(){this.constructor.call(this,i.create(t.create))};return t.inherit&&(e.prototype=new t.inherit),t.extend&&i.extend(e,t.extend),t.construct&&i.extend(t.parent||i.Container,t.construct),e},i.adopt=function(e){return e?e.instance?e.instance:((n="svg"==e.nodeName?e.parentNode instanceof t.SVGElement?new i.Nested:new i.Doc:"linearGradient"==e.nodeName?new i.Gradient("linear"):"radialGradient"==e.nodeName?new i.Gradient("radial"):i[u(e.nodeName)]?new(i[u(e.nodeName)]):new i.Element(e)).type=e.nodeName,n.node=e,e.instance=n,n instanceof i.Doc&&n.namespace().defs(),n.setData(JSON.parse(e.getAttribute("svgjs:data"))||{}),n):null;var n},i.prepare=function(){var t=e.getElementsByTagName("body")[0],n=(t?new i.Doc(t):i.adopt(e.documentElement).nested()).size(2,0);i.parser={body:t||e.documentElement,draw:n.style("opacity:0;position:absolute;left:-100%;top:-100%;overflow:hidden").node,poly:n.polyline().node,path:n.path().node,native:i.create("svg")}},i.parser={native:i.create("svg")},e.addEventListener("DOMContentLoaded",(function(){i.parser.draw||i.prepare()}),!1),i.regex={numberAndUnit:/^([+-]?(\d+(\.\d*)?|\.\d+)(e[+-]?\d+)?)([a-z%]*)$/i,hex:/^#?([a-f\d]{2})([a-f\d]{2})([a-f\d]{2})$/i,rgb:/rgb\((\d+),(\d+),(\d+)\)/,reference:/#([a-z0-9\-_]+)/i,transforms:/\)\s*,?\s*/,whitespace:/\s/g,isHex:/^#[a-f0-9]{3,6}$/i,isRgb:/^rgb\(/,isCss:/[^:]+:[^;]+;?/,isBlank:/^(\s+)?$/,isNumber:/^[+-]?(\d+(\.\d*)?|\.\d+)(e[+-]?\d+)?$/i,isPercent:/^-?[\d\.]+%$/,isImage:/\.(jpg|jpeg|png|gif|svg)(\?[^=]+.*)?/i,delimiter:/[\s,]+/,hyphen:/([^e])\-/gi,pathLetters:/[MLHVCSQTAZ]/gi,isPathLetter:/[MLHVCSQTAZ]/i,numbersWithDots:/((\d?\.\d+(?:e[+-]?\d+)?)((?:\.\d+(?:e[+-]?\d+)?)+))+/gi,dots:/\./g},i.utils={map:function(t,e){for(var i=t.length,n=[],a=0;a<i;a++)n.push(e(t[a]));return n},filter:function(t,e){for(var i=t.length,n=[],a=0;a<i;a++)e(t[a])&&n.push(t[a]);return n},filterSVGElements:function(e){return this.filter(e,(function(e){return e instanceof t.SVGElement}))}},i.defaults={attrs:{"fill-opacity":1,"stroke-opacity":1,"stroke-width":0,"stroke-linejoin":"miter","stroke-linecap":"butt",fill:"#000000",stroke:"#000000",opacity:1,x:0,y:0,cx:0,cy:0,width:0,height:0,r:0,rx:0,ry:0,offset:0,"stop-opacity":1,"stop-color":"#000000","font-size":16,"font-family":"Helvetica, Arial, sans-serif","text-anchor":"start"}},i.Color=function(t){var e,n;this.r=0,this.g=0,this.b=0,t&&("string"==typeof t?i.regex.isRgb.test(t)?(e=i.regex.rgb.exec(t.replace(i.regex.whitespace,"")),this.r=parseInt(e[1]),this.g=parseInt(e[2]),this.b=parseInt(e[3])):i.regex.isHex.test(t)&&(e=i.regex.hex.exec(4==(n=t).length?["#",n.substring(1,2),n.substring(1,2),n.substring(2,3),n.substring(2,3),n.substring(3,4),n.substring(3,4)].join(""):n),this.r=parseInt(e[1],16),this.g=parseInt(e[2],16),this.b=parseInt(e[3],16)):"object"===s(t)&&(this.r=t.r,this.g=t.g,this.b=t.b))},i.extend(i.Color,{toString:function(){return this.toHex()},toHex:function(){return"#"+d(this.r)+d(this.g)+d(this.b)},toRgb:function(){return"rgb("+[this.r,this.g,this.b].join()+")"},brightness:function(){return this.r/255*.3+this.g/255*.59+this.b/255*.11},morph:function(t){return this.destination=new i.Color(t),this},at:function(t){return this.destination?(t=t<0?0:t>1?1:t,new i.Color({r:~~(this.r+(this.destination.r-this.r)*t),g:~~(this.g+(this.destination.g-this.g)*t),b:~~(this.b+(this.destination.b-this.b)*t)})):this}}),i.Color.test=function(t){return t+="",i.regex.isHex.test(t)||i.regex.isRgb.test(t)},i.Color.isRgb=function(t){return t&&"number"==typeof t.r&&"number"==typeof t.g&&"number"==typeof t.b},i.Color.isColor=function(t){return i.Color.isRgb(t)||i.Color.test(t)},i.Array=function(t,e){0==(t=(t||[]).valueOf()).length&&e&&(t=e.valueOf()),this.value=this.parse(t)},i.extend(i.Array,{toString:function(){return this.value.join(" ")},valueOf:function(){return this.value},parse:function(t){return t=t.valueOf(),Array.isArray(t)?t:this.split(t)}}),i.PointArray=function(t,e){i.Array.call(this,t,e||[[0,0]])},i.PointArray.prototype=new i.Array,i.PointArray.prototype.constructor=i.PointArray;for(var n={M:function(t,e,i){return e.x=i.x=t[0],e.y=i.y=t[1],["M",e.x,e.y]},L:function(t,e){return e.x=t[0],e.y=t[1],["L",t[0],t[1]]},H:function(t,e){return e.x=t[0],["H",t[0]]},V:function(t,e){return e.y=t[0],["V",t[0]]},C:function(t,e){return e.x=t[4],e.y=t[5],["C",t[0],t[1],t[2],t[3],t[4],t[5]]},Q:function(t,e){return e.x=t[2],e.y=t[3],["Q",t[0],t[1],t[2],t[3]]},Z:function(t,e,i){return e.x=i.x,e.y=i.y,["Z"]}},a="mlhvqtcsaz".split(""),r=0,o=a.length;r<o;++r)n[a[r]]=function(t){return function(e,i,a){if("H"==t)e[0]=e[0]+i.x;else if("V"==t)e[0]=e[0]+i.y;else if("A"==t)e[5]=e[5]+i.x,e[6]=e[6]+i.y;else for(var r=0,s=e.length;r<s;++r)e[r]=e[r]+(r%2?i.y:i.x);if(n&&"function"==typeof n[t])return n[t](e,i,a)}}(a[r].toUpperCase());i.PathArray=function(t,e){i.Array.call(this,t,e||[["M",0,0]])},i.PathArray.prototype=new i.Array,i.PathArray.prototype.constructor=i.PathArray,i.extend(i.PathArray,{toString:function(){return function(t){for(var e=0,i=t.length,n="";e<i;e++)n+=t[e][0],null!=t[e][1]&&(n+=t[e][1],null!=t[e][2]&&(n+=" ",n+=t[e][2],null!=t[e][3]&&(n+=" ",n+=t[e][3],n+=" ",n+=t[e][4],null!=t[e][5]&&(n+=" ",n+=t[e][5],n+=" ",n+=t[e][6],null!=t[e][7]&&(n+=" ",n+=t[e][7])))));return n+" "}(this.value)},move:function(t,e){var i=this.bbox();return i.x,i.y,this},at:function(t){if(!this.destination)return this;for(var e=this.value,n=this.destination.value,a=[],r=new i.PathArray,s=0,o=e.length;s<o;s++){a[s]=[e[s][0]];for(var l=1,c=e[s].length;l<c;l++)a[s][l]=e[s][l]+(n[s][l]-e[s][l])*t;"A"===a[s][0]&&(a[s][4]=+(0!=a[s][4]),a[s][5]=+(0!=a[s][5]))}return r.value=a,r},parse:function(t){if(t instanceof i.PathArray)return t.valueOf();var e,a={M:2,L:2,H:1,V:1,C:6,S:4,Q:4,T:2,A:7,Z:0};t="string"==typeof t?t.replace(i.regex.numbersWithDots,c).replace(i.regex.pathLetters," $& ").replace(i.regex.hyphen,"$1 -").trim().split(i.regex.delimiter):t.reduce((function(t,e){return[].concat.call(t,e)}),[]);var r=[],s=new i.Point,o=new i.Point,l=0,h=t.length;do{i.regex.isPathLetter.test(t[l])?(e=t[l],++l):"M"==e?e="L":"m"==e&&(e="l"),r.push(n[e].call(null,t.slice(l,l+=a[e.toUpperCase()]).map(parseFloat),s,o))}while(h>l);return r},bbox:function(){return i.parser.draw||i.prepare(),i.parser.path.setAttribute("d",this.toString()),i.parser.path.getBBox()}}),i.Number=i.invent({create:function(t,e){this.value=0,this.unit=e||"","number"==typeof t?this.value=isNaN(t)?0:isFinite(t)?t:t<0?-34e37:34e37:"string"==typeof t?(e=t.match(i.regex.numberAndUnit))&&(this.value=parseFloat(e[1]),"%"==e[5]?this.value/=100:"s"==e[5]&&(this.value*=1e3),this.unit=e[5]):t instanceof i.Number&&(this.value=t.valueOf(),this.unit=t.unit)},extend:{toString:function(){return("%"==this.unit?~~(1e8*this.value)/1e6:"s"==this.unit?this.value/1e3:this.value)+this.unit},toJSON:function(){return this.toString()},valueOf:function(){return this.value},plus:function(t){return t=new i.Number(t),new i.Number(this+t,this.unit||t.unit)},minus:function(t){return t=new i.Number(t),new i.Number(this-t,this.unit||t.unit)},times:function(t){return t=new i.Number(t),new i.Number(this*t,this.unit||t.unit)},divide:function(t){return t=new i.Number(t),new i.Number(this/t,this.unit||t.unit)},to:function(t){var e=new i.Number(this);return"string"==typeof t&&(e.unit=t),e},morph:function(t){return this.destination=new i.Number(t),t.relative&&(this.destination.value+=this.value),this},at:function(t){return this.destination?new i.Number(this.destination).minus(this).times(t).plus(this):this}}}),i.Element=i.invent({create:function(t){this._stroke=i.defaults.attrs.stroke,this._event=null,this.dom={},(this.node=t)&&(this.type=t.nodeName,this.node.instance=this,this._stroke=t.getAttribute("stroke")||this._stroke)},extend:{x:function(t){return this.attr("x",t)},y:function(t){return this.attr("y",t)},cx:function(t){return null==t?this.x()+this.width()/2:this.x(t-this.width()/2)},cy:function(t){return null==t?this.y()+this.height()/2:this.y(t-this.height()/2)},move:function(t,e){return this.x(t).y(e)},center:function(t,e){return this.cx(t).cy(e)},width:function(t){return this.attr("width",t)},height:function(t){return this.attr("height",t)},size:function(t,e){var n=f(this,t,e);return this.width(new i.Number(n.width)).height(new i.Number(n.height))},clone:function(t){this.writeDataToDom();var e=m(this.node.cloneNode(!0));return t?t.add(e):this.after(e),e},remove:function(){return this.parent()&&this.parent().removeElement(this),this},replace:function(t){return this.after(t).remove(),t},addTo:function(t){return t.put(this)},putIn:function(t){return t.add(this)},id:function(t){return this.attr("id",t)},show:function(){return this.style("display","")},hide:function(){return this.style("display","none")},visible:function(){return"none"!=this.style("display")},toString:function(){return this.attr("id")},classes:function(){var t=this.attr("class");return null==t?[]:t.trim().split(i.regex.delimiter)},hasClass:function(t){return-1!=this.classes().indexOf(t)},addClass:function(t){if(!this.hasClass(t)){var e=this.classes();e.push(t),this.attr("class",e.join(" "))}return this},removeClass:function(t){return this.hasClass(t)&&this.attr("class",this.classes().filter((function(e){return e!=t})).join(" ")),this},toggleClass:function(t){return this.hasClass(t)?this.removeClass(t):this.addClass(t)},reference:function(t){return i.get(this.attr(t))},parent:function(e){var n=this;if(!n.node.parentNode)return null;if(n=i.adopt(n.node.parentNode),!e)return n;for(;n&&n.node instanceof t.SVGElement;){if("string"==typeof e?n.matches(e):n instanceof e)return n;if(!n.node.parentNode||"#document"==n.node.parentNode.nodeName)return null;n=i.adopt(n.node.parentNode)}},doc:function(){return this instanceof i.Doc?this:this.parent(i.Doc)},parents:function(t){var e=[],i=this;do{if(!(i=i.parent(t))||!i.node)break;e.push(i)}while(i.parent);return e},matches:function(t){return function(t,e){return(t.matches||t.matchesSelector||t.msMatchesSelector||t.mozMatchesSelector||t.webkitMatchesSelector||t.oMatchesSelector).call(t,e)}(this.node,t)},native:function(){return this.node},svg:function(t){var n=e.createElement("svg");if(!(t&&this instanceof i.Parent))return n.appendChild(t=e.createElement("svg")),this.writeDataToDom(),t.appendChild(this.node.cloneNode(!0)),n.innerHTML.replace(/^<svg>/,"").replace(/<\/svg>$/,"");n.innerHTML="<svg>"+t.replace(/\n/,"").replace(/<([\w:-]+)([^<]+?)\/>/g,"<$1$2></$1>")+"</svg>";for(var a=0,r=n.firstChild.childNodes.length;a<r;a++)this.node.appendChild(n.firstChild.firstChild);return this},writeDataToDom:function(){return(this.each||this.lines)&&(this.each?this:this.lines()).each((function(){this.writeDataToDom()})),this.node.removeAttribute("svgjs:data"),Object.keys(this.dom).length&&this.node.setAttribute("svgjs:data",JSON.stringify(this.dom)),this},setData:function(t){return this.dom=t,this},is:function(t){return function(t,e){return t instanceof e}(this,t)}}}),i.easing={"-":function(t){return t},"<>":function(t){return-Math.cos(t*Math.PI)/2+.5},">":function(t){return Math.sin(t*Math.PI/2)},"<":function(t){return 1-Math.cos(t*Math.PI/2)}},i.morph=function(t){return function(e,n){return new i.MorphObj(e,n).at(t)}},i.Situation=i.invent({create:function(t){this.init=!1,this.reversed=!1,this.reversing=!1,this.duration=new i.Number(t.duration).valueOf(),this.delay=new i.Number(t.delay).valueOf(),this.start=+new Date+this.delay,this.finish=this.start+this.duration,this.ease=t.ease,this.loop=0,this.loops=!1,this.animations={},this.attrs={},this.styles={},this.transforms=[],this.once={}}}),i.FX=i.invent({create:function(t){this._target=t,this.situations=[],this.active=!1,this.situation=null,this.paused=!1,this.lastPos=0,this.pos=0,this.absPos=0,this._speed=1},extend:{animate:function(t,e,n){"object"===s(t)&&(e=t.ease,n=t.delay,t=t.duration);var a=new i.Situation({duration:t||1e3,delay:n||0,ease:i.easing[e||"-"]||e});return this.queue(a),this},target:function(t){return t&&t instanceof i.Element?(this._target=t,this):this._target},timeToAbsPos:function(t){return(t-this.situation.start)/(this.situation.duration/this._speed)},absPosToTime:function(t){return this.situation.duration/this._speed*t+this.situation.start},startAnimFrame:function(){this.stopAnimFrame(),this.animationFrame=t.requestAnimationFrame(function(){this.step()}.bind(this))},stopAnimFrame:function(){t.cancelAnimationFrame(this.animationFrame)},start:function(){return!this.active&&this.situation&&(this.active=!0,this.startCurrent()),this},startCurrent:function(){return this.situation.start=+new Date+this.situation.delay/this._speed,this.situation.finish=this.situation.start+this.situation.duration/this._speed,this.initAnimations().step()},queue:function(t){return("function"==typeof t||t instanceof i.Situation)&&this.situations.push(t),this.situation||(this.situation=this.situations.shift()),this},dequeue:function(){return this.stop(),this.situation=this.situations.shift(),this.situation&&(this.situation instanceof i.Situation?this.start():this.situation.call(this)),this},initAnimations:function(){var t,e=this.situation;if(e.init)return this;for(var n in e.animations){t=this.target()[n](),Array.isArray(t)||(t=[t]),Array.isArray(e.animations[n])||(e.animations[n]=[e.animations[n]]);for(var a=t.length;a--;)e.animations[n][a]instanceof i.Number&&(t[a]=new i.Number(t[a])),e.animations[n][a]=t[a].morph(e.animations[n][a])}for(var n in e.attrs)e.attrs[n]=new i.MorphObj(this.target().attr(n),e.attrs[n]);for(var n in e.styles)e.styles[n]=new i.MorphObj(this.target().style(n),e.styles[n]);return e.initialTransformation=this.target().matrixify(),e.init=!0,this},clearQueue:function(){return this.situations=[],this},clearCurrent:function(){return this.situation=null,this},stop:function(t,e){var i=this.active;return this.active=!1,e&&this.clearQueue(),t&&this.situation&&(!i&&this.startCurrent(),this.atEnd()),this.stopAnimFrame(),this.clearCurrent()},after:function(t){var e=this.last();return this.target().on("finished.fx",(function i(n){n.detail.situation==e&&(t.call(this,e),this.off("finished.fx",i))})),this._callStart()},during:function(t){var e=this.last(),n=function(n){n.detail.situation==e&&t.call(this,n.detail.pos,i.morph(n.detail.pos),n.detail.eased,e)};return this.target().off("during.fx",n).on("during.fx",n),this.after((function(){this.off("during.fx",n)})),this._callStart()},afterAll:function(t){var e=function e(i){t.call(this),this.off("allfinished.fx",e)};return this.target().off("allfinished.fx",e).on("allfinished.fx",e),this._callStart()},last:function(){return this.situations.length?this.situations[this.situations.length-1]:this.situation},add:function(t,e,i){return this.last()[i||"animations"][t]=e,this._callStart()},step:function(t){var e,i,n;t||(this.absPos=this.timeToAbsPos(+new Date)),!1!==this.situation.loops?(e=Math.max(this.absPos,0),i=Math.floor(e),!0===this.situation.loops||i<this.situation.loops?(this.pos=e-i,n=this.situation.loop,this.situation.loop=i):(this.absPos=this.situation.loops,this.pos=1,n=this.situation.loop-1,this.situation.loop=this.situation.loops),this.situation.reversing&&(this.situation.reversed=this.situation.reversed!=Boolean((this.situation.loop-n)%2))):(this.absPos=Math.min(this.absPos,1),this.pos=this.absPos),this.pos<0&&(this.pos=0),this.situation.reversed&&(this.pos=1-this.pos);var a=this.situation.ease(this.pos);for(var r in this.situation.once)r>this.lastPos&&r<=a&&(this.situation.once[r].call(this.target(),this.pos,a),delete this.situation.once[r]);return this.active&&this.target().fire("during",{pos:this.pos,eased:a,fx:this,situation:this.situation}),this.situation?(this.eachAt(),1==this.pos&&!this.situation.reversed||this.situation.reversed&&0==this.pos?(this.stopAnimFrame(),this.target().fire("finished",{fx:this,situation:this.situation}),this.situations.length||(this.target().fire("allfinished"),this.situations.length||(this.target().off(".fx"),this.active=!1)),this.active?this.dequeue():this.clearCurrent()):!this.paused&&this.active&&this.startAnimFrame(),this.lastPos=a,this):this},eachAt:function(){var t,e=this,n=this.target(),a=this.situation;for(var r in a.animations)t=[].concat(a.animations[r]).map((function(t){return"string"!=typeof t&&t.at?t.at(a.ease(e.pos),e.pos):t})),n[r].apply(n,t);for(var r in a.attrs)t=[r].concat(a.attrs[r]).map((function(t){return"string"!=typeof t&&t.at?t.at(a.ease(e.pos),e.pos):t})),n.attr.apply(n,t);for(var r in a.styles)t=[r].concat(a.styles[r]).map((function(t){return"string"!=typeof t&&t.at?t.at(a.ease(e.pos),e.pos):t})),n.style.apply(n,t);if(a.transforms.length){t=a.initialTransformation,r=0;for(var s=a.transforms.length;r<s;r++){var o=a.transforms[r];o instanceof i.Matrix?t=o.relative?t.multiply((new i.Matrix).morph(o).at(a.ease(this.pos))):t.morph(o).at(a.ease(this.pos)):(o.relative||o.undo(t.extract()),t=t.multiply(o.at(a.ease(this.pos))))}n.matrix(t)}return this},once:function(t,e,i){var n=this.last();return i||(t=n.ease(t)),n.once[t]=e,this},_callStart:function(){return setTimeout(function(){this.start()}.bind(this),0),this}},parent:i.Element,construct:{animate:function(t,e,n){return(this.fx||(this.fx=new i.FX(this))).animate(t,e,n)},delay:function(t){return(this.fx||(this.fx=new i.FX(this))).delay(t)},stop:function(t,e){return this.fx&&this.fx.stop(t,e),this},finish:function(){return this.fx&&this.fx.finish(),this}}}),i.MorphObj=i.invent({create:function(t,e){return i.Color.isColor(e)?new i.Color(t).morph(e):i.regex.delimiter.test(t)?i.regex.pathLetters.test(t)?new i.PathArray(t).morph(e):new i.Array(t).morph(e):i.regex.numberAndUnit.test(e)?new i.Number(t).morph(e):(this.value=t,void(this.destination=e))},extend:{at:function(t,e){return e<1?this.value:this.destination},valueOf:function(){return this.value}}}),i.extend(i.FX,{attr:function(t,e,i){if("object"===s(t))for(var n in t)this.attr(n,t[n]);else this.add(t,e,"attrs");return this},plot:function(t,e,i,n){return 4==arguments.length?this.plot([t,e,i,n]):this.add("plot",new(this.target().morphArray)(t))}}),i.Box=i.invent({create:function(t,e,n,a){if(!("object"!==s(t)||t instanceof i.Element))return i.Box.call(this,null!=t.left?t.left:t.x,null!=t.top?t.top:t.y,t.width,t.height);4==arguments.length&&(this.x=t,this.y=e,this.width=n,this.height=a),v(this)}}),i.BBox=i.invent({create:function(t){if(i.Box.apply(this,[].slice.call(arguments)),t instanceof i.Element){var n;try{if(!e.documentElement.contains){for(var a=t.node;a.parentNode;)a=a.parentNode;if(a!=e)throw new Error("Element not in the dom")}n=t.node.getBBox()}catch(e){if(t instanceof i.Shape){i.parser.draw||i.prepare();var r=t.clone(i.parser.draw.instance).show();r&&r.node&&"function"==typeof r.node.getBBox&&(n=r.node.getBBox()),r&&"function"==typeof r.remove&&r.remove()}else n={x:t.node.clientLeft,y:t.node.clientTop,width:t.node.clientWidth,height:t.node.clientHeight}}i.Box.call(this,n)}},inherit:i.Box,parent:i.Element,construct:{bbox:function(){return new i.BBox(this)}}}),i.BBox.prototype.constructor=i.BBox,i.Matrix=i.invent({create:function(t){var e=p([1,0,0,1,0,0]);t=null===t?e:t instanceof i.Element?t.matrixify():"string"==typeof t?p(t.split(i.regex.delimiter).map(parseFloat)):6==arguments.length?p([].slice.call(arguments)):Array.isArray(t)?p(t):t&&"object"===s(t)?t:e;for(var n=b.length-1;n>=0;--n)this[b[n]]=null!=t[b[n]]?t[b[n]]:e[b[n]]},extend:{extract:function(){var t=g(this,0,1);g(this,1,0);var e=180/Math.PI*Math.atan2(t.y,t.x)-90;return{x:this.e,y:this.f,transformedX:(this.e*Math.cos(e*Math.PI/180)+this.f*Math.sin(e*Math.PI/180))/Math.sqrt(this.a*this.a+this.b*this.b),transformedY:(this.f*Math.cos(e*Math.PI/180)+this.e*Math.sin(-e*Math.PI/180))/Math.sqrt(this.c*this.c+this.d*this.d),rotation:e,a:this.a,b:this.b,c:this.c,d:this.d,e:this.e,f:this.f,matrix:new i.Matrix(this)}},clone:function(){return new i.Matrix(this)},morph:function(t){return this.destination=new i.Matrix(t),this},multiply:function(t){return new i.Matrix(this.native().multiply(function(t){return t instanceof i.Matrix||(t=new i.Matrix(t)),t}(t).native()))},inverse:function(){return new i.Matrix(this.native().inverse())},translate:function(t,e){return new i.Matrix(this.native().translate(t||0,e||0))},native:function(){for(var t=i.parser.native.createSVGMatrix(),e=b.length-1;e>=0;e--)t[b[e]]=this[b[e]];return t},toString:function(){return"matrix("+x(this.a)+","+x(this.b)+","+x(this.c)+","+x(this.d)+","+x(this.e)+","+x(this.f)+")"}},parent:i.Element,construct:{ctm:function(){return new i.Matrix(this.node.getCTM())},screenCTM:function(){if(this instanceof i.Nested){var t=this.rect(1,1),e=t.node.getScreenCTM();return t.remove(),new i.Matrix(e)}return new i.Matrix(this.node.getScreenCTM())}}}),i.Point=i.invent({create:function(t,e){var i;i=Array.isArray(t)?{x:t[0],y:t[1]}:"object"===s(t)?{x:t.x,y:t.y}:null!=t?{x:t,y:null!=e?e:t}:{x:0,y:0},this.x=i.x,this.y=i.y},extend:{clone:function(){return new i.Point(this)},morph:function(t,e){return this.destination=new i.Point(t,e),this}}}),i.extend(i.Element,{point:function(t,e){return new i.Point(t,e).transform(this.screenCTM().inverse())}}),i.extend(i.Element,{attr:function(t,e,n){if(null==t){for(t={},n=(e=this.node.attributes).length-1;n>=0;n--)t[e[n].nodeName]=i.regex.isNumber.test(e[n].nodeValue)?parseFloat(e[n].nodeValue):e[n].nodeValue;return t}if("object"===s(t))for(var a in t)this.attr(a,t[a]);else if(null===e)this.node.removeAttribute(t);else{if(null==e)return null==(e=this.node.getAttribute(t))?i.defaults.attrs[t]:i.regex.isNumber.test(e)?parseFloat(e):e;"stroke-width"==t?this.attr("stroke",parseFloat(e)>0?this._stroke:null):"stroke"==t&&(this._stroke=e),"fill"!=t&&"stroke"!=t||(i.regex.isImage.test(e)&&(e=this.doc().defs().image(e,0,0)),e instanceof i.Image&&(e=this.doc().defs().pattern(0,0,(function(){this.add(e)})))),"number"==typeof e?e=new i.Number(e):i.Color.isColor(e)?e=new i.Color(e):Array.isArray(e)&&(e=new i.Array(e)),"leading"==t?this.leading&&this.leading(e):"string"==typeof n?this.node.setAttributeNS(n,t,e.toString()):this.node.setAttribute(t,e.toString()),!this.rebuild||"font-size"!=t&&"x"!=t||this.rebuild(t,e)}return this}}),i.extend(i.Element,{transform:function(t,e){var n;return"object"!==s(t)?(n=new i.Matrix(this).extract(),"string"==typeof t?n[t]:n):(n=new i.Matrix(this),e=!!e||!!t.relative,null!=t.a&&(n=e?n.multiply(new i.Matrix(t)):new i.Matrix(t)),this.attr("transform",n))}}),i.extend(i.Element,{untransform:function(){return this.attr("transform",null)},matrixify:function(){return(this.attr("transform")||"").split(i.regex.transforms).slice(0,-1).map((function(t){var e=t.trim().split("(");return[e[0],e[1].split(i.regex.delimiter).map((function(t){return parseFloat(t)}))]})).reduce((function(t,e){return"matrix"==e[0]?t.multiply(p(e[1])):t[e[0]].apply(t,e[1])}),new i.Matrix)},toParent:function(t){if(this==t)return this;var e=this.screenCTM(),i=t.screenCTM().inverse();return this.addTo(t).untransform().transform(i.multiply(e)),this},toDoc:function(){return this.toParent(this.doc())}}),i.Transformation=i.invent({create:function(t,e){if(arguments.length>1&&"boolean"!=typeof e)return this.constructor.call(this,[].slice.call(arguments));if(Array.isArray(t))for(var i=0,n=this.arguments.length;i<n;++i)this[this.arguments[i]]=t[i];else if(t&&"object"===s(t))for(i=0,n=this.arguments.length;i<n;++i)this[this.arguments[i]]=t[this.arguments[i]];this.inversed=!1,!0===e&&(this.inversed=!0)}}),i.Translate=i.invent({parent:i.Matrix,inherit:i.Transformation,create:function(t,e){this.constructor.apply(this,[].slice.call(arguments))},extend:{arguments:["transformedX","transformedY"],method:"translate"}}),i.extend(i.Element,{style:function(t,e){if(0==arguments.length)return this.node.style.cssText||"";if(arguments.length<2)if("object"===s(t))for(var n in t)this.style(n,t[n]);else{if(!i.regex.isCss.test(t))return this.node.style[h(t)];for(t=t.split(/\s*;\s*/).filter((function(t){return!!t})).map((function(t){return t.split(/\s*:\s*/)}));e=t.pop();)this.style(e[0],e[1])}else this.node.style[h(t)]=null===e||i.regex.isBlank.test(e)?"":e;return this}}),i.Parent=i.invent({create:function(t){this.constructor.call(this,t)},inherit:i.Element,extend:{children:function(){return i.utils.map(i.utils.filterSVGElements(this.node.childNodes),(function(t){return i.adopt(t)}))},add:function(t,e){return null==e?this.node.appendChild(t.node):t.node!=this.node.childNodes[e]&&this.node.insertBefore(t.node,this.node.childNodes[e]),this},put:function(t,e){return this.add(t,e),t},has:function(t){return this.index(t)>=0},index:function(t){return[].slice.call(this.node.childNodes).indexOf(t.node)},get:function(t){return i.adopt(this.node.childNodes[t])},first:function(){return this.get(0)},last:function(){return this.get(this.node.childNodes.length-1)},each:function(t,e){for(var n=this.children(),a=0,r=n.length;a<r;a++)n[a]instanceof i.Element&&t.apply(n[a],[a,n]),e&&n[a]instanceof i.Container&&n[a].each(t,e);return this},removeElement:function(t){return this.node.removeChild(t.node),this},clear:function(){for(;this.node.hasChildNodes();)this.node.removeChild(this.node.lastChild);return delete this._defs,this},defs:function(){return this.doc().defs()}}}),i.extend(i.Parent,{ungroup:function(t,e){return 0===e||this instanceof i.Defs||this.node==i.parser.draw||(t=t||(this instanceof i.Doc?this:this.parent(i.Parent)),e=e||1/0,this.each((function(){return this instanceof i.Defs?this:this instanceof i.Parent?this.ungroup(t,e-1):this.toParent(t)})),this.node.firstChild||this.remove()),this},flatten:function(t,e){return this.ungroup(t,e)}}),i.Container=i.invent({create:function(t){this.constructor.call(this,t)},inherit:i.Parent}),i.ViewBox=i.invent({parent:i.Container,construct:{}}),["click","dblclick","mousedown","mouseup","mouseover","mouseout","mousemove","touchstart","touchmove","touchleave","touchend","touchcancel"].forEach((function(t){i.Element.prototype[t]=function(e){return i.on(this.node,t,e),this}})),i.listeners=[],i.handlerMap=[],i.listenerId=0,i.on=function(t,e,n,a,r){var s=n.bind(a||t.instance||t),o=(i.handlerMap.indexOf(t)+1||i.handlerMap.push(t))-1,l=e.split(".")[0],c=e.split(".")[1]||"*";i.listeners[o]=i.listeners[o]||{},i.listeners[o][l]=i.listeners[o][l]||{},i.listeners[o][l][c]=i.listeners[o][l][c]||{},n._svgjsListenerId||(n._svgjsListenerId=++i.listenerId),i.listeners[o][l][c][n._svgjsListenerId]=s,t.addEventListener(l,s,r||{passive:!0})},i.off=function(t,e,n){var a=i.handlerMap.indexOf(t),r=e&&e.split(".")[0],s=e&&e.split(".")[1],o="";if(-1!=a)if(n){if("function"==typeof n&&(n=n._svgjsListenerId),!n)return;i.listeners[a][r]&&i.listeners[a][r][s||"*"]&&(t.removeEventListener(r,i.listeners[a][r][s||"*"][n],!1),delete i.listeners[a][r][s||"*"][n])}else if(s&&r){if(i.listeners[a][r]&&i.listeners[a][r][s]){for(var l in i.listeners[a][r][s])i.off(t,[r,s].join("."),l);delete i.listeners[a][r][s]}}else if(s)for(var c in i.listeners[a])for(var o in i.listeners[a][c])s===o&&i.off(t,[c,s].join("."));else if(r){if(i.listeners[a][r]){for(var o in i.listeners[a][r])i.off(t,[r,o].join("."));delete i.listeners[a][r]}}else{for(var c in i.listeners[a])i.off(t,c);delete i.listeners[a],delete i.handlerMap[a]}},i.extend(i.Element,{on:function(t,e,n,a){return i.on(this.node,t,e,n,a),this},off:function(t,e){return i.off(this.node,t,e),this},fire:function(e,n){return e instanceof t.Event?this.node.dispatchEvent(e):this.node.dispatchEvent(e=new i.CustomEvent(e,{detail:n,cancelable:!0})),this._event=e,this},event:function(){return this._event}}),i.Defs=i.invent({create:"defs",inherit:i.Container}),i.G=i.invent({create:"g",inherit:i.Container,extend:{x:function(t){return null==t?this.transform("x"):this.transform({x:t-this.x()},!0)}},construct:{group:function(){return this.put(new i.G)}}}),i.Doc=i.invent({create:function(t){t&&("svg"==(t="string"==typeof t?e.getElementById(t):t).nodeName?this.constructor.call(this,t):(this.constructor.call(this,i.create("svg")),t.appendChild(this.node),this.size("100%","100%")),this.namespace().defs())},inherit:i.Container,extend:{namespace:function(){return this.attr({xmlns:i.ns,version:"1.1"}).attr("xmlns:xlink",i.xlink,i.xmlns).attr("xmlns:svgjs",i.svgjs,i.xmlns)},defs:function(){var t;return this._defs||((t=this.node.getElementsByTagName("defs")[0])?this._defs=i.adopt(t):this._defs=new i.Defs,this.node.appendChild(this._defs.node)),this._defs},parent:function(){return this.node.parentNode&&"#document"!=this.node.parentNode.nodeName?this.node.parentNode:null},remove:function(){return this.parent()&&this.parent().removeChild(this.node),this},clear:function(){for(;this.node.hasChildNodes();)this.node.removeChild(this.node.lastChild);return delete this._defs,i.parser.draw&&!i.parser.draw.parentNode&&this.node.appendChild(i.parser.draw),this},clone:function(t){this.writeDataToDom();var e=this.node,i=m(e.cloneNode(!0));return t?(t.node||t).appendChild(i.node):e.parentNode.insertBefore(i.node,e.nextSibling),i}}}),i.extend(i.Element,{}),i.Gradient=i.invent({create:function(t){this.constructor.call(this,i.create(t+"Gradient")),this.type=t},inherit:i.Container,extend:{at:function(t,e,n){return this.put(new i.Stop).update(t,e,n)},update:function(t){return this.clear(),"function"==typeof t&&t.call(this,this),this},fill:function(){return"url(#"+this.id()+")"},toString:function(){return this.fill()},attr:function(t,e,n){return"transform"==t&&(t="gradientTransform"),i.Container.prototype.attr.call(this,t,e,n)}},construct:{gradient:function(t,e){return this.defs().gradient(t,e)}}}),i.extend(i.Gradient,i.FX,{from:function(t,e){return"radial"==(this._target||this).type?this.attr({fx:new i.Number(t),fy:new i.Number(e)}):this.attr({x1:new i.Number(t),y1:new i.Number(e)})},to:function(t,e){return"radial"==(this._target||this).type?this.attr({cx:new i.Number(t),cy:new i.Number(e)}):this.attr({x2:new i.Number(t),y2:new i.Number(e)})}}),i.extend(i.Defs,{gradient:function(t,e){return this.put(new i.Gradient(t)).update(e)}}),i.Stop=i.invent({create:"stop",inherit:i.Element,extend:{update:function(t){return("number"==typeof t||t instanceof i.Number)&&(t={offset:arguments[0],color:arguments[1],opacity:arguments[2]}),null!=t.opacity&&this.attr("stop-opacity",t.opacity),null!=t.color&&this.attr("stop-color",t.color),null!=t.offset&&this.attr("offset",new i.Number(t.offset)),this}}}),i.Pattern=i.invent({create:"pattern",inherit:i.Container,extend:{fill:function(){return"url(#"+this.id()+")"},update:function(t){return this.clear(),"function"==typeof t&&t.call(this,this),this},toString:function(){return this.fill()},attr:function(t,e,n){return"transform"==t&&(t="patternTransform"),i.Container.prototype.attr.call(this,t,e,n)}},construct:{pattern:function(t,e,i){return this.defs().pattern(t,e,i)}}}),i.extend(i.Defs,{pattern:function(t,e,n){return this.put(new i.Pattern).update(n).attr({x:0,y:0,width:t,height:e,patternUnits:"userSpaceOnUse"})}}),i.Shape=i.invent({create:function(t){this.constructor.call(this,t)},inherit:i.Element}),i.Symbol=i.invent({create:"symbol",inherit:i.Container,construct:{symbol:function(){return this.put(new i.Symbol)}}}),i.Use=i.invent({create:"use",inherit:i.Shape,extend:{element:function(t,e){return this.attr("href",(e||"")+"#"+t,i.xlink)}},construct:{use:function(t,e){return this.put(new i.Use).element(t,e)}}}),i.Rect=i.invent({create:"rect",inherit:i.Shape,construct:{rect:function(t,e){return this.put(new i.Rect).size(t,e)}}}),i.Circle=i.invent({create:"circle",inherit:i.Shape,construct:{circle:function(t){return this.put(new i.Circle).rx(new i.Number(t).divide(2)).move(0,0)}}}),i.extend(i.Circle,i.FX,{rx:function(t){return this.attr("r",t)},ry:function(t){return this.rx(t)}}),i.Ellipse=i.invent({create:"ellipse",inherit:i.Shape,construct:{ellipse:function(t,e){return this.put(new i.Ellipse).size(t,e).move(0,0)}}}),i.extend(i.Ellipse,i.Rect,i.FX,{rx:function(t){return this.attr("rx",t)},ry:function(t){return this.attr("ry",t)}}),i.extend(i.Circle,i.Ellipse,{x:function(t){return null==t?this.cx()-this.rx():this.cx(t+this.rx())},y:function(t){return null==t?this.cy()-this.ry():this.cy(t+this.ry())},cx:function(t){return null==t?this.attr("cx"):this.attr("cx",t)},cy:function(t){return null==t?this.attr("cy"):this.attr("cy",t)},width:function(t){return null==t?2*this.rx():this.rx(new i.Number(t).divide(2))},height:function(t){return null==t?2*this.ry():this.ry(new i.Number(t).divide(2))},size:function(t,e){var n=f(this,t,e);return this.rx(new i.Number(n.width).divide(2)).ry(new i.Number(n.height).divide(2))}}),i.Line=i.invent({create:"line",inherit:i.Shape,extend:{array:function(){return new i.PointArray([[this.attr("x1"),this.attr("y1")],[this.attr("x2"),this.attr("y2")]])},plot:function(t,e,n,a){return null==t?this.array():(t=void 0!==e?{x1:t,y1:e,x2:n,y2:a}:new i.PointArray(t).toLine(),this.attr(t))},move:function(t,e){return this.attr(this.array().move(t,e).toLine())},size:function(t,e){var i=f(this,t,e);return this.attr(this.array().size(i.width,i.height).toLine())}},construct:{line:function(t,e,n,a){return i.Line.prototype.plot.apply(this.put(new i.Line),null!=t?[t,e,n,a]:[0,0,0,0])}}}),i.Polyline=i.invent({create:"polyline",inherit:i.Shape,construct:{polyline:function(t){return this.put(new i.Polyline).plot(t||new i.PointArray)}}}),i.Polygon=i.invent({create:"polygon",inherit:i.Shape,construct:{polygon:function(t){return this.put(new i.Polygon).plot(t||new i.PointArray)}}}),i.extend(i.Polyline,i.Polygon,{array:function(){return this._array||(this._array=new i.PointArray(this.attr("points")))},plot:function(t){return null==t?this.array():this.clear().attr("points","string"==typeof t?t:this._array=new i.PointArray(t))},clear:function(){return delete this._array,this},move:function(t,e){return this.attr("points",this.array().move(t,e))},size:function(t,e){var i=f(this,t,e);return this.attr("points",this.array().size(i.width,i.height))}}),i.extend(i.Line,i.Polyline,i.Polygon,{morphArray:i.PointArray,x:function(t){return null==t?this.bbox().x:this.move(t,this.bbox().y)},y:function(t){return null==t?this.bbox().y:this.move(this.bbox().x,t)},width:function(t){var e=this.bbox();return null==t?e.width:this.size(t,e.height)},height:function(t){var e=this.bbox();return null==t?e.height:this.size(e.width,t)}}),i.Path=i.invent({create:"path",inherit:i.Shape,extend:{morphArray:i.PathArray,array:function(){return this._array||(this._array=new i.PathArray(this.attr("d")))},plot:function(t){return null==t?this.array():this.clear().attr("d","string"==typeof t?t:this._array=new i.PathArray(t))},clear:function(){return delete this._array,this}},construct:{path:function(t){return this.put(new i.Path).plot(t||new i.PathArray)}}}),i.Image=i.invent({create:"image",inherit:i.Shape,extend:{load:function(e){if(!e)return this;var n=this,a=new t.Image;return i.on(a,"load",(function(){i.off(a);var t=n.parent(i.Pattern);null!==t&&(0==n.width()&&0==n.height()&&n.size(a.width,a.height),t&&0==t.width()&&0==t.height()&&t.size(n.width(),n.height()),"function"==typeof n._loaded&&n._loaded.call(n,{width:a.width,height:a.height,ratio:a.width/a.height,url:e}))})),i.on(a,"error",(function(t){i.off(a),"function"==typeof n._error&&n._error.call(n,t)})),this.attr("href",a.src=this.src=e,i.xlink)},loaded:function(t){return this._loaded=t,this},error:function(t){return this._error=t,this}},construct:{image:function(t,e,n){return this.put(new i.Image).load(t).size(e||0,n||e||0)}}}),i.Text=i.invent({create:function(){this.constructor.call(this,i.create("text")),this.dom.leading=new i.Number(1.3),this._rebuild=!0,this._build=!1,this.attr("font-family",i.defaults.attrs["font-family"])},inherit:i.Shape,extend:{x:function(t){return null==t?this.attr("x"):this.attr("x",t)},text:function(t){if(void 0===t){t="";for(var e=this.node.childNodes,n=0,a=e.length;n<a;++n)0!=n&&3!=e[n].nodeType&&1==i.adopt(e[n]).dom.newLined&&(t+="\n"),t+=e[n].textContent;return t}if(this.clear().build(!0),"function"==typeof t)t.call(this,this);else{n=0;for(var r=(t=t.split("\n")).length;n<r;n++)this.tspan(t[n]).newLine()}return this.build(!1).rebuild()},size:function(t){return this.attr("font-size",t).rebuild()},leading:function(t){return null==t?this.dom.leading:(this.dom.leading=new i.Number(t),this.rebuild())},lines:function(){var t=(this.textPath&&this.textPath()||this).node,e=i.utils.map(i.utils.filterSVGElements(t.childNodes),(function(t){return i.adopt(t)}));return new i.Set(e)},rebuild:function(t){if("boolean"==typeof t&&(this._rebuild=t),this._rebuild){var e=this,n=0,a=this.dom.leading*new i.Number(this.attr("font-size"));this.lines().each((function(){this.dom.newLined&&(e.textPath()||this.attr("x",e.attr("x")),"\n"==this.text()?n+=a:(this.attr("dy",a+n),n=0))})),this.fire("rebuild")}return this},build:function(t){return this._build=!!t,this},setData:function(t){return this.dom=t,this.dom.leading=new i.Number(t.leading||1.3),this}},construct:{text:function(t){return this.put(new i.Text).text(t)},plain:function(t){return this.put(new i.Text).plain(t)}}}),i.Tspan=i.invent({create:"tspan",inherit:i.Shape,extend:{text:function(t){return null==t?this.node.textContent+(this.dom.newLined?"\n":""):("function"==typeof t?t.call(this,this):this.plain(t),this)},dx:function(t){return this.attr("dx",t)},dy:function(t){return this.attr("dy",t)},newLine:function(){var t=this.parent(i.Text);return this.dom.newLined=!0,this.dy(t.dom.leading*t.attr("font-size")).attr("x",t.x())}}}),i.extend(i.Text,i.Tspan,{plain:function(t){return!1===this._build&&this.clear(),this.node.appendChild(e.createTextNode(t)),this},tspan:function(t){var e=(this.textPath&&this.textPath()||this).node,n=new i.Tspan;return!1===this._build&&this.clear(),e.appendChild(n.node),n.text(t)},clear:function(){for(var t=(this.textPath&&this.textPath()||this).node;t.hasChildNodes();)t.removeChild(t.lastChild);return this},length:function(){return this.node.getComputedTextLength()}}),i.TextPath=i.invent({create:"textPath",inherit:i.Parent,parent:i.Text,construct:{morphArray:i.PathArray,array:function(){var t=this.track();return t?t.array():null},plot:function(t){var e=this.track(),i=null;return e&&(i=e.plot(t)),null==t?i:this},track:function(){var t=this.textPath();if(t)return t.reference("href")},textPath:function(){if(this.node.firstChild&&"textPath"==this.node.firstChild.nodeName)return i.adopt(this.node.firstChild)}}}),i.Nested=i.invent({create:function(){this.constructor.call(this,i.create("svg")),this.style("overflow","visible")},inherit:i.Container,construct:{nested:function(){return this.put(new i.Nested)}}});var l={stroke:["color","width","opacity","linecap","linejoin","miterlimit","dasharray","dashoffset"],fill:["color","opacity","rule"],prefix:function(t,e){return"color"==e?t:t+"-"+e}};function c(t,e,n,a){return n+a.replace(i.regex.dots," .")}function h(t){return t.toLowerCase().replace(/-(.)/g,(function(t,e){return e.toUpperCase()}))}function u(t){return t.charAt(0).toUpperCase()+t.slice(1)}function d(t){var e=t.toString(16);return 1==e.length?"0"+e:e}function f(t,e,i){if(null==e||null==i){var n=t.bbox();null==e?e=n.width/n.height*i:null==i&&(i=n.height/n.width*e)}return{width:e,height:i}}function g(t,e,i){return{x:e*t.a+i*t.c+0,y:e*t.b+i*t.d+0}}function p(t){return{a:t[0],b:t[1],c:t[2],d:t[3],e:t[4],f:t[5]}}function m(e){for(var n=e.childNodes.length-1;n>=0;n--)e.childNodes[n]instanceof t.SVGElement&&m(e.childNodes[n]);return i.adopt(e).id(i.eid(e.nodeName))}function v(t){return null==t.x&&(t.x=0,t.y=0,t.width=0,t.height=0),t.w=t.width,t.h=t.height,t.x2=t.x+t.width,t.y2=t.y+t.height,t.cx=t.x+t.width/2,t.cy=t.y+t.height/2,t}function x(t){return Math.abs(t)>1e-37?t:0}["fill","stroke"].forEach((function(t){var e={};e[t]=function(e){if(void 0===e)return this;if("string"==typeof e||i.Color.isRgb(e)||e&&"function"==typeof e.fill)this.attr(t,e);else for(var n=l[t].length-1;n>=0;n--)null!=e[l[t][n]]&&this.attr(l.prefix(t,l[t][n]),e[l[t][n]]);return this},i.extend(i.Element,i.FX,e)})),i.extend(i.Element,i.FX,{translate:function(t,e){return this.transform({x:t,y:e})},matrix:function(t){return this.attr("transform",new i.Matrix(6==arguments.length?[].slice.call(arguments):t))},opacity:function(t){return this.attr("opacity",t)},dx:function(t){return this.x(new i.Number(t).plus(this instanceof i.FX?0:this.x()),!0)},dy:function(t){return this.y(new i.Number(t).plus(this instanceof i.FX?0:this.y()),!0)}}),i.extend(i.Path,{length:function(){return this.node.getTotalLength()},pointAt:function(t){return this.node.getPointAtLength(t)}}),i.Set=i.invent({create:function(t){Array.isArray(t)?this.members=t:this.clear()},extend:{add:function(){for(var t=[].slice.call(arguments),e=0,i=t.length;e<i;e++)this.members.push(t[e]);return this},remove:function(t){var e=this.index(t);return e>-1&&this.members.splice(e,1),this},each:function(t){for(var e=0,i=this.members.length;e<i;e++)t.apply(this.members[e],[e,this.members]);return this},clear:function(){return this.members=[],this},length:function(){return this.members.length},has:function(t){return this.index(t)>=0},index:function(t){return this.members.indexOf(t)},get:function(t){return this.members[t]},first:function(){return this.get(0)},last:function(){return this.get(this.members.length-1)},valueOf:function(){return this.members}},construct:{set:function(t){return new i.Set(t)}}}),i.FX.Set=i.invent({create:function(t){this.set=t}}),i.Set.inherit=function(){var t=[];for(var e in i.Shape.prototype)"function"==typeof i.Shape.prototype[e]&&"function"!=typeof i.Set.prototype[e]&&t.push(e);for(var e in t.forEach((function(t){i.Set.prototype[t]=function(){for(var e=0,n=this.members.length;e<n;e++)this.members[e]&&"function"==typeof this.members[e][t]&&this.members[e][t].apply(this.members[e],arguments);return"animate"==t?this.fx||(this.fx=new i.FX.Set(this)):this}})),t=[],i.FX.prototype)"function"==typeof i.FX.prototype[e]&&"function"!=typeof i.FX.Set.prototype[e]&&t.push(e);t.forEach((function(t){i.FX.Set.prototype[t]=function(){for(var e=0,i=this.set.members.length;e<i;e++)this.set.members[e].fx[t].apply(this.set.members[e].fx,arguments);return this}}))},i.extend(i.Element,{}),i.extend(i.Element,{remember:function(t,e){if("object"===s(arguments[0]))for(var i in t)this.remember(i,t[i]);else{if(1==arguments.length)return this.memory()[t];this.memory()[t]=e}return this},forget:function(){if(0==arguments.length)this._memory={};else for(var t=arguments.length-1;t>=0;t--)delete this.memory()[arguments[t]];return this},memory:function(){return this._memory||(this._memory={})}}),i.get=function(t){var n=e.getElementById(function(t){var e=(t||"").toString().match(i.regex.reference);if(e)return e[1]}(t)||t);return i.adopt(n)},i.select=function(t,n){return new i.Set(i.utils.map((n||e).querySelectorAll(t),(function(t){return i.adopt(t)})))},i.extend(i.Parent,{select:function(t){return i.select(t,this.node)}});var b="abcdef".split("");if("function"!=typeof t.CustomEvent){var y=function(t,i){i=i||{bubbles:!1,cancelable:!1,detail:void 0};var n=e.createEvent("CustomEvent");return n.initCustomEvent(t,i.bubbles,i.cancelable,i.detail),n};y.prototype=t.Event.prototype,i.CustomEvent=y}else i.CustomEvent=t.CustomEvent;return i},void 0!==(n=function(){return It(Dt,Dt.document)}.call(e,i,e,t))&&(t.exports=n),function(){SVG.Filter=SVG.invent({create:"filter",inherit:SVG.Parent,extend:{source:"SourceGraphic",sourceAlpha:"SourceAlpha",background:"BackgroundImage",backgroundAlpha:"BackgroundAlpha",fill:"FillPaint",stroke:"StrokePaint",autoSetIn:!0,put:function(t,e){return this.add(t,e),!t.attr("in")&&this.autoSetIn&&t.attr("in",this.source),t.attr("result")||t.attr("result",t),t},blend:function(t,e,i){return this.put(new SVG.BlendEffect(t,e,i))},colorMatrix:function(t,e){return this.put(new SVG.ColorMatrixEffect(t,e))},convolveMatrix:function(t){return this.put(new SVG.ConvolveMatrixEffect(t))},componentTransfer:function(t){return this.put(new SVG.ComponentTransferEffect(t))},composite:function(t,e,i){return this.put(new SVG.CompositeEffect(t,e,i))},flood:function(t,e){return this.put(new SVG.FloodEffect(t,e))},offset:function(t,e){return this.put(new SVG.OffsetEffect(t,e))},image:function(t){return this.put(new SVG.ImageEffect(t))},merge:function(){var t=[void 0];for(var e in arguments)t.push(arguments[e]);return this.put(new(SVG.MergeEffect.bind.apply(SVG.MergeEffect,t)))},gaussianBlur:function(t,e){return this.put(new SVG.GaussianBlurEffect(t,e))},morphology:function(t,e){return this.put(new SVG.MorphologyEffect(t,e))},diffuseLighting:function(t,e,i){return this.put(new SVG.DiffuseLightingEffect(t,e,i))},displacementMap:function(t,e,i,n,a){return this.put(new SVG.DisplacementMapEffect(t,e,i,n,a))},specularLighting:function(t,e,i,n){return this.put(new SVG.SpecularLightingEffect(t,e,i,n))},tile:function(){return this.put(new SVG.TileEffect)},turbulence:function(t,e,i,n,a){return this.put(new SVG.TurbulenceEffect(t,e,i,n,a))},toString:function(){return"url(#"+this.attr("id")+")"}}}),SVG.extend(SVG.Defs,{filter:function(t){var e=this.put(new SVG.Filter);return"function"==typeof t&&t.call(e,e),e}}),SVG.extend(SVG.Container,{filter:function(t){return this.defs().filter(t)}}),SVG.extend(SVG.Element,SVG.G,SVG.Nested,{filter:function(t){return this.filterer=t instanceof SVG.Element?t:this.doc().filter(t),this.doc()&&this.filterer.doc()!==this.doc()&&this.doc().defs().add(this.filterer),this.attr("filter",this.filterer),this.filterer},unfilter:function(t){return this.filterer&&!0===t&&this.filterer.remove(),delete this.filterer,this.attr("filter",null)}}),SVG.Effect=SVG.invent({create:function(){this.constructor.call(this)},inherit:SVG.Element,extend:{in:function(t){return null==t?this.parent()&&this.parent().select('[result="'+this.attr("in")+'"]').get(0)||this.attr("in"):this.attr("in",t)},result:function(t){return null==t?this.attr("result"):this.attr("result",t)},toString:function(){return this.result()}}}),SVG.ParentEffect=SVG.invent({create:function(){this.constructor.call(this)},inherit:SVG.Parent,extend:{in:function(t){return null==t?this.parent()&&this.parent().select('[result="'+this.attr("in")+'"]').get(0)||this.attr("in"):this.attr("in",t)},result:function(t){return null==t?this.attr("result"):this.attr("result",t)},toString:function(){return this.result()}}});var t={blend:function(t,e){return this.parent()&&this.parent().blend(this,t,e)},colorMatrix:function(t,e){return this.parent()&&this.parent().colorMatrix(t,e).in(this)},convolveMatrix:function(t){return this.parent()&&this.parent().convolveMatrix(t).in(this)},componentTransfer:function(t){return this.parent()&&this.parent().componentTransfer(t).in(this)},composite:function(t,e){return this.parent()&&this.parent().composite(this,t,e)},flood:function(t,e){return this.parent()&&this.parent().flood(t,e)},offset:function(t,e){return this.parent()&&this.parent().offset(t,e).in(this)},image:function(t){return this.parent()&&this.parent().image(t)},merge:function(){return this.parent()&&this.parent().merge.apply(this.parent(),[this].concat(arguments))},gaussianBlur:function(t,e){return this.parent()&&this.parent().gaussianBlur(t,e).in(this)},morphology:function(t,e){return this.parent()&&this.parent().morphology(t,e).in(this)},diffuseLighting:function(t,e,i){return this.parent()&&this.parent().diffuseLighting(t,e,i).in(this)},displacementMap:function(t,e,i,n){return this.parent()&&this.parent().displacementMap(this,t,e,i,n)},specularLighting:function(t,e,i,n){return this.parent()&&this.parent().specularLighting(t,e,i,n).in(this)},tile:function(){return this.parent()&&this.parent().tile().in(this)},turbulence:function(t,e,i,n,a){return this.parent()&&this.parent().turbulence(t,e,i,n,a).in(this)}};SVG.extend(SVG.Effect,t),SVG.extend(SVG.ParentEffect,t),SVG.ChildEffect=SVG.invent({create:function(){this.constructor.call(this)},inherit:SVG.Element,extend:{in:function(t){this.attr("in",t)}}});var e={blend:function(t,e,i){this.attr({in:t,in2:e,mode:i||"normal"})},colorMatrix:function(t,e){"matrix"==t&&(e=a(e)),this.attr({type:t,values:void 0===e?null:e})},convolveMatrix:function(t){t=a(t),this.attr({order:Math.sqrt(t.split(" ").length),kernelMatrix:t})},composite:function(t,e,i){this.attr({in:t,in2:e,operator:i})},flood:function(t,e){this.attr("flood-color",t),null!=e&&this.attr("flood-opacity",e)},offset:function(t,e){this.attr({dx:t,dy:e})},image:function(t){this.attr("href",t,SVG.xlink)},displacementMap:function(t,e,i,n,a){this.attr({in:t,in2:e,scale:i,xChannelSelector:n,yChannelSelector:a})},gaussianBlur:function(t,e){null!=t||null!=e?this.attr("stdDeviation",r(Array.prototype.slice.call(arguments))):this.attr("stdDeviation","0 0")},morphology:function(t,e){this.attr({operator:t,radius:e})},tile:function(){},turbulence:function(t,e,i,n,a){this.attr({numOctaves:e,seed:i,stitchTiles:n,baseFrequency:t,type:a})}},i={merge:function(){var t;if(arguments[0]instanceof SVG.Set){var e=this;arguments[0].each((function(t){this instanceof SVG.MergeNode?e.put(this):(this instanceof SVG.Effect||this instanceof SVG.ParentEffect)&&e.put(new SVG.MergeNode(this))}))}else{t=Array.isArray(arguments[0])?arguments[0]:arguments;for(var i=0;i<t.length;i++)t[i]instanceof SVG.MergeNode?this.put(t[i]):this.put(new SVG.MergeNode(t[i]))}},componentTransfer:function(t){if(this.rgb=new SVG.Set,["r","g","b","a"].forEach(function(t){this[t]=new(SVG["Func"+t.toUpperCase()])("identity"),this.rgb.add(this[t]),this.node.appendChild(this[t].node)}.bind(this)),t)for(var e in t.rgb&&(["r","g","b"].forEach(function(e){this[e].attr(t.rgb)}.bind(this)),delete t.rgb),t)this[e].attr(t[e])},diffuseLighting:function(t,e,i){this.attr({surfaceScale:t,diffuseConstant:e,kernelUnitLength:i})},specularLighting:function(t,e,i,n){this.attr({surfaceScale:t,diffuseConstant:e,specularExponent:i,kernelUnitLength:n})}},n={distantLight:function(t,e){this.attr({azimuth:t,elevation:e})},pointLight:function(t,e,i){this.attr({x:t,y:e,z:i})},spotLight:function(t,e,i,n,a,r){this.attr({x:t,y:e,z:i,pointsAtX:n,pointsAtY:a,pointsAtZ:r})},mergeNode:function(t){this.attr("in",t)}};function a(t){return Array.isArray(t)&&(t=new SVG.Array(t)),t.toString().replace(/^\s+/,"").replace(/\s+$/,"").replace(/\s+/g," ")}function r(t){if(!Array.isArray(t))return t;for(var e=0,i=t.length,n=[];e<i;e++)n.push(t[e]);return n.join(" ")}function s(){var t=function(){};for(var e in"function"==typeof arguments[arguments.length-1]&&(t=arguments[arguments.length-1],Array.prototype.splice.call(arguments,arguments.length-1,1)),arguments)for(var i in arguments[e])t(arguments[e][i],i,arguments[e])}["r","g","b","a"].forEach((function(t){n["Func"+t.toUpperCase()]=function(t){switch(this.attr("type",t),t){case"table":this.attr("tableValues",arguments[1]);break;case"linear":this.attr("slope",arguments[1]),this.attr("intercept",arguments[2]);break;case"gamma":this.attr("amplitude",arguments[1]),this.attr("exponent",arguments[2]),this.attr("offset",arguments[2])}}})),s(e,(function(t,e){var i=e.charAt(0).toUpperCase()+e.slice(1);SVG[i+"Effect"]=SVG.invent({create:function(){this.constructor.call(this,SVG.create("fe"+i)),t.apply(this,arguments),this.result(this.attr("id")+"Out")},inherit:SVG.Effect,extend:{}})})),s(i,(function(t,e){var i=e.charAt(0).toUpperCase()+e.slice(1);SVG[i+"Effect"]=SVG.invent({create:function(){this.constructor.call(this,SVG.create("fe"+i)),t.apply(this,arguments),this.result(this.attr("id")+"Out")},inherit:SVG.ParentEffect,extend:{}})})),s(n,(function(t,e){var i=e.charAt(0).toUpperCase()+e.slice(1);SVG[i]=SVG.invent({create:function(){this.constructor.call(this,SVG.create("fe"+i)),t.apply(this,arguments)},inherit:SVG.ChildEffect,extend:{}})})),SVG.extend(SVG.MergeEffect,{in:function(t){return t instanceof SVG.MergeNode?this.add(t,0):this.add(new SVG.MergeNode(t),0),this}}),SVG.extend(SVG.CompositeEffect,SVG.BlendEffect,SVG.DisplacementMapEffect,{in2:function(t){return null==t?this.parent()&&this.parent().select('[result="'+this.attr("in2")+'"]').get(0)||this.attr("in2"):this.attr("in2",t)}}),SVG.filter={sepiatone:[.343,.669,.119,0,0,.249,.626,.13,0,0,.172,.334,.111,0,0,0,0,0,1,0]}}.call(void 0),function(){function t(t,a,r,s,o,l,c){for(var h=t.slice(a,r||c),u=s.slice(o,l||c),d=0,f={pos:[0,0],start:[0,0]},g={pos:[0,0],start:[0,0]};h[d]=e.call(f,h[d]),u[d]=e.call(g,u[d]),h[d][0]!=u[d][0]||"M"==h[d][0]||"A"==h[d][0]&&(h[d][4]!=u[d][4]||h[d][5]!=u[d][5])?(Array.prototype.splice.apply(h,[d,1].concat(n.call(f,h[d]))),Array.prototype.splice.apply(u,[d,1].concat(n.call(g,u[d])))):(h[d]=i.call(f,h[d]),u[d]=i.call(g,u[d])),++d!=h.length||d!=u.length;)d==h.length&&h.push(["C",f.pos[0],f.pos[1],f.pos[0],f.pos[1],f.pos[0],f.pos[1]]),d==u.length&&u.push(["C",g.pos[0],g.pos[1],g.pos[0],g.pos[1],g.pos[0],g.pos[1]]);return{start:h,dest:u}}function e(t){switch(t[0]){case"z":case"Z":t[0]="L",t[1]=this.start[0],t[2]=this.start[1];break;case"H":t[0]="L",t[2]=this.pos[1];break;case"V":t[0]="L",t[2]=t[1],t[1]=this.pos[0];break;case"T":t[0]="Q",t[3]=t[1],t[4]=t[2],t[1]=this.reflection[1],t[2]=this.reflection[0];break;case"S":t[0]="C",t[6]=t[4],t[5]=t[3],t[4]=t[2],t[3]=t[1],t[2]=this.reflection[1],t[1]=this.reflection[0]}return t}function i(t){var e=t.length;return this.pos=[t[e-2],t[e-1]],-1!="SCQT".indexOf(t[0])&&(this.reflection=[2*this.pos[0]-t[e-4],2*this.pos[1]-t[e-3]]),t}function n(t){var e=[t];switch(t[0]){case"M":return this.pos=this.start=[t[1],t[2]],e;case"L":t[5]=t[3]=t[1],t[6]=t[4]=t[2],t[1]=this.pos[0],t[2]=this.pos[1];break;case"Q":t[6]=t[4],t[5]=t[3],t[4]=1*t[4]/3+2*t[2]/3,t[3]=1*t[3]/3+2*t[1]/3,t[2]=1*this.pos[1]/3+2*t[2]/3,t[1]=1*this.pos[0]/3+2*t[1]/3;break;case"A":t=(e=function(t,e){var i,n,a,r,s,o,l,c,h,u,d,f,g,p,m,v,x,b,y,w,k,A,S,_,C,E,T=Math.abs(e[1]),P=Math.abs(e[2]),M=e[3]%360,L=e[4],D=e[5],I=e[6],O=e[7],N=new SVG.Point(t),F=new SVG.Point(I,O),R=[];if(0===T||0===P||N.x===F.x&&N.y===F.y)return[["C",N.x,N.y,F.x,F.y,F.x,F.y]];for((n=(i=new SVG.Point((N.x-F.x)/2,(N.y-F.y)/2).transform((new SVG.Matrix).rotate(M))).x*i.x/(T*T)+i.y*i.y/(P*P))>1&&(T*=n=Math.sqrt(n),P*=n),a=(new SVG.Matrix).rotate(M).scale(1/T,1/P).rotate(-M),N=N.transform(a),o=(r=[(F=F.transform(a)).x-N.x,F.y-N.y])[0]*r[0]+r[1]*r[1],s=Math.sqrt(o),r[0]/=s,r[1]/=s,l=o<4?Math.sqrt(1-o/4):0,L===D&&(l*=-1),c=new SVG.Point((F.x+N.x)/2+l*-r[1],(F.y+N.y)/2+l*r[0]),h=new SVG.Point(N.x-c.x,N.y-c.y),u=new SVG.Point(F.x-c.x,F.y-c.y),d=Math.acos(h.x/Math.sqrt(h.x*h.x+h.y*h.y)),h.y<0&&(d*=-1),f=Math.acos(u.x/Math.sqrt(u.x*u.x+u.y*u.y)),u.y<0&&(f*=-1),D&&d>f&&(f+=2*Math.PI),!D&&d<f&&(f-=2*Math.PI),v=[],x=d,g=(f-d)/(p=Math.ceil(2*Math.abs(d-f)/Math.PI)),m=4*Math.tan(g/4)/3,k=0;k<=p;k++)y=Math.cos(x),b=Math.sin(x),w=new SVG.Point(c.x+y,c.y+b),v[k]=[new SVG.Point(w.x+m*b,w.y-m*y),w,new SVG.Point(w.x-m*b,w.y+m*y)],x+=g;for(v[0][0]=v[0][1].clone(),v[v.length-1][2]=v[v.length-1][1].clone(),a=(new SVG.Matrix).rotate(M).scale(T,P).rotate(-M),k=0,A=v.length;k<A;k++)v[k][0]=v[k][0].transform(a),v[k][1]=v[k][1].transform(a),v[k][2]=v[k][2].transform(a);for(k=1,A=v.length;k<A;k++)S=(w=v[k-1][2]).x,_=w.y,C=(w=v[k][0]).x,E=w.y,I=(w=v[k][1]).x,O=w.y,R.push(["C",S,_,C,E,I,O]);return R}(this.pos,t))[0]}return t[0]="C",this.pos=[t[5],t[6]],this.reflection=[2*t[5]-t[3],2*t[6]-t[4]],e}function a(t,e){if(!1===e)return!1;for(var i=e,n=t.length;i<n;++i)if("M"==t[i][0])return i;return!1}SVG.extend(SVG.PathArray,{morph:function(e){for(var i=this.value,n=this.parse(e),r=0,s=0,o=!1,l=!1;!1!==r||!1!==s;){var c;o=a(i,!1!==r&&r+1),l=a(n,!1!==s&&s+1),!1===r&&(r=0==(c=new SVG.PathArray(h.start).bbox()).height||0==c.width?i.push(i[0])-1:i.push(["M",c.x+c.width/2,c.y+c.height/2])-1),!1===s&&(s=0==(c=new SVG.PathArray(h.dest).bbox()).height||0==c.width?n.push(n[0])-1:n.push(["M",c.x+c.width/2,c.y+c.height/2])-1);var h=t(i,r,o,n,s,l);i=i.slice(0,r).concat(h.start,!1===o?[]:i.slice(o)),n=n.slice(0,s).concat(h.dest,!1===l?[]:n.slice(l)),r=!1!==o&&r+h.start.length,s=!1!==l&&s+h.dest.length}return this.value=i,this.destination=new SVG.PathArray,this.destination.value=n,this}})}(),function(){function t(t){t.remember("_draggable",this),this.el=t}t.prototype.init=function(t,e){var i=this;this.constraint=t,this.value=e,this.el.on("mousedown.drag",(function(t){i.start(t)})),this.el.on("touchstart.drag",(function(t){i.start(t)}))},t.prototype.transformPoint=function(t,e){var i=(t=t||window.event).changedTouches&&t.changedTouches[0]||t;return this.p.x=i.clientX-(e||0),this.p.y=i.clientY,this.p.matrixTransform(this.m)},t.prototype.getBBox=function(){var t=this.el.bbox();return this.el instanceof SVG.Nested&&(t=this.el.rbox()),(this.el instanceof SVG.G||this.el instanceof SVG.Use||this.el instanceof SVG.Nested)&&(t.x=this.el.x(),t.y=this.el.y()),t},t.prototype.start=function(t){if("click"!=t.type&&"mousedown"!=t.type&&"mousemove"!=t.type||1==(t.which||t.buttons)){var e=this;if(this.el.fire("beforedrag",{event:t,handler:this}),!this.el.event().defaultPrevented){t.preventDefault(),t.stopPropagation(),this.parent=this.parent||this.el.parent(SVG.Nested)||this.el.parent(SVG.Doc),this.p=this.parent.node.createSVGPoint(),this.m=this.el.node.getScreenCTM().inverse();var i,n=this.getBBox();if(this.el instanceof SVG.Text)switch(i=this.el.node.getComputedTextLength(),this.el.attr("text-anchor")){case"middle":i/=2;break;case"start":i=0}this.startPoints={point:this.transformPoint(t,i),box:n,transform:this.el.transform()},SVG.on(window,"mousemove.drag",(function(t){e.drag(t)})),SVG.on(window,"touchmove.drag",(function(t){e.drag(t)})),SVG.on(window,"mouseup.drag",(function(t){e.end(t)})),SVG.on(window,"touchend.drag",(function(t){e.end(t)})),this.el.fire("dragstart",{event:t,p:this.startPoints.point,m:this.m,handler:this})}}},t.prototype.drag=function(t){var e=this.getBBox(),i=this.transformPoint(t),n=this.startPoints.box.x+i.x-this.startPoints.point.x,a=this.startPoints.box.y+i.y-this.startPoints.point.y,r=this.constraint,s=i.x-this.startPoints.point.x,o=i.y-this.startPoints.point.y;if(this.el.fire("dragmove",{event:t,p:i,m:this.m,handler:this}),this.el.event().defaultPrevented)return i;if("function"==typeof r){var l=r.call(this.el,n,a,this.m);"boolean"==typeof l&&(l={x:l,y:l}),!0===l.x?this.el.x(n):!1!==l.x&&this.el.x(l.x),!0===l.y?this.el.y(a):!1!==l.y&&this.el.y(l.y)}else"object"==typeof r&&(null!=r.minX&&n<r.minX?s=(n=r.minX)-this.startPoints.box.x:null!=r.maxX&&n>r.maxX-e.width&&(s=(n=r.maxX-e.width)-this.startPoints.box.x),null!=r.minY&&a<r.minY?o=(a=r.minY)-this.startPoints.box.y:null!=r.maxY&&a>r.maxY-e.height&&(o=(a=r.maxY-e.height)-this.startPoints.box.y),null!=r.snapToGrid&&(n-=n%r.snapToGrid,a-=a%r.snapToGrid,s-=s%r.snapToGrid,o-=o%r.snapToGrid),this.el instanceof SVG.G?this.el.matrix(this.startPoints.transform).transform({x:s,y:o},!0):this.el.move(n,a));return i},t.prototype.end=function(t){var e=this.drag(t);this.el.fire("dragend",{event:t,p:e,m:this.m,handler:this}),SVG.off(window,"mousemove.drag"),SVG.off(window,"touchmove.drag"),SVG.off(window,"mouseup.drag"),SVG.off(window,"touchend.drag")},SVG.extend(SVG.Element,{draggable:function(e,i){"function"!=typeof e&&"object"!=typeof e||(i=e,e=!0);var n=this.remember("_draggable")||new t(this);return(e=void 0===e||e)?n.init(i||{},e):(this.off("mousedown.drag"),this.off("touchstart.drag")),this}})}.call(void 0),function(){function t(t){this.el=t,t.remember("_selectHandler",this),this.pointSelection={isSelected:!1},this.rectSelection={isSelected:!1},this.pointsList={lt:[0,0],rt:["width",0],rb:["width","height"],lb:[0,"height"],t:["width",0],r:["width","height"],b:["width","height"],l:[0,"height"]},this.pointCoord=function(t,e,i){var n="string"!=typeof t?t:e[t];return i?n/2:n},this.pointCoords=function(t,e){var i=this.pointsList[t];return{x:this.pointCoord(i[0],e,"t"===t||"b"===t),y:this.pointCoord(i[1],e,"r"===t||"l"===t)}}}t.prototype.init=function(t,e){var i=this.el.bbox();this.options={};var n=this.el.selectize.defaults.points;for(var a in this.el.selectize.defaults)this.options[a]=this.el.selectize.defaults[a],void 0!==e[a]&&(this.options[a]=e[a]);var r=["points","pointsExclude"];for(var a in r){var s=this.options[r[a]];"string"==typeof s?s=s.length>0?s.split(/\s*,\s*/i):[]:"boolean"==typeof s&&"points"===r[a]&&(s=s?n:[]),this.options[r[a]]=s}this.options.points=[n,this.options.points].reduce((function(t,e){return t.filter((function(t){return e.indexOf(t)>-1}))})),this.options.points=[this.options.points,this.options.pointsExclude].reduce((function(t,e){return t.filter((function(t){return e.indexOf(t)<0}))})),this.parent=this.el.parent(),this.nested=this.nested||this.parent.group(),this.nested.matrix(new SVG.Matrix(this.el).translate(i.x,i.y)),this.options.deepSelect&&-1!==["line","polyline","polygon"].indexOf(this.el.type)?this.selectPoints(t):this.selectRect(t),this.observe(),this.cleanup()},t.prototype.selectPoints=function(t){return this.pointSelection.isSelected=t,this.pointSelection.set||(this.pointSelection.set=this.parent.set(),this.drawPoints()),this},t.prototype.getPointArray=function(){var t=this.el.bbox();return this.el.array().valueOf().map((function(e){return[e[0]-t.x,e[1]-t.y]}))},t.prototype.drawPoints=function(){for(var t=this,e=this.getPointArray(),i=0,n=e.length;i<n;++i){var a=function(e){return function(i){(i=i||window.event).preventDefault?i.preventDefault():i.returnValue=!1,i.stopPropagation();var n=i.pageX||i.touches[0].pageX,a=i.pageY||i.touches[0].pageY;t.el.fire("point",{x:n,y:a,i:e,event:i})}}(i),r=this.drawPoint(e[i][0],e[i][1]).addClass(this.options.classPoints).addClass(this.options.classPoints+"_point").on("touchstart",a).on("mousedown",a);this.pointSelection.set.add(r)}},t.prototype.drawPoint=function(t,e){var i=this.options.pointType;switch(i){case"circle":return this.drawCircle(t,e);case"rect":return this.drawRect(t,e);default:if("function"==typeof i)return i.call(this,t,e);throw new Error("Unknown "+i+" point type!")}},t.prototype.drawCircle=function(t,e){return this.nested.circle(this.options.pointSize).center(t,e)},t.prototype.drawRect=function(t,e){return this.nested.rect(this.options.pointSize,this.options.pointSize).center(t,e)},t.prototype.updatePointSelection=function(){var t=this.getPointArray();this.pointSelection.set.each((function(e){this.cx()===t[e][0]&&this.cy()===t[e][1]||this.center(t[e][0],t[e][1])}))},t.prototype.updateRectSelection=function(){var t=this,e=this.el.bbox();if(this.rectSelection.set.get(0).attr({width:e.width,height:e.height}),this.options.points.length&&this.options.points.map((function(i,n){var a=t.pointCoords(i,e);t.rectSelection.set.get(n+1).center(a.x,a.y)})),this.options.rotationPoint){var i=this.rectSelection.set.length();this.rectSelection.set.get(i-1).center(e.width/2,20)}},t.prototype.selectRect=function(t){var e=this,i=this.el.bbox();function n(t){return function(i){(i=i||window.event).preventDefault?i.preventDefault():i.returnValue=!1,i.stopPropagation();var n=i.pageX||i.touches[0].pageX,a=i.pageY||i.touches[0].pageY;e.el.fire(t,{x:n,y:a,event:i})}}if(this.rectSelection.isSelected=t,this.rectSelection.set=this.rectSelection.set||this.parent.set(),this.rectSelection.set.get(0)||this.rectSelection.set.add(this.nested.rect(i.width,i.height).addClass(this.options.classRect)),this.options.points.length&&this.rectSelection.set.length()<2&&(this.options.points.map((function(t,a){var r=e.pointCoords(t,i),s=e.drawPoint(r.x,r.y).attr("class",e.options.classPoints+"_"+t).on("mousedown",n(t)).on("touchstart",n(t));e.rectSelection.set.add(s)})),this.rectSelection.set.each((function(){this.addClass(e.options.classPoints)}))),this.options.rotationPoint&&(this.options.points&&!this.rectSelection.set.get(9)||!this.options.points&&!this.rectSelection.set.get(1))){var a=function(t){(t=t||window.event).preventDefault?t.preventDefault():t.returnValue=!1,t.stopPropagation();var i=t.pageX||t.touches[0].pageX,n=t.pageY||t.touches[0].pageY;e.el.fire("rot",{x:i,y:n,event:t})},r=this.drawPoint(i.width/2,20).attr("class",this.options.classPoints+"_rot").on("touchstart",a).on("mousedown",a);this.rectSelection.set.add(r)}},t.prototype.handler=function(){var t=this.el.bbox();this.nested.matrix(new SVG.Matrix(this.el).translate(t.x,t.y)),this.rectSelection.isSelected&&this.updateRectSelection(),this.pointSelection.isSelected&&this.updatePointSelection()},t.prototype.observe=function(){var t=this;if(MutationObserver)if(this.rectSelection.isSelected||this.pointSelection.isSelected)this.observerInst=this.observerInst||new MutationObserver((function(){t.handler()})),this.observerInst.observe(this.el.node,{attributes:!0});else try{this.observerInst.disconnect(),delete this.observerInst}catch(t){}else this.el.off("DOMAttrModified.select"),(this.rectSelection.isSelected||this.pointSelection.isSelected)&&this.el.on("DOMAttrModified.select",(function(){t.handler()}))},t.prototype.cleanup=function(){!this.rectSelection.isSelected&&this.rectSelection.set&&(this.rectSelection.set.each((function(){this.remove()})),this.rectSelection.set.clear(),delete this.rectSelection.set),!this.pointSelection.isSelected&&this.pointSelection.set&&(this.pointSelection.set.each((function(){this.remove()})),this.pointSelection.set.clear(),delete this.pointSelection.set),this.pointSelection.isSelected||this.rectSelection.isSelected||(this.nested.remove(),delete this.nested)},SVG.extend(SVG.Element,{selectize:function(e,i){return"object"==typeof e&&(i=e,e=!0),(this.remember("_selectHandler")||new t(this)).init(void 0===e||e,i||{}),this}}),SVG.Element.prototype.selectize.defaults={points:["lt","rt","rb","lb","t","r","b","l"],pointsExclude:[],classRect:"svg_select_boundingRect",classPoints:"svg_select_points",pointSize:7,rotationPoint:!0,deepSelect:!1,pointType:"circle"}}(),function(){(function(){function t(t){t.remember("_resizeHandler",this),this.el=t,this.parameters={},this.lastUpdateCall=null,this.p=t.doc().node.createSVGPoint()}t.prototype.transformPoint=function(t,e,i){return this.p.x=t-(this.offset.x-window.pageXOffset),this.p.y=e-(this.offset.y-window.pageYOffset),this.p.matrixTransform(i||this.m)},t.prototype._extractPosition=function(t){return{x:null!=t.clientX?t.clientX:t.touches[0].clientX,y:null!=t.clientY?t.clientY:t.touches[0].clientY}},t.prototype.init=function(t){var e=this;if(this.stop(),"stop"!==t){for(var i in this.options={},this.el.resize.defaults)this.options[i]=this.el.resize.defaults[i],void 0!==t[i]&&(this.options[i]=t[i]);this.el.on("lt.resize",(function(t){e.resize(t||window.event)})),this.el.on("rt.resize",(function(t){e.resize(t||window.event)})),this.el.on("rb.resize",(function(t){e.resize(t||window.event)})),this.el.on("lb.resize",(function(t){e.resize(t||window.event)})),this.el.on("t.resize",(function(t){e.resize(t||window.event)})),this.el.on("r.resize",(function(t){e.resize(t||window.event)})),this.el.on("b.resize",(function(t){e.resize(t||window.event)})),this.el.on("l.resize",(function(t){e.resize(t||window.event)})),this.el.on("rot.resize",(function(t){e.resize(t||window.event)})),this.el.on("point.resize",(function(t){e.resize(t||window.event)})),this.update()}},t.prototype.stop=function(){return this.el.off("lt.resize"),this.el.off("rt.resize"),this.el.off("rb.resize"),this.el.off("lb.resize"),this.el.off("t.resize"),this.el.off("r.resize"),this.el.off("b.resize"),this.el.off("l.resize"),this.el.off("rot.resize"),this.el.off("point.resize"),this},t.prototype.resize=function(t){var e=this;this.m=this.el.node.getScreenCTM().inverse(),this.offset={x:window.pageXOffset,y:window.pageYOffset};var i=this._extractPosition(t.detail.event);if(this.parameters={type:this.el.type,p:this.transformPoint(i.x,i.y),x:t.detail.x,y:t.detail.y,box:this.el.bbox(),rotation:this.el.transform().rotation},"text"===this.el.type&&(this.parameters.fontSize=this.el.attr()["font-size"]),void 0!==t.detail.i){var n=this.el.array().valueOf();this.parameters.i=t.detail.i,this.parameters.pointCoords=[n[t.detail.i][0],n[t.detail.i][1]]}switch(t.type){case"lt":this.calc=function(t,e){var i=this.snapToGrid(t,e);if(this.parameters.box.width-i[0]>0&&this.parameters.box.height-i[1]>0){if("text"===this.parameters.type)return this.el.move(this.parameters.box.x+i[0],this.parameters.box.y),void this.el.attr("font-size",this.parameters.fontSize-i[0]);i=this.checkAspectRatio(i),this.el.move(this.parameters.box.x+i[0],this.parameters.box.y+i[1]).size(this.parameters.box.width-i[0],this.parameters.box.height-i[1])}};break;case"rt":this.calc=function(t,e){var i=this.snapToGrid(t,e,2);if(this.parameters.box.width+i[0]>0&&this.parameters.box.height-i[1]>0){if("text"===this.parameters.type)return this.el.move(this.parameters.box.x-i[0],this.parameters.box.y),void this.el.attr("font-size",this.parameters.fontSize+i[0]);i=this.checkAspectRatio(i,!0),this.el.move(this.parameters.box.x,this.parameters.box.y+i[1]).size(this.parameters.box.width+i[0],this.parameters.box.height-i[1])}};break;case"rb":this.calc=function(t,e){var i=this.snapToGrid(t,e,0);if(this.parameters.box.width+i[0]>0&&this.parameters.box.height+i[1]>0){if("text"===this.parameters.type)return this.el.move(this.parameters.box.x-i[0],this.parameters.box.y),void this.el.attr("font-size",this.parameters.fontSize+i[0]);i=this.checkAspectRatio(i),this.el.move(this.parameters.box.x,this.parameters.box.y).size(this.parameters.box.width+i[0],this.parameters.box.height+i[1])}};break;case"lb":this.calc=function(t,e){var i=this.snapToGrid(t,e,1);if(this.parameters.box.width-i[0]>0&&this.parameters.box.height+i[1]>0){if("text"===this.parameters.type)return this.el.move(this.parameters.box.x+i[0],this.parameters.box.y),void this.el.attr("font-size",this.parameters.fontSize-i[0]);i=this.checkAspectRatio(i,!0),this.el.move(this.parameters.box.x+i[0],this.parameters.box.y).size(this.parameters.box.width-i[0],this.parameters.box.height+i[1])}};break;case"t":this.calc=function(t,e){var i=this.snapToGrid(t,e,2);if(this.parameters.box.height-i[1]>0){if("text"===this.parameters.type)return;this.el.move(this.parameters.box.x,this.parameters.box.y+i[1]).height(this.parameters.box.height-i[1])}};break;case"r":this.calc=function(t,e){var i=this.snapToGrid(t,e,0);if(this.parameters.box.width+i[0]>0){if("text"===this.parameters.type)return;this.el.move(this.parameters.box.x,this.parameters.box.y).width(this.parameters.box.width+i[0])}};break;case"b":this.calc=function(t,e){var i=this.snapToGrid(t,e,0);if(this.parameters.box.height+i[1]>0){if("text"===this.parameters.type)return;this.el.move(this.parameters.box.x,this.parameters.box.y).height(this.parameters.box.height+i[1])}};break;case"l":this.calc=function(t,e){var i=this.snapToGrid(t,e,1);if(this.parameters.box.width-i[0]>0){if("text"===this.parameters.type)return;this.el.move(this.parameters.box.x+i[0],this.parameters.box.y).width(this.parameters.box.width-i[0])}};break;case"rot":this.calc=function(t,e){var i=t+this.parameters.p.x,n=e+this.parameters.p.y,a=Math.atan2(this.parameters.p.y-this.parameters.box.y-this.parameters.box.height/2,this.parameters.p.x-this.parameters.box.x-this.parameters.box.width/2),r=Math.atan2(n-this.parameters.box.y-this.parameters.box.height/2,i-this.parameters.box.x-this.parameters.box.width/2),s=this.parameters.rotation+180*(r-a)/Math.PI+this.options.snapToAngle/2;this.el.center(this.parameters.box.cx,this.parameters.box.cy).rotate(s-s%this.options.snapToAngle,this.parameters.box.cx,this.parameters.box.cy)};break;case"point":this.calc=function(t,e){var i=this.snapToGrid(t,e,this.parameters.pointCoords[0],this.parameters.pointCoords[1]),n=this.el.array().valueOf();n[this.parameters.i][0]=this.parameters.pointCoords[0]+i[0],n[this.parameters.i][1]=this.parameters.pointCoords[1]+i[1],this.el.plot(n)}}this.el.fire("resizestart",{dx:this.parameters.x,dy:this.parameters.y,event:t}),SVG.on(window,"touchmove.resize",(function(t){e.update(t||window.event)})),SVG.on(window,"touchend.resize",(function(){e.done()})),SVG.on(window,"mousemove.resize",(function(t){e.update(t||window.event)})),SVG.on(window,"mouseup.resize",(function(){e.done()}))},t.prototype.update=function(t){if(t){var e=this._extractPosition(t),i=this.transformPoint(e.x,e.y),n=i.x-this.parameters.p.x,a=i.y-this.parameters.p.y;this.lastUpdateCall=[n,a],this.calc(n,a),this.el.fire("resizing",{dx:n,dy:a,event:t})}else this.lastUpdateCall&&this.calc(this.lastUpdateCall[0],this.lastUpdateCall[1])},t.prototype.done=function(){this.lastUpdateCall=null,SVG.off(window,"mousemove.resize"),SVG.off(window,"mouseup.resize"),SVG.off(window,"touchmove.resize"),SVG.off(window,"touchend.resize"),this.el.fire("resizedone")},t.prototype.snapToGrid=function(t,e,i,n){var a;return void 0!==n?a=[(i+t)%this.options.snapToGrid,(n+e)%this.options.snapToGrid]:(i=null==i?3:i,a=[(this.parameters.box.x+t+(1&i?0:this.parameters.box.width))%this.options.snapToGrid,(this.parameters.box.y+e+(2&i?0:this.parameters.box.height))%this.options.snapToGrid]),t<0&&(a[0]-=this.options.snapToGrid),e<0&&(a[1]-=this.options.snapToGrid),t-=Math.abs(a[0])<this.options.snapToGrid/2?a[0]:a[0]-(t<0?-this.options.snapToGrid:this.options.snapToGrid),e-=Math.abs(a[1])<this.options.snapToGrid/2?a[1]:a[1]-(e<0?-this.options.snapToGrid:this.options.snapToGrid),this.constraintToBox(t,e,i,n)},t.prototype.constraintToBox=function(t,e,i,n){var a,r,s=this.options.constraint||{};return void 0!==n?(a=i,r=n):(a=this.parameters.box.x+(1&i?0:this.parameters.box.width),r=this.parameters.box.y+(2&i?0:this.parameters.box.height)),void 0!==s.minX&&a+t<s.minX&&(t=s.minX-a),void 0!==s.maxX&&a+t>s.maxX&&(t=s.maxX-a),void 0!==s.minY&&r+e<s.minY&&(e=s.minY-r),void 0!==s.maxY&&r+e>s.maxY&&(e=s.maxY-r),[t,e]},t.prototype.checkAspectRatio=function(t,e){if(!this.options.saveAspectRatio)return t;var i=t.slice(),n=this.parameters.box.width/this.parameters.box.height,a=this.parameters.box.width+t[0],r=this.parameters.box.height-t[1],s=a/r;return s<n?(i[1]=a/n-this.parameters.box.height,e&&(i[1]=-i[1])):s>n&&(i[0]=this.parameters.box.width-r*n,e&&(i[0]=-i[0])),i},SVG.extend(SVG.Element,{resize:function(e){return(this.remember("_resizeHandler")||new t(this)).init(e||{}),this}}),SVG.Element.prototype.resize.defaults={snapToAngle:.1,snapToGrid:1,constraint:{},saveAspectRatio:!1}}).call(this)}(),void 0===window.Apex&&(window.Apex={});var zt=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w}return c(t,[{key:"initModules",value:function(){this.ctx.publicMethods=["updateOptions","updateSeries","appendData","appendSeries","toggleSeries","showSeries","hideSeries","setLocale","resetSeries","zoomX","toggleDataPointSelection","dataURI","addXaxisAnnotation","addYaxisAnnotation","addPointAnnotation","clearAnnotations","removeAnnotation","paper","destroy"],this.ctx.eventList=["click","mousedown","mousemove","mouseleave","touchstart","touchmove","touchleave","mouseup","touchend"],this.ctx.animations=new b(this.ctx),this.ctx.axes=new et(this.ctx),this.ctx.core=new Ft(this.ctx.el,this.ctx),this.ctx.config=new X({}),this.ctx.data=new W(this.ctx),this.ctx.grid=new $(this.ctx),this.ctx.graphics=new w(this.ctx),this.ctx.coreUtils=new S(this.ctx),this.ctx.crosshairs=new it(this.ctx),this.ctx.events=new J(this.ctx),this.ctx.exports=new U(this.ctx),this.ctx.localization=new tt(this.ctx),this.ctx.options=new T,this.ctx.responsive=new nt(this.ctx),this.ctx.series=new N(this.ctx),this.ctx.theme=new at(this.ctx),this.ctx.formatters=new V(this.ctx),this.ctx.titleSubtitle=new rt(this.ctx),this.ctx.legend=new dt(this.ctx),this.ctx.toolbar=new ft(this.ctx),this.ctx.dimensions=new ht(this.ctx),this.ctx.updateHelpers=new Rt(this.ctx),this.ctx.zoomPanSelection=new gt(this.ctx),this.ctx.w.globals.tooltip=new wt(this.ctx)}}]),t}(),Ht=function(){function t(e){o(this,t),this.ctx=e,this.w=e.w}return c(t,[{key:"clear",value:function(t){var e=t.isUpdating;this.ctx.zoomPanSelection&&this.ctx.zoomPanSelection.destroy(),this.ctx.toolbar&&this.ctx.toolbar.destroy(),this.ctx.animations=null,this.ctx.axes=null,this.ctx.annotations=null,this.ctx.core=null,this.ctx.data=null,this.ctx.grid=null,this.ctx.series=null,this.ctx.responsive=null,this.ctx.theme=null,this.ctx.formatters=null,this.ctx.titleSubtitle=null,this.ctx.legend=null,this.ctx.dimensions=null,this.ctx.options=null,this.ctx.crosshairs=null,this.ctx.zoomPanSelection=null,this.ctx.updateHelpers=null,this.ctx.toolbar=null,this.ctx.localization=null,this.ctx.w.globals.tooltip=null,this.clearDomElements({isUpdating:e})}},{key:"killSVG",value:function(t){t.each((function(t,e){this.removeClass("*"),this.off(),this.stop()}),!0),t.ungroup(),t.clear()}},{key:"clearDomElements",value:function(t){var e=this,i=t.isUpdating,n=this.w.globals.dom.Paper.node;n.parentNode&&n.parentNode.parentNode&&!i&&(n.parentNode.parentNode.style.minHeight="unset");var a=this.w.globals.dom.baseEl;a&&this.ctx.eventList.forEach((function(t){a.removeEventListener(t,e.ctx.events.documentEvent)}));var r=this.w.globals.dom;if(null!==this.ctx.el)for(;this.ctx.el.firstChild;)this.ctx.el.removeChild(this.ctx.el.firstChild);this.killSVG(r.Paper),r.Paper.remove(),r.elWrap=null,r.elGraphical=null,r.elAnnotations=null,r.elLegendWrap=null,r.baseEl=null,r.elGridRect=null,r.elGridRectMask=null,r.elGridRectMarkerMask=null,r.elForecastMask=null,r.elNonForecastMask=null,r.elDefs=null}}]),t}(),Yt=new WeakMap,Xt=function(){function t(e,i){o(this,t),this.opts=i,this.ctx=this,this.w=new j(i).init(),this.el=e,this.w.globals.cuid=x.randomId(),this.w.globals.chartID=this.w.config.chart.id?x.escapeString(this.w.config.chart.id):this.w.globals.cuid,new zt(this).initModules(),this.create=x.bind(this.create,this),this.windowResizeHandler=this._windowResizeHandler.bind(this),this.parentResizeHandler=this._parentResizeCallback.bind(this)}return c(t,[{key:"render",value:function(){var t=this;return new Promise((function(e,i){if(null!==t.el){void 0===Apex._chartInstances&&(Apex._chartInstances=[]),t.w.config.chart.id&&Apex._chartInstances.push({id:t.w.globals.chartID,group:t.w.config.chart.group,chart:t}),t.setLocale(t.w.config.chart.defaultLocale);var n=t.w.config.chart.events.beforeMount;if("function"==typeof n&&n(t,t.w),t.events.fireEvent("beforeMount",[t,t.w]),window.addEventListener("resize",t.windowResizeHandler),c=t.el.parentNode,h=t.parentResizeHandler,u=!1,d=new ResizeObserver((function(t){u&&h.call(c,t),u=!0})),c.nodeType===Node.DOCUMENT_FRAGMENT_NODE?Array.from(c.children).forEach((function(t){return d.observe(t)})):d.observe(c),Yt.set(h,d),!t.css){var a=t.el.getRootNode&&t.el.getRootNode(),r=x.is("ShadowRoot",a),s=t.el.ownerDocument,o=s.getElementById("apexcharts-css");!r&&o||(t.css=document.createElement("style"),t.css.id="apexcharts-css",t.css.textContent='.apexcharts-canvas {\n  position: relative;\n  user-select: none;\n  /* cannot give overflow: hidden as it will crop tooltips which overflow outside chart area */\n}\n\n\n/* scrollbar is not visible by default for legend, hence forcing the visibility */\n.apexcharts-canvas ::-webkit-scrollbar {\n  -webkit-appearance: none;\n  width: 6px;\n}\n\n.apexcharts-canvas ::-webkit-scrollbar-thumb {\n  border-radius: 4px;\n  background-color: rgba(0, 0, 0, .5);\n  box-shadow: 0 0 1px rgba(255, 255, 255, .5);\n  -webkit-box-shadow: 0 0 1px rgba(255, 255, 255, .5);\n}\n\n\n.apexcharts-inner {\n  position: relative;\n}\n\n.apexcharts-text tspan {\n  font-family: inherit;\n}\n\n.legend-mouseover-inactive {\n  transition: 0.15s ease all;\n  opacity: 0.20;\n}\n\n.apexcharts-series-collapsed {\n  opacity: 0;\n}\n\n.apexcharts-tooltip {\n  border-radius: 5px;\n  box-shadow: 2px 2px 6px -4px #999;\n  cursor: default;\n  font-size: 14px;\n  left: 62px;\n  opacity: 0;\n  pointer-events: none;\n  position: absolute;\n  top: 20px;\n  display: flex;\n  flex-direction: column;\n  overflow: hidden;\n  white-space: nowrap;\n  z-index: 12;\n  transition: 0.15s ease all;\n}\n\n.apexcharts-tooltip.apexcharts-active {\n  opacity: 1;\n  transition: 0.15s ease all;\n}\n\n.apexcharts-tooltip.apexcharts-theme-light {\n  border: 1px solid #e3e3e3;\n  background: rgba(255, 255, 255, 0.96);\n}\n\n.apexcharts-tooltip.apexcharts-theme-dark {\n  color: #fff;\n  background: rgba(30, 30, 30, 0.8);\n}\n\n.apexcharts-tooltip * {\n  font-family: inherit;\n}\n\n\n.apexcharts-tooltip-title {\n  padding: 6px;\n  font-size: 15px;\n  margin-bottom: 4px;\n}\n\n.apexcharts-tooltip.apexcharts-theme-light .apexcharts-tooltip-title {\n  background: #ECEFF1;\n  border-bottom: 1px solid #ddd;\n}\n\n.apexcharts-tooltip.apexcharts-theme-dark .apexcharts-tooltip-title {\n  background: rgba(0, 0, 0, 0.7);\n  border-bottom: 1px solid #333;\n}\n\n.apexcharts-tooltip-text-y-value,\n.apexcharts-tooltip-text-goals-value,\n.apexcharts-tooltip-text-z-value {\n  display: inline-block;\n  font-weight: 600;\n  margin-left: 5px;\n}\n\n.apexcharts-tooltip-title:empty,\n.apexcharts-tooltip-text-y-label:empty,\n.apexcharts-tooltip-text-y-value:empty,\n.apexcharts-tooltip-text-goals-label:empty,\n.apexcharts-tooltip-text-goals-value:empty,\n.apexcharts-tooltip-text-z-value:empty {\n  display: none;\n}\n\n.apexcharts-tooltip-text-y-value,\n.apexcharts-tooltip-text-goals-value,\n.apexcharts-tooltip-text-z-value {\n  font-weight: 600;\n}\n\n.apexcharts-tooltip-text-goals-label, \n.apexcharts-tooltip-text-goals-value {\n  padding: 6px 0 5px;\n}\n\n.apexcharts-tooltip-goals-group, \n.apexcharts-tooltip-text-goals-label, \n.apexcharts-tooltip-text-goals-value {\n  display: flex;\n}\n.apexcharts-tooltip-text-goals-label:not(:empty),\n.apexcharts-tooltip-text-goals-value:not(:empty) {\n  margin-top: -6px;\n}\n\n.apexcharts-tooltip-marker {\n  width: 12px;\n  height: 12px;\n  position: relative;\n  top: 0px;\n  margin-right: 10px;\n  border-radius: 50%;\n}\n\n.apexcharts-tooltip-series-group {\n  padding: 0 10px;\n  display: none;\n  text-align: left;\n  justify-content: left;\n  align-items: center;\n}\n\n.apexcharts-tooltip-series-group.apexcharts-active .apexcharts-tooltip-marker {\n  opacity: 1;\n}\n\n.apexcharts-tooltip-series-group.apexcharts-active,\n.apexcharts-tooltip-series-group:last-child {\n  padding-bottom: 4px;\n}\n\n.apexcharts-tooltip-series-group-hidden {\n  opacity: 0;\n  height: 0;\n  line-height: 0;\n  padding: 0 !important;\n}\n\n.apexcharts-tooltip-y-group {\n  padding: 6px 0 5px;\n}\n\n.apexcharts-tooltip-box, .apexcharts-custom-tooltip {\n  padding: 4px 8px;\n}\n\n.apexcharts-tooltip-boxPlot {\n  display: flex;\n  flex-direction: column-reverse;\n}\n\n.apexcharts-tooltip-box>div {\n  margin: 4px 0;\n}\n\n.apexcharts-tooltip-box span.value {\n  font-weight: bold;\n}\n\n.apexcharts-tooltip-rangebar {\n  padding: 5px 8px;\n}\n\n.apexcharts-tooltip-rangebar .category {\n  font-weight: 600;\n  color: #777;\n}\n\n.apexcharts-tooltip-rangebar .series-name {\n  font-weight: bold;\n  display: block;\n  margin-bottom: 5px;\n}\n\n.apexcharts-xaxistooltip {\n  opacity: 0;\n  padding: 9px 10px;\n  pointer-events: none;\n  color: #373d3f;\n  font-size: 13px;\n  text-align: center;\n  border-radius: 2px;\n  position: absolute;\n  z-index: 10;\n  background: #ECEFF1;\n  border: 1px solid #90A4AE;\n  transition: 0.15s ease all;\n}\n\n.apexcharts-xaxistooltip.apexcharts-theme-dark {\n  background: rgba(0, 0, 0, 0.7);\n  border: 1px solid rgba(0, 0, 0, 0.5);\n  color: #fff;\n}\n\n.apexcharts-xaxistooltip:after,\n.apexcharts-xaxistooltip:before {\n  left: 50%;\n  border: solid transparent;\n  content: " ";\n  height: 0;\n  width: 0;\n  position: absolute;\n  pointer-events: none;\n}\n\n.apexcharts-xaxistooltip:after {\n  border-color: rgba(236, 239, 241, 0);\n  border-width: 6px;\n  margin-left: -6px;\n}\n\n.apexcharts-xaxistooltip:before {\n  border-color: rgba(144, 164, 174, 0);\n  border-width: 7px;\n  margin-left: -7px;\n}\n\n.apexcharts-xaxistooltip-bottom:after,\n.apexcharts-xaxistooltip-bottom:before {\n  bottom: 100%;\n}\n\n.apexcharts-xaxistooltip-top:after,\n.apexcharts-xaxistooltip-top:before {\n  top: 100%;\n}\n\n.apexcharts-xaxistooltip-bottom:after {\n  border-bottom-color: #ECEFF1;\n}\n\n.apexcharts-xaxistooltip-bottom:before {\n  border-bottom-color: #90A4AE;\n}\n\n.apexcharts-xaxistooltip-bottom.apexcharts-theme-dark:after {\n  border-bottom-color: rgba(0, 0, 0, 0.5);\n}\n\n.apexcharts-xaxistooltip-bottom.apexcharts-theme-dark:before {\n  border-bottom-color: rgba(0, 0, 0, 0.5);\n}\n\n.apexcharts-xaxistooltip-top:after {\n  border-top-color: #ECEFF1\n}\n\n.apexcharts-xaxistooltip-top:before {\n  border-top-color: #90A4AE;\n}\n\n.apexcharts-xaxistooltip-top.apexcharts-theme-dark:after {\n  border-top-color: rgba(0, 0, 0, 0.5);\n}\n\n.apexcharts-xaxistooltip-top.apexcharts-theme-dark:before {\n  border-top-color: rgba(0, 0, 0, 0.5);\n}\n\n.apexcharts-xaxistooltip.apexcharts-active {\n  opacity: 1;\n  transition: 0.15s ease all;\n}\n\n.apexcharts-yaxistooltip {\n  opacity: 0;\n  padding: 4px 10px;\n  pointer-events: none;\n  color: #373d3f;\n  font-size: 13px;\n  text-align: center;\n  border-radius: 2px;\n  position: absolute;\n  z-index: 10;\n  background: #ECEFF1;\n  border: 1px solid #90A4AE;\n}\n\n.apexcharts-yaxistooltip.apexcharts-theme-dark {\n  background: rgba(0, 0, 0, 0.7);\n  border: 1px solid rgba(0, 0, 0, 0.5);\n  color: #fff;\n}\n\n.apexcharts-yaxistooltip:after,\n.apexcharts-yaxistooltip:before {\n  top: 50%;\n  border: solid transparent;\n  content: " ";\n  height: 0;\n  width: 0;\n  position: absolute;\n  pointer-events: none;\n}\n\n.apexcharts-yaxistooltip:after {\n  border-color: rgba(236, 239, 241, 0);\n  border-width: 6px;\n  margin-top: -6px;\n}\n\n.apexcharts-yaxistooltip:before {\n  border-color: rgba(144, 164, 174, 0);\n  border-width: 7px;\n  margin-top: -7px;\n}\n\n.apexcharts-yaxistooltip-left:after,\n.apexcharts-yaxistooltip-left:before {\n  left: 100%;\n}\n\n.apexcharts-yaxistooltip-right:after,\n.apexcharts-yaxistooltip-right:before {\n  right: 100%;\n}\n\n.apexcharts-yaxistooltip-left:after {\n  border-left-color: #ECEFF1;\n}\n\n.apexcharts-yaxistooltip-left:before {\n  border-left-color: #90A4AE;\n}\n\n.apexcharts-yaxistooltip-left.apexcharts-theme-dark:after {\n  border-left-color: rgba(0, 0, 0, 0.5);\n}\n\n.apexcharts-yaxistooltip-left.apexcharts-theme-dark:before {\n  border-left-color: rgba(0, 0, 0, 0.5);\n}\n\n.apexcharts-yaxistooltip-right:after {\n  border-right-color: #ECEFF1;\n}\n\n.apexcharts-yaxistooltip-right:before {\n  border-right-color: #90A4AE;\n}\n\n.apexcharts-yaxistooltip-right.apexcharts-theme-dark:after {\n  border-right-color: rgba(0, 0, 0, 0.5);\n}\n\n.apexcharts-yaxistooltip-right.apexcharts-theme-dark:before {\n  border-right-color: rgba(0, 0, 0, 0.5);\n}\n\n.apexcharts-yaxistooltip.apexcharts-active {\n  opacity: 1;\n}\n\n.apexcharts-yaxistooltip-hidden {\n  display: none;\n}\n\n.apexcharts-xcrosshairs,\n.apexcharts-ycrosshairs {\n  pointer-events: none;\n  opacity: 0;\n  transition: 0.15s ease all;\n}\n\n.apexcharts-xcrosshairs.apexcharts-active,\n.apexcharts-ycrosshairs.apexcharts-active {\n  opacity: 1;\n  transition: 0.15s ease all;\n}\n\n.apexcharts-ycrosshairs-hidden {\n  opacity: 0;\n}\n\n.apexcharts-selection-rect {\n  cursor: move;\n}\n\n.svg_select_boundingRect, .svg_select_points_rot {\n  pointer-events: none;\n  opacity: 0;\n  visibility: hidden;\n}\n.apexcharts-selection-rect + g .svg_select_boundingRect,\n.apexcharts-selection-rect + g .svg_select_points_rot {\n  opacity: 0;\n  visibility: hidden;\n}\n\n.apexcharts-selection-rect + g .svg_select_points_l,\n.apexcharts-selection-rect + g .svg_select_points_r {\n  cursor: ew-resize;\n  opacity: 1;\n  visibility: visible;\n}\n\n.svg_select_points {\n  fill: #efefef;\n  stroke: #333;\n  rx: 2;\n}\n\n.apexcharts-svg.apexcharts-zoomable.hovering-zoom {\n  cursor: crosshair\n}\n\n.apexcharts-svg.apexcharts-zoomable.hovering-pan {\n  cursor: move\n}\n\n.apexcharts-zoom-icon,\n.apexcharts-zoomin-icon,\n.apexcharts-zoomout-icon,\n.apexcharts-reset-icon,\n.apexcharts-pan-icon,\n.apexcharts-selection-icon,\n.apexcharts-menu-icon,\n.apexcharts-toolbar-custom-icon {\n  cursor: pointer;\n  width: 20px;\n  height: 20px;\n  line-height: 24px;\n  color: #6E8192;\n  text-align: center;\n}\n\n.apexcharts-zoom-icon svg,\n.apexcharts-zoomin-icon svg,\n.apexcharts-zoomout-icon svg,\n.apexcharts-reset-icon svg,\n.apexcharts-menu-icon svg {\n  fill: #6E8192;\n}\n\n.apexcharts-selection-icon svg {\n  fill: #444;\n  transform: scale(0.76)\n}\n\n.apexcharts-theme-dark .apexcharts-zoom-icon svg,\n.apexcharts-theme-dark .apexcharts-zoomin-icon svg,\n.apexcharts-theme-dark .apexcharts-zoomout-icon svg,\n.apexcharts-theme-dark .apexcharts-reset-icon svg,\n.apexcharts-theme-dark .apexcharts-pan-icon svg,\n.apexcharts-theme-dark .apexcharts-selection-icon svg,\n.apexcharts-theme-dark .apexcharts-menu-icon svg,\n.apexcharts-theme-dark .apexcharts-toolbar-custom-icon svg {\n  fill: #f3f4f5;\n}\n\n.apexcharts-canvas .apexcharts-zoom-icon.apexcharts-selected svg,\n.apexcharts-canvas .apexcharts-selection-icon.apexcharts-selected svg,\n.apexcharts-canvas .apexcharts-reset-zoom-icon.apexcharts-selected svg {\n  fill: #008FFB;\n}\n\n.apexcharts-theme-light .apexcharts-selection-icon:not(.apexcharts-selected):hover svg,\n.apexcharts-theme-light .apexcharts-zoom-icon:not(.apexcharts-selected):hover svg,\n.apexcharts-theme-light .apexcharts-zoomin-icon:hover svg,\n.apexcharts-theme-light .apexcharts-zoomout-icon:hover svg,\n.apexcharts-theme-light .apexcharts-reset-icon:hover svg,\n.apexcharts-theme-light .apexcharts-menu-icon:hover svg {\n  fill: #333;\n}\n\n.apexcharts-selection-icon,\n.apexcharts-menu-icon {\n  position: relative;\n}\n\n.apexcharts-reset-icon {\n  margin-left: 5px;\n}\n\n.apexcharts-zoom-icon,\n.apexcharts-reset-icon,\n.apexcharts-menu-icon {\n  transform: scale(0.85);\n}\n\n.apexcharts-zoomin-icon,\n.apexcharts-zoomout-icon {\n  transform: scale(0.7)\n}\n\n.apexcharts-zoomout-icon {\n  margin-right: 3px;\n}\n\n.apexcharts-pan-icon {\n  transform: scale(0.62);\n  position: relative;\n  left: 1px;\n  top: 0px;\n}\n\n.apexcharts-pan-icon svg {\n  fill: #fff;\n  stroke: #6E8192;\n  stroke-width: 2;\n}\n\n.apexcharts-pan-icon.apexcharts-selected svg {\n  stroke: #008FFB;\n}\n\n.apexcharts-pan-icon:not(.apexcharts-selected):hover svg {\n  stroke: #333;\n}\n\n.apexcharts-toolbar {\n  position: absolute;\n  z-index: 11;\n  max-width: 176px;\n  text-align: right;\n  border-radius: 3px;\n  padding: 0px 6px 2px 6px;\n  display: flex;\n  justify-content: space-between;\n  align-items: center;\n}\n\n.apexcharts-menu {\n  background: #fff;\n  position: absolute;\n  top: 100%;\n  border: 1px solid #ddd;\n  border-radius: 3px;\n  padding: 3px;\n  right: 10px;\n  opacity: 0;\n  min-width: 110px;\n  transition: 0.15s ease all;\n  pointer-events: none;\n}\n\n.apexcharts-menu.apexcharts-menu-open {\n  opacity: 1;\n  pointer-events: all;\n  transition: 0.15s ease all;\n}\n\n.apexcharts-menu-item {\n  padding: 6px 7px;\n  font-size: 12px;\n  cursor: pointer;\n}\n\n.apexcharts-theme-light .apexcharts-menu-item:hover {\n  background: #eee;\n}\n\n.apexcharts-theme-dark .apexcharts-menu {\n  background: rgba(0, 0, 0, 0.7);\n  color: #fff;\n}\n\n@media screen and (min-width: 768px) {\n  .apexcharts-canvas:hover .apexcharts-toolbar {\n    opacity: 1;\n  }\n}\n\n.apexcharts-datalabel.apexcharts-element-hidden {\n  opacity: 0;\n}\n\n.apexcharts-pie-label,\n.apexcharts-datalabels,\n.apexcharts-datalabel,\n.apexcharts-datalabel-label,\n.apexcharts-datalabel-value {\n  cursor: default;\n  pointer-events: none;\n}\n\n.apexcharts-pie-label-delay {\n  opacity: 0;\n  animation-name: opaque;\n  animation-duration: 0.3s;\n  animation-fill-mode: forwards;\n  animation-timing-function: ease;\n}\n\n.apexcharts-canvas .apexcharts-element-hidden {\n  opacity: 0;\n}\n\n.apexcharts-hide .apexcharts-series-points {\n  opacity: 0;\n}\n\n.apexcharts-gridline,\n.apexcharts-annotation-rect,\n.apexcharts-tooltip .apexcharts-marker,\n.apexcharts-area-series .apexcharts-area,\n.apexcharts-line,\n.apexcharts-zoom-rect,\n.apexcharts-toolbar svg,\n.apexcharts-area-series .apexcharts-series-markers .apexcharts-marker.no-pointer-events,\n.apexcharts-line-series .apexcharts-series-markers .apexcharts-marker.no-pointer-events,\n.apexcharts-radar-series path,\n.apexcharts-radar-series polygon {\n  pointer-events: none;\n}\n\n\n/* markers */\n\n.apexcharts-marker {\n  transition: 0.15s ease all;\n}\n\n@keyframes opaque {\n  0% {\n    opacity: 0;\n  }\n  100% {\n    opacity: 1;\n  }\n}\n\n\n/* Resize generated styles */\n\n@keyframes resizeanim {\n  from {\n    opacity: 0;\n  }\n  to {\n    opacity: 0;\n  }\n}\n\n.resize-triggers {\n  animation: 1ms resizeanim;\n  visibility: hidden;\n  opacity: 0;\n}\n\n.resize-triggers,\n.resize-triggers>div,\n.contract-trigger:before {\n  content: " ";\n  display: block;\n  position: absolute;\n  top: 0;\n  left: 0;\n  height: 100%;\n  width: 100%;\n  overflow: hidden;\n}\n\n.resize-triggers>div {\n  background: #eee;\n  overflow: auto;\n}\n\n.contract-trigger:before {\n  width: 200%;\n  height: 200%;\n}',r?a.prepend(t.css):s.head.appendChild(t.css))}var l=t.create(t.w.config.series,{});if(!l)return e(t);t.mount(l).then((function(){"function"==typeof t.w.config.chart.events.mounted&&t.w.config.chart.events.mounted(t,t.w),t.events.fireEvent("mounted",[t,t.w]),e(l)})).catch((function(t){i(t)}))}else i(new Error("Element not found"));var c,h,u,d}))}},{key:"create",value:function(t,e){var i=this.w;new zt(this).initModules();var n=this.w.globals;if(n.noData=!1,n.animationEnded=!1,this.responsive.checkResponsiveConfig(e),i.config.xaxis.convertedCatToNumeric&&new Y(i.config).convertCatToNumericXaxis(i.config,this.ctx),null===this.el)return n.animationEnded=!0,null;if(this.core.setupElements(),"treemap"===i.config.chart.type&&(i.config.grid.show=!1,i.config.yaxis[0].show=!1),0===n.svgWidth)return n.animationEnded=!0,null;var a=S.checkComboSeries(t);n.comboCharts=a.comboCharts,n.comboBarCount=a.comboBarCount;var r=t.every((function(t){return t.data&&0===t.data.length}));(0===t.length||r)&&this.series.handleNoData(),this.events.setupEventHandlers(),this.data.parseData(t),this.theme.init(),new L(this).setGlobalMarkerSize(),this.formatters.setLabelFormatters(),this.titleSubtitle.draw(),n.noData&&n.collapsedSeries.length!==n.series.length&&!i.config.legend.showForSingleSeries||this.legend.init(),this.series.hasAllSeriesEqualX(),n.axisCharts&&(this.core.coreCalculations(),"category"!==i.config.xaxis.type&&this.formatters.setLabelFormatters(),this.ctx.toolbar.minX=i.globals.minX,this.ctx.toolbar.maxX=i.globals.maxX),this.formatters.heatmapLabelFormatters(),this.dimensions.plotCoords();var s=this.core.xySettings();this.grid.createGridMask();var o=this.core.plotChartType(t,s),l=new I(this);l.bringForward(),i.config.dataLabels.background.enabled&&l.dataLabelsBackground(),this.core.shiftGraphPosition();var c={plot:{left:i.globals.translateX,top:i.globals.translateY,width:i.globals.gridWidth,height:i.globals.gridHeight}};return{elGraph:o,xyRatios:s,elInner:i.globals.dom.elGraphical,dimensions:c}}},{key:"mount",value:function(){var t=this,e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:null,i=this,n=i.w;return new Promise((function(a,r){if(null===i.el)return r(new Error("Not enough data to display or target element not found"));(null===e||n.globals.allSeriesCollapsed)&&i.series.handleNoData(),"treemap"!==n.config.chart.type&&i.axes.drawAxis(n.config.chart.type,e.xyRatios),i.grid=new $(i);var s=i.grid.drawGrid();i.annotations=new P(i),i.annotations.drawImageAnnos(),i.annotations.drawTextAnnos(),"back"===n.config.grid.position&&s&&n.globals.dom.elGraphical.add(s.el);var o=new q(t.ctx),l=new Q(t.ctx);if(null!==s&&(o.xAxisLabelCorrections(s.xAxisTickWidth),l.setYAxisTextAlignments(),n.config.yaxis.map((function(t,e){-1===n.globals.ignoreYAxisIndexes.indexOf(e)&&l.yAxisTitleRotate(e,t.opposite)}))),"back"===n.config.annotations.position&&(n.globals.dom.Paper.add(n.globals.dom.elAnnotations),i.annotations.drawAxesAnnotations()),Array.isArray(e.elGraph))for(var c=0;c<e.elGraph.length;c++)n.globals.dom.elGraphical.add(e.elGraph[c]);else n.globals.dom.elGraphical.add(e.elGraph);if("front"===n.config.grid.position&&s&&n.globals.dom.elGraphical.add(s.el),"front"===n.config.xaxis.crosshairs.position&&i.crosshairs.drawXCrosshairs(),"front"===n.config.yaxis[0].crosshairs.position&&i.crosshairs.drawYCrosshairs(),"front"===n.config.annotations.position&&(n.globals.dom.Paper.add(n.globals.dom.elAnnotations),i.annotations.drawAxesAnnotations()),!n.globals.noData){if(n.config.tooltip.enabled&&!n.globals.noData&&i.w.globals.tooltip.drawTooltip(e.xyRatios),n.globals.axisCharts&&(n.globals.isXNumeric||n.config.xaxis.convertedCatToNumeric||n.globals.isRangeBar))(n.config.chart.zoom.enabled||n.config.chart.selection&&n.config.chart.selection.enabled||n.config.chart.pan&&n.config.chart.pan.enabled)&&i.zoomPanSelection.init({xyRatios:e.xyRatios});else{var h=n.config.chart.toolbar.tools;["zoom","zoomin","zoomout","selection","pan","reset"].forEach((function(t){h[t]=!1}))}n.config.chart.toolbar.show&&!n.globals.allSeriesCollapsed&&i.toolbar.createToolbar()}n.globals.memory.methodsToExec.length>0&&n.globals.memory.methodsToExec.forEach((function(t){t.method(t.params,!1,t.context)})),n.globals.axisCharts||n.globals.noData||i.core.resizeNonAxisCharts(),a(i)}))}},{key:"destroy",value:function(){var t,e;window.removeEventListener("resize",this.windowResizeHandler),this.el.parentNode,t=this.parentResizeHandler,(e=Yt.get(t))&&(e.disconnect(),Yt.delete(t));var i=this.w.config.chart.id;i&&Apex._chartInstances.forEach((function(t,e){t.id===x.escapeString(i)&&Apex._chartInstances.splice(e,1)})),new Ht(this.ctx).clear({isUpdating:!1})}},{key:"updateOptions",value:function(t){var e=this,i=arguments.length>1&&void 0!==arguments[1]&&arguments[1],n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],a=!(arguments.length>3&&void 0!==arguments[3])||arguments[3],r=!(arguments.length>4&&void 0!==arguments[4])||arguments[4],s=this.w;return s.globals.selection=void 0,t.series&&(this.series.resetSeries(!1,!0,!1),t.series.length&&t.series[0].data&&(t.series=t.series.map((function(t,i){return e.updateHelpers._extendSeries(t,i)}))),this.updateHelpers.revertDefaultAxisMinMax()),t.xaxis&&(t=this.updateHelpers.forceXAxisUpdate(t)),t.yaxis&&(t=this.updateHelpers.forceYAxisUpdate(t)),s.globals.collapsedSeriesIndices.length>0&&this.series.clearPreviousPaths(),t.theme&&(t=this.theme.updateThemeOptions(t)),this.updateHelpers._updateOptions(t,i,n,a,r)}},{key:"updateSeries",value:function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:[],e=!(arguments.length>1&&void 0!==arguments[1])||arguments[1],i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];return this.series.resetSeries(!1),this.updateHelpers.revertDefaultAxisMinMax(),this.updateHelpers._updateSeries(t,e,i)}},{key:"appendSeries",value:function(t){var e=!(arguments.length>1&&void 0!==arguments[1])||arguments[1],i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],n=this.w.config.series.slice();return n.push(t),this.series.resetSeries(!1),this.updateHelpers.revertDefaultAxisMinMax(),this.updateHelpers._updateSeries(n,e,i)}},{key:"appendData",value:function(t){var e=!(arguments.length>1&&void 0!==arguments[1])||arguments[1],i=this;i.w.globals.dataChanged=!0,i.series.getPreviousPaths();for(var n=i.w.config.series.slice(),a=0;a<n.length;a++)if(null!==t[a]&&void 0!==t[a])for(var r=0;r<t[a].data.length;r++)n[a].data.push(t[a].data[r]);return i.w.config.series=n,e&&(i.w.globals.initialSeries=x.clone(i.w.config.series)),this.update()}},{key:"update",value:function(t){var e=this;return new Promise((function(i,n){new Ht(e.ctx).clear({isUpdating:!0});var a=e.create(e.w.config.series,t);if(!a)return i(e);e.mount(a).then((function(){"function"==typeof e.w.config.chart.events.updated&&e.w.config.chart.events.updated(e,e.w),e.events.fireEvent("updated",[e,e.w]),e.w.globals.isDirty=!0,i(e)})).catch((function(t){n(t)}))}))}},{key:"getSyncedCharts",value:function(){var t=this.getGroupedCharts(),e=[this];return t.length&&(e=[],t.forEach((function(t){e.push(t)}))),e}},{key:"getGroupedCharts",value:function(){var t=this;return Apex._chartInstances.filter((function(t){if(t.group)return!0})).map((function(e){return t.w.config.chart.group===e.group?e.chart:t}))}},{key:"toggleSeries",value:function(t){return this.series.toggleSeries(t)}},{key:"highlightSeriesOnLegendHover",value:function(t,e){return this.series.toggleSeriesOnHover(t,e)}},{key:"showSeries",value:function(t){this.series.showSeries(t)}},{key:"hideSeries",value:function(t){this.series.hideSeries(t)}},{key:"resetSeries",value:function(){var t=!(arguments.length>0&&void 0!==arguments[0])||arguments[0],e=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];this.series.resetSeries(t,e)}},{key:"addEventListener",value:function(t,e){this.events.addEventListener(t,e)}},{key:"removeEventListener",value:function(t,e){this.events.removeEventListener(t,e)}},{key:"addXaxisAnnotation",value:function(t){var e=!(arguments.length>1&&void 0!==arguments[1])||arguments[1],i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:void 0,n=this;i&&(n=i),n.annotations.addXaxisAnnotationExternal(t,e,n)}},{key:"addYaxisAnnotation",value:function(t){var e=!(arguments.length>1&&void 0!==arguments[1])||arguments[1],i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:void 0,n=this;i&&(n=i),n.annotations.addYaxisAnnotationExternal(t,e,n)}},{key:"addPointAnnotation",value:function(t){var e=!(arguments.length>1&&void 0!==arguments[1])||arguments[1],i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:void 0,n=this;i&&(n=i),n.annotations.addPointAnnotationExternal(t,e,n)}},{key:"clearAnnotations",value:function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:void 0,e=this;t&&(e=t),e.annotations.clearAnnotations(e)}},{key:"removeAnnotation",value:function(t){var e=arguments.length>1&&void 0!==arguments[1]?arguments[1]:void 0,i=this;e&&(i=e),i.annotations.removeAnnotation(i,t)}},{key:"getChartArea",value:function(){return this.w.globals.dom.baseEl.querySelector(".apexcharts-inner")}},{key:"getSeriesTotalXRange",value:function(t,e){return this.coreUtils.getSeriesTotalsXRange(t,e)}},{key:"getHighestValueInSeries",value:function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:0,e=new K(this.ctx);return e.getMinYMaxY(t).highestY}},{key:"getLowestValueInSeries",value:function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:0,e=new K(this.ctx);return e.getMinYMaxY(t).lowestY}},{key:"getSeriesTotal",value:function(){return this.w.globals.seriesTotals}},{key:"toggleDataPointSelection",value:function(t,e){return this.updateHelpers.toggleDataPointSelection(t,e)}},{key:"zoomX",value:function(t,e){this.ctx.toolbar.zoomUpdateOptions(t,e)}},{key:"setLocale",value:function(t){this.localization.setCurrentLocaleValues(t)}},{key:"dataURI",value:function(t){return new U(this.ctx).dataURI(t)}},{key:"paper",value:function(){return this.w.globals.dom.Paper}},{key:"_parentResizeCallback",value:function(){this.w.globals.animationEnded&&this.w.config.chart.redrawOnParentResize&&this._windowResize()}},{key:"_windowResize",value:function(){var t=this;clearTimeout(this.w.globals.resizeTimer),this.w.globals.resizeTimer=window.setTimeout((function(){t.w.globals.resized=!0,t.w.globals.dataChanged=!1,t.ctx.update()}),150)}},{key:"_windowResizeHandler",value:function(){var t=this.w.config.chart.redrawOnWindowResize;"function"==typeof t&&(t=t()),t&&this._windowResize()}}],[{key:"getChartByID",value:function(t){var e=x.escapeString(t),i=Apex._chartInstances.filter((function(t){return t.id===e}))[0];return i&&i.chart}},{key:"initOnLoad",value:function(){for(var e=document.querySelectorAll("[data-apexcharts]"),i=0;i<e.length;i++)new t(e[i],JSON.parse(e[i].getAttribute("data-options"))).render()}},{key:"exec",value:function(t,e){var i=this.getChartByID(t);if(i){i.w.globals.isExecCalled=!0;var n=null;if(-1!==i.publicMethods.indexOf(e)){for(var a=arguments.length,r=new Array(a>2?a-2:0),s=2;s<a;s++)r[s-2]=arguments[s];n=i[e].apply(i,r)}return n}}},{key:"merge",value:function(t,e){return x.extend(t,e)}}]),t}();t.exports=Xt},695:function(t,e,i){t.exports=function(t,e){"use strict";const i=t=>t&&"object"==typeof t&&"default"in t?t:{default:t},n=i(t),a=i(e),r="transitionend",s=t=>(t=>!(!t||"object"!=typeof t)&&(void 0!==t.jquery&&(t=t[0]),void 0!==t.nodeType))(t)?t.jquery?t[0]:t:"string"==typeof t&&t.length>0?document.querySelector(t):null,o=t=>{"function"==typeof t&&t()},l=(t,e,i=!0)=>{if(!i)return void o(t);const n=(t=>{if(!t)return 0;let{transitionDuration:e,transitionDelay:i}=window.getComputedStyle(t);const n=Number.parseFloat(e),a=Number.parseFloat(i);return n||a?(e=e.split(",")[0],i=i.split(",")[0],1e3*(Number.parseFloat(e)+Number.parseFloat(i))):0})(e)+5;let a=!1;const s=({target:i})=>{i===e&&(a=!0,e.removeEventListener(r,s),o(t))};e.addEventListener(r,s),setTimeout((()=>{a||e.dispatchEvent(new Event(r))}),n)};return class{constructor(t){(t=s(t))&&(this._element=t,n.default.set(this._element,this.constructor.DATA_KEY,this))}dispose(){n.default.remove(this._element,this.constructor.DATA_KEY),a.default.off(this._element,this.constructor.EVENT_KEY),Object.getOwnPropertyNames(this).forEach((t=>{this[t]=null}))}_queueCallback(t,e,i=!0){l(t,e,i)}static getInstance(t){return n.default.get(s(t),this.DATA_KEY)}static getOrCreateInstance(t,e={}){return this.getInstance(t)||new this(t,"object"==typeof e?e:null)}static get VERSION(){return"5.1.3"}static get NAME(){throw new Error('You have to implement the static method "NAME", for each component!')}static get DATA_KEY(){return`bs.${this.NAME}`}static get EVENT_KEY(){return`.${this.DATA_KEY}`}}}(i(493),i(286))},493:function(t){t.exports=function(){"use strict";const t=new Map;return{set(e,i,n){t.has(e)||t.set(e,new Map);const a=t.get(e);a.has(i)||0===a.size?a.set(i,n):console.error(`Bootstrap doesn't allow more than one instance per element. Bound instance: ${Array.from(a.keys())[0]}.`)},get:(e,i)=>t.has(e)&&t.get(e).get(i)||null,remove(e,i){if(!t.has(e))return;const n=t.get(e);n.delete(i),0===n.size&&t.delete(e)}}}()},286:function(t){t.exports=function(){"use strict";const t=/[^.]*(?=\..*)\.|.*/,e=/\..*/,i=/::\d+$/,n={};let a=1;const r={mouseenter:"mouseover",mouseleave:"mouseout"},s=/^(mouseenter|mouseleave)/i,o=new Set(["click","dblclick","mouseup","mousedown","contextmenu","mousewheel","DOMMouseScroll","mouseover","mouseout","mousemove","selectstart","selectend","keydown","keypress","keyup","orientationchange","touchstart","touchmove","touchend","touchcancel","pointerdown","pointermove","pointerup","pointerleave","pointercancel","gesturestart","gesturechange","gestureend","focus","blur","change","reset","select","submit","focusin","focusout","load","unload","beforeunload","resize","move","DOMContentLoaded","readystatechange","error","abort","scroll"]);function l(t,e){return e&&`${e}::${a++}`||t.uidEvent||a++}function c(t){const e=l(t);return t.uidEvent=e,n[e]=n[e]||{},n[e]}function h(t,e,i=null){const n=Object.keys(t);for(let a=0,r=n.length;a<r;a++){const r=t[n[a]];if(r.originalHandler===e&&r.delegationSelector===i)return r}return null}function u(t,e,i){const n="string"==typeof e,a=n?i:e;let r=g(t);return o.has(r)||(r=t),[n,a,r]}function d(e,i,n,a,r){if("string"!=typeof i||!e)return;if(n||(n=a,a=null),s.test(i)){const t=t=>function(e){if(!e.relatedTarget||e.relatedTarget!==e.delegateTarget&&!e.delegateTarget.contains(e.relatedTarget))return t.call(this,e)};a?a=t(a):n=t(n)}const[o,d,f]=u(i,n,a),g=c(e),m=g[f]||(g[f]={}),v=h(m,d,o?n:null);if(v)return void(v.oneOff=v.oneOff&&r);const x=l(d,i.replace(t,"")),b=o?function(t,e,i){return function n(a){const r=t.querySelectorAll(e);for(let{target:s}=a;s&&s!==this;s=s.parentNode)for(let o=r.length;o--;)if(r[o]===s)return a.delegateTarget=s,n.oneOff&&p.off(t,a.type,e,i),i.apply(s,[a]);return null}}(e,n,a):function(t,e){return function i(n){return n.delegateTarget=t,i.oneOff&&p.off(t,n.type,e),e.apply(t,[n])}}(e,n);b.delegationSelector=o?n:null,b.originalHandler=d,b.oneOff=r,b.uidEvent=x,m[x]=b,e.addEventListener(f,b,o)}function f(t,e,i,n,a){const r=h(e[i],n,a);r&&(t.removeEventListener(i,r,Boolean(a)),delete e[i][r.uidEvent])}function g(t){return t=t.replace(e,""),r[t]||t}const p={on(t,e,i,n){d(t,e,i,n,!1)},one(t,e,i,n){d(t,e,i,n,!0)},off(t,e,n,a){if("string"!=typeof e||!t)return;const[r,s,o]=u(e,n,a),l=o!==e,h=c(t),d=e.startsWith(".");if(void 0!==s){if(!h||!h[o])return;return void f(t,h,o,s,r?n:null)}d&&Object.keys(h).forEach((i=>{!function(t,e,i,n){const a=e[i]||{};Object.keys(a).forEach((r=>{if(r.includes(n)){const n=a[r];f(t,e,i,n.originalHandler,n.delegationSelector)}}))}(t,h,i,e.slice(1))}));const g=h[o]||{};Object.keys(g).forEach((n=>{const a=n.replace(i,"");if(!l||e.includes(a)){const e=g[n];f(t,h,o,e.originalHandler,e.delegationSelector)}}))},trigger(t,e,i){if("string"!=typeof e||!t)return null;const n=(()=>{const{jQuery:t}=window;return t&&!document.body.hasAttribute("data-bs-no-jquery")?t:null})(),a=g(e),r=e!==a,s=o.has(a);let l,c=!0,h=!0,u=!1,d=null;return r&&n&&(l=n.Event(e,i),n(t).trigger(l),c=!l.isPropagationStopped(),h=!l.isImmediatePropagationStopped(),u=l.isDefaultPrevented()),s?(d=document.createEvent("HTMLEvents"),d.initEvent(a,c,!0)):d=new CustomEvent(e,{bubbles:c,cancelable:!0}),void 0!==i&&Object.keys(i).forEach((t=>{Object.defineProperty(d,t,{get:()=>i[t]})})),u&&d.preventDefault(),h&&t.dispatchEvent(d),d.defaultPrevented&&void 0!==l&&l.preventDefault(),d}};return p}()},175:function(t){t.exports=function(){"use strict";function t(t){return"true"===t||"false"!==t&&(t===Number(t).toString()?Number(t):""===t||"null"===t?null:t)}function e(t){return t.replace(/[A-Z]/g,(t=>`-${t.toLowerCase()}`))}return{setDataAttribute(t,i,n){t.setAttribute(`data-bs-${e(i)}`,n)},removeDataAttribute(t,i){t.removeAttribute(`data-bs-${e(i)}`)},getDataAttributes(e){if(!e)return{};const i={};return Object.keys(e.dataset).filter((t=>t.startsWith("bs"))).forEach((n=>{let a=n.replace(/^bs/,"");a=a.charAt(0).toLowerCase()+a.slice(1,a.length),i[a]=t(e.dataset[n])})),i},getDataAttribute:(i,n)=>t(i.getAttribute(`data-bs-${e(n)}`)),offset(t){const e=t.getBoundingClientRect();return{top:e.top+window.pageYOffset,left:e.left+window.pageXOffset}},position:t=>({top:t.offsetTop,left:t.offsetLeft})}}()},737:function(t){t.exports=function(){"use strict";return{find:(t,e=document.documentElement)=>[].concat(...Element.prototype.querySelectorAll.call(e,t)),findOne:(t,e=document.documentElement)=>Element.prototype.querySelector.call(e,t),children:(t,e)=>[].concat(...t.children).filter((t=>t.matches(e))),parents(t,e){const i=[];let n=t.parentNode;for(;n&&n.nodeType===Node.ELEMENT_NODE&&3!==n.nodeType;)n.matches(e)&&i.push(n),n=n.parentNode;return i},prev(t,e){let i=t.previousElementSibling;for(;i;){if(i.matches(e))return[i];i=i.previousElementSibling}return[]},next(t,e){let i=t.nextElementSibling;for(;i;){if(i.matches(e))return[i];i=i.nextElementSibling}return[]},focusableChildren(t){const e=["a","button","input","textarea","select","details","[tabindex]",'[contenteditable="true"]'].map((t=>`${t}:not([tabindex^="-"])`)).join(", ");return this.find(e,t).filter((t=>!(t=>!t||t.nodeType!==Node.ELEMENT_NODE||!!t.classList.contains("disabled")||(void 0!==t.disabled?t.disabled:t.hasAttribute("disabled")&&"false"!==t.getAttribute("disabled")))(t)&&(t=>{return e=t,!(!e||"object"!=typeof e||(void 0!==e.jquery&&(e=e[0]),void 0===e.nodeType)||0===t.getClientRects().length||"visible"!==getComputedStyle(t).getPropertyValue("visibility"));var e})(t)))}}}()},424:function(t,e,i){t.exports=function(t,e,i,n){"use strict";const a=t=>t&&"object"==typeof t&&"default"in t?t:{default:t},r=a(t),s=a(e),o=a(i),l=a(n),c="transitionend",h=t=>{const e=(t=>{let e=t.getAttribute("data-bs-target");if(!e||"#"===e){let i=t.getAttribute("href");if(!i||!i.includes("#")&&!i.startsWith("."))return null;i.includes("#")&&!i.startsWith("#")&&(i=`#${i.split("#")[1]}`),e=i&&"#"!==i?i.trim():null}return e})(t);return e?document.querySelector(e):null},u=t=>!(!t||"object"!=typeof t)&&(void 0!==t.jquery&&(t=t[0]),void 0!==t.nodeType),d=(t,e,i)=>{Object.keys(i).forEach((n=>{const a=i[n],r=e[n],s=r&&u(r)?"element":null==(o=r)?`${o}`:{}.toString.call(o).match(/\s([a-z]+)/i)[1].toLowerCase();var o;if(!new RegExp(a).test(s))throw new TypeError(`${t.toUpperCase()}: Option "${n}" provided type "${s}" but expected type "${a}".`)}))},f=t=>{t.offsetHeight},g=[],p=()=>"rtl"===document.documentElement.dir,m=t=>{"function"==typeof t&&t()},v=(t,e,i=!0)=>{if(!i)return void m(t);const n=(t=>{if(!t)return 0;let{transitionDuration:e,transitionDelay:i}=window.getComputedStyle(t);const n=Number.parseFloat(e),a=Number.parseFloat(i);return n||a?(e=e.split(",")[0],i=i.split(",")[0],1e3*(Number.parseFloat(e)+Number.parseFloat(i))):0})(e)+5;let a=!1;const r=({target:i})=>{i===e&&(a=!0,e.removeEventListener(c,r),m(t))};e.addEventListener(c,r),setTimeout((()=>{a||e.dispatchEvent(new Event(c))}),n)},x=".fixed-top, .fixed-bottom, .is-fixed, .sticky-top",b=".sticky-top";class y{constructor(){this._element=document.body}getWidth(){const t=document.documentElement.clientWidth;return Math.abs(window.innerWidth-t)}hide(){const t=this.getWidth();this._disableOverFlow(),this._setElementAttributes(this._element,"paddingRight",(e=>e+t)),this._setElementAttributes(x,"paddingRight",(e=>e+t)),this._setElementAttributes(b,"marginRight",(e=>e-t))}_disableOverFlow(){this._saveInitialAttribute(this._element,"overflow"),this._element.style.overflow="hidden"}_setElementAttributes(t,e,i){const n=this.getWidth();this._applyManipulationCallback(t,(t=>{if(t!==this._element&&window.innerWidth>t.clientWidth+n)return;this._saveInitialAttribute(t,e);const a=window.getComputedStyle(t)[e];t.style[e]=`${i(Number.parseFloat(a))}px`}))}reset(){this._resetElementAttributes(this._element,"overflow"),this._resetElementAttributes(this._element,"paddingRight"),this._resetElementAttributes(x,"paddingRight"),this._resetElementAttributes(b,"marginRight")}_saveInitialAttribute(t,e){const i=t.style[e];i&&s.default.setDataAttribute(t,e,i)}_resetElementAttributes(t,e){this._applyManipulationCallback(t,(t=>{const i=s.default.getDataAttribute(t,e);void 0===i?t.style.removeProperty(e):(s.default.removeDataAttribute(t,e),t.style[e]=i)}))}_applyManipulationCallback(t,e){u(t)?e(t):o.default.find(t,this._element).forEach(e)}isOverflowing(){return this.getWidth()>0}}const w={className:"modal-backdrop",isVisible:!0,isAnimated:!1,rootElement:"body",clickCallback:null},k={className:"string",isVisible:"boolean",isAnimated:"boolean",rootElement:"(element|string)",clickCallback:"(function|null)"},A="backdrop",S="show",_="mousedown.bs.backdrop";class C{constructor(t){this._config=this._getConfig(t),this._isAppended=!1,this._element=null}show(t){this._config.isVisible?(this._append(),this._config.isAnimated&&f(this._getElement()),this._getElement().classList.add(S),this._emulateAnimation((()=>{m(t)}))):m(t)}hide(t){this._config.isVisible?(this._getElement().classList.remove(S),this._emulateAnimation((()=>{this.dispose(),m(t)}))):m(t)}_getElement(){if(!this._element){const t=document.createElement("div");t.className=this._config.className,this._config.isAnimated&&t.classList.add("fade"),this._element=t}return this._element}_getConfig(t){return(t={...w,..."object"==typeof t?t:{}}).rootElement=(e=t.rootElement,u(e)?e.jquery?e[0]:e:"string"==typeof e&&e.length>0?document.querySelector(e):null),d(A,t,k),t;var e}_append(){this._isAppended||(this._config.rootElement.append(this._getElement()),r.default.on(this._getElement(),_,(()=>{m(this._config.clickCallback)})),this._isAppended=!0)}dispose(){this._isAppended&&(r.default.off(this._element,_),this._element.remove(),this._isAppended=!1)}_emulateAnimation(t){v(t,this._getElement(),this._config.isAnimated)}}const E={trapElement:null,autofocus:!0},T={trapElement:"element",autofocus:"boolean"},P=".bs.focustrap",M="backward";class L{constructor(t){this._config=this._getConfig(t),this._isActive=!1,this._lastTabNavDirection=null}activate(){const{trapElement:t,autofocus:e}=this._config;this._isActive||(e&&t.focus(),r.default.off(document,P),r.default.on(document,"focusin.bs.focustrap",(t=>this._handleFocusin(t))),r.default.on(document,"keydown.tab.bs.focustrap",(t=>this._handleKeydown(t))),this._isActive=!0)}deactivate(){this._isActive&&(this._isActive=!1,r.default.off(document,P))}_handleFocusin(t){const{target:e}=t,{trapElement:i}=this._config;if(e===document||e===i||i.contains(e))return;const n=o.default.focusableChildren(i);0===n.length?i.focus():this._lastTabNavDirection===M?n[n.length-1].focus():n[0].focus()}_handleKeydown(t){"Tab"===t.key&&(this._lastTabNavDirection=t.shiftKey?M:"forward")}_getConfig(t){return t={...E,..."object"==typeof t?t:{}},d("focustrap",t,T),t}}const D="modal",I=".bs.modal",O="Escape",N={backdrop:!0,keyboard:!0,focus:!0},F={backdrop:"(boolean|string)",keyboard:"boolean",focus:"boolean"},R="hidden.bs.modal",z="show.bs.modal",H="resize.bs.modal",Y="click.dismiss.bs.modal",X="keydown.dismiss.bs.modal",B="mousedown.dismiss.bs.modal",j="modal-open",W="show",V="modal-static";class G extends l.default{constructor(t,e){super(t),this._config=this._getConfig(e),this._dialog=o.default.findOne(".modal-dialog",this._element),this._backdrop=this._initializeBackDrop(),this._focustrap=this._initializeFocusTrap(),this._isShown=!1,this._ignoreBackdropClick=!1,this._isTransitioning=!1,this._scrollBar=new y}static get Default(){return N}static get NAME(){return D}toggle(t){return this._isShown?this.hide():this.show(t)}show(t){this._isShown||this._isTransitioning||r.default.trigger(this._element,z,{relatedTarget:t}).defaultPrevented||(this._isShown=!0,this._isAnimated()&&(this._isTransitioning=!0),this._scrollBar.hide(),document.body.classList.add(j),this._adjustDialog(),this._setEscapeEvent(),this._setResizeEvent(),r.default.on(this._dialog,B,(()=>{r.default.one(this._element,"mouseup.dismiss.bs.modal",(t=>{t.target===this._element&&(this._ignoreBackdropClick=!0)}))})),this._showBackdrop((()=>this._showElement(t))))}hide(){if(!this._isShown||this._isTransitioning)return;if(r.default.trigger(this._element,"hide.bs.modal").defaultPrevented)return;this._isShown=!1;const t=this._isAnimated();t&&(this._isTransitioning=!0),this._setEscapeEvent(),this._setResizeEvent(),this._focustrap.deactivate(),this._element.classList.remove(W),r.default.off(this._element,Y),r.default.off(this._dialog,B),this._queueCallback((()=>this._hideModal()),this._element,t)}dispose(){[window,this._dialog].forEach((t=>r.default.off(t,I))),this._backdrop.dispose(),this._focustrap.deactivate(),super.dispose()}handleUpdate(){this._adjustDialog()}_initializeBackDrop(){return new C({isVisible:Boolean(this._config.backdrop),isAnimated:this._isAnimated()})}_initializeFocusTrap(){return new L({trapElement:this._element})}_getConfig(t){return t={...N,...s.default.getDataAttributes(this._element),..."object"==typeof t?t:{}},d(D,t,F),t}_showElement(t){const e=this._isAnimated(),i=o.default.findOne(".modal-body",this._dialog);this._element.parentNode&&this._element.parentNode.nodeType===Node.ELEMENT_NODE||document.body.append(this._element),this._element.style.display="block",this._element.removeAttribute("aria-hidden"),this._element.setAttribute("aria-modal",!0),this._element.setAttribute("role","dialog"),this._element.scrollTop=0,i&&(i.scrollTop=0),e&&f(this._element),this._element.classList.add(W);this._queueCallback((()=>{this._config.focus&&this._focustrap.activate(),this._isTransitioning=!1,r.default.trigger(this._element,"shown.bs.modal",{relatedTarget:t})}),this._dialog,e)}_setEscapeEvent(){this._isShown?r.default.on(this._element,X,(t=>{this._config.keyboard&&t.key===O?(t.preventDefault(),this.hide()):this._config.keyboard||t.key!==O||this._triggerBackdropTransition()})):r.default.off(this._element,X)}_setResizeEvent(){this._isShown?r.default.on(window,H,(()=>this._adjustDialog())):r.default.off(window,H)}_hideModal(){this._element.style.display="none",this._element.setAttribute("aria-hidden",!0),this._element.removeAttribute("aria-modal"),this._element.removeAttribute("role"),this._isTransitioning=!1,this._backdrop.hide((()=>{document.body.classList.remove(j),this._resetAdjustments(),this._scrollBar.reset(),r.default.trigger(this._element,R)}))}_showBackdrop(t){r.default.on(this._element,Y,(t=>{this._ignoreBackdropClick?this._ignoreBackdropClick=!1:t.target===t.currentTarget&&(!0===this._config.backdrop?this.hide():"static"===this._config.backdrop&&this._triggerBackdropTransition())})),this._backdrop.show(t)}_isAnimated(){return this._element.classList.contains("fade")}_triggerBackdropTransition(){if(r.default.trigger(this._element,"hidePrevented.bs.modal").defaultPrevented)return;const{classList:t,scrollHeight:e,style:i}=this._element,n=e>document.documentElement.clientHeight;!n&&"hidden"===i.overflowY||t.contains(V)||(n||(i.overflowY="hidden"),t.add(V),this._queueCallback((()=>{t.remove(V),n||this._queueCallback((()=>{i.overflowY=""}),this._dialog)}),this._dialog),this._element.focus())}_adjustDialog(){const t=this._element.scrollHeight>document.documentElement.clientHeight,e=this._scrollBar.getWidth(),i=e>0;(!i&&t&&!p()||i&&!t&&p())&&(this._element.style.paddingLeft=`${e}px`),(i&&!t&&!p()||!i&&t&&p())&&(this._element.style.paddingRight=`${e}px`)}_resetAdjustments(){this._element.style.paddingLeft="",this._element.style.paddingRight=""}static jQueryInterface(t,e){return this.each((function(){const i=G.getOrCreateInstance(this,t);if("string"==typeof t){if(void 0===i[t])throw new TypeError(`No method named "${t}"`);i[t](e)}}))}}return r.default.on(document,"click.bs.modal.data-api",'[data-bs-toggle="modal"]',(function(t){const e=h(this);["A","AREA"].includes(this.tagName)&&t.preventDefault(),r.default.one(e,z,(t=>{t.defaultPrevented||r.default.one(e,R,(()=>{var t;u(t=this)&&0!==t.getClientRects().length&&"visible"===getComputedStyle(t).getPropertyValue("visibility")&&this.focus()}))}));const i=o.default.findOne(".modal.show");i&&G.getInstance(i).hide(),G.getOrCreateInstance(e).toggle(this)})),((t,e="hide")=>{const i=`click.dismiss${t.EVENT_KEY}`,n=t.NAME;r.default.on(document,i,`[data-bs-dismiss="${n}"]`,(function(i){if(["A","AREA"].includes(this.tagName)&&i.preventDefault(),!(a=this)||a.nodeType!==Node.ELEMENT_NODE||a.classList.contains("disabled")||(void 0!==a.disabled?a.disabled:a.hasAttribute("disabled")&&"false"!==a.getAttribute("disabled")))return;var a;const r=h(this)||this.closest(`.${n}`);t.getOrCreateInstance(r)[e]()}))})(G),U=G,q=()=>{const t=(()=>{const{jQuery:t}=window;return t&&!document.body.hasAttribute("data-bs-no-jquery")?t:null})();if(t){const e=U.NAME,i=t.fn[e];t.fn[e]=U.jQueryInterface,t.fn[e].Constructor=U,t.fn[e].noConflict=()=>(t.fn[e]=i,U.jQueryInterface)}},"loading"===document.readyState?(g.length||document.addEventListener("DOMContentLoaded",(()=>{g.forEach((t=>t()))})),g.push(q)):q(),G;var U,q}(i(286),i(175),i(737),i(695))},953:function(t){t.exports=function(){"use strict";var t=function(){return t=Object.assign||function(t){for(var e,i=1,n=arguments.length;i<n;i++)for(var a in e=arguments[i])Object.prototype.hasOwnProperty.call(e,a)&&(t[a]=e[a]);return t},t.apply(this,arguments)};function e(){for(var t=0,e=0,i=arguments.length;e<i;e++)t+=arguments[e].length;var n=Array(t),a=0;for(e=0;e<i;e++)for(var r=arguments[e],s=0,o=r.length;s<o;s++,a++)n[a]=r[s];return n}var i=["onChange","onClose","onDayCreate","onDestroy","onKeyDown","onMonthChange","onOpen","onParseConfig","onReady","onValueUpdate","onYearChange","onPreCalendarPosition"],n={_disable:[],allowInput:!1,allowInvalidPreload:!1,altFormat:"F j, Y",altInput:!1,altInputClass:"form-control input",animate:"object"==typeof window&&-1===window.navigator.userAgent.indexOf("MSIE"),ariaDateFormat:"F j, Y",autoFillDefaultTime:!0,clickOpens:!0,closeOnSelect:!0,conjunction:", ",dateFormat:"Y-m-d",defaultHour:12,defaultMinute:0,defaultSeconds:0,disable:[],disableMobile:!1,enableSeconds:!1,enableTime:!1,errorHandler:function(t){return"undefined"!=typeof console&&console.warn(t)},getWeek:function(t){var e=new Date(t.getTime());e.setHours(0,0,0,0),e.setDate(e.getDate()+3-(e.getDay()+6)%7);var i=new Date(e.getFullYear(),0,4);return 1+Math.round(((e.getTime()-i.getTime())/864e5-3+(i.getDay()+6)%7)/7)},hourIncrement:1,ignoredFocusElements:[],inline:!1,locale:"default",minuteIncrement:5,mode:"single",monthSelectorType:"dropdown",nextArrow:"<svg version='1.1' xmlns='http://www.w3.org/2000/svg' xmlns:xlink='http://www.w3.org/1999/xlink' viewBox='0 0 17 17'><g></g><path d='M13.207 8.472l-7.854 7.854-0.707-0.707 7.146-7.146-7.146-7.148 0.707-0.707 7.854 7.854z' /></svg>",noCalendar:!1,now:new Date,onChange:[],onClose:[],onDayCreate:[],onDestroy:[],onKeyDown:[],onMonthChange:[],onOpen:[],onParseConfig:[],onReady:[],onValueUpdate:[],onYearChange:[],onPreCalendarPosition:[],plugins:[],position:"auto",positionElement:void 0,prevArrow:"<svg version='1.1' xmlns='http://www.w3.org/2000/svg' xmlns:xlink='http://www.w3.org/1999/xlink' viewBox='0 0 17 17'><g></g><path d='M5.207 8.471l7.146 7.147-0.707 0.707-7.853-7.854 7.854-7.853 0.707 0.707-7.147 7.146z' /></svg>",shorthandCurrentMonth:!1,showMonths:1,static:!1,time_24hr:!1,weekNumbers:!1,wrap:!1},a={weekdays:{shorthand:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],longhand:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"]},months:{shorthand:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],longhand:["January","February","March","April","May","June","July","August","September","October","November","December"]},daysInMonth:[31,28,31,30,31,30,31,31,30,31,30,31],firstDayOfWeek:0,ordinal:function(t){var e=t%100;if(e>3&&e<21)return"th";switch(e%10){case 1:return"st";case 2:return"nd";case 3:return"rd";default:return"th"}},rangeSeparator:" to ",weekAbbreviation:"Wk",scrollTitle:"Scroll to increment",toggleTitle:"Click to toggle",amPM:["AM","PM"],yearAriaLabel:"Year",monthAriaLabel:"Month",hourAriaLabel:"Hour",minuteAriaLabel:"Minute",time_24hr:!1},r=function(t,e){return void 0===e&&(e=2),("000"+t).slice(-1*e)},s=function(t){return!0===t?1:0};function o(t,e){var i;return function(){var n=this,a=arguments;clearTimeout(i),i=setTimeout((function(){return t.apply(n,a)}),e)}}var l=function(t){return t instanceof Array?t:[t]};function c(t,e,i){if(!0===i)return t.classList.add(e);t.classList.remove(e)}function h(t,e,i){var n=window.document.createElement(t);return e=e||"",i=i||"",n.className=e,void 0!==i&&(n.textContent=i),n}function u(t){for(;t.firstChild;)t.removeChild(t.firstChild)}function d(t,e){return e(t)?t:t.parentNode?d(t.parentNode,e):void 0}function f(t,e){var i=h("div","numInputWrapper"),n=h("input","numInput "+t),a=h("span","arrowUp"),r=h("span","arrowDown");if(-1===navigator.userAgent.indexOf("MSIE 9.0")?n.type="number":(n.type="text",n.pattern="\\d*"),void 0!==e)for(var s in e)n.setAttribute(s,e[s]);return i.appendChild(n),i.appendChild(a),i.appendChild(r),i}function g(t){try{return"function"==typeof t.composedPath?t.composedPath()[0]:t.target}catch(e){return t.target}}var p=function(){},m=function(t,e,i){return i.months[e?"shorthand":"longhand"][t]},v={D:p,F:function(t,e,i){t.setMonth(i.months.longhand.indexOf(e))},G:function(t,e){t.setHours((t.getHours()>=12?12:0)+parseFloat(e))},H:function(t,e){t.setHours(parseFloat(e))},J:function(t,e){t.setDate(parseFloat(e))},K:function(t,e,i){t.setHours(t.getHours()%12+12*s(new RegExp(i.amPM[1],"i").test(e)))},M:function(t,e,i){t.setMonth(i.months.shorthand.indexOf(e))},S:function(t,e){t.setSeconds(parseFloat(e))},U:function(t,e){return new Date(1e3*parseFloat(e))},W:function(t,e,i){var n=parseInt(e),a=new Date(t.getFullYear(),0,2+7*(n-1),0,0,0,0);return a.setDate(a.getDate()-a.getDay()+i.firstDayOfWeek),a},Y:function(t,e){t.setFullYear(parseFloat(e))},Z:function(t,e){return new Date(e)},d:function(t,e){t.setDate(parseFloat(e))},h:function(t,e){t.setHours((t.getHours()>=12?12:0)+parseFloat(e))},i:function(t,e){t.setMinutes(parseFloat(e))},j:function(t,e){t.setDate(parseFloat(e))},l:p,m:function(t,e){t.setMonth(parseFloat(e)-1)},n:function(t,e){t.setMonth(parseFloat(e)-1)},s:function(t,e){t.setSeconds(parseFloat(e))},u:function(t,e){return new Date(parseFloat(e))},w:p,y:function(t,e){t.setFullYear(2e3+parseFloat(e))}},x={D:"",F:"",G:"(\\d\\d|\\d)",H:"(\\d\\d|\\d)",J:"(\\d\\d|\\d)\\w+",K:"",M:"",S:"(\\d\\d|\\d)",U:"(.+)",W:"(\\d\\d|\\d)",Y:"(\\d{4})",Z:"(.+)",d:"(\\d\\d|\\d)",h:"(\\d\\d|\\d)",i:"(\\d\\d|\\d)",j:"(\\d\\d|\\d)",l:"",m:"(\\d\\d|\\d)",n:"(\\d\\d|\\d)",s:"(\\d\\d|\\d)",u:"(.+)",w:"(\\d\\d|\\d)",y:"(\\d{2})"},b={Z:function(t){return t.toISOString()},D:function(t,e,i){return e.weekdays.shorthand[b.w(t,e,i)]},F:function(t,e,i){return m(b.n(t,e,i)-1,!1,e)},G:function(t,e,i){return r(b.h(t,e,i))},H:function(t){return r(t.getHours())},J:function(t,e){return void 0!==e.ordinal?t.getDate()+e.ordinal(t.getDate()):t.getDate()},K:function(t,e){return e.amPM[s(t.getHours()>11)]},M:function(t,e){return m(t.getMonth(),!0,e)},S:function(t){return r(t.getSeconds())},U:function(t){return t.getTime()/1e3},W:function(t,e,i){return i.getWeek(t)},Y:function(t){return r(t.getFullYear(),4)},d:function(t){return r(t.getDate())},h:function(t){return t.getHours()%12?t.getHours()%12:12},i:function(t){return r(t.getMinutes())},j:function(t){return t.getDate()},l:function(t,e){return e.weekdays.longhand[t.getDay()]},m:function(t){return r(t.getMonth()+1)},n:function(t){return t.getMonth()+1},s:function(t){return t.getSeconds()},u:function(t){return t.getTime()},w:function(t){return t.getDay()},y:function(t){return String(t.getFullYear()).substring(2)}},y=function(t){var e=t.config,i=void 0===e?n:e,r=t.l10n,s=void 0===r?a:r,o=t.isMobile,l=void 0!==o&&o;return function(t,e,n){var a=n||s;return void 0===i.formatDate||l?e.split("").map((function(e,n,r){return b[e]&&"\\"!==r[n-1]?b[e](t,a,i):"\\"!==e?e:""})).join(""):i.formatDate(t,e,a)}},w=function(t){var e=t.config,i=void 0===e?n:e,r=t.l10n,s=void 0===r?a:r;return function(t,e,a,r){if(0===t||t){var o,l=r||s,c=t;if(t instanceof Date)o=new Date(t.getTime());else if("string"!=typeof t&&void 0!==t.toFixed)o=new Date(t);else if("string"==typeof t){var h=e||(i||n).dateFormat,u=String(t).trim();if("today"===u)o=new Date,a=!0;else if(i&&i.parseDate)o=i.parseDate(t,h);else if(/Z$/.test(u)||/GMT$/.test(u))o=new Date(t);else{for(var d=void 0,f=[],g=0,p=0,m="";g<h.length;g++){var b=h[g],y="\\"===b,w="\\"===h[g-1]||y;if(x[b]&&!w){m+=x[b];var k=new RegExp(m).exec(t);k&&(d=!0)&&f["Y"!==b?"push":"unshift"]({fn:v[b],val:k[++p]})}else y||(m+=".")}o=i&&i.noCalendar?new Date((new Date).setHours(0,0,0,0)):new Date((new Date).getFullYear(),0,1,0,0,0,0),f.forEach((function(t){var e=t.fn,i=t.val;return o=e(o,i,l)||o})),o=d?o:void 0}}if(o instanceof Date&&!isNaN(o.getTime()))return!0===a&&o.setHours(0,0,0,0),o;i.errorHandler(new Error("Invalid date provided: "+c))}}};function k(t,e,i){return void 0===i&&(i=!0),!1!==i?new Date(t.getTime()).setHours(0,0,0,0)-new Date(e.getTime()).setHours(0,0,0,0):t.getTime()-e.getTime()}var A=function(t,e,i){return 3600*t+60*e+i},S=864e5;function _(t){var e=t.defaultHour,i=t.defaultMinute,n=t.defaultSeconds;if(void 0!==t.minDate){var a=t.minDate.getHours(),r=t.minDate.getMinutes(),s=t.minDate.getSeconds();e<a&&(e=a),e===a&&i<r&&(i=r),e===a&&i===r&&n<s&&(n=t.minDate.getSeconds())}if(void 0!==t.maxDate){var o=t.maxDate.getHours(),l=t.maxDate.getMinutes();(e=Math.min(e,o))===o&&(i=Math.min(l,i)),e===o&&i===l&&(n=t.maxDate.getSeconds())}return{hours:e,minutes:i,seconds:n}}"function"!=typeof Object.assign&&(Object.assign=function(t){for(var e=[],i=1;i<arguments.length;i++)e[i-1]=arguments[i];if(!t)throw TypeError("Cannot convert undefined or null to object");for(var n=function(e){e&&Object.keys(e).forEach((function(i){return t[i]=e[i]}))},a=0,r=e;a<r.length;a++)n(r[a]);return t});function C(p,v){var b={config:t(t({},n),T.defaultConfig),l10n:a};function C(){var t;return(null===(t=b.calendarContainer)||void 0===t?void 0:t.getRootNode()).activeElement||document.activeElement}function E(t){return t.bind(b)}function P(){var t=b.config;!1===t.weekNumbers&&1===t.showMonths||!0!==t.noCalendar&&window.requestAnimationFrame((function(){if(void 0!==b.calendarContainer&&(b.calendarContainer.style.visibility="hidden",b.calendarContainer.style.display="block"),void 0!==b.daysContainer){var e=(b.days.offsetWidth+1)*t.showMonths;b.daysContainer.style.width=e+"px",b.calendarContainer.style.width=e+(void 0!==b.weekWrapper?b.weekWrapper.offsetWidth:0)+"px",b.calendarContainer.style.removeProperty("visibility"),b.calendarContainer.style.removeProperty("display")}}))}function M(t){if(0===b.selectedDates.length){var e=void 0===b.config.minDate||k(new Date,b.config.minDate)>=0?new Date:new Date(b.config.minDate.getTime()),i=_(b.config);e.setHours(i.hours,i.minutes,i.seconds,e.getMilliseconds()),b.selectedDates=[e],b.latestSelectedDateObj=e}void 0!==t&&"blur"!==t.type&&function(t){t.preventDefault();var e="keydown"===t.type,i=g(t),n=i;void 0!==b.amPM&&i===b.amPM&&(b.amPM.textContent=b.l10n.amPM[s(b.amPM.textContent===b.l10n.amPM[0])]);var a=parseFloat(n.getAttribute("min")),o=parseFloat(n.getAttribute("max")),l=parseFloat(n.getAttribute("step")),c=parseInt(n.value,10),h=c+l*(t.delta||(e?38===t.which?1:-1:0));if(void 0!==n.value&&2===n.value.length){var u=n===b.hourElement,d=n===b.minuteElement;h<a?(h=o+h+s(!u)+(s(u)&&s(!b.amPM)),d&&H(void 0,-1,b.hourElement)):h>o&&(h=n===b.hourElement?h-o-s(!b.amPM):a,d&&H(void 0,1,b.hourElement)),b.amPM&&u&&(1===l?h+c===23:Math.abs(h-c)>l)&&(b.amPM.textContent=b.l10n.amPM[s(b.amPM.textContent===b.l10n.amPM[0])]),n.value=r(h)}}(t);var n=b._input.value,a=b.parseDate(n),o=b.latestSelectedDateObj;n&&o&&(null==a?void 0:a.getTime())!==(null==o?void 0:o.getTime())?mt(a):L(),St(),b._input.value!==n&&b._debouncedChange()}function L(){if(void 0!==b.hourElement&&void 0!==b.minuteElement){var t=(parseInt(b.hourElement.value.slice(-2),10)||0)%24,e=(parseInt(b.minuteElement.value,10)||0)%60,i=void 0!==b.secondElement?(parseInt(b.secondElement.value,10)||0)%60:0;void 0!==b.amPM&&(d=t,f=b.amPM.textContent,t=d%12+12*s(f===b.l10n.amPM[1]));var n=void 0!==b.config.minTime||b.config.minDate&&b.minDateHasTime&&b.latestSelectedDateObj&&0===k(b.latestSelectedDateObj,b.config.minDate,!0),a=void 0!==b.config.maxTime||b.config.maxDate&&b.maxDateHasTime&&b.latestSelectedDateObj&&0===k(b.latestSelectedDateObj,b.config.maxDate,!0);if(void 0!==b.config.maxTime&&void 0!==b.config.minTime&&b.config.minTime>b.config.maxTime){var r=A(b.config.minTime.getHours(),b.config.minTime.getMinutes(),b.config.minTime.getSeconds()),o=A(b.config.maxTime.getHours(),b.config.maxTime.getMinutes(),b.config.maxTime.getSeconds()),l=A(t,e,i);if(l>o&&l<r){var c=function(t){var e=Math.floor(t/3600),i=(t-3600*e)/60;return[e,i,t-3600*e-60*i]}(r);t=c[0],e=c[1],i=c[2]}}else{if(a){var h=void 0!==b.config.maxTime?b.config.maxTime:b.config.maxDate;(t=Math.min(t,h.getHours()))===h.getHours()&&(e=Math.min(e,h.getMinutes())),e===h.getMinutes()&&(i=Math.min(i,h.getSeconds()))}if(n){var u=void 0!==b.config.minTime?b.config.minTime:b.config.minDate;(t=Math.max(t,u.getHours()))===u.getHours()&&e<u.getMinutes()&&(e=u.getMinutes()),e===u.getMinutes()&&(i=Math.max(i,u.getSeconds()))}}I(t,e,i)}var d,f}function D(t){var e=t||b.latestSelectedDateObj;e&&I(e.getHours(),e.getMinutes(),e.getSeconds())}function I(t,e,i){void 0!==b.latestSelectedDateObj&&b.latestSelectedDateObj.setHours(t%24,e,i||0,0),b.hourElement&&b.minuteElement&&!b.isMobile&&(b.hourElement.value=r(b.config.time_24hr?t:(12+t)%12+12*s(t%12==0)),b.minuteElement.value=r(e),void 0!==b.amPM&&(b.amPM.textContent=b.l10n.amPM[s(t>=12)]),void 0!==b.secondElement&&(b.secondElement.value=r(i)))}function O(t){var e=g(t),i=parseInt(e.value)+(t.delta||0);(i/1e3>1||"Enter"===t.key&&!/[^\d]/.test(i.toString()))&&tt(i)}function N(t,e,i,n){return e instanceof Array?e.forEach((function(e){return N(t,e,i,n)})):t instanceof Array?t.forEach((function(t){return N(t,e,i,n)})):(t.addEventListener(e,i,n),void b._handlers.push({remove:function(){return t.removeEventListener(e,i,n)}}))}function F(){bt("onChange")}function R(t,e){var i=void 0!==t?b.parseDate(t):b.latestSelectedDateObj||(b.config.minDate&&b.config.minDate>b.now?b.config.minDate:b.config.maxDate&&b.config.maxDate<b.now?b.config.maxDate:b.now),n=b.currentYear,a=b.currentMonth;try{void 0!==i&&(b.currentYear=i.getFullYear(),b.currentMonth=i.getMonth())}catch(t){t.message="Invalid date supplied: "+i,b.config.errorHandler(t)}e&&b.currentYear!==n&&(bt("onYearChange"),G()),!e||b.currentYear===n&&b.currentMonth===a||bt("onMonthChange"),b.redraw()}function z(t){var e=g(t);~e.className.indexOf("arrow")&&H(t,e.classList.contains("arrowUp")?1:-1)}function H(t,e,i){var n=t&&g(t),a=i||n&&n.parentNode&&n.parentNode.firstChild,r=yt("increment");r.delta=e,a&&a.dispatchEvent(r)}function Y(t,e,i,n){var a=et(e,!0),r=h("span",t,e.getDate().toString());return r.dateObj=e,r.$i=n,r.setAttribute("aria-label",b.formatDate(e,b.config.ariaDateFormat)),-1===t.indexOf("hidden")&&0===k(e,b.now)&&(b.todayDateElem=r,r.classList.add("today"),r.setAttribute("aria-current","date")),a?(r.tabIndex=-1,wt(e)&&(r.classList.add("selected"),b.selectedDateElem=r,"range"===b.config.mode&&(c(r,"startRange",b.selectedDates[0]&&0===k(e,b.selectedDates[0],!0)),c(r,"endRange",b.selectedDates[1]&&0===k(e,b.selectedDates[1],!0)),"nextMonthDay"===t&&r.classList.add("inRange")))):r.classList.add("flatpickr-disabled"),"range"===b.config.mode&&function(t){return!("range"!==b.config.mode||b.selectedDates.length<2)&&k(t,b.selectedDates[0])>=0&&k(t,b.selectedDates[1])<=0}(e)&&!wt(e)&&r.classList.add("inRange"),b.weekNumbers&&1===b.config.showMonths&&"prevMonthDay"!==t&&i%7==1&&b.weekNumbers.insertAdjacentHTML("beforeend","<span class='flatpickr-day'>"+b.config.getWeek(e)+"</span>"),bt("onDayCreate",r),r}function X(t){t.focus(),"range"===b.config.mode&&rt(t)}function B(t){for(var e=t>0?0:b.config.showMonths-1,i=t>0?b.config.showMonths:-1,n=e;n!=i;n+=t)for(var a=b.daysContainer.children[n],r=t>0?0:a.children.length-1,s=t>0?a.children.length:-1,o=r;o!=s;o+=t){var l=a.children[o];if(-1===l.className.indexOf("hidden")&&et(l.dateObj))return l}}function j(t,e){var i=C(),n=it(i||document.body),a=void 0!==t?t:n?i:void 0!==b.selectedDateElem&&it(b.selectedDateElem)?b.selectedDateElem:void 0!==b.todayDateElem&&it(b.todayDateElem)?b.todayDateElem:B(e>0?1:-1);void 0===a?b._input.focus():n?function(t,e){for(var i=-1===t.className.indexOf("Month")?t.dateObj.getMonth():b.currentMonth,n=e>0?b.config.showMonths:-1,a=e>0?1:-1,r=i-b.currentMonth;r!=n;r+=a)for(var s=b.daysContainer.children[r],o=i-b.currentMonth===r?t.$i+e:e<0?s.children.length-1:0,l=s.children.length,c=o;c>=0&&c<l&&c!=(e>0?l:-1);c+=a){var h=s.children[c];if(-1===h.className.indexOf("hidden")&&et(h.dateObj)&&Math.abs(t.$i-c)>=Math.abs(e))return X(h)}b.changeMonth(a),j(B(a),0)}(a,e):X(a)}function W(t,e){for(var i=(new Date(t,e,1).getDay()-b.l10n.firstDayOfWeek+7)%7,n=b.utils.getDaysInMonth((e-1+12)%12,t),a=b.utils.getDaysInMonth(e,t),r=window.document.createDocumentFragment(),s=b.config.showMonths>1,o=s?"prevMonthDay hidden":"prevMonthDay",l=s?"nextMonthDay hidden":"nextMonthDay",c=n+1-i,u=0;c<=n;c++,u++)r.appendChild(Y("flatpickr-day "+o,new Date(t,e-1,c),c,u));for(c=1;c<=a;c++,u++)r.appendChild(Y("flatpickr-day",new Date(t,e,c),c,u));for(var d=a+1;d<=42-i&&(1===b.config.showMonths||u%7!=0);d++,u++)r.appendChild(Y("flatpickr-day "+l,new Date(t,e+1,d%a),d,u));var f=h("div","dayContainer");return f.appendChild(r),f}function V(){if(void 0!==b.daysContainer){u(b.daysContainer),b.weekNumbers&&u(b.weekNumbers);for(var t=document.createDocumentFragment(),e=0;e<b.config.showMonths;e++){var i=new Date(b.currentYear,b.currentMonth,1);i.setMonth(b.currentMonth+e),t.appendChild(W(i.getFullYear(),i.getMonth()))}b.daysContainer.appendChild(t),b.days=b.daysContainer.firstChild,"range"===b.config.mode&&1===b.selectedDates.length&&rt()}}function G(){if(!(b.config.showMonths>1||"dropdown"!==b.config.monthSelectorType)){var t=function(t){return!(void 0!==b.config.minDate&&b.currentYear===b.config.minDate.getFullYear()&&t<b.config.minDate.getMonth()||void 0!==b.config.maxDate&&b.currentYear===b.config.maxDate.getFullYear()&&t>b.config.maxDate.getMonth())};b.monthsDropdownContainer.tabIndex=-1,b.monthsDropdownContainer.innerHTML="";for(var e=0;e<12;e++)if(t(e)){var i=h("option","flatpickr-monthDropdown-month");i.value=new Date(b.currentYear,e).getMonth().toString(),i.textContent=m(e,b.config.shorthandCurrentMonth,b.l10n),i.tabIndex=-1,b.currentMonth===e&&(i.selected=!0),b.monthsDropdownContainer.appendChild(i)}}}function U(){var t,e=h("div","flatpickr-month"),i=window.document.createDocumentFragment();b.config.showMonths>1||"static"===b.config.monthSelectorType?t=h("span","cur-month"):(b.monthsDropdownContainer=h("select","flatpickr-monthDropdown-months"),b.monthsDropdownContainer.setAttribute("aria-label",b.l10n.monthAriaLabel),N(b.monthsDropdownContainer,"change",(function(t){var e=g(t),i=parseInt(e.value,10);b.changeMonth(i-b.currentMonth),bt("onMonthChange")})),G(),t=b.monthsDropdownContainer);var n=f("cur-year",{tabindex:"-1"}),a=n.getElementsByTagName("input")[0];a.setAttribute("aria-label",b.l10n.yearAriaLabel),b.config.minDate&&a.setAttribute("min",b.config.minDate.getFullYear().toString()),b.config.maxDate&&(a.setAttribute("max",b.config.maxDate.getFullYear().toString()),a.disabled=!!b.config.minDate&&b.config.minDate.getFullYear()===b.config.maxDate.getFullYear());var r=h("div","flatpickr-current-month");return r.appendChild(t),r.appendChild(n),i.appendChild(r),e.appendChild(i),{container:e,yearElement:a,monthElement:t}}function q(){u(b.monthNav),b.monthNav.appendChild(b.prevMonthNav),b.config.showMonths&&(b.yearElements=[],b.monthElements=[]);for(var t=b.config.showMonths;t--;){var e=U();b.yearElements.push(e.yearElement),b.monthElements.push(e.monthElement),b.monthNav.appendChild(e.container)}b.monthNav.appendChild(b.nextMonthNav)}function $(){b.weekdayContainer?u(b.weekdayContainer):b.weekdayContainer=h("div","flatpickr-weekdays");for(var t=b.config.showMonths;t--;){var e=h("div","flatpickr-weekdaycontainer");b.weekdayContainer.appendChild(e)}return Z(),b.weekdayContainer}function Z(){if(b.weekdayContainer){var t=b.l10n.firstDayOfWeek,i=e(b.l10n.weekdays.shorthand);t>0&&t<i.length&&(i=e(i.splice(t,i.length),i.splice(0,t)));for(var n=b.config.showMonths;n--;)b.weekdayContainer.children[n].innerHTML="\n      <span class='flatpickr-weekday'>\n        "+i.join("</span><span class='flatpickr-weekday'>")+"\n      </span>\n      "}}function K(t,e){void 0===e&&(e=!0);var i=e?t:t-b.currentMonth;i<0&&!0===b._hidePrevMonthArrow||i>0&&!0===b._hideNextMonthArrow||(b.currentMonth+=i,(b.currentMonth<0||b.currentMonth>11)&&(b.currentYear+=b.currentMonth>11?1:-1,b.currentMonth=(b.currentMonth+12)%12,bt("onYearChange"),G()),V(),bt("onMonthChange"),kt())}function Q(t){return b.calendarContainer.contains(t)}function J(t){if(b.isOpen&&!b.config.inline){var e=g(t),i=Q(e),n=e===b.input||e===b.altInput||b.element.contains(e)||t.path&&t.path.indexOf&&(~t.path.indexOf(b.input)||~t.path.indexOf(b.altInput)),a="blur"===t.type?n&&t.relatedTarget&&!Q(t.relatedTarget):!n&&!i&&!Q(t.relatedTarget),r=!b.config.ignoredFocusElements.some((function(t){return t.contains(e)}));a&&r&&(b.config.allowInput&&b.setDate(b._input.value,!0,b.config.altInput?b.config.altFormat:b.config.dateFormat),void 0!==b.timeContainer&&void 0!==b.minuteElement&&void 0!==b.hourElement&&""!==b.input.value&&void 0!==b.input.value&&M(),b.close(),b.config&&"range"===b.config.mode&&1===b.selectedDates.length&&b.clear(!1))}}function tt(t){if(!(!t||b.config.minDate&&t<b.config.minDate.getFullYear()||b.config.maxDate&&t>b.config.maxDate.getFullYear())){var e=t,i=b.currentYear!==e;b.currentYear=e||b.currentYear,b.config.maxDate&&b.currentYear===b.config.maxDate.getFullYear()?b.currentMonth=Math.min(b.config.maxDate.getMonth(),b.currentMonth):b.config.minDate&&b.currentYear===b.config.minDate.getFullYear()&&(b.currentMonth=Math.max(b.config.minDate.getMonth(),b.currentMonth)),i&&(b.redraw(),bt("onYearChange"),G())}}function et(t,e){var i;void 0===e&&(e=!0);var n=b.parseDate(t,void 0,e);if(b.config.minDate&&n&&k(n,b.config.minDate,void 0!==e?e:!b.minDateHasTime)<0||b.config.maxDate&&n&&k(n,b.config.maxDate,void 0!==e?e:!b.maxDateHasTime)>0)return!1;if(!b.config.enable&&0===b.config.disable.length)return!0;if(void 0===n)return!1;for(var a=!!b.config.enable,r=null!==(i=b.config.enable)&&void 0!==i?i:b.config.disable,s=0,o=void 0;s<r.length;s++){if("function"==typeof(o=r[s])&&o(n))return a;if(o instanceof Date&&void 0!==n&&o.getTime()===n.getTime())return a;if("string"==typeof o){var l=b.parseDate(o,void 0,!0);return l&&l.getTime()===n.getTime()?a:!a}if("object"==typeof o&&void 0!==n&&o.from&&o.to&&n.getTime()>=o.from.getTime()&&n.getTime()<=o.to.getTime())return a}return!a}function it(t){return void 0!==b.daysContainer&&-1===t.className.indexOf("hidden")&&-1===t.className.indexOf("flatpickr-disabled")&&b.daysContainer.contains(t)}function nt(t){t.target!==b._input||!(b.selectedDates.length>0||b._input.value.length>0)||t.relatedTarget&&Q(t.relatedTarget)||b.setDate(b._input.value,!0,t.target===b.altInput?b.config.altFormat:b.config.dateFormat)}function at(t){var e=g(t),i=b.config.wrap?p.contains(e):e===b._input,n=b.config.allowInput,a=b.isOpen&&(!n||!i),r=b.config.inline&&i&&!n;if(13===t.keyCode&&i){if(n)return b.setDate(b._input.value,!0,e===b.altInput?b.config.altFormat:b.config.dateFormat),b.close(),e.blur();b.open()}else if(Q(e)||a||r){var s=!!b.timeContainer&&b.timeContainer.contains(e);switch(t.keyCode){case 13:s?(t.preventDefault(),M(),dt()):ft(t);break;case 27:t.preventDefault(),dt();break;case 8:case 46:i&&!b.config.allowInput&&(t.preventDefault(),b.clear());break;case 37:case 39:if(s||i)b.hourElement&&b.hourElement.focus();else{t.preventDefault();var o=C();if(void 0!==b.daysContainer&&(!1===n||o&&it(o))){var l=39===t.keyCode?1:-1;t.ctrlKey?(t.stopPropagation(),K(l),j(B(1),0)):j(void 0,l)}}break;case 38:case 40:t.preventDefault();var c=40===t.keyCode?1:-1;b.daysContainer&&void 0!==e.$i||e===b.input||e===b.altInput?t.ctrlKey?(t.stopPropagation(),tt(b.currentYear-c),j(B(1),0)):s||j(void 0,7*c):e===b.currentYearElement?tt(b.currentYear-c):b.config.enableTime&&(!s&&b.hourElement&&b.hourElement.focus(),M(t),b._debouncedChange());break;case 9:if(s){var h=[b.hourElement,b.minuteElement,b.secondElement,b.amPM].concat(b.pluginElements).filter((function(t){return t})),u=h.indexOf(e);if(-1!==u){var d=h[u+(t.shiftKey?-1:1)];t.preventDefault(),(d||b._input).focus()}}else!b.config.noCalendar&&b.daysContainer&&b.daysContainer.contains(e)&&t.shiftKey&&(t.preventDefault(),b._input.focus())}}if(void 0!==b.amPM&&e===b.amPM)switch(t.key){case b.l10n.amPM[0].charAt(0):case b.l10n.amPM[0].charAt(0).toLowerCase():b.amPM.textContent=b.l10n.amPM[0],L(),St();break;case b.l10n.amPM[1].charAt(0):case b.l10n.amPM[1].charAt(0).toLowerCase():b.amPM.textContent=b.l10n.amPM[1],L(),St()}(i||Q(e))&&bt("onKeyDown",t)}function rt(t,e){if(void 0===e&&(e="flatpickr-day"),1===b.selectedDates.length&&(!t||t.classList.contains(e)&&!t.classList.contains("flatpickr-disabled"))){for(var i=t?t.dateObj.getTime():b.days.firstElementChild.dateObj.getTime(),n=b.parseDate(b.selectedDates[0],void 0,!0).getTime(),a=Math.min(i,b.selectedDates[0].getTime()),r=Math.max(i,b.selectedDates[0].getTime()),s=!1,o=0,l=0,c=a;c<r;c+=S)et(new Date(c),!0)||(s=s||c>a&&c<r,c<n&&(!o||c>o)?o=c:c>n&&(!l||c<l)&&(l=c));Array.from(b.rContainer.querySelectorAll("*:nth-child(-n+"+b.config.showMonths+") > ."+e)).forEach((function(e){var a,r,c,h=e.dateObj.getTime(),u=o>0&&h<o||l>0&&h>l;if(u)return e.classList.add("notAllowed"),void["inRange","startRange","endRange"].forEach((function(t){e.classList.remove(t)}));s&&!u||(["startRange","inRange","endRange","notAllowed"].forEach((function(t){e.classList.remove(t)})),void 0!==t&&(t.classList.add(i<=b.selectedDates[0].getTime()?"startRange":"endRange"),n<i&&h===n?e.classList.add("startRange"):n>i&&h===n&&e.classList.add("endRange"),h>=o&&(0===l||h<=l)&&(r=n,c=i,(a=h)>Math.min(r,c)&&a<Math.max(r,c))&&e.classList.add("inRange")))}))}}function st(){!b.isOpen||b.config.static||b.config.inline||ht()}function ot(t){return function(e){var i=b.config["_"+t+"Date"]=b.parseDate(e,b.config.dateFormat),n=b.config["_"+("min"===t?"max":"min")+"Date"];void 0!==i&&(b["min"===t?"minDateHasTime":"maxDateHasTime"]=i.getHours()>0||i.getMinutes()>0||i.getSeconds()>0),b.selectedDates&&(b.selectedDates=b.selectedDates.filter((function(t){return et(t)})),b.selectedDates.length||"min"!==t||D(i),St()),b.daysContainer&&(ut(),void 0!==i?b.currentYearElement[t]=i.getFullYear().toString():b.currentYearElement.removeAttribute(t),b.currentYearElement.disabled=!!n&&void 0!==i&&n.getFullYear()===i.getFullYear())}}function lt(){return b.config.wrap?p.querySelector("[data-input]"):p}function ct(){"object"!=typeof b.config.locale&&void 0===T.l10ns[b.config.locale]&&b.config.errorHandler(new Error("flatpickr: invalid locale "+b.config.locale)),b.l10n=t(t({},T.l10ns.default),"object"==typeof b.config.locale?b.config.locale:"default"!==b.config.locale?T.l10ns[b.config.locale]:void 0),x.D="("+b.l10n.weekdays.shorthand.join("|")+")",x.l="("+b.l10n.weekdays.longhand.join("|")+")",x.M="("+b.l10n.months.shorthand.join("|")+")",x.F="("+b.l10n.months.longhand.join("|")+")",x.K="("+b.l10n.amPM[0]+"|"+b.l10n.amPM[1]+"|"+b.l10n.amPM[0].toLowerCase()+"|"+b.l10n.amPM[1].toLowerCase()+")",void 0===t(t({},v),JSON.parse(JSON.stringify(p.dataset||{}))).time_24hr&&void 0===T.defaultConfig.time_24hr&&(b.config.time_24hr=b.l10n.time_24hr),b.formatDate=y(b),b.parseDate=w({config:b.config,l10n:b.l10n})}function ht(t){if("function"!=typeof b.config.position){if(void 0!==b.calendarContainer){bt("onPreCalendarPosition");var e=t||b._positionElement,i=Array.prototype.reduce.call(b.calendarContainer.children,(function(t,e){return t+e.offsetHeight}),0),n=b.calendarContainer.offsetWidth,a=b.config.position.split(" "),r=a[0],s=a.length>1?a[1]:null,o=e.getBoundingClientRect(),l=window.innerHeight-o.bottom,h="above"===r||"below"!==r&&l<i&&o.top>i,u=window.pageYOffset+o.top+(h?-i-2:e.offsetHeight+2);if(c(b.calendarContainer,"arrowTop",!h),c(b.calendarContainer,"arrowBottom",h),!b.config.inline){var d=window.pageXOffset+o.left,f=!1,g=!1;"center"===s?(d-=(n-o.width)/2,f=!0):"right"===s&&(d-=n-o.width,g=!0),c(b.calendarContainer,"arrowLeft",!f&&!g),c(b.calendarContainer,"arrowCenter",f),c(b.calendarContainer,"arrowRight",g);var p=window.document.body.offsetWidth-(window.pageXOffset+o.right),m=d+n>window.document.body.offsetWidth,v=p+n>window.document.body.offsetWidth;if(c(b.calendarContainer,"rightMost",m),!b.config.static)if(b.calendarContainer.style.top=u+"px",m)if(v){var x=function(){for(var t=null,e=0;e<document.styleSheets.length;e++){var i=document.styleSheets[e];if(i.cssRules){try{i.cssRules}catch(t){continue}t=i;break}}return null!=t?t:(n=document.createElement("style"),document.head.appendChild(n),n.sheet);var n}();if(void 0===x)return;var y=window.document.body.offsetWidth,w=Math.max(0,y/2-n/2),k=x.cssRules.length,A="{left:"+o.left+"px;right:auto;}";c(b.calendarContainer,"rightMost",!1),c(b.calendarContainer,"centerMost",!0),x.insertRule(".flatpickr-calendar.centerMost:before,.flatpickr-calendar.centerMost:after"+A,k),b.calendarContainer.style.left=w+"px",b.calendarContainer.style.right="auto"}else b.calendarContainer.style.left="auto",b.calendarContainer.style.right=p+"px";else b.calendarContainer.style.left=d+"px",b.calendarContainer.style.right="auto"}}}else b.config.position(b,t)}function ut(){b.config.noCalendar||b.isMobile||(G(),kt(),V())}function dt(){b._input.focus(),-1!==window.navigator.userAgent.indexOf("MSIE")||void 0!==navigator.msMaxTouchPoints?setTimeout(b.close,0):b.close()}function ft(t){t.preventDefault(),t.stopPropagation();var e=d(g(t),(function(t){return t.classList&&t.classList.contains("flatpickr-day")&&!t.classList.contains("flatpickr-disabled")&&!t.classList.contains("notAllowed")}));if(void 0!==e){var i=e,n=b.latestSelectedDateObj=new Date(i.dateObj.getTime()),a=(n.getMonth()<b.currentMonth||n.getMonth()>b.currentMonth+b.config.showMonths-1)&&"range"!==b.config.mode;if(b.selectedDateElem=i,"single"===b.config.mode)b.selectedDates=[n];else if("multiple"===b.config.mode){var r=wt(n);r?b.selectedDates.splice(parseInt(r),1):b.selectedDates.push(n)}else"range"===b.config.mode&&(2===b.selectedDates.length&&b.clear(!1,!1),b.latestSelectedDateObj=n,b.selectedDates.push(n),0!==k(n,b.selectedDates[0],!0)&&b.selectedDates.sort((function(t,e){return t.getTime()-e.getTime()})));if(L(),a){var s=b.currentYear!==n.getFullYear();b.currentYear=n.getFullYear(),b.currentMonth=n.getMonth(),s&&(bt("onYearChange"),G()),bt("onMonthChange")}if(kt(),V(),St(),a||"range"===b.config.mode||1!==b.config.showMonths?void 0!==b.selectedDateElem&&void 0===b.hourElement&&b.selectedDateElem&&b.selectedDateElem.focus():X(i),void 0!==b.hourElement&&void 0!==b.hourElement&&b.hourElement.focus(),b.config.closeOnSelect){var o="single"===b.config.mode&&!b.config.enableTime,l="range"===b.config.mode&&2===b.selectedDates.length&&!b.config.enableTime;(o||l)&&dt()}F()}}b.parseDate=w({config:b.config,l10n:b.l10n}),b._handlers=[],b.pluginElements=[],b.loadedPlugins=[],b._bind=N,b._setHoursFromDate=D,b._positionCalendar=ht,b.changeMonth=K,b.changeYear=tt,b.clear=function(t,e){if(void 0===t&&(t=!0),void 0===e&&(e=!0),b.input.value="",void 0!==b.altInput&&(b.altInput.value=""),void 0!==b.mobileInput&&(b.mobileInput.value=""),b.selectedDates=[],b.latestSelectedDateObj=void 0,!0===e&&(b.currentYear=b._initialDate.getFullYear(),b.currentMonth=b._initialDate.getMonth()),!0===b.config.enableTime){var i=_(b.config);I(i.hours,i.minutes,i.seconds)}b.redraw(),t&&bt("onChange")},b.close=function(){b.isOpen=!1,b.isMobile||(void 0!==b.calendarContainer&&b.calendarContainer.classList.remove("open"),void 0!==b._input&&b._input.classList.remove("active")),bt("onClose")},b.onMouseOver=rt,b._createElement=h,b.createDay=Y,b.destroy=function(){void 0!==b.config&&bt("onDestroy");for(var t=b._handlers.length;t--;)b._handlers[t].remove();if(b._handlers=[],b.mobileInput)b.mobileInput.parentNode&&b.mobileInput.parentNode.removeChild(b.mobileInput),b.mobileInput=void 0;else if(b.calendarContainer&&b.calendarContainer.parentNode)if(b.config.static&&b.calendarContainer.parentNode){var e=b.calendarContainer.parentNode;if(e.lastChild&&e.removeChild(e.lastChild),e.parentNode){for(;e.firstChild;)e.parentNode.insertBefore(e.firstChild,e);e.parentNode.removeChild(e)}}else b.calendarContainer.parentNode.removeChild(b.calendarContainer);b.altInput&&(b.input.type="text",b.altInput.parentNode&&b.altInput.parentNode.removeChild(b.altInput),delete b.altInput),b.input&&(b.input.type=b.input._type,b.input.classList.remove("flatpickr-input"),b.input.removeAttribute("readonly")),["_showTimeInput","latestSelectedDateObj","_hideNextMonthArrow","_hidePrevMonthArrow","__hideNextMonthArrow","__hidePrevMonthArrow","isMobile","isOpen","selectedDateElem","minDateHasTime","maxDateHasTime","days","daysContainer","_input","_positionElement","innerContainer","rContainer","monthNav","todayDateElem","calendarContainer","weekdayContainer","prevMonthNav","nextMonthNav","monthsDropdownContainer","currentMonthElement","currentYearElement","navigationCurrentMonth","selectedDateElem","config"].forEach((function(t){try{delete b[t]}catch(t){}}))},b.isEnabled=et,b.jumpToDate=R,b.updateValue=St,b.open=function(t,e){if(void 0===e&&(e=b._positionElement),!0===b.isMobile){if(t){t.preventDefault();var i=g(t);i&&i.blur()}return void 0!==b.mobileInput&&(b.mobileInput.focus(),b.mobileInput.click()),void bt("onOpen")}if(!b._input.disabled&&!b.config.inline){var n=b.isOpen;b.isOpen=!0,n||(b.calendarContainer.classList.add("open"),b._input.classList.add("active"),bt("onOpen"),ht(e)),!0===b.config.enableTime&&!0===b.config.noCalendar&&(!1!==b.config.allowInput||void 0!==t&&b.timeContainer.contains(t.relatedTarget)||setTimeout((function(){return b.hourElement.select()}),50))}},b.redraw=ut,b.set=function(t,e){if(null!==t&&"object"==typeof t)for(var n in Object.assign(b.config,t),t)void 0!==gt[n]&&gt[n].forEach((function(t){return t()}));else b.config[t]=e,void 0!==gt[t]?gt[t].forEach((function(t){return t()})):i.indexOf(t)>-1&&(b.config[t]=l(e));b.redraw(),St(!0)},b.setDate=mt,b.toggle=function(t){if(!0===b.isOpen)return b.close();b.open(t)};var gt={locale:[ct,Z],showMonths:[q,P,$],minDate:[R],maxDate:[R],positionElement:[xt],clickOpens:[function(){!0===b.config.clickOpens?(N(b._input,"focus",b.open),N(b._input,"click",b.open)):(b._input.removeEventListener("focus",b.open),b._input.removeEventListener("click",b.open))}]};function pt(t,e){var i=[];if(t instanceof Array)i=t.map((function(t){return b.parseDate(t,e)}));else if(t instanceof Date||"number"==typeof t)i=[b.parseDate(t,e)];else if("string"==typeof t)switch(b.config.mode){case"single":case"time":i=[b.parseDate(t,e)];break;case"multiple":i=t.split(b.config.conjunction).map((function(t){return b.parseDate(t,e)}));break;case"range":i=t.split(b.l10n.rangeSeparator).map((function(t){return b.parseDate(t,e)}))}else b.config.errorHandler(new Error("Invalid date supplied: "+JSON.stringify(t)));b.selectedDates=b.config.allowInvalidPreload?i:i.filter((function(t){return t instanceof Date&&et(t,!1)})),"range"===b.config.mode&&b.selectedDates.sort((function(t,e){return t.getTime()-e.getTime()}))}function mt(t,e,i){if(void 0===e&&(e=!1),void 0===i&&(i=b.config.dateFormat),0!==t&&!t||t instanceof Array&&0===t.length)return b.clear(e);pt(t,i),b.latestSelectedDateObj=b.selectedDates[b.selectedDates.length-1],b.redraw(),R(void 0,e),D(),0===b.selectedDates.length&&b.clear(!1),St(e),e&&bt("onChange")}function vt(t){return t.slice().map((function(t){return"string"==typeof t||"number"==typeof t||t instanceof Date?b.parseDate(t,void 0,!0):t&&"object"==typeof t&&t.from&&t.to?{from:b.parseDate(t.from,void 0),to:b.parseDate(t.to,void 0)}:t})).filter((function(t){return t}))}function xt(){b._positionElement=b.config.positionElement||b._input}function bt(t,e){if(void 0!==b.config){var i=b.config[t];if(void 0!==i&&i.length>0)for(var n=0;i[n]&&n<i.length;n++)i[n](b.selectedDates,b.input.value,b,e);"onChange"===t&&(b.input.dispatchEvent(yt("change")),b.input.dispatchEvent(yt("input")))}}function yt(t){var e=document.createEvent("Event");return e.initEvent(t,!0,!0),e}function wt(t){for(var e=0;e<b.selectedDates.length;e++)if(0===k(b.selectedDates[e],t))return""+e;return!1}function kt(){b.config.noCalendar||b.isMobile||!b.monthNav||(b.yearElements.forEach((function(t,e){var i=new Date(b.currentYear,b.currentMonth,1);i.setMonth(b.currentMonth+e),b.config.showMonths>1||"static"===b.config.monthSelectorType?b.monthElements[e].textContent=m(i.getMonth(),b.config.shorthandCurrentMonth,b.l10n)+" ":b.monthsDropdownContainer.value=i.getMonth().toString(),t.value=i.getFullYear().toString()})),b._hidePrevMonthArrow=void 0!==b.config.minDate&&(b.currentYear===b.config.minDate.getFullYear()?b.currentMonth<=b.config.minDate.getMonth():b.currentYear<b.config.minDate.getFullYear()),b._hideNextMonthArrow=void 0!==b.config.maxDate&&(b.currentYear===b.config.maxDate.getFullYear()?b.currentMonth+1>b.config.maxDate.getMonth():b.currentYear>b.config.maxDate.getFullYear()))}function At(t){return b.selectedDates.map((function(e){return b.formatDate(e,t)})).filter((function(t,e,i){return"range"!==b.config.mode||b.config.enableTime||i.indexOf(t)===e})).join("range"!==b.config.mode?b.config.conjunction:b.l10n.rangeSeparator)}function St(t){void 0===t&&(t=!0),void 0!==b.mobileInput&&b.mobileFormatStr&&(b.mobileInput.value=void 0!==b.latestSelectedDateObj?b.formatDate(b.latestSelectedDateObj,b.mobileFormatStr):""),b.input.value=At(b.config.dateFormat),void 0!==b.altInput&&(b.altInput.value=At(b.config.altFormat)),!1!==t&&bt("onValueUpdate")}function _t(t){var e=g(t),i=b.prevMonthNav.contains(e),n=b.nextMonthNav.contains(e);i||n?K(i?-1:1):b.yearElements.indexOf(e)>=0?e.select():e.classList.contains("arrowUp")?b.changeYear(b.currentYear+1):e.classList.contains("arrowDown")&&b.changeYear(b.currentYear-1)}return function(){b.element=b.input=p,b.isOpen=!1,function(){var e=["wrap","weekNumbers","allowInput","allowInvalidPreload","clickOpens","time_24hr","enableTime","noCalendar","altInput","shorthandCurrentMonth","inline","static","enableSeconds","disableMobile"],a=t(t({},JSON.parse(JSON.stringify(p.dataset||{}))),v),r={};b.config.parseDate=a.parseDate,b.config.formatDate=a.formatDate,Object.defineProperty(b.config,"enable",{get:function(){return b.config._enable},set:function(t){b.config._enable=vt(t)}}),Object.defineProperty(b.config,"disable",{get:function(){return b.config._disable},set:function(t){b.config._disable=vt(t)}});var s="time"===a.mode;if(!a.dateFormat&&(a.enableTime||s)){var o=T.defaultConfig.dateFormat||n.dateFormat;r.dateFormat=a.noCalendar||s?"H:i"+(a.enableSeconds?":S":""):o+" H:i"+(a.enableSeconds?":S":"")}if(a.altInput&&(a.enableTime||s)&&!a.altFormat){var c=T.defaultConfig.altFormat||n.altFormat;r.altFormat=a.noCalendar||s?"h:i"+(a.enableSeconds?":S K":" K"):c+" h:i"+(a.enableSeconds?":S":"")+" K"}Object.defineProperty(b.config,"minDate",{get:function(){return b.config._minDate},set:ot("min")}),Object.defineProperty(b.config,"maxDate",{get:function(){return b.config._maxDate},set:ot("max")});var h=function(t){return function(e){b.config["min"===t?"_minTime":"_maxTime"]=b.parseDate(e,"H:i:S")}};Object.defineProperty(b.config,"minTime",{get:function(){return b.config._minTime},set:h("min")}),Object.defineProperty(b.config,"maxTime",{get:function(){return b.config._maxTime},set:h("max")}),"time"===a.mode&&(b.config.noCalendar=!0,b.config.enableTime=!0),Object.assign(b.config,r,a);for(var u=0;u<e.length;u++)b.config[e[u]]=!0===b.config[e[u]]||"true"===b.config[e[u]];for(i.filter((function(t){return void 0!==b.config[t]})).forEach((function(t){b.config[t]=l(b.config[t]||[]).map(E)})),b.isMobile=!b.config.disableMobile&&!b.config.inline&&"single"===b.config.mode&&!b.config.disable.length&&!b.config.enable&&!b.config.weekNumbers&&/Android|webOS|iPhone|iPad|iPod|BlackBerry|IEMobile|Opera Mini/i.test(navigator.userAgent),u=0;u<b.config.plugins.length;u++){var d=b.config.plugins[u](b)||{};for(var f in d)i.indexOf(f)>-1?b.config[f]=l(d[f]).map(E).concat(b.config[f]):void 0===a[f]&&(b.config[f]=d[f])}a.altInputClass||(b.config.altInputClass=lt().className+" "+b.config.altInputClass),bt("onParseConfig")}(),ct(),b.input=lt(),b.input?(b.input._type=b.input.type,b.input.type="text",b.input.classList.add("flatpickr-input"),b._input=b.input,b.config.altInput&&(b.altInput=h(b.input.nodeName,b.config.altInputClass),b._input=b.altInput,b.altInput.placeholder=b.input.placeholder,b.altInput.disabled=b.input.disabled,b.altInput.required=b.input.required,b.altInput.tabIndex=b.input.tabIndex,b.altInput.type="text",b.input.setAttribute("type","hidden"),!b.config.static&&b.input.parentNode&&b.input.parentNode.insertBefore(b.altInput,b.input.nextSibling)),b.config.allowInput||b._input.setAttribute("readonly","readonly"),xt()):b.config.errorHandler(new Error("Invalid input element specified")),function(){b.selectedDates=[],b.now=b.parseDate(b.config.now)||new Date;var t=b.config.defaultDate||("INPUT"!==b.input.nodeName&&"TEXTAREA"!==b.input.nodeName||!b.input.placeholder||b.input.value!==b.input.placeholder?b.input.value:null);t&&pt(t,b.config.dateFormat),b._initialDate=b.selectedDates.length>0?b.selectedDates[0]:b.config.minDate&&b.config.minDate.getTime()>b.now.getTime()?b.config.minDate:b.config.maxDate&&b.config.maxDate.getTime()<b.now.getTime()?b.config.maxDate:b.now,b.currentYear=b._initialDate.getFullYear(),b.currentMonth=b._initialDate.getMonth(),b.selectedDates.length>0&&(b.latestSelectedDateObj=b.selectedDates[0]),void 0!==b.config.minTime&&(b.config.minTime=b.parseDate(b.config.minTime,"H:i")),void 0!==b.config.maxTime&&(b.config.maxTime=b.parseDate(b.config.maxTime,"H:i")),b.minDateHasTime=!!b.config.minDate&&(b.config.minDate.getHours()>0||b.config.minDate.getMinutes()>0||b.config.minDate.getSeconds()>0),b.maxDateHasTime=!!b.config.maxDate&&(b.config.maxDate.getHours()>0||b.config.maxDate.getMinutes()>0||b.config.maxDate.getSeconds()>0)}(),b.utils={getDaysInMonth:function(t,e){return void 0===t&&(t=b.currentMonth),void 0===e&&(e=b.currentYear),1===t&&(e%4==0&&e%100!=0||e%400==0)?29:b.l10n.daysInMonth[t]}},b.isMobile||function(){var t=window.document.createDocumentFragment();if(b.calendarContainer=h("div","flatpickr-calendar"),b.calendarContainer.tabIndex=-1,!b.config.noCalendar){if(t.appendChild((b.monthNav=h("div","flatpickr-months"),b.yearElements=[],b.monthElements=[],b.prevMonthNav=h("span","flatpickr-prev-month"),b.prevMonthNav.innerHTML=b.config.prevArrow,b.nextMonthNav=h("span","flatpickr-next-month"),b.nextMonthNav.innerHTML=b.config.nextArrow,q(),Object.defineProperty(b,"_hidePrevMonthArrow",{get:function(){return b.__hidePrevMonthArrow},set:function(t){b.__hidePrevMonthArrow!==t&&(c(b.prevMonthNav,"flatpickr-disabled",t),b.__hidePrevMonthArrow=t)}}),Object.defineProperty(b,"_hideNextMonthArrow",{get:function(){return b.__hideNextMonthArrow},set:function(t){b.__hideNextMonthArrow!==t&&(c(b.nextMonthNav,"flatpickr-disabled",t),b.__hideNextMonthArrow=t)}}),b.currentYearElement=b.yearElements[0],kt(),b.monthNav)),b.innerContainer=h("div","flatpickr-innerContainer"),b.config.weekNumbers){var e=function(){b.calendarContainer.classList.add("hasWeeks");var t=h("div","flatpickr-weekwrapper");t.appendChild(h("span","flatpickr-weekday",b.l10n.weekAbbreviation));var e=h("div","flatpickr-weeks");return t.appendChild(e),{weekWrapper:t,weekNumbers:e}}(),i=e.weekWrapper,n=e.weekNumbers;b.innerContainer.appendChild(i),b.weekNumbers=n,b.weekWrapper=i}b.rContainer=h("div","flatpickr-rContainer"),b.rContainer.appendChild($()),b.daysContainer||(b.daysContainer=h("div","flatpickr-days"),b.daysContainer.tabIndex=-1),V(),b.rContainer.appendChild(b.daysContainer),b.innerContainer.appendChild(b.rContainer),t.appendChild(b.innerContainer)}b.config.enableTime&&t.appendChild(function(){b.calendarContainer.classList.add("hasTime"),b.config.noCalendar&&b.calendarContainer.classList.add("noCalendar");var t=_(b.config);b.timeContainer=h("div","flatpickr-time"),b.timeContainer.tabIndex=-1;var e=h("span","flatpickr-time-separator",":"),i=f("flatpickr-hour",{"aria-label":b.l10n.hourAriaLabel});b.hourElement=i.getElementsByTagName("input")[0];var n=f("flatpickr-minute",{"aria-label":b.l10n.minuteAriaLabel});if(b.minuteElement=n.getElementsByTagName("input")[0],b.hourElement.tabIndex=b.minuteElement.tabIndex=-1,b.hourElement.value=r(b.latestSelectedDateObj?b.latestSelectedDateObj.getHours():b.config.time_24hr?t.hours:function(t){switch(t%24){case 0:case 12:return 12;default:return t%12}}(t.hours)),b.minuteElement.value=r(b.latestSelectedDateObj?b.latestSelectedDateObj.getMinutes():t.minutes),b.hourElement.setAttribute("step",b.config.hourIncrement.toString()),b.minuteElement.setAttribute("step",b.config.minuteIncrement.toString()),b.hourElement.setAttribute("min",b.config.time_24hr?"0":"1"),b.hourElement.setAttribute("max",b.config.time_24hr?"23":"12"),b.hourElement.setAttribute("maxlength","2"),b.minuteElement.setAttribute("min","0"),b.minuteElement.setAttribute("max","59"),b.minuteElement.setAttribute("maxlength","2"),b.timeContainer.appendChild(i),b.timeContainer.appendChild(e),b.timeContainer.appendChild(n),b.config.time_24hr&&b.timeContainer.classList.add("time24hr"),b.config.enableSeconds){b.timeContainer.classList.add("hasSeconds");var a=f("flatpickr-second");b.secondElement=a.getElementsByTagName("input")[0],b.secondElement.value=r(b.latestSelectedDateObj?b.latestSelectedDateObj.getSeconds():t.seconds),b.secondElement.setAttribute("step",b.minuteElement.getAttribute("step")),b.secondElement.setAttribute("min","0"),b.secondElement.setAttribute("max","59"),b.secondElement.setAttribute("maxlength","2"),b.timeContainer.appendChild(h("span","flatpickr-time-separator",":")),b.timeContainer.appendChild(a)}return b.config.time_24hr||(b.amPM=h("span","flatpickr-am-pm",b.l10n.amPM[s((b.latestSelectedDateObj?b.hourElement.value:b.config.defaultHour)>11)]),b.amPM.title=b.l10n.toggleTitle,b.amPM.tabIndex=-1,b.timeContainer.appendChild(b.amPM)),b.timeContainer}()),c(b.calendarContainer,"rangeMode","range"===b.config.mode),c(b.calendarContainer,"animate",!0===b.config.animate),c(b.calendarContainer,"multiMonth",b.config.showMonths>1),b.calendarContainer.appendChild(t);var a=void 0!==b.config.appendTo&&void 0!==b.config.appendTo.nodeType;if((b.config.inline||b.config.static)&&(b.calendarContainer.classList.add(b.config.inline?"inline":"static"),b.config.inline&&(!a&&b.element.parentNode?b.element.parentNode.insertBefore(b.calendarContainer,b._input.nextSibling):void 0!==b.config.appendTo&&b.config.appendTo.appendChild(b.calendarContainer)),b.config.static)){var o=h("div","flatpickr-wrapper");b.element.parentNode&&b.element.parentNode.insertBefore(o,b.element),o.appendChild(b.element),b.altInput&&o.appendChild(b.altInput),o.appendChild(b.calendarContainer)}b.config.static||b.config.inline||(void 0!==b.config.appendTo?b.config.appendTo:window.document.body).appendChild(b.calendarContainer)}(),function(){if(b.config.wrap&&["open","close","toggle","clear"].forEach((function(t){Array.prototype.forEach.call(b.element.querySelectorAll("[data-"+t+"]"),(function(e){return N(e,"click",b[t])}))})),b.isMobile)!function(){var t=b.config.enableTime?b.config.noCalendar?"time":"datetime-local":"date";b.mobileInput=h("input",b.input.className+" flatpickr-mobile"),b.mobileInput.tabIndex=1,b.mobileInput.type=t,b.mobileInput.disabled=b.input.disabled,b.mobileInput.required=b.input.required,b.mobileInput.placeholder=b.input.placeholder,b.mobileFormatStr="datetime-local"===t?"Y-m-d\\TH:i:S":"date"===t?"Y-m-d":"H:i:S",b.selectedDates.length>0&&(b.mobileInput.defaultValue=b.mobileInput.value=b.formatDate(b.selectedDates[0],b.mobileFormatStr)),b.config.minDate&&(b.mobileInput.min=b.formatDate(b.config.minDate,"Y-m-d")),b.config.maxDate&&(b.mobileInput.max=b.formatDate(b.config.maxDate,"Y-m-d")),b.input.getAttribute("step")&&(b.mobileInput.step=String(b.input.getAttribute("step"))),b.input.type="hidden",void 0!==b.altInput&&(b.altInput.type="hidden");try{b.input.parentNode&&b.input.parentNode.insertBefore(b.mobileInput,b.input.nextSibling)}catch(t){}N(b.mobileInput,"change",(function(t){b.setDate(g(t).value,!1,b.mobileFormatStr),bt("onChange"),bt("onClose")}))}();else{var t=o(st,50);if(b._debouncedChange=o(F,300),b.daysContainer&&!/iPhone|iPad|iPod/i.test(navigator.userAgent)&&N(b.daysContainer,"mouseover",(function(t){"range"===b.config.mode&&rt(g(t))})),N(b._input,"keydown",at),void 0!==b.calendarContainer&&N(b.calendarContainer,"keydown",at),b.config.inline||b.config.static||N(window,"resize",t),void 0!==window.ontouchstart?N(window.document,"touchstart",J):N(window.document,"mousedown",J),N(window.document,"focus",J,{capture:!0}),!0===b.config.clickOpens&&(N(b._input,"focus",b.open),N(b._input,"click",b.open)),void 0!==b.daysContainer&&(N(b.monthNav,"click",_t),N(b.monthNav,["keyup","increment"],O),N(b.daysContainer,"click",ft)),void 0!==b.timeContainer&&void 0!==b.minuteElement&&void 0!==b.hourElement){var e=function(t){return g(t).select()};N(b.timeContainer,["increment"],M),N(b.timeContainer,"blur",M,{capture:!0}),N(b.timeContainer,"click",z),N([b.hourElement,b.minuteElement],["focus","click"],e),void 0!==b.secondElement&&N(b.secondElement,"focus",(function(){return b.secondElement&&b.secondElement.select()})),void 0!==b.amPM&&N(b.amPM,"click",(function(t){M(t)}))}b.config.allowInput&&N(b._input,"blur",nt)}}(),(b.selectedDates.length||b.config.noCalendar)&&(b.config.enableTime&&D(b.config.noCalendar?b.latestSelectedDateObj:void 0),St(!1)),P();var e=/^((?!chrome|android).)*safari/i.test(navigator.userAgent);!b.isMobile&&e&&ht(),bt("onReady")}(),b}function E(t,e){for(var i=Array.prototype.slice.call(t).filter((function(t){return t instanceof HTMLElement})),n=[],a=0;a<i.length;a++){var r=i[a];try{if(null!==r.getAttribute("data-fp-omit"))continue;void 0!==r._flatpickr&&(r._flatpickr.destroy(),r._flatpickr=void 0),r._flatpickr=C(r,e||{}),n.push(r._flatpickr)}catch(t){console.error(t)}}return 1===n.length?n[0]:n}"undefined"!=typeof HTMLElement&&"undefined"!=typeof HTMLCollection&&"undefined"!=typeof NodeList&&(HTMLCollection.prototype.flatpickr=NodeList.prototype.flatpickr=function(t){return E(this,t)},HTMLElement.prototype.flatpickr=function(t){return E([this],t)});var T=function(t,e){return"string"==typeof t?E(window.document.querySelectorAll(t),e):t instanceof Node?E([t],e):E(t,e)};return T.defaultConfig={},T.l10ns={en:t({},a),default:t({},a)},T.localize=function(e){T.l10ns.default=t(t({},T.l10ns.default),e)},T.setDefaults=function(e){T.defaultConfig=t(t({},T.defaultConfig),e)},T.parseDate=w({}),T.formatDate=y({}),T.compareDates=k,"undefined"!=typeof jQuery&&void 0!==jQuery.fn&&(jQuery.fn.flatpickr=function(t){return E(this,t)}),Date.prototype.fp_incr=function(t){return new Date(this.getFullYear(),this.getMonth(),this.getDate()+("string"==typeof t?parseInt(t,10):t))},"undefined"!=typeof window&&(window.flatpickr=T),T}()},924:function(t,e){!function(t){"use strict";var e="undefined"!=typeof window&&void 0!==window.flatpickr?window.flatpickr:{l10ns:{}},i={weekdays:{shorthand:["Dom","Seg","Ter","Qua","Qui","Sex","Sáb"],longhand:["Domingo","Segunda-feira","Terça-feira","Quarta-feira","Quinta-feira","Sexta-feira","Sábado"]},months:{shorthand:["Jan","Fev","Mar","Abr","Mai","Jun","Jul","Ago","Set","Out","Nov","Dez"],longhand:["Janeiro","Fevereiro","Março","Abril","Maio","Junho","Julho","Agosto","Setembro","Outubro","Novembro","Dezembro"]},rangeSeparator:" até ",time_24hr:!0};e.l10ns.pt=i;var n=e.l10ns;t.Portuguese=i,t.default=n,Object.defineProperty(t,"__esModule",{value:!0})}(e)},382:t=>{self,t.exports=function(){"use strict";var t={8741:function(t,e){Object.defineProperty(e,"__esModule",{value:!0}),e.default=void 0;var i=!("undefined"==typeof window||!window.document||!window.document.createElement);e.default=i},3976:function(t,e,i){Object.defineProperty(e,"__esModule",{value:!0}),e.default=void 0;var n,a=(n=i(5581))&&n.__esModule?n:{default:n},r={_maxTestPos:500,placeholder:"_",optionalmarker:["[","]"],quantifiermarker:["{","}"],groupmarker:["(",")"],alternatormarker:"|",escapeChar:"\\",mask:null,regex:null,oncomplete:function(){},onincomplete:function(){},oncleared:function(){},repeat:0,greedy:!1,autoUnmask:!1,removeMaskOnSubmit:!1,clearMaskOnLostFocus:!0,insertMode:!0,insertModeVisual:!0,clearIncomplete:!1,alias:null,onKeyDown:function(){},onBeforeMask:null,onBeforePaste:function(t,e){return"function"==typeof e.onBeforeMask?e.onBeforeMask.call(this,t,e):t},onBeforeWrite:null,onUnMask:null,showMaskOnFocus:!0,showMaskOnHover:!0,onKeyValidation:function(){},skipOptionalPartCharacter:" ",numericInput:!1,rightAlign:!1,undoOnEscape:!0,radixPoint:"",_radixDance:!1,groupSeparator:"",keepStatic:null,positionCaretOnTab:!0,tabThrough:!1,supportsInputType:["text","tel","url","password","search"],ignorables:[a.default.BACKSPACE,a.default.TAB,a.default["PAUSE/BREAK"],a.default.ESCAPE,a.default.PAGE_UP,a.default.PAGE_DOWN,a.default.END,a.default.HOME,a.default.LEFT,a.default.UP,a.default.RIGHT,a.default.DOWN,a.default.INSERT,a.default.DELETE,93,112,113,114,115,116,117,118,119,120,121,122,123,0,229],isComplete:null,preValidation:null,postValidation:null,staticDefinitionSymbol:void 0,jitMasking:!1,nullable:!0,inputEventOnly:!1,noValuePatching:!1,positionCaretOnClick:"lvp",casing:null,inputmode:"text",importDataAttributes:!0,shiftPositions:!0,usePrototypeDefinitions:!0,validationEventTimeOut:3e3,substitutes:{}};e.default=r},7392:function(t,e){Object.defineProperty(e,"__esModule",{value:!0}),e.default=void 0,e.default={9:{validator:"[0-9０-９]",definitionSymbol:"*"},a:{validator:"[A-Za-zА-яЁёÀ-ÿµ]",definitionSymbol:"*"},"*":{validator:"[0-9０-９A-Za-zА-яЁёÀ-ÿµ]"}}},253:function(t,e){Object.defineProperty(e,"__esModule",{value:!0}),e.default=function(t,e,i){if(void 0===i)return t.__data?t.__data[e]:null;t.__data=t.__data||{},t.__data[e]=i}},3776:function(t,e,i){Object.defineProperty(e,"__esModule",{value:!0}),e.Event=void 0,e.off=function(t,e){var i,n;function a(t,e,a){if(t in i==1)if(n.removeEventListener?n.removeEventListener(t,a,!1):n.detachEvent&&n.detachEvent("on"+t,a),"global"===e)for(var r in i[t])i[t][r].splice(i[t][r].indexOf(a),1);else i[t][e].splice(i[t][e].indexOf(a),1)}function r(t,n){var a,r,s=[];if(t.length>0)if(void 0===e)for(a=0,r=i[t][n].length;a<r;a++)s.push({ev:t,namespace:n&&n.length>0?n:"global",handler:i[t][n][a]});else s.push({ev:t,namespace:n&&n.length>0?n:"global",handler:e});else if(n.length>0)for(var o in i)for(var l in i[o])if(l===n)if(void 0===e)for(a=0,r=i[o][l].length;a<r;a++)s.push({ev:o,namespace:l,handler:i[o][l][a]});else s.push({ev:o,namespace:l,handler:e});return s}if(c(this[0])&&t){i=this[0].eventRegistry,n=this[0];for(var s=t.split(" "),o=0;o<s.length;o++)for(var l=s[o].split("."),h=r(l[0],l[1]),u=0,d=h.length;u<d;u++)a(h[u].ev,h[u].namespace,h[u].handler)}return this},e.on=function(t,e){function i(t,i){a.addEventListener?a.addEventListener(t,e,!1):a.attachEvent&&a.attachEvent("on"+t,e),n[t]=n[t]||{},n[t][i]=n[t][i]||[],n[t][i].push(e)}if(c(this[0]))for(var n=this[0].eventRegistry,a=this[0],r=t.split(" "),s=0;s<r.length;s++){var o=r[s].split(".");i(o[0],o[1]||"global")}return this},e.trigger=function(t){if(c(this[0]))for(var e=this[0].eventRegistry,i=this[0],n="string"==typeof t?t.split(" "):[t.type],r=0;r<n.length;r++){var o=n[r].split("."),l=o[0],h=o[1]||"global";if(void 0!==document&&"global"===h){var u,d,f={bubbles:!0,cancelable:!0,detail:arguments[1]};if(document.createEvent){try{"input"===l?(f.inputType="insertText",u=new InputEvent(l,f)):u=new CustomEvent(l,f)}catch(t){(u=document.createEvent("CustomEvent")).initCustomEvent(l,f.bubbles,f.cancelable,f.detail)}t.type&&(0,a.default)(u,t),i.dispatchEvent(u)}else(u=document.createEventObject()).eventType=l,u.detail=arguments[1],t.type&&(0,a.default)(u,t),i.fireEvent("on"+u.eventType,u)}else if(void 0!==e[l])if(arguments[0]=arguments[0].type?arguments[0]:s.default.Event(arguments[0]),arguments[0].detail=arguments.slice(1),"global"===h)for(var g in e[l])for(d=0;d<e[l][g].length;d++)e[l][g][d].apply(i,arguments);else for(d=0;d<e[l][h].length;d++)e[l][h][d].apply(i,arguments)}return this};var n,a=l(i(600)),r=l(i(9380)),s=l(i(4963)),o=l(i(8741));function l(t){return t&&t.__esModule?t:{default:t}}function c(t){return t instanceof Element}e.Event=n,"function"==typeof r.default.CustomEvent?e.Event=n=r.default.CustomEvent:o.default&&(e.Event=n=function(t,e){e=e||{bubbles:!1,cancelable:!1,detail:void 0};var i=document.createEvent("CustomEvent");return i.initCustomEvent(t,e.bubbles,e.cancelable,e.detail),i},n.prototype=r.default.Event.prototype)},600:function(t,e){function i(t){return i="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},i(t)}Object.defineProperty(e,"__esModule",{value:!0}),e.default=function t(){var e,n,a,r,s,o,l=arguments[0]||{},c=1,h=arguments.length,u=!1;for("boolean"==typeof l&&(u=l,l=arguments[c]||{},c++),"object"!==i(l)&&"function"!=typeof l&&(l={});c<h;c++)if(null!=(e=arguments[c]))for(n in e)a=l[n],l!==(r=e[n])&&(u&&r&&("[object Object]"===Object.prototype.toString.call(r)||(s=Array.isArray(r)))?(s?(s=!1,o=a&&Array.isArray(a)?a:[]):o=a&&"[object Object]"===Object.prototype.toString.call(a)?a:{},l[n]=t(u,o,r)):void 0!==r&&(l[n]=r));return l}},4963:function(t,e,i){Object.defineProperty(e,"__esModule",{value:!0}),e.default=void 0;var n=o(i(600)),a=o(i(9380)),r=o(i(253)),s=i(3776);function o(t){return t&&t.__esModule?t:{default:t}}var l=a.default.document;function c(t){return t instanceof c?t:this instanceof c?void(null!=t&&t!==a.default&&(this[0]=t.nodeName?t:void 0!==t[0]&&t[0].nodeName?t[0]:l.querySelector(t),void 0!==this[0]&&null!==this[0]&&(this[0].eventRegistry=this[0].eventRegistry||{}))):new c(t)}c.prototype={on:s.on,off:s.off,trigger:s.trigger},c.extend=n.default,c.data=r.default,c.Event=s.Event;var h=c;e.default=h},9845:function(t,e,i){Object.defineProperty(e,"__esModule",{value:!0}),e.ua=e.mobile=e.iphone=e.iemobile=e.ie=void 0;var n,a=(n=i(9380))&&n.__esModule?n:{default:n},r=a.default.navigator&&a.default.navigator.userAgent||"",s=r.indexOf("MSIE ")>0||r.indexOf("Trident/")>0,o="ontouchstart"in a.default,l=/iemobile/i.test(r),c=/iphone/i.test(r)&&!l;e.iphone=c,e.iemobile=l,e.mobile=o,e.ie=s,e.ua=r},7184:function(t,e){Object.defineProperty(e,"__esModule",{value:!0}),e.default=function(t){return t.replace(i,"\\$1")};var i=new RegExp("(\\"+["/",".","*","+","?","|","(",")","[","]","{","}","\\","$","^"].join("|\\")+")","gim")},6030:function(t,e,i){Object.defineProperty(e,"__esModule",{value:!0}),e.EventHandlers=void 0;var n,a=i(8711),r=(n=i(5581))&&n.__esModule?n:{default:n},s=i(9845),o=i(7215),l=i(7760),c=i(4713);function h(t,e){var i="undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(!i){if(Array.isArray(t)||(i=function(t,e){if(t){if("string"==typeof t)return u(t,e);var i=Object.prototype.toString.call(t).slice(8,-1);return"Object"===i&&t.constructor&&(i=t.constructor.name),"Map"===i||"Set"===i?Array.from(t):"Arguments"===i||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(i)?u(t,e):void 0}}(t))||e&&t&&"number"==typeof t.length){i&&(t=i);var n=0,a=function(){};return{s:a,n:function(){return n>=t.length?{done:!0}:{done:!1,value:t[n++]}},e:function(t){throw t},f:a}}throw new TypeError("Invalid attempt to iterate non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}var r,s=!0,o=!1;return{s:function(){i=i.call(t)},n:function(){var t=i.next();return s=t.done,t},e:function(t){o=!0,r=t},f:function(){try{s||null==i.return||i.return()}finally{if(o)throw r}}}}function u(t,e){(null==e||e>t.length)&&(e=t.length);for(var i=0,n=new Array(e);i<e;i++)n[i]=t[i];return n}var d={keydownEvent:function(t){var e=this.inputmask,i=e.opts,n=e.dependencyLib,h=e.maskset,u=this,d=n(u),f=t.keyCode,g=a.caret.call(e,u),p=i.onKeyDown.call(this,t,a.getBuffer.call(e),g,i);if(void 0!==p)return p;if(f===r.default.BACKSPACE||f===r.default.DELETE||s.iphone&&f===r.default.BACKSPACE_SAFARI||t.ctrlKey&&f===r.default.X&&!("oncut"in u))t.preventDefault(),o.handleRemove.call(e,u,f,g),(0,l.writeBuffer)(u,a.getBuffer.call(e,!0),h.p,t,u.inputmask._valueGet()!==a.getBuffer.call(e).join(""));else if(f===r.default.END||f===r.default.PAGE_DOWN){t.preventDefault();var m=a.seekNext.call(e,a.getLastValidPosition.call(e));a.caret.call(e,u,t.shiftKey?g.begin:m,m,!0)}else f===r.default.HOME&&!t.shiftKey||f===r.default.PAGE_UP?(t.preventDefault(),a.caret.call(e,u,0,t.shiftKey?g.begin:0,!0)):i.undoOnEscape&&f===r.default.ESCAPE&&!0!==t.altKey?((0,l.checkVal)(u,!0,!1,e.undoValue.split("")),d.trigger("click")):f!==r.default.INSERT||t.shiftKey||t.ctrlKey||void 0!==e.userOptions.insertMode?!0===i.tabThrough&&f===r.default.TAB?!0===t.shiftKey?(g.end=a.seekPrevious.call(e,g.end,!0),!0===c.getTest.call(e,g.end-1).match.static&&g.end--,g.begin=a.seekPrevious.call(e,g.end,!0),g.begin>=0&&g.end>0&&(t.preventDefault(),a.caret.call(e,u,g.begin,g.end))):(g.begin=a.seekNext.call(e,g.begin,!0),g.end=a.seekNext.call(e,g.begin,!0),g.end<h.maskLength&&g.end--,g.begin<=h.maskLength&&(t.preventDefault(),a.caret.call(e,u,g.begin,g.end))):t.shiftKey||i.insertModeVisual&&!1===i.insertMode&&(f===r.default.RIGHT?setTimeout((function(){var t=a.caret.call(e,u);a.caret.call(e,u,t.begin)}),0):f===r.default.LEFT&&setTimeout((function(){var t=a.translatePosition.call(e,u.inputmask.caretPos.begin);a.translatePosition.call(e,u.inputmask.caretPos.end),e.isRTL?a.caret.call(e,u,t+(t===h.maskLength?0:1)):a.caret.call(e,u,t-(0===t?0:1))}),0)):o.isSelection.call(e,g)?i.insertMode=!i.insertMode:(i.insertMode=!i.insertMode,a.caret.call(e,u,g.begin,g.begin));e.ignorable=i.ignorables.includes(f)},keypressEvent:function(t,e,i,n,s){var c=this.inputmask||this,h=c.opts,u=c.dependencyLib,d=c.maskset,f=c.el,g=u(f),p=t.keyCode;if(!(!0===e||t.ctrlKey&&t.altKey)&&(t.ctrlKey||t.metaKey||c.ignorable))return p===r.default.ENTER&&c.undoValue!==c._valueGet(!0)&&(c.undoValue=c._valueGet(!0),setTimeout((function(){g.trigger("change")}),0)),c.skipInputEvent=!0,!0;if(p){44!==p&&46!==p||3!==t.location||""===h.radixPoint||(p=h.radixPoint.charCodeAt(0));var m,v=e?{begin:s,end:s}:a.caret.call(c,f),x=String.fromCharCode(p);x=h.substitutes[x]||x,d.writeOutBuffer=!0;var b=o.isValid.call(c,v,x,n,void 0,void 0,void 0,e);if(!1!==b&&(a.resetMaskSet.call(c,!0),m=void 0!==b.caret?b.caret:a.seekNext.call(c,b.pos.begin?b.pos.begin:b.pos),d.p=m),m=h.numericInput&&void 0===b.caret?a.seekPrevious.call(c,m):m,!1!==i&&(setTimeout((function(){h.onKeyValidation.call(f,p,b)}),0),d.writeOutBuffer&&!1!==b)){var y=a.getBuffer.call(c);(0,l.writeBuffer)(f,y,m,t,!0!==e)}if(t.preventDefault(),e)return!1!==b&&(b.forwardPosition=m),b}},keyupEvent:function(t){var e=this.inputmask;!e.isComposing||t.keyCode!==r.default.KEY_229&&t.keyCode!==r.default.ENTER||e.$el.trigger("input")},pasteEvent:function(t){var e,i=this.inputmask,n=i.opts,r=i._valueGet(!0),s=a.caret.call(i,this);i.isRTL&&(e=s.end,s.end=a.translatePosition.call(i,s.begin),s.begin=a.translatePosition.call(i,e));var o=r.substr(0,s.begin),c=r.substr(s.end,r.length);if(o==(i.isRTL?a.getBufferTemplate.call(i).slice().reverse():a.getBufferTemplate.call(i)).slice(0,s.begin).join("")&&(o=""),c==(i.isRTL?a.getBufferTemplate.call(i).slice().reverse():a.getBufferTemplate.call(i)).slice(s.end).join("")&&(c=""),window.clipboardData&&window.clipboardData.getData)r=o+window.clipboardData.getData("Text")+c;else{if(!t.clipboardData||!t.clipboardData.getData)return!0;r=o+t.clipboardData.getData("text/plain")+c}var u=r;if(i.isRTL){u=u.split("");var d,f=h(a.getBufferTemplate.call(i));try{for(f.s();!(d=f.n()).done;){var g=d.value;u[0]===g&&u.shift()}}catch(t){f.e(t)}finally{f.f()}u=u.join("")}if("function"==typeof n.onBeforePaste){if(!1===(u=n.onBeforePaste.call(i,u,n)))return!1;u||(u=r)}(0,l.checkVal)(this,!0,!1,u.toString().split(""),t),t.preventDefault()},inputFallBackEvent:function(t){var e=this.inputmask,i=e.opts,n=e.dependencyLib,o=this,h=o.inputmask._valueGet(!0),u=(e.isRTL?a.getBuffer.call(e).slice().reverse():a.getBuffer.call(e)).join(""),f=a.caret.call(e,o,void 0,void 0,!0);if(u!==h){h=function(t,i,n){if(s.iemobile){var r=i.replace(a.getBuffer.call(e).join(""),"");if(1===r.length){var o=i.split("");o.splice(n.begin,0,r),i=o.join("")}}return i}(0,h,f);var g=function(t,n,r){for(var s,o,l,h=t.substr(0,r.begin).split(""),u=t.substr(r.begin).split(""),d=n.substr(0,r.begin).split(""),f=n.substr(r.begin).split(""),g=h.length>=d.length?h.length:d.length,p=u.length>=f.length?u.length:f.length,m="",v=[],x="~";h.length<g;)h.push(x);for(;d.length<g;)d.push(x);for(;u.length<p;)u.unshift(x);for(;f.length<p;)f.unshift(x);var b=h.concat(u),y=d.concat(f);for(o=0,s=b.length;o<s;o++)switch(l=c.getPlaceholder.call(e,a.translatePosition.call(e,o)),m){case"insertText":y[o-1]===b[o]&&r.begin==b.length-1&&v.push(b[o]),o=s;break;case"insertReplacementText":case"deleteContentBackward":b[o]===x?r.end++:o=s;break;default:b[o]!==y[o]&&(b[o+1]!==x&&b[o+1]!==l&&void 0!==b[o+1]||(y[o]!==l||y[o+1]!==x)&&y[o]!==x?y[o+1]===x&&y[o]===b[o+1]?(m="insertText",v.push(b[o]),r.begin--,r.end--):b[o]!==l&&b[o]!==x&&(b[o+1]===x||y[o]!==b[o]&&y[o+1]===b[o+1])?(m="insertReplacementText",v.push(b[o]),r.begin--):b[o]===x?(m="deleteContentBackward",(a.isMask.call(e,a.translatePosition.call(e,o),!0)||y[o]===i.radixPoint)&&r.end++):o=s:(m="insertText",v.push(b[o]),r.begin--,r.end--))}return{action:m,data:v,caret:r}}(h,u,f);switch((o.inputmask.shadowRoot||o.ownerDocument).activeElement!==o&&o.focus(),(0,l.writeBuffer)(o,a.getBuffer.call(e)),a.caret.call(e,o,f.begin,f.end,!0),g.action){case"insertText":case"insertReplacementText":g.data.forEach((function(t,i){var a=new n.Event("keypress");a.keyCode=t.charCodeAt(0),e.ignorable=!1,d.keypressEvent.call(o,a)})),setTimeout((function(){e.$el.trigger("keyup")}),0);break;case"deleteContentBackward":var p=new n.Event("keydown");p.keyCode=r.default.BACKSPACE,d.keydownEvent.call(o,p);break;default:(0,l.applyInputValue)(o,h)}t.preventDefault()}},compositionendEvent:function(t){var e=this.inputmask;e.isComposing=!1,e.$el.trigger("input")},setValueEvent:function(t){var e=this.inputmask,i=this,n=t&&t.detail?t.detail[0]:arguments[1];void 0===n&&(n=i.inputmask._valueGet(!0)),(0,l.applyInputValue)(i,n),(t.detail&&void 0!==t.detail[1]||void 0!==arguments[2])&&a.caret.call(e,i,t.detail?t.detail[1]:arguments[2])},focusEvent:function(t){var e=this.inputmask,i=e.opts,n=this,r=n.inputmask._valueGet();i.showMaskOnFocus&&r!==a.getBuffer.call(e).join("")&&(0,l.writeBuffer)(n,a.getBuffer.call(e),a.seekNext.call(e,a.getLastValidPosition.call(e))),!0!==i.positionCaretOnTab||!1!==e.mouseEnter||o.isComplete.call(e,a.getBuffer.call(e))&&-1!==a.getLastValidPosition.call(e)||d.clickEvent.apply(n,[t,!0]),e.undoValue=e._valueGet(!0)},invalidEvent:function(t){this.inputmask.validationEvent=!0},mouseleaveEvent:function(){var t=this.inputmask,e=t.opts,i=this;t.mouseEnter=!1,e.clearMaskOnLostFocus&&(i.inputmask.shadowRoot||i.ownerDocument).activeElement!==i&&(0,l.HandleNativePlaceholder)(i,t.originalPlaceholder)},clickEvent:function(t,e){var i=this.inputmask,n=this;if((n.inputmask.shadowRoot||n.ownerDocument).activeElement===n){var r=a.determineNewCaretPosition.call(i,a.caret.call(i,n),e);void 0!==r&&a.caret.call(i,n,r)}},cutEvent:function(t){var e=this.inputmask,i=e.maskset,n=this,s=a.caret.call(e,n),c=e.isRTL?a.getBuffer.call(e).slice(s.end,s.begin):a.getBuffer.call(e).slice(s.begin,s.end),h=e.isRTL?c.reverse().join(""):c.join("");window.navigator.clipboard?window.navigator.clipboard.writeText(h):window.clipboardData&&window.clipboardData.getData&&window.clipboardData.setData("Text",h),o.handleRemove.call(e,n,r.default.DELETE,s),(0,l.writeBuffer)(n,a.getBuffer.call(e),i.p,t,e.undoValue!==e._valueGet(!0))},blurEvent:function(t){var e=this.inputmask,i=e.opts,n=(0,e.dependencyLib)(this),r=this;if(r.inputmask){(0,l.HandleNativePlaceholder)(r,e.originalPlaceholder);var s=r.inputmask._valueGet(),c=a.getBuffer.call(e).slice();""!==s&&(i.clearMaskOnLostFocus&&(-1===a.getLastValidPosition.call(e)&&s===a.getBufferTemplate.call(e).join("")?c=[]:l.clearOptionalTail.call(e,c)),!1===o.isComplete.call(e,c)&&(setTimeout((function(){n.trigger("incomplete")}),0),i.clearIncomplete&&(a.resetMaskSet.call(e),c=i.clearMaskOnLostFocus?[]:a.getBufferTemplate.call(e).slice())),(0,l.writeBuffer)(r,c,void 0,t)),e.undoValue!==e._valueGet(!0)&&(e.undoValue=e._valueGet(!0),n.trigger("change"))}},mouseenterEvent:function(){var t=this.inputmask,e=t.opts,i=this;if(t.mouseEnter=!0,(i.inputmask.shadowRoot||i.ownerDocument).activeElement!==i){var n=(t.isRTL?a.getBufferTemplate.call(t).slice().reverse():a.getBufferTemplate.call(t)).join("");t.placeholder!==n&&i.placeholder!==t.originalPlaceholder&&(t.originalPlaceholder=i.placeholder),e.showMaskOnHover&&(0,l.HandleNativePlaceholder)(i,n)}},submitEvent:function(){var t=this.inputmask,e=t.opts;t.undoValue!==t._valueGet(!0)&&t.$el.trigger("change"),-1===a.getLastValidPosition.call(t)&&t._valueGet&&t._valueGet()===a.getBufferTemplate.call(t).join("")&&t._valueSet(""),e.clearIncomplete&&!1===o.isComplete.call(t,a.getBuffer.call(t))&&t._valueSet(""),e.removeMaskOnSubmit&&(t._valueSet(t.unmaskedvalue(),!0),setTimeout((function(){(0,l.writeBuffer)(t.el,a.getBuffer.call(t))}),0))},resetEvent:function(){var t=this.inputmask;t.refreshValue=!0,setTimeout((function(){(0,l.applyInputValue)(t.el,t._valueGet(!0))}),0)}};e.EventHandlers=d},9716:function(t,e,i){Object.defineProperty(e,"__esModule",{value:!0}),e.EventRuler=void 0;var n=o(i(2394)),a=o(i(5581)),r=i(8711),s=i(7760);function o(t){return t&&t.__esModule?t:{default:t}}var l={on:function(t,e,i){var o=t.inputmask.dependencyLib,l=function(e){e.originalEvent&&(e=e.originalEvent||e,arguments[0]=e);var l,c=this,h=c.inputmask,u=h?h.opts:void 0;if(void 0===h&&"FORM"!==this.nodeName){var d=o.data(c,"_inputmask_opts");o(c).off(),d&&new n.default(d).mask(c)}else{if(["submit","reset","setvalue"].includes(e.type)||"FORM"===this.nodeName||!(c.disabled||c.readOnly&&!("keydown"===e.type&&e.ctrlKey&&67===e.keyCode||!1===u.tabThrough&&e.keyCode===a.default.TAB))){switch(e.type){case"input":if(!0===h.skipInputEvent||e.inputType&&"insertCompositionText"===e.inputType)return h.skipInputEvent=!1,e.preventDefault();break;case"keydown":h.skipKeyPressEvent=!1,h.skipInputEvent=h.isComposing=e.keyCode===a.default.KEY_229;break;case"keyup":case"compositionend":h.isComposing&&(h.skipInputEvent=!1);break;case"keypress":if(!0===h.skipKeyPressEvent)return e.preventDefault();h.skipKeyPressEvent=!0;break;case"click":case"focus":return h.validationEvent?(h.validationEvent=!1,t.blur(),(0,s.HandleNativePlaceholder)(t,(h.isRTL?r.getBufferTemplate.call(h).slice().reverse():r.getBufferTemplate.call(h)).join("")),setTimeout((function(){t.focus()}),u.validationEventTimeOut),!1):(l=arguments,setTimeout((function(){t.inputmask&&i.apply(c,l)}),0),!1)}var f=i.apply(c,arguments);return!1===f&&(e.preventDefault(),e.stopPropagation()),f}e.preventDefault()}};["submit","reset"].includes(e)?(l=l.bind(t),null!==t.form&&o(t.form).on(e,l)):o(t).on(e,l),t.inputmask.events[e]=t.inputmask.events[e]||[],t.inputmask.events[e].push(l)},off:function(t,e){if(t.inputmask&&t.inputmask.events){var i=t.inputmask.dependencyLib,n=t.inputmask.events;for(var a in e&&((n=[])[e]=t.inputmask.events[e]),n){for(var r=n[a];r.length>0;){var s=r.pop();["submit","reset"].includes(a)?null!==t.form&&i(t.form).off(a,s):i(t).off(a,s)}delete t.inputmask.events[a]}}}};e.EventRuler=l},219:function(t,e,i){var n=u(i(2394)),a=u(i(5581)),r=u(i(7184)),s=i(8711),o=i(4713);function l(t){return l="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},l(t)}function c(t,e){(null==e||e>t.length)&&(e=t.length);for(var i=0,n=new Array(e);i<e;i++)n[i]=t[i];return n}function h(t,e){for(var i=0;i<e.length;i++){var n=e[i];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,n.key,n)}}function u(t){return t&&t.__esModule?t:{default:t}}var d=n.default.dependencyLib,f=function(){function t(e,i,n){!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,t),this.mask=e,this.format=i,this.opts=n,this._date=new Date(1,0,1),this.initDateObject(e,this.opts)}var e,i;return e=t,(i=[{key:"date",get:function(){return void 0===this._date&&(this._date=new Date(1,0,1),this.initDateObject(void 0,this.opts)),this._date}},{key:"initDateObject",value:function(t,e){var i;for(w(e).lastIndex=0;i=w(e).exec(this.format);){var n=new RegExp("\\d+$").exec(i[0]),a=n?i[0][0]+"x":i[0],r=void 0;if(void 0!==t){if(n){var s=w(e).lastIndex,o=E(i.index,e);w(e).lastIndex=s,r=t.slice(0,t.indexOf(o.nextMatch[0]))}else r=t.slice(0,a.length);t=t.slice(r.length)}Object.prototype.hasOwnProperty.call(m,a)&&this.setValue(this,r,a,m[a][2],m[a][1])}}},{key:"setValue",value:function(t,e,i,n,a){if(void 0!==e&&(t[n]="ampm"===n?e:e.replace(/[^0-9]/g,"0"),t["raw"+n]=e.replace(/\s/g,"_")),void 0!==a){var r=t[n];("day"===n&&29===parseInt(r)||"month"===n&&2===parseInt(r))&&(29!==parseInt(t.day)||2!==parseInt(t.month)||""!==t.year&&void 0!==t.year||t._date.setFullYear(2012,1,29)),"day"===n&&(p=!0,0===parseInt(r)&&(r=1)),"month"===n&&(p=!0),"year"===n&&(p=!0,r.length<4&&(r=S(r,4,!0))),""===r||isNaN(r)||a.call(t._date,r),"ampm"===n&&a.call(t._date,r)}}},{key:"reset",value:function(){this._date=new Date(1,0,1)}},{key:"reInit",value:function(){this._date=void 0,this.date}}])&&h(e.prototype,i),Object.defineProperty(e,"prototype",{writable:!1}),t}(),g=(new Date).getFullYear(),p=!1,m={d:["[1-9]|[12][0-9]|3[01]",Date.prototype.setDate,"day",Date.prototype.getDate],dd:["0[1-9]|[12][0-9]|3[01]",Date.prototype.setDate,"day",function(){return S(Date.prototype.getDate.call(this),2)}],ddd:[""],dddd:[""],m:["[1-9]|1[012]",function(t){var e=t?parseInt(t):0;return e>0&&e--,Date.prototype.setMonth.call(this,e)},"month",function(){return Date.prototype.getMonth.call(this)+1}],mm:["0[1-9]|1[012]",function(t){var e=t?parseInt(t):0;return e>0&&e--,Date.prototype.setMonth.call(this,e)},"month",function(){return S(Date.prototype.getMonth.call(this)+1,2)}],mmm:[""],mmmm:[""],yy:["[0-9]{2}",Date.prototype.setFullYear,"year",function(){return S(Date.prototype.getFullYear.call(this),2)}],yyyy:["[0-9]{4}",Date.prototype.setFullYear,"year",function(){return S(Date.prototype.getFullYear.call(this),4)}],h:["[1-9]|1[0-2]",Date.prototype.setHours,"hours",Date.prototype.getHours],hh:["0[1-9]|1[0-2]",Date.prototype.setHours,"hours",function(){return S(Date.prototype.getHours.call(this),2)}],hx:[function(t){return"[0-9]{".concat(t,"}")},Date.prototype.setHours,"hours",function(t){return Date.prototype.getHours}],H:["1?[0-9]|2[0-3]",Date.prototype.setHours,"hours",Date.prototype.getHours],HH:["0[0-9]|1[0-9]|2[0-3]",Date.prototype.setHours,"hours",function(){return S(Date.prototype.getHours.call(this),2)}],Hx:[function(t){return"[0-9]{".concat(t,"}")},Date.prototype.setHours,"hours",function(t){return function(){return S(Date.prototype.getHours.call(this),t)}}],M:["[1-5]?[0-9]",Date.prototype.setMinutes,"minutes",Date.prototype.getMinutes],MM:["0[0-9]|1[0-9]|2[0-9]|3[0-9]|4[0-9]|5[0-9]",Date.prototype.setMinutes,"minutes",function(){return S(Date.prototype.getMinutes.call(this),2)}],s:["[1-5]?[0-9]",Date.prototype.setSeconds,"seconds",Date.prototype.getSeconds],ss:["0[0-9]|1[0-9]|2[0-9]|3[0-9]|4[0-9]|5[0-9]",Date.prototype.setSeconds,"seconds",function(){return S(Date.prototype.getSeconds.call(this),2)}],l:["[0-9]{3}",Date.prototype.setMilliseconds,"milliseconds",function(){return S(Date.prototype.getMilliseconds.call(this),3)}],L:["[0-9]{2}",Date.prototype.setMilliseconds,"milliseconds",function(){return S(Date.prototype.getMilliseconds.call(this),2)}],t:["[ap]",x,"ampm",b,1],tt:["[ap]m",x,"ampm",b,2],T:["[AP]",x,"ampm",b,1],TT:["[AP]M",x,"ampm",b,2],Z:[".*",void 0,"Z",function(){var t=this.toString().match(/\((.+)\)/)[1];return t.includes(" ")&&(t=(t=t.replace("-"," ").toUpperCase()).split(" ").map((function(t){return function(t,e){return function(t){if(Array.isArray(t))return t}(t)||function(t,e){var i=null==t?null:"undefined"!=typeof Symbol&&t[Symbol.iterator]||t["@@iterator"];if(null!=i){var n,a,r=[],s=!0,o=!1;try{for(i=i.call(t);!(s=(n=i.next()).done)&&(r.push(n.value),!e||r.length!==e);s=!0);}catch(t){o=!0,a=t}finally{try{s||null==i.return||i.return()}finally{if(o)throw a}}return r}}(t,e)||function(t,e){if(t){if("string"==typeof t)return c(t,e);var i=Object.prototype.toString.call(t).slice(8,-1);return"Object"===i&&t.constructor&&(i=t.constructor.name),"Map"===i||"Set"===i?Array.from(t):"Arguments"===i||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(i)?c(t,e):void 0}}(t,e)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}(t,1)[0]})).join("")),t}],o:[""],S:[""]},v={isoDate:"yyyy-mm-dd",isoTime:"HH:MM:ss",isoDateTime:"yyyy-mm-dd'T'HH:MM:ss",isoUtcDateTime:"UTC:yyyy-mm-dd'T'HH:MM:ss'Z'"};function x(t){var e=this.getHours();t.toLowerCase().includes("p")?this.setHours(e+12):t.toLowerCase().includes("a")&&e>=12&&this.setHours(e-12)}function b(){var t=this.getHours();return(t=t||12)>=12?"PM":"AM"}function y(t){var e=new RegExp("\\d+$").exec(t[0]);if(e&&void 0!==e[0]){var i=m[t[0][0]+"x"].slice("");return i[0]=i[0](e[0]),i[3]=i[3](e[0]),i}if(m[t[0]])return m[t[0]]}function w(t){if(!t.tokenizer){var e=[],i=[];for(var n in m)if(/\.*x$/.test(n)){var a=n[0]+"\\d+";-1===i.indexOf(a)&&i.push(a)}else-1===e.indexOf(n[0])&&e.push(n[0]);t.tokenizer="("+(i.length>0?i.join("|")+"|":"")+e.join("+|")+")+?|.",t.tokenizer=new RegExp(t.tokenizer,"g")}return t.tokenizer}function k(t,e,i){if(!p)return!0;if(void 0===t.rawday||!isFinite(t.rawday)&&new Date(t.date.getFullYear(),isFinite(t.rawmonth)?t.month:t.date.getMonth()+1,0).getDate()>=t.day||"29"==t.day&&(!isFinite(t.rawyear)||void 0===t.rawyear||""===t.rawyear)||new Date(t.date.getFullYear(),isFinite(t.rawmonth)?t.month:t.date.getMonth()+1,0).getDate()>=t.day)return e;if("29"==t.day){var n=E(e.pos,i);if("yyyy"===n.targetMatch[0]&&e.pos-n.targetMatchIndex==2)return e.remove=e.pos+1,e}else if("02"==t.month&&"30"==t.day&&void 0!==e.c)return t.day="03",t.date.setDate(3),t.date.setMonth(1),e.insert=[{pos:e.pos,c:"0"},{pos:e.pos+1,c:e.c}],e.caret=s.seekNext.call(this,e.pos+1),e;return!1}function A(t,e,i,n){var a,s,o="";for(w(i).lastIndex=0;a=w(i).exec(t);)if(void 0===e)if(s=y(a))o+="("+s[0]+")";else switch(a[0]){case"[":o+="(";break;case"]":o+=")?";break;default:o+=(0,r.default)(a[0])}else(s=y(a))?!0!==n&&s[3]?o+=s[3].call(e.date):s[2]?o+=e["raw"+s[2]]:o+=a[0]:o+=a[0];return o}function S(t,e,i){for(t=String(t),e=e||2;t.length<e;)t=i?t+"0":"0"+t;return t}function _(t,e,i){return"string"==typeof t?new f(t,e,i):t&&"object"===l(t)&&Object.prototype.hasOwnProperty.call(t,"date")?t:void 0}function C(t,e){return A(e.inputFormat,{date:t},e)}function E(t,e){var i,n,a=0,r=0;for(w(e).lastIndex=0;n=w(e).exec(e.inputFormat);){var s=new RegExp("\\d+$").exec(n[0]);if((a+=r=s?parseInt(s[0]):n[0].length)>=t+1){i=n,n=w(e).exec(e.inputFormat);break}}return{targetMatchIndex:a-r,nextMatch:n,targetMatch:i}}n.default.extendAliases({datetime:{mask:function(t){return t.numericInput=!1,m.S=t.i18n.ordinalSuffix.join("|"),t.inputFormat=v[t.inputFormat]||t.inputFormat,t.displayFormat=v[t.displayFormat]||t.displayFormat||t.inputFormat,t.outputFormat=v[t.outputFormat]||t.outputFormat||t.inputFormat,t.placeholder=""!==t.placeholder?t.placeholder:t.inputFormat.replace(/[[\]]/,""),t.regex=A(t.inputFormat,void 0,t),t.min=_(t.min,t.inputFormat,t),t.max=_(t.max,t.inputFormat,t),null},placeholder:"",inputFormat:"isoDateTime",displayFormat:null,outputFormat:null,min:null,max:null,skipOptionalPartCharacter:"",i18n:{dayNames:["Mon","Tue","Wed","Thu","Fri","Sat","Sun","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday","Sunday"],monthNames:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec","January","February","March","April","May","June","July","August","September","October","November","December"],ordinalSuffix:["st","nd","rd","th"]},preValidation:function(t,e,i,n,a,r,s,o){if(o)return!0;if(isNaN(i)&&t[e]!==i){var l=E(e,a);if(l.nextMatch&&l.nextMatch[0]===i&&l.targetMatch[0].length>1){var c=m[l.targetMatch[0]][0];if(new RegExp(c).test("0"+t[e-1]))return t[e]=t[e-1],t[e-1]="0",{fuzzy:!0,buffer:t,refreshFromBuffer:{start:e-1,end:e+1},pos:e+1}}}return!0},postValidation:function(t,e,i,n,a,r,s,l){var c,h;if(s)return!0;if(!1===n&&(((c=E(e+1,a)).targetMatch&&c.targetMatchIndex===e&&c.targetMatch[0].length>1&&void 0!==m[c.targetMatch[0]]||(c=E(e+2,a)).targetMatch&&c.targetMatchIndex===e+1&&c.targetMatch[0].length>1&&void 0!==m[c.targetMatch[0]])&&(h=m[c.targetMatch[0]][0]),void 0!==h&&(void 0!==r.validPositions[e+1]&&new RegExp(h).test(i+"0")?(t[e]=i,t[e+1]="0",n={pos:e+2,caret:e}):new RegExp(h).test("0"+i)&&(t[e]="0",t[e+1]=i,n={pos:e+2})),!1===n))return n;if(n.fuzzy&&(t=n.buffer,e=n.pos),(c=E(e,a)).targetMatch&&c.targetMatch[0]&&void 0!==m[c.targetMatch[0]]){var u=m[c.targetMatch[0]];h=u[0];var d=t.slice(c.targetMatchIndex,c.targetMatchIndex+c.targetMatch[0].length);if(!1===new RegExp(h).test(d.join(""))&&2===c.targetMatch[0].length&&r.validPositions[c.targetMatchIndex]&&r.validPositions[c.targetMatchIndex+1]&&(r.validPositions[c.targetMatchIndex+1].input="0"),"year"==u[2])for(var f=o.getMaskTemplate.call(this,!1,1,void 0,!0),p=e+1;p<t.length;p++)t[p]=f[p],delete r.validPositions[p]}var v=n,x=_(t.join(""),a.inputFormat,a);return v&&x.date.getTime()==x.date.getTime()&&(a.prefillYear&&(v=function(t,e,i){if(t.year!==t.rawyear){var n=g.toString(),a=t.rawyear.replace(/[^0-9]/g,""),r=n.slice(0,a.length),s=n.slice(a.length);if(2===a.length&&a===r){var o=new Date(g,t.month-1,t.day);t.day==o.getDate()&&(!i.max||i.max.date.getTime()>=o.getTime())&&(t.date.setFullYear(g),t.year=n,e.insert=[{pos:e.pos+1,c:s[0]},{pos:e.pos+2,c:s[1]}])}}return e}(x,v,a)),v=function(t,e,i,n,a){if(!e)return e;if(e&&i.min&&i.min.date.getTime()==i.min.date.getTime()){var r;for(t.reset(),w(i).lastIndex=0;r=w(i).exec(i.inputFormat);){var s;if((s=y(r))&&s[3]){for(var o=s[1],l=t[s[2]],c=i.min[s[2]],h=i.max?i.max[s[2]]:c,u=[],d=!1,f=0;f<c.length;f++)void 0!==n.validPositions[f+r.index]||d?(u[f]=l[f],d=d||l[f]>c[f]):(u[f]=c[f],"year"===s[2]&&l.length-1==f&&c!=h&&(u=(parseInt(u.join(""))+1).toString().split("")),"ampm"===s[2]&&c!=h&&i.min.date.getTime()>t.date.getTime()&&(u[f]=h[f]));o.call(t._date,u.join(""))}}e=i.min.date.getTime()<=t.date.getTime(),t.reInit()}return e&&i.max&&i.max.date.getTime()==i.max.date.getTime()&&(e=i.max.date.getTime()>=t.date.getTime()),e}(x,v=k.call(this,x,v,a),a,r)),void 0!==e&&v&&n.pos!==e?{buffer:A(a.inputFormat,x,a).split(""),refreshFromBuffer:{start:e,end:n.pos},pos:n.caret||n.pos}:v},onKeyDown:function(t,e,i,n){t.ctrlKey&&t.keyCode===a.default.RIGHT&&(this.inputmask._valueSet(C(new Date,n)),d(this).trigger("setvalue"))},onUnMask:function(t,e,i){return e?A(i.outputFormat,_(t,i.inputFormat,i),i,!0):e},casing:function(t,e,i,n){return 0==e.nativeDef.indexOf("[ap]")?t.toLowerCase():0==e.nativeDef.indexOf("[AP]")?t.toUpperCase():t},onBeforeMask:function(t,e){return"[object Date]"===Object.prototype.toString.call(t)&&(t=C(t,e)),t},insertMode:!1,shiftPositions:!1,keepStatic:!1,inputmode:"numeric",prefillYear:!0}})},3851:function(t,e,i){var n,a=(n=i(2394))&&n.__esModule?n:{default:n},r=i(8711),s=i(4713);a.default.extendDefinitions({A:{validator:"[A-Za-zА-яЁёÀ-ÿµ]",casing:"upper"},"&":{validator:"[0-9A-Za-zА-яЁёÀ-ÿµ]",casing:"upper"},"#":{validator:"[0-9A-Fa-f]",casing:"upper"}});var o=new RegExp("25[0-5]|2[0-4][0-9]|[01][0-9][0-9]");function l(t,e,i,n,a){return i-1>-1&&"."!==e.buffer[i-1]?(t=e.buffer[i-1]+t,t=i-2>-1&&"."!==e.buffer[i-2]?e.buffer[i-2]+t:"0"+t):t="00"+t,o.test(t)}a.default.extendAliases({cssunit:{regex:"[+-]?[0-9]+\\.?([0-9]+)?(px|em|rem|ex|%|in|cm|mm|pt|pc)"},url:{regex:"(https?|ftp)://.*",autoUnmask:!1,keepStatic:!1,tabThrough:!0},ip:{mask:"i{1,3}.j{1,3}.k{1,3}.l{1,3}",definitions:{i:{validator:l},j:{validator:l},k:{validator:l},l:{validator:l}},onUnMask:function(t,e,i){return t},inputmode:"decimal",substitutes:{",":"."}},email:{mask:function(t){var e="*{1,64}[.*{1,64}][.*{1,64}][.*{1,63}]@-{1,63}.-{1,63}[.-{1,63}][.-{1,63}]",i=e;if(t.separator)for(var n=0;n<t.quantifier;n++)i+="[".concat(t.separator).concat(e,"]");return i},greedy:!1,casing:"lower",separator:null,quantifier:5,skipOptionalPartCharacter:"",onBeforePaste:function(t,e){return(t=t.toLowerCase()).replace("mailto:","")},definitions:{"*":{validator:"[0-9１-９A-Za-zА-яЁёÀ-ÿµ!#$%&'*+/=?^_`{|}~-]"},"-":{validator:"[0-9A-Za-z-]"}},onUnMask:function(t,e,i){return t},inputmode:"email"},mac:{mask:"##:##:##:##:##:##"},vin:{mask:"V{13}9{4}",definitions:{V:{validator:"[A-HJ-NPR-Za-hj-npr-z\\d]",casing:"upper"}},clearIncomplete:!0,autoUnmask:!0},ssn:{mask:"999-99-9999",postValidation:function(t,e,i,n,a,o,l){var c=s.getMaskTemplate.call(this,!0,r.getLastValidPosition.call(this),!0,!0);return/^(?!219-09-9999|078-05-1120)(?!666|000|9.{2}).{3}-(?!00).{2}-(?!0{4}).{4}$/.test(c.join(""))}}})},207:function(t,e,i){var n=o(i(2394)),a=o(i(5581)),r=o(i(7184)),s=i(8711);function o(t){return t&&t.__esModule?t:{default:t}}var l=n.default.dependencyLib;function c(t,e){for(var i="",a=0;a<t.length;a++)n.default.prototype.definitions[t.charAt(a)]||e.definitions[t.charAt(a)]||e.optionalmarker[0]===t.charAt(a)||e.optionalmarker[1]===t.charAt(a)||e.quantifiermarker[0]===t.charAt(a)||e.quantifiermarker[1]===t.charAt(a)||e.groupmarker[0]===t.charAt(a)||e.groupmarker[1]===t.charAt(a)||e.alternatormarker===t.charAt(a)?i+="\\"+t.charAt(a):i+=t.charAt(a);return i}function h(t,e,i,n){if(t.length>0&&e>0&&(!i.digitsOptional||n)){var a=t.indexOf(i.radixPoint),r=!1;i.negationSymbol.back===t[t.length-1]&&(r=!0,t.length--),-1===a&&(t.push(i.radixPoint),a=t.length-1);for(var s=1;s<=e;s++)isFinite(t[a+s])||(t[a+s]="0")}return r&&t.push(i.negationSymbol.back),t}function u(t,e){var i=0;if("+"===t){for(i in e.validPositions);i=s.seekNext.call(this,parseInt(i))}for(var n in e.tests)if((n=parseInt(n))>=i)for(var a=0,r=e.tests[n].length;a<r;a++)if((void 0===e.validPositions[n]||"-"===t)&&e.tests[n][a].match.def===t)return n+(void 0!==e.validPositions[n]&&"-"!==t?1:0);return i}function d(t,e){var i=-1;for(var n in e.validPositions){var a=e.validPositions[n];if(a&&a.match.def===t){i=parseInt(n);break}}return i}function f(t,e,i,n,a){var r=e.buffer?e.buffer.indexOf(a.radixPoint):-1,s=(-1!==r||n&&a.jitMasking)&&new RegExp(a.definitions[9].validator).test(t);return a._radixDance&&-1!==r&&s&&null==e.validPositions[r]?{insert:{pos:r===i?r+1:r,c:a.radixPoint},pos:i}:s}n.default.extendAliases({numeric:{mask:function(t){t.repeat=0,t.groupSeparator===t.radixPoint&&t.digits&&"0"!==t.digits&&("."===t.radixPoint?t.groupSeparator=",":","===t.radixPoint?t.groupSeparator=".":t.groupSeparator="")," "===t.groupSeparator&&(t.skipOptionalPartCharacter=void 0),t.placeholder.length>1&&(t.placeholder=t.placeholder.charAt(0)),"radixFocus"===t.positionCaretOnClick&&""===t.placeholder&&(t.positionCaretOnClick="lvp");var e="0",i=t.radixPoint;!0===t.numericInput&&void 0===t.__financeInput?(e="1",t.positionCaretOnClick="radixFocus"===t.positionCaretOnClick?"lvp":t.positionCaretOnClick,t.digitsOptional=!1,isNaN(t.digits)&&(t.digits=2),t._radixDance=!1,i=","===t.radixPoint?"?":"!",""!==t.radixPoint&&void 0===t.definitions[i]&&(t.definitions[i]={},t.definitions[i].validator="["+t.radixPoint+"]",t.definitions[i].placeholder=t.radixPoint,t.definitions[i].static=!0,t.definitions[i].generated=!0)):(t.__financeInput=!1,t.numericInput=!0);var n,a="[+]";if(a+=c(t.prefix,t),""!==t.groupSeparator?(void 0===t.definitions[t.groupSeparator]&&(t.definitions[t.groupSeparator]={},t.definitions[t.groupSeparator].validator="["+t.groupSeparator+"]",t.definitions[t.groupSeparator].placeholder=t.groupSeparator,t.definitions[t.groupSeparator].static=!0,t.definitions[t.groupSeparator].generated=!0),a+=t._mask(t)):a+="9{+}",void 0!==t.digits&&0!==t.digits){var s=t.digits.toString().split(",");isFinite(s[0])&&s[1]&&isFinite(s[1])?a+=i+e+"{"+t.digits+"}":(isNaN(t.digits)||parseInt(t.digits)>0)&&(t.digitsOptional||t.jitMasking?(n=a+i+e+"{0,"+t.digits+"}",t.keepStatic=!0):a+=i+e+"{"+t.digits+"}")}else t.inputmode="numeric";return a+=c(t.suffix,t),a+="[-]",n&&(a=[n+c(t.suffix,t)+"[-]",a]),t.greedy=!1,function(t){void 0===t.parseMinMaxOptions&&(null!==t.min&&(t.min=t.min.toString().replace(new RegExp((0,r.default)(t.groupSeparator),"g"),""),","===t.radixPoint&&(t.min=t.min.replace(t.radixPoint,".")),t.min=isFinite(t.min)?parseFloat(t.min):NaN,isNaN(t.min)&&(t.min=Number.MIN_VALUE)),null!==t.max&&(t.max=t.max.toString().replace(new RegExp((0,r.default)(t.groupSeparator),"g"),""),","===t.radixPoint&&(t.max=t.max.replace(t.radixPoint,".")),t.max=isFinite(t.max)?parseFloat(t.max):NaN,isNaN(t.max)&&(t.max=Number.MAX_VALUE)),t.parseMinMaxOptions="done")}(t),""!==t.radixPoint&&(t.substitutes["."==t.radixPoint?",":"."]=t.radixPoint),a},_mask:function(t){return"("+t.groupSeparator+"999){+|1}"},digits:"*",digitsOptional:!0,enforceDigitsOnBlur:!1,radixPoint:".",positionCaretOnClick:"radixFocus",_radixDance:!0,groupSeparator:"",allowMinus:!0,negationSymbol:{front:"-",back:""},prefix:"",suffix:"",min:null,max:null,SetMaxOnOverflow:!1,step:1,inputType:"text",unmaskAsNumber:!1,roundingFN:Math.round,inputmode:"decimal",shortcuts:{k:"1000",m:"1000000"},placeholder:"0",greedy:!1,rightAlign:!0,insertMode:!0,autoUnmask:!1,skipOptionalPartCharacter:"",usePrototypeDefinitions:!1,stripLeadingZeroes:!0,definitions:{0:{validator:f},1:{validator:f,definitionSymbol:"9"},9:{validator:"[0-9０-９٠-٩۰-۹]",definitionSymbol:"*"},"+":{validator:function(t,e,i,n,a){return a.allowMinus&&("-"===t||t===a.negationSymbol.front)}},"-":{validator:function(t,e,i,n,a){return a.allowMinus&&t===a.negationSymbol.back}}},preValidation:function(t,e,i,n,a,r,s,o){if(!1!==a.__financeInput&&i===a.radixPoint)return!1;var l=t.indexOf(a.radixPoint),c=e;if(e=function(t,e,i,n,a){return a._radixDance&&a.numericInput&&e!==a.negationSymbol.back&&t<=i&&(i>0||e==a.radixPoint)&&(void 0===n.validPositions[t-1]||n.validPositions[t-1].input!==a.negationSymbol.back)&&(t-=1),t}(e,i,l,r,a),"-"===i||i===a.negationSymbol.front){if(!0!==a.allowMinus)return!1;var h=!1,f=d("+",r),g=d("-",r);return-1!==f&&(h=[f,g]),!1!==h?{remove:h,caret:c-a.negationSymbol.back.length}:{insert:[{pos:u.call(this,"+",r),c:a.negationSymbol.front,fromIsValid:!0},{pos:u.call(this,"-",r),c:a.negationSymbol.back,fromIsValid:void 0}],caret:c+a.negationSymbol.back.length}}if(i===a.groupSeparator)return{caret:c};if(o)return!0;if(-1!==l&&!0===a._radixDance&&!1===n&&i===a.radixPoint&&void 0!==a.digits&&(isNaN(a.digits)||parseInt(a.digits)>0)&&l!==e)return{caret:a._radixDance&&e===l-1?l+1:l};if(!1===a.__financeInput)if(n){if(a.digitsOptional)return{rewritePosition:s.end};if(!a.digitsOptional){if(s.begin>l&&s.end<=l)return i===a.radixPoint?{insert:{pos:l+1,c:"0",fromIsValid:!0},rewritePosition:l}:{rewritePosition:l+1};if(s.begin<l)return{rewritePosition:s.begin-1}}}else if(!a.showMaskOnHover&&!a.showMaskOnFocus&&!a.digitsOptional&&a.digits>0&&""===this.__valueGet.call(this.el))return{rewritePosition:l};return{rewritePosition:e}},postValidation:function(t,e,i,n,a,r,s){if(!1===n)return n;if(s)return!0;if(null!==a.min||null!==a.max){var o=a.onUnMask(t.slice().reverse().join(""),void 0,l.extend({},a,{unmaskAsNumber:!0}));if(null!==a.min&&o<a.min&&(o.toString().length>a.min.toString().length||o<0))return!1;if(null!==a.max&&o>a.max)return!!a.SetMaxOnOverflow&&{refreshFromBuffer:!0,buffer:h(a.max.toString().replace(".",a.radixPoint).split(""),a.digits,a).reverse()}}return n},onUnMask:function(t,e,i){if(""===e&&!0===i.nullable)return e;var n=t.replace(i.prefix,"");return n=(n=n.replace(i.suffix,"")).replace(new RegExp((0,r.default)(i.groupSeparator),"g"),""),""!==i.placeholder.charAt(0)&&(n=n.replace(new RegExp(i.placeholder.charAt(0),"g"),"0")),i.unmaskAsNumber?(""!==i.radixPoint&&-1!==n.indexOf(i.radixPoint)&&(n=n.replace(r.default.call(this,i.radixPoint),".")),n=(n=n.replace(new RegExp("^"+(0,r.default)(i.negationSymbol.front)),"-")).replace(new RegExp((0,r.default)(i.negationSymbol.back)+"$"),""),Number(n)):n},isComplete:function(t,e){var i=(e.numericInput?t.slice().reverse():t).join("");return i=(i=(i=(i=(i=i.replace(new RegExp("^"+(0,r.default)(e.negationSymbol.front)),"-")).replace(new RegExp((0,r.default)(e.negationSymbol.back)+"$"),"")).replace(e.prefix,"")).replace(e.suffix,"")).replace(new RegExp((0,r.default)(e.groupSeparator)+"([0-9]{3})","g"),"$1"),","===e.radixPoint&&(i=i.replace((0,r.default)(e.radixPoint),".")),isFinite(i)},onBeforeMask:function(t,e){var i=e.radixPoint||",";isFinite(e.digits)&&(e.digits=parseInt(e.digits)),"number"!=typeof t&&"number"!==e.inputType||""===i||(t=t.toString().replace(".",i));var n="-"===t.charAt(0)||t.charAt(0)===e.negationSymbol.front,a=t.split(i),s=a[0].replace(/[^\-0-9]/g,""),o=a.length>1?a[1].replace(/[^0-9]/g,""):"",l=a.length>1;t=s+(""!==o?i+o:o);var c=0;if(""!==i&&(c=e.digitsOptional?e.digits<o.length?e.digits:o.length:e.digits,""!==o||!e.digitsOptional)){var u=Math.pow(10,c||1);t=t.replace((0,r.default)(i),"."),isNaN(parseFloat(t))||(t=(e.roundingFN(parseFloat(t)*u)/u).toFixed(c)),t=t.toString().replace(".",i)}if(0===e.digits&&-1!==t.indexOf(i)&&(t=t.substring(0,t.indexOf(i))),null!==e.min||null!==e.max){var d=t.toString().replace(i,".");null!==e.min&&d<e.min?t=e.min.toString().replace(".",i):null!==e.max&&d>e.max&&(t=e.max.toString().replace(".",i))}return n&&"-"!==t.charAt(0)&&(t="-"+t),h(t.toString().split(""),c,e,l).join("")},onBeforeWrite:function(t,e,i,n){function a(t,e){if(!1!==n.__financeInput||e){var i=t.indexOf(n.radixPoint);-1!==i&&t.splice(i,1)}if(""!==n.groupSeparator)for(;-1!==(i=t.indexOf(n.groupSeparator));)t.splice(i,1);return t}var s,o;if(n.stripLeadingZeroes&&(o=function(t,e){var i=new RegExp("(^"+(""!==e.negationSymbol.front?(0,r.default)(e.negationSymbol.front)+"?":"")+(0,r.default)(e.prefix)+")(.*)("+(0,r.default)(e.suffix)+(""!=e.negationSymbol.back?(0,r.default)(e.negationSymbol.back)+"?":"")+"$)").exec(t.slice().reverse().join("")),n=i?i[2]:"",a=!1;return n&&(n=n.split(e.radixPoint.charAt(0))[0],a=new RegExp("^[0"+e.groupSeparator+"]*").exec(n)),!(!a||!(a[0].length>1||a[0].length>0&&a[0].length<n.length))&&a}(e,n)))for(var c=e.join("").lastIndexOf(o[0].split("").reverse().join(""))-(o[0]==o.input?0:1),u=o[0]==o.input?1:0,d=o[0].length-u;d>0;d--)delete this.maskset.validPositions[c+d],delete e[c+d];if(t)switch(t.type){case"blur":case"checkval":if(null!==n.min){var f=n.onUnMask(e.slice().reverse().join(""),void 0,l.extend({},n,{unmaskAsNumber:!0}));if(null!==n.min&&f<n.min)return{refreshFromBuffer:!0,buffer:h(n.min.toString().replace(".",n.radixPoint).split(""),n.digits,n).reverse()}}if(e[e.length-1]===n.negationSymbol.front){var g=new RegExp("(^"+(""!=n.negationSymbol.front?(0,r.default)(n.negationSymbol.front)+"?":"")+(0,r.default)(n.prefix)+")(.*)("+(0,r.default)(n.suffix)+(""!=n.negationSymbol.back?(0,r.default)(n.negationSymbol.back)+"?":"")+"$)").exec(a(e.slice(),!0).reverse().join(""));0==(g?g[2]:"")&&(s={refreshFromBuffer:!0,buffer:[0]})}else""!==n.radixPoint&&e.indexOf(n.radixPoint)===n.suffix.length&&(s&&s.buffer?s.buffer.splice(0,1+n.suffix.length):(e.splice(0,1+n.suffix.length),s={refreshFromBuffer:!0,buffer:a(e)}));if(n.enforceDigitsOnBlur){var p=(s=s||{})&&s.buffer||e.slice().reverse();s.refreshFromBuffer=!0,s.buffer=h(p,n.digits,n,!0).reverse()}}return s},onKeyDown:function(t,e,i,n){var r,s,o=l(this),c=String.fromCharCode(t.keyCode).toLowerCase();if((s=n.shortcuts&&n.shortcuts[c])&&s.length>1)return this.inputmask.__valueSet.call(this,parseFloat(this.inputmask.unmaskedvalue())*parseInt(s)),o.trigger("setvalue"),!1;if(t.ctrlKey)switch(t.keyCode){case a.default.UP:return this.inputmask.__valueSet.call(this,parseFloat(this.inputmask.unmaskedvalue())+parseInt(n.step)),o.trigger("setvalue"),!1;case a.default.DOWN:return this.inputmask.__valueSet.call(this,parseFloat(this.inputmask.unmaskedvalue())-parseInt(n.step)),o.trigger("setvalue"),!1}if(!t.shiftKey&&(t.keyCode===a.default.DELETE||t.keyCode===a.default.BACKSPACE||t.keyCode===a.default.BACKSPACE_SAFARI)&&i.begin!==e.length){if(e[t.keyCode===a.default.DELETE?i.begin-1:i.end]===n.negationSymbol.front)return r=e.slice().reverse(),""!==n.negationSymbol.front&&r.shift(),""!==n.negationSymbol.back&&r.pop(),o.trigger("setvalue",[r.join(""),i.begin]),!1;if(!0===n._radixDance){var u=e.indexOf(n.radixPoint);if(n.digitsOptional){if(0===u)return(r=e.slice().reverse()).pop(),o.trigger("setvalue",[r.join(""),i.begin>=r.length?r.length:i.begin]),!1}else if(-1!==u&&(i.begin<u||i.end<u||t.keyCode===a.default.DELETE&&i.begin===u))return i.begin!==i.end||t.keyCode!==a.default.BACKSPACE&&t.keyCode!==a.default.BACKSPACE_SAFARI||i.begin++,(r=e.slice().reverse()).splice(r.length-i.begin,i.begin-i.end+1),r=h(r,n.digits,n).join(""),o.trigger("setvalue",[r,i.begin>=r.length?u+1:i.begin]),!1}}}},currency:{prefix:"",groupSeparator:",",alias:"numeric",digits:2,digitsOptional:!1},decimal:{alias:"numeric"},integer:{alias:"numeric",inputmode:"numeric",digits:0},percentage:{alias:"numeric",min:0,max:100,suffix:" %",digits:0,allowMinus:!1},indianns:{alias:"numeric",_mask:function(t){return"("+t.groupSeparator+"99){*|1}("+t.groupSeparator+"999){1|1}"},groupSeparator:",",radixPoint:".",placeholder:"0",digits:2,digitsOptional:!1}})},9380:function(t,e,i){var n;Object.defineProperty(e,"__esModule",{value:!0}),e.default=void 0;var a=((n=i(8741))&&n.__esModule?n:{default:n}).default?window:{};e.default=a},7760:function(t,e,i){Object.defineProperty(e,"__esModule",{value:!0}),e.HandleNativePlaceholder=function(t,e){var i=t?t.inputmask:this;if(l.ie){if(t.inputmask._valueGet()!==e&&(t.placeholder!==e||""===t.placeholder)){var n=s.getBuffer.call(i).slice(),a=t.inputmask._valueGet();if(a!==e){var r=s.getLastValidPosition.call(i);-1===r&&a===s.getBufferTemplate.call(i).join("")?n=[]:-1!==r&&u.call(i,n),f(t,n)}}}else t.placeholder!==e&&(t.placeholder=e,""===t.placeholder&&t.removeAttribute("placeholder"))},e.applyInputValue=h,e.checkVal=d,e.clearOptionalTail=u,e.unmaskedvalue=function(t){var e=t?t.inputmask:this,i=e.opts,n=e.maskset;if(t){if(void 0===t.inputmask)return t.value;t.inputmask&&t.inputmask.refreshValue&&h(t,t.inputmask._valueGet(!0))}var a=[],r=n.validPositions;for(var o in r)r[o]&&r[o].match&&(1!=r[o].match.static||Array.isArray(n.metadata)&&!0!==r[o].generatedInput)&&a.push(r[o].input);var l=0===a.length?"":(e.isRTL?a.reverse():a).join("");if("function"==typeof i.onUnMask){var c=(e.isRTL?s.getBuffer.call(e).slice().reverse():s.getBuffer.call(e)).join("");l=i.onUnMask.call(e,c,l,i)}return l},e.writeBuffer=f;var n,a=(n=i(5581))&&n.__esModule?n:{default:n},r=i(4713),s=i(8711),o=i(7215),l=i(9845),c=i(6030);function h(t,e){var i=t?t.inputmask:this,n=i.opts;t.inputmask.refreshValue=!1,"function"==typeof n.onBeforeMask&&(e=n.onBeforeMask.call(i,e,n)||e),d(t,!0,!1,e=e.toString().split("")),i.undoValue=i._valueGet(!0),(n.clearMaskOnLostFocus||n.clearIncomplete)&&t.inputmask._valueGet()===s.getBufferTemplate.call(i).join("")&&-1===s.getLastValidPosition.call(i)&&t.inputmask._valueSet("")}function u(t){t.length=0;for(var e,i=r.getMaskTemplate.call(this,!0,0,!0,void 0,!0);void 0!==(e=i.shift());)t.push(e);return t}function d(t,e,i,n,a){var l=t?t.inputmask:this,h=l.maskset,u=l.opts,d=l.dependencyLib,g=n.slice(),p="",m=-1,v=void 0,x=u.skipOptionalPartCharacter;u.skipOptionalPartCharacter="",s.resetMaskSet.call(l),h.tests={},m=u.radixPoint?s.determineNewCaretPosition.call(l,{begin:0,end:0},!1,!1===u.__financeInput?"radixFocus":void 0).begin:0,h.p=m,l.caretPos={begin:m};var b=[],y=l.caretPos;if(g.forEach((function(t,e){if(void 0!==t){var n=new d.Event("_checkval");n.keyCode=t.toString().charCodeAt(0),p+=t;var a=s.getLastValidPosition.call(l,void 0,!0);!function(t,e){for(var i=r.getMaskTemplate.call(l,!0,0).slice(t,s.seekNext.call(l,t,!1,!1)).join("").replace(/'/g,""),n=i.indexOf(e);n>0&&" "===i[n-1];)n--;var a=0===n&&!s.isMask.call(l,t)&&(r.getTest.call(l,t).match.nativeDef===e.charAt(0)||!0===r.getTest.call(l,t).match.static&&r.getTest.call(l,t).match.nativeDef==="'"+e.charAt(0)||" "===r.getTest.call(l,t).match.nativeDef&&(r.getTest.call(l,t+1).match.nativeDef===e.charAt(0)||!0===r.getTest.call(l,t+1).match.static&&r.getTest.call(l,t+1).match.nativeDef==="'"+e.charAt(0)));if(!a&&n>0&&!s.isMask.call(l,t,!1,!0)){var o=s.seekNext.call(l,t);l.caretPos.begin<o&&(l.caretPos={begin:o})}return a}(m,p)?(v=c.EventHandlers.keypressEvent.call(l,n,!0,!1,i,l.caretPos.begin))&&(m=l.caretPos.begin+1,p=""):v=c.EventHandlers.keypressEvent.call(l,n,!0,!1,i,a+1),v?(void 0!==v.pos&&h.validPositions[v.pos]&&!0===h.validPositions[v.pos].match.static&&void 0===h.validPositions[v.pos].alternation&&(b.push(v.pos),l.isRTL||(v.forwardPosition=v.pos+1)),f.call(l,void 0,s.getBuffer.call(l),v.forwardPosition,n,!1),l.caretPos={begin:v.forwardPosition,end:v.forwardPosition},y=l.caretPos):void 0===h.validPositions[e]&&g[e]===r.getPlaceholder.call(l,e)&&s.isMask.call(l,e,!0)?l.caretPos.begin++:l.caretPos=y}})),b.length>0){var w,k,A=s.seekNext.call(l,-1,void 0,!1);if(!o.isComplete.call(l,s.getBuffer.call(l))&&b.length<=A||o.isComplete.call(l,s.getBuffer.call(l))&&b.length>0&&b.length!==A&&0===b[0])for(var S=A;void 0!==(w=b.shift());){var _=new d.Event("_checkval");if((k=h.validPositions[w]).generatedInput=!0,_.keyCode=k.input.charCodeAt(0),(v=c.EventHandlers.keypressEvent.call(l,_,!0,!1,i,S))&&void 0!==v.pos&&v.pos!==w&&h.validPositions[v.pos]&&!0===h.validPositions[v.pos].match.static)b.push(v.pos);else if(!v)break;S++}}e&&f.call(l,t,s.getBuffer.call(l),v?v.forwardPosition:l.caretPos.begin,a||new d.Event("checkval"),a&&("input"===a.type&&l.undoValue!==s.getBuffer.call(l).join("")||"paste"===a.type)),u.skipOptionalPartCharacter=x}function f(t,e,i,n,r){var l=t?t.inputmask:this,c=l.opts,h=l.dependencyLib;if(n&&"function"==typeof c.onBeforeWrite){var u=c.onBeforeWrite.call(l,n,e,i,c);if(u){if(u.refreshFromBuffer){var d=u.refreshFromBuffer;o.refreshFromBuffer.call(l,!0===d?d:d.start,d.end,u.buffer||e),e=s.getBuffer.call(l,!0)}void 0!==i&&(i=void 0!==u.caret?u.caret:i)}}if(void 0!==t&&(t.inputmask._valueSet(e.join("")),void 0===i||void 0!==n&&"blur"===n.type||s.caret.call(l,t,i,void 0,void 0,void 0!==n&&"keydown"===n.type&&(n.keyCode===a.default.DELETE||n.keyCode===a.default.BACKSPACE)),!0===r)){var f=h(t),g=t.inputmask._valueGet();t.inputmask.skipInputEvent=!0,f.trigger("input"),setTimeout((function(){g===s.getBufferTemplate.call(l).join("")?f.trigger("cleared"):!0===o.isComplete.call(l,e)&&f.trigger("complete")}),0)}}},2394:function(t,e,i){Object.defineProperty(e,"__esModule",{value:!0}),e.default=void 0,i(7149),i(3194);var n=i(157),a=m(i(4963)),r=m(i(9380)),s=i(2391),o=i(4713),l=i(8711),c=i(7215),h=i(7760),u=i(9716),d=m(i(7392)),f=m(i(3976)),g=m(i(8741));function p(t){return p="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},p(t)}function m(t){return t&&t.__esModule?t:{default:t}}var v=r.default.document,x="_inputmask_opts";function b(t,e,i){if(g.default){if(!(this instanceof b))return new b(t,e,i);this.dependencyLib=a.default,this.el=void 0,this.events={},this.maskset=void 0,!0!==i&&("[object Object]"===Object.prototype.toString.call(t)?e=t:(e=e||{},t&&(e.alias=t)),this.opts=a.default.extend(!0,{},this.defaults,e),this.noMasksCache=e&&void 0!==e.definitions,this.userOptions=e||{},y(this.opts.alias,e,this.opts)),this.refreshValue=!1,this.undoValue=void 0,this.$el=void 0,this.skipKeyPressEvent=!1,this.skipInputEvent=!1,this.validationEvent=!1,this.ignorable=!1,this.maxLength,this.mouseEnter=!1,this.originalPlaceholder=void 0,this.isComposing=!1}}function y(t,e,i){var n=b.prototype.aliases[t];return n?(n.alias&&y(n.alias,void 0,i),a.default.extend(!0,i,n),a.default.extend(!0,i,e),!0):(null===i.mask&&(i.mask=t),!1)}b.prototype={dataAttribute:"data-inputmask",defaults:f.default,definitions:d.default,aliases:{},masksCache:{},get isRTL(){return this.opts.isRTL||this.opts.numericInput},mask:function(t){var e=this;return"string"==typeof t&&(t=v.getElementById(t)||v.querySelectorAll(t)),(t=t.nodeName?[t]:Array.isArray(t)?t:Array.from(t)).forEach((function(t,i){var o=a.default.extend(!0,{},e.opts);if(function(t,e,i,n){function s(e,a){var s=""===n?e:n+"-"+e;null!==(a=void 0!==a?a:t.getAttribute(s))&&("string"==typeof a&&(0===e.indexOf("on")?a=r.default[a]:"false"===a?a=!1:"true"===a&&(a=!0)),i[e]=a)}if(!0===e.importDataAttributes){var o,l,c,h,u=t.getAttribute(n);if(u&&""!==u&&(u=u.replace(/'/g,'"'),l=JSON.parse("{"+u+"}")),l)for(h in c=void 0,l)if("alias"===h.toLowerCase()){c=l[h];break}for(o in s("alias",c),i.alias&&y(i.alias,i,e),e){if(l)for(h in c=void 0,l)if(h.toLowerCase()===o.toLowerCase()){c=l[h];break}s(o,c)}}return a.default.extend(!0,e,i),("rtl"===t.dir||e.rightAlign)&&(t.style.textAlign="right"),("rtl"===t.dir||e.numericInput)&&(t.dir="ltr",t.removeAttribute("dir"),e.isRTL=!0),Object.keys(i).length}(t,o,a.default.extend(!0,{},e.userOptions),e.dataAttribute)){var l=(0,s.generateMaskSet)(o,e.noMasksCache);void 0!==l&&(void 0!==t.inputmask&&(t.inputmask.opts.autoUnmask=!0,t.inputmask.remove()),t.inputmask=new b(void 0,void 0,!0),t.inputmask.opts=o,t.inputmask.noMasksCache=e.noMasksCache,t.inputmask.userOptions=a.default.extend(!0,{},e.userOptions),t.inputmask.el=t,t.inputmask.$el=(0,a.default)(t),t.inputmask.maskset=l,a.default.data(t,x,e.userOptions),n.mask.call(t.inputmask))}})),t&&t[0]&&t[0].inputmask||this},option:function(t,e){return"string"==typeof t?this.opts[t]:"object"===p(t)?(a.default.extend(this.userOptions,t),this.el&&!0!==e&&this.mask(this.el),this):void 0},unmaskedvalue:function(t){if(this.maskset=this.maskset||(0,s.generateMaskSet)(this.opts,this.noMasksCache),void 0===this.el||void 0!==t){var e=("function"==typeof this.opts.onBeforeMask&&this.opts.onBeforeMask.call(this,t,this.opts)||t).split("");h.checkVal.call(this,void 0,!1,!1,e),"function"==typeof this.opts.onBeforeWrite&&this.opts.onBeforeWrite.call(this,void 0,l.getBuffer.call(this),0,this.opts)}return h.unmaskedvalue.call(this,this.el)},remove:function(){if(this.el){a.default.data(this.el,x,null);var t=this.opts.autoUnmask?(0,h.unmaskedvalue)(this.el):this._valueGet(this.opts.autoUnmask);t!==l.getBufferTemplate.call(this).join("")?this._valueSet(t,this.opts.autoUnmask):this._valueSet(""),u.EventRuler.off(this.el),Object.getOwnPropertyDescriptor&&Object.getPrototypeOf?Object.getOwnPropertyDescriptor(Object.getPrototypeOf(this.el),"value")&&this.__valueGet&&Object.defineProperty(this.el,"value",{get:this.__valueGet,set:this.__valueSet,configurable:!0}):v.__lookupGetter__&&this.el.__lookupGetter__("value")&&this.__valueGet&&(this.el.__defineGetter__("value",this.__valueGet),this.el.__defineSetter__("value",this.__valueSet)),this.el.inputmask=void 0}return this.el},getemptymask:function(){return this.maskset=this.maskset||(0,s.generateMaskSet)(this.opts,this.noMasksCache),l.getBufferTemplate.call(this).join("")},hasMaskedValue:function(){return!this.opts.autoUnmask},isComplete:function(){return this.maskset=this.maskset||(0,s.generateMaskSet)(this.opts,this.noMasksCache),c.isComplete.call(this,l.getBuffer.call(this))},getmetadata:function(){if(this.maskset=this.maskset||(0,s.generateMaskSet)(this.opts,this.noMasksCache),Array.isArray(this.maskset.metadata)){var t=o.getMaskTemplate.call(this,!0,0,!1).join("");return this.maskset.metadata.forEach((function(e){return e.mask!==t||(t=e,!1)})),t}return this.maskset.metadata},isValid:function(t){if(this.maskset=this.maskset||(0,s.generateMaskSet)(this.opts,this.noMasksCache),t){var e=("function"==typeof this.opts.onBeforeMask&&this.opts.onBeforeMask.call(this,t,this.opts)||t).split("");h.checkVal.call(this,void 0,!0,!1,e)}else t=this.isRTL?l.getBuffer.call(this).slice().reverse().join(""):l.getBuffer.call(this).join("");for(var i=l.getBuffer.call(this),n=l.determineLastRequiredPosition.call(this),a=i.length-1;a>n&&!l.isMask.call(this,a);a--);return i.splice(n,a+1-n),c.isComplete.call(this,i)&&t===(this.isRTL?l.getBuffer.call(this).slice().reverse().join(""):l.getBuffer.call(this).join(""))},format:function(t,e){this.maskset=this.maskset||(0,s.generateMaskSet)(this.opts,this.noMasksCache);var i=("function"==typeof this.opts.onBeforeMask&&this.opts.onBeforeMask.call(this,t,this.opts)||t).split("");h.checkVal.call(this,void 0,!0,!1,i);var n=this.isRTL?l.getBuffer.call(this).slice().reverse().join(""):l.getBuffer.call(this).join("");return e?{value:n,metadata:this.getmetadata()}:n},setValue:function(t){this.el&&(0,a.default)(this.el).trigger("setvalue",[t])},analyseMask:s.analyseMask},b.extendDefaults=function(t){a.default.extend(!0,b.prototype.defaults,t)},b.extendDefinitions=function(t){a.default.extend(!0,b.prototype.definitions,t)},b.extendAliases=function(t){a.default.extend(!0,b.prototype.aliases,t)},b.format=function(t,e,i){return b(e).format(t,i)},b.unmask=function(t,e){return b(e).unmaskedvalue(t)},b.isValid=function(t,e){return b(e).isValid(t)},b.remove=function(t){"string"==typeof t&&(t=v.getElementById(t)||v.querySelectorAll(t)),(t=t.nodeName?[t]:t).forEach((function(t){t.inputmask&&t.inputmask.remove()}))},b.setValue=function(t,e){"string"==typeof t&&(t=v.getElementById(t)||v.querySelectorAll(t)),(t=t.nodeName?[t]:t).forEach((function(t){t.inputmask?t.inputmask.setValue(e):(0,a.default)(t).trigger("setvalue",[e])}))},b.dependencyLib=a.default,r.default.Inputmask=b;var w=b;e.default=w},5296:function(t,e,i){function n(t){return n="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},n(t)}var a=f(i(9380)),r=f(i(2394)),s=f(i(8741));function o(t,e){if(e&&("object"===n(e)||"function"==typeof e))return e;if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");return function(t){if(void 0===t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return t}(t)}function l(t){var e="function"==typeof Map?new Map:void 0;return l=function(t){if(null===t||(i=t,-1===Function.toString.call(i).indexOf("[native code]")))return t;var i;if("function"!=typeof t)throw new TypeError("Super expression must either be null or a function");if(void 0!==e){if(e.has(t))return e.get(t);e.set(t,n)}function n(){return c(t,arguments,d(this).constructor)}return n.prototype=Object.create(t.prototype,{constructor:{value:n,enumerable:!1,writable:!0,configurable:!0}}),u(n,t)},l(t)}function c(t,e,i){return c=h()?Reflect.construct:function(t,e,i){var n=[null];n.push.apply(n,e);var a=new(Function.bind.apply(t,n));return i&&u(a,i.prototype),a},c.apply(null,arguments)}function h(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],(function(){}))),!0}catch(t){return!1}}function u(t,e){return u=Object.setPrototypeOf||function(t,e){return t.__proto__=e,t},u(t,e)}function d(t){return d=Object.setPrototypeOf?Object.getPrototypeOf:function(t){return t.__proto__||Object.getPrototypeOf(t)},d(t)}function f(t){return t&&t.__esModule?t:{default:t}}var g=a.default.document;if(s.default&&g&&g.head&&g.head.attachShadow&&a.default.customElements&&void 0===a.default.customElements.get("input-mask")){var p=function(t){!function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");Object.defineProperty(t,"prototype",{value:Object.create(e&&e.prototype,{constructor:{value:t,writable:!0,configurable:!0}}),writable:!1}),e&&u(t,e)}(s,t);var e,i,n,a=(e=s,i=h(),function(){var t,n=d(e);if(i){var a=d(this).constructor;t=Reflect.construct(n,arguments,a)}else t=n.apply(this,arguments);return o(this,t)});function s(){var t;!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,s);var e=(t=a.call(this)).getAttributeNames(),i=t.attachShadow({mode:"closed"}),n=g.createElement("input");for(var o in n.type="text",i.appendChild(n),e)Object.prototype.hasOwnProperty.call(e,o)&&n.setAttribute(e[o],t.getAttribute(e[o]));var l=new r.default;return l.dataAttribute="",l.mask(n),n.inputmask.shadowRoot=i,t}return n=s,Object.defineProperty(n,"prototype",{writable:!1}),n}(l(HTMLElement));a.default.customElements.define("input-mask",p)}},2391:function(t,e,i){Object.defineProperty(e,"__esModule",{value:!0}),e.analyseMask=function(t,e,i){var n,s,o,l,c,h,u=/(?:[?*+]|\{[0-9+*]+(?:,[0-9+*]*)?(?:\|[0-9+*]*)?\})|[^.?*+^${[]()|\\]+|./g,d=/\[\^?]?(?:[^\\\]]+|\\[\S\s]?)*]?|\\(?:0(?:[0-3][0-7]{0,2}|[4-7][0-7]?)?|[1-9][0-9]*|x[0-9A-Fa-f]{2}|u[0-9A-Fa-f]{4}|c[A-Za-z]|[\S\s]?)|\((?:\?[:=!]?)?|(?:[?*+]|\{[0-9]+(?:,[0-9]*)?\})\??|[^.?*+^${[()|\\]+|./g,f=!1,g=new a.default,p=[],m=[],v=!1;function x(t,n,a){a=void 0!==a?a:t.matches.length;var s=t.matches[a-1];if(e)0===n.indexOf("[")||f&&/\\d|\\s|\\w/i.test(n)||"."===n?t.matches.splice(a++,0,{fn:new RegExp(n,i.casing?"i":""),static:!1,optionality:!1,newBlockMarker:void 0===s?"master":s.def!==n,casing:null,def:n,placeholder:void 0,nativeDef:n}):(f&&(n=n[n.length-1]),n.split("").forEach((function(e,n){s=t.matches[a-1],t.matches.splice(a++,0,{fn:/[a-z]/i.test(i.staticDefinitionSymbol||e)?new RegExp("["+(i.staticDefinitionSymbol||e)+"]",i.casing?"i":""):null,static:!0,optionality:!1,newBlockMarker:void 0===s?"master":s.def!==e&&!0!==s.static,casing:null,def:i.staticDefinitionSymbol||e,placeholder:void 0!==i.staticDefinitionSymbol?e:void 0,nativeDef:(f?"'":"")+e})}))),f=!1;else{var o=i.definitions&&i.definitions[n]||i.usePrototypeDefinitions&&r.default.prototype.definitions[n];o&&!f?t.matches.splice(a++,0,{fn:o.validator?"string"==typeof o.validator?new RegExp(o.validator,i.casing?"i":""):new function(){this.test=o.validator}:new RegExp("."),static:o.static||!1,optionality:o.optional||!1,newBlockMarker:void 0===s||o.optional?"master":s.def!==(o.definitionSymbol||n),casing:o.casing,def:o.definitionSymbol||n,placeholder:o.placeholder,nativeDef:n,generated:o.generated}):(t.matches.splice(a++,0,{fn:/[a-z]/i.test(i.staticDefinitionSymbol||n)?new RegExp("["+(i.staticDefinitionSymbol||n)+"]",i.casing?"i":""):null,static:!0,optionality:!1,newBlockMarker:void 0===s?"master":s.def!==n&&!0!==s.static,casing:null,def:i.staticDefinitionSymbol||n,placeholder:void 0!==i.staticDefinitionSymbol?n:void 0,nativeDef:(f?"'":"")+n}),f=!1)}}function b(){if(p.length>0){if(x(l=p[p.length-1],s),l.isAlternator){c=p.pop();for(var t=0;t<c.matches.length;t++)c.matches[t].isGroup&&(c.matches[t].isGroup=!1);p.length>0?(l=p[p.length-1]).matches.push(c):g.matches.push(c)}}else x(g,s)}function y(t){var e=new a.default(!0);return e.openGroup=!1,e.matches=t,e}function w(){if((o=p.pop()).openGroup=!1,void 0!==o)if(p.length>0){if((l=p[p.length-1]).matches.push(o),l.isAlternator){for(var t=(c=p.pop()).matches[0].matches?c.matches[0].matches.length:1,e=0;e<c.matches.length;e++)c.matches[e].isGroup=!1,c.matches[e].alternatorGroup=!1,null===i.keepStatic&&t<(c.matches[e].matches?c.matches[e].matches.length:1)&&(i.keepStatic=!0),t=c.matches[e].matches?c.matches[e].matches.length:1;p.length>0?(l=p[p.length-1]).matches.push(c):g.matches.push(c)}}else g.matches.push(o);else b()}function k(t){var e=t.pop();return e.isQuantifier&&(e=y([t.pop(),e])),e}for(e&&(i.optionalmarker[0]=void 0,i.optionalmarker[1]=void 0);n=e?d.exec(t):u.exec(t);){if(s=n[0],e){switch(s.charAt(0)){case"?":s="{0,1}";break;case"+":case"*":s="{"+s+"}";break;case"|":if(0===p.length){var A=y(g.matches);A.openGroup=!0,p.push(A),g.matches=[],v=!0}}"\\d"===s&&(s="[0-9]")}if(f)b();else switch(s.charAt(0)){case"$":case"^":e||b();break;case i.escapeChar:f=!0,e&&b();break;case i.optionalmarker[1]:case i.groupmarker[1]:w();break;case i.optionalmarker[0]:p.push(new a.default(!1,!0));break;case i.groupmarker[0]:p.push(new a.default(!0));break;case i.quantifiermarker[0]:var S=new a.default(!1,!1,!0),_=(s=s.replace(/[{}?]/g,"")).split("|"),C=_[0].split(","),E=isNaN(C[0])?C[0]:parseInt(C[0]),T=1===C.length?E:isNaN(C[1])?C[1]:parseInt(C[1]),P=isNaN(_[1])?_[1]:parseInt(_[1]);"*"!==E&&"+"!==E||(E="*"===T?0:1),S.quantifier={min:E,max:T,jit:P};var M=p.length>0?p[p.length-1].matches:g.matches;if((n=M.pop()).isAlternator){M.push(n),M=n.matches;var L=new a.default(!0),D=M.pop();M.push(L),M=L.matches,n=D}n.isGroup||(n=y([n])),M.push(n),M.push(S);break;case i.alternatormarker:if(p.length>0){var I=(l=p[p.length-1]).matches[l.matches.length-1];h=l.openGroup&&(void 0===I.matches||!1===I.isGroup&&!1===I.isAlternator)?p.pop():k(l.matches)}else h=k(g.matches);if(h.isAlternator)p.push(h);else if(h.alternatorGroup?(c=p.pop(),h.alternatorGroup=!1):c=new a.default(!1,!1,!1,!0),c.matches.push(h),p.push(c),h.openGroup){h.openGroup=!1;var O=new a.default(!0);O.alternatorGroup=!0,p.push(O)}break;default:b()}}for(v&&w();p.length>0;)o=p.pop(),g.matches.push(o);return g.matches.length>0&&(function t(n){n&&n.matches&&n.matches.forEach((function(a,r){var s=n.matches[r+1];(void 0===s||void 0===s.matches||!1===s.isQuantifier)&&a&&a.isGroup&&(a.isGroup=!1,e||(x(a,i.groupmarker[0],0),!0!==a.openGroup&&x(a,i.groupmarker[1]))),t(a)}))}(g),m.push(g)),(i.numericInput||i.isRTL)&&function t(e){for(var n in e.matches=e.matches.reverse(),e.matches)if(Object.prototype.hasOwnProperty.call(e.matches,n)){var a=parseInt(n);if(e.matches[n].isQuantifier&&e.matches[a+1]&&e.matches[a+1].isGroup){var r=e.matches[n];e.matches.splice(n,1),e.matches.splice(a+1,0,r)}void 0!==e.matches[n].matches?e.matches[n]=t(e.matches[n]):e.matches[n]=((s=e.matches[n])===i.optionalmarker[0]?s=i.optionalmarker[1]:s===i.optionalmarker[1]?s=i.optionalmarker[0]:s===i.groupmarker[0]?s=i.groupmarker[1]:s===i.groupmarker[1]&&(s=i.groupmarker[0]),s)}var s;return e}(m[0]),m},e.generateMaskSet=function(t,e){var i;function a(t,i,a){var s,o,l=!1;if(null!==t&&""!==t||((l=null!==a.regex)?t=(t=a.regex).replace(/^(\^)(.*)(\$)$/,"$2"):(l=!0,t=".*")),1===t.length&&!1===a.greedy&&0!==a.repeat&&(a.placeholder=""),a.repeat>0||"*"===a.repeat||"+"===a.repeat){var c="*"===a.repeat?0:"+"===a.repeat?1:a.repeat;t=a.groupmarker[0]+t+a.groupmarker[1]+a.quantifiermarker[0]+c+","+a.repeat+a.quantifiermarker[1]}return o=l?"regex_"+a.regex:a.numericInput?t.split("").reverse().join(""):t,null!==a.keepStatic&&(o="ks_"+a.keepStatic+o),void 0===r.default.prototype.masksCache[o]||!0===e?(s={mask:t,maskToken:r.default.prototype.analyseMask(t,l,a),validPositions:{},_buffer:void 0,buffer:void 0,tests:{},excludes:{},metadata:i,maskLength:void 0,jitOffset:{}},!0!==e&&(r.default.prototype.masksCache[o]=s,s=n.default.extend(!0,{},r.default.prototype.masksCache[o]))):s=n.default.extend(!0,{},r.default.prototype.masksCache[o]),s}if("function"==typeof t.mask&&(t.mask=t.mask(t)),Array.isArray(t.mask)){if(t.mask.length>1){null===t.keepStatic&&(t.keepStatic=!0);var s=t.groupmarker[0];return(t.isRTL?t.mask.reverse():t.mask).forEach((function(e){s.length>1&&(s+=t.alternatormarker),void 0!==e.mask&&"function"!=typeof e.mask?s+=e.mask:s+=e})),a(s+=t.groupmarker[1],t.mask,t)}t.mask=t.mask.pop()}return i=t.mask&&void 0!==t.mask.mask&&"function"!=typeof t.mask.mask?a(t.mask.mask,t.mask,t):a(t.mask,t.mask,t),null===t.keepStatic&&(t.keepStatic=!1),i};var n=s(i(4963)),a=s(i(9695)),r=s(i(2394));function s(t){return t&&t.__esModule?t:{default:t}}},157:function(t,e,i){Object.defineProperty(e,"__esModule",{value:!0}),e.mask=function(){var t=this,e=this.opts,i=this.el,n=this.dependencyLib;o.EventRuler.off(i);var u=function(e,i){"textarea"!==e.tagName.toLowerCase()&&i.ignorables.push(a.default.ENTER);var l=e.getAttribute("type"),c="input"===e.tagName.toLowerCase()&&i.supportsInputType.includes(l)||e.isContentEditable||"textarea"===e.tagName.toLowerCase();if(!c)if("input"===e.tagName.toLowerCase()){var h=document.createElement("input");h.setAttribute("type",l),c="text"===h.type,h=null}else c="partial";return!1!==c?function(e){var a,l;function c(){return this.inputmask?this.inputmask.opts.autoUnmask?this.inputmask.unmaskedvalue():-1!==r.getLastValidPosition.call(t)||!0!==i.nullable?(this.inputmask.shadowRoot||this.ownerDocument).activeElement===this&&i.clearMaskOnLostFocus?(t.isRTL?s.clearOptionalTail.call(t,r.getBuffer.call(t).slice()).reverse():s.clearOptionalTail.call(t,r.getBuffer.call(t).slice())).join(""):a.call(this):"":a.call(this)}function h(t){l.call(this,t),this.inputmask&&(0,s.applyInputValue)(this,t)}if(!e.inputmask.__valueGet){if(!0!==i.noValuePatching){if(Object.getOwnPropertyDescriptor){var u=Object.getPrototypeOf?Object.getOwnPropertyDescriptor(Object.getPrototypeOf(e),"value"):void 0;u&&u.get&&u.set?(a=u.get,l=u.set,Object.defineProperty(e,"value",{get:c,set:h,configurable:!0})):"input"!==e.tagName.toLowerCase()&&(a=function(){return this.textContent},l=function(t){this.textContent=t},Object.defineProperty(e,"value",{get:c,set:h,configurable:!0}))}else document.__lookupGetter__&&e.__lookupGetter__("value")&&(a=e.__lookupGetter__("value"),l=e.__lookupSetter__("value"),e.__defineGetter__("value",c),e.__defineSetter__("value",h));e.inputmask.__valueGet=a,e.inputmask.__valueSet=l}e.inputmask._valueGet=function(e){return t.isRTL&&!0!==e?a.call(this.el).split("").reverse().join(""):a.call(this.el)},e.inputmask._valueSet=function(e,i){l.call(this.el,null==e?"":!0!==i&&t.isRTL?e.split("").reverse().join(""):e)},void 0===a&&(a=function(){return this.value},l=function(t){this.value=t},function(e){if(n.valHooks&&(void 0===n.valHooks[e]||!0!==n.valHooks[e].inputmaskpatch)){var a=n.valHooks[e]&&n.valHooks[e].get?n.valHooks[e].get:function(t){return t.value},o=n.valHooks[e]&&n.valHooks[e].set?n.valHooks[e].set:function(t,e){return t.value=e,t};n.valHooks[e]={get:function(e){if(e.inputmask){if(e.inputmask.opts.autoUnmask)return e.inputmask.unmaskedvalue();var n=a(e);return-1!==r.getLastValidPosition.call(t,void 0,void 0,e.inputmask.maskset.validPositions)||!0!==i.nullable?n:""}return a(e)},set:function(t,e){var i=o(t,e);return t.inputmask&&(0,s.applyInputValue)(t,e),i},inputmaskpatch:!0}}}(e.type),function(e){o.EventRuler.on(e,"mouseenter",(function(){var e=this.inputmask._valueGet(!0);e!==(t.isRTL?r.getBuffer.call(t).reverse():r.getBuffer.call(t)).join("")&&(0,s.applyInputValue)(this,e)}))}(e))}}(e):e.inputmask=void 0,c}(i,e);if(!1!==u){t.originalPlaceholder=i.placeholder,t.maxLength=void 0!==i?i.maxLength:void 0,-1===t.maxLength&&(t.maxLength=void 0),"inputMode"in i&&null===i.getAttribute("inputmode")&&(i.inputMode=e.inputmode,i.setAttribute("inputmode",e.inputmode)),!0===u&&(e.showMaskOnFocus=e.showMaskOnFocus&&-1===["cc-number","cc-exp"].indexOf(i.autocomplete),l.iphone&&(e.insertModeVisual=!1),o.EventRuler.on(i,"submit",h.EventHandlers.submitEvent),o.EventRuler.on(i,"reset",h.EventHandlers.resetEvent),o.EventRuler.on(i,"blur",h.EventHandlers.blurEvent),o.EventRuler.on(i,"focus",h.EventHandlers.focusEvent),o.EventRuler.on(i,"invalid",h.EventHandlers.invalidEvent),o.EventRuler.on(i,"click",h.EventHandlers.clickEvent),o.EventRuler.on(i,"mouseleave",h.EventHandlers.mouseleaveEvent),o.EventRuler.on(i,"mouseenter",h.EventHandlers.mouseenterEvent),o.EventRuler.on(i,"paste",h.EventHandlers.pasteEvent),o.EventRuler.on(i,"cut",h.EventHandlers.cutEvent),o.EventRuler.on(i,"complete",e.oncomplete),o.EventRuler.on(i,"incomplete",e.onincomplete),o.EventRuler.on(i,"cleared",e.oncleared),!0!==e.inputEventOnly&&(o.EventRuler.on(i,"keydown",h.EventHandlers.keydownEvent),o.EventRuler.on(i,"keypress",h.EventHandlers.keypressEvent),o.EventRuler.on(i,"keyup",h.EventHandlers.keyupEvent)),(l.mobile||e.inputEventOnly)&&i.removeAttribute("maxLength"),o.EventRuler.on(i,"input",h.EventHandlers.inputFallBackEvent),o.EventRuler.on(i,"compositionend",h.EventHandlers.compositionendEvent)),o.EventRuler.on(i,"setvalue",h.EventHandlers.setValueEvent),r.getBufferTemplate.call(t).join(""),t.undoValue=t._valueGet(!0);var d=(i.inputmask.shadowRoot||i.ownerDocument).activeElement;if(""!==i.inputmask._valueGet(!0)||!1===e.clearMaskOnLostFocus||d===i){(0,s.applyInputValue)(i,i.inputmask._valueGet(!0),e);var f=r.getBuffer.call(t).slice();!1===c.isComplete.call(t,f)&&e.clearIncomplete&&r.resetMaskSet.call(t),e.clearMaskOnLostFocus&&d!==i&&(-1===r.getLastValidPosition.call(t)?f=[]:s.clearOptionalTail.call(t,f)),(!1===e.clearMaskOnLostFocus||e.showMaskOnFocus&&d===i||""!==i.inputmask._valueGet(!0))&&(0,s.writeBuffer)(i,f),d===i&&r.caret.call(t,i,r.seekNext.call(t,r.getLastValidPosition.call(t)))}}};var n,a=(n=i(5581))&&n.__esModule?n:{default:n},r=i(8711),s=i(7760),o=i(9716),l=i(9845),c=i(7215),h=i(6030)},9695:function(t,e){Object.defineProperty(e,"__esModule",{value:!0}),e.default=function(t,e,i,n){this.matches=[],this.openGroup=t||!1,this.alternatorGroup=!1,this.isGroup=t||!1,this.isOptional=e||!1,this.isQuantifier=i||!1,this.isAlternator=n||!1,this.quantifier={min:1,max:1}}},3194:function(){Array.prototype.includes||Object.defineProperty(Array.prototype,"includes",{value:function(t,e){if(null==this)throw new TypeError('"this" is null or not defined');var i=Object(this),n=i.length>>>0;if(0===n)return!1;for(var a=0|e,r=Math.max(a>=0?a:n-Math.abs(a),0);r<n;){if(i[r]===t)return!0;r++}return!1}})},7149:function(){function t(e){return(t="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t})(e)}"function"!=typeof Object.getPrototypeOf&&(Object.getPrototypeOf="object"===t("test".__proto__)?function(t){return t.__proto__}:function(t){return t.constructor.prototype})},8711:function(t,e,i){Object.defineProperty(e,"__esModule",{value:!0}),e.caret=function(t,e,i,n,a){var r,s=this,o=this.opts;if(void 0===e)return"selectionStart"in t&&"selectionEnd"in t?(e=t.selectionStart,i=t.selectionEnd):window.getSelection?(r=window.getSelection().getRangeAt(0)).commonAncestorContainer.parentNode!==t&&r.commonAncestorContainer!==t||(e=r.startOffset,i=r.endOffset):document.selection&&document.selection.createRange&&(i=(e=0-(r=document.selection.createRange()).duplicate().moveStart("character",-t.inputmask._valueGet().length))+r.text.length),{begin:n?e:c.call(s,e),end:n?i:c.call(s,i)};if(Array.isArray(e)&&(i=s.isRTL?e[0]:e[1],e=s.isRTL?e[1]:e[0]),void 0!==e.begin&&(i=s.isRTL?e.begin:e.end,e=s.isRTL?e.end:e.begin),"number"==typeof e){e=n?e:c.call(s,e),i="number"==typeof(i=n?i:c.call(s,i))?i:e;var l=parseInt(((t.ownerDocument.defaultView||window).getComputedStyle?(t.ownerDocument.defaultView||window).getComputedStyle(t,null):t.currentStyle).fontSize)*i;if(t.scrollLeft=l>t.scrollWidth?l:0,t.inputmask.caretPos={begin:e,end:i},o.insertModeVisual&&!1===o.insertMode&&e===i&&(a||i++),t===(t.inputmask.shadowRoot||t.ownerDocument).activeElement)if("setSelectionRange"in t)t.setSelectionRange(e,i);else if(window.getSelection){if(r=document.createRange(),void 0===t.firstChild||null===t.firstChild){var h=document.createTextNode("");t.appendChild(h)}r.setStart(t.firstChild,e<t.inputmask._valueGet().length?e:t.inputmask._valueGet().length),r.setEnd(t.firstChild,i<t.inputmask._valueGet().length?i:t.inputmask._valueGet().length),r.collapse(!0);var u=window.getSelection();u.removeAllRanges(),u.addRange(r)}else t.createTextRange&&((r=t.createTextRange()).collapse(!0),r.moveEnd("character",i),r.moveStart("character",e),r.select())}},e.determineLastRequiredPosition=function(t){var e,i,r=this,o=this.maskset,l=this.dependencyLib,c=n.getMaskTemplate.call(r,!0,s.call(r),!0,!0),h=c.length,u=s.call(r),d={},f=o.validPositions[u],g=void 0!==f?f.locator.slice():void 0;for(e=u+1;e<c.length;e++)g=(i=n.getTestTemplate.call(r,e,g,e-1)).locator.slice(),d[e]=l.extend(!0,{},i);var p=f&&void 0!==f.alternation?f.locator[f.alternation]:void 0;for(e=h-1;e>u&&((i=d[e]).match.optionality||i.match.optionalQuantifier&&i.match.newBlockMarker||p&&(p!==d[e].locator[f.alternation]&&1!=i.match.static||!0===i.match.static&&i.locator[f.alternation]&&a.checkAlternationMatch.call(r,i.locator[f.alternation].toString().split(","),p.toString().split(","))&&""!==n.getTests.call(r,e)[0].def))&&c[e]===n.getPlaceholder.call(r,e,i.match);e--)h--;return t?{l:h,def:d[h]?d[h].match:void 0}:h},e.determineNewCaretPosition=function(t,e,i){var a=this,c=this.maskset,h=this.opts;if(e&&(a.isRTL?t.end=t.begin:t.begin=t.end),t.begin===t.end){switch(i=i||h.positionCaretOnClick){case"none":break;case"select":t={begin:0,end:r.call(a).length};break;case"ignore":t.end=t.begin=l.call(a,s.call(a));break;case"radixFocus":if(function(t){if(""!==h.radixPoint&&0!==h.digits){var e=c.validPositions;if(void 0===e[t]||e[t].input===n.getPlaceholder.call(a,t)){if(t<l.call(a,-1))return!0;var i=r.call(a).indexOf(h.radixPoint);if(-1!==i){for(var s in e)if(e[s]&&i<s&&e[s].input!==n.getPlaceholder.call(a,s))return!1;return!0}}}return!1}(t.begin)){var u=r.call(a).join("").indexOf(h.radixPoint);t.end=t.begin=h.numericInput?l.call(a,u):u;break}default:var d=t.begin,f=s.call(a,d,!0),g=l.call(a,-1!==f||o.call(a,0)?f:-1);if(d<=g)t.end=t.begin=o.call(a,d,!1,!0)?d:l.call(a,d);else{var p=c.validPositions[f],m=n.getTestTemplate.call(a,g,p?p.match.locator:void 0,p),v=n.getPlaceholder.call(a,g,m.match);if(""!==v&&r.call(a)[g]!==v&&!0!==m.match.optionalQuantifier&&!0!==m.match.newBlockMarker||!o.call(a,g,h.keepStatic,!0)&&m.match.def===v){var x=l.call(a,g);(d>=x||d===g)&&(g=x)}t.end=t.begin=g}}return t}},e.getBuffer=r,e.getBufferTemplate=function(){var t=this.maskset;return void 0===t._buffer&&(t._buffer=n.getMaskTemplate.call(this,!1,1),void 0===t.buffer&&(t.buffer=t._buffer.slice())),t._buffer},e.getLastValidPosition=s,e.isMask=o,e.resetMaskSet=function(t){var e=this.maskset;e.buffer=void 0,!0!==t&&(e.validPositions={},e.p=0)},e.seekNext=l,e.seekPrevious=function(t,e){var i=this,a=t-1;if(t<=0)return 0;for(;a>0&&(!0===e&&(!0!==n.getTest.call(i,a).match.newBlockMarker||!o.call(i,a,void 0,!0))||!0!==e&&!o.call(i,a,void 0,!0));)a--;return a},e.translatePosition=c;var n=i(4713),a=i(7215);function r(t){var e=this.maskset;return void 0!==e.buffer&&!0!==t||(e.buffer=n.getMaskTemplate.call(this,!0,s.call(this),!0),void 0===e._buffer&&(e._buffer=e.buffer.slice())),e.buffer}function s(t,e,i){var n=this.maskset,a=-1,r=-1,s=i||n.validPositions;for(var o in void 0===t&&(t=-1),s){var l=parseInt(o);s[l]&&(e||!0!==s[l].generatedInput)&&(l<=t&&(a=l),l>=t&&(r=l))}return-1===a||a==t?r:-1==r||t-a<r-t?a:r}function o(t,e,i){var a=this,r=this.maskset,s=n.getTestTemplate.call(a,t).match;if(""===s.def&&(s=n.getTest.call(a,t).match),!0!==s.static)return s.fn;if(!0===i&&void 0!==r.validPositions[t]&&!0!==r.validPositions[t].generatedInput)return!0;if(!0!==e&&t>-1){if(i){var o=n.getTests.call(a,t);return o.length>1+(""===o[o.length-1].match.def?1:0)}var l=n.determineTestTemplate.call(a,t,n.getTests.call(a,t)),c=n.getPlaceholder.call(a,t,l.match);return l.match.def!==c}return!1}function l(t,e,i){var a=this;void 0===i&&(i=!0);for(var r=t+1;""!==n.getTest.call(a,r).match.def&&(!0===e&&(!0!==n.getTest.call(a,r).match.newBlockMarker||!o.call(a,r,void 0,!0))||!0!==e&&!o.call(a,r,void 0,i));)r++;return r}function c(t){var e=this.opts,i=this.el;return!this.isRTL||"number"!=typeof t||e.greedy&&""===e.placeholder||!i||(t=Math.abs(this._valueGet().length-t)),t}},4713:function(t,e,i){Object.defineProperty(e,"__esModule",{value:!0}),e.determineTestTemplate=c,e.getDecisionTaker=s,e.getMaskTemplate=function(t,e,i,n,a){var r=this,s=this.opts,h=this.maskset,u=s.greedy;a&&s.greedy&&(s.greedy=!1,r.maskset.tests={}),e=e||0;var f,g,p,m,v=[],x=0;do{if(!0===t&&h.validPositions[x])g=(p=a&&h.validPositions[x].match.optionality&&void 0===h.validPositions[x+1]&&(!0===h.validPositions[x].generatedInput||h.validPositions[x].input==s.skipOptionalPartCharacter&&x>0)?c.call(r,x,d.call(r,x,f,x-1)):h.validPositions[x]).match,f=p.locator.slice(),v.push(!0===i?p.input:!1===i?g.nativeDef:o.call(r,x,g));else{g=(p=l.call(r,x,f,x-1)).match,f=p.locator.slice();var b=!0!==n&&(!1!==s.jitMasking?s.jitMasking:g.jit);(m=(m&&g.static&&g.def!==s.groupSeparator&&null===g.fn||h.validPositions[x-1]&&g.static&&g.def!==s.groupSeparator&&null===g.fn)&&h.tests[x]&&1===h.tests[x].length)||!1===b||void 0===b||"number"==typeof b&&isFinite(b)&&b>x?v.push(!1===i?g.nativeDef:o.call(r,x,g)):m=!1}x++}while(!0!==g.static||""!==g.def||e>x);return""===v[v.length-1]&&v.pop(),!1===i&&void 0!==h.maskLength||(h.maskLength=x-1),s.greedy=u,v},e.getPlaceholder=o,e.getTest=h,e.getTestTemplate=l,e.getTests=d,e.isSubsetOf=u;var n,a=(n=i(2394))&&n.__esModule?n:{default:n};function r(t,e){var i=(null!=t.alternation?t.mloc[s(t)]:t.locator).join("");if(""!==i)for(;i.length<e;)i+="0";return i}function s(t){var e=t.locator[t.alternation];return"string"==typeof e&&e.length>0&&(e=e.split(",")[0]),void 0!==e?e.toString():""}function o(t,e,i){var n=this.opts,a=this.maskset;if(void 0!==(e=e||h.call(this,t).match).placeholder||!0===i)return"function"==typeof e.placeholder?e.placeholder(n):e.placeholder;if(!0===e.static){if(t>-1&&void 0===a.validPositions[t]){var r,s=d.call(this,t),o=[];if(s.length>1+(""===s[s.length-1].match.def?1:0))for(var l=0;l<s.length;l++)if(""!==s[l].match.def&&!0!==s[l].match.optionality&&!0!==s[l].match.optionalQuantifier&&(!0===s[l].match.static||void 0===r||!1!==s[l].match.fn.test(r.match.def,a,t,!0,n))&&(o.push(s[l]),!0===s[l].match.static&&(r=s[l]),o.length>1&&/[0-9a-bA-Z]/.test(o[0].match.def)))return n.placeholder.charAt(t%n.placeholder.length)}return e.def}return n.placeholder.charAt(t%n.placeholder.length)}function l(t,e,i){return this.maskset.validPositions[t]||c.call(this,t,d.call(this,t,e?e.slice():e,i))}function c(t,e){var i=this.opts,n=function(t,e){var i=0,n=!1;return e.forEach((function(t){t.match.optionality&&(0!==i&&i!==t.match.optionality&&(n=!0),(0===i||i>t.match.optionality)&&(i=t.match.optionality))})),i&&(0==t||1==e.length?i=0:n||(i=0)),i}(t,e);t=t>0?t-1:0;var a,s,o,l=r(h.call(this,t));i.greedy&&e.length>1&&""===e[e.length-1].match.def&&e.pop();for(var c=0;c<e.length;c++){var u=e[c];a=r(u,l.length);var d=Math.abs(a-l);(void 0===s||""!==a&&d<s||o&&!i.greedy&&o.match.optionality&&o.match.optionality-n>0&&"master"===o.match.newBlockMarker&&(!u.match.optionality||u.match.optionality-n<1||!u.match.newBlockMarker)||o&&!i.greedy&&o.match.optionalQuantifier&&!u.match.optionalQuantifier)&&(s=d,o=u)}return o}function h(t,e){var i=this.maskset;return i.validPositions[t]?i.validPositions[t]:(e||d.call(this,t))[0]}function u(t,e,i){function n(t){for(var e,i=[],n=-1,a=0,r=t.length;a<r;a++)if("-"===t.charAt(a))for(e=t.charCodeAt(a+1);++n<e;)i.push(String.fromCharCode(n));else n=t.charCodeAt(a),i.push(t.charAt(a));return i.join("")}return t.match.def===e.match.nativeDef||!(!(i.regex||t.match.fn instanceof RegExp&&e.match.fn instanceof RegExp)||!0===t.match.static||!0===e.match.static)&&-1!==n(e.match.fn.toString().replace(/[[\]/]/g,"")).indexOf(n(t.match.fn.toString().replace(/[[\]/]/g,"")))}function d(t,e,i){var n,r,s=this,o=this.dependencyLib,l=this.maskset,h=this.opts,d=this.el,f=l.maskToken,g=e?i:0,p=e?e.slice():[0],m=[],v=!1,x=e?e.join(""):"";function b(e,i,r,s){function o(r,s,c){function f(t,e){var i=0===e.matches.indexOf(t);return i||e.matches.every((function(n,a){return!0===n.isQuantifier?i=f(t,e.matches[a-1]):Object.prototype.hasOwnProperty.call(n,"matches")&&(i=f(t,n)),!i})),i}function p(t,e,i){var n,a;if((l.tests[t]||l.validPositions[t])&&(l.tests[t]||[l.validPositions[t]]).every((function(t,r){if(t.mloc[e])return n=t,!1;var s=void 0!==i?i:t.alternation,o=void 0!==t.locator[s]?t.locator[s].toString().indexOf(e):-1;return(void 0===a||o<a)&&-1!==o&&(n=t,a=o),!0})),n){var r=n.locator[n.alternation];return(n.mloc[e]||n.mloc[r]||n.locator).slice((void 0!==i?i:n.alternation)+1)}return void 0!==i?p(t,e):void 0}function y(t,e){var i=t.alternation,n=void 0===e||i===e.alternation&&-1===t.locator[i].toString().indexOf(e.locator[i]);if(!n&&i>e.alternation)for(var a=e.alternation;a<i;a++)if(t.locator[a]!==e.locator[a]){i=a,n=!0;break}if(n){t.mloc=t.mloc||{};var r=t.locator[i];if(void 0!==r){if("string"==typeof r&&(r=r.split(",")[0]),void 0===t.mloc[r]&&(t.mloc[r]=t.locator.slice()),void 0!==e){for(var s in e.mloc)"string"==typeof s&&(s=s.split(",")[0]),void 0===t.mloc[s]&&(t.mloc[s]=e.mloc[s]);t.locator[i]=Object.keys(t.mloc).join(",")}return!0}t.alternation=void 0}return!1}function w(t,e){if(t.locator.length!==e.locator.length)return!1;for(var i=t.alternation+1;i<t.locator.length;i++)if(t.locator[i]!==e.locator[i])return!1;return!0}if(g>t+h._maxTestPos)throw"Inputmask: There is probably an error in your mask definition or in the code. Create an issue on github with an example of the mask you are using. "+l.mask;if(g===t&&void 0===r.matches){if(m.push({match:r,locator:s.reverse(),cd:x,mloc:{}}),!r.optionality||void 0!==c||!(h.definitions&&h.definitions[r.nativeDef]&&h.definitions[r.nativeDef].optional||a.default.prototype.definitions[r.nativeDef]&&a.default.prototype.definitions[r.nativeDef].optional))return!0;v=!0,g=t}else if(void 0!==r.matches){if(r.isGroup&&c!==r){if(r=o(e.matches[e.matches.indexOf(r)+1],s,c))return!0}else if(r.isOptional){var k=r,A=m.length;if(r=b(r,i,s,c)){if(m.forEach((function(t,e){e>=A&&(t.match.optionality=t.match.optionality?t.match.optionality+1:1)})),n=m[m.length-1].match,void 0!==c||!f(n,k))return!0;v=!0,g=t}}else if(r.isAlternator){var S,_=r,C=[],E=m.slice(),T=s.length,P=!1,M=i.length>0?i.shift():-1;if(-1===M||"string"==typeof M){var L,D=g,I=i.slice(),O=[];if("string"==typeof M)O=M.split(",");else for(L=0;L<_.matches.length;L++)O.push(L.toString());if(void 0!==l.excludes[t]){for(var N=O.slice(),F=0,R=l.excludes[t].length;F<R;F++){var z=l.excludes[t][F].toString().split(":");s.length==z[1]&&O.splice(O.indexOf(z[0]),1)}0===O.length&&(delete l.excludes[t],O=N)}(!0===h.keepStatic||isFinite(parseInt(h.keepStatic))&&D>=h.keepStatic)&&(O=O.slice(0,1));for(var H=0;H<O.length;H++){L=parseInt(O[H]),m=[],i="string"==typeof M&&p(g,L,T)||I.slice();var Y=_.matches[L];if(Y&&o(Y,[L].concat(s),c))r=!0;else if(0===H&&(P=!0),Y&&Y.matches&&Y.matches.length>_.matches[0].matches.length)break;S=m.slice(),g=D,m=[];for(var X=0;X<S.length;X++){var B=S[X],j=!1;B.match.jit=B.match.jit||P,B.alternation=B.alternation||T,y(B);for(var W=0;W<C.length;W++){var V=C[W];if("string"!=typeof M||void 0!==B.alternation&&O.includes(B.locator[B.alternation].toString())){if(B.match.nativeDef===V.match.nativeDef){j=!0,y(V,B);break}if(u(B,V,h)){y(B,V)&&(j=!0,C.splice(C.indexOf(V),0,B));break}if(u(V,B,h)){y(V,B);break}if(Z=V,!0===($=B).match.static&&!0!==Z.match.static&&Z.match.fn.test($.match.def,l,t,!1,h,!1)){w(B,V)||void 0!==d.inputmask.userOptions.keepStatic?y(B,V)&&(j=!0,C.splice(C.indexOf(V),0,B)):h.keepStatic=!0;break}}}j||C.push(B)}}m=E.concat(C),g=t,v=m.length>0,r=C.length>0,i=I.slice()}else r=o(_.matches[M]||e.matches[M],[M].concat(s),c);if(r)return!0}else if(r.isQuantifier&&c!==e.matches[e.matches.indexOf(r)-1])for(var G=r,U=i.length>0?i.shift():0;U<(isNaN(G.quantifier.max)?U+1:G.quantifier.max)&&g<=t;U++){var q=e.matches[e.matches.indexOf(G)-1];if(r=o(q,[U].concat(s),q)){if((n=m[m.length-1].match).optionalQuantifier=U>=G.quantifier.min,n.jit=(U+1)*(q.matches.indexOf(n)+1)>G.quantifier.jit,n.optionalQuantifier&&f(n,q)){v=!0,g=t;break}return n.jit&&(l.jitOffset[t]=q.matches.length-q.matches.indexOf(n)),!0}}else if(r=b(r,i,s,c))return!0}else g++;var $,Z}for(var c=i.length>0?i.shift():0;c<e.matches.length;c++)if(!0!==e.matches[c].isQuantifier){var f=o(e.matches[c],[c].concat(r),s);if(f&&g===t)return f;if(g>t)break}}if(t>-1){if(void 0===e){for(var y,w=t-1;void 0===(y=l.validPositions[w]||l.tests[w])&&w>-1;)w--;void 0!==y&&w>-1&&(p=function(t,e){var i,n=[];return Array.isArray(e)||(e=[e]),e.length>0&&(void 0===e[0].alternation||!0===h.keepStatic?0===(n=c.call(s,t,e.slice()).locator.slice()).length&&(n=e[0].locator.slice()):e.forEach((function(t){""!==t.def&&(0===n.length?(i=t.alternation,n=t.locator.slice()):t.locator[i]&&-1===n[i].toString().indexOf(t.locator[i])&&(n[i]+=","+t.locator[i]))}))),n}(w,y),x=p.join(""),g=w)}if(l.tests[t]&&l.tests[t][0].cd===x)return l.tests[t];for(var k=p.shift();k<f.length&&!(b(f[k],p,[k])&&g===t||g>t);k++);}return(0===m.length||v)&&m.push({match:{fn:null,static:!0,optionality:!1,casing:null,def:"",placeholder:""},locator:[],mloc:{},cd:x}),void 0!==e&&l.tests[t]?r=o.extend(!0,[],m):(l.tests[t]=o.extend(!0,[],m),r=l.tests[t]),m.forEach((function(t){t.match.optionality=!1})),r}},7215:function(t,e,i){Object.defineProperty(e,"__esModule",{value:!0}),e.alternate=l,e.checkAlternationMatch=function(t,e,i){for(var n,a=this.opts.greedy?e:e.slice(0,1),r=!1,s=void 0!==i?i.split(","):[],o=0;o<s.length;o++)-1!==(n=t.indexOf(s[o]))&&t.splice(n,1);for(var l=0;l<t.length;l++)if(a.includes(t[l])){r=!0;break}return r},e.handleRemove=function(t,e,i,n,o){var c=this,h=this.maskset,u=this.opts;if((u.numericInput||c.isRTL)&&(e===r.default.BACKSPACE?e=r.default.DELETE:e===r.default.DELETE&&(e=r.default.BACKSPACE),c.isRTL)){var d=i.end;i.end=i.begin,i.begin=d}var f,g=s.getLastValidPosition.call(c,void 0,!0);if(i.end>=s.getBuffer.call(c).length&&g>=i.end&&(i.end=g+1),e===r.default.BACKSPACE?i.end-i.begin<1&&(i.begin=s.seekPrevious.call(c,i.begin)):e===r.default.DELETE&&i.begin===i.end&&(i.end=s.isMask.call(c,i.end,!0,!0)?i.end+1:s.seekNext.call(c,i.end)+1),!1!==(f=m.call(c,i))){if(!0!==n&&!1!==u.keepStatic||null!==u.regex&&-1!==a.getTest.call(c,i.begin).match.def.indexOf("|")){var p=l.call(c,!0);if(p){var v=void 0!==p.caret?p.caret:p.pos?s.seekNext.call(c,p.pos.begin?p.pos.begin:p.pos):s.getLastValidPosition.call(c,-1,!0);(e!==r.default.DELETE||i.begin>v)&&i.begin}}!0!==n&&(h.p=e===r.default.DELETE?i.begin+f:i.begin,h.p=s.determineNewCaretPosition.call(c,{begin:h.p,end:h.p},!1,!1===u.insertMode&&e===r.default.BACKSPACE?"none":void 0).begin)}},e.isComplete=h,e.isSelection=u,e.isValid=d,e.refreshFromBuffer=g,e.revalidateMask=m;var n,a=i(4713),r=(n=i(5581))&&n.__esModule?n:{default:n},s=i(8711),o=i(6030);function l(t,e,i,n,r,o){var c,h,u,f,g,p,m,v,x,b,y,w=this,k=this.dependencyLib,A=this.opts,S=w.maskset,_=k.extend(!0,{},S.validPositions),C=k.extend(!0,{},S.tests),E=!1,T=!1,P=void 0!==r?r:s.getLastValidPosition.call(w);if(o&&(b=o.begin,y=o.end,o.begin>o.end&&(b=o.end,y=o.begin)),-1===P&&void 0===r)c=0,h=(f=a.getTest.call(w,c)).alternation;else for(;P>=0;P--)if((u=S.validPositions[P])&&void 0!==u.alternation){if(f&&f.locator[u.alternation]!==u.locator[u.alternation])break;c=P,h=S.validPositions[c].alternation,f=u}if(void 0!==h){m=parseInt(c),S.excludes[m]=S.excludes[m]||[],!0!==t&&S.excludes[m].push((0,a.getDecisionTaker)(f)+":"+f.alternation);var M=[],L=-1;for(g=m;g<s.getLastValidPosition.call(w,void 0,!0)+1;g++)-1===L&&t<=g&&void 0!==e&&(M.push(e),L=M.length-1),(p=S.validPositions[g])&&!0!==p.generatedInput&&(void 0===o||g<b||g>=y)&&M.push(p.input),delete S.validPositions[g];for(-1===L&&void 0!==e&&(M.push(e),L=M.length-1);void 0!==S.excludes[m]&&S.excludes[m].length<10;){for(S.tests={},s.resetMaskSet.call(w,!0),E=!0,g=0;g<M.length&&(v=E.caret||s.getLastValidPosition.call(w,void 0,!0)+1,x=M[g],E=d.call(w,v,x,!1,n,!0));g++)g===L&&(T=E),1==t&&E&&(T={caretPos:g});if(E)break;if(s.resetMaskSet.call(w),f=a.getTest.call(w,m),S.validPositions=k.extend(!0,{},_),S.tests=k.extend(!0,{},C),!S.excludes[m]){T=l.call(w,t,e,i,n,m-1,o);break}var D=(0,a.getDecisionTaker)(f);if(-1!==S.excludes[m].indexOf(D+":"+f.alternation)){T=l.call(w,t,e,i,n,m-1,o);break}for(S.excludes[m].push(D+":"+f.alternation),g=m;g<s.getLastValidPosition.call(w,void 0,!0)+1;g++)delete S.validPositions[g]}}return T&&!1===A.keepStatic||delete S.excludes[m],T}function c(t,e,i){var n=this.opts,a=this.maskset;switch(n.casing||e.casing){case"upper":t=t.toUpperCase();break;case"lower":t=t.toLowerCase();break;case"title":var s=a.validPositions[i-1];t=0===i||s&&s.input===String.fromCharCode(r.default.SPACE)?t.toUpperCase():t.toLowerCase();break;default:if("function"==typeof n.casing){var o=Array.prototype.slice.call(arguments);o.push(a.validPositions),t=n.casing.apply(this,o)}}return t}function h(t){var e=this,i=this.opts,n=this.maskset;if("function"==typeof i.isComplete)return i.isComplete(t,i);if("*"!==i.repeat){var r=!1,o=s.determineLastRequiredPosition.call(e,!0),l=s.seekPrevious.call(e,o.l);if(void 0===o.def||o.def.newBlockMarker||o.def.optionality||o.def.optionalQuantifier){r=!0;for(var c=0;c<=l;c++){var h=a.getTestTemplate.call(e,c).match;if(!0!==h.static&&void 0===n.validPositions[c]&&!0!==h.optionality&&!0!==h.optionalQuantifier||!0===h.static&&t[c]!==a.getPlaceholder.call(e,c,h)){r=!1;break}}}return r}}function u(t){var e=this.opts.insertMode?0:1;return this.isRTL?t.begin-t.end>e:t.end-t.begin>e}function d(t,e,i,n,r,o,f){var v=this,x=this.dependencyLib,b=this.opts,y=v.maskset;i=!0===i;var w=t;function k(t){if(void 0!==t){if(void 0!==t.remove&&(Array.isArray(t.remove)||(t.remove=[t.remove]),t.remove.sort((function(t,e){return e.pos-t.pos})).forEach((function(t){m.call(v,{begin:t,end:t+1})})),t.remove=void 0),void 0!==t.insert&&(Array.isArray(t.insert)||(t.insert=[t.insert]),t.insert.sort((function(t,e){return t.pos-e.pos})).forEach((function(t){""!==t.c&&d.call(v,t.pos,t.c,void 0===t.strict||t.strict,void 0!==t.fromIsValid?t.fromIsValid:n)})),t.insert=void 0),t.refreshFromBuffer&&t.buffer){var e=t.refreshFromBuffer;g.call(v,!0===e?e:e.start,e.end,t.buffer),t.refreshFromBuffer=void 0}void 0!==t.rewritePosition&&(w=t.rewritePosition,t=!0)}return t}function A(e,i,r){var o=!1;return a.getTests.call(v,e).every((function(l,h){var d=l.match;if(s.getBuffer.call(v,!0),!1!==(o=(!d.jit||void 0!==y.validPositions[s.seekPrevious.call(v,e)])&&(null!=d.fn?d.fn.test(i,y,e,r,b,u.call(v,t)):(i===d.def||i===b.skipOptionalPartCharacter)&&""!==d.def&&{c:a.getPlaceholder.call(v,e,d,!0)||d.def,pos:e}))){var f=void 0!==o.c?o.c:i,g=e;return f=f===b.skipOptionalPartCharacter&&!0===d.static?a.getPlaceholder.call(v,e,d,!0)||d.def:f,!0!==(o=k(o))&&void 0!==o.pos&&o.pos!==e&&(g=o.pos),!0!==o&&void 0===o.pos&&void 0===o.c||!1===m.call(v,t,x.extend({},l,{input:c.call(v,f,d,g)}),n,g)&&(o=!1),!1}return!0})),o}void 0!==t.begin&&(w=v.isRTL?t.end:t.begin);var S=!0,_=x.extend(!0,{},y.validPositions);if(!1===b.keepStatic&&void 0!==y.excludes[w]&&!0!==r&&!0!==n)for(var C=w;C<(v.isRTL?t.begin:t.end);C++)void 0!==y.excludes[C]&&(y.excludes[C]=void 0,delete y.tests[C]);if("function"==typeof b.preValidation&&!0!==n&&!0!==o&&(S=k(S=b.preValidation.call(v,s.getBuffer.call(v),w,e,u.call(v,t),b,y,t,i||r))),!0===S){if(S=A(w,e,i),(!i||!0===n)&&!1===S&&!0!==o){var E=y.validPositions[w];if(!E||!0!==E.match.static||E.match.def!==e&&e!==b.skipOptionalPartCharacter){if(b.insertMode||void 0===y.validPositions[s.seekNext.call(v,w)]||t.end>w){var T=!1;if(y.jitOffset[w]&&void 0===y.validPositions[s.seekNext.call(v,w)]&&!1!==(S=d.call(v,w+y.jitOffset[w],e,!0,!0))&&(!0!==r&&(S.caret=w),T=!0),t.end>w&&(y.validPositions[w]=void 0),!T&&!s.isMask.call(v,w,b.keepStatic&&0===w))for(var P=w+1,M=s.seekNext.call(v,w,!1,0!==w);P<=M;P++)if(!1!==(S=A(P,e,i))){S=p.call(v,w,void 0!==S.pos?S.pos:P)||S,w=P;break}}}else S={caret:s.seekNext.call(v,w)}}!1!==S||!b.keepStatic||!h.call(v,s.getBuffer.call(v))&&0!==w||i||!0===r?u.call(v,t)&&y.tests[w]&&y.tests[w].length>1&&b.keepStatic&&!i&&!0!==r&&(S=l.call(v,!0)):S=l.call(v,w,e,i,n,void 0,t),!0===S&&(S={pos:w})}if("function"==typeof b.postValidation&&!0!==n&&!0!==o){var L=b.postValidation.call(v,s.getBuffer.call(v,!0),void 0!==t.begin?v.isRTL?t.end:t.begin:t,e,S,b,y,i,f);void 0!==L&&(S=!0===L?S:L)}S&&void 0===S.pos&&(S.pos=w),!1===S||!0===o?(s.resetMaskSet.call(v,!0),y.validPositions=x.extend(!0,{},_)):p.call(v,void 0,w,!0);var D=k(S);return void 0!==v.maxLength&&s.getBuffer.call(v).length>v.maxLength&&!n&&(s.resetMaskSet.call(v,!0),y.validPositions=x.extend(!0,{},_),D=!1),D}function f(t,e,i){for(var n=this.maskset,r=!1,s=a.getTests.call(this,t),o=0;o<s.length;o++){if(s[o].match&&(s[o].match.nativeDef===e.match[i.shiftPositions?"def":"nativeDef"]&&(!i.shiftPositions||!e.match.static)||s[o].match.nativeDef===e.match.nativeDef||i.regex&&!s[o].match.static&&s[o].match.fn.test(e.input))){r=!0;break}if(s[o].match&&s[o].match.def===e.match.nativeDef){r=void 0;break}}return!1===r&&void 0!==n.jitOffset[t]&&(r=f.call(this,t+n.jitOffset[t],e,i)),r}function g(t,e,i){var n,a,r=this,l=this.maskset,c=this.opts,h=this.dependencyLib,u=c.skipOptionalPartCharacter,d=r.isRTL?i.slice().reverse():i;if(c.skipOptionalPartCharacter="",!0===t)s.resetMaskSet.call(r),l.tests={},t=0,e=i.length,a=s.determineNewCaretPosition.call(r,{begin:0,end:0},!1).begin;else{for(n=t;n<e;n++)delete l.validPositions[n];a=t}var f=new h.Event("keypress");for(n=t;n<e;n++){f.keyCode=d[n].toString().charCodeAt(0),r.ignorable=!1;var g=o.EventHandlers.keypressEvent.call(r,f,!0,!1,!1,a);!1!==g&&void 0!==g&&(a=g.forwardPosition)}c.skipOptionalPartCharacter=u}function p(t,e,i){var n=this,r=this.maskset,o=this.dependencyLib;if(void 0===t)for(t=e-1;t>0&&!r.validPositions[t];t--);for(var l=t;l<e;l++)if(void 0===r.validPositions[l]&&!s.isMask.call(n,l,!1)&&(0==l?a.getTest.call(n,l):r.validPositions[l-1])){var c=a.getTests.call(n,l).slice();""===c[c.length-1].match.def&&c.pop();var h,u=a.determineTestTemplate.call(n,l,c);if(u&&(!0!==u.match.jit||"master"===u.match.newBlockMarker&&(h=r.validPositions[l+1])&&!0===h.match.optionalQuantifier)&&((u=o.extend({},u,{input:a.getPlaceholder.call(n,l,u.match,!0)||u.match.def})).generatedInput=!0,m.call(n,l,u,!0),!0!==i)){var f=r.validPositions[e].input;return r.validPositions[e]=void 0,d.call(n,e,f,!0,!0)}}}function m(t,e,i,n){var r=this,o=this.maskset,l=this.opts,c=this.dependencyLib;function h(t,e,i){var n=e[t];if(void 0!==n&&!0===n.match.static&&!0!==n.match.optionality&&(void 0===e[0]||void 0===e[0].alternation)){var a=i.begin<=t-1?e[t-1]&&!0===e[t-1].match.static&&e[t-1]:e[t-1],r=i.end>t+1?e[t+1]&&!0===e[t+1].match.static&&e[t+1]:e[t+1];return a&&r}return!1}var u=0,g=void 0!==t.begin?t.begin:t,p=void 0!==t.end?t.end:t,m=!0;if(t.begin>t.end&&(g=t.end,p=t.begin),n=void 0!==n?n:g,g!==p||l.insertMode&&void 0!==o.validPositions[n]&&void 0===i||void 0===e||e.match.optionalQuantifier||e.match.optionality){var v,x=c.extend(!0,{},o.validPositions),b=s.getLastValidPosition.call(r,void 0,!0);for(o.p=g,v=b;v>=g;v--)delete o.validPositions[v],void 0===e&&delete o.tests[v+1];var y,w,k=n,A=k;for(e&&(o.validPositions[n]=c.extend(!0,{},e),A++,k++),v=e?p:p-1;v<=b;v++){if(void 0!==(y=x[v])&&!0!==y.generatedInput&&(v>=p||v>=g&&h(v,x,{begin:g,end:p}))){for(;""!==a.getTest.call(r,A).match.def;){if(!1!==(w=f.call(r,A,y,l))||"+"===y.match.def){"+"===y.match.def&&s.getBuffer.call(r,!0);var S=d.call(r,A,y.input,"+"!==y.match.def,!0);if(m=!1!==S,k=(S.pos||A)+1,!m&&w)break}else m=!1;if(m){void 0===e&&y.match.static&&v===t.begin&&u++;break}if(!m&&s.getBuffer.call(r),A>o.maskLength)break;A++}""==a.getTest.call(r,A).match.def&&(m=!1),A=k}if(!m)break}if(!m)return o.validPositions=c.extend(!0,{},x),s.resetMaskSet.call(r,!0),!1}else e&&a.getTest.call(r,n).match.cd===e.match.cd&&(o.validPositions[n]=c.extend(!0,{},e));return s.resetMaskSet.call(r,!0),u}},5581:function(t){t.exports=JSON.parse('{"BACKSPACE":8,"BACKSPACE_SAFARI":127,"DELETE":46,"DOWN":40,"END":35,"ENTER":13,"ESCAPE":27,"HOME":36,"INSERT":45,"LEFT":37,"PAGE_DOWN":34,"PAGE_UP":33,"RIGHT":39,"SPACE":32,"TAB":9,"UP":38,"X":88,"Z":90,"CONTROL":17,"PAUSE/BREAK":19,"WINDOWS_LEFT":91,"WINDOWS_RIGHT":92,"KEY_229":229}')}},e={};function i(n){var a=e[n];if(void 0!==a)return a.exports;var r=e[n]={exports:{}};return t[n](r,r.exports,i),r.exports}var n={};return function(){var t,e=n;Object.defineProperty(e,"__esModule",{value:!0}),e.default=void 0,i(3851),i(219),i(207),i(5296);var a=((t=i(2394))&&t.__esModule?t:{default:t}).default;e.default=a}(),n}()},486:function(t,e,i){var n;t=i.nmd(t),function(){var a,r="Expected a function",s="__lodash_hash_undefined__",o="__lodash_placeholder__",l=32,c=128,h=1/0,u=9007199254740991,d=NaN,f=4294967295,g=[["ary",c],["bind",1],["bindKey",2],["curry",8],["curryRight",16],["flip",512],["partial",l],["partialRight",64],["rearg",256]],p="[object Arguments]",m="[object Array]",v="[object Boolean]",x="[object Date]",b="[object Error]",y="[object Function]",w="[object GeneratorFunction]",k="[object Map]",A="[object Number]",S="[object Object]",_="[object Promise]",C="[object RegExp]",E="[object Set]",T="[object String]",P="[object Symbol]",M="[object WeakMap]",L="[object ArrayBuffer]",D="[object DataView]",I="[object Float32Array]",O="[object Float64Array]",N="[object Int8Array]",F="[object Int16Array]",R="[object Int32Array]",z="[object Uint8Array]",H="[object Uint8ClampedArray]",Y="[object Uint16Array]",X="[object Uint32Array]",B=/\b__p \+= '';/g,j=/\b(__p \+=) '' \+/g,W=/(__e\(.*?\)|\b__t\)) \+\n'';/g,V=/&(?:amp|lt|gt|quot|#39);/g,G=/[&<>"']/g,U=RegExp(V.source),q=RegExp(G.source),$=/<%-([\s\S]+?)%>/g,Z=/<%([\s\S]+?)%>/g,K=/<%=([\s\S]+?)%>/g,Q=/\.|\[(?:[^[\]]*|(["'])(?:(?!\1)[^\\]|\\.)*?\1)\]/,J=/^\w*$/,tt=/[^.[\]]+|\[(?:(-?\d+(?:\.\d+)?)|(["'])((?:(?!\2)[^\\]|\\.)*?)\2)\]|(?=(?:\.|\[\])(?:\.|\[\]|$))/g,et=/[\\^$.*+?()[\]{}|]/g,it=RegExp(et.source),nt=/^\s+/,at=/\s/,rt=/\{(?:\n\/\* \[wrapped with .+\] \*\/)?\n?/,st=/\{\n\/\* \[wrapped with (.+)\] \*/,ot=/,? & /,lt=/[^\x00-\x2f\x3a-\x40\x5b-\x60\x7b-\x7f]+/g,ct=/[()=,{}\[\]\/\s]/,ht=/\\(\\)?/g,ut=/\$\{([^\\}]*(?:\\.[^\\}]*)*)\}/g,dt=/\w*$/,ft=/^[-+]0x[0-9a-f]+$/i,gt=/^0b[01]+$/i,pt=/^\[object .+?Constructor\]$/,mt=/^0o[0-7]+$/i,vt=/^(?:0|[1-9]\d*)$/,xt=/[\xc0-\xd6\xd8-\xf6\xf8-\xff\u0100-\u017f]/g,bt=/($^)/,yt=/['\n\r\u2028\u2029\\]/g,wt="\\u0300-\\u036f\\ufe20-\\ufe2f\\u20d0-\\u20ff",kt="a-z\\xdf-\\xf6\\xf8-\\xff",At="A-Z\\xc0-\\xd6\\xd8-\\xde",St="\\xac\\xb1\\xd7\\xf7\\x00-\\x2f\\x3a-\\x40\\x5b-\\x60\\x7b-\\xbf\\u2000-\\u206f \\t\\x0b\\f\\xa0\\ufeff\\n\\r\\u2028\\u2029\\u1680\\u180e\\u2000\\u2001\\u2002\\u2003\\u2004\\u2005\\u2006\\u2007\\u2008\\u2009\\u200a\\u202f\\u205f\\u3000",_t="["+St+"]",Ct="["+wt+"]",Et="\\d+",Tt="["+kt+"]",Pt="[^\\ud800-\\udfff"+St+Et+"\\u2700-\\u27bf"+kt+At+"]",Mt="\\ud83c[\\udffb-\\udfff]",Lt="[^\\ud800-\\udfff]",Dt="(?:\\ud83c[\\udde6-\\uddff]){2}",It="[\\ud800-\\udbff][\\udc00-\\udfff]",Ot="["+At+"]",Nt="(?:"+Tt+"|"+Pt+")",Ft="(?:"+Ot+"|"+Pt+")",Rt="(?:['’](?:d|ll|m|re|s|t|ve))?",zt="(?:['’](?:D|LL|M|RE|S|T|VE))?",Ht="(?:"+Ct+"|"+Mt+")?",Yt="[\\ufe0e\\ufe0f]?",Xt=Yt+Ht+"(?:\\u200d(?:"+[Lt,Dt,It].join("|")+")"+Yt+Ht+")*",Bt="(?:"+["[\\u2700-\\u27bf]",Dt,It].join("|")+")"+Xt,jt="(?:"+[Lt+Ct+"?",Ct,Dt,It,"[\\ud800-\\udfff]"].join("|")+")",Wt=RegExp("['’]","g"),Vt=RegExp(Ct,"g"),Gt=RegExp(Mt+"(?="+Mt+")|"+jt+Xt,"g"),Ut=RegExp([Ot+"?"+Tt+"+"+Rt+"(?="+[_t,Ot,"$"].join("|")+")",Ft+"+"+zt+"(?="+[_t,Ot+Nt,"$"].join("|")+")",Ot+"?"+Nt+"+"+Rt,Ot+"+"+zt,"\\d*(?:1ST|2ND|3RD|(?![123])\\dTH)(?=\\b|[a-z_])","\\d*(?:1st|2nd|3rd|(?![123])\\dth)(?=\\b|[A-Z_])",Et,Bt].join("|"),"g"),qt=RegExp("[\\u200d\\ud800-\\udfff"+wt+"\\ufe0e\\ufe0f]"),$t=/[a-z][A-Z]|[A-Z]{2}[a-z]|[0-9][a-zA-Z]|[a-zA-Z][0-9]|[^a-zA-Z0-9 ]/,Zt=["Array","Buffer","DataView","Date","Error","Float32Array","Float64Array","Function","Int8Array","Int16Array","Int32Array","Map","Math","Object","Promise","RegExp","Set","String","Symbol","TypeError","Uint8Array","Uint8ClampedArray","Uint16Array","Uint32Array","WeakMap","_","clearTimeout","isFinite","parseInt","setTimeout"],Kt=-1,Qt={};Qt[I]=Qt[O]=Qt[N]=Qt[F]=Qt[R]=Qt[z]=Qt[H]=Qt[Y]=Qt[X]=!0,Qt[p]=Qt[m]=Qt[L]=Qt[v]=Qt[D]=Qt[x]=Qt[b]=Qt[y]=Qt[k]=Qt[A]=Qt[S]=Qt[C]=Qt[E]=Qt[T]=Qt[M]=!1;var Jt={};Jt[p]=Jt[m]=Jt[L]=Jt[D]=Jt[v]=Jt[x]=Jt[I]=Jt[O]=Jt[N]=Jt[F]=Jt[R]=Jt[k]=Jt[A]=Jt[S]=Jt[C]=Jt[E]=Jt[T]=Jt[P]=Jt[z]=Jt[H]=Jt[Y]=Jt[X]=!0,Jt[b]=Jt[y]=Jt[M]=!1;var te={"\\":"\\","'":"'","\n":"n","\r":"r","\u2028":"u2028","\u2029":"u2029"},ee=parseFloat,ie=parseInt,ne="object"==typeof i.g&&i.g&&i.g.Object===Object&&i.g,ae="object"==typeof self&&self&&self.Object===Object&&self,re=ne||ae||Function("return this")(),se=e&&!e.nodeType&&e,oe=se&&t&&!t.nodeType&&t,le=oe&&oe.exports===se,ce=le&&ne.process,he=function(){try{return oe&&oe.require&&oe.require("util").types||ce&&ce.binding&&ce.binding("util")}catch(t){}}(),ue=he&&he.isArrayBuffer,de=he&&he.isDate,fe=he&&he.isMap,ge=he&&he.isRegExp,pe=he&&he.isSet,me=he&&he.isTypedArray;function ve(t,e,i){switch(i.length){case 0:return t.call(e);case 1:return t.call(e,i[0]);case 2:return t.call(e,i[0],i[1]);case 3:return t.call(e,i[0],i[1],i[2])}return t.apply(e,i)}function xe(t,e,i,n){for(var a=-1,r=null==t?0:t.length;++a<r;){var s=t[a];e(n,s,i(s),t)}return n}function be(t,e){for(var i=-1,n=null==t?0:t.length;++i<n&&!1!==e(t[i],i,t););return t}function ye(t,e){for(var i=null==t?0:t.length;i--&&!1!==e(t[i],i,t););return t}function we(t,e){for(var i=-1,n=null==t?0:t.length;++i<n;)if(!e(t[i],i,t))return!1;return!0}function ke(t,e){for(var i=-1,n=null==t?0:t.length,a=0,r=[];++i<n;){var s=t[i];e(s,i,t)&&(r[a++]=s)}return r}function Ae(t,e){return!(null==t||!t.length)&&Ie(t,e,0)>-1}function Se(t,e,i){for(var n=-1,a=null==t?0:t.length;++n<a;)if(i(e,t[n]))return!0;return!1}function _e(t,e){for(var i=-1,n=null==t?0:t.length,a=Array(n);++i<n;)a[i]=e(t[i],i,t);return a}function Ce(t,e){for(var i=-1,n=e.length,a=t.length;++i<n;)t[a+i]=e[i];return t}function Ee(t,e,i,n){var a=-1,r=null==t?0:t.length;for(n&&r&&(i=t[++a]);++a<r;)i=e(i,t[a],a,t);return i}function Te(t,e,i,n){var a=null==t?0:t.length;for(n&&a&&(i=t[--a]);a--;)i=e(i,t[a],a,t);return i}function Pe(t,e){for(var i=-1,n=null==t?0:t.length;++i<n;)if(e(t[i],i,t))return!0;return!1}var Me=Re("length");function Le(t,e,i){var n;return i(t,(function(t,i,a){if(e(t,i,a))return n=i,!1})),n}function De(t,e,i,n){for(var a=t.length,r=i+(n?1:-1);n?r--:++r<a;)if(e(t[r],r,t))return r;return-1}function Ie(t,e,i){return e==e?function(t,e,i){for(var n=i-1,a=t.length;++n<a;)if(t[n]===e)return n;return-1}(t,e,i):De(t,Ne,i)}function Oe(t,e,i,n){for(var a=i-1,r=t.length;++a<r;)if(n(t[a],e))return a;return-1}function Ne(t){return t!=t}function Fe(t,e){var i=null==t?0:t.length;return i?Ye(t,e)/i:d}function Re(t){return function(e){return null==e?a:e[t]}}function ze(t){return function(e){return null==t?a:t[e]}}function He(t,e,i,n,a){return a(t,(function(t,a,r){i=n?(n=!1,t):e(i,t,a,r)})),i}function Ye(t,e){for(var i,n=-1,r=t.length;++n<r;){var s=e(t[n]);s!==a&&(i=i===a?s:i+s)}return i}function Xe(t,e){for(var i=-1,n=Array(t);++i<t;)n[i]=e(i);return n}function Be(t){return t?t.slice(0,si(t)+1).replace(nt,""):t}function je(t){return function(e){return t(e)}}function We(t,e){return _e(e,(function(e){return t[e]}))}function Ve(t,e){return t.has(e)}function Ge(t,e){for(var i=-1,n=t.length;++i<n&&Ie(e,t[i],0)>-1;);return i}function Ue(t,e){for(var i=t.length;i--&&Ie(e,t[i],0)>-1;);return i}function qe(t,e){for(var i=t.length,n=0;i--;)t[i]===e&&++n;return n}var $e=ze({À:"A",Á:"A",Â:"A",Ã:"A",Ä:"A",Å:"A",à:"a",á:"a",â:"a",ã:"a",ä:"a",å:"a",Ç:"C",ç:"c",Ð:"D",ð:"d",È:"E",É:"E",Ê:"E",Ë:"E",è:"e",é:"e",ê:"e",ë:"e",Ì:"I",Í:"I",Î:"I",Ï:"I",ì:"i",í:"i",î:"i",ï:"i",Ñ:"N",ñ:"n",Ò:"O",Ó:"O",Ô:"O",Õ:"O",Ö:"O",Ø:"O",ò:"o",ó:"o",ô:"o",õ:"o",ö:"o",ø:"o",Ù:"U",Ú:"U",Û:"U",Ü:"U",ù:"u",ú:"u",û:"u",ü:"u",Ý:"Y",ý:"y",ÿ:"y",Æ:"Ae",æ:"ae",Þ:"Th",þ:"th",ß:"ss",Ā:"A",Ă:"A",Ą:"A",ā:"a",ă:"a",ą:"a",Ć:"C",Ĉ:"C",Ċ:"C",Č:"C",ć:"c",ĉ:"c",ċ:"c",č:"c",Ď:"D",Đ:"D",ď:"d",đ:"d",Ē:"E",Ĕ:"E",Ė:"E",Ę:"E",Ě:"E",ē:"e",ĕ:"e",ė:"e",ę:"e",ě:"e",Ĝ:"G",Ğ:"G",Ġ:"G",Ģ:"G",ĝ:"g",ğ:"g",ġ:"g",ģ:"g",Ĥ:"H",Ħ:"H",ĥ:"h",ħ:"h",Ĩ:"I",Ī:"I",Ĭ:"I",Į:"I",İ:"I",ĩ:"i",ī:"i",ĭ:"i",į:"i",ı:"i",Ĵ:"J",ĵ:"j",Ķ:"K",ķ:"k",ĸ:"k",Ĺ:"L",Ļ:"L",Ľ:"L",Ŀ:"L",Ł:"L",ĺ:"l",ļ:"l",ľ:"l",ŀ:"l",ł:"l",Ń:"N",Ņ:"N",Ň:"N",Ŋ:"N",ń:"n",ņ:"n",ň:"n",ŋ:"n",Ō:"O",Ŏ:"O",Ő:"O",ō:"o",ŏ:"o",ő:"o",Ŕ:"R",Ŗ:"R",Ř:"R",ŕ:"r",ŗ:"r",ř:"r",Ś:"S",Ŝ:"S",Ş:"S",Š:"S",ś:"s",ŝ:"s",ş:"s",š:"s",Ţ:"T",Ť:"T",Ŧ:"T",ţ:"t",ť:"t",ŧ:"t",Ũ:"U",Ū:"U",Ŭ:"U",Ů:"U",Ű:"U",Ų:"U",ũ:"u",ū:"u",ŭ:"u",ů:"u",ű:"u",ų:"u",Ŵ:"W",ŵ:"w",Ŷ:"Y",ŷ:"y",Ÿ:"Y",Ź:"Z",Ż:"Z",Ž:"Z",ź:"z",ż:"z",ž:"z",Ĳ:"IJ",ĳ:"ij",Œ:"Oe",œ:"oe",ŉ:"'n",ſ:"s"}),Ze=ze({"&":"&amp;","<":"&lt;",">":"&gt;",'"':"&quot;","'":"&#39;"});function Ke(t){return"\\"+te[t]}function Qe(t){return qt.test(t)}function Je(t){var e=-1,i=Array(t.size);return t.forEach((function(t,n){i[++e]=[n,t]})),i}function ti(t,e){return function(i){return t(e(i))}}function ei(t,e){for(var i=-1,n=t.length,a=0,r=[];++i<n;){var s=t[i];s!==e&&s!==o||(t[i]=o,r[a++]=i)}return r}function ii(t){var e=-1,i=Array(t.size);return t.forEach((function(t){i[++e]=t})),i}function ni(t){var e=-1,i=Array(t.size);return t.forEach((function(t){i[++e]=[t,t]})),i}function ai(t){return Qe(t)?function(t){for(var e=Gt.lastIndex=0;Gt.test(t);)++e;return e}(t):Me(t)}function ri(t){return Qe(t)?function(t){return t.match(Gt)||[]}(t):function(t){return t.split("")}(t)}function si(t){for(var e=t.length;e--&&at.test(t.charAt(e)););return e}var oi=ze({"&amp;":"&","&lt;":"<","&gt;":">","&quot;":'"',"&#39;":"'"}),li=function t(e){var i,n=(e=null==e?re:li.defaults(re.Object(),e,li.pick(re,Zt))).Array,at=e.Date,wt=e.Error,kt=e.Function,At=e.Math,St=e.Object,_t=e.RegExp,Ct=e.String,Et=e.TypeError,Tt=n.prototype,Pt=kt.prototype,Mt=St.prototype,Lt=e["__core-js_shared__"],Dt=Pt.toString,It=Mt.hasOwnProperty,Ot=0,Nt=(i=/[^.]+$/.exec(Lt&&Lt.keys&&Lt.keys.IE_PROTO||""))?"Symbol(src)_1."+i:"",Ft=Mt.toString,Rt=Dt.call(St),zt=re._,Ht=_t("^"+Dt.call(It).replace(et,"\\$&").replace(/hasOwnProperty|(function).*?(?=\\\()| for .+?(?=\\\])/g,"$1.*?")+"$"),Yt=le?e.Buffer:a,Xt=e.Symbol,Bt=e.Uint8Array,jt=Yt?Yt.allocUnsafe:a,Gt=ti(St.getPrototypeOf,St),qt=St.create,te=Mt.propertyIsEnumerable,ne=Tt.splice,ae=Xt?Xt.isConcatSpreadable:a,se=Xt?Xt.iterator:a,oe=Xt?Xt.toStringTag:a,ce=function(){try{var t=cr(St,"defineProperty");return t({},"",{}),t}catch(t){}}(),he=e.clearTimeout!==re.clearTimeout&&e.clearTimeout,Me=at&&at.now!==re.Date.now&&at.now,ze=e.setTimeout!==re.setTimeout&&e.setTimeout,ci=At.ceil,hi=At.floor,ui=St.getOwnPropertySymbols,di=Yt?Yt.isBuffer:a,fi=e.isFinite,gi=Tt.join,pi=ti(St.keys,St),mi=At.max,vi=At.min,xi=at.now,bi=e.parseInt,yi=At.random,wi=Tt.reverse,ki=cr(e,"DataView"),Ai=cr(e,"Map"),Si=cr(e,"Promise"),_i=cr(e,"Set"),Ci=cr(e,"WeakMap"),Ei=cr(St,"create"),Ti=Ci&&new Ci,Pi={},Mi=zr(ki),Li=zr(Ai),Di=zr(Si),Ii=zr(_i),Oi=zr(Ci),Ni=Xt?Xt.prototype:a,Fi=Ni?Ni.valueOf:a,Ri=Ni?Ni.toString:a;function zi(t){if(eo(t)&&!Ws(t)&&!(t instanceof Bi)){if(t instanceof Xi)return t;if(It.call(t,"__wrapped__"))return Hr(t)}return new Xi(t)}var Hi=function(){function t(){}return function(e){if(!to(e))return{};if(qt)return qt(e);t.prototype=e;var i=new t;return t.prototype=a,i}}();function Yi(){}function Xi(t,e){this.__wrapped__=t,this.__actions__=[],this.__chain__=!!e,this.__index__=0,this.__values__=a}function Bi(t){this.__wrapped__=t,this.__actions__=[],this.__dir__=1,this.__filtered__=!1,this.__iteratees__=[],this.__takeCount__=f,this.__views__=[]}function ji(t){var e=-1,i=null==t?0:t.length;for(this.clear();++e<i;){var n=t[e];this.set(n[0],n[1])}}function Wi(t){var e=-1,i=null==t?0:t.length;for(this.clear();++e<i;){var n=t[e];this.set(n[0],n[1])}}function Vi(t){var e=-1,i=null==t?0:t.length;for(this.clear();++e<i;){var n=t[e];this.set(n[0],n[1])}}function Gi(t){var e=-1,i=null==t?0:t.length;for(this.__data__=new Vi;++e<i;)this.add(t[e])}function Ui(t){var e=this.__data__=new Wi(t);this.size=e.size}function qi(t,e){var i=Ws(t),n=!i&&js(t),a=!i&&!n&&qs(t),r=!i&&!n&&!a&&co(t),s=i||n||a||r,o=s?Xe(t.length,Ct):[],l=o.length;for(var c in t)!e&&!It.call(t,c)||s&&("length"==c||a&&("offset"==c||"parent"==c)||r&&("buffer"==c||"byteLength"==c||"byteOffset"==c)||mr(c,l))||o.push(c);return o}function $i(t){var e=t.length;return e?t[Gn(0,e-1)]:a}function Zi(t,e){return Ir(Ea(t),sn(e,0,t.length))}function Ki(t){return Ir(Ea(t))}function Qi(t,e,i){(i!==a&&!Ys(t[e],i)||i===a&&!(e in t))&&an(t,e,i)}function Ji(t,e,i){var n=t[e];It.call(t,e)&&Ys(n,i)&&(i!==a||e in t)||an(t,e,i)}function tn(t,e){for(var i=t.length;i--;)if(Ys(t[i][0],e))return i;return-1}function en(t,e,i,n){return un(t,(function(t,a,r){e(n,t,i(t),r)})),n}function nn(t,e){return t&&Ta(e,Do(e),t)}function an(t,e,i){"__proto__"==e&&ce?ce(t,e,{configurable:!0,enumerable:!0,value:i,writable:!0}):t[e]=i}function rn(t,e){for(var i=-1,r=e.length,s=n(r),o=null==t;++i<r;)s[i]=o?a:Eo(t,e[i]);return s}function sn(t,e,i){return t==t&&(i!==a&&(t=t<=i?t:i),e!==a&&(t=t>=e?t:e)),t}function on(t,e,i,n,r,s){var o,l=1&e,c=2&e,h=4&e;if(i&&(o=r?i(t,n,r,s):i(t)),o!==a)return o;if(!to(t))return t;var u=Ws(t);if(u){if(o=function(t){var e=t.length,i=new t.constructor(e);return e&&"string"==typeof t[0]&&It.call(t,"index")&&(i.index=t.index,i.input=t.input),i}(t),!l)return Ea(t,o)}else{var d=dr(t),f=d==y||d==w;if(qs(t))return wa(t,l);if(d==S||d==p||f&&!r){if(o=c||f?{}:gr(t),!l)return c?function(t,e){return Ta(t,ur(t),e)}(t,function(t,e){return t&&Ta(e,Io(e),t)}(o,t)):function(t,e){return Ta(t,hr(t),e)}(t,nn(o,t))}else{if(!Jt[d])return r?t:{};o=function(t,e,i){var n,a=t.constructor;switch(e){case L:return ka(t);case v:case x:return new a(+t);case D:return function(t,e){var i=e?ka(t.buffer):t.buffer;return new t.constructor(i,t.byteOffset,t.byteLength)}(t,i);case I:case O:case N:case F:case R:case z:case H:case Y:case X:return Aa(t,i);case k:return new a;case A:case T:return new a(t);case C:return function(t){var e=new t.constructor(t.source,dt.exec(t));return e.lastIndex=t.lastIndex,e}(t);case E:return new a;case P:return n=t,Fi?St(Fi.call(n)):{}}}(t,d,l)}}s||(s=new Ui);var g=s.get(t);if(g)return g;s.set(t,o),so(t)?t.forEach((function(n){o.add(on(n,e,i,n,t,s))})):io(t)&&t.forEach((function(n,a){o.set(a,on(n,e,i,a,t,s))}));var m=u?a:(h?c?ir:er:c?Io:Do)(t);return be(m||t,(function(n,a){m&&(n=t[a=n]),Ji(o,a,on(n,e,i,a,t,s))})),o}function ln(t,e,i){var n=i.length;if(null==t)return!n;for(t=St(t);n--;){var r=i[n],s=e[r],o=t[r];if(o===a&&!(r in t)||!s(o))return!1}return!0}function cn(t,e,i){if("function"!=typeof t)throw new Et(r);return Pr((function(){t.apply(a,i)}),e)}function hn(t,e,i,n){var a=-1,r=Ae,s=!0,o=t.length,l=[],c=e.length;if(!o)return l;i&&(e=_e(e,je(i))),n?(r=Se,s=!1):e.length>=200&&(r=Ve,s=!1,e=new Gi(e));t:for(;++a<o;){var h=t[a],u=null==i?h:i(h);if(h=n||0!==h?h:0,s&&u==u){for(var d=c;d--;)if(e[d]===u)continue t;l.push(h)}else r(e,u,n)||l.push(h)}return l}zi.templateSettings={escape:$,evaluate:Z,interpolate:K,variable:"",imports:{_:zi}},zi.prototype=Yi.prototype,zi.prototype.constructor=zi,Xi.prototype=Hi(Yi.prototype),Xi.prototype.constructor=Xi,Bi.prototype=Hi(Yi.prototype),Bi.prototype.constructor=Bi,ji.prototype.clear=function(){this.__data__=Ei?Ei(null):{},this.size=0},ji.prototype.delete=function(t){var e=this.has(t)&&delete this.__data__[t];return this.size-=e?1:0,e},ji.prototype.get=function(t){var e=this.__data__;if(Ei){var i=e[t];return i===s?a:i}return It.call(e,t)?e[t]:a},ji.prototype.has=function(t){var e=this.__data__;return Ei?e[t]!==a:It.call(e,t)},ji.prototype.set=function(t,e){var i=this.__data__;return this.size+=this.has(t)?0:1,i[t]=Ei&&e===a?s:e,this},Wi.prototype.clear=function(){this.__data__=[],this.size=0},Wi.prototype.delete=function(t){var e=this.__data__,i=tn(e,t);return!(i<0||(i==e.length-1?e.pop():ne.call(e,i,1),--this.size,0))},Wi.prototype.get=function(t){var e=this.__data__,i=tn(e,t);return i<0?a:e[i][1]},Wi.prototype.has=function(t){return tn(this.__data__,t)>-1},Wi.prototype.set=function(t,e){var i=this.__data__,n=tn(i,t);return n<0?(++this.size,i.push([t,e])):i[n][1]=e,this},Vi.prototype.clear=function(){this.size=0,this.__data__={hash:new ji,map:new(Ai||Wi),string:new ji}},Vi.prototype.delete=function(t){var e=or(this,t).delete(t);return this.size-=e?1:0,e},Vi.prototype.get=function(t){return or(this,t).get(t)},Vi.prototype.has=function(t){return or(this,t).has(t)},Vi.prototype.set=function(t,e){var i=or(this,t),n=i.size;return i.set(t,e),this.size+=i.size==n?0:1,this},Gi.prototype.add=Gi.prototype.push=function(t){return this.__data__.set(t,s),this},Gi.prototype.has=function(t){return this.__data__.has(t)},Ui.prototype.clear=function(){this.__data__=new Wi,this.size=0},Ui.prototype.delete=function(t){var e=this.__data__,i=e.delete(t);return this.size=e.size,i},Ui.prototype.get=function(t){return this.__data__.get(t)},Ui.prototype.has=function(t){return this.__data__.has(t)},Ui.prototype.set=function(t,e){var i=this.__data__;if(i instanceof Wi){var n=i.__data__;if(!Ai||n.length<199)return n.push([t,e]),this.size=++i.size,this;i=this.__data__=new Vi(n)}return i.set(t,e),this.size=i.size,this};var un=La(bn),dn=La(yn,!0);function fn(t,e){var i=!0;return un(t,(function(t,n,a){return i=!!e(t,n,a)})),i}function gn(t,e,i){for(var n=-1,r=t.length;++n<r;){var s=t[n],o=e(s);if(null!=o&&(l===a?o==o&&!lo(o):i(o,l)))var l=o,c=s}return c}function pn(t,e){var i=[];return un(t,(function(t,n,a){e(t,n,a)&&i.push(t)})),i}function mn(t,e,i,n,a){var r=-1,s=t.length;for(i||(i=pr),a||(a=[]);++r<s;){var o=t[r];e>0&&i(o)?e>1?mn(o,e-1,i,n,a):Ce(a,o):n||(a[a.length]=o)}return a}var vn=Da(),xn=Da(!0);function bn(t,e){return t&&vn(t,e,Do)}function yn(t,e){return t&&xn(t,e,Do)}function wn(t,e){return ke(e,(function(e){return Ks(t[e])}))}function kn(t,e){for(var i=0,n=(e=va(e,t)).length;null!=t&&i<n;)t=t[Rr(e[i++])];return i&&i==n?t:a}function An(t,e,i){var n=e(t);return Ws(t)?n:Ce(n,i(t))}function Sn(t){return null==t?t===a?"[object Undefined]":"[object Null]":oe&&oe in St(t)?function(t){var e=It.call(t,oe),i=t[oe];try{t[oe]=a;var n=!0}catch(t){}var r=Ft.call(t);return n&&(e?t[oe]=i:delete t[oe]),r}(t):function(t){return Ft.call(t)}(t)}function _n(t,e){return t>e}function Cn(t,e){return null!=t&&It.call(t,e)}function En(t,e){return null!=t&&e in St(t)}function Tn(t,e,i){for(var r=i?Se:Ae,s=t[0].length,o=t.length,l=o,c=n(o),h=1/0,u=[];l--;){var d=t[l];l&&e&&(d=_e(d,je(e))),h=vi(d.length,h),c[l]=!i&&(e||s>=120&&d.length>=120)?new Gi(l&&d):a}d=t[0];var f=-1,g=c[0];t:for(;++f<s&&u.length<h;){var p=d[f],m=e?e(p):p;if(p=i||0!==p?p:0,!(g?Ve(g,m):r(u,m,i))){for(l=o;--l;){var v=c[l];if(!(v?Ve(v,m):r(t[l],m,i)))continue t}g&&g.push(m),u.push(p)}}return u}function Pn(t,e,i){var n=null==(t=_r(t,e=va(e,t)))?t:t[Rr(Zr(e))];return null==n?a:ve(n,t,i)}function Mn(t){return eo(t)&&Sn(t)==p}function Ln(t,e,i,n,r){return t===e||(null==t||null==e||!eo(t)&&!eo(e)?t!=t&&e!=e:function(t,e,i,n,r,s){var o=Ws(t),l=Ws(e),c=o?m:dr(t),h=l?m:dr(e),u=(c=c==p?S:c)==S,d=(h=h==p?S:h)==S,f=c==h;if(f&&qs(t)){if(!qs(e))return!1;o=!0,u=!1}if(f&&!u)return s||(s=new Ui),o||co(t)?Ja(t,e,i,n,r,s):function(t,e,i,n,a,r,s){switch(i){case D:if(t.byteLength!=e.byteLength||t.byteOffset!=e.byteOffset)return!1;t=t.buffer,e=e.buffer;case L:return!(t.byteLength!=e.byteLength||!r(new Bt(t),new Bt(e)));case v:case x:case A:return Ys(+t,+e);case b:return t.name==e.name&&t.message==e.message;case C:case T:return t==e+"";case k:var o=Je;case E:var l=1&n;if(o||(o=ii),t.size!=e.size&&!l)return!1;var c=s.get(t);if(c)return c==e;n|=2,s.set(t,e);var h=Ja(o(t),o(e),n,a,r,s);return s.delete(t),h;case P:if(Fi)return Fi.call(t)==Fi.call(e)}return!1}(t,e,c,i,n,r,s);if(!(1&i)){var g=u&&It.call(t,"__wrapped__"),y=d&&It.call(e,"__wrapped__");if(g||y){var w=g?t.value():t,_=y?e.value():e;return s||(s=new Ui),r(w,_,i,n,s)}}return!!f&&(s||(s=new Ui),function(t,e,i,n,r,s){var o=1&i,l=er(t),c=l.length;if(c!=er(e).length&&!o)return!1;for(var h=c;h--;){var u=l[h];if(!(o?u in e:It.call(e,u)))return!1}var d=s.get(t),f=s.get(e);if(d&&f)return d==e&&f==t;var g=!0;s.set(t,e),s.set(e,t);for(var p=o;++h<c;){var m=t[u=l[h]],v=e[u];if(n)var x=o?n(v,m,u,e,t,s):n(m,v,u,t,e,s);if(!(x===a?m===v||r(m,v,i,n,s):x)){g=!1;break}p||(p="constructor"==u)}if(g&&!p){var b=t.constructor,y=e.constructor;b==y||!("constructor"in t)||!("constructor"in e)||"function"==typeof b&&b instanceof b&&"function"==typeof y&&y instanceof y||(g=!1)}return s.delete(t),s.delete(e),g}(t,e,i,n,r,s))}(t,e,i,n,Ln,r))}function Dn(t,e,i,n){var r=i.length,s=r,o=!n;if(null==t)return!s;for(t=St(t);r--;){var l=i[r];if(o&&l[2]?l[1]!==t[l[0]]:!(l[0]in t))return!1}for(;++r<s;){var c=(l=i[r])[0],h=t[c],u=l[1];if(o&&l[2]){if(h===a&&!(c in t))return!1}else{var d=new Ui;if(n)var f=n(h,u,c,t,e,d);if(!(f===a?Ln(u,h,3,n,d):f))return!1}}return!0}function In(t){return!(!to(t)||(e=t,Nt&&Nt in e))&&(Ks(t)?Ht:pt).test(zr(t));var e}function On(t){return"function"==typeof t?t:null==t?al:"object"==typeof t?Ws(t)?Hn(t[0],t[1]):zn(t):fl(t)}function Nn(t){if(!wr(t))return pi(t);var e=[];for(var i in St(t))It.call(t,i)&&"constructor"!=i&&e.push(i);return e}function Fn(t,e){return t<e}function Rn(t,e){var i=-1,a=Gs(t)?n(t.length):[];return un(t,(function(t,n,r){a[++i]=e(t,n,r)})),a}function zn(t){var e=lr(t);return 1==e.length&&e[0][2]?Ar(e[0][0],e[0][1]):function(i){return i===t||Dn(i,t,e)}}function Hn(t,e){return xr(t)&&kr(e)?Ar(Rr(t),e):function(i){var n=Eo(i,t);return n===a&&n===e?To(i,t):Ln(e,n,3)}}function Yn(t,e,i,n,r){t!==e&&vn(e,(function(s,o){if(r||(r=new Ui),to(s))!function(t,e,i,n,r,s,o){var l=Er(t,i),c=Er(e,i),h=o.get(c);if(h)Qi(t,i,h);else{var u=s?s(l,c,i+"",t,e,o):a,d=u===a;if(d){var f=Ws(c),g=!f&&qs(c),p=!f&&!g&&co(c);u=c,f||g||p?Ws(l)?u=l:Us(l)?u=Ea(l):g?(d=!1,u=wa(c,!0)):p?(d=!1,u=Aa(c,!0)):u=[]:ao(c)||js(c)?(u=l,js(l)?u=xo(l):to(l)&&!Ks(l)||(u=gr(c))):d=!1}d&&(o.set(c,u),r(u,c,n,s,o),o.delete(c)),Qi(t,i,u)}}(t,e,o,i,Yn,n,r);else{var l=n?n(Er(t,o),s,o+"",t,e,r):a;l===a&&(l=s),Qi(t,o,l)}}),Io)}function Xn(t,e){var i=t.length;if(i)return mr(e+=e<0?i:0,i)?t[e]:a}function Bn(t,e,i){e=e.length?_e(e,(function(t){return Ws(t)?function(e){return kn(e,1===t.length?t[0]:t)}:t})):[al];var n=-1;e=_e(e,je(sr()));var a=Rn(t,(function(t,i,a){var r=_e(e,(function(e){return e(t)}));return{criteria:r,index:++n,value:t}}));return function(t,e){var n=t.length;for(t.sort((function(t,e){return function(t,e,i){for(var n=-1,a=t.criteria,r=e.criteria,s=a.length,o=i.length;++n<s;){var l=Sa(a[n],r[n]);if(l)return n>=o?l:l*("desc"==i[n]?-1:1)}return t.index-e.index}(t,e,i)}));n--;)t[n]=t[n].value;return t}(a)}function jn(t,e,i){for(var n=-1,a=e.length,r={};++n<a;){var s=e[n],o=kn(t,s);i(o,s)&&Kn(r,va(s,t),o)}return r}function Wn(t,e,i,n){var a=n?Oe:Ie,r=-1,s=e.length,o=t;for(t===e&&(e=Ea(e)),i&&(o=_e(t,je(i)));++r<s;)for(var l=0,c=e[r],h=i?i(c):c;(l=a(o,h,l,n))>-1;)o!==t&&ne.call(o,l,1),ne.call(t,l,1);return t}function Vn(t,e){for(var i=t?e.length:0,n=i-1;i--;){var a=e[i];if(i==n||a!==r){var r=a;mr(a)?ne.call(t,a,1):ca(t,a)}}return t}function Gn(t,e){return t+hi(yi()*(e-t+1))}function Un(t,e){var i="";if(!t||e<1||e>u)return i;do{e%2&&(i+=t),(e=hi(e/2))&&(t+=t)}while(e);return i}function qn(t,e){return Mr(Sr(t,e,al),t+"")}function $n(t){return $i(Xo(t))}function Zn(t,e){var i=Xo(t);return Ir(i,sn(e,0,i.length))}function Kn(t,e,i,n){if(!to(t))return t;for(var r=-1,s=(e=va(e,t)).length,o=s-1,l=t;null!=l&&++r<s;){var c=Rr(e[r]),h=i;if("__proto__"===c||"constructor"===c||"prototype"===c)return t;if(r!=o){var u=l[c];(h=n?n(u,c,l):a)===a&&(h=to(u)?u:mr(e[r+1])?[]:{})}Ji(l,c,h),l=l[c]}return t}var Qn=Ti?function(t,e){return Ti.set(t,e),t}:al,Jn=ce?function(t,e){return ce(t,"toString",{configurable:!0,enumerable:!1,value:el(e),writable:!0})}:al;function ta(t){return Ir(Xo(t))}function ea(t,e,i){var a=-1,r=t.length;e<0&&(e=-e>r?0:r+e),(i=i>r?r:i)<0&&(i+=r),r=e>i?0:i-e>>>0,e>>>=0;for(var s=n(r);++a<r;)s[a]=t[a+e];return s}function ia(t,e){var i;return un(t,(function(t,n,a){return!(i=e(t,n,a))})),!!i}function na(t,e,i){var n=0,a=null==t?n:t.length;if("number"==typeof e&&e==e&&a<=2147483647){for(;n<a;){var r=n+a>>>1,s=t[r];null!==s&&!lo(s)&&(i?s<=e:s<e)?n=r+1:a=r}return a}return aa(t,e,al,i)}function aa(t,e,i,n){var r=0,s=null==t?0:t.length;if(0===s)return 0;for(var o=(e=i(e))!=e,l=null===e,c=lo(e),h=e===a;r<s;){var u=hi((r+s)/2),d=i(t[u]),f=d!==a,g=null===d,p=d==d,m=lo(d);if(o)var v=n||p;else v=h?p&&(n||f):l?p&&f&&(n||!g):c?p&&f&&!g&&(n||!m):!g&&!m&&(n?d<=e:d<e);v?r=u+1:s=u}return vi(s,4294967294)}function ra(t,e){for(var i=-1,n=t.length,a=0,r=[];++i<n;){var s=t[i],o=e?e(s):s;if(!i||!Ys(o,l)){var l=o;r[a++]=0===s?0:s}}return r}function sa(t){return"number"==typeof t?t:lo(t)?d:+t}function oa(t){if("string"==typeof t)return t;if(Ws(t))return _e(t,oa)+"";if(lo(t))return Ri?Ri.call(t):"";var e=t+"";return"0"==e&&1/t==-1/0?"-0":e}function la(t,e,i){var n=-1,a=Ae,r=t.length,s=!0,o=[],l=o;if(i)s=!1,a=Se;else if(r>=200){var c=e?null:Ua(t);if(c)return ii(c);s=!1,a=Ve,l=new Gi}else l=e?[]:o;t:for(;++n<r;){var h=t[n],u=e?e(h):h;if(h=i||0!==h?h:0,s&&u==u){for(var d=l.length;d--;)if(l[d]===u)continue t;e&&l.push(u),o.push(h)}else a(l,u,i)||(l!==o&&l.push(u),o.push(h))}return o}function ca(t,e){return null==(t=_r(t,e=va(e,t)))||delete t[Rr(Zr(e))]}function ha(t,e,i,n){return Kn(t,e,i(kn(t,e)),n)}function ua(t,e,i,n){for(var a=t.length,r=n?a:-1;(n?r--:++r<a)&&e(t[r],r,t););return i?ea(t,n?0:r,n?r+1:a):ea(t,n?r+1:0,n?a:r)}function da(t,e){var i=t;return i instanceof Bi&&(i=i.value()),Ee(e,(function(t,e){return e.func.apply(e.thisArg,Ce([t],e.args))}),i)}function fa(t,e,i){var a=t.length;if(a<2)return a?la(t[0]):[];for(var r=-1,s=n(a);++r<a;)for(var o=t[r],l=-1;++l<a;)l!=r&&(s[r]=hn(s[r]||o,t[l],e,i));return la(mn(s,1),e,i)}function ga(t,e,i){for(var n=-1,r=t.length,s=e.length,o={};++n<r;){var l=n<s?e[n]:a;i(o,t[n],l)}return o}function pa(t){return Us(t)?t:[]}function ma(t){return"function"==typeof t?t:al}function va(t,e){return Ws(t)?t:xr(t,e)?[t]:Fr(bo(t))}var xa=qn;function ba(t,e,i){var n=t.length;return i=i===a?n:i,!e&&i>=n?t:ea(t,e,i)}var ya=he||function(t){return re.clearTimeout(t)};function wa(t,e){if(e)return t.slice();var i=t.length,n=jt?jt(i):new t.constructor(i);return t.copy(n),n}function ka(t){var e=new t.constructor(t.byteLength);return new Bt(e).set(new Bt(t)),e}function Aa(t,e){var i=e?ka(t.buffer):t.buffer;return new t.constructor(i,t.byteOffset,t.length)}function Sa(t,e){if(t!==e){var i=t!==a,n=null===t,r=t==t,s=lo(t),o=e!==a,l=null===e,c=e==e,h=lo(e);if(!l&&!h&&!s&&t>e||s&&o&&c&&!l&&!h||n&&o&&c||!i&&c||!r)return 1;if(!n&&!s&&!h&&t<e||h&&i&&r&&!n&&!s||l&&i&&r||!o&&r||!c)return-1}return 0}function _a(t,e,i,a){for(var r=-1,s=t.length,o=i.length,l=-1,c=e.length,h=mi(s-o,0),u=n(c+h),d=!a;++l<c;)u[l]=e[l];for(;++r<o;)(d||r<s)&&(u[i[r]]=t[r]);for(;h--;)u[l++]=t[r++];return u}function Ca(t,e,i,a){for(var r=-1,s=t.length,o=-1,l=i.length,c=-1,h=e.length,u=mi(s-l,0),d=n(u+h),f=!a;++r<u;)d[r]=t[r];for(var g=r;++c<h;)d[g+c]=e[c];for(;++o<l;)(f||r<s)&&(d[g+i[o]]=t[r++]);return d}function Ea(t,e){var i=-1,a=t.length;for(e||(e=n(a));++i<a;)e[i]=t[i];return e}function Ta(t,e,i,n){var r=!i;i||(i={});for(var s=-1,o=e.length;++s<o;){var l=e[s],c=n?n(i[l],t[l],l,i,t):a;c===a&&(c=t[l]),r?an(i,l,c):Ji(i,l,c)}return i}function Pa(t,e){return function(i,n){var a=Ws(i)?xe:en,r=e?e():{};return a(i,t,sr(n,2),r)}}function Ma(t){return qn((function(e,i){var n=-1,r=i.length,s=r>1?i[r-1]:a,o=r>2?i[2]:a;for(s=t.length>3&&"function"==typeof s?(r--,s):a,o&&vr(i[0],i[1],o)&&(s=r<3?a:s,r=1),e=St(e);++n<r;){var l=i[n];l&&t(e,l,n,s)}return e}))}function La(t,e){return function(i,n){if(null==i)return i;if(!Gs(i))return t(i,n);for(var a=i.length,r=e?a:-1,s=St(i);(e?r--:++r<a)&&!1!==n(s[r],r,s););return i}}function Da(t){return function(e,i,n){for(var a=-1,r=St(e),s=n(e),o=s.length;o--;){var l=s[t?o:++a];if(!1===i(r[l],l,r))break}return e}}function Ia(t){return function(e){var i=Qe(e=bo(e))?ri(e):a,n=i?i[0]:e.charAt(0),r=i?ba(i,1).join(""):e.slice(1);return n[t]()+r}}function Oa(t){return function(e){return Ee(Qo(Wo(e).replace(Wt,"")),t,"")}}function Na(t){return function(){var e=arguments;switch(e.length){case 0:return new t;case 1:return new t(e[0]);case 2:return new t(e[0],e[1]);case 3:return new t(e[0],e[1],e[2]);case 4:return new t(e[0],e[1],e[2],e[3]);case 5:return new t(e[0],e[1],e[2],e[3],e[4]);case 6:return new t(e[0],e[1],e[2],e[3],e[4],e[5]);case 7:return new t(e[0],e[1],e[2],e[3],e[4],e[5],e[6])}var i=Hi(t.prototype),n=t.apply(i,e);return to(n)?n:i}}function Fa(t){return function(e,i,n){var r=St(e);if(!Gs(e)){var s=sr(i,3);e=Do(e),i=function(t){return s(r[t],t,r)}}var o=t(e,i,n);return o>-1?r[s?e[o]:o]:a}}function Ra(t){return tr((function(e){var i=e.length,n=i,s=Xi.prototype.thru;for(t&&e.reverse();n--;){var o=e[n];if("function"!=typeof o)throw new Et(r);if(s&&!l&&"wrapper"==ar(o))var l=new Xi([],!0)}for(n=l?n:i;++n<i;){var c=ar(o=e[n]),h="wrapper"==c?nr(o):a;l=h&&br(h[0])&&424==h[1]&&!h[4].length&&1==h[9]?l[ar(h[0])].apply(l,h[3]):1==o.length&&br(o)?l[c]():l.thru(o)}return function(){var t=arguments,n=t[0];if(l&&1==t.length&&Ws(n))return l.plant(n).value();for(var a=0,r=i?e[a].apply(this,t):n;++a<i;)r=e[a].call(this,r);return r}}))}function za(t,e,i,r,s,o,l,h,u,d){var f=e&c,g=1&e,p=2&e,m=24&e,v=512&e,x=p?a:Na(t);return function a(){for(var c=arguments.length,b=n(c),y=c;y--;)b[y]=arguments[y];if(m)var w=rr(a),k=qe(b,w);if(r&&(b=_a(b,r,s,m)),o&&(b=Ca(b,o,l,m)),c-=k,m&&c<d){var A=ei(b,w);return Va(t,e,za,a.placeholder,i,b,A,h,u,d-c)}var S=g?i:this,_=p?S[t]:t;return c=b.length,h?b=Cr(b,h):v&&c>1&&b.reverse(),f&&u<c&&(b.length=u),this&&this!==re&&this instanceof a&&(_=x||Na(_)),_.apply(S,b)}}function Ha(t,e){return function(i,n){return function(t,e,i,n){return bn(t,(function(t,a,r){e(n,i(t),a,r)})),n}(i,t,e(n),{})}}function Ya(t,e){return function(i,n){var r;if(i===a&&n===a)return e;if(i!==a&&(r=i),n!==a){if(r===a)return n;"string"==typeof i||"string"==typeof n?(i=oa(i),n=oa(n)):(i=sa(i),n=sa(n)),r=t(i,n)}return r}}function Xa(t){return tr((function(e){return e=_e(e,je(sr())),qn((function(i){var n=this;return t(e,(function(t){return ve(t,n,i)}))}))}))}function Ba(t,e){var i=(e=e===a?" ":oa(e)).length;if(i<2)return i?Un(e,t):e;var n=Un(e,ci(t/ai(e)));return Qe(e)?ba(ri(n),0,t).join(""):n.slice(0,t)}function ja(t){return function(e,i,r){return r&&"number"!=typeof r&&vr(e,i,r)&&(i=r=a),e=go(e),i===a?(i=e,e=0):i=go(i),function(t,e,i,a){for(var r=-1,s=mi(ci((e-t)/(i||1)),0),o=n(s);s--;)o[a?s:++r]=t,t+=i;return o}(e,i,r=r===a?e<i?1:-1:go(r),t)}}function Wa(t){return function(e,i){return"string"==typeof e&&"string"==typeof i||(e=vo(e),i=vo(i)),t(e,i)}}function Va(t,e,i,n,r,s,o,c,h,u){var d=8&e;e|=d?l:64,4&(e&=~(d?64:l))||(e&=-4);var f=[t,e,r,d?s:a,d?o:a,d?a:s,d?a:o,c,h,u],g=i.apply(a,f);return br(t)&&Tr(g,f),g.placeholder=n,Lr(g,t,e)}function Ga(t){var e=At[t];return function(t,i){if(t=vo(t),(i=null==i?0:vi(po(i),292))&&fi(t)){var n=(bo(t)+"e").split("e");return+((n=(bo(e(n[0]+"e"+(+n[1]+i)))+"e").split("e"))[0]+"e"+(+n[1]-i))}return e(t)}}var Ua=_i&&1/ii(new _i([,-0]))[1]==h?function(t){return new _i(t)}:cl;function qa(t){return function(e){var i=dr(e);return i==k?Je(e):i==E?ni(e):function(t,e){return _e(e,(function(e){return[e,t[e]]}))}(e,t(e))}}function $a(t,e,i,s,h,u,d,f){var g=2&e;if(!g&&"function"!=typeof t)throw new Et(r);var p=s?s.length:0;if(p||(e&=-97,s=h=a),d=d===a?d:mi(po(d),0),f=f===a?f:po(f),p-=h?h.length:0,64&e){var m=s,v=h;s=h=a}var x=g?a:nr(t),b=[t,e,i,s,h,m,v,u,d,f];if(x&&function(t,e){var i=t[1],n=e[1],a=i|n,r=a<131,s=n==c&&8==i||n==c&&256==i&&t[7].length<=e[8]||384==n&&e[7].length<=e[8]&&8==i;if(!r&&!s)return t;1&n&&(t[2]=e[2],a|=1&i?0:4);var l=e[3];if(l){var h=t[3];t[3]=h?_a(h,l,e[4]):l,t[4]=h?ei(t[3],o):e[4]}(l=e[5])&&(h=t[5],t[5]=h?Ca(h,l,e[6]):l,t[6]=h?ei(t[5],o):e[6]),(l=e[7])&&(t[7]=l),n&c&&(t[8]=null==t[8]?e[8]:vi(t[8],e[8])),null==t[9]&&(t[9]=e[9]),t[0]=e[0],t[1]=a}(b,x),t=b[0],e=b[1],i=b[2],s=b[3],h=b[4],!(f=b[9]=b[9]===a?g?0:t.length:mi(b[9]-p,0))&&24&e&&(e&=-25),e&&1!=e)y=8==e||16==e?function(t,e,i){var r=Na(t);return function s(){for(var o=arguments.length,l=n(o),c=o,h=rr(s);c--;)l[c]=arguments[c];var u=o<3&&l[0]!==h&&l[o-1]!==h?[]:ei(l,h);return(o-=u.length)<i?Va(t,e,za,s.placeholder,a,l,u,a,a,i-o):ve(this&&this!==re&&this instanceof s?r:t,this,l)}}(t,e,f):e!=l&&33!=e||h.length?za.apply(a,b):function(t,e,i,a){var r=1&e,s=Na(t);return function e(){for(var o=-1,l=arguments.length,c=-1,h=a.length,u=n(h+l),d=this&&this!==re&&this instanceof e?s:t;++c<h;)u[c]=a[c];for(;l--;)u[c++]=arguments[++o];return ve(d,r?i:this,u)}}(t,e,i,s);else var y=function(t,e,i){var n=1&e,a=Na(t);return function e(){return(this&&this!==re&&this instanceof e?a:t).apply(n?i:this,arguments)}}(t,e,i);return Lr((x?Qn:Tr)(y,b),t,e)}function Za(t,e,i,n){return t===a||Ys(t,Mt[i])&&!It.call(n,i)?e:t}function Ka(t,e,i,n,r,s){return to(t)&&to(e)&&(s.set(e,t),Yn(t,e,a,Ka,s),s.delete(e)),t}function Qa(t){return ao(t)?a:t}function Ja(t,e,i,n,r,s){var o=1&i,l=t.length,c=e.length;if(l!=c&&!(o&&c>l))return!1;var h=s.get(t),u=s.get(e);if(h&&u)return h==e&&u==t;var d=-1,f=!0,g=2&i?new Gi:a;for(s.set(t,e),s.set(e,t);++d<l;){var p=t[d],m=e[d];if(n)var v=o?n(m,p,d,e,t,s):n(p,m,d,t,e,s);if(v!==a){if(v)continue;f=!1;break}if(g){if(!Pe(e,(function(t,e){if(!Ve(g,e)&&(p===t||r(p,t,i,n,s)))return g.push(e)}))){f=!1;break}}else if(p!==m&&!r(p,m,i,n,s)){f=!1;break}}return s.delete(t),s.delete(e),f}function tr(t){return Mr(Sr(t,a,Vr),t+"")}function er(t){return An(t,Do,hr)}function ir(t){return An(t,Io,ur)}var nr=Ti?function(t){return Ti.get(t)}:cl;function ar(t){for(var e=t.name+"",i=Pi[e],n=It.call(Pi,e)?i.length:0;n--;){var a=i[n],r=a.func;if(null==r||r==t)return a.name}return e}function rr(t){return(It.call(zi,"placeholder")?zi:t).placeholder}function sr(){var t=zi.iteratee||rl;return t=t===rl?On:t,arguments.length?t(arguments[0],arguments[1]):t}function or(t,e){var i,n,a=t.__data__;return("string"==(n=typeof(i=e))||"number"==n||"symbol"==n||"boolean"==n?"__proto__"!==i:null===i)?a["string"==typeof e?"string":"hash"]:a.map}function lr(t){for(var e=Do(t),i=e.length;i--;){var n=e[i],a=t[n];e[i]=[n,a,kr(a)]}return e}function cr(t,e){var i=function(t,e){return null==t?a:t[e]}(t,e);return In(i)?i:a}var hr=ui?function(t){return null==t?[]:(t=St(t),ke(ui(t),(function(e){return te.call(t,e)})))}:ml,ur=ui?function(t){for(var e=[];t;)Ce(e,hr(t)),t=Gt(t);return e}:ml,dr=Sn;function fr(t,e,i){for(var n=-1,a=(e=va(e,t)).length,r=!1;++n<a;){var s=Rr(e[n]);if(!(r=null!=t&&i(t,s)))break;t=t[s]}return r||++n!=a?r:!!(a=null==t?0:t.length)&&Js(a)&&mr(s,a)&&(Ws(t)||js(t))}function gr(t){return"function"!=typeof t.constructor||wr(t)?{}:Hi(Gt(t))}function pr(t){return Ws(t)||js(t)||!!(ae&&t&&t[ae])}function mr(t,e){var i=typeof t;return!!(e=null==e?u:e)&&("number"==i||"symbol"!=i&&vt.test(t))&&t>-1&&t%1==0&&t<e}function vr(t,e,i){if(!to(i))return!1;var n=typeof e;return!!("number"==n?Gs(i)&&mr(e,i.length):"string"==n&&e in i)&&Ys(i[e],t)}function xr(t,e){if(Ws(t))return!1;var i=typeof t;return!("number"!=i&&"symbol"!=i&&"boolean"!=i&&null!=t&&!lo(t))||J.test(t)||!Q.test(t)||null!=e&&t in St(e)}function br(t){var e=ar(t),i=zi[e];if("function"!=typeof i||!(e in Bi.prototype))return!1;if(t===i)return!0;var n=nr(i);return!!n&&t===n[0]}(ki&&dr(new ki(new ArrayBuffer(1)))!=D||Ai&&dr(new Ai)!=k||Si&&dr(Si.resolve())!=_||_i&&dr(new _i)!=E||Ci&&dr(new Ci)!=M)&&(dr=function(t){var e=Sn(t),i=e==S?t.constructor:a,n=i?zr(i):"";if(n)switch(n){case Mi:return D;case Li:return k;case Di:return _;case Ii:return E;case Oi:return M}return e});var yr=Lt?Ks:vl;function wr(t){var e=t&&t.constructor;return t===("function"==typeof e&&e.prototype||Mt)}function kr(t){return t==t&&!to(t)}function Ar(t,e){return function(i){return null!=i&&i[t]===e&&(e!==a||t in St(i))}}function Sr(t,e,i){return e=mi(e===a?t.length-1:e,0),function(){for(var a=arguments,r=-1,s=mi(a.length-e,0),o=n(s);++r<s;)o[r]=a[e+r];r=-1;for(var l=n(e+1);++r<e;)l[r]=a[r];return l[e]=i(o),ve(t,this,l)}}function _r(t,e){return e.length<2?t:kn(t,ea(e,0,-1))}function Cr(t,e){for(var i=t.length,n=vi(e.length,i),r=Ea(t);n--;){var s=e[n];t[n]=mr(s,i)?r[s]:a}return t}function Er(t,e){if(("constructor"!==e||"function"!=typeof t[e])&&"__proto__"!=e)return t[e]}var Tr=Dr(Qn),Pr=ze||function(t,e){return re.setTimeout(t,e)},Mr=Dr(Jn);function Lr(t,e,i){var n=e+"";return Mr(t,function(t,e){var i=e.length;if(!i)return t;var n=i-1;return e[n]=(i>1?"& ":"")+e[n],e=e.join(i>2?", ":" "),t.replace(rt,"{\n/* [wrapped with "+e+"] */\n")}(n,function(t,e){return be(g,(function(i){var n="_."+i[0];e&i[1]&&!Ae(t,n)&&t.push(n)})),t.sort()}(function(t){var e=t.match(st);return e?e[1].split(ot):[]}(n),i)))}function Dr(t){var e=0,i=0;return function(){var n=xi(),r=16-(n-i);if(i=n,r>0){if(++e>=800)return arguments[0]}else e=0;return t.apply(a,arguments)}}function Ir(t,e){var i=-1,n=t.length,r=n-1;for(e=e===a?n:e;++i<e;){var s=Gn(i,r),o=t[s];t[s]=t[i],t[i]=o}return t.length=e,t}var Or,Nr,Fr=(Or=Os((function(t){var e=[];return 46===t.charCodeAt(0)&&e.push(""),t.replace(tt,(function(t,i,n,a){e.push(n?a.replace(ht,"$1"):i||t)})),e}),(function(t){return 500===Nr.size&&Nr.clear(),t})),Nr=Or.cache,Or);function Rr(t){if("string"==typeof t||lo(t))return t;var e=t+"";return"0"==e&&1/t==-1/0?"-0":e}function zr(t){if(null!=t){try{return Dt.call(t)}catch(t){}try{return t+""}catch(t){}}return""}function Hr(t){if(t instanceof Bi)return t.clone();var e=new Xi(t.__wrapped__,t.__chain__);return e.__actions__=Ea(t.__actions__),e.__index__=t.__index__,e.__values__=t.__values__,e}var Yr=qn((function(t,e){return Us(t)?hn(t,mn(e,1,Us,!0)):[]})),Xr=qn((function(t,e){var i=Zr(e);return Us(i)&&(i=a),Us(t)?hn(t,mn(e,1,Us,!0),sr(i,2)):[]})),Br=qn((function(t,e){var i=Zr(e);return Us(i)&&(i=a),Us(t)?hn(t,mn(e,1,Us,!0),a,i):[]}));function jr(t,e,i){var n=null==t?0:t.length;if(!n)return-1;var a=null==i?0:po(i);return a<0&&(a=mi(n+a,0)),De(t,sr(e,3),a)}function Wr(t,e,i){var n=null==t?0:t.length;if(!n)return-1;var r=n-1;return i!==a&&(r=po(i),r=i<0?mi(n+r,0):vi(r,n-1)),De(t,sr(e,3),r,!0)}function Vr(t){return null!=t&&t.length?mn(t,1):[]}function Gr(t){return t&&t.length?t[0]:a}var Ur=qn((function(t){var e=_e(t,pa);return e.length&&e[0]===t[0]?Tn(e):[]})),qr=qn((function(t){var e=Zr(t),i=_e(t,pa);return e===Zr(i)?e=a:i.pop(),i.length&&i[0]===t[0]?Tn(i,sr(e,2)):[]})),$r=qn((function(t){var e=Zr(t),i=_e(t,pa);return(e="function"==typeof e?e:a)&&i.pop(),i.length&&i[0]===t[0]?Tn(i,a,e):[]}));function Zr(t){var e=null==t?0:t.length;return e?t[e-1]:a}var Kr=qn(Qr);function Qr(t,e){return t&&t.length&&e&&e.length?Wn(t,e):t}var Jr=tr((function(t,e){var i=null==t?0:t.length,n=rn(t,e);return Vn(t,_e(e,(function(t){return mr(t,i)?+t:t})).sort(Sa)),n}));function ts(t){return null==t?t:wi.call(t)}var es=qn((function(t){return la(mn(t,1,Us,!0))})),is=qn((function(t){var e=Zr(t);return Us(e)&&(e=a),la(mn(t,1,Us,!0),sr(e,2))})),ns=qn((function(t){var e=Zr(t);return e="function"==typeof e?e:a,la(mn(t,1,Us,!0),a,e)}));function as(t){if(!t||!t.length)return[];var e=0;return t=ke(t,(function(t){if(Us(t))return e=mi(t.length,e),!0})),Xe(e,(function(e){return _e(t,Re(e))}))}function rs(t,e){if(!t||!t.length)return[];var i=as(t);return null==e?i:_e(i,(function(t){return ve(e,a,t)}))}var ss=qn((function(t,e){return Us(t)?hn(t,e):[]})),os=qn((function(t){return fa(ke(t,Us))})),ls=qn((function(t){var e=Zr(t);return Us(e)&&(e=a),fa(ke(t,Us),sr(e,2))})),cs=qn((function(t){var e=Zr(t);return e="function"==typeof e?e:a,fa(ke(t,Us),a,e)})),hs=qn(as),us=qn((function(t){var e=t.length,i=e>1?t[e-1]:a;return i="function"==typeof i?(t.pop(),i):a,rs(t,i)}));function ds(t){var e=zi(t);return e.__chain__=!0,e}function fs(t,e){return e(t)}var gs=tr((function(t){var e=t.length,i=e?t[0]:0,n=this.__wrapped__,r=function(e){return rn(e,t)};return!(e>1||this.__actions__.length)&&n instanceof Bi&&mr(i)?((n=n.slice(i,+i+(e?1:0))).__actions__.push({func:fs,args:[r],thisArg:a}),new Xi(n,this.__chain__).thru((function(t){return e&&!t.length&&t.push(a),t}))):this.thru(r)})),ps=Pa((function(t,e,i){It.call(t,i)?++t[i]:an(t,i,1)})),ms=Fa(jr),vs=Fa(Wr);function xs(t,e){return(Ws(t)?be:un)(t,sr(e,3))}function bs(t,e){return(Ws(t)?ye:dn)(t,sr(e,3))}var ys=Pa((function(t,e,i){It.call(t,i)?t[i].push(e):an(t,i,[e])})),ws=qn((function(t,e,i){var a=-1,r="function"==typeof e,s=Gs(t)?n(t.length):[];return un(t,(function(t){s[++a]=r?ve(e,t,i):Pn(t,e,i)})),s})),ks=Pa((function(t,e,i){an(t,i,e)}));function As(t,e){return(Ws(t)?_e:Rn)(t,sr(e,3))}var Ss=Pa((function(t,e,i){t[i?0:1].push(e)}),(function(){return[[],[]]})),_s=qn((function(t,e){if(null==t)return[];var i=e.length;return i>1&&vr(t,e[0],e[1])?e=[]:i>2&&vr(e[0],e[1],e[2])&&(e=[e[0]]),Bn(t,mn(e,1),[])})),Cs=Me||function(){return re.Date.now()};function Es(t,e,i){return e=i?a:e,e=t&&null==e?t.length:e,$a(t,c,a,a,a,a,e)}function Ts(t,e){var i;if("function"!=typeof e)throw new Et(r);return t=po(t),function(){return--t>0&&(i=e.apply(this,arguments)),t<=1&&(e=a),i}}var Ps=qn((function(t,e,i){var n=1;if(i.length){var a=ei(i,rr(Ps));n|=l}return $a(t,n,e,i,a)})),Ms=qn((function(t,e,i){var n=3;if(i.length){var a=ei(i,rr(Ms));n|=l}return $a(e,n,t,i,a)}));function Ls(t,e,i){var n,s,o,l,c,h,u=0,d=!1,f=!1,g=!0;if("function"!=typeof t)throw new Et(r);function p(e){var i=n,r=s;return n=s=a,u=e,l=t.apply(r,i)}function m(t){return u=t,c=Pr(x,e),d?p(t):l}function v(t){var i=t-h;return h===a||i>=e||i<0||f&&t-u>=o}function x(){var t=Cs();if(v(t))return b(t);c=Pr(x,function(t){var i=e-(t-h);return f?vi(i,o-(t-u)):i}(t))}function b(t){return c=a,g&&n?p(t):(n=s=a,l)}function y(){var t=Cs(),i=v(t);if(n=arguments,s=this,h=t,i){if(c===a)return m(h);if(f)return ya(c),c=Pr(x,e),p(h)}return c===a&&(c=Pr(x,e)),l}return e=vo(e)||0,to(i)&&(d=!!i.leading,o=(f="maxWait"in i)?mi(vo(i.maxWait)||0,e):o,g="trailing"in i?!!i.trailing:g),y.cancel=function(){c!==a&&ya(c),u=0,n=h=s=c=a},y.flush=function(){return c===a?l:b(Cs())},y}var Ds=qn((function(t,e){return cn(t,1,e)})),Is=qn((function(t,e,i){return cn(t,vo(e)||0,i)}));function Os(t,e){if("function"!=typeof t||null!=e&&"function"!=typeof e)throw new Et(r);var i=function(){var n=arguments,a=e?e.apply(this,n):n[0],r=i.cache;if(r.has(a))return r.get(a);var s=t.apply(this,n);return i.cache=r.set(a,s)||r,s};return i.cache=new(Os.Cache||Vi),i}function Ns(t){if("function"!=typeof t)throw new Et(r);return function(){var e=arguments;switch(e.length){case 0:return!t.call(this);case 1:return!t.call(this,e[0]);case 2:return!t.call(this,e[0],e[1]);case 3:return!t.call(this,e[0],e[1],e[2])}return!t.apply(this,e)}}Os.Cache=Vi;var Fs=xa((function(t,e){var i=(e=1==e.length&&Ws(e[0])?_e(e[0],je(sr())):_e(mn(e,1),je(sr()))).length;return qn((function(n){for(var a=-1,r=vi(n.length,i);++a<r;)n[a]=e[a].call(this,n[a]);return ve(t,this,n)}))})),Rs=qn((function(t,e){var i=ei(e,rr(Rs));return $a(t,l,a,e,i)})),zs=qn((function(t,e){var i=ei(e,rr(zs));return $a(t,64,a,e,i)})),Hs=tr((function(t,e){return $a(t,256,a,a,a,e)}));function Ys(t,e){return t===e||t!=t&&e!=e}var Xs=Wa(_n),Bs=Wa((function(t,e){return t>=e})),js=Mn(function(){return arguments}())?Mn:function(t){return eo(t)&&It.call(t,"callee")&&!te.call(t,"callee")},Ws=n.isArray,Vs=ue?je(ue):function(t){return eo(t)&&Sn(t)==L};function Gs(t){return null!=t&&Js(t.length)&&!Ks(t)}function Us(t){return eo(t)&&Gs(t)}var qs=di||vl,$s=de?je(de):function(t){return eo(t)&&Sn(t)==x};function Zs(t){if(!eo(t))return!1;var e=Sn(t);return e==b||"[object DOMException]"==e||"string"==typeof t.message&&"string"==typeof t.name&&!ao(t)}function Ks(t){if(!to(t))return!1;var e=Sn(t);return e==y||e==w||"[object AsyncFunction]"==e||"[object Proxy]"==e}function Qs(t){return"number"==typeof t&&t==po(t)}function Js(t){return"number"==typeof t&&t>-1&&t%1==0&&t<=u}function to(t){var e=typeof t;return null!=t&&("object"==e||"function"==e)}function eo(t){return null!=t&&"object"==typeof t}var io=fe?je(fe):function(t){return eo(t)&&dr(t)==k};function no(t){return"number"==typeof t||eo(t)&&Sn(t)==A}function ao(t){if(!eo(t)||Sn(t)!=S)return!1;var e=Gt(t);if(null===e)return!0;var i=It.call(e,"constructor")&&e.constructor;return"function"==typeof i&&i instanceof i&&Dt.call(i)==Rt}var ro=ge?je(ge):function(t){return eo(t)&&Sn(t)==C},so=pe?je(pe):function(t){return eo(t)&&dr(t)==E};function oo(t){return"string"==typeof t||!Ws(t)&&eo(t)&&Sn(t)==T}function lo(t){return"symbol"==typeof t||eo(t)&&Sn(t)==P}var co=me?je(me):function(t){return eo(t)&&Js(t.length)&&!!Qt[Sn(t)]},ho=Wa(Fn),uo=Wa((function(t,e){return t<=e}));function fo(t){if(!t)return[];if(Gs(t))return oo(t)?ri(t):Ea(t);if(se&&t[se])return function(t){for(var e,i=[];!(e=t.next()).done;)i.push(e.value);return i}(t[se]());var e=dr(t);return(e==k?Je:e==E?ii:Xo)(t)}function go(t){return t?(t=vo(t))===h||t===-1/0?17976931348623157e292*(t<0?-1:1):t==t?t:0:0===t?t:0}function po(t){var e=go(t),i=e%1;return e==e?i?e-i:e:0}function mo(t){return t?sn(po(t),0,f):0}function vo(t){if("number"==typeof t)return t;if(lo(t))return d;if(to(t)){var e="function"==typeof t.valueOf?t.valueOf():t;t=to(e)?e+"":e}if("string"!=typeof t)return 0===t?t:+t;t=Be(t);var i=gt.test(t);return i||mt.test(t)?ie(t.slice(2),i?2:8):ft.test(t)?d:+t}function xo(t){return Ta(t,Io(t))}function bo(t){return null==t?"":oa(t)}var yo=Ma((function(t,e){if(wr(e)||Gs(e))Ta(e,Do(e),t);else for(var i in e)It.call(e,i)&&Ji(t,i,e[i])})),wo=Ma((function(t,e){Ta(e,Io(e),t)})),ko=Ma((function(t,e,i,n){Ta(e,Io(e),t,n)})),Ao=Ma((function(t,e,i,n){Ta(e,Do(e),t,n)})),So=tr(rn),_o=qn((function(t,e){t=St(t);var i=-1,n=e.length,r=n>2?e[2]:a;for(r&&vr(e[0],e[1],r)&&(n=1);++i<n;)for(var s=e[i],o=Io(s),l=-1,c=o.length;++l<c;){var h=o[l],u=t[h];(u===a||Ys(u,Mt[h])&&!It.call(t,h))&&(t[h]=s[h])}return t})),Co=qn((function(t){return t.push(a,Ka),ve(No,a,t)}));function Eo(t,e,i){var n=null==t?a:kn(t,e);return n===a?i:n}function To(t,e){return null!=t&&fr(t,e,En)}var Po=Ha((function(t,e,i){null!=e&&"function"!=typeof e.toString&&(e=Ft.call(e)),t[e]=i}),el(al)),Mo=Ha((function(t,e,i){null!=e&&"function"!=typeof e.toString&&(e=Ft.call(e)),It.call(t,e)?t[e].push(i):t[e]=[i]}),sr),Lo=qn(Pn);function Do(t){return Gs(t)?qi(t):Nn(t)}function Io(t){return Gs(t)?qi(t,!0):function(t){if(!to(t))return function(t){var e=[];if(null!=t)for(var i in St(t))e.push(i);return e}(t);var e=wr(t),i=[];for(var n in t)("constructor"!=n||!e&&It.call(t,n))&&i.push(n);return i}(t)}var Oo=Ma((function(t,e,i){Yn(t,e,i)})),No=Ma((function(t,e,i,n){Yn(t,e,i,n)})),Fo=tr((function(t,e){var i={};if(null==t)return i;var n=!1;e=_e(e,(function(e){return e=va(e,t),n||(n=e.length>1),e})),Ta(t,ir(t),i),n&&(i=on(i,7,Qa));for(var a=e.length;a--;)ca(i,e[a]);return i})),Ro=tr((function(t,e){return null==t?{}:function(t,e){return jn(t,e,(function(e,i){return To(t,i)}))}(t,e)}));function zo(t,e){if(null==t)return{};var i=_e(ir(t),(function(t){return[t]}));return e=sr(e),jn(t,i,(function(t,i){return e(t,i[0])}))}var Ho=qa(Do),Yo=qa(Io);function Xo(t){return null==t?[]:We(t,Do(t))}var Bo=Oa((function(t,e,i){return e=e.toLowerCase(),t+(i?jo(e):e)}));function jo(t){return Ko(bo(t).toLowerCase())}function Wo(t){return(t=bo(t))&&t.replace(xt,$e).replace(Vt,"")}var Vo=Oa((function(t,e,i){return t+(i?"-":"")+e.toLowerCase()})),Go=Oa((function(t,e,i){return t+(i?" ":"")+e.toLowerCase()})),Uo=Ia("toLowerCase"),qo=Oa((function(t,e,i){return t+(i?"_":"")+e.toLowerCase()})),$o=Oa((function(t,e,i){return t+(i?" ":"")+Ko(e)})),Zo=Oa((function(t,e,i){return t+(i?" ":"")+e.toUpperCase()})),Ko=Ia("toUpperCase");function Qo(t,e,i){return t=bo(t),(e=i?a:e)===a?function(t){return $t.test(t)}(t)?function(t){return t.match(Ut)||[]}(t):function(t){return t.match(lt)||[]}(t):t.match(e)||[]}var Jo=qn((function(t,e){try{return ve(t,a,e)}catch(t){return Zs(t)?t:new wt(t)}})),tl=tr((function(t,e){return be(e,(function(e){e=Rr(e),an(t,e,Ps(t[e],t))})),t}));function el(t){return function(){return t}}var il=Ra(),nl=Ra(!0);function al(t){return t}function rl(t){return On("function"==typeof t?t:on(t,1))}var sl=qn((function(t,e){return function(i){return Pn(i,t,e)}})),ol=qn((function(t,e){return function(i){return Pn(t,i,e)}}));function ll(t,e,i){var n=Do(e),a=wn(e,n);null!=i||to(e)&&(a.length||!n.length)||(i=e,e=t,t=this,a=wn(e,Do(e)));var r=!(to(i)&&"chain"in i&&!i.chain),s=Ks(t);return be(a,(function(i){var n=e[i];t[i]=n,s&&(t.prototype[i]=function(){var e=this.__chain__;if(r||e){var i=t(this.__wrapped__),a=i.__actions__=Ea(this.__actions__);return a.push({func:n,args:arguments,thisArg:t}),i.__chain__=e,i}return n.apply(t,Ce([this.value()],arguments))})})),t}function cl(){}var hl=Xa(_e),ul=Xa(we),dl=Xa(Pe);function fl(t){return xr(t)?Re(Rr(t)):function(t){return function(e){return kn(e,t)}}(t)}var gl=ja(),pl=ja(!0);function ml(){return[]}function vl(){return!1}var xl,bl=Ya((function(t,e){return t+e}),0),yl=Ga("ceil"),wl=Ya((function(t,e){return t/e}),1),kl=Ga("floor"),Al=Ya((function(t,e){return t*e}),1),Sl=Ga("round"),_l=Ya((function(t,e){return t-e}),0);return zi.after=function(t,e){if("function"!=typeof e)throw new Et(r);return t=po(t),function(){if(--t<1)return e.apply(this,arguments)}},zi.ary=Es,zi.assign=yo,zi.assignIn=wo,zi.assignInWith=ko,zi.assignWith=Ao,zi.at=So,zi.before=Ts,zi.bind=Ps,zi.bindAll=tl,zi.bindKey=Ms,zi.castArray=function(){if(!arguments.length)return[];var t=arguments[0];return Ws(t)?t:[t]},zi.chain=ds,zi.chunk=function(t,e,i){e=(i?vr(t,e,i):e===a)?1:mi(po(e),0);var r=null==t?0:t.length;if(!r||e<1)return[];for(var s=0,o=0,l=n(ci(r/e));s<r;)l[o++]=ea(t,s,s+=e);return l},zi.compact=function(t){for(var e=-1,i=null==t?0:t.length,n=0,a=[];++e<i;){var r=t[e];r&&(a[n++]=r)}return a},zi.concat=function(){var t=arguments.length;if(!t)return[];for(var e=n(t-1),i=arguments[0],a=t;a--;)e[a-1]=arguments[a];return Ce(Ws(i)?Ea(i):[i],mn(e,1))},zi.cond=function(t){var e=null==t?0:t.length,i=sr();return t=e?_e(t,(function(t){if("function"!=typeof t[1])throw new Et(r);return[i(t[0]),t[1]]})):[],qn((function(i){for(var n=-1;++n<e;){var a=t[n];if(ve(a[0],this,i))return ve(a[1],this,i)}}))},zi.conforms=function(t){return function(t){var e=Do(t);return function(i){return ln(i,t,e)}}(on(t,1))},zi.constant=el,zi.countBy=ps,zi.create=function(t,e){var i=Hi(t);return null==e?i:nn(i,e)},zi.curry=function t(e,i,n){var r=$a(e,8,a,a,a,a,a,i=n?a:i);return r.placeholder=t.placeholder,r},zi.curryRight=function t(e,i,n){var r=$a(e,16,a,a,a,a,a,i=n?a:i);return r.placeholder=t.placeholder,r},zi.debounce=Ls,zi.defaults=_o,zi.defaultsDeep=Co,zi.defer=Ds,zi.delay=Is,zi.difference=Yr,zi.differenceBy=Xr,zi.differenceWith=Br,zi.drop=function(t,e,i){var n=null==t?0:t.length;return n?ea(t,(e=i||e===a?1:po(e))<0?0:e,n):[]},zi.dropRight=function(t,e,i){var n=null==t?0:t.length;return n?ea(t,0,(e=n-(e=i||e===a?1:po(e)))<0?0:e):[]},zi.dropRightWhile=function(t,e){return t&&t.length?ua(t,sr(e,3),!0,!0):[]},zi.dropWhile=function(t,e){return t&&t.length?ua(t,sr(e,3),!0):[]},zi.fill=function(t,e,i,n){var r=null==t?0:t.length;return r?(i&&"number"!=typeof i&&vr(t,e,i)&&(i=0,n=r),function(t,e,i,n){var r=t.length;for((i=po(i))<0&&(i=-i>r?0:r+i),(n=n===a||n>r?r:po(n))<0&&(n+=r),n=i>n?0:mo(n);i<n;)t[i++]=e;return t}(t,e,i,n)):[]},zi.filter=function(t,e){return(Ws(t)?ke:pn)(t,sr(e,3))},zi.flatMap=function(t,e){return mn(As(t,e),1)},zi.flatMapDeep=function(t,e){return mn(As(t,e),h)},zi.flatMapDepth=function(t,e,i){return i=i===a?1:po(i),mn(As(t,e),i)},zi.flatten=Vr,zi.flattenDeep=function(t){return null!=t&&t.length?mn(t,h):[]},zi.flattenDepth=function(t,e){return null!=t&&t.length?mn(t,e=e===a?1:po(e)):[]},zi.flip=function(t){return $a(t,512)},zi.flow=il,zi.flowRight=nl,zi.fromPairs=function(t){for(var e=-1,i=null==t?0:t.length,n={};++e<i;){var a=t[e];n[a[0]]=a[1]}return n},zi.functions=function(t){return null==t?[]:wn(t,Do(t))},zi.functionsIn=function(t){return null==t?[]:wn(t,Io(t))},zi.groupBy=ys,zi.initial=function(t){return null!=t&&t.length?ea(t,0,-1):[]},zi.intersection=Ur,zi.intersectionBy=qr,zi.intersectionWith=$r,zi.invert=Po,zi.invertBy=Mo,zi.invokeMap=ws,zi.iteratee=rl,zi.keyBy=ks,zi.keys=Do,zi.keysIn=Io,zi.map=As,zi.mapKeys=function(t,e){var i={};return e=sr(e,3),bn(t,(function(t,n,a){an(i,e(t,n,a),t)})),i},zi.mapValues=function(t,e){var i={};return e=sr(e,3),bn(t,(function(t,n,a){an(i,n,e(t,n,a))})),i},zi.matches=function(t){return zn(on(t,1))},zi.matchesProperty=function(t,e){return Hn(t,on(e,1))},zi.memoize=Os,zi.merge=Oo,zi.mergeWith=No,zi.method=sl,zi.methodOf=ol,zi.mixin=ll,zi.negate=Ns,zi.nthArg=function(t){return t=po(t),qn((function(e){return Xn(e,t)}))},zi.omit=Fo,zi.omitBy=function(t,e){return zo(t,Ns(sr(e)))},zi.once=function(t){return Ts(2,t)},zi.orderBy=function(t,e,i,n){return null==t?[]:(Ws(e)||(e=null==e?[]:[e]),Ws(i=n?a:i)||(i=null==i?[]:[i]),Bn(t,e,i))},zi.over=hl,zi.overArgs=Fs,zi.overEvery=ul,zi.overSome=dl,zi.partial=Rs,zi.partialRight=zs,zi.partition=Ss,zi.pick=Ro,zi.pickBy=zo,zi.property=fl,zi.propertyOf=function(t){return function(e){return null==t?a:kn(t,e)}},zi.pull=Kr,zi.pullAll=Qr,zi.pullAllBy=function(t,e,i){return t&&t.length&&e&&e.length?Wn(t,e,sr(i,2)):t},zi.pullAllWith=function(t,e,i){return t&&t.length&&e&&e.length?Wn(t,e,a,i):t},zi.pullAt=Jr,zi.range=gl,zi.rangeRight=pl,zi.rearg=Hs,zi.reject=function(t,e){return(Ws(t)?ke:pn)(t,Ns(sr(e,3)))},zi.remove=function(t,e){var i=[];if(!t||!t.length)return i;var n=-1,a=[],r=t.length;for(e=sr(e,3);++n<r;){var s=t[n];e(s,n,t)&&(i.push(s),a.push(n))}return Vn(t,a),i},zi.rest=function(t,e){if("function"!=typeof t)throw new Et(r);return qn(t,e=e===a?e:po(e))},zi.reverse=ts,zi.sampleSize=function(t,e,i){return e=(i?vr(t,e,i):e===a)?1:po(e),(Ws(t)?Zi:Zn)(t,e)},zi.set=function(t,e,i){return null==t?t:Kn(t,e,i)},zi.setWith=function(t,e,i,n){return n="function"==typeof n?n:a,null==t?t:Kn(t,e,i,n)},zi.shuffle=function(t){return(Ws(t)?Ki:ta)(t)},zi.slice=function(t,e,i){var n=null==t?0:t.length;return n?(i&&"number"!=typeof i&&vr(t,e,i)?(e=0,i=n):(e=null==e?0:po(e),i=i===a?n:po(i)),ea(t,e,i)):[]},zi.sortBy=_s,zi.sortedUniq=function(t){return t&&t.length?ra(t):[]},zi.sortedUniqBy=function(t,e){return t&&t.length?ra(t,sr(e,2)):[]},zi.split=function(t,e,i){return i&&"number"!=typeof i&&vr(t,e,i)&&(e=i=a),(i=i===a?f:i>>>0)?(t=bo(t))&&("string"==typeof e||null!=e&&!ro(e))&&!(e=oa(e))&&Qe(t)?ba(ri(t),0,i):t.split(e,i):[]},zi.spread=function(t,e){if("function"!=typeof t)throw new Et(r);return e=null==e?0:mi(po(e),0),qn((function(i){var n=i[e],a=ba(i,0,e);return n&&Ce(a,n),ve(t,this,a)}))},zi.tail=function(t){var e=null==t?0:t.length;return e?ea(t,1,e):[]},zi.take=function(t,e,i){return t&&t.length?ea(t,0,(e=i||e===a?1:po(e))<0?0:e):[]},zi.takeRight=function(t,e,i){var n=null==t?0:t.length;return n?ea(t,(e=n-(e=i||e===a?1:po(e)))<0?0:e,n):[]},zi.takeRightWhile=function(t,e){return t&&t.length?ua(t,sr(e,3),!1,!0):[]},zi.takeWhile=function(t,e){return t&&t.length?ua(t,sr(e,3)):[]},zi.tap=function(t,e){return e(t),t},zi.throttle=function(t,e,i){var n=!0,a=!0;if("function"!=typeof t)throw new Et(r);return to(i)&&(n="leading"in i?!!i.leading:n,a="trailing"in i?!!i.trailing:a),Ls(t,e,{leading:n,maxWait:e,trailing:a})},zi.thru=fs,zi.toArray=fo,zi.toPairs=Ho,zi.toPairsIn=Yo,zi.toPath=function(t){return Ws(t)?_e(t,Rr):lo(t)?[t]:Ea(Fr(bo(t)))},zi.toPlainObject=xo,zi.transform=function(t,e,i){var n=Ws(t),a=n||qs(t)||co(t);if(e=sr(e,4),null==i){var r=t&&t.constructor;i=a?n?new r:[]:to(t)&&Ks(r)?Hi(Gt(t)):{}}return(a?be:bn)(t,(function(t,n,a){return e(i,t,n,a)})),i},zi.unary=function(t){return Es(t,1)},zi.union=es,zi.unionBy=is,zi.unionWith=ns,zi.uniq=function(t){return t&&t.length?la(t):[]},zi.uniqBy=function(t,e){return t&&t.length?la(t,sr(e,2)):[]},zi.uniqWith=function(t,e){return e="function"==typeof e?e:a,t&&t.length?la(t,a,e):[]},zi.unset=function(t,e){return null==t||ca(t,e)},zi.unzip=as,zi.unzipWith=rs,zi.update=function(t,e,i){return null==t?t:ha(t,e,ma(i))},zi.updateWith=function(t,e,i,n){return n="function"==typeof n?n:a,null==t?t:ha(t,e,ma(i),n)},zi.values=Xo,zi.valuesIn=function(t){return null==t?[]:We(t,Io(t))},zi.without=ss,zi.words=Qo,zi.wrap=function(t,e){return Rs(ma(e),t)},zi.xor=os,zi.xorBy=ls,zi.xorWith=cs,zi.zip=hs,zi.zipObject=function(t,e){return ga(t||[],e||[],Ji)},zi.zipObjectDeep=function(t,e){return ga(t||[],e||[],Kn)},zi.zipWith=us,zi.entries=Ho,zi.entriesIn=Yo,zi.extend=wo,zi.extendWith=ko,ll(zi,zi),zi.add=bl,zi.attempt=Jo,zi.camelCase=Bo,zi.capitalize=jo,zi.ceil=yl,zi.clamp=function(t,e,i){return i===a&&(i=e,e=a),i!==a&&(i=(i=vo(i))==i?i:0),e!==a&&(e=(e=vo(e))==e?e:0),sn(vo(t),e,i)},zi.clone=function(t){return on(t,4)},zi.cloneDeep=function(t){return on(t,5)},zi.cloneDeepWith=function(t,e){return on(t,5,e="function"==typeof e?e:a)},zi.cloneWith=function(t,e){return on(t,4,e="function"==typeof e?e:a)},zi.conformsTo=function(t,e){return null==e||ln(t,e,Do(e))},zi.deburr=Wo,zi.defaultTo=function(t,e){return null==t||t!=t?e:t},zi.divide=wl,zi.endsWith=function(t,e,i){t=bo(t),e=oa(e);var n=t.length,r=i=i===a?n:sn(po(i),0,n);return(i-=e.length)>=0&&t.slice(i,r)==e},zi.eq=Ys,zi.escape=function(t){return(t=bo(t))&&q.test(t)?t.replace(G,Ze):t},zi.escapeRegExp=function(t){return(t=bo(t))&&it.test(t)?t.replace(et,"\\$&"):t},zi.every=function(t,e,i){var n=Ws(t)?we:fn;return i&&vr(t,e,i)&&(e=a),n(t,sr(e,3))},zi.find=ms,zi.findIndex=jr,zi.findKey=function(t,e){return Le(t,sr(e,3),bn)},zi.findLast=vs,zi.findLastIndex=Wr,zi.findLastKey=function(t,e){return Le(t,sr(e,3),yn)},zi.floor=kl,zi.forEach=xs,zi.forEachRight=bs,zi.forIn=function(t,e){return null==t?t:vn(t,sr(e,3),Io)},zi.forInRight=function(t,e){return null==t?t:xn(t,sr(e,3),Io)},zi.forOwn=function(t,e){return t&&bn(t,sr(e,3))},zi.forOwnRight=function(t,e){return t&&yn(t,sr(e,3))},zi.get=Eo,zi.gt=Xs,zi.gte=Bs,zi.has=function(t,e){return null!=t&&fr(t,e,Cn)},zi.hasIn=To,zi.head=Gr,zi.identity=al,zi.includes=function(t,e,i,n){t=Gs(t)?t:Xo(t),i=i&&!n?po(i):0;var a=t.length;return i<0&&(i=mi(a+i,0)),oo(t)?i<=a&&t.indexOf(e,i)>-1:!!a&&Ie(t,e,i)>-1},zi.indexOf=function(t,e,i){var n=null==t?0:t.length;if(!n)return-1;var a=null==i?0:po(i);return a<0&&(a=mi(n+a,0)),Ie(t,e,a)},zi.inRange=function(t,e,i){return e=go(e),i===a?(i=e,e=0):i=go(i),function(t,e,i){return t>=vi(e,i)&&t<mi(e,i)}(t=vo(t),e,i)},zi.invoke=Lo,zi.isArguments=js,zi.isArray=Ws,zi.isArrayBuffer=Vs,zi.isArrayLike=Gs,zi.isArrayLikeObject=Us,zi.isBoolean=function(t){return!0===t||!1===t||eo(t)&&Sn(t)==v},zi.isBuffer=qs,zi.isDate=$s,zi.isElement=function(t){return eo(t)&&1===t.nodeType&&!ao(t)},zi.isEmpty=function(t){if(null==t)return!0;if(Gs(t)&&(Ws(t)||"string"==typeof t||"function"==typeof t.splice||qs(t)||co(t)||js(t)))return!t.length;var e=dr(t);if(e==k||e==E)return!t.size;if(wr(t))return!Nn(t).length;for(var i in t)if(It.call(t,i))return!1;return!0},zi.isEqual=function(t,e){return Ln(t,e)},zi.isEqualWith=function(t,e,i){var n=(i="function"==typeof i?i:a)?i(t,e):a;return n===a?Ln(t,e,a,i):!!n},zi.isError=Zs,zi.isFinite=function(t){return"number"==typeof t&&fi(t)},zi.isFunction=Ks,zi.isInteger=Qs,zi.isLength=Js,zi.isMap=io,zi.isMatch=function(t,e){return t===e||Dn(t,e,lr(e))},zi.isMatchWith=function(t,e,i){return i="function"==typeof i?i:a,Dn(t,e,lr(e),i)},zi.isNaN=function(t){return no(t)&&t!=+t},zi.isNative=function(t){if(yr(t))throw new wt("Unsupported core-js use. Try https://npms.io/search?q=ponyfill.");return In(t)},zi.isNil=function(t){return null==t},zi.isNull=function(t){return null===t},zi.isNumber=no,zi.isObject=to,zi.isObjectLike=eo,zi.isPlainObject=ao,zi.isRegExp=ro,zi.isSafeInteger=function(t){return Qs(t)&&t>=-9007199254740991&&t<=u},zi.isSet=so,zi.isString=oo,zi.isSymbol=lo,zi.isTypedArray=co,zi.isUndefined=function(t){return t===a},zi.isWeakMap=function(t){return eo(t)&&dr(t)==M},zi.isWeakSet=function(t){return eo(t)&&"[object WeakSet]"==Sn(t)},zi.join=function(t,e){return null==t?"":gi.call(t,e)},zi.kebabCase=Vo,zi.last=Zr,zi.lastIndexOf=function(t,e,i){var n=null==t?0:t.length;if(!n)return-1;var r=n;return i!==a&&(r=(r=po(i))<0?mi(n+r,0):vi(r,n-1)),e==e?function(t,e,i){for(var n=i+1;n--;)if(t[n]===e)return n;return n}(t,e,r):De(t,Ne,r,!0)},zi.lowerCase=Go,zi.lowerFirst=Uo,zi.lt=ho,zi.lte=uo,zi.max=function(t){return t&&t.length?gn(t,al,_n):a},zi.maxBy=function(t,e){return t&&t.length?gn(t,sr(e,2),_n):a},zi.mean=function(t){return Fe(t,al)},zi.meanBy=function(t,e){return Fe(t,sr(e,2))},zi.min=function(t){return t&&t.length?gn(t,al,Fn):a},zi.minBy=function(t,e){return t&&t.length?gn(t,sr(e,2),Fn):a},zi.stubArray=ml,zi.stubFalse=vl,zi.stubObject=function(){return{}},zi.stubString=function(){return""},zi.stubTrue=function(){return!0},zi.multiply=Al,zi.nth=function(t,e){return t&&t.length?Xn(t,po(e)):a},zi.noConflict=function(){return re._===this&&(re._=zt),this},zi.noop=cl,zi.now=Cs,zi.pad=function(t,e,i){t=bo(t);var n=(e=po(e))?ai(t):0;if(!e||n>=e)return t;var a=(e-n)/2;return Ba(hi(a),i)+t+Ba(ci(a),i)},zi.padEnd=function(t,e,i){t=bo(t);var n=(e=po(e))?ai(t):0;return e&&n<e?t+Ba(e-n,i):t},zi.padStart=function(t,e,i){t=bo(t);var n=(e=po(e))?ai(t):0;return e&&n<e?Ba(e-n,i)+t:t},zi.parseInt=function(t,e,i){return i||null==e?e=0:e&&(e=+e),bi(bo(t).replace(nt,""),e||0)},zi.random=function(t,e,i){if(i&&"boolean"!=typeof i&&vr(t,e,i)&&(e=i=a),i===a&&("boolean"==typeof e?(i=e,e=a):"boolean"==typeof t&&(i=t,t=a)),t===a&&e===a?(t=0,e=1):(t=go(t),e===a?(e=t,t=0):e=go(e)),t>e){var n=t;t=e,e=n}if(i||t%1||e%1){var r=yi();return vi(t+r*(e-t+ee("1e-"+((r+"").length-1))),e)}return Gn(t,e)},zi.reduce=function(t,e,i){var n=Ws(t)?Ee:He,a=arguments.length<3;return n(t,sr(e,4),i,a,un)},zi.reduceRight=function(t,e,i){var n=Ws(t)?Te:He,a=arguments.length<3;return n(t,sr(e,4),i,a,dn)},zi.repeat=function(t,e,i){return e=(i?vr(t,e,i):e===a)?1:po(e),Un(bo(t),e)},zi.replace=function(){var t=arguments,e=bo(t[0]);return t.length<3?e:e.replace(t[1],t[2])},zi.result=function(t,e,i){var n=-1,r=(e=va(e,t)).length;for(r||(r=1,t=a);++n<r;){var s=null==t?a:t[Rr(e[n])];s===a&&(n=r,s=i),t=Ks(s)?s.call(t):s}return t},zi.round=Sl,zi.runInContext=t,zi.sample=function(t){return(Ws(t)?$i:$n)(t)},zi.size=function(t){if(null==t)return 0;if(Gs(t))return oo(t)?ai(t):t.length;var e=dr(t);return e==k||e==E?t.size:Nn(t).length},zi.snakeCase=qo,zi.some=function(t,e,i){var n=Ws(t)?Pe:ia;return i&&vr(t,e,i)&&(e=a),n(t,sr(e,3))},zi.sortedIndex=function(t,e){return na(t,e)},zi.sortedIndexBy=function(t,e,i){return aa(t,e,sr(i,2))},zi.sortedIndexOf=function(t,e){var i=null==t?0:t.length;if(i){var n=na(t,e);if(n<i&&Ys(t[n],e))return n}return-1},zi.sortedLastIndex=function(t,e){return na(t,e,!0)},zi.sortedLastIndexBy=function(t,e,i){return aa(t,e,sr(i,2),!0)},zi.sortedLastIndexOf=function(t,e){if(null!=t&&t.length){var i=na(t,e,!0)-1;if(Ys(t[i],e))return i}return-1},zi.startCase=$o,zi.startsWith=function(t,e,i){return t=bo(t),i=null==i?0:sn(po(i),0,t.length),e=oa(e),t.slice(i,i+e.length)==e},zi.subtract=_l,zi.sum=function(t){return t&&t.length?Ye(t,al):0},zi.sumBy=function(t,e){return t&&t.length?Ye(t,sr(e,2)):0},zi.template=function(t,e,i){var n=zi.templateSettings;i&&vr(t,e,i)&&(e=a),t=bo(t),e=ko({},e,n,Za);var r,s,o=ko({},e.imports,n.imports,Za),l=Do(o),c=We(o,l),h=0,u=e.interpolate||bt,d="__p += '",f=_t((e.escape||bt).source+"|"+u.source+"|"+(u===K?ut:bt).source+"|"+(e.evaluate||bt).source+"|$","g"),g="//# sourceURL="+(It.call(e,"sourceURL")?(e.sourceURL+"").replace(/\s/g," "):"lodash.templateSources["+ ++Kt+"]")+"\n";t.replace(f,(function(e,i,n,a,o,l){return n||(n=a),d+=t.slice(h,l).replace(yt,Ke),i&&(r=!0,d+="' +\n__e("+i+") +\n'"),o&&(s=!0,d+="';\n"+o+";\n__p += '"),n&&(d+="' +\n((__t = ("+n+")) == null ? '' : __t) +\n'"),h=l+e.length,e})),d+="';\n";var p=It.call(e,"variable")&&e.variable;if(p){if(ct.test(p))throw new wt("Invalid `variable` option passed into `_.template`")}else d="with (obj) {\n"+d+"\n}\n";d=(s?d.replace(B,""):d).replace(j,"$1").replace(W,"$1;"),d="function("+(p||"obj")+") {\n"+(p?"":"obj || (obj = {});\n")+"var __t, __p = ''"+(r?", __e = _.escape":"")+(s?", __j = Array.prototype.join;\nfunction print() { __p += __j.call(arguments, '') }\n":";\n")+d+"return __p\n}";var m=Jo((function(){return kt(l,g+"return "+d).apply(a,c)}));if(m.source=d,Zs(m))throw m;return m},zi.times=function(t,e){if((t=po(t))<1||t>u)return[];var i=f,n=vi(t,f);e=sr(e),t-=f;for(var a=Xe(n,e);++i<t;)e(i);return a},zi.toFinite=go,zi.toInteger=po,zi.toLength=mo,zi.toLower=function(t){return bo(t).toLowerCase()},zi.toNumber=vo,zi.toSafeInteger=function(t){return t?sn(po(t),-9007199254740991,u):0===t?t:0},zi.toString=bo,zi.toUpper=function(t){return bo(t).toUpperCase()},zi.trim=function(t,e,i){if((t=bo(t))&&(i||e===a))return Be(t);if(!t||!(e=oa(e)))return t;var n=ri(t),r=ri(e);return ba(n,Ge(n,r),Ue(n,r)+1).join("")},zi.trimEnd=function(t,e,i){if((t=bo(t))&&(i||e===a))return t.slice(0,si(t)+1);if(!t||!(e=oa(e)))return t;var n=ri(t);return ba(n,0,Ue(n,ri(e))+1).join("")},zi.trimStart=function(t,e,i){if((t=bo(t))&&(i||e===a))return t.replace(nt,"");if(!t||!(e=oa(e)))return t;var n=ri(t);return ba(n,Ge(n,ri(e))).join("")},zi.truncate=function(t,e){var i=30,n="...";if(to(e)){var r="separator"in e?e.separator:r;i="length"in e?po(e.length):i,n="omission"in e?oa(e.omission):n}var s=(t=bo(t)).length;if(Qe(t)){var o=ri(t);s=o.length}if(i>=s)return t;var l=i-ai(n);if(l<1)return n;var c=o?ba(o,0,l).join(""):t.slice(0,l);if(r===a)return c+n;if(o&&(l+=c.length-l),ro(r)){if(t.slice(l).search(r)){var h,u=c;for(r.global||(r=_t(r.source,bo(dt.exec(r))+"g")),r.lastIndex=0;h=r.exec(u);)var d=h.index;c=c.slice(0,d===a?l:d)}}else if(t.indexOf(oa(r),l)!=l){var f=c.lastIndexOf(r);f>-1&&(c=c.slice(0,f))}return c+n},zi.unescape=function(t){return(t=bo(t))&&U.test(t)?t.replace(V,oi):t},zi.uniqueId=function(t){var e=++Ot;return bo(t)+e},zi.upperCase=Zo,zi.upperFirst=Ko,zi.each=xs,zi.eachRight=bs,zi.first=Gr,ll(zi,(xl={},bn(zi,(function(t,e){It.call(zi.prototype,e)||(xl[e]=t)})),xl),{chain:!1}),zi.VERSION="4.17.21",be(["bind","bindKey","curry","curryRight","partial","partialRight"],(function(t){zi[t].placeholder=zi})),be(["drop","take"],(function(t,e){Bi.prototype[t]=function(i){i=i===a?1:mi(po(i),0);var n=this.__filtered__&&!e?new Bi(this):this.clone();return n.__filtered__?n.__takeCount__=vi(i,n.__takeCount__):n.__views__.push({size:vi(i,f),type:t+(n.__dir__<0?"Right":"")}),n},Bi.prototype[t+"Right"]=function(e){return this.reverse()[t](e).reverse()}})),be(["filter","map","takeWhile"],(function(t,e){var i=e+1,n=1==i||3==i;Bi.prototype[t]=function(t){var e=this.clone();return e.__iteratees__.push({iteratee:sr(t,3),type:i}),e.__filtered__=e.__filtered__||n,e}})),be(["head","last"],(function(t,e){var i="take"+(e?"Right":"");Bi.prototype[t]=function(){return this[i](1).value()[0]}})),be(["initial","tail"],(function(t,e){var i="drop"+(e?"":"Right");Bi.prototype[t]=function(){return this.__filtered__?new Bi(this):this[i](1)}})),Bi.prototype.compact=function(){return this.filter(al)},Bi.prototype.find=function(t){return this.filter(t).head()},Bi.prototype.findLast=function(t){return this.reverse().find(t)},Bi.prototype.invokeMap=qn((function(t,e){return"function"==typeof t?new Bi(this):this.map((function(i){return Pn(i,t,e)}))})),Bi.prototype.reject=function(t){return this.filter(Ns(sr(t)))},Bi.prototype.slice=function(t,e){t=po(t);var i=this;return i.__filtered__&&(t>0||e<0)?new Bi(i):(t<0?i=i.takeRight(-t):t&&(i=i.drop(t)),e!==a&&(i=(e=po(e))<0?i.dropRight(-e):i.take(e-t)),i)},Bi.prototype.takeRightWhile=function(t){return this.reverse().takeWhile(t).reverse()},Bi.prototype.toArray=function(){return this.take(f)},bn(Bi.prototype,(function(t,e){var i=/^(?:filter|find|map|reject)|While$/.test(e),n=/^(?:head|last)$/.test(e),r=zi[n?"take"+("last"==e?"Right":""):e],s=n||/^find/.test(e);r&&(zi.prototype[e]=function(){var e=this.__wrapped__,o=n?[1]:arguments,l=e instanceof Bi,c=o[0],h=l||Ws(e),u=function(t){var e=r.apply(zi,Ce([t],o));return n&&d?e[0]:e};h&&i&&"function"==typeof c&&1!=c.length&&(l=h=!1);var d=this.__chain__,f=!!this.__actions__.length,g=s&&!d,p=l&&!f;if(!s&&h){e=p?e:new Bi(this);var m=t.apply(e,o);return m.__actions__.push({func:fs,args:[u],thisArg:a}),new Xi(m,d)}return g&&p?t.apply(this,o):(m=this.thru(u),g?n?m.value()[0]:m.value():m)})})),be(["pop","push","shift","sort","splice","unshift"],(function(t){var e=Tt[t],i=/^(?:push|sort|unshift)$/.test(t)?"tap":"thru",n=/^(?:pop|shift)$/.test(t);zi.prototype[t]=function(){var t=arguments;if(n&&!this.__chain__){var a=this.value();return e.apply(Ws(a)?a:[],t)}return this[i]((function(i){return e.apply(Ws(i)?i:[],t)}))}})),bn(Bi.prototype,(function(t,e){var i=zi[e];if(i){var n=i.name+"";It.call(Pi,n)||(Pi[n]=[]),Pi[n].push({name:e,func:i})}})),Pi[za(a,2).name]=[{name:"wrapper",func:a}],Bi.prototype.clone=function(){var t=new Bi(this.__wrapped__);return t.__actions__=Ea(this.__actions__),t.__dir__=this.__dir__,t.__filtered__=this.__filtered__,t.__iteratees__=Ea(this.__iteratees__),t.__takeCount__=this.__takeCount__,t.__views__=Ea(this.__views__),t},Bi.prototype.reverse=function(){if(this.__filtered__){var t=new Bi(this);t.__dir__=-1,t.__filtered__=!0}else(t=this.clone()).__dir__*=-1;return t},Bi.prototype.value=function(){var t=this.__wrapped__.value(),e=this.__dir__,i=Ws(t),n=e<0,a=i?t.length:0,r=function(t,e,i){for(var n=-1,a=i.length;++n<a;){var r=i[n],s=r.size;switch(r.type){case"drop":t+=s;break;case"dropRight":e-=s;break;case"take":e=vi(e,t+s);break;case"takeRight":t=mi(t,e-s)}}return{start:t,end:e}}(0,a,this.__views__),s=r.start,o=r.end,l=o-s,c=n?o:s-1,h=this.__iteratees__,u=h.length,d=0,f=vi(l,this.__takeCount__);if(!i||!n&&a==l&&f==l)return da(t,this.__actions__);var g=[];t:for(;l--&&d<f;){for(var p=-1,m=t[c+=e];++p<u;){var v=h[p],x=v.iteratee,b=v.type,y=x(m);if(2==b)m=y;else if(!y){if(1==b)continue t;break t}}g[d++]=m}return g},zi.prototype.at=gs,zi.prototype.chain=function(){return ds(this)},zi.prototype.commit=function(){return new Xi(this.value(),this.__chain__)},zi.prototype.next=function(){this.__values__===a&&(this.__values__=fo(this.value()));var t=this.__index__>=this.__values__.length;return{done:t,value:t?a:this.__values__[this.__index__++]}},zi.prototype.plant=function(t){for(var e,i=this;i instanceof Yi;){var n=Hr(i);n.__index__=0,n.__values__=a,e?r.__wrapped__=n:e=n;var r=n;i=i.__wrapped__}return r.__wrapped__=t,e},zi.prototype.reverse=function(){var t=this.__wrapped__;if(t instanceof Bi){var e=t;return this.__actions__.length&&(e=new Bi(this)),(e=e.reverse()).__actions__.push({func:fs,args:[ts],thisArg:a}),new Xi(e,this.__chain__)}return this.thru(ts)},zi.prototype.toJSON=zi.prototype.valueOf=zi.prototype.value=function(){return da(this.__wrapped__,this.__actions__)},zi.prototype.first=zi.prototype.head,se&&(zi.prototype[se]=function(){return this}),zi}();re._=li,(n=function(){return li}.call(e,i,e,t))===a||(t.exports=n)}.call(this)},79:function(t){t.exports=function(){"use strict";var t="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},e=function(){function t(t,e){for(var i=0;i<e.length;i++){var n=e[i];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,n.key,n)}}return function(e,i,n){return i&&t(e.prototype,i),n&&t(e,n),e}}();var i=function(){function i(t){(function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")})(this,i),this.afterFormat=function(){},this.allowNegative=!1,this.beforeFormat=function(){},this.negativeSignAfter=!1,this.decimalSeparator=",",this.fixed=!0,this.fractionDigits=2,this.prefix="",this.suffix="",this.thousandsSeparator=".",this.cursor="move",this.merge(t)}return e(i,[{key:"merge",value:function(e){e&&"object"===(void 0===e?"undefined":t(e))&&(this.fractionDigits=void 0===e.fractionDigits||isNaN(e.fractionDigits)?this.fractionDigits:parseInt(e.fractionDigits),this.afterFormat="function"==typeof e.afterFormat?e.afterFormat:this.afterFormat,this.beforeFormat="function"==typeof e.beforeFormat?e.beforeFormat:this.beforeFormat,this.fixed="boolean"==typeof e.fixed?e.fixed:this.fixed,this.allowNegative="boolean"==typeof e.allowNegative?e.allowNegative:this.allowNegative,this.negativeSignAfter="boolean"==typeof e.negativeSignAfter?e.negativeSignAfter:this.negativeSignAfter,this.decimalSeparator=void 0===e.decimalSeparator?this.decimalSeparator:e.decimalSeparator,this.prefix=void 0===e.prefix?this.prefix:e.prefix,this.suffix=void 0===e.suffix?this.suffix:e.suffix,this.thousandsSeparator=void 0===e.thousandsSeparator?this.thousandsSeparator:e.thousandsSeparator,this.cursor=void 0===e.cursor?this.cursor:e.cursor)}}]),i}(),n=function(){function t(t,e){for(var i=0;i<e.length;i++){var n=e[i];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,n.key,n)}}return function(e,i,n){return i&&t(e.prototype,i),n&&t(e,n),e}}();var a=function(){function t(e){(function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")})(this,t),this.args=new i(e)}return n(t,[{key:"addCompleter",value:function(t,e,i){for(var n=!(arguments.length>3&&void 0!==arguments[3])||arguments[3];t.length<i;)t=n?""+e+t:""+t+e;return t}},{key:"addPrefix",value:function(t){return""+this.args.prefix+t}},{key:"addSeparators",value:function(t){for(var e=t.length-this.args.fractionDigits,i=this.args.fixed?"d":"w",n="\\,?||\\.?(\\"+i+")",a=Math.ceil(e/3),r=this.args.decimalSeparator+"$"+(a+1),s=a;0!==s;s--)e>=3?(n="(\\"+i+"{3})"+n,e-=3):n="(\\"+i+"{"+e+"})"+n,r=s>1?this.args.thousandsSeparator+"$"+s+r:"$"+s+r;return t.replace(new RegExp(n),r)}},{key:"addSuffix",value:function(t){return""+t+this.args.suffix}},{key:"adjustDotPosition",value:function(t){var e,i=t.toString();return e=(i=i.replace(".","")).length-this.args.fractionDigits,i.substring(0,e)+"."+i.substring(e)}},{key:"completer",value:function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:1;return this.args.fixed?"".padEnd(t,"0"):"".padEnd(t,"_")}},{key:"checkNumberStart",value:function(t,e){var i=t.toString();return i[0]===e?(this.args.fixed?"0":"_")+i:i}},{key:"checkSuffix",value:function(t){var e=void 0,i=t.length-1,n=i-1,a=t.substring(i-this.args.suffix.length+1,i+this.args.suffix.length),r=t.substring(n-this.args.suffix.length+1,n+this.args.suffix.length);switch(this.args.suffix){case a:e=t;break;case r:e=""+t.substring(0,n)+t.substring(t.length+this.args.suffix.length+1,n+this.args.suffix.length)+".";break;default:e=t.substring(0,i)+"."}return e}},{key:"emptyOrInvalid",value:function(){return""+this.completer()+this.args.decimalSeparator+this.completer(this.args.fractionDigits)}},{key:"isFloat",value:function(t){return t%1!=0}},{key:"mask",value:function(t){var e=this.args.allowNegative&&-1!==t.indexOf("-"),i=""+(this.writingToNumber(t)||this.emptyOrInvalid());i=this.replaceSeparator(i,this.args.decimalSeparator,".");var n=this.completer();return isNaN(this.removeCompleter(i,n))||(i=this.replaceSeparator(i,"."),i=this.addCompleter(i||"",n,this.args.fractionDigits),i=this.args.fractionDigits>=i.length?""+n+i:i,i=this.addSeparators(i)),this.args.prefix&&(i=this.addPrefix(i)),this.args.suffix&&(i=this.addSuffix(i)),(!this.args.negativeSignAfter&&e?"-":"")+i+(this.args.negativeSignAfter&&e?"-":"")}},{key:"numberToText",value:function(t){var e=this.completer(),i=this.emptyOrInvalid();if(t=this.replaceSeparator(t.toString(),this.args.decimalSeparator,"."),!isNaN(t)){if(this.isFloat(t)){var n=t.split("."),a=n[0],r=n[1];i=""+a+(r=this.addCompleter(r||"",e,this.args.fractionDigits,!1))}else i=this.removeCompleter(t,e),i=this.addCompleter("string"==typeof i?i:"",e,this.args.fractionDigits+i.length,!1);i=this.addSeparators(i),i=this.checkNumberStart(i,this.args.decimalSeparator)}return this.args.prefix&&(i=this.addPrefix(i)),this.args.suffix&&(i=this.addSuffix(i)),i}},{key:"onlyNumber",value:function(t){for(var e=t.toString().indexOf(this.args.decimalSeparator),i=!1,n="",a=t.length-1;a>=0;a--)isFinite(t[a])||!this.args.fixed&&"_"===t[a]?n=t[a]+n:-1===e||i||t[a]!==this.args.decimalSeparator||(n=t[a].replace(this.args.decimalSeparator,".")+n,i=!0);return"."===n[0]?"0"+n:n}},{key:"removeCompleter",value:function(t,e){for(var i=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],n=function(){return i?0:t.length-1},a=n();t[a]===e;)t=t.substring(0,a-1)+t.substring(a+1,t.length),a=n();return t}},{key:"removePrefix",value:function(t){return-1!==t.indexOf(this.args.prefix,0)&&(t=t.substring(this.args.prefix.length,t.length)),t}},{key:"removeSuffix",value:function(t){var e=t.indexOf(this.args.suffix,t.length-this.args.suffix.length);if(-1!==e){var i=t.substring(0,e);t=i+t.substring(i.length+this.args.suffix.length-1,t.length-1)}return t}},{key:"replaceSeparator",value:function(t,e){var i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:"";return t.replace(new RegExp("\\"+e,"g"),i)}},{key:"textToNumber",value:function(t){var e=t.toString(),i=this.completer();return this.args.prefix&&(e=this.removePrefix(e)),this.args.suffix&&(e=this.removeSuffix(e)),(e=this.onlyNumber(e))&&(e=this.removeCompleter(e,i),e=this.checkNumberStart(e,".")),e||(this.args.fixed?"0":"")}},{key:"writingToNumber",value:function(t){var e=t.toString(),i=this.completer();return this.args.prefix&&(e=this.removePrefix(e)),this.args.suffix&&(e=this.checkSuffix(e),e=this.removeSuffix(e)),(e=this.onlyNumber(e))&&(e=this.adjustDotPosition(e),e=this.removeCompleter(e,i),e=this.checkNumberStart(e,".")),e||(this.args.fixed?"0":"")}}]),t}(),r={getCaretPosition:function(t){var e=-1;if("selectionStart"in t)e=t.selectionStart;else if(document.selection){t.focus();var i=document.selection.createRange(),n=document.selection.createRange().text.length;i.moveStart("character",-t.value.length),e=i.text.length-n}return e},setCaretPosition:function(t,e){if(t.setSelectionRange)t.focus(),t.setSelectionRange(e,e);else if(t.createTextRange){var i=t.createTextRange();i.collapse(!0),i.moveEnd("character",e),i.moveStart("character",e),i.select()}},indexMove:function(t,e,i){switch(!0){case e.length<t.length:return i+1;case e.length>t.length:return i-1;default:return i}},addPropertyMask:function(t,e){var i=this;t.maskArgs={};var n=function(n){Object.defineProperty(t.maskArgs,n,{get:function(){return e.args[n]},set:function(a){e.args[n]=a,i.refreshMask(t)}})};for(var a in e.args)n(a)},addMask:function(t,e){var i=this;t.addEventListener("input",(function(n){var a=t.value;e.args.beforeFormat(a);var r=e.mask(a),s=i.getCaretPosition(t),o=i.indexMove(r,a,s);"start"===t.maskArgs.cursor?o=0:"end"===t.maskArgs.cursor&&(o=r.length),t.value=r,t._value=r,i.setCaretPosition(t,o),e.args.afterFormat(r),!(n instanceof Event)&&i.refreshMask(t)}))},refreshMask:function(t){t.dispatchEvent(new Event("input"))}},s="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(t){return typeof t}:function(t){return t&&"function"==typeof Symbol&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},o=function(){function t(t,e){for(var i=0;i<e.length;i++){var n=e[i];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,n.key,n)}}return function(e,i,n){return i&&t(e.prototype,i),n&&t(e,n),e}}();var l=new i;return function(){function t(){!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,t)}return o(t,null,[{key:"formatToCurrency",value:function(t,e){var i=new a(void 0!==e&&"object"===(void 0===e?"undefined":s(e))?e:l);i.args.beforeFormat(t);var n=i.args.allowNegative&&-1!==t.indexOf("-"),r=i.numberToText(i.textToNumber(t)),o=(!i.args.negativeSignAfter&&n?"-":"")+r+(i.args.negativeSignAfter&&n?"-":"");return i.args.afterFormat(o),o}},{key:"formatToMask",value:function(t,e){var i=new a(void 0!==e&&"object"===(void 0===e?"undefined":s(e))?e:l),n=t.toString();i.args.beforeFormat(n);var r=i.mask(n);return i.args.afterFormat(r),r}},{key:"formatToNumber",value:function(t,e){var i=new a(void 0!==e&&"object"===(void 0===e?"undefined":s(e))?e:l),n=t.toString();i.args.beforeFormat(n);var r="0",o=i.args.allowNegative&&-1!==n.indexOf("-");return o&&(n=n.replace("-","")),n=i.textToNumber(n),this.args.fixed||(n=n.replace(new RegExp("_","g"),"")),isNaN(n)||(r=parseFloat(o?-1*n:n)),i.args.afterFormat(r),r}},{key:"setMask",value:function(e,i){if("undefined"==typeof document)throw"This function only works on client side";var n="string"==typeof e?document.querySelector(e):e,o=new a(void 0!==i&&"object"===(void 0===i?"undefined":s(i))?i:l);return r.addPropertyMask(n,o),r.addMask(n,o),r.refreshMask(n),n.formatToNumber=function(){return t.formatToNumber(n.value,n.maskArgs)},n}},{key:"args",get:function(){return l},set:function(t){l=new i(t)}}]),t}()}()},837:()=>{document.addEventListener("DOMContentLoaded",(function(t){let e={},i=[];function n(t,e){function i(t){return t.length?t[0].getTime():0}let n=i(t.selectedDates);e(t.selectedDates,!0),t.set("onChange",(function(t){let a=i(t);a!=n&&(n=a,e(t))}))}document.querySelectorAll("[fp_config]:not([disabled])").forEach((function(t){try{var n=JSON.parse(t.getAttribute("fp_config"))}catch(t){}if(n.id&&n.options){let a;if(n.options.wrap&&(t.setAttribute("data-input",""),a=t.closest(".flatpickr-wrapper"),!a))throw new Error('django-flatpickr error:: When wrap option is set to true, flatpickr input element should be contained by ".flatpickr-wrapper" element');n.linked_to&&i.push(n),e[n.id]={config:n,instance:flatpickr(a||t,n.options)}}})),i.forEach((function(t){let i=e[t.linked_to].instance,a=e[t.id].instance;n(i,(function(t){a.set("minDate",t[0]||!1)})),n(a,(function(t){i.set("maxDate",t[0]||!1)}))}))}))}},e={};function i(n){var a=e[n];if(void 0!==a)return a.exports;var r=e[n]={id:n,loaded:!1,exports:{}};return t[n].call(r.exports,r,r.exports,i),r.loaded=!0,r.exports}i.n=t=>{var e=t&&t.__esModule?()=>t.default:()=>t;return i.d(e,{a:e}),e},i.d=(t,e)=>{for(var n in e)i.o(e,n)&&!i.o(t,n)&&Object.defineProperty(t,n,{enumerable:!0,get:e[n]})},i.g=function(){if("object"==typeof globalThis)return globalThis;try{return this||new Function("return this")()}catch(t){if("object"==typeof window)return window}}(),i.o=(t,e)=>Object.prototype.hasOwnProperty.call(t,e),i.r=t=>{"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(t,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(t,"__esModule",{value:!0})},i.nmd=t=>(t.paths=[],t.children||(t.children=[]),t),(()=>{"use strict";var t={};i.r(t),i.d(t,{afterMain:()=>w,afterRead:()=>x,afterWrite:()=>S,applyStyles:()=>L,arrow:()=>$,auto:()=>s,basePlacements:()=>o,beforeMain:()=>b,beforeRead:()=>m,beforeWrite:()=>k,bottom:()=>n,clippingParents:()=>h,computeStyles:()=>J,createPopper:()=>Tt,createPopperBase:()=>Et,createPopperLite:()=>Pt,detectOverflow:()=>gt,end:()=>c,eventListeners:()=>et,flip:()=>pt,hide:()=>xt,left:()=>r,main:()=>y,modifierPhases:()=>_,offset:()=>bt,placements:()=>p,popper:()=>d,popperGenerator:()=>Ct,popperOffsets:()=>yt,preventOverflow:()=>wt,read:()=>v,reference:()=>f,right:()=>a,start:()=>l,top:()=>e,variationPlacements:()=>g,viewport:()=>u,write:()=>A}),i(486),i(953),i(924);var e="top",n="bottom",a="right",r="left",s="auto",o=[e,n,a,r],l="start",c="end",h="clippingParents",u="viewport",d="popper",f="reference",g=o.reduce((function(t,e){return t.concat([e+"-"+l,e+"-"+c])}),[]),p=[].concat(o,[s]).reduce((function(t,e){return t.concat([e,e+"-"+l,e+"-"+c])}),[]),m="beforeRead",v="read",x="afterRead",b="beforeMain",y="main",w="afterMain",k="beforeWrite",A="write",S="afterWrite",_=[m,v,x,b,y,w,k,A,S];function C(t){return t?(t.nodeName||"").toLowerCase():null}function E(t){if(null==t)return window;if("[object Window]"!==t.toString()){var e=t.ownerDocument;return e&&e.defaultView||window}return t}function T(t){return t instanceof E(t).Element||t instanceof Element}function P(t){return t instanceof E(t).HTMLElement||t instanceof HTMLElement}function M(t){return"undefined"!=typeof ShadowRoot&&(t instanceof E(t).ShadowRoot||t instanceof ShadowRoot)}const L={name:"applyStyles",enabled:!0,phase:"write",fn:function(t){var e=t.state;Object.keys(e.elements).forEach((function(t){var i=e.styles[t]||{},n=e.attributes[t]||{},a=e.elements[t];P(a)&&C(a)&&(Object.assign(a.style,i),Object.keys(n).forEach((function(t){var e=n[t];!1===e?a.removeAttribute(t):a.setAttribute(t,!0===e?"":e)})))}))},effect:function(t){var e=t.state,i={popper:{position:e.options.strategy,left:"0",top:"0",margin:"0"},arrow:{position:"absolute"},reference:{}};return Object.assign(e.elements.popper.style,i.popper),e.styles=i,e.elements.arrow&&Object.assign(e.elements.arrow.style,i.arrow),function(){Object.keys(e.elements).forEach((function(t){var n=e.elements[t],a=e.attributes[t]||{},r=Object.keys(e.styles.hasOwnProperty(t)?e.styles[t]:i[t]).reduce((function(t,e){return t[e]="",t}),{});P(n)&&C(n)&&(Object.assign(n.style,r),Object.keys(a).forEach((function(t){n.removeAttribute(t)})))}))}},requires:["computeStyles"]};function D(t){return t.split("-")[0]}var I=Math.max,O=Math.min,N=Math.round;function F(t,e){void 0===e&&(e=!1);var i=t.getBoundingClientRect(),n=1,a=1;if(P(t)&&e){var r=t.offsetHeight,s=t.offsetWidth;s>0&&(n=N(i.width)/s||1),r>0&&(a=N(i.height)/r||1)}return{width:i.width/n,height:i.height/a,top:i.top/a,right:i.right/n,bottom:i.bottom/a,left:i.left/n,x:i.left/n,y:i.top/a}}function R(t){var e=F(t),i=t.offsetWidth,n=t.offsetHeight;return Math.abs(e.width-i)<=1&&(i=e.width),Math.abs(e.height-n)<=1&&(n=e.height),{x:t.offsetLeft,y:t.offsetTop,width:i,height:n}}function z(t,e){var i=e.getRootNode&&e.getRootNode();if(t.contains(e))return!0;if(i&&M(i)){var n=e;do{if(n&&t.isSameNode(n))return!0;n=n.parentNode||n.host}while(n)}return!1}function H(t){return E(t).getComputedStyle(t)}function Y(t){return["table","td","th"].indexOf(C(t))>=0}function X(t){return((T(t)?t.ownerDocument:t.document)||window.document).documentElement}function B(t){return"html"===C(t)?t:t.assignedSlot||t.parentNode||(M(t)?t.host:null)||X(t)}function j(t){return P(t)&&"fixed"!==H(t).position?t.offsetParent:null}function W(t){for(var e=E(t),i=j(t);i&&Y(i)&&"static"===H(i).position;)i=j(i);return i&&("html"===C(i)||"body"===C(i)&&"static"===H(i).position)?e:i||function(t){var e=-1!==navigator.userAgent.toLowerCase().indexOf("firefox");if(-1!==navigator.userAgent.indexOf("Trident")&&P(t)&&"fixed"===H(t).position)return null;for(var i=B(t);P(i)&&["html","body"].indexOf(C(i))<0;){var n=H(i);if("none"!==n.transform||"none"!==n.perspective||"paint"===n.contain||-1!==["transform","perspective"].indexOf(n.willChange)||e&&"filter"===n.willChange||e&&n.filter&&"none"!==n.filter)return i;i=i.parentNode}return null}(t)||e}function V(t){return["top","bottom"].indexOf(t)>=0?"x":"y"}function G(t,e,i){return I(t,O(e,i))}function U(t){return Object.assign({},{top:0,right:0,bottom:0,left:0},t)}function q(t,e){return e.reduce((function(e,i){return e[i]=t,e}),{})}const $={name:"arrow",enabled:!0,phase:"main",fn:function(t){var i,s=t.state,l=t.name,c=t.options,h=s.elements.arrow,u=s.modifiersData.popperOffsets,d=D(s.placement),f=V(d),g=[r,a].indexOf(d)>=0?"height":"width";if(h&&u){var p=function(t,e){return U("number"!=typeof(t="function"==typeof t?t(Object.assign({},e.rects,{placement:e.placement})):t)?t:q(t,o))}(c.padding,s),m=R(h),v="y"===f?e:r,x="y"===f?n:a,b=s.rects.reference[g]+s.rects.reference[f]-u[f]-s.rects.popper[g],y=u[f]-s.rects.reference[f],w=W(h),k=w?"y"===f?w.clientHeight||0:w.clientWidth||0:0,A=b/2-y/2,S=p[v],_=k-m[g]-p[x],C=k/2-m[g]/2+A,E=G(S,C,_),T=f;s.modifiersData[l]=((i={})[T]=E,i.centerOffset=E-C,i)}},effect:function(t){var e=t.state,i=t.options.element,n=void 0===i?"[data-popper-arrow]":i;null!=n&&("string"!=typeof n||(n=e.elements.popper.querySelector(n)))&&z(e.elements.popper,n)&&(e.elements.arrow=n)},requires:["popperOffsets"],requiresIfExists:["preventOverflow"]};function Z(t){return t.split("-")[1]}var K={top:"auto",right:"auto",bottom:"auto",left:"auto"};function Q(t){var i,s=t.popper,o=t.popperRect,l=t.placement,h=t.variation,u=t.offsets,d=t.position,f=t.gpuAcceleration,g=t.adaptive,p=t.roundOffsets,m=t.isFixed,v=u.x,x=void 0===v?0:v,b=u.y,y=void 0===b?0:b,w="function"==typeof p?p({x,y}):{x,y};x=w.x,y=w.y;var k=u.hasOwnProperty("x"),A=u.hasOwnProperty("y"),S=r,_=e,C=window;if(g){var T=W(s),P="clientHeight",M="clientWidth";T===E(s)&&"static"!==H(T=X(s)).position&&"absolute"===d&&(P="scrollHeight",M="scrollWidth"),T=T,(l===e||(l===r||l===a)&&h===c)&&(_=n,y-=(m&&C.visualViewport?C.visualViewport.height:T[P])-o.height,y*=f?1:-1),l!==r&&(l!==e&&l!==n||h!==c)||(S=a,x-=(m&&C.visualViewport?C.visualViewport.width:T[M])-o.width,x*=f?1:-1)}var L,D=Object.assign({position:d},g&&K),I=!0===p?function(t){var e=t.x,i=t.y,n=window.devicePixelRatio||1;return{x:N(e*n)/n||0,y:N(i*n)/n||0}}({x,y}):{x,y};return x=I.x,y=I.y,f?Object.assign({},D,((L={})[_]=A?"0":"",L[S]=k?"0":"",L.transform=(C.devicePixelRatio||1)<=1?"translate("+x+"px, "+y+"px)":"translate3d("+x+"px, "+y+"px, 0)",L)):Object.assign({},D,((i={})[_]=A?y+"px":"",i[S]=k?x+"px":"",i.transform="",i))}const J={name:"computeStyles",enabled:!0,phase:"beforeWrite",fn:function(t){var e=t.state,i=t.options,n=i.gpuAcceleration,a=void 0===n||n,r=i.adaptive,s=void 0===r||r,o=i.roundOffsets,l=void 0===o||o,c={placement:D(e.placement),variation:Z(e.placement),popper:e.elements.popper,popperRect:e.rects.popper,gpuAcceleration:a,isFixed:"fixed"===e.options.strategy};null!=e.modifiersData.popperOffsets&&(e.styles.popper=Object.assign({},e.styles.popper,Q(Object.assign({},c,{offsets:e.modifiersData.popperOffsets,position:e.options.strategy,adaptive:s,roundOffsets:l})))),null!=e.modifiersData.arrow&&(e.styles.arrow=Object.assign({},e.styles.arrow,Q(Object.assign({},c,{offsets:e.modifiersData.arrow,position:"absolute",adaptive:!1,roundOffsets:l})))),e.attributes.popper=Object.assign({},e.attributes.popper,{"data-popper-placement":e.placement})},data:{}};var tt={passive:!0};const et={name:"eventListeners",enabled:!0,phase:"write",fn:function(){},effect:function(t){var e=t.state,i=t.instance,n=t.options,a=n.scroll,r=void 0===a||a,s=n.resize,o=void 0===s||s,l=E(e.elements.popper),c=[].concat(e.scrollParents.reference,e.scrollParents.popper);return r&&c.forEach((function(t){t.addEventListener("scroll",i.update,tt)})),o&&l.addEventListener("resize",i.update,tt),function(){r&&c.forEach((function(t){t.removeEventListener("scroll",i.update,tt)})),o&&l.removeEventListener("resize",i.update,tt)}},data:{}};var it={left:"right",right:"left",bottom:"top",top:"bottom"};function nt(t){return t.replace(/left|right|bottom|top/g,(function(t){return it[t]}))}var at={start:"end",end:"start"};function rt(t){return t.replace(/start|end/g,(function(t){return at[t]}))}function st(t){var e=E(t);return{scrollLeft:e.pageXOffset,scrollTop:e.pageYOffset}}function ot(t){return F(X(t)).left+st(t).scrollLeft}function lt(t){var e=H(t),i=e.overflow,n=e.overflowX,a=e.overflowY;return/auto|scroll|overlay|hidden/.test(i+a+n)}function ct(t){return["html","body","#document"].indexOf(C(t))>=0?t.ownerDocument.body:P(t)&&lt(t)?t:ct(B(t))}function ht(t,e){var i;void 0===e&&(e=[]);var n=ct(t),a=n===(null==(i=t.ownerDocument)?void 0:i.body),r=E(n),s=a?[r].concat(r.visualViewport||[],lt(n)?n:[]):n,o=e.concat(s);return a?o:o.concat(ht(B(s)))}function ut(t){return Object.assign({},t,{left:t.x,top:t.y,right:t.x+t.width,bottom:t.y+t.height})}function dt(t,e){return e===u?ut(function(t){var e=E(t),i=X(t),n=e.visualViewport,a=i.clientWidth,r=i.clientHeight,s=0,o=0;return n&&(a=n.width,r=n.height,/^((?!chrome|android).)*safari/i.test(navigator.userAgent)||(s=n.offsetLeft,o=n.offsetTop)),{width:a,height:r,x:s+ot(t),y:o}}(t)):T(e)?function(t){var e=F(t);return e.top=e.top+t.clientTop,e.left=e.left+t.clientLeft,e.bottom=e.top+t.clientHeight,e.right=e.left+t.clientWidth,e.width=t.clientWidth,e.height=t.clientHeight,e.x=e.left,e.y=e.top,e}(e):ut(function(t){var e,i=X(t),n=st(t),a=null==(e=t.ownerDocument)?void 0:e.body,r=I(i.scrollWidth,i.clientWidth,a?a.scrollWidth:0,a?a.clientWidth:0),s=I(i.scrollHeight,i.clientHeight,a?a.scrollHeight:0,a?a.clientHeight:0),o=-n.scrollLeft+ot(t),l=-n.scrollTop;return"rtl"===H(a||i).direction&&(o+=I(i.clientWidth,a?a.clientWidth:0)-r),{width:r,height:s,x:o,y:l}}(X(t)))}function ft(t){var i,s=t.reference,o=t.element,h=t.placement,u=h?D(h):null,d=h?Z(h):null,f=s.x+s.width/2-o.width/2,g=s.y+s.height/2-o.height/2;switch(u){case e:i={x:f,y:s.y-o.height};break;case n:i={x:f,y:s.y+s.height};break;case a:i={x:s.x+s.width,y:g};break;case r:i={x:s.x-o.width,y:g};break;default:i={x:s.x,y:s.y}}var p=u?V(u):null;if(null!=p){var m="y"===p?"height":"width";switch(d){case l:i[p]=i[p]-(s[m]/2-o[m]/2);break;case c:i[p]=i[p]+(s[m]/2-o[m]/2)}}return i}function gt(t,i){void 0===i&&(i={});var r=i,s=r.placement,l=void 0===s?t.placement:s,c=r.boundary,g=void 0===c?h:c,p=r.rootBoundary,m=void 0===p?u:p,v=r.elementContext,x=void 0===v?d:v,b=r.altBoundary,y=void 0!==b&&b,w=r.padding,k=void 0===w?0:w,A=U("number"!=typeof k?k:q(k,o)),S=x===d?f:d,_=t.rects.popper,E=t.elements[y?S:x],M=function(t,e,i){var n="clippingParents"===e?function(t){var e=ht(B(t)),i=["absolute","fixed"].indexOf(H(t).position)>=0&&P(t)?W(t):t;return T(i)?e.filter((function(t){return T(t)&&z(t,i)&&"body"!==C(t)})):[]}(t):[].concat(e),a=[].concat(n,[i]),r=a[0],s=a.reduce((function(e,i){var n=dt(t,i);return e.top=I(n.top,e.top),e.right=O(n.right,e.right),e.bottom=O(n.bottom,e.bottom),e.left=I(n.left,e.left),e}),dt(t,r));return s.width=s.right-s.left,s.height=s.bottom-s.top,s.x=s.left,s.y=s.top,s}(T(E)?E:E.contextElement||X(t.elements.popper),g,m),L=F(t.elements.reference),D=ft({reference:L,element:_,strategy:"absolute",placement:l}),N=ut(Object.assign({},_,D)),R=x===d?N:L,Y={top:M.top-R.top+A.top,bottom:R.bottom-M.bottom+A.bottom,left:M.left-R.left+A.left,right:R.right-M.right+A.right},j=t.modifiersData.offset;if(x===d&&j){var V=j[l];Object.keys(Y).forEach((function(t){var i=[a,n].indexOf(t)>=0?1:-1,r=[e,n].indexOf(t)>=0?"y":"x";Y[t]+=V[r]*i}))}return Y}const pt={name:"flip",enabled:!0,phase:"main",fn:function(t){var i=t.state,c=t.options,h=t.name;if(!i.modifiersData[h]._skip){for(var u=c.mainAxis,d=void 0===u||u,f=c.altAxis,m=void 0===f||f,v=c.fallbackPlacements,x=c.padding,b=c.boundary,y=c.rootBoundary,w=c.altBoundary,k=c.flipVariations,A=void 0===k||k,S=c.allowedAutoPlacements,_=i.options.placement,C=D(_),E=v||(C!==_&&A?function(t){if(D(t)===s)return[];var e=nt(t);return[rt(t),e,rt(e)]}(_):[nt(_)]),T=[_].concat(E).reduce((function(t,e){return t.concat(D(e)===s?function(t,e){void 0===e&&(e={});var i=e,n=i.placement,a=i.boundary,r=i.rootBoundary,s=i.padding,l=i.flipVariations,c=i.allowedAutoPlacements,h=void 0===c?p:c,u=Z(n),d=u?l?g:g.filter((function(t){return Z(t)===u})):o,f=d.filter((function(t){return h.indexOf(t)>=0}));0===f.length&&(f=d);var m=f.reduce((function(e,i){return e[i]=gt(t,{placement:i,boundary:a,rootBoundary:r,padding:s})[D(i)],e}),{});return Object.keys(m).sort((function(t,e){return m[t]-m[e]}))}(i,{placement:e,boundary:b,rootBoundary:y,padding:x,flipVariations:A,allowedAutoPlacements:S}):e)}),[]),P=i.rects.reference,M=i.rects.popper,L=new Map,I=!0,O=T[0],N=0;N<T.length;N++){var F=T[N],R=D(F),z=Z(F)===l,H=[e,n].indexOf(R)>=0,Y=H?"width":"height",X=gt(i,{placement:F,boundary:b,rootBoundary:y,altBoundary:w,padding:x}),B=H?z?a:r:z?n:e;P[Y]>M[Y]&&(B=nt(B));var j=nt(B),W=[];if(d&&W.push(X[R]<=0),m&&W.push(X[B]<=0,X[j]<=0),W.every((function(t){return t}))){O=F,I=!1;break}L.set(F,W)}if(I)for(var V=function(t){var e=T.find((function(e){var i=L.get(e);if(i)return i.slice(0,t).every((function(t){return t}))}));if(e)return O=e,"break"},G=A?3:1;G>0&&"break"!==V(G);G--);i.placement!==O&&(i.modifiersData[h]._skip=!0,i.placement=O,i.reset=!0)}},requiresIfExists:["offset"],data:{_skip:!1}};function mt(t,e,i){return void 0===i&&(i={x:0,y:0}),{top:t.top-e.height-i.y,right:t.right-e.width+i.x,bottom:t.bottom-e.height+i.y,left:t.left-e.width-i.x}}function vt(t){return[e,a,n,r].some((function(e){return t[e]>=0}))}const xt={name:"hide",enabled:!0,phase:"main",requiresIfExists:["preventOverflow"],fn:function(t){var e=t.state,i=t.name,n=e.rects.reference,a=e.rects.popper,r=e.modifiersData.preventOverflow,s=gt(e,{elementContext:"reference"}),o=gt(e,{altBoundary:!0}),l=mt(s,n),c=mt(o,a,r),h=vt(l),u=vt(c);e.modifiersData[i]={referenceClippingOffsets:l,popperEscapeOffsets:c,isReferenceHidden:h,hasPopperEscaped:u},e.attributes.popper=Object.assign({},e.attributes.popper,{"data-popper-reference-hidden":h,"data-popper-escaped":u})}},bt={name:"offset",enabled:!0,phase:"main",requires:["popperOffsets"],fn:function(t){var i=t.state,n=t.options,s=t.name,o=n.offset,l=void 0===o?[0,0]:o,c=p.reduce((function(t,n){return t[n]=function(t,i,n){var s=D(t),o=[r,e].indexOf(s)>=0?-1:1,l="function"==typeof n?n(Object.assign({},i,{placement:t})):n,c=l[0],h=l[1];return c=c||0,h=(h||0)*o,[r,a].indexOf(s)>=0?{x:h,y:c}:{x:c,y:h}}(n,i.rects,l),t}),{}),h=c[i.placement],u=h.x,d=h.y;null!=i.modifiersData.popperOffsets&&(i.modifiersData.popperOffsets.x+=u,i.modifiersData.popperOffsets.y+=d),i.modifiersData[s]=c}},yt={name:"popperOffsets",enabled:!0,phase:"read",fn:function(t){var e=t.state,i=t.name;e.modifiersData[i]=ft({reference:e.rects.reference,element:e.rects.popper,strategy:"absolute",placement:e.placement})},data:{}},wt={name:"preventOverflow",enabled:!0,phase:"main",fn:function(t){var i=t.state,s=t.options,o=t.name,c=s.mainAxis,h=void 0===c||c,u=s.altAxis,d=void 0!==u&&u,f=s.boundary,g=s.rootBoundary,p=s.altBoundary,m=s.padding,v=s.tether,x=void 0===v||v,b=s.tetherOffset,y=void 0===b?0:b,w=gt(i,{boundary:f,rootBoundary:g,padding:m,altBoundary:p}),k=D(i.placement),A=Z(i.placement),S=!A,_=V(k),C="x"===_?"y":"x",E=i.modifiersData.popperOffsets,T=i.rects.reference,P=i.rects.popper,M="function"==typeof y?y(Object.assign({},i.rects,{placement:i.placement})):y,L="number"==typeof M?{mainAxis:M,altAxis:M}:Object.assign({mainAxis:0,altAxis:0},M),N=i.modifiersData.offset?i.modifiersData.offset[i.placement]:null,F={x:0,y:0};if(E){if(h){var z,H="y"===_?e:r,Y="y"===_?n:a,X="y"===_?"height":"width",B=E[_],j=B+w[H],U=B-w[Y],q=x?-P[X]/2:0,$=A===l?T[X]:P[X],K=A===l?-P[X]:-T[X],Q=i.elements.arrow,J=x&&Q?R(Q):{width:0,height:0},tt=i.modifiersData["arrow#persistent"]?i.modifiersData["arrow#persistent"].padding:{top:0,right:0,bottom:0,left:0},et=tt[H],it=tt[Y],nt=G(0,T[X],J[X]),at=S?T[X]/2-q-nt-et-L.mainAxis:$-nt-et-L.mainAxis,rt=S?-T[X]/2+q+nt+it+L.mainAxis:K+nt+it+L.mainAxis,st=i.elements.arrow&&W(i.elements.arrow),ot=st?"y"===_?st.clientTop||0:st.clientLeft||0:0,lt=null!=(z=null==N?void 0:N[_])?z:0,ct=B+rt-lt,ht=G(x?O(j,B+at-lt-ot):j,B,x?I(U,ct):U);E[_]=ht,F[_]=ht-B}if(d){var ut,dt="x"===_?e:r,ft="x"===_?n:a,pt=E[C],mt="y"===C?"height":"width",vt=pt+w[dt],xt=pt-w[ft],bt=-1!==[e,r].indexOf(k),yt=null!=(ut=null==N?void 0:N[C])?ut:0,wt=bt?vt:pt-T[mt]-P[mt]-yt+L.altAxis,kt=bt?pt+T[mt]+P[mt]-yt-L.altAxis:xt,At=x&&bt?function(t,e,i){var n=G(t,e,i);return n>i?i:n}(wt,pt,kt):G(x?wt:vt,pt,x?kt:xt);E[C]=At,F[C]=At-pt}i.modifiersData[o]=F}},requiresIfExists:["offset"]};function kt(t,e,i){void 0===i&&(i=!1);var n,a,r=P(e),s=P(e)&&function(t){var e=t.getBoundingClientRect(),i=N(e.width)/t.offsetWidth||1,n=N(e.height)/t.offsetHeight||1;return 1!==i||1!==n}(e),o=X(e),l=F(t,s),c={scrollLeft:0,scrollTop:0},h={x:0,y:0};return(r||!r&&!i)&&(("body"!==C(e)||lt(o))&&(c=(n=e)!==E(n)&&P(n)?{scrollLeft:(a=n).scrollLeft,scrollTop:a.scrollTop}:st(n)),P(e)?((h=F(e,!0)).x+=e.clientLeft,h.y+=e.clientTop):o&&(h.x=ot(o))),{x:l.left+c.scrollLeft-h.x,y:l.top+c.scrollTop-h.y,width:l.width,height:l.height}}function At(t){var e=new Map,i=new Set,n=[];function a(t){i.add(t.name),[].concat(t.requires||[],t.requiresIfExists||[]).forEach((function(t){if(!i.has(t)){var n=e.get(t);n&&a(n)}})),n.push(t)}return t.forEach((function(t){e.set(t.name,t)})),t.forEach((function(t){i.has(t.name)||a(t)})),n}var St={placement:"bottom",modifiers:[],strategy:"absolute"};function _t(){for(var t=arguments.length,e=new Array(t),i=0;i<t;i++)e[i]=arguments[i];return!e.some((function(t){return!(t&&"function"==typeof t.getBoundingClientRect)}))}function Ct(t){void 0===t&&(t={});var e=t,i=e.defaultModifiers,n=void 0===i?[]:i,a=e.defaultOptions,r=void 0===a?St:a;return function(t,e,i){void 0===i&&(i=r);var a,s,o={placement:"bottom",orderedModifiers:[],options:Object.assign({},St,r),modifiersData:{},elements:{reference:t,popper:e},attributes:{},styles:{}},l=[],c=!1,h={state:o,setOptions:function(i){var a="function"==typeof i?i(o.options):i;u(),o.options=Object.assign({},r,o.options,a),o.scrollParents={reference:T(t)?ht(t):t.contextElement?ht(t.contextElement):[],popper:ht(e)};var s,c,d=function(t){var e=At(t);return _.reduce((function(t,i){return t.concat(e.filter((function(t){return t.phase===i})))}),[])}((s=[].concat(n,o.options.modifiers),c=s.reduce((function(t,e){var i=t[e.name];return t[e.name]=i?Object.assign({},i,e,{options:Object.assign({},i.options,e.options),data:Object.assign({},i.data,e.data)}):e,t}),{}),Object.keys(c).map((function(t){return c[t]}))));return o.orderedModifiers=d.filter((function(t){return t.enabled})),o.orderedModifiers.forEach((function(t){var e=t.name,i=t.options,n=void 0===i?{}:i,a=t.effect;if("function"==typeof a){var r=a({state:o,name:e,instance:h,options:n});l.push(r||function(){})}})),h.update()},forceUpdate:function(){if(!c){var t=o.elements,e=t.reference,i=t.popper;if(_t(e,i)){o.rects={reference:kt(e,W(i),"fixed"===o.options.strategy),popper:R(i)},o.reset=!1,o.placement=o.options.placement,o.orderedModifiers.forEach((function(t){return o.modifiersData[t.name]=Object.assign({},t.data)}));for(var n=0;n<o.orderedModifiers.length;n++)if(!0!==o.reset){var a=o.orderedModifiers[n],r=a.fn,s=a.options,l=void 0===s?{}:s,u=a.name;"function"==typeof r&&(o=r({state:o,options:l,name:u,instance:h})||o)}else o.reset=!1,n=-1}}},update:(a=function(){return new Promise((function(t){h.forceUpdate(),t(o)}))},function(){return s||(s=new Promise((function(t){Promise.resolve().then((function(){s=void 0,t(a())}))}))),s}),destroy:function(){u(),c=!0}};if(!_t(t,e))return h;function u(){l.forEach((function(t){return t()})),l=[]}return h.setOptions(i).then((function(t){!c&&i.onFirstUpdate&&i.onFirstUpdate(t)})),h}}var Et=Ct(),Tt=Ct({defaultModifiers:[et,yt,J,L,bt,pt,wt,$,xt]}),Pt=Ct({defaultModifiers:[et,yt,J,L]});const Mt="transitionend",Lt=t=>{let e=t.getAttribute("data-bs-target");if(!e||"#"===e){let i=t.getAttribute("href");if(!i||!i.includes("#")&&!i.startsWith("."))return null;i.includes("#")&&!i.startsWith("#")&&(i=`#${i.split("#")[1]}`),e=i&&"#"!==i?i.trim():null}return e},Dt=t=>{const e=Lt(t);return e&&document.querySelector(e)?e:null},It=t=>{const e=Lt(t);return e?document.querySelector(e):null},Ot=t=>{t.dispatchEvent(new Event(Mt))},Nt=t=>!(!t||"object"!=typeof t)&&(void 0!==t.jquery&&(t=t[0]),void 0!==t.nodeType),Ft=t=>Nt(t)?t.jquery?t[0]:t:"string"==typeof t&&t.length>0?document.querySelector(t):null,Rt=(t,e,i)=>{Object.keys(i).forEach((n=>{const a=i[n],r=e[n],s=r&&Nt(r)?"element":null==(o=r)?`${o}`:{}.toString.call(o).match(/\s([a-z]+)/i)[1].toLowerCase();var o;if(!new RegExp(a).test(s))throw new TypeError(`${t.toUpperCase()}: Option "${n}" provided type "${s}" but expected type "${a}".`)}))},zt=t=>!(!Nt(t)||0===t.getClientRects().length)&&"visible"===getComputedStyle(t).getPropertyValue("visibility"),Ht=t=>!t||t.nodeType!==Node.ELEMENT_NODE||!!t.classList.contains("disabled")||(void 0!==t.disabled?t.disabled:t.hasAttribute("disabled")&&"false"!==t.getAttribute("disabled")),Yt=t=>{if(!document.documentElement.attachShadow)return null;if("function"==typeof t.getRootNode){const e=t.getRootNode();return e instanceof ShadowRoot?e:null}return t instanceof ShadowRoot?t:t.parentNode?Yt(t.parentNode):null},Xt=()=>{},Bt=t=>{t.offsetHeight},jt=()=>{const{jQuery:t}=window;return t&&!document.body.hasAttribute("data-bs-no-jquery")?t:null},Wt=[],Vt=()=>"rtl"===document.documentElement.dir,Gt=t=>{var e;e=()=>{const e=jt();if(e){const i=t.NAME,n=e.fn[i];e.fn[i]=t.jQueryInterface,e.fn[i].Constructor=t,e.fn[i].noConflict=()=>(e.fn[i]=n,t.jQueryInterface)}},"loading"===document.readyState?(Wt.length||document.addEventListener("DOMContentLoaded",(()=>{Wt.forEach((t=>t()))})),Wt.push(e)):e()},Ut=t=>{"function"==typeof t&&t()},qt=(t,e,i=!0)=>{if(!i)return void Ut(t);const n=(t=>{if(!t)return 0;let{transitionDuration:e,transitionDelay:i}=window.getComputedStyle(t);const n=Number.parseFloat(e),a=Number.parseFloat(i);return n||a?(e=e.split(",")[0],i=i.split(",")[0],1e3*(Number.parseFloat(e)+Number.parseFloat(i))):0})(e)+5;let a=!1;const r=({target:i})=>{i===e&&(a=!0,e.removeEventListener(Mt,r),Ut(t))};e.addEventListener(Mt,r),setTimeout((()=>{a||Ot(e)}),n)},$t=(t,e,i,n)=>{let a=t.indexOf(e);if(-1===a)return t[!i&&n?t.length-1:0];const r=t.length;return a+=i?1:-1,n&&(a=(a+r)%r),t[Math.max(0,Math.min(a,r-1))]},Zt=/[^.]*(?=\..*)\.|.*/,Kt=/\..*/,Qt=/::\d+$/,Jt={};let te=1;const ee={mouseenter:"mouseover",mouseleave:"mouseout"},ie=/^(mouseenter|mouseleave)/i,ne=new Set(["click","dblclick","mouseup","mousedown","contextmenu","mousewheel","DOMMouseScroll","mouseover","mouseout","mousemove","selectstart","selectend","keydown","keypress","keyup","orientationchange","touchstart","touchmove","touchend","touchcancel","pointerdown","pointermove","pointerup","pointerleave","pointercancel","gesturestart","gesturechange","gestureend","focus","blur","change","reset","select","submit","focusin","focusout","load","unload","beforeunload","resize","move","DOMContentLoaded","readystatechange","error","abort","scroll"]);function ae(t,e){return e&&`${e}::${te++}`||t.uidEvent||te++}function re(t){const e=ae(t);return t.uidEvent=e,Jt[e]=Jt[e]||{},Jt[e]}function se(t,e,i=null){const n=Object.keys(t);for(let a=0,r=n.length;a<r;a++){const r=t[n[a]];if(r.originalHandler===e&&r.delegationSelector===i)return r}return null}function oe(t,e,i){const n="string"==typeof e,a=n?i:e;let r=he(t);return ne.has(r)||(r=t),[n,a,r]}function le(t,e,i,n,a){if("string"!=typeof e||!t)return;if(i||(i=n,n=null),ie.test(e)){const t=t=>function(e){if(!e.relatedTarget||e.relatedTarget!==e.delegateTarget&&!e.delegateTarget.contains(e.relatedTarget))return t.call(this,e)};n?n=t(n):i=t(i)}const[r,s,o]=oe(e,i,n),l=re(t),c=l[o]||(l[o]={}),h=se(c,s,r?i:null);if(h)return void(h.oneOff=h.oneOff&&a);const u=ae(s,e.replace(Zt,"")),d=r?function(t,e,i){return function n(a){const r=t.querySelectorAll(e);for(let{target:s}=a;s&&s!==this;s=s.parentNode)for(let o=r.length;o--;)if(r[o]===s)return a.delegateTarget=s,n.oneOff&&ue.off(t,a.type,e,i),i.apply(s,[a]);return null}}(t,i,n):function(t,e){return function i(n){return n.delegateTarget=t,i.oneOff&&ue.off(t,n.type,e),e.apply(t,[n])}}(t,i);d.delegationSelector=r?i:null,d.originalHandler=s,d.oneOff=a,d.uidEvent=u,c[u]=d,t.addEventListener(o,d,r)}function ce(t,e,i,n,a){const r=se(e[i],n,a);r&&(t.removeEventListener(i,r,Boolean(a)),delete e[i][r.uidEvent])}function he(t){return t=t.replace(Kt,""),ee[t]||t}const ue={on(t,e,i,n){le(t,e,i,n,!1)},one(t,e,i,n){le(t,e,i,n,!0)},off(t,e,i,n){if("string"!=typeof e||!t)return;const[a,r,s]=oe(e,i,n),o=s!==e,l=re(t),c=e.startsWith(".");if(void 0!==r){if(!l||!l[s])return;return void ce(t,l,s,r,a?i:null)}c&&Object.keys(l).forEach((i=>{!function(t,e,i,n){const a=e[i]||{};Object.keys(a).forEach((r=>{if(r.includes(n)){const n=a[r];ce(t,e,i,n.originalHandler,n.delegationSelector)}}))}(t,l,i,e.slice(1))}));const h=l[s]||{};Object.keys(h).forEach((i=>{const n=i.replace(Qt,"");if(!o||e.includes(n)){const e=h[i];ce(t,l,s,e.originalHandler,e.delegationSelector)}}))},trigger(t,e,i){if("string"!=typeof e||!t)return null;const n=jt(),a=he(e),r=e!==a,s=ne.has(a);let o,l=!0,c=!0,h=!1,u=null;return r&&n&&(o=n.Event(e,i),n(t).trigger(o),l=!o.isPropagationStopped(),c=!o.isImmediatePropagationStopped(),h=o.isDefaultPrevented()),s?(u=document.createEvent("HTMLEvents"),u.initEvent(a,l,!0)):u=new CustomEvent(e,{bubbles:l,cancelable:!0}),void 0!==i&&Object.keys(i).forEach((t=>{Object.defineProperty(u,t,{get:()=>i[t]})})),h&&u.preventDefault(),c&&t.dispatchEvent(u),u.defaultPrevented&&void 0!==o&&o.preventDefault(),u}},de=new Map,fe={set(t,e,i){de.has(t)||de.set(t,new Map);const n=de.get(t);n.has(e)||0===n.size?n.set(e,i):console.error(`Bootstrap doesn't allow more than one instance per element. Bound instance: ${Array.from(n.keys())[0]}.`)},get:(t,e)=>de.has(t)&&de.get(t).get(e)||null,remove(t,e){if(!de.has(t))return;const i=de.get(t);i.delete(e),0===i.size&&de.delete(t)}};class ge{constructor(t){(t=Ft(t))&&(this._element=t,fe.set(this._element,this.constructor.DATA_KEY,this))}dispose(){fe.remove(this._element,this.constructor.DATA_KEY),ue.off(this._element,this.constructor.EVENT_KEY),Object.getOwnPropertyNames(this).forEach((t=>{this[t]=null}))}_queueCallback(t,e,i=!0){qt(t,e,i)}static getInstance(t){return fe.get(Ft(t),this.DATA_KEY)}static getOrCreateInstance(t,e={}){return this.getInstance(t)||new this(t,"object"==typeof e?e:null)}static get VERSION(){return"5.1.3"}static get NAME(){throw new Error('You have to implement the static method "NAME", for each component!')}static get DATA_KEY(){return`bs.${this.NAME}`}static get EVENT_KEY(){return`.${this.DATA_KEY}`}}const pe=(t,e="hide")=>{const i=`click.dismiss${t.EVENT_KEY}`,n=t.NAME;ue.on(document,i,`[data-bs-dismiss="${n}"]`,(function(i){if(["A","AREA"].includes(this.tagName)&&i.preventDefault(),Ht(this))return;const a=It(this)||this.closest(`.${n}`);t.getOrCreateInstance(a)[e]()}))};class me extends ge{static get NAME(){return"alert"}close(){if(ue.trigger(this._element,"close.bs.alert").defaultPrevented)return;this._element.classList.remove("show");const t=this._element.classList.contains("fade");this._queueCallback((()=>this._destroyElement()),this._element,t)}_destroyElement(){this._element.remove(),ue.trigger(this._element,"closed.bs.alert"),this.dispose()}static jQueryInterface(t){return this.each((function(){const e=me.getOrCreateInstance(this);if("string"==typeof t){if(void 0===e[t]||t.startsWith("_")||"constructor"===t)throw new TypeError(`No method named "${t}"`);e[t](this)}}))}}pe(me,"close"),Gt(me);const ve='[data-bs-toggle="button"]';class xe extends ge{static get NAME(){return"button"}toggle(){this._element.setAttribute("aria-pressed",this._element.classList.toggle("active"))}static jQueryInterface(t){return this.each((function(){const e=xe.getOrCreateInstance(this);"toggle"===t&&e[t]()}))}}function be(t){return"true"===t||"false"!==t&&(t===Number(t).toString()?Number(t):""===t||"null"===t?null:t)}function ye(t){return t.replace(/[A-Z]/g,(t=>`-${t.toLowerCase()}`))}ue.on(document,"click.bs.button.data-api",ve,(t=>{t.preventDefault();const e=t.target.closest(ve);xe.getOrCreateInstance(e).toggle()})),Gt(xe);const we={setDataAttribute(t,e,i){t.setAttribute(`data-bs-${ye(e)}`,i)},removeDataAttribute(t,e){t.removeAttribute(`data-bs-${ye(e)}`)},getDataAttributes(t){if(!t)return{};const e={};return Object.keys(t.dataset).filter((t=>t.startsWith("bs"))).forEach((i=>{let n=i.replace(/^bs/,"");n=n.charAt(0).toLowerCase()+n.slice(1,n.length),e[n]=be(t.dataset[i])})),e},getDataAttribute:(t,e)=>be(t.getAttribute(`data-bs-${ye(e)}`)),offset(t){const e=t.getBoundingClientRect();return{top:e.top+window.pageYOffset,left:e.left+window.pageXOffset}},position:t=>({top:t.offsetTop,left:t.offsetLeft})},ke={find:(t,e=document.documentElement)=>[].concat(...Element.prototype.querySelectorAll.call(e,t)),findOne:(t,e=document.documentElement)=>Element.prototype.querySelector.call(e,t),children:(t,e)=>[].concat(...t.children).filter((t=>t.matches(e))),parents(t,e){const i=[];let n=t.parentNode;for(;n&&n.nodeType===Node.ELEMENT_NODE&&3!==n.nodeType;)n.matches(e)&&i.push(n),n=n.parentNode;return i},prev(t,e){let i=t.previousElementSibling;for(;i;){if(i.matches(e))return[i];i=i.previousElementSibling}return[]},next(t,e){let i=t.nextElementSibling;for(;i;){if(i.matches(e))return[i];i=i.nextElementSibling}return[]},focusableChildren(t){const e=["a","button","input","textarea","select","details","[tabindex]",'[contenteditable="true"]'].map((t=>`${t}:not([tabindex^="-"])`)).join(", ");return this.find(e,t).filter((t=>!Ht(t)&&zt(t)))}},Ae="carousel",Se={interval:5e3,keyboard:!0,slide:!1,pause:"hover",wrap:!0,touch:!0},_e={interval:"(number|boolean)",keyboard:"boolean",slide:"(boolean|string)",pause:"(string|boolean)",wrap:"boolean",touch:"boolean"},Ce="next",Ee="prev",Te="left",Pe="right",Me={ArrowLeft:Pe,ArrowRight:Te},Le="slid.bs.carousel",De="active",Ie=".active.carousel-item";class Oe extends ge{constructor(t,e){super(t),this._items=null,this._interval=null,this._activeElement=null,this._isPaused=!1,this._isSliding=!1,this.touchTimeout=null,this.touchStartX=0,this.touchDeltaX=0,this._config=this._getConfig(e),this._indicatorsElement=ke.findOne(".carousel-indicators",this._element),this._touchSupported="ontouchstart"in document.documentElement||navigator.maxTouchPoints>0,this._pointerEvent=Boolean(window.PointerEvent),this._addEventListeners()}static get Default(){return Se}static get NAME(){return Ae}next(){this._slide(Ce)}nextWhenVisible(){!document.hidden&&zt(this._element)&&this.next()}prev(){this._slide(Ee)}pause(t){t||(this._isPaused=!0),ke.findOne(".carousel-item-next, .carousel-item-prev",this._element)&&(Ot(this._element),this.cycle(!0)),clearInterval(this._interval),this._interval=null}cycle(t){t||(this._isPaused=!1),this._interval&&(clearInterval(this._interval),this._interval=null),this._config&&this._config.interval&&!this._isPaused&&(this._updateInterval(),this._interval=setInterval((document.visibilityState?this.nextWhenVisible:this.next).bind(this),this._config.interval))}to(t){this._activeElement=ke.findOne(Ie,this._element);const e=this._getItemIndex(this._activeElement);if(t>this._items.length-1||t<0)return;if(this._isSliding)return void ue.one(this._element,Le,(()=>this.to(t)));if(e===t)return this.pause(),void this.cycle();const i=t>e?Ce:Ee;this._slide(i,this._items[t])}_getConfig(t){return t={...Se,...we.getDataAttributes(this._element),..."object"==typeof t?t:{}},Rt(Ae,t,_e),t}_handleSwipe(){const t=Math.abs(this.touchDeltaX);if(t<=40)return;const e=t/this.touchDeltaX;this.touchDeltaX=0,e&&this._slide(e>0?Pe:Te)}_addEventListeners(){this._config.keyboard&&ue.on(this._element,"keydown.bs.carousel",(t=>this._keydown(t))),"hover"===this._config.pause&&(ue.on(this._element,"mouseenter.bs.carousel",(t=>this.pause(t))),ue.on(this._element,"mouseleave.bs.carousel",(t=>this.cycle(t)))),this._config.touch&&this._touchSupported&&this._addTouchEventListeners()}_addTouchEventListeners(){const t=t=>this._pointerEvent&&("pen"===t.pointerType||"touch"===t.pointerType),e=e=>{t(e)?this.touchStartX=e.clientX:this._pointerEvent||(this.touchStartX=e.touches[0].clientX)},i=t=>{this.touchDeltaX=t.touches&&t.touches.length>1?0:t.touches[0].clientX-this.touchStartX},n=e=>{t(e)&&(this.touchDeltaX=e.clientX-this.touchStartX),this._handleSwipe(),"hover"===this._config.pause&&(this.pause(),this.touchTimeout&&clearTimeout(this.touchTimeout),this.touchTimeout=setTimeout((t=>this.cycle(t)),500+this._config.interval))};ke.find(".carousel-item img",this._element).forEach((t=>{ue.on(t,"dragstart.bs.carousel",(t=>t.preventDefault()))})),this._pointerEvent?(ue.on(this._element,"pointerdown.bs.carousel",(t=>e(t))),ue.on(this._element,"pointerup.bs.carousel",(t=>n(t))),this._element.classList.add("pointer-event")):(ue.on(this._element,"touchstart.bs.carousel",(t=>e(t))),ue.on(this._element,"touchmove.bs.carousel",(t=>i(t))),ue.on(this._element,"touchend.bs.carousel",(t=>n(t))))}_keydown(t){if(/input|textarea/i.test(t.target.tagName))return;const e=Me[t.key];e&&(t.preventDefault(),this._slide(e))}_getItemIndex(t){return this._items=t&&t.parentNode?ke.find(".carousel-item",t.parentNode):[],this._items.indexOf(t)}_getItemByOrder(t,e){const i=t===Ce;return $t(this._items,e,i,this._config.wrap)}_triggerSlideEvent(t,e){const i=this._getItemIndex(t),n=this._getItemIndex(ke.findOne(Ie,this._element));return ue.trigger(this._element,"slide.bs.carousel",{relatedTarget:t,direction:e,from:n,to:i})}_setActiveIndicatorElement(t){if(this._indicatorsElement){const e=ke.findOne(".active",this._indicatorsElement);e.classList.remove(De),e.removeAttribute("aria-current");const i=ke.find("[data-bs-target]",this._indicatorsElement);for(let e=0;e<i.length;e++)if(Number.parseInt(i[e].getAttribute("data-bs-slide-to"),10)===this._getItemIndex(t)){i[e].classList.add(De),i[e].setAttribute("aria-current","true");break}}}_updateInterval(){const t=this._activeElement||ke.findOne(Ie,this._element);if(!t)return;const e=Number.parseInt(t.getAttribute("data-bs-interval"),10);e?(this._config.defaultInterval=this._config.defaultInterval||this._config.interval,this._config.interval=e):this._config.interval=this._config.defaultInterval||this._config.interval}_slide(t,e){const i=this._directionToOrder(t),n=ke.findOne(Ie,this._element),a=this._getItemIndex(n),r=e||this._getItemByOrder(i,n),s=this._getItemIndex(r),o=Boolean(this._interval),l=i===Ce,c=l?"carousel-item-start":"carousel-item-end",h=l?"carousel-item-next":"carousel-item-prev",u=this._orderToDirection(i);if(r&&r.classList.contains(De))return void(this._isSliding=!1);if(this._isSliding)return;if(this._triggerSlideEvent(r,u).defaultPrevented)return;if(!n||!r)return;this._isSliding=!0,o&&this.pause(),this._setActiveIndicatorElement(r),this._activeElement=r;const d=()=>{ue.trigger(this._element,Le,{relatedTarget:r,direction:u,from:a,to:s})};if(this._element.classList.contains("slide")){r.classList.add(h),Bt(r),n.classList.add(c),r.classList.add(c);const t=()=>{r.classList.remove(c,h),r.classList.add(De),n.classList.remove(De,h,c),this._isSliding=!1,setTimeout(d,0)};this._queueCallback(t,n,!0)}else n.classList.remove(De),r.classList.add(De),this._isSliding=!1,d();o&&this.cycle()}_directionToOrder(t){return[Pe,Te].includes(t)?Vt()?t===Te?Ee:Ce:t===Te?Ce:Ee:t}_orderToDirection(t){return[Ce,Ee].includes(t)?Vt()?t===Ee?Te:Pe:t===Ee?Pe:Te:t}static carouselInterface(t,e){const i=Oe.getOrCreateInstance(t,e);let{_config:n}=i;"object"==typeof e&&(n={...n,...e});const a="string"==typeof e?e:n.slide;if("number"==typeof e)i.to(e);else if("string"==typeof a){if(void 0===i[a])throw new TypeError(`No method named "${a}"`);i[a]()}else n.interval&&n.ride&&(i.pause(),i.cycle())}static jQueryInterface(t){return this.each((function(){Oe.carouselInterface(this,t)}))}static dataApiClickHandler(t){const e=It(this);if(!e||!e.classList.contains("carousel"))return;const i={...we.getDataAttributes(e),...we.getDataAttributes(this)},n=this.getAttribute("data-bs-slide-to");n&&(i.interval=!1),Oe.carouselInterface(e,i),n&&Oe.getInstance(e).to(n),t.preventDefault()}}ue.on(document,"click.bs.carousel.data-api","[data-bs-slide], [data-bs-slide-to]",Oe.dataApiClickHandler),ue.on(window,"load.bs.carousel.data-api",(()=>{const t=ke.find('[data-bs-ride="carousel"]');for(let e=0,i=t.length;e<i;e++)Oe.carouselInterface(t[e],Oe.getInstance(t[e]))})),Gt(Oe);const Ne="collapse",Fe={toggle:!0,parent:null},Re={toggle:"boolean",parent:"(null|element)"},ze="show",He="collapse",Ye="collapsing",Xe="collapsed",Be=":scope .collapse .collapse",je='[data-bs-toggle="collapse"]';class We extends ge{constructor(t,e){super(t),this._isTransitioning=!1,this._config=this._getConfig(e),this._triggerArray=[];const i=ke.find(je);for(let t=0,e=i.length;t<e;t++){const e=i[t],n=Dt(e),a=ke.find(n).filter((t=>t===this._element));null!==n&&a.length&&(this._selector=n,this._triggerArray.push(e))}this._initializeChildren(),this._config.parent||this._addAriaAndCollapsedClass(this._triggerArray,this._isShown()),this._config.toggle&&this.toggle()}static get Default(){return Fe}static get NAME(){return Ne}toggle(){this._isShown()?this.hide():this.show()}show(){if(this._isTransitioning||this._isShown())return;let t,e=[];if(this._config.parent){const t=ke.find(Be,this._config.parent);e=ke.find(".collapse.show, .collapse.collapsing",this._config.parent).filter((e=>!t.includes(e)))}const i=ke.findOne(this._selector);if(e.length){const n=e.find((t=>i!==t));if(t=n?We.getInstance(n):null,t&&t._isTransitioning)return}if(ue.trigger(this._element,"show.bs.collapse").defaultPrevented)return;e.forEach((e=>{i!==e&&We.getOrCreateInstance(e,{toggle:!1}).hide(),t||fe.set(e,"bs.collapse",null)}));const n=this._getDimension();this._element.classList.remove(He),this._element.classList.add(Ye),this._element.style[n]=0,this._addAriaAndCollapsedClass(this._triggerArray,!0),this._isTransitioning=!0;const a=`scroll${n[0].toUpperCase()+n.slice(1)}`;this._queueCallback((()=>{this._isTransitioning=!1,this._element.classList.remove(Ye),this._element.classList.add(He,ze),this._element.style[n]="",ue.trigger(this._element,"shown.bs.collapse")}),this._element,!0),this._element.style[n]=`${this._element[a]}px`}hide(){if(this._isTransitioning||!this._isShown())return;if(ue.trigger(this._element,"hide.bs.collapse").defaultPrevented)return;const t=this._getDimension();this._element.style[t]=`${this._element.getBoundingClientRect()[t]}px`,Bt(this._element),this._element.classList.add(Ye),this._element.classList.remove(He,ze);const e=this._triggerArray.length;for(let t=0;t<e;t++){const e=this._triggerArray[t],i=It(e);i&&!this._isShown(i)&&this._addAriaAndCollapsedClass([e],!1)}this._isTransitioning=!0,this._element.style[t]="",this._queueCallback((()=>{this._isTransitioning=!1,this._element.classList.remove(Ye),this._element.classList.add(He),ue.trigger(this._element,"hidden.bs.collapse")}),this._element,!0)}_isShown(t=this._element){return t.classList.contains(ze)}_getConfig(t){return(t={...Fe,...we.getDataAttributes(this._element),...t}).toggle=Boolean(t.toggle),t.parent=Ft(t.parent),Rt(Ne,t,Re),t}_getDimension(){return this._element.classList.contains("collapse-horizontal")?"width":"height"}_initializeChildren(){if(!this._config.parent)return;const t=ke.find(Be,this._config.parent);ke.find(je,this._config.parent).filter((e=>!t.includes(e))).forEach((t=>{const e=It(t);e&&this._addAriaAndCollapsedClass([t],this._isShown(e))}))}_addAriaAndCollapsedClass(t,e){t.length&&t.forEach((t=>{e?t.classList.remove(Xe):t.classList.add(Xe),t.setAttribute("aria-expanded",e)}))}static jQueryInterface(t){return this.each((function(){const e={};"string"==typeof t&&/show|hide/.test(t)&&(e.toggle=!1);const i=We.getOrCreateInstance(this,e);if("string"==typeof t){if(void 0===i[t])throw new TypeError(`No method named "${t}"`);i[t]()}}))}}ue.on(document,"click.bs.collapse.data-api",je,(function(t){("A"===t.target.tagName||t.delegateTarget&&"A"===t.delegateTarget.tagName)&&t.preventDefault();const e=Dt(this);ke.find(e).forEach((t=>{We.getOrCreateInstance(t,{toggle:!1}).toggle()}))})),Gt(We);const Ve="dropdown",Ge="Escape",Ue="Space",qe="ArrowUp",$e="ArrowDown",Ze=new RegExp("ArrowUp|ArrowDown|Escape"),Ke="click.bs.dropdown.data-api",Qe="keydown.bs.dropdown.data-api",Je="show",ti='[data-bs-toggle="dropdown"]',ei=".dropdown-menu",ii=Vt()?"top-end":"top-start",ni=Vt()?"top-start":"top-end",ai=Vt()?"bottom-end":"bottom-start",ri=Vt()?"bottom-start":"bottom-end",si=Vt()?"left-start":"right-start",oi=Vt()?"right-start":"left-start",li={offset:[0,2],boundary:"clippingParents",reference:"toggle",display:"dynamic",popperConfig:null,autoClose:!0},ci={offset:"(array|string|function)",boundary:"(string|element)",reference:"(string|element|object)",display:"string",popperConfig:"(null|object|function)",autoClose:"(boolean|string)"};class hi extends ge{constructor(t,e){super(t),this._popper=null,this._config=this._getConfig(e),this._menu=this._getMenuElement(),this._inNavbar=this._detectNavbar()}static get Default(){return li}static get DefaultType(){return ci}static get NAME(){return Ve}toggle(){return this._isShown()?this.hide():this.show()}show(){if(Ht(this._element)||this._isShown(this._menu))return;const t={relatedTarget:this._element};if(ue.trigger(this._element,"show.bs.dropdown",t).defaultPrevented)return;const e=hi.getParentFromElement(this._element);this._inNavbar?we.setDataAttribute(this._menu,"popper","none"):this._createPopper(e),"ontouchstart"in document.documentElement&&!e.closest(".navbar-nav")&&[].concat(...document.body.children).forEach((t=>ue.on(t,"mouseover",Xt))),this._element.focus(),this._element.setAttribute("aria-expanded",!0),this._menu.classList.add(Je),this._element.classList.add(Je),ue.trigger(this._element,"shown.bs.dropdown",t)}hide(){if(Ht(this._element)||!this._isShown(this._menu))return;const t={relatedTarget:this._element};this._completeHide(t)}dispose(){this._popper&&this._popper.destroy(),super.dispose()}update(){this._inNavbar=this._detectNavbar(),this._popper&&this._popper.update()}_completeHide(t){ue.trigger(this._element,"hide.bs.dropdown",t).defaultPrevented||("ontouchstart"in document.documentElement&&[].concat(...document.body.children).forEach((t=>ue.off(t,"mouseover",Xt))),this._popper&&this._popper.destroy(),this._menu.classList.remove(Je),this._element.classList.remove(Je),this._element.setAttribute("aria-expanded","false"),we.removeDataAttribute(this._menu,"popper"),ue.trigger(this._element,"hidden.bs.dropdown",t))}_getConfig(t){if(t={...this.constructor.Default,...we.getDataAttributes(this._element),...t},Rt(Ve,t,this.constructor.DefaultType),"object"==typeof t.reference&&!Nt(t.reference)&&"function"!=typeof t.reference.getBoundingClientRect)throw new TypeError(`${Ve.toUpperCase()}: Option "reference" provided type "object" without a required "getBoundingClientRect" method.`);return t}_createPopper(e){if(void 0===t)throw new TypeError("Bootstrap's dropdowns require Popper (https://popper.js.org)");let i=this._element;"parent"===this._config.reference?i=e:Nt(this._config.reference)?i=Ft(this._config.reference):"object"==typeof this._config.reference&&(i=this._config.reference);const n=this._getPopperConfig(),a=n.modifiers.find((t=>"applyStyles"===t.name&&!1===t.enabled));this._popper=Tt(i,this._menu,n),a&&we.setDataAttribute(this._menu,"popper","static")}_isShown(t=this._element){return t.classList.contains(Je)}_getMenuElement(){return ke.next(this._element,ei)[0]}_getPlacement(){const t=this._element.parentNode;if(t.classList.contains("dropend"))return si;if(t.classList.contains("dropstart"))return oi;const e="end"===getComputedStyle(this._menu).getPropertyValue("--bs-position").trim();return t.classList.contains("dropup")?e?ni:ii:e?ri:ai}_detectNavbar(){return null!==this._element.closest(".navbar")}_getOffset(){const{offset:t}=this._config;return"string"==typeof t?t.split(",").map((t=>Number.parseInt(t,10))):"function"==typeof t?e=>t(e,this._element):t}_getPopperConfig(){const t={placement:this._getPlacement(),modifiers:[{name:"preventOverflow",options:{boundary:this._config.boundary}},{name:"offset",options:{offset:this._getOffset()}}]};return"static"===this._config.display&&(t.modifiers=[{name:"applyStyles",enabled:!1}]),{...t,..."function"==typeof this._config.popperConfig?this._config.popperConfig(t):this._config.popperConfig}}_selectMenuItem({key:t,target:e}){const i=ke.find(".dropdown-menu .dropdown-item:not(.disabled):not(:disabled)",this._menu).filter(zt);i.length&&$t(i,e,t===$e,!i.includes(e)).focus()}static jQueryInterface(t){return this.each((function(){const e=hi.getOrCreateInstance(this,t);if("string"==typeof t){if(void 0===e[t])throw new TypeError(`No method named "${t}"`);e[t]()}}))}static clearMenus(t){if(t&&(2===t.button||"keyup"===t.type&&"Tab"!==t.key))return;const e=ke.find(ti);for(let i=0,n=e.length;i<n;i++){const n=hi.getInstance(e[i]);if(!n||!1===n._config.autoClose)continue;if(!n._isShown())continue;const a={relatedTarget:n._element};if(t){const e=t.composedPath(),i=e.includes(n._menu);if(e.includes(n._element)||"inside"===n._config.autoClose&&!i||"outside"===n._config.autoClose&&i)continue;if(n._menu.contains(t.target)&&("keyup"===t.type&&"Tab"===t.key||/input|select|option|textarea|form/i.test(t.target.tagName)))continue;"click"===t.type&&(a.clickEvent=t)}n._completeHide(a)}}static getParentFromElement(t){return It(t)||t.parentNode}static dataApiKeydownHandler(t){if(/input|textarea/i.test(t.target.tagName)?t.key===Ue||t.key!==Ge&&(t.key!==$e&&t.key!==qe||t.target.closest(ei)):!Ze.test(t.key))return;const e=this.classList.contains(Je);if(!e&&t.key===Ge)return;if(t.preventDefault(),t.stopPropagation(),Ht(this))return;const i=this.matches(ti)?this:ke.prev(this,ti)[0],n=hi.getOrCreateInstance(i);if(t.key!==Ge)return t.key===qe||t.key===$e?(e||n.show(),void n._selectMenuItem(t)):void(e&&t.key!==Ue||hi.clearMenus());n.hide()}}ue.on(document,Qe,ti,hi.dataApiKeydownHandler),ue.on(document,Qe,ei,hi.dataApiKeydownHandler),ue.on(document,Ke,hi.clearMenus),ue.on(document,"keyup.bs.dropdown.data-api",hi.clearMenus),ue.on(document,Ke,ti,(function(t){t.preventDefault(),hi.getOrCreateInstance(this).toggle()})),Gt(hi);const ui=".fixed-top, .fixed-bottom, .is-fixed, .sticky-top",di=".sticky-top";class fi{constructor(){this._element=document.body}getWidth(){const t=document.documentElement.clientWidth;return Math.abs(window.innerWidth-t)}hide(){const t=this.getWidth();this._disableOverFlow(),this._setElementAttributes(this._element,"paddingRight",(e=>e+t)),this._setElementAttributes(ui,"paddingRight",(e=>e+t)),this._setElementAttributes(di,"marginRight",(e=>e-t))}_disableOverFlow(){this._saveInitialAttribute(this._element,"overflow"),this._element.style.overflow="hidden"}_setElementAttributes(t,e,i){const n=this.getWidth();this._applyManipulationCallback(t,(t=>{if(t!==this._element&&window.innerWidth>t.clientWidth+n)return;this._saveInitialAttribute(t,e);const a=window.getComputedStyle(t)[e];t.style[e]=`${i(Number.parseFloat(a))}px`}))}reset(){this._resetElementAttributes(this._element,"overflow"),this._resetElementAttributes(this._element,"paddingRight"),this._resetElementAttributes(ui,"paddingRight"),this._resetElementAttributes(di,"marginRight")}_saveInitialAttribute(t,e){const i=t.style[e];i&&we.setDataAttribute(t,e,i)}_resetElementAttributes(t,e){this._applyManipulationCallback(t,(t=>{const i=we.getDataAttribute(t,e);void 0===i?t.style.removeProperty(e):(we.removeDataAttribute(t,e),t.style[e]=i)}))}_applyManipulationCallback(t,e){Nt(t)?e(t):ke.find(t,this._element).forEach(e)}isOverflowing(){return this.getWidth()>0}}const gi={className:"modal-backdrop",isVisible:!0,isAnimated:!1,rootElement:"body",clickCallback:null},pi={className:"string",isVisible:"boolean",isAnimated:"boolean",rootElement:"(element|string)",clickCallback:"(function|null)"},mi="show",vi="mousedown.bs.backdrop";class xi{constructor(t){this._config=this._getConfig(t),this._isAppended=!1,this._element=null}show(t){this._config.isVisible?(this._append(),this._config.isAnimated&&Bt(this._getElement()),this._getElement().classList.add(mi),this._emulateAnimation((()=>{Ut(t)}))):Ut(t)}hide(t){this._config.isVisible?(this._getElement().classList.remove(mi),this._emulateAnimation((()=>{this.dispose(),Ut(t)}))):Ut(t)}_getElement(){if(!this._element){const t=document.createElement("div");t.className=this._config.className,this._config.isAnimated&&t.classList.add("fade"),this._element=t}return this._element}_getConfig(t){return(t={...gi,..."object"==typeof t?t:{}}).rootElement=Ft(t.rootElement),Rt("backdrop",t,pi),t}_append(){this._isAppended||(this._config.rootElement.append(this._getElement()),ue.on(this._getElement(),vi,(()=>{Ut(this._config.clickCallback)})),this._isAppended=!0)}dispose(){this._isAppended&&(ue.off(this._element,vi),this._element.remove(),this._isAppended=!1)}_emulateAnimation(t){qt(t,this._getElement(),this._config.isAnimated)}}const bi={trapElement:null,autofocus:!0},yi={trapElement:"element",autofocus:"boolean"},wi=".bs.focustrap",ki="backward";class Ai{constructor(t){this._config=this._getConfig(t),this._isActive=!1,this._lastTabNavDirection=null}activate(){const{trapElement:t,autofocus:e}=this._config;this._isActive||(e&&t.focus(),ue.off(document,wi),ue.on(document,"focusin.bs.focustrap",(t=>this._handleFocusin(t))),ue.on(document,"keydown.tab.bs.focustrap",(t=>this._handleKeydown(t))),this._isActive=!0)}deactivate(){this._isActive&&(this._isActive=!1,ue.off(document,wi))}_handleFocusin(t){const{target:e}=t,{trapElement:i}=this._config;if(e===document||e===i||i.contains(e))return;const n=ke.focusableChildren(i);0===n.length?i.focus():this._lastTabNavDirection===ki?n[n.length-1].focus():n[0].focus()}_handleKeydown(t){"Tab"===t.key&&(this._lastTabNavDirection=t.shiftKey?ki:"forward")}_getConfig(t){return t={...bi,..."object"==typeof t?t:{}},Rt("focustrap",t,yi),t}}const Si="modal",_i="Escape",Ci={backdrop:!0,keyboard:!0,focus:!0},Ei={backdrop:"(boolean|string)",keyboard:"boolean",focus:"boolean"},Ti="hidden.bs.modal",Pi="show.bs.modal",Mi="resize.bs.modal",Li="click.dismiss.bs.modal",Di="keydown.dismiss.bs.modal",Ii="mousedown.dismiss.bs.modal",Oi="modal-open",Ni="show",Fi="modal-static";class Ri extends ge{constructor(t,e){super(t),this._config=this._getConfig(e),this._dialog=ke.findOne(".modal-dialog",this._element),this._backdrop=this._initializeBackDrop(),this._focustrap=this._initializeFocusTrap(),this._isShown=!1,this._ignoreBackdropClick=!1,this._isTransitioning=!1,this._scrollBar=new fi}static get Default(){return Ci}static get NAME(){return Si}toggle(t){return this._isShown?this.hide():this.show(t)}show(t){this._isShown||this._isTransitioning||ue.trigger(this._element,Pi,{relatedTarget:t}).defaultPrevented||(this._isShown=!0,this._isAnimated()&&(this._isTransitioning=!0),this._scrollBar.hide(),document.body.classList.add(Oi),this._adjustDialog(),this._setEscapeEvent(),this._setResizeEvent(),ue.on(this._dialog,Ii,(()=>{ue.one(this._element,"mouseup.dismiss.bs.modal",(t=>{t.target===this._element&&(this._ignoreBackdropClick=!0)}))})),this._showBackdrop((()=>this._showElement(t))))}hide(){if(!this._isShown||this._isTransitioning)return;if(ue.trigger(this._element,"hide.bs.modal").defaultPrevented)return;this._isShown=!1;const t=this._isAnimated();t&&(this._isTransitioning=!0),this._setEscapeEvent(),this._setResizeEvent(),this._focustrap.deactivate(),this._element.classList.remove(Ni),ue.off(this._element,Li),ue.off(this._dialog,Ii),this._queueCallback((()=>this._hideModal()),this._element,t)}dispose(){[window,this._dialog].forEach((t=>ue.off(t,".bs.modal"))),this._backdrop.dispose(),this._focustrap.deactivate(),super.dispose()}handleUpdate(){this._adjustDialog()}_initializeBackDrop(){return new xi({isVisible:Boolean(this._config.backdrop),isAnimated:this._isAnimated()})}_initializeFocusTrap(){return new Ai({trapElement:this._element})}_getConfig(t){return t={...Ci,...we.getDataAttributes(this._element),..."object"==typeof t?t:{}},Rt(Si,t,Ei),t}_showElement(t){const e=this._isAnimated(),i=ke.findOne(".modal-body",this._dialog);this._element.parentNode&&this._element.parentNode.nodeType===Node.ELEMENT_NODE||document.body.append(this._element),this._element.style.display="block",this._element.removeAttribute("aria-hidden"),this._element.setAttribute("aria-modal",!0),this._element.setAttribute("role","dialog"),this._element.scrollTop=0,i&&(i.scrollTop=0),e&&Bt(this._element),this._element.classList.add(Ni),this._queueCallback((()=>{this._config.focus&&this._focustrap.activate(),this._isTransitioning=!1,ue.trigger(this._element,"shown.bs.modal",{relatedTarget:t})}),this._dialog,e)}_setEscapeEvent(){this._isShown?ue.on(this._element,Di,(t=>{this._config.keyboard&&t.key===_i?(t.preventDefault(),this.hide()):this._config.keyboard||t.key!==_i||this._triggerBackdropTransition()})):ue.off(this._element,Di)}_setResizeEvent(){this._isShown?ue.on(window,Mi,(()=>this._adjustDialog())):ue.off(window,Mi)}_hideModal(){this._element.style.display="none",this._element.setAttribute("aria-hidden",!0),this._element.removeAttribute("aria-modal"),this._element.removeAttribute("role"),this._isTransitioning=!1,this._backdrop.hide((()=>{document.body.classList.remove(Oi),this._resetAdjustments(),this._scrollBar.reset(),ue.trigger(this._element,Ti)}))}_showBackdrop(t){ue.on(this._element,Li,(t=>{this._ignoreBackdropClick?this._ignoreBackdropClick=!1:t.target===t.currentTarget&&(!0===this._config.backdrop?this.hide():"static"===this._config.backdrop&&this._triggerBackdropTransition())})),this._backdrop.show(t)}_isAnimated(){return this._element.classList.contains("fade")}_triggerBackdropTransition(){if(ue.trigger(this._element,"hidePrevented.bs.modal").defaultPrevented)return;const{classList:t,scrollHeight:e,style:i}=this._element,n=e>document.documentElement.clientHeight;!n&&"hidden"===i.overflowY||t.contains(Fi)||(n||(i.overflowY="hidden"),t.add(Fi),this._queueCallback((()=>{t.remove(Fi),n||this._queueCallback((()=>{i.overflowY=""}),this._dialog)}),this._dialog),this._element.focus())}_adjustDialog(){const t=this._element.scrollHeight>document.documentElement.clientHeight,e=this._scrollBar.getWidth(),i=e>0;(!i&&t&&!Vt()||i&&!t&&Vt())&&(this._element.style.paddingLeft=`${e}px`),(i&&!t&&!Vt()||!i&&t&&Vt())&&(this._element.style.paddingRight=`${e}px`)}_resetAdjustments(){this._element.style.paddingLeft="",this._element.style.paddingRight=""}static jQueryInterface(t,e){return this.each((function(){const i=Ri.getOrCreateInstance(this,t);if("string"==typeof t){if(void 0===i[t])throw new TypeError(`No method named "${t}"`);i[t](e)}}))}}ue.on(document,"click.bs.modal.data-api",'[data-bs-toggle="modal"]',(function(t){const e=It(this);["A","AREA"].includes(this.tagName)&&t.preventDefault(),ue.one(e,Pi,(t=>{t.defaultPrevented||ue.one(e,Ti,(()=>{zt(this)&&this.focus()}))}));const i=ke.findOne(".modal.show");i&&Ri.getInstance(i).hide(),Ri.getOrCreateInstance(e).toggle(this)})),pe(Ri),Gt(Ri);const zi="offcanvas",Hi={backdrop:!0,keyboard:!0,scroll:!1},Yi={backdrop:"boolean",keyboard:"boolean",scroll:"boolean"},Xi="show",Bi=".offcanvas.show",ji="hidden.bs.offcanvas";class Wi extends ge{constructor(t,e){super(t),this._config=this._getConfig(e),this._isShown=!1,this._backdrop=this._initializeBackDrop(),this._focustrap=this._initializeFocusTrap(),this._addEventListeners()}static get NAME(){return zi}static get Default(){return Hi}toggle(t){return this._isShown?this.hide():this.show(t)}show(t){this._isShown||ue.trigger(this._element,"show.bs.offcanvas",{relatedTarget:t}).defaultPrevented||(this._isShown=!0,this._element.style.visibility="visible",this._backdrop.show(),this._config.scroll||(new fi).hide(),this._element.removeAttribute("aria-hidden"),this._element.setAttribute("aria-modal",!0),this._element.setAttribute("role","dialog"),this._element.classList.add(Xi),this._queueCallback((()=>{this._config.scroll||this._focustrap.activate(),ue.trigger(this._element,"shown.bs.offcanvas",{relatedTarget:t})}),this._element,!0))}hide(){this._isShown&&(ue.trigger(this._element,"hide.bs.offcanvas").defaultPrevented||(this._focustrap.deactivate(),this._element.blur(),this._isShown=!1,this._element.classList.remove(Xi),this._backdrop.hide(),this._queueCallback((()=>{this._element.setAttribute("aria-hidden",!0),this._element.removeAttribute("aria-modal"),this._element.removeAttribute("role"),this._element.style.visibility="hidden",this._config.scroll||(new fi).reset(),ue.trigger(this._element,ji)}),this._element,!0)))}dispose(){this._backdrop.dispose(),this._focustrap.deactivate(),super.dispose()}_getConfig(t){return t={...Hi,...we.getDataAttributes(this._element),..."object"==typeof t?t:{}},Rt(zi,t,Yi),t}_initializeBackDrop(){return new xi({className:"offcanvas-backdrop",isVisible:this._config.backdrop,isAnimated:!0,rootElement:this._element.parentNode,clickCallback:()=>this.hide()})}_initializeFocusTrap(){return new Ai({trapElement:this._element})}_addEventListeners(){ue.on(this._element,"keydown.dismiss.bs.offcanvas",(t=>{this._config.keyboard&&"Escape"===t.key&&this.hide()}))}static jQueryInterface(t){return this.each((function(){const e=Wi.getOrCreateInstance(this,t);if("string"==typeof t){if(void 0===e[t]||t.startsWith("_")||"constructor"===t)throw new TypeError(`No method named "${t}"`);e[t](this)}}))}}ue.on(document,"click.bs.offcanvas.data-api",'[data-bs-toggle="offcanvas"]',(function(t){const e=It(this);if(["A","AREA"].includes(this.tagName)&&t.preventDefault(),Ht(this))return;ue.one(e,ji,(()=>{zt(this)&&this.focus()}));const i=ke.findOne(Bi);i&&i!==e&&Wi.getInstance(i).hide(),Wi.getOrCreateInstance(e).toggle(this)})),ue.on(window,"load.bs.offcanvas.data-api",(()=>ke.find(Bi).forEach((t=>Wi.getOrCreateInstance(t).show())))),pe(Wi),Gt(Wi);const Vi=new Set(["background","cite","href","itemtype","longdesc","poster","src","xlink:href"]),Gi=/^(?:(?:https?|mailto|ftp|tel|file|sms):|[^#&/:?]*(?:[#/?]|$))/i,Ui=/^data:(?:image\/(?:bmp|gif|jpeg|jpg|png|tiff|webp)|video\/(?:mpeg|mp4|ogg|webm)|audio\/(?:mp3|oga|ogg|opus));base64,[\d+/a-z]+=*$/i,qi=(t,e)=>{const i=t.nodeName.toLowerCase();if(e.includes(i))return!Vi.has(i)||Boolean(Gi.test(t.nodeValue)||Ui.test(t.nodeValue));const n=e.filter((t=>t instanceof RegExp));for(let t=0,e=n.length;t<e;t++)if(n[t].test(i))return!0;return!1};function $i(t,e,i){if(!t.length)return t;if(i&&"function"==typeof i)return i(t);const n=(new window.DOMParser).parseFromString(t,"text/html"),a=[].concat(...n.body.querySelectorAll("*"));for(let t=0,i=a.length;t<i;t++){const i=a[t],n=i.nodeName.toLowerCase();if(!Object.keys(e).includes(n)){i.remove();continue}const r=[].concat(...i.attributes),s=[].concat(e["*"]||[],e[n]||[]);r.forEach((t=>{qi(t,s)||i.removeAttribute(t.nodeName)}))}return n.body.innerHTML}const Zi="tooltip",Ki=new Set(["sanitize","allowList","sanitizeFn"]),Qi={animation:"boolean",template:"string",title:"(string|element|function)",trigger:"string",delay:"(number|object)",html:"boolean",selector:"(string|boolean)",placement:"(string|function)",offset:"(array|string|function)",container:"(string|element|boolean)",fallbackPlacements:"array",boundary:"(string|element)",customClass:"(string|function)",sanitize:"boolean",sanitizeFn:"(null|function)",allowList:"object",popperConfig:"(null|object|function)"},Ji={AUTO:"auto",TOP:"top",RIGHT:Vt()?"left":"right",BOTTOM:"bottom",LEFT:Vt()?"right":"left"},tn={animation:!0,template:'<div class="tooltip" role="tooltip"><div class="tooltip-arrow"></div><div class="tooltip-inner"></div></div>',trigger:"hover focus",title:"",delay:0,html:!1,selector:!1,placement:"top",offset:[0,0],container:!1,fallbackPlacements:["top","right","bottom","left"],boundary:"clippingParents",customClass:"",sanitize:!0,sanitizeFn:null,allowList:{"*":["class","dir","id","lang","role",/^aria-[\w-]*$/i],a:["target","href","title","rel"],area:[],b:[],br:[],col:[],code:[],div:[],em:[],hr:[],h1:[],h2:[],h3:[],h4:[],h5:[],h6:[],i:[],img:["src","srcset","alt","title","width","height"],li:[],ol:[],p:[],pre:[],s:[],small:[],span:[],sub:[],sup:[],strong:[],u:[],ul:[]},popperConfig:null},en={HIDE:"hide.bs.tooltip",HIDDEN:"hidden.bs.tooltip",SHOW:"show.bs.tooltip",SHOWN:"shown.bs.tooltip",INSERTED:"inserted.bs.tooltip",CLICK:"click.bs.tooltip",FOCUSIN:"focusin.bs.tooltip",FOCUSOUT:"focusout.bs.tooltip",MOUSEENTER:"mouseenter.bs.tooltip",MOUSELEAVE:"mouseleave.bs.tooltip"},nn="fade",an="show",rn="show",sn="out",on=".tooltip-inner",ln=".modal",cn="hide.bs.modal",hn="hover",un="focus";class dn extends ge{constructor(e,i){if(void 0===t)throw new TypeError("Bootstrap's tooltips require Popper (https://popper.js.org)");super(e),this._isEnabled=!0,this._timeout=0,this._hoverState="",this._activeTrigger={},this._popper=null,this._config=this._getConfig(i),this.tip=null,this._setListeners()}static get Default(){return tn}static get NAME(){return Zi}static get Event(){return en}static get DefaultType(){return Qi}enable(){this._isEnabled=!0}disable(){this._isEnabled=!1}toggleEnabled(){this._isEnabled=!this._isEnabled}toggle(t){if(this._isEnabled)if(t){const e=this._initializeOnDelegatedTarget(t);e._activeTrigger.click=!e._activeTrigger.click,e._isWithActiveTrigger()?e._enter(null,e):e._leave(null,e)}else{if(this.getTipElement().classList.contains(an))return void this._leave(null,this);this._enter(null,this)}}dispose(){clearTimeout(this._timeout),ue.off(this._element.closest(ln),cn,this._hideModalHandler),this.tip&&this.tip.remove(),this._disposePopper(),super.dispose()}show(){if("none"===this._element.style.display)throw new Error("Please use show on visible elements");if(!this.isWithContent()||!this._isEnabled)return;const t=ue.trigger(this._element,this.constructor.Event.SHOW),e=Yt(this._element),i=null===e?this._element.ownerDocument.documentElement.contains(this._element):e.contains(this._element);if(t.defaultPrevented||!i)return;"tooltip"===this.constructor.NAME&&this.tip&&this.getTitle()!==this.tip.querySelector(on).innerHTML&&(this._disposePopper(),this.tip.remove(),this.tip=null);const n=this.getTipElement(),a=(t=>{do{t+=Math.floor(1e6*Math.random())}while(document.getElementById(t));return t})(this.constructor.NAME);n.setAttribute("id",a),this._element.setAttribute("aria-describedby",a),this._config.animation&&n.classList.add(nn);const r="function"==typeof this._config.placement?this._config.placement.call(this,n,this._element):this._config.placement,s=this._getAttachment(r);this._addAttachmentClass(s);const{container:o}=this._config;fe.set(n,this.constructor.DATA_KEY,this),this._element.ownerDocument.documentElement.contains(this.tip)||(o.append(n),ue.trigger(this._element,this.constructor.Event.INSERTED)),this._popper?this._popper.update():this._popper=Tt(this._element,n,this._getPopperConfig(s)),n.classList.add(an);const l=this._resolvePossibleFunction(this._config.customClass);l&&n.classList.add(...l.split(" ")),"ontouchstart"in document.documentElement&&[].concat(...document.body.children).forEach((t=>{ue.on(t,"mouseover",Xt)}));const c=this.tip.classList.contains(nn);this._queueCallback((()=>{const t=this._hoverState;this._hoverState=null,ue.trigger(this._element,this.constructor.Event.SHOWN),t===sn&&this._leave(null,this)}),this.tip,c)}hide(){if(!this._popper)return;const t=this.getTipElement();if(ue.trigger(this._element,this.constructor.Event.HIDE).defaultPrevented)return;t.classList.remove(an),"ontouchstart"in document.documentElement&&[].concat(...document.body.children).forEach((t=>ue.off(t,"mouseover",Xt))),this._activeTrigger.click=!1,this._activeTrigger.focus=!1,this._activeTrigger.hover=!1;const e=this.tip.classList.contains(nn);this._queueCallback((()=>{this._isWithActiveTrigger()||(this._hoverState!==rn&&t.remove(),this._cleanTipClass(),this._element.removeAttribute("aria-describedby"),ue.trigger(this._element,this.constructor.Event.HIDDEN),this._disposePopper())}),this.tip,e),this._hoverState=""}update(){null!==this._popper&&this._popper.update()}isWithContent(){return Boolean(this.getTitle())}getTipElement(){if(this.tip)return this.tip;const t=document.createElement("div");t.innerHTML=this._config.template;const e=t.children[0];return this.setContent(e),e.classList.remove(nn,an),this.tip=e,this.tip}setContent(t){this._sanitizeAndSetContent(t,this.getTitle(),on)}_sanitizeAndSetContent(t,e,i){const n=ke.findOne(i,t);e||!n?this.setElementContent(n,e):n.remove()}setElementContent(t,e){if(null!==t)return Nt(e)?(e=Ft(e),void(this._config.html?e.parentNode!==t&&(t.innerHTML="",t.append(e)):t.textContent=e.textContent)):void(this._config.html?(this._config.sanitize&&(e=$i(e,this._config.allowList,this._config.sanitizeFn)),t.innerHTML=e):t.textContent=e)}getTitle(){const t=this._element.getAttribute("data-bs-original-title")||this._config.title;return this._resolvePossibleFunction(t)}updateAttachment(t){return"right"===t?"end":"left"===t?"start":t}_initializeOnDelegatedTarget(t,e){return e||this.constructor.getOrCreateInstance(t.delegateTarget,this._getDelegateConfig())}_getOffset(){const{offset:t}=this._config;return"string"==typeof t?t.split(",").map((t=>Number.parseInt(t,10))):"function"==typeof t?e=>t(e,this._element):t}_resolvePossibleFunction(t){return"function"==typeof t?t.call(this._element):t}_getPopperConfig(t){const e={placement:t,modifiers:[{name:"flip",options:{fallbackPlacements:this._config.fallbackPlacements}},{name:"offset",options:{offset:this._getOffset()}},{name:"preventOverflow",options:{boundary:this._config.boundary}},{name:"arrow",options:{element:`.${this.constructor.NAME}-arrow`}},{name:"onChange",enabled:!0,phase:"afterWrite",fn:t=>this._handlePopperPlacementChange(t)}],onFirstUpdate:t=>{t.options.placement!==t.placement&&this._handlePopperPlacementChange(t)}};return{...e,..."function"==typeof this._config.popperConfig?this._config.popperConfig(e):this._config.popperConfig}}_addAttachmentClass(t){this.getTipElement().classList.add(`${this._getBasicClassPrefix()}-${this.updateAttachment(t)}`)}_getAttachment(t){return Ji[t.toUpperCase()]}_setListeners(){this._config.trigger.split(" ").forEach((t=>{if("click"===t)ue.on(this._element,this.constructor.Event.CLICK,this._config.selector,(t=>this.toggle(t)));else if("manual"!==t){const e=t===hn?this.constructor.Event.MOUSEENTER:this.constructor.Event.FOCUSIN,i=t===hn?this.constructor.Event.MOUSELEAVE:this.constructor.Event.FOCUSOUT;ue.on(this._element,e,this._config.selector,(t=>this._enter(t))),ue.on(this._element,i,this._config.selector,(t=>this._leave(t)))}})),this._hideModalHandler=()=>{this._element&&this.hide()},ue.on(this._element.closest(ln),cn,this._hideModalHandler),this._config.selector?this._config={...this._config,trigger:"manual",selector:""}:this._fixTitle()}_fixTitle(){const t=this._element.getAttribute("title"),e=typeof this._element.getAttribute("data-bs-original-title");(t||"string"!==e)&&(this._element.setAttribute("data-bs-original-title",t||""),!t||this._element.getAttribute("aria-label")||this._element.textContent||this._element.setAttribute("aria-label",t),this._element.setAttribute("title",""))}_enter(t,e){e=this._initializeOnDelegatedTarget(t,e),t&&(e._activeTrigger["focusin"===t.type?un:hn]=!0),e.getTipElement().classList.contains(an)||e._hoverState===rn?e._hoverState=rn:(clearTimeout(e._timeout),e._hoverState=rn,e._config.delay&&e._config.delay.show?e._timeout=setTimeout((()=>{e._hoverState===rn&&e.show()}),e._config.delay.show):e.show())}_leave(t,e){e=this._initializeOnDelegatedTarget(t,e),t&&(e._activeTrigger["focusout"===t.type?un:hn]=e._element.contains(t.relatedTarget)),e._isWithActiveTrigger()||(clearTimeout(e._timeout),e._hoverState=sn,e._config.delay&&e._config.delay.hide?e._timeout=setTimeout((()=>{e._hoverState===sn&&e.hide()}),e._config.delay.hide):e.hide())}_isWithActiveTrigger(){for(const t in this._activeTrigger)if(this._activeTrigger[t])return!0;return!1}_getConfig(t){const e=we.getDataAttributes(this._element);return Object.keys(e).forEach((t=>{Ki.has(t)&&delete e[t]})),(t={...this.constructor.Default,...e,..."object"==typeof t&&t?t:{}}).container=!1===t.container?document.body:Ft(t.container),"number"==typeof t.delay&&(t.delay={show:t.delay,hide:t.delay}),"number"==typeof t.title&&(t.title=t.title.toString()),"number"==typeof t.content&&(t.content=t.content.toString()),Rt(Zi,t,this.constructor.DefaultType),t.sanitize&&(t.template=$i(t.template,t.allowList,t.sanitizeFn)),t}_getDelegateConfig(){const t={};for(const e in this._config)this.constructor.Default[e]!==this._config[e]&&(t[e]=this._config[e]);return t}_cleanTipClass(){const t=this.getTipElement(),e=new RegExp(`(^|\\s)${this._getBasicClassPrefix()}\\S+`,"g"),i=t.getAttribute("class").match(e);null!==i&&i.length>0&&i.map((t=>t.trim())).forEach((e=>t.classList.remove(e)))}_getBasicClassPrefix(){return"bs-tooltip"}_handlePopperPlacementChange(t){const{state:e}=t;e&&(this.tip=e.elements.popper,this._cleanTipClass(),this._addAttachmentClass(this._getAttachment(e.placement)))}_disposePopper(){this._popper&&(this._popper.destroy(),this._popper=null)}static jQueryInterface(t){return this.each((function(){const e=dn.getOrCreateInstance(this,t);if("string"==typeof t){if(void 0===e[t])throw new TypeError(`No method named "${t}"`);e[t]()}}))}}Gt(dn);const fn={...dn.Default,placement:"right",offset:[0,8],trigger:"click",content:"",template:'<div class="popover" role="tooltip"><div class="popover-arrow"></div><h3 class="popover-header"></h3><div class="popover-body"></div></div>'},gn={...dn.DefaultType,content:"(string|element|function)"},pn={HIDE:"hide.bs.popover",HIDDEN:"hidden.bs.popover",SHOW:"show.bs.popover",SHOWN:"shown.bs.popover",INSERTED:"inserted.bs.popover",CLICK:"click.bs.popover",FOCUSIN:"focusin.bs.popover",FOCUSOUT:"focusout.bs.popover",MOUSEENTER:"mouseenter.bs.popover",MOUSELEAVE:"mouseleave.bs.popover"};class mn extends dn{static get Default(){return fn}static get NAME(){return"popover"}static get Event(){return pn}static get DefaultType(){return gn}isWithContent(){return this.getTitle()||this._getContent()}setContent(t){this._sanitizeAndSetContent(t,this.getTitle(),".popover-header"),this._sanitizeAndSetContent(t,this._getContent(),".popover-body")}_getContent(){return this._resolvePossibleFunction(this._config.content)}_getBasicClassPrefix(){return"bs-popover"}static jQueryInterface(t){return this.each((function(){const e=mn.getOrCreateInstance(this,t);if("string"==typeof t){if(void 0===e[t])throw new TypeError(`No method named "${t}"`);e[t]()}}))}}Gt(mn);const vn="scrollspy",xn={offset:10,method:"auto",target:""},bn={offset:"number",method:"string",target:"(string|element)"},yn="active",wn=".nav-link, .list-group-item, .dropdown-item",kn="position";class An extends ge{constructor(t,e){super(t),this._scrollElement="BODY"===this._element.tagName?window:this._element,this._config=this._getConfig(e),this._offsets=[],this._targets=[],this._activeTarget=null,this._scrollHeight=0,ue.on(this._scrollElement,"scroll.bs.scrollspy",(()=>this._process())),this.refresh(),this._process()}static get Default(){return xn}static get NAME(){return vn}refresh(){const t=this._scrollElement===this._scrollElement.window?"offset":kn,e="auto"===this._config.method?t:this._config.method,i=e===kn?this._getScrollTop():0;this._offsets=[],this._targets=[],this._scrollHeight=this._getScrollHeight(),ke.find(wn,this._config.target).map((t=>{const n=Dt(t),a=n?ke.findOne(n):null;if(a){const t=a.getBoundingClientRect();if(t.width||t.height)return[we[e](a).top+i,n]}return null})).filter((t=>t)).sort(((t,e)=>t[0]-e[0])).forEach((t=>{this._offsets.push(t[0]),this._targets.push(t[1])}))}dispose(){ue.off(this._scrollElement,".bs.scrollspy"),super.dispose()}_getConfig(t){return(t={...xn,...we.getDataAttributes(this._element),..."object"==typeof t&&t?t:{}}).target=Ft(t.target)||document.documentElement,Rt(vn,t,bn),t}_getScrollTop(){return this._scrollElement===window?this._scrollElement.pageYOffset:this._scrollElement.scrollTop}_getScrollHeight(){return this._scrollElement.scrollHeight||Math.max(document.body.scrollHeight,document.documentElement.scrollHeight)}_getOffsetHeight(){return this._scrollElement===window?window.innerHeight:this._scrollElement.getBoundingClientRect().height}_process(){const t=this._getScrollTop()+this._config.offset,e=this._getScrollHeight(),i=this._config.offset+e-this._getOffsetHeight();if(this._scrollHeight!==e&&this.refresh(),t>=i){const t=this._targets[this._targets.length-1];this._activeTarget!==t&&this._activate(t)}else{if(this._activeTarget&&t<this._offsets[0]&&this._offsets[0]>0)return this._activeTarget=null,void this._clear();for(let e=this._offsets.length;e--;)this._activeTarget!==this._targets[e]&&t>=this._offsets[e]&&(void 0===this._offsets[e+1]||t<this._offsets[e+1])&&this._activate(this._targets[e])}}_activate(t){this._activeTarget=t,this._clear();const e=wn.split(",").map((e=>`${e}[data-bs-target="${t}"],${e}[href="${t}"]`)),i=ke.findOne(e.join(","),this._config.target);i.classList.add(yn),i.classList.contains("dropdown-item")?ke.findOne(".dropdown-toggle",i.closest(".dropdown")).classList.add(yn):ke.parents(i,".nav, .list-group").forEach((t=>{ke.prev(t,".nav-link, .list-group-item").forEach((t=>t.classList.add(yn))),ke.prev(t,".nav-item").forEach((t=>{ke.children(t,".nav-link").forEach((t=>t.classList.add(yn)))}))})),ue.trigger(this._scrollElement,"activate.bs.scrollspy",{relatedTarget:t})}_clear(){ke.find(wn,this._config.target).filter((t=>t.classList.contains(yn))).forEach((t=>t.classList.remove(yn)))}static jQueryInterface(t){return this.each((function(){const e=An.getOrCreateInstance(this,t);if("string"==typeof t){if(void 0===e[t])throw new TypeError(`No method named "${t}"`);e[t]()}}))}}ue.on(window,"load.bs.scrollspy.data-api",(()=>{ke.find('[data-bs-spy="scroll"]').forEach((t=>new An(t)))})),Gt(An);const Sn="active",_n="fade",Cn="show",En=".active",Tn=":scope > li > .active";class Pn extends ge{static get NAME(){return"tab"}show(){if(this._element.parentNode&&this._element.parentNode.nodeType===Node.ELEMENT_NODE&&this._element.classList.contains(Sn))return;let t;const e=It(this._element),i=this._element.closest(".nav, .list-group");if(i){const e="UL"===i.nodeName||"OL"===i.nodeName?Tn:En;t=ke.find(e,i),t=t[t.length-1]}const n=t?ue.trigger(t,"hide.bs.tab",{relatedTarget:this._element}):null;if(ue.trigger(this._element,"show.bs.tab",{relatedTarget:t}).defaultPrevented||null!==n&&n.defaultPrevented)return;this._activate(this._element,i);const a=()=>{ue.trigger(t,"hidden.bs.tab",{relatedTarget:this._element}),ue.trigger(this._element,"shown.bs.tab",{relatedTarget:t})};e?this._activate(e,e.parentNode,a):a()}_activate(t,e,i){const n=(!e||"UL"!==e.nodeName&&"OL"!==e.nodeName?ke.children(e,En):ke.find(Tn,e))[0],a=i&&n&&n.classList.contains(_n),r=()=>this._transitionComplete(t,n,i);n&&a?(n.classList.remove(Cn),this._queueCallback(r,t,!0)):r()}_transitionComplete(t,e,i){if(e){e.classList.remove(Sn);const t=ke.findOne(":scope > .dropdown-menu .active",e.parentNode);t&&t.classList.remove(Sn),"tab"===e.getAttribute("role")&&e.setAttribute("aria-selected",!1)}t.classList.add(Sn),"tab"===t.getAttribute("role")&&t.setAttribute("aria-selected",!0),Bt(t),t.classList.contains(_n)&&t.classList.add(Cn);let n=t.parentNode;if(n&&"LI"===n.nodeName&&(n=n.parentNode),n&&n.classList.contains("dropdown-menu")){const e=t.closest(".dropdown");e&&ke.find(".dropdown-toggle",e).forEach((t=>t.classList.add(Sn))),t.setAttribute("aria-expanded",!0)}i&&i()}static jQueryInterface(t){return this.each((function(){const e=Pn.getOrCreateInstance(this);if("string"==typeof t){if(void 0===e[t])throw new TypeError(`No method named "${t}"`);e[t]()}}))}}ue.on(document,"click.bs.tab.data-api",'[data-bs-toggle="tab"], [data-bs-toggle="pill"], [data-bs-toggle="list"]',(function(t){["A","AREA"].includes(this.tagName)&&t.preventDefault(),Ht(this)||Pn.getOrCreateInstance(this).show()})),Gt(Pn);const Mn="toast",Ln="hide",Dn="show",In="showing",On={animation:"boolean",autohide:"boolean",delay:"number"},Nn={animation:!0,autohide:!0,delay:5e3};class Fn extends ge{constructor(t,e){super(t),this._config=this._getConfig(e),this._timeout=null,this._hasMouseInteraction=!1,this._hasKeyboardInteraction=!1,this._setListeners()}static get DefaultType(){return On}static get Default(){return Nn}static get NAME(){return Mn}show(){ue.trigger(this._element,"show.bs.toast").defaultPrevented||(this._clearTimeout(),this._config.animation&&this._element.classList.add("fade"),this._element.classList.remove(Ln),Bt(this._element),this._element.classList.add(Dn),this._element.classList.add(In),this._queueCallback((()=>{this._element.classList.remove(In),ue.trigger(this._element,"shown.bs.toast"),this._maybeScheduleHide()}),this._element,this._config.animation))}hide(){this._element.classList.contains(Dn)&&(ue.trigger(this._element,"hide.bs.toast").defaultPrevented||(this._element.classList.add(In),this._queueCallback((()=>{this._element.classList.add(Ln),this._element.classList.remove(In),this._element.classList.remove(Dn),ue.trigger(this._element,"hidden.bs.toast")}),this._element,this._config.animation)))}dispose(){this._clearTimeout(),this._element.classList.contains(Dn)&&this._element.classList.remove(Dn),super.dispose()}_getConfig(t){return t={...Nn,...we.getDataAttributes(this._element),..."object"==typeof t&&t?t:{}},Rt(Mn,t,this.constructor.DefaultType),t}_maybeScheduleHide(){this._config.autohide&&(this._hasMouseInteraction||this._hasKeyboardInteraction||(this._timeout=setTimeout((()=>{this.hide()}),this._config.delay)))}_onInteraction(t,e){switch(t.type){case"mouseover":case"mouseout":this._hasMouseInteraction=e;break;case"focusin":case"focusout":this._hasKeyboardInteraction=e}if(e)return void this._clearTimeout();const i=t.relatedTarget;this._element===i||this._element.contains(i)||this._maybeScheduleHide()}_setListeners(){ue.on(this._element,"mouseover.bs.toast",(t=>this._onInteraction(t,!0))),ue.on(this._element,"mouseout.bs.toast",(t=>this._onInteraction(t,!1))),ue.on(this._element,"focusin.bs.toast",(t=>this._onInteraction(t,!0))),ue.on(this._element,"focusout.bs.toast",(t=>this._onInteraction(t,!1)))}_clearTimeout(){clearTimeout(this._timeout),this._timeout=null}static jQueryInterface(t){return this.each((function(){const e=Fn.getOrCreateInstance(this,t);if("string"==typeof t){if(void 0===e[t])throw new TypeError(`No method named "${t}"`);e[t](this)}}))}}pe(Fn),Gt(Fn);var Rn=i(927),zn=i.n(Rn),Hn=[];function Yn(t){if(Hn)for(;Hn.length>0;)Hn.pop().destroy();let e=document.querySelector(t);if(e){let t=e.dataset.chartUrl;function i(t,e,i){if("apexchart"===t.chartlib){e.innerHTML="";let t=new(zn())(e,i);t.render(),Hn.push(t)}}fetch(t,{method:"GET",headers:{"X-Requested-With":"XMLHttpRequest"}}).then((t=>t.json())).then((t=>{let n=t.charts,a=t.settings;e.innerHTML=t.template,n.forEach((t=>{let e=document.querySelector("#"+t.div_id);"chart"===t.type?e&&i(a,e,t.data):"card"===t.type&&(e.innerHTML=t.data)}))})).catch((function(t){let e=document.querySelector(".chart-panel");e&&(e.innerHTML='<p class="alert-warning p-4 w-25" style="border-radius: 5px"> Dashboard não dinspońivel no momento </p>')}))}}var Xn=i(424),Bn=i.n(Xn);const jn=()=>{window.addEventListener("popstate",(function(t){this.window.location.reload()}))},Wn=(t,e)=>{t&&fetch(t,{method:"GET",headers:{"X-Requested-With":"XMLHttpRequest","X-Page-Content-Reload":"Active"}}).then((t=>t.text())).then((i=>{Vn(i),e(),window.history.state!==t&&window.history.pushState(t,null,t)}))};function Vn(t){console.log(1);let e=document.createElement("div");e.innerHTML=t,e.querySelectorAll(".page-content").forEach((t=>{let e=t.id;document.querySelector("#"+e).innerHTML=t.innerHTML,t.remove()}))}let Gn=null,Un=null,qn=null,$n=null;const Zn=t=>{t.erro?Kn(null,"","","",""):Kn(t.cep,t.logradouro,t.localidade,t.uf)},Kn=(t,e,i,n)=>{t&&(document.querySelector("#id_zip_code").value=t),document.querySelector("#id_address").value=e,document.querySelector("#id_city").value=i,document.querySelector("#id_state").value=n};var Qn=i(382),Jn=i.n(Qn);const ta=()=>{let t=document.getElementById("id_socket_name");t&&"send_batch_email"===JSON.parse(t.textContent).socket_name&&ea()};function ea(){let t=null;t=new WebSocket("wss://"+window.location.host+"/ws/send-batch-mail/"),t.onopen=function(t){},t.onclose=function(t){setTimeout((function(){ea()}),2e3)},t.onmessage=function(t){const e=JSON.parse(t.data);let i=e.data;"send_batch_email"===e.type&&(ia(i.sent.id,i.sent.value),na(i.status.id,i.status.value,i.status.text),ia(i.date_finished.id,i.date_finished.value))},t.onerror=function(e){t.close()}}const ia=(t,e)=>{let i=document.querySelector("#"+t);null!==e&&(i.innerHTML=e)},na=(t,e,i)=>{let n=document.querySelector("#"+t);if(n){let t='<div class="text-center"><div class="spinner-border spinner-border-sm" role="status"></div></div>';"PROC"===e&&n.innerHTML!==t?n.innerHTML=t:"FINI"!==e&&"FERR"!==e||(n.innerHTML=i)}};var aa=i(79),ra=i.n(aa);function sa(t){let e="#000000";t.value==e?tinyMCE.activeEditor.getBody().style.color="#FFFFFF":tinyMCE.activeEditor.getBody().style.color=e,tinyMCE.activeEditor.getBody().style.backgroundColor=t.value}function oa(){var t;Yn(".chart-panel"),document.querySelectorAll(".chart-button").forEach((t=>t.addEventListener("click",(e=>{var i;e.preventDefault(),function(t,e){let i=document.querySelector(e);i&&(i.dataset.chartUrl=t,Yn(e))}(t.href,".chart-panel"),i=t.dataset.chartSelected,document.querySelectorAll(".chart_selected").forEach((t=>{t.innerHTML=""})),document.querySelector("#chart_"+i).innerHTML='<i class="bi bi-check-lg text-success"></i>'})))),t="technical-analysis",document.getElementById(t)&&(Gn&&(Gn=null),Gn=new TradingView.widget({autosize:!0,symbol:"NQ1!",interval:"D",timezone:"Etc/UTC",theme:"light",style:"1",locale:"br",toolbar_bg:"#f1f3f6",enable_publishing:!1,allow_symbol_change:!0,container_id:t})),window.setTimeout((()=>{document.querySelectorAll(".toast").forEach((t=>t.remove()))}),3e3),function(){!function(){let t=document.getElementById("term_modal");t&&t.addEventListener("show.bs.modal",(function(e){let i=e.relatedTarget.href;!function(t,e){let i=t.querySelector(".modal-body"),n=t.querySelector(".modal-title");fetch(e).then((t=>t.json())).then((t=>{n.innerHTML=t.product_name+" - "+t.title,i.innerHTML=t.text}))}(t,i)}))}();let t=document.getElementById("message_modal");t&&new(Bn())(t).show()}(),(()=>{let t=document.querySelector("#id_agreement_form");t&&(Un=document.querySelector("#id_agreement_modal_accept"),qn=document.querySelector("#id_modal_submit"),$n=document.querySelector("#id_modal_accept_div"),Un.addEventListener("click",(t=>{qn.disabled=!t.target.checked})),t.addEventListener("submit",(t=>{if("id_agreement_form"!==t.target.id)return!0;if($n.style="display: block",Un.disabled=!1,Un.checked=!1,qn.innerHTML="Continuar",qn.type="submit",qn.disabled=!0,"id_purchase_product"===t.submitter.id){t.preventDefault();let e=document.getElementById("id_agreement_modal");if(e){let i=new(Bn())(e),n=t.target.dataset.agreementUrl,a=t.target.dataset.extraArgs,r="";a&&a.split(",").forEach((t=>{let e=document.getElementById("id_"+t).value;r+="&value="+e})),console.log(r),((t,e,i,n)=>{fetch(t+"?product_id="+i+n).then((t=>t.json())).then((t=>{let i=e.querySelector(".modal-body"),n=e.querySelector(".modal-title"),a=e.querySelector("#id_agreement_term");t.error?(i.innerHTML=t.error,$n.style="display: none",Un.disabled=!0,qn.innerHTML="Fechar",qn.type="button",qn.disabled=!1):(i.innerHTML=t.text,n.innerHTML="Contrato "+t.product.display_text,t.agreement_term?a.innerHTML="Duração de "+t.agreement_term:a.innerHTML="Prazo indeterminado")})).catch((function(t){e.querySelector(".modal-body").innerHTML="Ocoreu um erro ao tentar acessar o contrato. Tente novamente mais tarde.",$n.style="display: none",Un.disabled=!0,qn.innerHTML="Fechar",qn.type="button",qn.disabled=!1}))})(n,e,t.submitter.dataset.product,r),i.show()}return!1}if("id_modal_submit"===t.submitter.id){let t=document.querySelector("#id_accept_agreement"),e=document.querySelector("#id_agreement_modal_accept");return t.checked=e.checked,t.value=e.checked,e.checked=!1,!0}})))})(),(()=>{let t=document.querySelector("#id_accept_term"),e=document.querySelector("#id_accept_term_button");t&&e&&t.addEventListener("click",(t=>{e.disabled=!t.target.checked}))})(),(()=>{let t=document.querySelector("#id_zip_code");t&&t.addEventListener("blur",(t=>{let e=t.target.value;(t=>{let e=t.replace(/\D/g,"");if(""!=e){if(/^[0-9]{8}$/.test(e))return e;Kn(null,"","","","")}return null})(e)&&((t,e)=>{let i="https://viacep.com.br/ws/"+t+"/json/",n=document.querySelector("label[for=id_zip_code]");fetch(i).then((t=>(n.innerHTML='Cep <div class="spinner-border spinner-border-sm text-secondary mt-1 ml-2"></div>',t.json()))).then((t=>{e(t),n.innerHTML="Cep"})).catch((t=>{e({erro:!0}),n.innerHTML="Cep"}))})(e,Zn)}))})(),(()=>{let t=document.querySelector(".phone"),e=document.querySelector(".cpf"),i=document.querySelector(".cnpj"),n=document.querySelector(".zip_code");t&&Jn()({mask:"(99) 9999[9]-9999",onincomplete:function(){let e=t.inputmask.unmaskedvalue();10==e.length&&(t.value=Jn().format(e,{mask:"(99) 9999-9999"}))}}).mask(t),e&&Jn()({mask:"999.999.999-99"}).mask(e),n&&Jn()("99999-999").mask(n),i&&Jn()("99.999.999/9999-99").mask(i)})(),ta(),(()=>{let t=document.querySelector("#id_select_op"),e=document.querySelector("#id_deposit_op"),i=document.querySelector("#id_withdraw_op");t&&t.addEventListener("change",(()=>{if(t.value){e.disabled=!1,i.disabled=!1;let n=t.options[t.selectedIndex].dataset;e.setAttribute("onclick",`window.location.href='${n.depositUrl}'`),i.setAttribute("onclick",`window.location.href='${n.withdrawUrl}'`)}else e.disabled=!0,i.disabled=!0,e.onclick="",i.onclick=""}))})(),(()=>{let t=document.querySelector(".check-unlock-button");if(t){let e=t.dataset.buttonValue,i=document.querySelector(`button[value="${e}"]`);t.addEventListener("click",(t=>{i.disabled=!t.target.checked}))}})(),(()=>{let t=document.querySelectorAll(".decimal-input");t&&t.forEach((t=>{let e=t.dataset.digits;ra().setMask(`#${t.id}`,{fractionDigits:e,cursor:"end"})}))})(),(()=>{let t=document.querySelector("#id_abt_us_bkg_color");t&&(window.onload=()=>{sa(t)},t.addEventListener("change",(()=>{sa(t)})))})()}i(837),oa(),(()=>{let t=document.querySelector("#id_signup_form"),e=document.querySelector("#id_term_modal_accept");if(function(){let t=document.querySelector("#id_signup_submit");if(t){let e=document.querySelector("#id_signup_form").querySelectorAll("input[type=text], input[type=password]");e.forEach((i=>{i.addEventListener("keyup",(()=>{let i=0;e.forEach((t=>{0!==t.value.length&&(i+=1)})),i!==e.length?t.disabled=!0:i===e.length&&(t.disabled=!1)}))}))}}(),t&&e){let i=document.querySelector("#id_modal_submit");e.addEventListener("click",(t=>{i.disabled=!t.target.checked})),t.addEventListener("submit",(t=>{if("id_signup_form"!==t.target.id)return!0;if(t.target.dataset.acceptTerm){if("id_signup_submit"===t.submitter.id){t.preventDefault();let e=document.getElementById("id_signup_term_modal");return e&&new(Bn())(e).show(),!1}if("id_modal_submit"===t.submitter.id){let t=document.querySelector("#id_accept_terms"),e=document.querySelector("#id_term_modal_accept");return t.checked=e.checked,t.value=e.checked,e.checked=!1,!0}}}))}})(),[].slice.call(document.querySelectorAll('[data-bs-toggle="popover"]')).map((function(t){return new mn(t)})),"true"===document.currentScript.getAttribute("active")&&(t=>{(t=>{document.querySelectorAll(".page-menu-link").forEach((e=>e.addEventListener("click",(i=>{i.preventDefault();let n=e.href;Wn(n,t)}))))})(t),(t=>{document.addEventListener("submit",(function(e){if("form_id"!==e.target.id)return!0;e.preventDefault();let i=new FormData(e.target);return i.append("button",e.submitter.value),fetch(e.target.action,{method:"POST",headers:{"X-Requested-With":"XMLHttpRequest","X-Page-Content-Reload":"Active"},body:i}).then((function(t){return t.ok?(window.history.pushState(t.url,null,t.url),t.text()):Promise.reject(t)})).then((function(e){Vn(e),t()})).catch((function(t){console.log(t)})),!1}))})(t),jn()})(oa)})()})();
\ No newline at end of file
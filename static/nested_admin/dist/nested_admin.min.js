@@ -0,0 +1,3 @@
+/*! For license information please see nested_admin.min.js.LICENSE.txt */
+!function(){var t={4963:function(t){t.exports=function(t){if("function"!=typeof t)throw TypeError(t+" is not a function!");return t}},7722:function(t,e,i){var n=i(6314)("unscopables"),o=Array.prototype;null==o[n]&&i(7728)(o,n,{}),t.exports=function(t){o[n][t]=!0}},6793:function(t,e,i){"use strict";var n=i(4496)(!0);t.exports=function(t,e,i){return e+(i?n(t,e).length:1)}},7007:function(t,e,i){var n=i(5286);t.exports=function(t){if(!n(t))throw TypeError(t+" is not an object!");return t}},9315:function(t,e,i){var n=i(2110),o=i(875),r=i(2337);t.exports=function(t){return function(e,i,s){var a,l=n(e),h=o(l.length),c=r(s,h);if(t&&i!=i){for(;h>c;)if((a=l[c++])!=a)return!0}else for(;h>c;c++)if((t||c in l)&&l[c]===i)return t||c||0;return!t&&-1}}},50:function(t,e,i){var n=i(741),o=i(9797),r=i(508),s=i(875),a=i(6886);t.exports=function(t,e){var i=1==t,l=2==t,h=3==t,c=4==t,d=6==t,u=5==t||d,f=e||a;return function(e,a,p){for(var m,g,v=r(e),_=o(v),y=n(a,p,3),b=s(_.length),x=0,w=i?f(e,b):l?f(e,0):void 0;b>x;x++)if((u||x in _)&&(g=y(m=_[x],x,v),t))if(i)w[x]=g;else if(g)switch(t){case 3:return!0;case 5:return m;case 6:return x;case 2:w.push(m)}else if(c)return!1;return d?-1:h||c?c:w}}},2736:function(t,e,i){var n=i(5286),o=i(4302),r=i(6314)("species");t.exports=function(t){var e;return o(t)&&("function"!=typeof(e=t.constructor)||e!==Array&&!o(e.prototype)||(e=void 0),n(e)&&null===(e=e[r])&&(e=void 0)),void 0===e?Array:e}},6886:function(t,e,i){var n=i(2736);t.exports=function(t,e){return new(n(t))(e)}},1488:function(t,e,i){var n=i(2032),o=i(6314)("toStringTag"),r="Arguments"==n(function(){return arguments}());t.exports=function(t){var e,i,s;return void 0===t?"Undefined":null===t?"Null":"string"==typeof(i=function(t,e){try{return t[e]}catch(t){}}(e=Object(t),o))?i:r?n(e):"Object"==(s=n(e))&&"function"==typeof e.callee?"Arguments":s}},2032:function(t){var e={}.toString;t.exports=function(t){return e.call(t).slice(8,-1)}},5645:function(t){var e=t.exports={version:"2.6.12"};"number"==typeof __e&&(__e=e)},741:function(t,e,i){var n=i(4963);t.exports=function(t,e,i){if(n(t),void 0===e)return t;switch(i){case 1:return function(i){return t.call(e,i)};case 2:return function(i,n){return t.call(e,i,n)};case 3:return function(i,n,o){return t.call(e,i,n,o)}}return function(){return t.apply(e,arguments)}}},1355:function(t){t.exports=function(t){if(null==t)throw TypeError("Can't call method on  "+t);return t}},7057:function(t,e,i){t.exports=!i(4253)((function(){return 7!=Object.defineProperty({},"a",{get:function(){return 7}}).a}))},2457:function(t,e,i){var n=i(5286),o=i(3816).document,r=n(o)&&n(o.createElement);t.exports=function(t){return r?o.createElement(t):{}}},4430:function(t){t.exports="constructor,hasOwnProperty,isPrototypeOf,propertyIsEnumerable,toLocaleString,toString,valueOf".split(",")},2985:function(t,e,i){var n=i(3816),o=i(5645),r=i(7728),s=i(7234),a=i(741),l=function(t,e,i){var h,c,d,u,f=t&l.F,p=t&l.G,m=t&l.S,g=t&l.P,v=t&l.B,_=p?n:m?n[e]||(n[e]={}):(n[e]||{}).prototype,y=p?o:o[e]||(o[e]={}),b=y.prototype||(y.prototype={});for(h in p&&(i=e),i)d=((c=!f&&_&&void 0!==_[h])?_:i)[h],u=v&&c?a(d,n):g&&"function"==typeof d?a(Function.call,d):d,_&&s(_,h,d,t&l.U),y[h]!=d&&r(y,h,u),g&&b[h]!=d&&(b[h]=d)};n.core=o,l.F=1,l.G=2,l.S=4,l.P=8,l.B=16,l.W=32,l.U=64,l.R=128,t.exports=l},4253:function(t){t.exports=function(t){try{return!!t()}catch(t){return!0}}},8082:function(t,e,i){"use strict";i(8269);var n=i(7234),o=i(7728),r=i(4253),s=i(1355),a=i(6314),l=i(1165),h=a("species"),c=!r((function(){var t=/./;return t.exec=function(){var t=[];return t.groups={a:"7"},t},"7"!=="".replace(t,"$<a>")})),d=function(){var t=/(?:)/,e=t.exec;t.exec=function(){return e.apply(this,arguments)};var i="ab".split(t);return 2===i.length&&"a"===i[0]&&"b"===i[1]}();t.exports=function(t,e,i){var u=a(t),f=!r((function(){var e={};return e[u]=function(){return 7},7!=""[t](e)})),p=f?!r((function(){var e=!1,i=/a/;return i.exec=function(){return e=!0,null},"split"===t&&(i.constructor={},i.constructor[h]=function(){return i}),i[u](""),!e})):void 0;if(!f||!p||"replace"===t&&!c||"split"===t&&!d){var m=/./[u],g=i(s,u,""[t],(function(t,e,i,n,o){return e.exec===l?f&&!o?{done:!0,value:m.call(e,i,n)}:{done:!0,value:t.call(i,e,n)}:{done:!1}})),v=g[0],_=g[1];n(String.prototype,t,v),o(RegExp.prototype,u,2==e?function(t,e){return _.call(t,this,e)}:function(t){return _.call(t,this)})}}},3218:function(t,e,i){"use strict";var n=i(7007);t.exports=function(){var t=n(this),e="";return t.global&&(e+="g"),t.ignoreCase&&(e+="i"),t.multiline&&(e+="m"),t.unicode&&(e+="u"),t.sticky&&(e+="y"),e}},18:function(t,e,i){t.exports=i(3825)("native-function-to-string",Function.toString)},3816:function(t){var e=t.exports="undefined"!=typeof window&&window.Math==Math?window:"undefined"!=typeof self&&self.Math==Math?self:Function("return this")();"number"==typeof __g&&(__g=e)},9181:function(t){var e={}.hasOwnProperty;t.exports=function(t,i){return e.call(t,i)}},7728:function(t,e,i){var n=i(9275),o=i(681);t.exports=i(7057)?function(t,e,i){return n.f(t,e,o(1,i))}:function(t,e,i){return t[e]=i,t}},639:function(t,e,i){var n=i(3816).document;t.exports=n&&n.documentElement},1734:function(t,e,i){t.exports=!i(7057)&&!i(4253)((function(){return 7!=Object.defineProperty(i(2457)("div"),"a",{get:function(){return 7}}).a}))},266:function(t,e,i){var n=i(5286),o=i(7375).set;t.exports=function(t,e,i){var r,s=e.constructor;return s!==i&&"function"==typeof s&&(r=s.prototype)!==i.prototype&&n(r)&&o&&o(t,r),t}},9797:function(t,e,i){var n=i(2032);t.exports=Object("z").propertyIsEnumerable(0)?Object:function(t){return"String"==n(t)?t.split(""):Object(t)}},4302:function(t,e,i){var n=i(2032);t.exports=Array.isArray||function(t){return"Array"==n(t)}},5286:function(t){t.exports=function(t){return"object"==typeof t?null!==t:"function"==typeof t}},5364:function(t,e,i){var n=i(5286),o=i(2032),r=i(6314)("match");t.exports=function(t){var e;return n(t)&&(void 0!==(e=t[r])?!!e:"RegExp"==o(t))}},4461:function(t){t.exports=!1},9275:function(t,e,i){var n=i(7007),o=i(1734),r=i(1689),s=Object.defineProperty;e.f=i(7057)?Object.defineProperty:function(t,e,i){if(n(t),e=r(e,!0),n(i),o)try{return s(t,e,i)}catch(t){}if("get"in i||"set"in i)throw TypeError("Accessors not supported!");return"value"in i&&(t[e]=i.value),t}},8693:function(t,e,i){var n=i(4682),o=i(681),r=i(2110),s=i(1689),a=i(9181),l=i(1734),h=Object.getOwnPropertyDescriptor;e.f=i(7057)?h:function(t,e){if(t=r(t),e=s(e,!0),l)try{return h(t,e)}catch(t){}if(a(t,e))return o(!n.f.call(t,e),t[e])}},616:function(t,e,i){var n=i(189),o=i(4430).concat("length","prototype");e.f=Object.getOwnPropertyNames||function(t){return n(t,o)}},189:function(t,e,i){var n=i(9181),o=i(2110),r=i(9315)(!1),s=i(9335)("IE_PROTO");t.exports=function(t,e){var i,a=o(t),l=0,h=[];for(i in a)i!=s&&n(a,i)&&h.push(i);for(;e.length>l;)n(a,i=e[l++])&&(~r(h,i)||h.push(i));return h}},4682:function(t,e){e.f={}.propertyIsEnumerable},681:function(t){t.exports=function(t,e){return{enumerable:!(1&t),configurable:!(2&t),writable:!(4&t),value:e}}},7234:function(t,e,i){var n=i(3816),o=i(7728),r=i(9181),s=i(3953)("src"),a=i(18),l="toString",h=(""+a).split(l);i(5645).inspectSource=function(t){return a.call(t)},(t.exports=function(t,e,i,a){var l="function"==typeof i;l&&(r(i,"name")||o(i,"name",e)),t[e]!==i&&(l&&(r(i,s)||o(i,s,t[e]?""+t[e]:h.join(String(e)))),t===n?t[e]=i:a?t[e]?t[e]=i:o(t,e,i):(delete t[e],o(t,e,i)))})(Function.prototype,l,(function(){return"function"==typeof this&&this[s]||a.call(this)}))},7787:function(t,e,i){"use strict";var n=i(1488),o=RegExp.prototype.exec;t.exports=function(t,e){var i=t.exec;if("function"==typeof i){var r=i.call(t,e);if("object"!=typeof r)throw new TypeError("RegExp exec method returned something other than an Object or null");return r}if("RegExp"!==n(t))throw new TypeError("RegExp#exec called on incompatible receiver");return o.call(t,e)}},1165:function(t,e,i){"use strict";var n,o,r=i(3218),s=RegExp.prototype.exec,a=String.prototype.replace,l=s,h=(n=/a/,o=/b*/g,s.call(n,"a"),s.call(o,"a"),0!==n.lastIndex||0!==o.lastIndex),c=void 0!==/()??/.exec("")[1];(h||c)&&(l=function(t){var e,i,n,o,l=this;return c&&(i=new RegExp("^"+l.source+"$(?!\\s)",r.call(l))),h&&(e=l.lastIndex),n=s.call(l,t),h&&n&&(l.lastIndex=l.global?n.index+n[0].length:e),c&&n&&n.length>1&&a.call(n[0],i,(function(){for(o=1;o<arguments.length-2;o++)void 0===arguments[o]&&(n[o]=void 0)})),n}),t.exports=l},7375:function(t,e,i){var n=i(5286),o=i(7007),r=function(t,e){if(o(t),!n(e)&&null!==e)throw TypeError(e+": can't set as prototype!")};t.exports={set:Object.setPrototypeOf||("__proto__"in{}?function(t,e,n){try{(n=i(741)(Function.call,i(8693).f(Object.prototype,"__proto__").set,2))(t,[]),e=!(t instanceof Array)}catch(t){e=!0}return function(t,i){return r(t,i),e?t.__proto__=i:n(t,i),t}}({},!1):void 0),check:r}},2974:function(t,e,i){"use strict";var n=i(3816),o=i(9275),r=i(7057),s=i(6314)("species");t.exports=function(t){var e=n[t];r&&e&&!e[s]&&o.f(e,s,{configurable:!0,get:function(){return this}})}},9335:function(t,e,i){var n=i(3825)("keys"),o=i(3953);t.exports=function(t){return n[t]||(n[t]=o(t))}},3825:function(t,e,i){var n=i(5645),o=i(3816),r="__core-js_shared__",s=o[r]||(o[r]={});(t.exports=function(t,e){return s[t]||(s[t]=void 0!==e?e:{})})("versions",[]).push({version:n.version,mode:i(4461)?"pure":"global",copyright:"© 2020 Denis Pushkarev (zloirock.ru)"})},8364:function(t,e,i){var n=i(7007),o=i(4963),r=i(6314)("species");t.exports=function(t,e){var i,s=n(t).constructor;return void 0===s||null==(i=n(s)[r])?e:o(i)}},7717:function(t,e,i){"use strict";var n=i(4253);t.exports=function(t,e){return!!t&&n((function(){e?t.call(null,(function(){}),1):t.call(null)}))}},4496:function(t,e,i){var n=i(1467),o=i(1355);t.exports=function(t){return function(e,i){var r,s,a=String(o(e)),l=n(i),h=a.length;return l<0||l>=h?t?"":void 0:(r=a.charCodeAt(l))<55296||r>56319||l+1===h||(s=a.charCodeAt(l+1))<56320||s>57343?t?a.charAt(l):r:t?a.slice(l,l+2):s-56320+(r-55296<<10)+65536}}},2337:function(t,e,i){var n=i(1467),o=Math.max,r=Math.min;t.exports=function(t,e){return(t=n(t))<0?o(t+e,0):r(t,e)}},1467:function(t){var e=Math.ceil,i=Math.floor;t.exports=function(t){return isNaN(t=+t)?0:(t>0?i:e)(t)}},2110:function(t,e,i){var n=i(9797),o=i(1355);t.exports=function(t){return n(o(t))}},875:function(t,e,i){var n=i(1467),o=Math.min;t.exports=function(t){return t>0?o(n(t),9007199254740991):0}},508:function(t,e,i){var n=i(1355);t.exports=function(t){return Object(n(t))}},1689:function(t,e,i){var n=i(5286);t.exports=function(t,e){if(!n(t))return t;var i,o;if(e&&"function"==typeof(i=t.toString)&&!n(o=i.call(t)))return o;if("function"==typeof(i=t.valueOf)&&!n(o=i.call(t)))return o;if(!e&&"function"==typeof(i=t.toString)&&!n(o=i.call(t)))return o;throw TypeError("Can't convert object to primitive value")}},3953:function(t){var e=0,i=Math.random();t.exports=function(t){return"Symbol(".concat(void 0===t?"":t,")_",(++e+i).toString(36))}},6314:function(t,e,i){var n=i(3825)("wks"),o=i(3953),r=i(3816).Symbol,s="function"==typeof r;(t.exports=function(t){return n[t]||(n[t]=s&&r[t]||(s?r:o)("Symbol."+t))}).store=n},8837:function(t,e,i){"use strict";var n=i(2985),o=i(50)(2);n(n.P+n.F*!i(7717)([].filter,!0),"Array",{filter:function(t){return o(this,t,arguments[1])}})},2310:function(t,e,i){"use strict";var n=i(2985),o=i(50)(5),r="find",s=!0;r in[]&&Array(1).find((function(){s=!1})),n(n.P+n.F*s,"Array",{find:function(t){return o(this,t,arguments.length>1?arguments[1]:void 0)}}),i(7722)(r)},9371:function(t,e,i){"use strict";var n=i(2985),o=i(50)(1);n(n.P+n.F*!i(7717)([].map,!0),"Array",{map:function(t){return o(this,t,arguments[1])}})},110:function(t,e,i){"use strict";var n=i(2985),o=i(639),r=i(2032),s=i(2337),a=i(875),l=[].slice;n(n.P+n.F*i(4253)((function(){o&&l.call(o)})),"Array",{slice:function(t,e){var i=a(this.length),n=r(this);if(e=void 0===e?i:e,"Array"==n)return l.call(this,t,e);for(var o=s(t,i),h=s(e,i),c=a(h-o),d=new Array(c),u=0;u<c;u++)d[u]="String"==n?this.charAt(o+u):this[o+u];return d}})},75:function(t,e,i){"use strict";var n=i(2985),o=i(4963),r=i(508),s=i(4253),a=[].sort,l=[1,2,3];n(n.P+n.F*(s((function(){l.sort(void 0)}))||!s((function(){l.sort(null)}))||!i(7717)(a)),"Array",{sort:function(t){return void 0===t?a.call(r(this)):a.call(r(this),o(t))}})},6059:function(t,e,i){var n=i(9275).f,o=Function.prototype,r=/^\s*function ([^ (]*)/,s="name";s in o||i(7057)&&n(o,s,{configurable:!0,get:function(){try{return(""+this).match(r)[1]}catch(t){return""}}})},3946:function(t,e,i){var n=i(3816),o=i(266),r=i(9275).f,s=i(616).f,a=i(5364),l=i(3218),h=n.RegExp,c=h,d=h.prototype,u=/a/g,f=/a/g,p=new h(u)!==u;if(i(7057)&&(!p||i(4253)((function(){return f[i(6314)("match")]=!1,h(u)!=u||h(f)==f||"/a/i"!=h(u,"i")})))){h=function(t,e){var i=this instanceof h,n=a(t),r=void 0===e;return!i&&n&&t.constructor===h&&r?t:o(p?new c(n&&!r?t.source:t,e):c((n=t instanceof h)?t.source:t,n&&r?l.call(t):e),i?this:d,h)};for(var m=function(t){t in h||r(h,t,{configurable:!0,get:function(){return c[t]},set:function(e){c[t]=e}})},g=s(c),v=0;g.length>v;)m(g[v++]);d.constructor=h,h.prototype=d,i(7234)(n,"RegExp",h)}i(2974)("RegExp")},8269:function(t,e,i){"use strict";var n=i(1165);i(2985)({target:"RegExp",proto:!0,forced:n!==/./.exec},{exec:n})},1466:function(t,e,i){"use strict";var n=i(7007),o=i(875),r=i(6793),s=i(7787);i(8082)("match",1,(function(t,e,i,a){return[function(i){var n=t(this),o=null==i?void 0:i[e];return void 0!==o?o.call(i,n):new RegExp(i)[e](String(n))},function(t){var e=a(i,t,this);if(e.done)return e.value;var l=n(t),h=String(this);if(!l.global)return s(l,h);var c=l.unicode;l.lastIndex=0;for(var d,u=[],f=0;null!==(d=s(l,h));){var p=String(d[0]);u[f]=p,""===p&&(l.lastIndex=r(h,o(l.lastIndex),c)),f++}return 0===f?null:u}]}))},9357:function(t,e,i){"use strict";var n=i(7007),o=i(508),r=i(875),s=i(1467),a=i(6793),l=i(7787),h=Math.max,c=Math.min,d=Math.floor,u=/\$([$&`']|\d\d?|<[^>]*>)/g,f=/\$([$&`']|\d\d?)/g;i(8082)("replace",2,(function(t,e,i,p){return[function(n,o){var r=t(this),s=null==n?void 0:n[e];return void 0!==s?s.call(n,r,o):i.call(String(r),n,o)},function(t,e){var o=p(i,t,this,e);if(o.done)return o.value;var d=n(t),u=String(this),f="function"==typeof e;f||(e=String(e));var g=d.global;if(g){var v=d.unicode;d.lastIndex=0}for(var _=[];;){var y=l(d,u);if(null===y)break;if(_.push(y),!g)break;""===String(y[0])&&(d.lastIndex=a(u,r(d.lastIndex),v))}for(var b,x="",w=0,j=0;j<_.length;j++){y=_[j];for(var P=String(y[0]),S=h(c(s(y.index),u.length),0),I=[],F=1;F<y.length;F++)I.push(void 0===(b=y[F])?b:String(b));var C=y.groups;if(f){var E=[P].concat(I,S,u);void 0!==C&&E.push(C);var D=String(e.apply(void 0,E))}else D=m(P,u,S,I,C,e);S>=w&&(x+=u.slice(w,S)+D,w=S+P.length)}return x+u.slice(w)}];function m(t,e,n,r,s,a){var l=n+t.length,h=r.length,c=f;return void 0!==s&&(s=o(s),c=u),i.call(a,c,(function(i,o){var a;switch(o.charAt(0)){case"$":return"$";case"&":return t;case"`":return e.slice(0,n);case"'":return e.slice(l);case"<":a=s[o.slice(1,-1)];break;default:var c=+o;if(0===c)return i;if(c>h){var u=d(c/10);return 0===u?i:u<=h?void 0===r[u-1]?o.charAt(1):r[u-1]+o.charAt(1):i}a=r[c-1]}return void 0===a?"":a}))}}))},1876:function(t,e,i){"use strict";var n=i(5364),o=i(7007),r=i(8364),s=i(6793),a=i(875),l=i(7787),h=i(1165),c=i(4253),d=Math.min,u=[].push,f=4294967295,p=!c((function(){RegExp(f,"y")}));i(8082)("split",2,(function(t,e,i,c){var m;return m="c"=="abbc".split(/(b)*/)[1]||4!="test".split(/(?:)/,-1).length||2!="ab".split(/(?:ab)*/).length||4!=".".split(/(.?)(.?)/).length||".".split(/()()/).length>1||"".split(/.?/).length?function(t,e){var o=String(this);if(void 0===t&&0===e)return[];if(!n(t))return i.call(o,t,e);for(var r,s,a,l=[],c=(t.ignoreCase?"i":"")+(t.multiline?"m":"")+(t.unicode?"u":"")+(t.sticky?"y":""),d=0,p=void 0===e?f:e>>>0,m=new RegExp(t.source,c+"g");(r=h.call(m,o))&&!((s=m.lastIndex)>d&&(l.push(o.slice(d,r.index)),r.length>1&&r.index<o.length&&u.apply(l,r.slice(1)),a=r[0].length,d=s,l.length>=p));)m.lastIndex===r.index&&m.lastIndex++;return d===o.length?!a&&m.test("")||l.push(""):l.push(o.slice(d)),l.length>p?l.slice(0,p):l}:"0".split(void 0,0).length?function(t,e){return void 0===t&&0===e?[]:i.call(this,t,e)}:i,[function(i,n){var o=t(this),r=null==i?void 0:i[e];return void 0!==r?r.call(i,o,n):m.call(String(o),i,n)},function(t,e){var n=c(m,t,this,e,m!==i);if(n.done)return n.value;var h=o(t),u=String(this),g=r(h,RegExp),v=h.unicode,_=(h.ignoreCase?"i":"")+(h.multiline?"m":"")+(h.unicode?"u":"")+(p?"y":"g"),y=new g(p?h:"^(?:"+h.source+")",_),b=void 0===e?f:e>>>0;if(0===b)return[];if(0===u.length)return null===l(y,u)?[u]:[];for(var x=0,w=0,j=[];w<u.length;){y.lastIndex=p?w:0;var P,S=l(y,p?u:u.slice(w));if(null===S||(P=d(a(y.lastIndex+(p?0:w)),u.length))===x)w=s(u,w,v);else{if(j.push(u.slice(x,w)),j.length===b)return j;for(var I=1;I<=S.length-1;I++)if(j.push(S[I]),j.length===b)return j;w=x=P}}return j.push(u.slice(x)),j}]}))}},e={};function i(n){var o=e[n];if(void 0!==o)return o.exports;var r=e[n]={exports:{}};return t[n](r,r.exports,i),r.exports}i.n=function(t){var e=t&&t.__esModule?function(){return t.default}:function(){return t};return i.d(e,{a:e}),e},i.d=function(t,e){for(var n in e)i.o(e,n)&&!i.o(t,n)&&Object.defineProperty(t,n,{enumerable:!0,get:e[n]})},i.o=function(t,e){return Object.prototype.hasOwnProperty.call(t,e)},i.r=function(t){"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(t,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(t,"__esModule",{value:!0})};var n={};!function(){"use strict";i.r(n),i.d(n,{default:function(){return I}}),i(8837),i(2310);var t=window.django.jQuery,e=window.grappelli,o=(i(9357),i(9371),i(1466),i(1876),i(6059),i(75),i(3946),{});if(t.fn.djnData=function(e){var i=(t(this).data("inlineFormset")||{}).nestedOptions||{};return e?i[e]:i},t.fn.djangoPrefixIndex=function(){var t,e,i,n,r,s,a=this.length>1?this.first():this,l=a.attr("id"),h=a.attr("name"),c=a.attr("for");if((r=o[l])||(r=o[h])||(r=o[c]))return r;if(l&&!t&&(t=(l.match(/^(.*)\-group$/)||[null,null])[1]),l&&!t&&a.is(".djn-item")&&l.match(/\d+$/)){var d=l.match(/(.*?)\-(\d+)$/)||[null,null,null];n=d[0],t=d[1],s=d[2]}if(t){if("id_"==t.substr(0,3)&&(t=t.substr(3)),!document.getElementById(t+"-group"))return null}else if((e=a.closest(".djn-inline-form")).length){var u=e.attr("id").match(/(.*?)\-(\d+)$/)||[null,null,null];n=u[0],t=u[1],s=u[2]}else{if(!(i=a.closest(".djn-group")).length)return null;t=((i.attr("id")||"").match(/^(.*)\-group$/)||[null,null])[1]}return n&&(o[n]=[t,s]),[t,s]},t.fn.djangoFormPrefix=function(){var t=this.djangoPrefixIndex();return t&&t[1]?t[0]+"-"+t[1]+"-":null},t.fn.djangoFormIndex=function(){var t=this.djangoPrefixIndex();return t&&t[1]?parseInt(t[1],10):null},t.fn.djangoFormsetPrefix=function(){var t=this.djangoPrefixIndex();return t?t[0]:null},t.fn.djangoFormsetForms=function(){var e=[];return this.each((function(){var i,n=t(this).djangoFormsetPrefix(),o=n?t("#"+n+"-group"):null;if(n&&o.length){i=o.find(".djn-inline-form").filter((function(){return function(t,e,i){var n=t.getAttribute("id"),o=n.substr(i.length+1);return 0===n.indexOf(i)&&!o.match(/\D/)}(this,0,n)}));var r=i.toArray().sort((function(e,i){return t(e).djangoFormIndex()-t(i).djangoFormIndex}));Array.prototype.push.apply(e,r)}})),this.pushStack(e)},"function"!=typeof t.djangoFormField&&(t.djangoFormField=function(e,i,n){var o,r=t([]);if((o=i.match(/^(.+)\-(\d+)\-$/))&&(i=o[1],n=o[2]),n=parseInt(n,10),isNaN(n))return r;var s=i+"-"+n+"-";if("*"==e)return t('*[name^="'+s+'"]').filter((function(){return-1===t(this).attr("name").substring(s.length).indexOf("-")}));var a=t("#id_"+s+e);if(!a.length&&("pk"==e||"position"==e)){if(!(e=(t("#"+i+"-group").djnData("fieldNames")||{})[e]))return r;a=t("#id_"+s+e)}return a}),"function"!=typeof t.fn.djangoFormField&&(t.fn.djangoFormField=function(e,i){var n=this.djangoPrefixIndex(),o=t([]);if(!n)return o;var r=n[0];return void 0===i&&void 0===(i=n[1])?o:t.djangoFormField(e,r,i)}),"function"!=typeof t.fn.filterDjangoField){var r={};t.fn.filterDjangoField=function(e,i,n){var o,s;return void 0!==n?("string"==typeof n&&(n=parseInt(n,10)),"number"!=typeof n||isNaN(n)||(o=t("#id_"+e+"-"+n+"-"+i))):("object"!=typeof r[e]&&(r[e]={}),void 0===r[e][i]&&(r[e][i]=new RegExp("^"+e+"-\\d+-"+i+"$")),o=this.find('input[name$="'+i+'"]').filter((function(){return this.getAttribute("name").match(r[e][i])}))),o.length||"pk"!=i&&"position"!=i||((s=t("#"+e+"-group").djnData("fieldNames")||{})[i],s[i]!=i&&(o=t(this).filterDjangoField(e,s[i],n))),o}}var s,a,l,h,c,d=function(t){return(t+"").replace(/([\.\?\*\+\^\$\[\]\\\(\)\{\}\|\-])/g,"\\$1")};if(i(110),void 0===t.ui){var u=t;!function(t,e){function i(e,i){var o,r,s,a=e.nodeName.toLowerCase();return"area"===a?(r=(o=e.parentNode).name,!(!e.href||!r||"map"!==o.nodeName.toLowerCase())&&!!(s=t("img[usemap=#"+r+"]")[0])&&n(s)):(/input|select|textarea|button|object/.test(a)?!e.disabled:"a"===a&&e.href||i)&&n(e)}function n(e){return t.expr.filters.visible(e)&&!t(e).parents().addBack().filter((function(){return"hidden"===t.css(this,"visibility")})).length}var o=0,r=/^ui-id-\d+$/;t.ui=t.ui||{},t.extend(t.ui,{version:"1.10.3",keyCode:{BACKSPACE:8,COMMA:188,DELETE:46,DOWN:40,END:35,ENTER:13,ESCAPE:27,HOME:36,LEFT:37,NUMPAD_ADD:107,NUMPAD_DECIMAL:110,NUMPAD_DIVIDE:111,NUMPAD_ENTER:108,NUMPAD_MULTIPLY:106,NUMPAD_SUBTRACT:109,PAGE_DOWN:34,PAGE_UP:33,PERIOD:190,RIGHT:39,SPACE:32,TAB:9,UP:38}}),t.fn.extend({focus:function(e){return function(i,n){return"number"==typeof i?this.each((function(){var e=this;setTimeout((function(){t(e).focus(),n&&n.call(e)}),i)})):e.apply(this,arguments)}}(t.fn.focus),scrollParent:function(){var e;return e=t.ui.ie&&/(static|relative)/.test(this.css("position"))||/absolute/.test(this.css("position"))?this.parents().filter((function(){return/(relative|absolute|fixed)/.test(t.css(this,"position"))&&/(auto|scroll)/.test(t.css(this,"overflow")+t.css(this,"overflow-y")+t.css(this,"overflow-x"))})).eq(0):this.parents().filter((function(){return/(auto|scroll)/.test(t.css(this,"overflow")+t.css(this,"overflow-y")+t.css(this,"overflow-x"))})).eq(0),/fixed/.test(this.css("position"))||!e.length?t(document):e},zIndex:function(i){if(i!==e)return this.css("zIndex",i);if(this.length)for(var n,o,r=t(this[0]);r.length&&r[0]!==document;){if(("absolute"===(n=r.css("position"))||"relative"===n||"fixed"===n)&&(o=parseInt(r.css("zIndex"),10),!isNaN(o)&&0!==o))return o;r=r.parent()}return 0},uniqueId:function(){return this.each((function(){this.id||(this.id="ui-id-"+ ++o)}))},removeUniqueId:function(){return this.each((function(){r.test(this.id)&&t(this).removeAttr("id")}))}}),t.extend(t.expr[":"],{data:t.expr.createPseudo?t.expr.createPseudo((function(e){return function(i){return!!t.data(i,e)}})):function(e,i,n){return!!t.data(e,n[3])},focusable:function(e){return i(e,!isNaN(t.attr(e,"tabindex")))},tabbable:function(e){var n=t.attr(e,"tabindex"),o=isNaN(n);return(o||n>=0)&&i(e,!o)}}),t("<a>").outerWidth(1).jquery||t.each(["Width","Height"],(function(i,n){function o(e,i,n,o){return t.each(r,(function(){i-=parseFloat(t.css(e,"padding"+this))||0,n&&(i-=parseFloat(t.css(e,"border"+this+"Width"))||0),o&&(i-=parseFloat(t.css(e,"margin"+this))||0)})),i}var r="Width"===n?["Left","Right"]:["Top","Bottom"],s=n.toLowerCase(),a={innerWidth:t.fn.innerWidth,innerHeight:t.fn.innerHeight,outerWidth:t.fn.outerWidth,outerHeight:t.fn.outerHeight};t.fn["inner"+n]=function(i){return i===e?a["inner"+n].call(this):this.each((function(){t(this).css(s,o(this,i)+"px")}))},t.fn["outer"+n]=function(e,i){return"number"!=typeof e?a["outer"+n].call(this,e):this.each((function(){t(this).css(s,o(this,e,!0,i)+"px")}))}})),t.fn.addBack||(t.fn.addBack=function(t){return this.add(null==t?this.prevObject:this.prevObject.filter(t))}),t("<a>").data("a-b","a").removeData("a-b").data("a-b")&&(t.fn.removeData=function(e){return function(i){return arguments.length?e.call(this,t.camelCase(i)):e.call(this)}}(t.fn.removeData)),t.ui.ie=!!/msie [\w.]+/.exec(navigator.userAgent.toLowerCase()),t.support.selectstart="onselectstart"in document.createElement("div"),t.fn.extend({disableSelection:function(){return this.bind((t.support.selectstart?"selectstart":"mousedown")+".ui-disableSelection",(function(t){t.preventDefault()}))},enableSelection:function(){return this.unbind(".ui-disableSelection")}}),t.extend(t.ui,{plugin:{add:function(e,i,n){var o,r=t.ui[e].prototype;for(o in n)r.plugins[o]=r.plugins[o]||[],r.plugins[o].push([i,n[o]])},call:function(t,e,i){var n,o=t.plugins[e];if(o&&t.element[0].parentNode&&11!==t.element[0].parentNode.nodeType)for(n=0;o.length>n;n++)t.options[o[n][0]]&&o[n][1].apply(t.element,i)}},hasScroll:function(e,i){if("hidden"===t(e).css("overflow"))return!1;var n=i&&"left"===i?"scrollLeft":"scrollTop",o=!1;return e[n]>0||(e[n]=1,o=e[n]>0,e[n]=0,o)}})}(u),s=u,l=0,h=Array.prototype.slice,c=s.cleanData,s.cleanData=function(t){for(var e,i=0;null!=(e=t[i]);i++)try{s(e).triggerHandler("remove")}catch(t){}c(t)},s.widget=function(t,e,i){var n,o,r,l,h={},c=t.split(".")[0];t=t.split(".")[1],n=c+"-"+t,i||(i=e,e=s.Widget),s.expr[":"][n.toLowerCase()]=function(t){return!!s.data(t,n)},s[c]=s[c]||{},o=s[c][t],r=s[c][t]=function(t,e){return this._createWidget?(arguments.length&&this._createWidget(t,e),a):new r(t,e)},s.extend(r,o,{version:i.version,_proto:s.extend({},i),_childConstructors:[]}),(l=new e).options=s.widget.extend({},l.options),s.each(i,(function(t,i){return s.isFunction(i)?(h[t]=function(){var n=function(){return e.prototype[t].apply(this,arguments)},o=function(i){return e.prototype[t].apply(this,i)};return function(){var t,e=this._super,r=this._superApply;return this._super=n,this._superApply=o,t=i.apply(this,arguments),this._super=e,this._superApply=r,t}}(),a):(h[t]=i,a)})),r.prototype=s.widget.extend(l,{widgetEventPrefix:o?l.widgetEventPrefix:t},h,{constructor:r,namespace:c,widgetName:t,widgetFullName:n}),o?(s.each(o._childConstructors,(function(t,e){var i=e.prototype;s.widget(i.namespace+"."+i.widgetName,r,e._proto)})),delete o._childConstructors):e._childConstructors.push(r),s.widget.bridge(t,r)},s.widget.extend=function(t){for(var e,i,n=h.call(arguments,1),o=0,r=n.length;r>o;o++)for(e in n[o])i=n[o][e],n[o].hasOwnProperty(e)&&i!==a&&(t[e]=s.isPlainObject(i)?s.isPlainObject(t[e])?s.widget.extend({},t[e],i):s.widget.extend({},i):i);return t},s.widget.bridge=function(t,e){var i=e.prototype.widgetFullName||t;s.fn[t]=function(n){var o="string"==typeof n,r=h.call(arguments,1),l=this;return n=!o&&r.length?s.widget.extend.apply(null,[n].concat(r)):n,o?this.each((function(){var e,o=s.data(this,i);return o?s.isFunction(o[n])&&"_"!==n.charAt(0)?(e=o[n].apply(o,r))!==o&&e!==a?(l=e&&e.jquery?l.pushStack(e.get()):e,!1):a:s.error("no such method '"+n+"' for "+t+" widget instance"):s.error("cannot call methods on "+t+" prior to initialization; attempted to call method '"+n+"'")})):this.each((function(){var t=s.data(this,i);t?t.option(n||{})._init():s.data(this,i,new e(n,this))})),l}},s.Widget=function(){},s.Widget._childConstructors=[],s.Widget.prototype={widgetName:"widget",widgetEventPrefix:"",defaultElement:"<div>",options:{disabled:!1,create:null},_createWidget:function(t,e){e=s(e||this.defaultElement||this)[0],this.element=s(e),this.uuid=l++,this.eventNamespace="."+this.widgetName+this.uuid,this.options=s.widget.extend({},this.options,this._getCreateOptions(),t),this.bindings=s(),this.hoverable=s(),this.focusable=s(),e!==this&&(s.data(e,this.widgetFullName,this),this._on(!0,this.element,{remove:function(t){t.target===e&&this.destroy()}}),this.document=s(e.style?e.ownerDocument:e.document||e),this.window=s(this.document[0].defaultView||this.document[0].parentWindow)),this._create(),this._trigger("create",null,this._getCreateEventData()),this._init()},_getCreateOptions:s.noop,_getCreateEventData:s.noop,_create:s.noop,_init:s.noop,destroy:function(){this._destroy(),this.element.unbind(this.eventNamespace).removeData(this.widgetName).removeData(this.widgetFullName).removeData(s.camelCase(this.widgetFullName)),this.widget().unbind(this.eventNamespace).removeAttr("aria-disabled").removeClass(this.widgetFullName+"-disabled ui-state-disabled"),this.bindings.unbind(this.eventNamespace),this.hoverable.removeClass("ui-state-hover"),this.focusable.removeClass("ui-state-focus")},_destroy:s.noop,widget:function(){return this.element},option:function(t,e){var i,n,o,r=t;if(0===arguments.length)return s.widget.extend({},this.options);if("string"==typeof t)if(r={},i=t.split("."),t=i.shift(),i.length){for(n=r[t]=s.widget.extend({},this.options[t]),o=0;i.length-1>o;o++)n[i[o]]=n[i[o]]||{},n=n[i[o]];if(t=i.pop(),e===a)return n[t]===a?null:n[t];n[t]=e}else{if(e===a)return this.options[t]===a?null:this.options[t];r[t]=e}return this._setOptions(r),this},_setOptions:function(t){var e;for(e in t)this._setOption(e,t[e]);return this},_setOption:function(t,e){return this.options[t]=e,"disabled"===t&&(this.widget().toggleClass(this.widgetFullName+"-disabled ui-state-disabled",!!e).attr("aria-disabled",e),this.hoverable.removeClass("ui-state-hover"),this.focusable.removeClass("ui-state-focus")),this},enable:function(){return this._setOption("disabled",!1)},disable:function(){return this._setOption("disabled",!0)},_on:function(t,e,i){var n,o=this;"boolean"!=typeof t&&(i=e,e=t,t=!1),i?(e=n=s(e),this.bindings=this.bindings.add(e)):(i=e,e=this.element,n=this.widget()),s.each(i,(function(i,r){function l(){return t||!0!==o.options.disabled&&!s(this).hasClass("ui-state-disabled")?("string"==typeof r?o[r]:r).apply(o,arguments):a}"string"!=typeof r&&(l.guid=r.guid=r.guid||l.guid||s.guid++);var h=i.match(/^(\w+)\s*(.*)$/),c=h[1]+o.eventNamespace,d=h[2];d?n.delegate(d,c,l):e.bind(c,l)}))},_off:function(t,e){e=(e||"").split(" ").join(this.eventNamespace+" ")+this.eventNamespace,t.unbind(e).undelegate(e)},_delay:function(t,e){var i=this;return setTimeout((function(){return("string"==typeof t?i[t]:t).apply(i,arguments)}),e||0)},_hoverable:function(t){this.hoverable=this.hoverable.add(t),this._on(t,{mouseenter:function(t){s(t.currentTarget).addClass("ui-state-hover")},mouseleave:function(t){s(t.currentTarget).removeClass("ui-state-hover")}})},_focusable:function(t){this.focusable=this.focusable.add(t),this._on(t,{focusin:function(t){s(t.currentTarget).addClass("ui-state-focus")},focusout:function(t){s(t.currentTarget).removeClass("ui-state-focus")}})},_trigger:function(t,e,i){var n,o,r=this.options[t];if(i=i||{},(e=s.Event(e)).type=(t===this.widgetEventPrefix?t:this.widgetEventPrefix+t).toLowerCase(),e.target=this.element[0],o=e.originalEvent)for(n in o)n in e||(e[n]=o[n]);return this.element.trigger(e,i),!(s.isFunction(r)&&!1===r.apply(this.element[0],[e].concat(i))||e.isDefaultPrevented())}},s.each({show:"fadeIn",hide:"fadeOut"},(function(t,e){s.Widget.prototype["_"+t]=function(i,n,o){"string"==typeof n&&(n={effect:n});var r,a=n?!0===n||"number"==typeof n?e:n.effect||e:t;"number"==typeof(n=n||{})&&(n={duration:n}),r=!s.isEmptyObject(n),n.complete=o,n.delay&&i.delay(n.delay),r&&s.effects&&s.effects.effect[a]?i[t](n):a!==t&&i[a]?i[a](n.duration,n.easing,o):i.queue((function(e){s(this)[t](),o&&o.call(i[0]),e()}))}})),function(t){var e=!1;t(document).mouseup((function(){e=!1})),t.widget("ui.mouse",{version:"1.10.3",options:{cancel:"input,textarea,button,select,option",distance:1,delay:0},_mouseInit:function(){var e=this;this.element.bind("mousedown."+this.widgetName,(function(t){return e._mouseDown(t)})).bind("click."+this.widgetName,(function(i){return!0===t.data(i.target,e.widgetName+".preventClickEvent")?(t.removeData(i.target,e.widgetName+".preventClickEvent"),i.stopImmediatePropagation(),!1):void 0})),this.started=!1},_mouseDestroy:function(){this.element.unbind("."+this.widgetName),this._mouseMoveDelegate&&t(document).unbind("mousemove."+this.widgetName,this._mouseMoveDelegate).unbind("mouseup."+this.widgetName,this._mouseUpDelegate)},_mouseDown:function(i){if(!e){this._mouseStarted&&this._mouseUp(i),this._mouseDownEvent=i;var n=this,o=1===i.which,r=!("string"!=typeof this.options.cancel||!i.target.nodeName)&&t(i.target).closest(this.options.cancel).length;return!(o&&!r&&this._mouseCapture(i)&&(this.mouseDelayMet=!this.options.delay,this.mouseDelayMet||(this._mouseDelayTimer=setTimeout((function(){n.mouseDelayMet=!0}),this.options.delay)),this._mouseDistanceMet(i)&&this._mouseDelayMet(i)&&(this._mouseStarted=!1!==this._mouseStart(i),!this._mouseStarted)?(i.preventDefault(),0):(!0===t.data(i.target,this.widgetName+".preventClickEvent")&&t.removeData(i.target,this.widgetName+".preventClickEvent"),this._mouseMoveDelegate=function(t){return n._mouseMove(t)},this._mouseUpDelegate=function(t){return n._mouseUp(t)},t(document).bind("mousemove."+this.widgetName,this._mouseMoveDelegate).bind("mouseup."+this.widgetName,this._mouseUpDelegate),i.preventDefault(),e=!0,0)))}},_mouseMove:function(e){return t.ui.ie&&(!document.documentMode||9>document.documentMode)&&!e.button?this._mouseUp(e):this._mouseStarted?(this._mouseDrag(e),e.preventDefault()):(this._mouseDistanceMet(e)&&this._mouseDelayMet(e)&&(this._mouseStarted=!1!==this._mouseStart(this._mouseDownEvent,e),this._mouseStarted?this._mouseDrag(e):this._mouseUp(e)),!this._mouseStarted)},_mouseUp:function(e){return t(document).unbind("mousemove."+this.widgetName,this._mouseMoveDelegate).unbind("mouseup."+this.widgetName,this._mouseUpDelegate),this._mouseStarted&&(this._mouseStarted=!1,e.target===this._mouseDownEvent.target&&t.data(e.target,this.widgetName+".preventClickEvent",!0),this._mouseStop(e)),!1},_mouseDistanceMet:function(t){return Math.max(Math.abs(this._mouseDownEvent.pageX-t.pageX),Math.abs(this._mouseDownEvent.pageY-t.pageY))>=this.options.distance},_mouseDelayMet:function(){return this.mouseDelayMet},_mouseStart:function(){},_mouseDrag:function(){},_mouseStop:function(){},_mouseCapture:function(){return!0}})}(u),function(t,e){function i(t,e,i){return[parseFloat(t[0])*(f.test(t[0])?e/100:1),parseFloat(t[1])*(f.test(t[1])?i/100:1)]}function n(e,i){return parseInt(t.css(e,i),10)||0}function o(e){var i=e[0];return 9===i.nodeType?{width:e.width(),height:e.height(),offset:{top:0,left:0}}:t.isWindow(i)?{width:e.width(),height:e.height(),offset:{top:e.scrollTop(),left:e.scrollLeft()}}:i.preventDefault?{width:0,height:0,offset:{top:i.pageY,left:i.pageX}}:{width:e.outerWidth(),height:e.outerHeight(),offset:e.offset()}}t.ui=t.ui||{};var r,s=Math.max,a=Math.abs,l=Math.round,h=/left|center|right/,c=/top|center|bottom/,d=/[\+\-]\d+(\.[\d]+)?%?/,u=/^\w+/,f=/%$/,p=t.fn.position;t.position={scrollbarWidth:function(){if(void 0!==r)return r;var e,i,n=t("<div style='display:block;width:50px;height:50px;overflow:hidden;'><div style='height:100px;width:auto;'></div></div>"),o=n.children()[0];return t("body").append(n),e=o.offsetWidth,n.css("overflow","scroll"),e===(i=o.offsetWidth)&&(i=n[0].clientWidth),n.remove(),r=e-i},getScrollInfo:function(e){var i=e.isWindow?"":e.element.css("overflow-x"),n=e.isWindow?"":e.element.css("overflow-y"),o="scroll"===i||"auto"===i&&e.width<e.element[0].scrollWidth;return{width:"scroll"===n||"auto"===n&&e.height<e.element[0].scrollHeight?t.position.scrollbarWidth():0,height:o?t.position.scrollbarWidth():0}},getWithinInfo:function(e){var i=t(e||window),n=t.isWindow(i[0]);return{element:i,isWindow:n,offset:i.offset()||{left:0,top:0},scrollLeft:i.scrollLeft(),scrollTop:i.scrollTop(),width:n?i.width():i.outerWidth(),height:n?i.height():i.outerHeight()}}},t.fn.position=function(e){if(!e||!e.of)return p.apply(this,arguments);e=t.extend({},e);var r,f,m,g,v,_,y=t(e.of),b=t.position.getWithinInfo(e.within),x=t.position.getScrollInfo(b),w=(e.collision||"flip").split(" "),j={};return _=o(y),y[0].preventDefault&&(e.at="left top"),f=_.width,m=_.height,g=_.offset,v=t.extend({},g),t.each(["my","at"],(function(){var t,i,n=(e[this]||"").split(" ");1===n.length&&(n=h.test(n[0])?n.concat(["center"]):c.test(n[0])?["center"].concat(n):["center","center"]),n[0]=h.test(n[0])?n[0]:"center",n[1]=c.test(n[1])?n[1]:"center",t=d.exec(n[0]),i=d.exec(n[1]),j[this]=[t?t[0]:0,i?i[0]:0],e[this]=[u.exec(n[0])[0],u.exec(n[1])[0]]})),1===w.length&&(w[1]=w[0]),"right"===e.at[0]?v.left+=f:"center"===e.at[0]&&(v.left+=f/2),"bottom"===e.at[1]?v.top+=m:"center"===e.at[1]&&(v.top+=m/2),r=i(j.at,f,m),v.left+=r[0],v.top+=r[1],this.each((function(){var o,h,c=t(this),d=c.outerWidth(),u=c.outerHeight(),p=n(this,"marginLeft"),_=n(this,"marginTop"),P=d+p+n(this,"marginRight")+x.width,S=u+_+n(this,"marginBottom")+x.height,I=t.extend({},v),F=i(j.my,c.outerWidth(),c.outerHeight());"right"===e.my[0]?I.left-=d:"center"===e.my[0]&&(I.left-=d/2),"bottom"===e.my[1]?I.top-=u:"center"===e.my[1]&&(I.top-=u/2),I.left+=F[0],I.top+=F[1],t.support.offsetFractions||(I.left=l(I.left),I.top=l(I.top)),o={marginLeft:p,marginTop:_},t.each(["left","top"],(function(i,n){t.ui.position[w[i]]&&t.ui.position[w[i]][n](I,{targetWidth:f,targetHeight:m,elemWidth:d,elemHeight:u,collisionPosition:o,collisionWidth:P,collisionHeight:S,offset:[r[0]+F[0],r[1]+F[1]],my:e.my,at:e.at,within:b,elem:c})})),e.using&&(h=function(t){var i=g.left-I.left,n=i+f-d,o=g.top-I.top,r=o+m-u,l={target:{element:y,left:g.left,top:g.top,width:f,height:m},element:{element:c,left:I.left,top:I.top,width:d,height:u},horizontal:0>n?"left":i>0?"right":"center",vertical:0>r?"top":o>0?"bottom":"middle"};d>f&&f>a(i+n)&&(l.horizontal="center"),u>m&&m>a(o+r)&&(l.vertical="middle"),l.important=s(a(i),a(n))>s(a(o),a(r))?"horizontal":"vertical",e.using.call(this,t,l)}),c.offset(t.extend(I,{using:h}))}))},t.ui.position={fit:{left:function(t,e){var i,n=e.within,o=n.isWindow?n.scrollLeft:n.offset.left,r=n.width,a=t.left-e.collisionPosition.marginLeft,l=o-a,h=a+e.collisionWidth-r-o;e.collisionWidth>r?l>0&&0>=h?(i=t.left+l+e.collisionWidth-r-o,t.left+=l-i):t.left=h>0&&0>=l?o:l>h?o+r-e.collisionWidth:o:l>0?t.left+=l:h>0?t.left-=h:t.left=s(t.left-a,t.left)},top:function(t,e){var i,n=e.within,o=n.isWindow?n.scrollTop:n.offset.top,r=e.within.height,a=t.top-e.collisionPosition.marginTop,l=o-a,h=a+e.collisionHeight-r-o;e.collisionHeight>r?l>0&&0>=h?(i=t.top+l+e.collisionHeight-r-o,t.top+=l-i):t.top=h>0&&0>=l?o:l>h?o+r-e.collisionHeight:o:l>0?t.top+=l:h>0?t.top-=h:t.top=s(t.top-a,t.top)}},flip:{left:function(t,e){var i,n,o=e.within,r=o.offset.left+o.scrollLeft,s=o.width,l=o.isWindow?o.scrollLeft:o.offset.left,h=t.left-e.collisionPosition.marginLeft,c=h-l,d=h+e.collisionWidth-s-l,u="left"===e.my[0]?-e.elemWidth:"right"===e.my[0]?e.elemWidth:0,f="left"===e.at[0]?e.targetWidth:"right"===e.at[0]?-e.targetWidth:0,p=-2*e.offset[0];0>c?(0>(i=t.left+u+f+p+e.collisionWidth-s-r)||a(c)>i)&&(t.left+=u+f+p):d>0&&((n=t.left-e.collisionPosition.marginLeft+u+f+p-l)>0||d>a(n))&&(t.left+=u+f+p)},top:function(t,e){var i,n,o=e.within,r=o.offset.top+o.scrollTop,s=o.height,l=o.isWindow?o.scrollTop:o.offset.top,h=t.top-e.collisionPosition.marginTop,c=h-l,d=h+e.collisionHeight-s-l,u="top"===e.my[1]?-e.elemHeight:"bottom"===e.my[1]?e.elemHeight:0,f="top"===e.at[1]?e.targetHeight:"bottom"===e.at[1]?-e.targetHeight:0,p=-2*e.offset[1];0>c?(n=t.top+u+f+p+e.collisionHeight-s-r,t.top+u+f+p>c&&(0>n||a(c)>n)&&(t.top+=u+f+p)):d>0&&(i=t.top-e.collisionPosition.marginTop+u+f+p-l,t.top+u+f+p>d&&(i>0||d>a(i))&&(t.top+=u+f+p))}},flipfit:{left:function(){t.ui.position.flip.left.apply(this,arguments),t.ui.position.fit.left.apply(this,arguments)},top:function(){t.ui.position.flip.top.apply(this,arguments),t.ui.position.fit.top.apply(this,arguments)}}},function(){var e,i,n,o,r,s=document.getElementsByTagName("body")[0],a=document.createElement("div");for(r in e=document.createElement(s?"div":"body"),n={visibility:"hidden",width:0,height:0,border:0,margin:0,background:"none"},s&&t.extend(n,{position:"absolute",left:"-1000px",top:"-1000px"}),n)e.style[r]=n[r];e.appendChild(a),(i=s||document.documentElement).insertBefore(e,i.firstChild),a.style.cssText="position: absolute; left: 10.7432222px;",o=t(a).offset().left,t.support.offsetFractions=o>10&&11>o,e.innerHTML="",i.removeChild(e)}()}(u)}t.widget("ui.djnsortable",t.ui.mouse,{version:"@VERSION",widgetEventPrefix:"sort",ready:!1,options:{appendTo:"parent",axis:!1,connectWith:!1,containment:!1,cursor:"auto",cursorAt:!1,dropOnEmpty:!0,forcePlaceholderSize:!1,forceHelperSize:!1,grid:!1,handle:!1,helper:"original",items:"> *",opacity:!1,placeholder:!1,revert:!1,scroll:!0,scrollSensitivity:20,scrollSpeed:20,scope:"default",tolerance:"intersect",zIndex:1e3},_isOverAxis:function(t,e,i){return t>=e&&t<e+i},_create:function(){var t=this.options;this.containerCache={},this.element.addClass("ui-sortable"),this.refresh(),this.floating=!!this.items.length&&("x"===t.axis||/left|right/.test(this.items[0].item.css("float"))||/inline|table-cell/.test(this.items[0].item.css("display"))),this.offset=this.element.offset(),this._mouseInit(),this.ready=!0},_destroy:function(){this.element.removeClass("ui-sortable ui-sortable-disabled"),this._mouseDestroy();for(var t=this.items.length-1;t>=0;t--)this.items[t].item.removeData(this.widgetName+"-item");return this},_setOption:function(e,i){"disabled"===e?(this.options[e]=i,this.widget().toggleClass("ui-sortable-disabled",!!i)):t.Widget.prototype._setOption.apply(this,arguments)},_mouseCapture:function(e,i){var n=this;if(this.reverting)return!1;if(this.options.disabled||"static"==this.options.type)return!1;this._refreshItems(e);var o=null;if(t(e.target).parents().each((function(){if(t.data(this,n.widgetName+"-item")==n)return o=t(this),!1})),t.data(e.target,n.widgetName+"-item")==n&&(o=t(e.target)),!o)return!1;if(this.options.handle&&!i){var r=!1,s=t.fn.addBack?"addBack":"andSelf";if(t(this.options.handle,o).find("*")[s]().each((function(){this==e.target&&(r=!0)})),!r)return!1}return this.currentItem=o,this._removeCurrentsFromItems(),!0},_mouseStart:function(e,i,n){var o=this.options;if(this.currentContainer=this,this.refreshPositions(),this.helper=this._createHelper(e),this._cacheHelperProportions(),this._cacheMargins(),this.scrollParent=this.helper.scrollParent(),this.offset=this.currentItem.offset(),this.offset={top:this.offset.top-this.margins.top,left:this.offset.left-this.margins.left},t.extend(this.offset,{click:{left:e.pageX-this.offset.left,top:e.pageY-this.offset.top},parent:this._getParentOffset(),relative:this._getRelativeOffset()}),this.helper.css("position","absolute"),this.cssPosition=this.helper.css("position"),this.originalPosition=this._generatePosition(e),this.originalPageX=e.pageX,this.originalPageY=e.pageY,o.cursorAt&&this._adjustOffsetFromHelper(o.cursorAt),this.domPosition={prev:this.currentItem.prev()[0],parent:this.currentItem.parent()[0]},this.helper[0]!=this.currentItem[0]&&this.currentItem.hide(),this._createPlaceholder(),o.containment&&this._setContainment(),o.cursor&&(t("body").css("cursor")&&(this._storedCursor=t("body").css("cursor")),t("body").css("cursor",o.cursor)),o.opacity&&(this.helper.css("opacity")&&(this._storedOpacity=this.helper.css("opacity")),this.helper.css("opacity",o.opacity)),o.zIndex&&(this.helper.css("zIndex")&&(this._storedZIndex=this.helper.css("zIndex")),this.helper.css("zIndex",o.zIndex)),this.scrollParent[0]!=document&&"HTML"!=this.scrollParent[0].tagName&&(this.overflowOffset=this.scrollParent.offset()),this._trigger("start",e,this._uiHash()),this._preserveHelperProportions||this._cacheHelperProportions(),!n)for(var r=this.containers.length-1;r>=0;r--)this.containers[r]._trigger("activate",e,this._uiHash(this));return t.ui.ddmanager&&(t.ui.ddmanager.current=this),t.ui.ddmanager&&!o.dropBehaviour&&t.ui.ddmanager.prepareOffsets(this,e),this.dragging=!0,this.helper.addClass("ui-sortable-helper"),this._mouseDrag(e),!0},_mouseDrag:function(e){if(this.position=this._generatePosition(e),this.positionAbs=this._convertPositionTo("absolute"),this.lastPositionAbs||(this.lastPositionAbs=this.positionAbs),this.options.scroll){var i=this.options,n=!1;this.scrollParent[0]!=document&&"HTML"!=this.scrollParent[0].tagName?(this.overflowOffset.top+this.scrollParent[0].offsetHeight-e.pageY<i.scrollSensitivity?this.scrollParent[0].scrollTop=n=this.scrollParent[0].scrollTop+i.scrollSpeed:e.pageY-this.overflowOffset.top<i.scrollSensitivity&&(this.scrollParent[0].scrollTop=n=this.scrollParent[0].scrollTop-i.scrollSpeed),this.overflowOffset.left+this.scrollParent[0].offsetWidth-e.pageX<i.scrollSensitivity?this.scrollParent[0].scrollLeft=n=this.scrollParent[0].scrollLeft+i.scrollSpeed:e.pageX-this.overflowOffset.left<i.scrollSensitivity&&(this.scrollParent[0].scrollLeft=n=this.scrollParent[0].scrollLeft-i.scrollSpeed)):(e.pageY-t(document).scrollTop()<i.scrollSensitivity?n=t(document).scrollTop(t(document).scrollTop()-i.scrollSpeed):t(window).height()-(e.pageY-t(document).scrollTop())<i.scrollSensitivity&&(n=t(document).scrollTop(t(document).scrollTop()+i.scrollSpeed)),e.pageX-t(document).scrollLeft()<i.scrollSensitivity?n=t(document).scrollLeft(t(document).scrollLeft()-i.scrollSpeed):t(window).width()-(e.pageX-t(document).scrollLeft())<i.scrollSensitivity&&(n=t(document).scrollLeft(t(document).scrollLeft()+i.scrollSpeed))),!1!==n&&t.ui.ddmanager&&!i.dropBehaviour&&t.ui.ddmanager.prepareOffsets(this,e)}this.positionAbs=this._convertPositionTo("absolute"),this.options.axis&&"y"==this.options.axis||(this.helper[0].style.left=this.position.left+"px"),this.options.axis&&"x"==this.options.axis||(this.helper[0].style.top=this.position.top+"px");for(var o=this.items.length-1;o>=0;o--){var r=this.items[o],s=r.item[0],a=this._intersectsWithPointer(r);if(a&&r.instance===this.currentContainer&&!(s==this.currentItem[0]||this.placeholder[1==a?"next":"prev"]()[0]==s||t.contains(this.placeholder[0],s)||"semi-dynamic"==this.options.type&&t.contains(this.element[0],s))){if(this.direction=1==a?"down":"up","pointer"!=this.options.tolerance&&!this._intersectsWithSides(r))break;this._rearrange(e,r),this._trigger("change",e,this._uiHash());break}}return this._contactContainers(e),t.ui.ddmanager&&t.ui.ddmanager.drag(this,e),this._trigger("sort",e,this._uiHash()),this.lastPositionAbs=this.positionAbs,!1},_mouseStop:function(e,i){if(e){if(t.ui.ddmanager&&!this.options.dropBehaviour&&t.ui.ddmanager.drop(this,e),this.options.revert){var n=this,o=this.placeholder.offset();this.reverting=!0,t(this.helper).animate({left:o.left-this.offset.parent.left-this.margins.left+(this.offsetParent[0]==document.body?0:this.offsetParent[0].scrollLeft),top:o.top-this.offset.parent.top-this.margins.top+(this.offsetParent[0]==document.body?0:this.offsetParent[0].scrollTop)},parseInt(this.options.revert,10)||500,(function(){n._clear(e)}))}else this._clear(e,i);return!1}},cancel:function(){if(this.dragging){this._mouseUp({target:null}),"original"==this.options.helper?this.currentItem.css(this._storedCSS).removeClass("ui-sortable-helper"):this.currentItem.show();for(var e=this.containers.length-1;e>=0;e--)this.containers[e]._trigger("deactivate",null,this._uiHash(this)),this.containers[e].containerCache.over&&(this.containers[e]._trigger("out",null,this._uiHash(this)),this.containers[e].containerCache.over=0)}return this.placeholder&&(this.placeholder[0].parentNode&&this.placeholder[0].parentNode.removeChild(this.placeholder[0]),"original"!=this.options.helper&&this.helper&&this.helper[0].parentNode&&this.helper.remove(),t.extend(this,{helper:null,dragging:!1,reverting:!1,_noFinalSort:null}),this.domPosition.prev?t(this.domPosition.prev).after(this.currentItem):t(this.domPosition.parent).prepend(this.currentItem)),this},serialize:function(e){var i=this._getItemsAsjQuery(e&&e.connected),n=[];return e=e||{},t(i).each((function(){var i=(t(e.item||this).attr(e.attribute||"id")||"").match(e.expression||/(.+)[-=_](.+)/);i&&n.push((e.key||i[1]+"[]")+"="+(e.key&&e.expression?i[1]:i[2]))})),!n.length&&e.key&&n.push(e.key+"="),n.join("&")},toArray:function(e){var i=this._getItemsAsjQuery(e&&e.connected),n=[];return e=e||{},i.each((function(){n.push(t(e.item||this).attr(e.attribute||"id")||"")})),n},_intersectsWith:function(t){var e=this.positionAbs.left,i=e+this.helperProportions.width,n=this.positionAbs.top,o=n+this.helperProportions.height,r=t.left,s=r+t.width,a=t.top,l=a+Math.max(10,t.height),h=this.offset.click.top,c=this.offset.click.left,d=n+h>a&&n+h<l&&e+c>r&&e+c<s;return"pointer"==this.options.tolerance||this.options.forcePointerForContainers||"pointer"!=this.options.tolerance&&this.helperProportions[this.floating?"width":"height"]>t[this.floating?"width":"height"]?d:r<e+this.helperProportions.width/2&&i-this.helperProportions.width/2<s&&a<n+this.helperProportions.height/2&&o-this.helperProportions.height/2<l},_intersectsWithPointer:function(t){var e="x"===this.options.axis||this._isOverAxis(this.positionAbs.top+this.offset.click.top,t.top,Math.max(10,t.height)),i="y"===this.options.axis||this._isOverAxis(this.positionAbs.left+this.offset.click.left,t.left,t.width),n=e&&i,o=this._getDragVerticalDirection(),r=this._getDragHorizontalDirection();return!!n&&(this.floating?r&&"right"==r||"down"==o?2:1:o&&("down"==o?2:1))},_intersectsWithSides:function(t){var e=this._isOverAxis(this.positionAbs.top+this.offset.click.top,t.top+Math.max(10,t.height)/2,Math.max(10,t.height)),i=this._isOverAxis(this.positionAbs.left+this.offset.click.left,t.left+t.width/2,t.width),n=this._getDragVerticalDirection(),o=this._getDragHorizontalDirection();return this.floating&&o?"right"==o&&i||"left"==o&&!i:n&&("down"==n&&e||"up"==n&&!e)},_getDragVerticalDirection:function(){var t=this.positionAbs.top-this.lastPositionAbs.top;return 0!=t&&(t>0?"down":"up")},_getDragHorizontalDirection:function(){var t=this.positionAbs.left-this.lastPositionAbs.left;return 0!=t&&(t>0?"right":"left")},refresh:function(t){return this._refreshItems(t),this.refreshPositions(),this},_connectWith:function(){var t=this.options;return t.connectWith.constructor==String?[t.connectWith]:t.connectWith},_getItemsAsjQuery:function(e){var i=[],n=[],o=this._connectWith();if(o&&e)for(var r=o.length-1;r>=0;r--)for(var s=t(o[r]),a=s.length-1;a>=0;a--){var l=t.data(s[a],this.widgetName);l&&l!=this&&!l.options.disabled&&n.push([t.isFunction(l.options.items)?l.options.items.call(l.element):t(l.options.items,l.element).not(".ui-sortable-helper").not(".ui-sortable-placeholder"),l])}for(n.push([t.isFunction(this.options.items)?this.options.items.call(this.element,null,{options:this.options,item:this.currentItem}):t(this.options.items,this.element).not(".ui-sortable-helper").not(".ui-sortable-placeholder"),this]),r=n.length-1;r>=0;r--)n[r][0].each((function(){i.push(this)}));return t(i)},_removeCurrentsFromItems:function(){var e=this.currentItem.find(":data("+this.widgetName+"-item)");this.items=t.grep(this.items,(function(t){for(var i=0;i<e.length;i++)if(e[i]==t.item[0])return!1;return!0}))},_refreshItems:function(e){this.items=[],this.containers=[this];var i=this.items,n=[[t.isFunction(this.options.items)?this.options.items.call(this.element[0],e,{item:this.currentItem}):t(this.options.items,this.element),this]],o=this._connectWith();if(o&&this.ready)for(var r=o.length-1;r>=0;r--)for(var s=t(o[r]),a=s.length-1;a>=0;a--){var l=t.data(s[a],this.widgetName);l&&l!=this&&!l.options.disabled&&(n.push([t.isFunction(l.options.items)?l.options.items.call(l.element[0],e,{item:this.currentItem}):t(l.options.items,l.element),l]),this.containers.push(l))}for(r=n.length-1;r>=0;r--)for(var h=n[r][1],c=n[r][0],d=(a=0,c.length);a<d;a++){var u=t(c[a]);u.data(this.widgetName+"-item",h),i.push({item:u,instance:h,width:0,height:0,left:0,top:0})}},refreshPositions:function(e){this.offsetParent&&this.helper&&(this.offset.parent=this._getParentOffset());for(var i=this.items.length-1;i>=0;i--){var n=this.items[i];if(n.instance==this.currentContainer||!this.currentContainer||n.item[0]==this.currentItem[0]){var o=this.options.toleranceElement?t(this.options.toleranceElement,n.item):n.item;e||(n.width=o.outerWidth(),n.height=o.outerHeight());var r=o.offset();n.left=r.left,n.top=r.top}}if(this.options.custom&&this.options.custom.refreshContainers)this.options.custom.refreshContainers.call(this);else for(i=this.containers.length-1;i>=0;i--)r=this.containers[i].element.offset(),this.containers[i].containerCache.left=r.left,this.containers[i].containerCache.top=r.top,this.containers[i].containerCache.width=this.containers[i].element.outerWidth(),this.containers[i].containerCache.height=this.containers[i].element.outerHeight();return this},_createPlaceholder:function(e){var i=(e=e||this).options;if(!i.placeholder||i.placeholder.constructor==String){var n=i.placeholder;i.placeholder={element:function(){var i=t(document.createElement(e.currentItem[0].nodeName)).addClass(n||e.currentItem[0].className+" ui-sortable-placeholder").removeClass("ui-sortable-helper")[0];return n||(i.style.visibility="hidden"),i},update:function(t,o){n&&!i.forcePlaceholderSize||(o.height()||o.height(e.currentItem.innerHeight()-parseInt(e.currentItem.css("paddingTop")||0,10)-parseInt(e.currentItem.css("paddingBottom")||0,10)),o.width()||o.width(e.currentItem.innerWidth()-parseInt(e.currentItem.css("paddingLeft")||0,10)-parseInt(e.currentItem.css("paddingRight")||0,10)))}}}e.placeholder=t(i.placeholder.element.call(e.element,e.currentItem)),e.currentItem.after(e.placeholder),i.placeholder.update(e,e.placeholder)},_contactContainers:function(e){for(var i=null,n=null,o=this.containers.length-1;o>=0;o--)if(!t.contains(this.currentItem[0],this.containers[o].element[0]))if(this._intersectsWith(this.containers[o].containerCache)){if(i&&t.contains(this.containers[o].element[0],i.element[0]))continue;i=this.containers[o],n=o}else this.containers[o].containerCache.over&&(this.containers[o]._trigger("out",e,this._uiHash(this)),this.containers[o].containerCache.over=0);if(i)if(1===this.containers.length)this.containers[n]._trigger("over",e,this._uiHash(this)),this.containers[n].containerCache.over=1;else{for(var r=1e4,s=null,a=this.containers[n].floating?"left":"top",l=this.containers[n].floating?"width":"height",h=this.positionAbs[a]+this.offset.click[a],c=this.items.length-1;c>=0;c--)if(t.contains(this.containers[n].element[0],this.items[c].item[0])&&this.items[c].item[0]!=this.currentItem[0]){var d=this.items[c].item.offset()[a],u=!1;Math.abs(d-h)>Math.abs(d+Math.max(10,this.items[c][l])-h)&&(u=!0,d+=this.items[c][l]),Math.abs(d-h)<r&&(r=Math.abs(d-h),s=this.items[c],this.direction=u?"up":"down")}if(!s&&!this.options.dropOnEmpty)return;this.currentContainer=this.containers[n],s?this._rearrange(e,s,null,!0):this._rearrange(e,null,this.containers[n].element,!0),this._trigger("change",e,this._uiHash()),this.containers[n]._trigger("change",e,this._uiHash(this)),this.options.placeholder.update(this.currentContainer,this.placeholder),this.containers[n]._trigger("over",e,this._uiHash(this)),this.containers[n].containerCache.over=1}},_createHelper:function(e){var i=this.options,n=t.isFunction(i.helper)?t(i.helper.apply(this.element[0],[e,this.currentItem])):"clone"==i.helper?this.currentItem.clone():this.currentItem;return n.parents("body").length||t("parent"!=i.appendTo?i.appendTo:this.currentItem[0].parentNode)[0].appendChild(n[0]),n[0]==this.currentItem[0]&&(this._storedCSS={width:this.currentItem[0].style.width,height:this.currentItem[0].style.height,position:this.currentItem.css("position"),top:this.currentItem.css("top"),left:this.currentItem.css("left")}),(""==n[0].style.width||i.forceHelperSize)&&n.width(this.currentItem.width()),(""==n[0].style.height||i.forceHelperSize)&&n.height(this.currentItem.height()),n},_adjustOffsetFromHelper:function(e){"string"==typeof e&&(e=e.split(" ")),t.isArray(e)&&(e={left:+e[0],top:+e[1]||0}),"left"in e&&(this.offset.click.left=e.left+this.margins.left),"right"in e&&(this.offset.click.left=this.helperProportions.width-e.right+this.margins.left),"top"in e&&(this.offset.click.top=e.top+this.margins.top),"bottom"in e&&(this.offset.click.top=this.helperProportions.height-e.bottom+this.margins.top)},_getParentOffset:function(){this.offsetParent=this.helper.offsetParent();var e=this.offsetParent.offset();return"absolute"==this.cssPosition&&this.scrollParent[0]!=document&&t.contains(this.scrollParent[0],this.offsetParent[0])&&(e.left+=this.scrollParent.scrollLeft(),e.top+=this.scrollParent.scrollTop()),(this.offsetParent[0]==document.body||this.offsetParent[0].tagName&&"html"==this.offsetParent[0].tagName.toLowerCase()&&t.ui.ie)&&(e={top:0,left:0}),{top:e.top+(parseInt(this.offsetParent.css("borderTopWidth"),10)||0),left:e.left+(parseInt(this.offsetParent.css("borderLeftWidth"),10)||0)}},_getRelativeOffset:function(){if("relative"==this.cssPosition){var t=this.currentItem.position();return{top:t.top-(parseInt(this.helper.css("top"),10)||0)+this.scrollParent.scrollTop(),left:t.left-(parseInt(this.helper.css("left"),10)||0)+this.scrollParent.scrollLeft()}}return{top:0,left:0}},_cacheMargins:function(){this.margins={left:parseInt(this.currentItem.css("marginLeft"),10)||0,top:parseInt(this.currentItem.css("marginTop"),10)||0}},_cacheHelperProportions:function(){this.helperProportions={width:this.helper.outerWidth(),height:this.helper.outerHeight()}},_setContainment:function(){var e=this.options;if("parent"==e.containment&&(e.containment=this.helper[0].parentNode),"document"!=e.containment&&"window"!=e.containment||(this.containment=[0-this.offset.relative.left-this.offset.parent.left,0-this.offset.relative.top-this.offset.parent.top,t("document"==e.containment?document:window).width()-this.helperProportions.width-this.margins.left,(t("document"==e.containment?document:window).height()||document.body.parentNode.scrollHeight)-this.helperProportions.height-this.margins.top]),!/^(document|window|parent)$/.test(e.containment)){var i=t(e.containment)[0],n=t(e.containment).offset(),o="hidden"!=t(i).css("overflow");this.containment=[n.left+(parseInt(t(i).css("borderLeftWidth"),10)||0)+(parseInt(t(i).css("paddingLeft"),10)||0)-this.margins.left,n.top+(parseInt(t(i).css("borderTopWidth"),10)||0)+(parseInt(t(i).css("paddingTop"),10)||0)-this.margins.top,n.left+(o?Math.max(i.scrollWidth,i.offsetWidth):i.offsetWidth)-(parseInt(t(i).css("borderLeftWidth"),10)||0)-(parseInt(t(i).css("paddingRight"),10)||0)-this.helperProportions.width-this.margins.left,n.top+(o?Math.max(i.scrollHeight,i.offsetHeight):i.offsetHeight)-(parseInt(t(i).css("borderTopWidth"),10)||0)-(parseInt(t(i).css("paddingBottom"),10)||0)-this.helperProportions.height-this.margins.top]}},_convertPositionTo:function(e,i){i||(i=this.position);var n="absolute"==e?1:-1,o=(this.options,"absolute"!=this.cssPosition||this.scrollParent[0]!=document&&t.contains(this.scrollParent[0],this.offsetParent[0])?this.scrollParent:this.offsetParent),r=/(html|body)/i.test(o[0].tagName);return{top:i.top+this.offset.relative.top*n+this.offset.parent.top*n-("fixed"==this.cssPosition?-this.scrollParent.scrollTop():r?0:o.scrollTop())*n,left:i.left+this.offset.relative.left*n+this.offset.parent.left*n-("fixed"==this.cssPosition?-this.scrollParent.scrollLeft():r?0:o.scrollLeft())*n}},_generatePosition:function(e){var i=this.options,n="absolute"!=this.cssPosition||this.scrollParent[0]!=document&&t.contains(this.scrollParent[0],this.offsetParent[0])?this.scrollParent:this.offsetParent,o=/(html|body)/i.test(n[0].tagName);"relative"!=this.cssPosition||this.scrollParent[0]!=document&&this.scrollParent[0]!=this.offsetParent[0]||(this.offset.relative=this._getRelativeOffset());var r=e.pageX,s=e.pageY;if(this.originalPosition&&(this.containment&&(e.pageX-this.offset.click.left<this.containment[0]&&(r=this.containment[0]+this.offset.click.left),e.pageY-this.offset.click.top<this.containment[1]&&(s=this.containment[1]+this.offset.click.top),e.pageX-this.offset.click.left>this.containment[2]&&(r=this.containment[2]+this.offset.click.left),e.pageY-this.offset.click.top>this.containment[3]&&(s=this.containment[3]+this.offset.click.top)),i.grid)){var a=this.originalPageY+Math.round((s-this.originalPageY)/i.grid[1])*i.grid[1];s=this.containment&&(a-this.offset.click.top<this.containment[1]||a-this.offset.click.top>this.containment[3])?a-this.offset.click.top<this.containment[1]?a+i.grid[1]:a-i.grid[1]:a;var l=this.originalPageX+Math.round((r-this.originalPageX)/i.grid[0])*i.grid[0];r=this.containment&&(l-this.offset.click.left<this.containment[0]||l-this.offset.click.left>this.containment[2])?l-this.offset.click.left<this.containment[0]?l+i.grid[0]:l-i.grid[0]:l}return{top:s-this.offset.click.top-this.offset.relative.top-this.offset.parent.top+("fixed"==this.cssPosition?-this.scrollParent.scrollTop():o?0:n.scrollTop()),left:r-this.offset.click.left-this.offset.relative.left-this.offset.parent.left+("fixed"==this.cssPosition?-this.scrollParent.scrollLeft():o?0:n.scrollLeft())}},_rearrange:function(t,e,i,n){i?i[0].appendChild(this.placeholder[0]):e.item[0].parentNode.insertBefore(this.placeholder[0],"down"==this.direction?e.item[0]:e.item[0].nextSibling),this.counter=this.counter?++this.counter:1;var o=this.counter;this._delay((function(){o==this.counter&&this.refreshPositions(!n)}))},_clear:function(e,i){this.reverting=!1;var n=[];if(!this._noFinalSort&&this.currentItem.parent().length&&this.placeholder.before(this.currentItem),this._noFinalSort=null,this.helper[0]==this.currentItem[0]){for(var o in this._storedCSS)"auto"!=this._storedCSS[o]&&"static"!=this._storedCSS[o]||(this._storedCSS[o]="");this.currentItem.css(this._storedCSS).removeClass("ui-sortable-helper")}else this.currentItem.show();for(this.fromOutside&&!i&&n.push((function(t){this._trigger("receive",t,this._uiHash(this.fromOutside))})),!this.fromOutside&&this.domPosition.prev==this.currentItem.prev().not(".ui-sortable-helper")[0]&&this.domPosition.parent==this.currentItem.parent()[0]||i||n.push((function(t){this._trigger("update",t,this._uiHash())})),this!==this.currentContainer&&(i||(n.push((function(t){this._trigger("remove",t,this._uiHash())})),n.push(function(t){return function(e){t._trigger("receive",e,this._uiHash(this))}}.call(this,this.currentContainer)),n.push(function(t){return function(e){t._trigger("update",e,this._uiHash(this))}}.call(this,this.currentContainer)))),o=this.containers.length-1;o>=0;o--)i||n.push(function(t){return function(e){t._trigger("deactivate",e,this._uiHash(this))}}.call(this,this.containers[o])),this.containers[o].containerCache.over&&(n.push(function(t){return function(e){t._trigger("out",e,this._uiHash(this))}}.call(this,this.containers[o])),this.containers[o].containerCache.over=0);if(this._storedCursor&&t("body").css("cursor",this._storedCursor),this._storedOpacity&&this.helper.css("opacity",this._storedOpacity),this._storedZIndex&&this.helper.css("zIndex","auto"==this._storedZIndex?"":this._storedZIndex),this.dragging=!1,this.cancelHelperRemoval){if(!i){for(this._trigger("beforeStop",e,this._uiHash()),o=0;o<n.length;o++)n[o].call(this,e);this._trigger("stop",e,this._uiHash())}return this.fromOutside=!1,!1}if(i||this._trigger("beforeStop",e,this._uiHash()),this.placeholder[0].parentNode.removeChild(this.placeholder[0]),this.helper[0]!=this.currentItem[0]&&this.helper.remove(),this.helper=null,!i){for(o=0;o<n.length;o++)n[o].call(this,e);this._trigger("stop",e,this._uiHash())}return this.fromOutside=!1,!0},_trigger:function(){!1===t.Widget.prototype._trigger.apply(this,arguments)&&this.cancel()},_delay:function(t,e){var i=this;return setTimeout((function(){return("string"==typeof t?i[t]:t).apply(i,arguments)}),e||0)},_uiHash:function(e){var i=e||this;return{helper:i.helper,placeholder:i.placeholder||t([]),position:i.position,originalPosition:i.originalPosition,offset:i.positionAbs,item:i.currentItem,sender:e?e.element:null}}}),"function"!=typeof t.fn.nearest&&(t.fn.nearest=function(e){var i=[],n=this,o=1e4;return n.find(e).each((function(){var e=t(this).parentsUntil(n).length;e<o?(o=e,i=[this]):e==o&&i.push(this)})),this.pushStack(i,"nearest",[e])});var f=0,p="djn"+(""+Math.random()).replace(/\D/g,""),m=function(e,i){if(!e||!e.element||e.element[0]!=i){var n=t(i),o=t.extend({},e.options);if(o.connectWith=[e.element],!n.data(e.widgetName)){n[e.widgetName].call(n,o);for(var r=n.data(e.widgetName),s=0;s<e.options.connectWith.length;s++){var a=e.options.connectWith[s];r.addToConnectWith(a);var l=a.data(e.widgetName);l&&l.addToConnectWith(n)}return e.addToConnectWith(n),r}}};function g(e){var i,n=0,o=1,r=t("#"+e+"-group"),s=r.djnData(),a=s.fieldNames,l=s.formsetFkName,h=e.match(/^(.*)\-(\d+)-[^\-]+(?:\-\d+)?$/)||[],c=h[1],u=h[2],f=(s.sortableOptions||{}).sortableExcludes||[];if(f.push(l),c){var p=t("#"+c+"-group"),m=p.djnData("fieldNames").pk;i=p.filterDjangoField(c,m,u).val()}l&&void 0!==i&&r.filterDjangoField(e,l).val(i).trigger("change"),r.find(".djn-inline-form").each((function(){if(!this.id||"-empty"==this.id.substr(-6))return!0;var i=new RegExp("^(?:id_)?"+d(e)+"\\-\\d+$");if(!this.id.match(i))return!0;var r=t(this),s=r.djangoPrefixIndex()||[null,null],l=s[0],h=l+"-"+s[1]+"-";if(l){var c=r.find("> h3 > .inline_label");c.length&&c.html(c.html().replace(/(#\d+)/g,"#"+o)),o++;var u,p=r.djangoFormField("*"),m=!1;p.each((function(){var e=t(this);if(e.is(":input[type!=radio][type!=checkbox],input:checked")){var i=e.val()||"file"==e.attr("type")&&e.siblings("a").length,n=e.attr("name").substring(h.length);n==a.position&&(u=e),i&&-1===t.inArray(n,f)&&(m=!0)}})),m&&u&&(u.val(n).trigger("change"),n++)}}))}t.widget("ui.nestedSortable",t.ui.djnsortable,{options:{tabSize:20,disableNesting:"ui-nestedSortable-no-nesting",errorClass:"ui-nestedSortable-error",nestedContainerSelector:":not(*)",doNotClear:!1,createContainerElement:function(e){return t(document.createElement("ol"))},containerElementSelector:"ol",listItemSelector:"li",items:"> li",maxLevels:0,revertOnError:1,protectRoot:!1,rootID:null,rtl:!1,fixedNestingDepth:!1,showErrorDiv:!0,keepInParent:!1,isAllowed:function(t,e){return!0},canConnectWith:function(t,e,i){if(t.data("inlineModel")!==e.data("inlineModel"))return!1;var n=e.data(i.widgetName);return!(i.options.fixedNestingDepth||n&&n.options.fixedNestingDepth)||i._getLevel(t)===i._getLevel(e)}},_createWidget:function(e,i){var n=t(i||this.defaultElement||this),o=n.data("djnsortableOptions");return i=n[0],o&&(e=t.extend({},e,o)),t.ui.djnsortable.prototype._createWidget.call(this,e,i)},_create:function(){this.element.data("uiNestedSortable")&&this.element.data("nestedSortable",this.element.data("uiNestedSortable")),this.element.data("ui-nestedSortable")&&this.element.data("nestedSortable",this.element.data("ui-nestedSortable")),this.element.data("djnsortable",this.element.data("nestedSortable")),this.element.data("uiNestedSortable")&&this.element.data("uiSortable",this.element.data("nestedSortable")),t.ui.djnsortable.prototype._create.apply(this,arguments),this._connectWithMap={};var e=this,i=this.options,n=t(document),o=i.connectWith;if(!o||"string"==typeof o){if(this.options.connectWith=[],"string"==typeof o)for(var r=this._connectWith(),s=0;s<r.length;s++)this.addToConnectWith(t(r[s]));n.on("djnesting:init.nestedSortable",i.containerElementSelector,(function(t){m(e,this)})),this.element.find(i.containerElementSelector+":not(.subarticle-wrapper)").each((function(i,n){t(n).closest("[data-inline-formset]").attr("id").indexOf("-empty")>-1||m(e,n)}))}n.trigger("nestedSortable:created",[this]),n.on("nestedSortable:created.nestedSortable",(function(t,i){i.addToConnectWith(e.element),e.addToConnectWith(i.element)}))},addToConnectWith:function(e){var i,n=this,o=void 0!==e.selector?e:t(e);o.length>1?o.each((function(e,i){n.addToConnectWith(t(i))})):(void 0===(i=e[0][p])&&(i=e[0][p]=++f),"string"!=typeof this.options.connectWith&&(this._connectWithMap[i]||(this.options.connectWith.push(e),this._connectWithMap[i]=1)))},_destroy:function(){return this.element.removeData("nestedSortable").unbind(".nestedSortable"),t(document).unbind(".nestedSortable"),t.ui.djnsortable.prototype.destroy.apply(this,arguments)},_intersectsWithPointer:function(e){var i=e.item[0],n=this.options,o=t.ui.djnsortable.prototype._intersectsWithPointer.apply(this,arguments);if(this.lastItemElement=null,!o)return o;if(e.instance!==this.currentContainer)return!1;var r=t(i);return n.fixedNestingDepth&&this._getLevel(this.currentItem)===1+this._getLevel(r)&&(i=(r=function(){var e=n.containerElementSelector,i=r.find(".djn-item");if(1!=i.length)return r;if(!i.is(".djn-no-drag,.djn-thead"))return r;var o=r.closest(e);return o.length?o[0]!=i.closest(e).closest(e)[0]?r:t(i[0]):r}())[0]),!(i==this.currentItem[0]||this.placeholder[1==o?"next":"prev"]()[0]==i||t.contains(this.placeholder[0],i)||"semi-dynamic"==this.options.type&&t.contains(this.element[0],i)||n.keepInParent&&i.parentNode!=this.placeholder[0].parentNode||n.fixedNestingDepth&&this._getLevel(this.currentItem)!==this._getLevel(r)||!n.showErrorDiv&&!n.isAllowed.call(this,this.currentItem[0],i.parentNode,this.placeholder))&&(this.lastItemElement=i,o)},_contactContainers:function(e){this.lastItemElement&&this._clearEmpty(this.lastItemElement);var i=this.options,n=this.placeholder.closest(i.listItemSelector),o=n.length&&n.closest(".ui-sortable").length?n:null,r=this._getLevel(this.placeholder),s=this._getChildLevels(this.helper),a=this.placeholder.attr("class"),l=" "+a+" ";if(-1==l.indexOf(" ui-sortable-nested-level-"+r+" ")){var h,c=l.indexOf(" ui-sortable-nested-level-")-1;h=c>-1?a.substring(0,c):a,this.placeholder.attr("class",h+" ui-sortable-nested-level-"+r)}var d=this.placeholder[0].previousSibling?t(this.placeholder[0].previousSibling):null;if(null!=d)for(;!d.is(this.options.listItemSelector)||d[0]==this.currentItem[0]||d[0]==this.helper[0];){if(!d[0].previousSibling){d=null;break}d=t(d[0].previousSibling)}var u=this.placeholder[0].nextSibling?t(this.placeholder[0].nextSibling):null;if(null!=u)for(;!u.is(this.options.listItemSelector)||u[0]==this.currentItem[0]||u[0]==this.helper[0];){if(!u[0].nextSibling){u=null;break}u=t(u[0].nextSibling)}this.beyondMaxLevels=0;var f=this;if(this.refreshPositions(),!i.fixedNestingDepth&&null!=o&&null==u&&(i.rtl&&this.positionAbs.left+this.helper.outerWidth()>o.offset().left+o.outerWidth()||!i.rtl&&this.positionAbs.left<o.offset().left))o.after(this.placeholder[0]),f=o.closest(i.containerElementSelector).data(this.widgetName)||f,this._clearEmpty(o[0]),this.refreshPositions(),this._trigger("change",e,this._uiHash());else if(i.fixedNestingDepth||null==d||d.is(".djn-no-drag,.djn-thead")||!(i.rtl&&this.positionAbs.left+this.helper.outerWidth()<d.offset().left+d.outerWidth()-i.tabSize||!i.rtl&&this.positionAbs.left>d.offset().left+i.tabSize))this._isAllowed(o,r,r+s);else{if(this._isAllowed(d,r,r+s),this.beyondMaxLevels>0)return t.ui.djnsortable.prototype._contactContainers.apply(this,arguments);var p;(p=d.nearest(i.containerElementSelector).first()).length||d.closest(i.nestedContainerSelector).length||(p=this.options.createContainerElement(d[0]),d.append(p)),p.length&&(p.append(this.placeholder),(f=p.data(this.widgetName))||(f=m(this,p[0])),this.refreshPositions()),this._trigger("change",e,this._uiHash())}t.ui.djnsortable.prototype._contactContainers.call(this,e)},_rearrange:function(e,i,n,o){var r=this.options;if(i&&"object"==typeof i&&i.item&&(this.lastRearrangedElement=i.item[0]),i&&"object"==typeof i&&i.item&&this.placeholder.closest(r.nestedContainerSelector).length){var s=this.placeholder.closest(r.listItemSelector),a="down"==this.direction?s.next(r.nestedContainerSelector):s;if(a.length&&a[0]==i.item[0]){this.counter=this.counter?++this.counter:1;var l=this.counter;return void this._delay((function(){l==this.counter&&this.refreshPositions(!o)}))}}t.ui.djnsortable.prototype._rearrange.apply(this,arguments)},_convertPositionTo:function(e,i){return this.previousTopOffset=this.placeholder.offset().top,t.ui.djnsortable.prototype._convertPositionTo.apply(this,arguments)},_clear:function(){t.ui.djnsortable.prototype._clear.apply(this,arguments),"object"==typeof this.lastRearrangedElement&&this.lastRearrangedElement.ownerDocument&&this._clearEmpty(this.lastRearrangedElement)},_mouseStop:function(e,i){this.beyondMaxLevels&&(this.placeholder.removeClass(this.options.errorClass),this.domPosition.prev?t(this.domPosition.prev).after(this.placeholder):t(this.domPosition.parent).prepend(this.placeholder),this._trigger("revert",e,this._uiHash()));for(var n=this.items.length-1;n>=0;n--){var o=this.items[n].item[0];this._clearEmpty(o)}t.ui.djnsortable.prototype._mouseStop.apply(this,arguments)},toArray:function(e){var i=(e=t.extend(!0,{},this.options,e||{})).startDepthCount||0,n=[],o=2;n.push({item_id:e.rootID,parent_id:"none",depth:i,left:"1",right:2*(t(e.listItemSelector,this.element).length+1)});var r=function o(r,s,a){var l,h,c=a+1,d=t(r).children(e.containerElementSelector).find(e.items);return d.length>0&&(s++,d.each((function(){c=o(t(this),s,c)})),s--),l=t(r).attr(e.attribute||"id").match(e.expression||/(.+)[-=_](.+)/),h=s===i+1?e.rootID:t(r).parent(e.containerElementSelector).parent(e.items).attr(e.attribute||"id").match(e.expression||/(.+)[-=_](.+)/)[2],l&&n.push({item_id:l[2],parent_id:h,depth:s,left:a,right:c}),c+1};return t(this.element).children(e.listItemSelector).each((function(){o=r(this,i+1,o)})),n=n.sort((function(t,e){return t.left-e.left})),n},_clearEmpty:function(e){if(!this.options.doNotClear){var i=t(e);i.nearest(this.options.containerElementSelector).each((function(e,i){var n=t(i);if(!n.children().length){var o=n.data(this.widgetName);"object"==typeof o&&o.destroy&&o.destroy(),n.remove()}})),i.children().length||i.remove()}},_getLevel:function(t){var e,i=1,n=this.options;if(n.containerElementSelector)for(e=t.closest(n.containerElementSelector);e&&e.length>0&&!e.parent().is(".djn-group-root");)i++,e=e.parent().closest(n.containerElementSelector);return i},_getChildLevels:function(e,i){var n=this,o=this.options,r=0;return i=i||0,t(e).nearest(o.containerElementSelector).first().find(o.items).each((function(e,o){t(o).is(".djn-no-drag,.djn-thead")||(r=Math.max(n._getChildLevels(o,i+1),r))})),i?r+1:r},_isAllowed:function(e,i,n){var o=this.options,r=!!t(this.domPosition.parent).hasClass("ui-sortable"),s=o.maxLevels;e&&"object"==typeof e&&void 0===e.selector&&(e=t(e)),!o.isAllowed.call(this,this.currentItem,e,this.placeholder)||e&&e.hasClass(o.disableNesting)||o.protectRoot&&(null==e&&!r||r&&i>1)?(this.placeholder.addClass(o.errorClass),this.beyondMaxLevels=s<n&&0!=s?n-s:1):s<n&&0!=s?(this.placeholder.addClass(o.errorClass),this.beyondMaxLevels=n-s):(this.placeholder.removeClass(o.errorClass),this.beyondMaxLevels=0)},_connectWith:function(){for(var e=t.ui.djnsortable.prototype._connectWith.apply(this,arguments),i=[],n=this,o=0;o<e.length;o++){var r=t(e[o]);r.each((function(e,o){o!=n.element[0]&&n.options.canConnectWith(n.element,t(o),n)&&i.push(o)}))}return i},_removeCurrentsFromItems:function(){for(var t=this.currentItem.find(":data(sortable-item)"),e=0;e<this.items.length;e++)for(var i=0;i<t.length&&!(t[i]==this.items[e].item[0]&&(this.items.splice(e,1),e>=this.items.length));i++);},createContainerElement:function(e){if(!e.childNodes)throw new Error("Invalid element 'parent' passed to createContainerElement.");var i=this.options.createContainerElement.apply(this,arguments);return e.appendChild(i[0]),t(i)}}),t.ui.nestedSortable.prototype.options=t.extend({},t.ui.djnsortable.prototype.options,t.ui.nestedSortable.prototype.options);var v=function e(i){if(void 0===window.grp)return t(i);if(window.grp.jQuery.fn.init===t.fn.init)return t(i);var n=window.grp.jQuery(i);return i.prevObject&&(n.prevObject=e(i.prevObject)),n},_=void 0!==window.DJNesting?window.DJNesting:{};function y(){var t;window.SelectFilter.init=(t=window.SelectFilter.init,function(e,i,n){e.match(/\-empty\-/)||t.apply(this,arguments)})}_.regexQuote=d,_.createSortable=function(e){return e.is(".djn-is-polymorphic"),e.find("> .djn-items, > .djn-fieldset > .djn-items, > .tabular > .module > .djn-items").nestedSortable({handle:["> h3.djn-drag-handler","> .djn-tools .drag-handler","> .djn-td > .djn-tools .djn-drag-handler","> .djn-tr > .is-sortable > .djn-drag-handler","> .djn-tr > .grp-tools-container .djn-drag-handler"].join(", "),items:"> .djn-item",forcePlaceholderSize:!0,placeholder:{element:function(e){var i=t(document.createElement(e[0].nodeName)).addClass(e[0].className+" ui-sortable-placeholder").removeClass("ui-sortable-helper")[0];if(e.is(".djn-tbody")){var n=e.children(".djn-tr").eq(0),o=n.prop("tagName").toLowerCase(),r=t("<"+o+"></"+o+">");r.addClass(n.attr("class"));var s=n.children(".djn-td").eq(0).prop("tagName").toLowerCase(),a=0;n.children(".djn-td").each((function(e,i){a+=parseInt(t(i).attr("colspan"),10)||1})),r.append(t("<"+s+' colspan="'+a+'" class="djn-td grp-td"></'+s+">")),i.appendChild(r[0])}return i},update:function(t,e){var i=t.currentItem;if(i){var n=t.options;if(!n.className||n.forcePlaceholderSize){if(e.is(".djn-tbody")&&(e=e.children(".djn-tr").eq(0).children(".djn-td").eq(0)),!e.height()){var o=i.innerHeight(),r=parseInt(i.css("paddingTop")||0,10),s=parseInt(i.css("paddingBottom")||0,10);e.height(o-r-s)}if(!e.width()){var a=i.innerWidth(),l=parseInt(i.css("paddingLeft")||0,10),h=parseInt(i.css("paddingRight")||0,10);e.width(a-l-h)}}}}},helper:"clone",opacity:.6,maxLevels:0,connectWith:".djn-items",tolerance:"intersection",isAllowed:function(t,e){if(e&&e.hasClass("predelete"))return!1;var i=e.closest(".djn-group"),n=i.data("inlineModel"),o=i.djnData("childModels"),r=t.data("inlineModel"),s=o&&-1!==o.indexOf(r);return!(r!==n&&!s)},fixedNestingDepth:!0,containerElementSelector:".djn-items",listItemSelector:".djn-item",start:function(t,e){e.item.addClass("djn-item-dragging"),e.item.show()},stop:function(t,e){e.item.removeClass("djn-item-dragging")},receive:function(e,i){t(this).closest(".djn-group").djangoFormset().spliceInto(i.item),g(i.item.djangoFormsetPrefix())},update:function(e,i){var n=i.item.nextAll(".djn-item").first();if(n.is(".djn-no-drag,.djn-thead")){var o=n[0],r=o.parentNode;r.insertBefore(o,r.firstChild)}var s=t(e.target).closest(".djn-group").attr("id"),a=i.item,l=a.closest("#"+s);"removed"==a.data("updateOperation")?a.removeAttr("data-update-operation"):l.length||a.attr("data-update-operation","removed"),g(a.djangoFormsetPrefix()),t(document).trigger("djnesting:mutate",[t("#"+a.djangoFormsetPrefix()+"-group")])}})},_.updatePositions=g,_.updateFormAttributes=function(e,i,n,o){o||(o=[":input","span","table","iframe","label","a","ul","p","img",".djn-group",".djn-inline-form",".cropduster-form",".dal-forward-conf"].join(","));var r=t.fn.addBack?"addBack":"andSelf";e.find(o)[r]().each((function(){var e=t(this);t.each(["id","name","for","href","class","onclick","data-inline-formset"],(function(t,o){var r=e.attr(o);r&&(e.attr(o,r.replace(i,n)),"data-inline-formset"===o&&e.data("inlineFormset",JSON.parse(e.attr(o))))}))})),e.find(".prepopulated_field").each((function(){var e=v(this),o=t.makeArray(e.data("dependency_ids")||[]);e.data("dependency_ids",t.map(o,(function(t){return t.replace(i,n)})))}))},_.createContainerElement=function(){},_.initRelatedFields=function(e,i){if("object"==typeof _.LOOKUP_URLS&&_.LOOKUP_URLS.related){var n=_.LOOKUP_URLS,o=t("#"+e+"-group");i||(i=o.djnData());var r=i.lookupRelated;o.djangoFormsetForms().each((function(i,o){t.each(r.fk||[],(function(e,i){t(o).djangoFormField(i).each((function(){v(this).grp_related_fk({lookup_url:n.related})}))})),t.each(r.m2m||[],(function(e,i){t(o).djangoFormField(i).each((function(){v(this).grp_related_m2m({lookup_url:n.m2m})}))})),t.each(r.generic||[],(function(){var i=this[0],r=this[1];t(o).djangoFormField(r).each((function(){var o=t(this),s=o.djangoFormIndex();o.hasClass("grp-has-related-lookup")&&(o.parent().find("a.related-lookup").remove(),o.parent().find(".grp-placeholder-related-generic").remove()),v(o).grp_related_generic({content_type:"#id_"+e+"-"+s+"-"+i,object_id:"#id_"+e+"-"+s+"-"+r,lookup_url:n.related})}))}))}))}},_.initAutocompleteFields=function(e,i){if("object"==typeof _.LOOKUP_URLS&&_.LOOKUP_URLS.related){var n=_.LOOKUP_URLS,o=t("#"+e+"-group");i||(i=o.djnData());var r=i.lookupAutocomplete;o.djangoFormsetForms().each((function(i,o){t.each(r.fk||[],(function(e,i){t(o).djangoFormField(i).each((function(){var e=t(this),i=e.attr("id");t("#"+i+"-autocomplete").length||v(e).grp_autocomplete_fk({lookup_url:n.related,autocomplete_lookup_url:n.autocomplete})}))})),t.each(r.m2m||[],(function(e,i){t(o).djangoFormField(i).each((function(){var e=t(this),i=e.attr("id");t("#"+i+"-autocomplete").length||v(e).grp_autocomplete_m2m({lookup_url:n.m2m,autocomplete_lookup_url:n.autocomplete})}))})),t.each(r.generic||[],(function(){var i=this[0],r=this[1];t(o).djangoFormField(r).each((function(){var o=t(this),s=o.djangoFormIndex();t("#"+o.attr("id")+"-autocomplete").length||v(o).grp_autocomplete_generic({content_type:"#id_"+e+"-"+s+"-"+i,object_id:"#id_"+e+"-"+s+"-"+r,lookup_url:n.related,autocomplete_lookup_url:n.m2m})}))}))}))}},_.DjangoInlines={initPrepopulatedFields:function(e){e.find(".prepopulated_field").each((function(){var e=t(this),i=e.is(":input")?e:e.find(":input"),n=v(i),o=n.data("dependency_list")||[],r=i.djangoFormPrefix(),s=[];r&&!r.match(/__prefix__/)&&(t.each(o,(function(t,e){s.push("#id_"+r+e)})),s.length&&n.prepopulate(s,i.attr("maxlength")))}))},reinitDateTimeShortCuts:function(){void 0!==window.DateTimeShortcuts&&(t(".datetimeshortcuts").remove(),DateTimeShortcuts.init())},updateSelectFilter:function(t){void 0!==window.SelectFilter&&(t.find(".selectfilter").each((function(t,e){var i=e.name.split("-");SelectFilter.init(e.id,i[i.length-1],!1)})),t.find(".selectfilterstacked").each((function(t,e){var i=e.name.split("-");SelectFilter.init(e.id,i[i.length-1],!0)})))}},void 0!==window.SelectFilter?y():setTimeout((function(){void 0!==window.SelectFilter&&y()}),12),["prepopulate","djangoAdminSelect2"].forEach((function(e){!function i(n){var o;if(!(n>2))return void 0===t.fn[e]?setTimeout((function(){return i(n++)}),12):void(t.fn[e]=(o=t.fn[e],function(){return o.apply(this.filter(':not([id*="-empty-"]):not([id$="-empty"]):not([id*="__prefix__"])'),arguments)}))}(0)})),["grp_autocomplete_fk","grp_autocomplete_generic","grp_autocomplete_m2m","grp_collapsible","grp_collapsible_group","grp_inline","grp_related_fk","grp_related_generic","grp_related_m2m","grp_timepicker","datepicker","prepopulate","djangoAdminSelect2"].forEach((function(t){!function e(i){var n;if(!(i>2))return void 0===window.grp||void 0===window.grp.jQuery.fn[t]?setTimeout((function(){return e(i++)}),12):void(window.grp.jQuery.fn[t]=(n=window.grp.jQuery.fn[t],function(){return n.apply(this.filter(':not([id*="-empty-"]):not([id$="-empty"]):not([id*="__prefix__"])'),arguments)}))}(0)}));var b=_,x=window.grp,w=i.n(x),j="djangoFormset",P=function(){function i(e){this.opts={emptyClass:"empty-form grp-empty-form djn-empty-form",predeleteClass:"grp-predelete"},this.$inline=t(e),this.prefix=this.$inline.djangoFormsetPrefix(),this._$totalForms=this.$inline.find("#id_"+this.prefix+"-TOTAL_FORMS"),this._$totalForms.attr("autocomplete","off"),this._$template=t("#"+this.prefix+"-empty");var i=this.$inline.djnData("inlineModel");this.opts=t.extend({},this.opts,{childTypes:this.$inline.data("inlineFormset").options.childTypes,formsetFkModel:this.$inline.djnData("formsetFkModel"),addButtonSelector:".djn-add-handler.djn-model-"+i,removeButtonSelector:".djn-remove-handler.djn-model-"+i,deleteButtonSelector:".djn-delete-handler.djn-model-"+i,formClass:"dynamic-form grp-dynamic-form djn-dynamic-form-"+i,formClassSelector:".djn-dynamic-form-"+i}),b.initRelatedFields(this.prefix,this.$inline.djnData()),b.initAutocompleteFields(this.prefix,this.$inline.djnData()),this.opts.childTypes&&this._setupPolymorphic(),this._bindEvents(),this._initializeForms(),this.$inline.find('.djn-items:not([id*="-empty"])').trigger("djnesting:init"),this.$inline.find('.djn-group[id$="-group"][id^="'+this.prefix+'"][data-inline-formset]:not([id*="-empty"])').each((function(){t(this)[j]()})),this.$inline.is(".djn-group-root")&&b.createSortable(this.$inline),t(document).trigger("djnesting:initialized",[this.$inline,this])}var n=i.prototype;return n._setupPolymorphic=function(){if(!this.opts.childTypes)throw Error("The polymorphic fieldset options.childTypes is not defined!");var e='<div class="polymorphic-type-menu" style="display: none"><ul>';this.opts.childTypes.forEach((function(t){e+='<li><a href="#" data-type="'+t.type+'">'+t.name+"</a></li>"})),e+="</ul></div>";var i=this.$inline.find(this.opts.addButtonSelector),n=t(e);i.after(n)},n._initializeForms=function(){var t=this.mgmtVal("TOTAL_FORMS");this.mgmtVal("MAX_NUM_FORMS")<=t&&this.$inline.find(this.opts.addButtonSelector).parents(".djn-add-item").hide();for(var e=0;e<t;e++)this._initializeForm("#"+this.prefix+"-"+e)},n._initializeForm=function(e){var i=t(e),n=i.djangoFormPrefix();i.addClass(this.opts.formClass),i.hasClass("has_original")&&t("#id_"+n+"DELETE:checked").toggleClass(this.opts.predeleteClass);var o=this.mgmtVal("MIN_NUM_FORMS"),r=this.mgmtVal("TOTAL_FORMS"),s=this,a=r<=o;this.$inline.djangoFormsetForms().each((function(){var e=a?"hide":"show";t(this).find(s.opts.removeButtonSelector)[e]()}))},n._bindEvents=function(e){var i=this;void 0===e&&(e=this.$inline);var n=e.find(this.opts.addButtonSelector);n.off("click.djnesting").on("click.djnesting",(function(e){e.preventDefault(),e.stopPropagation();var n=t(this).next(".polymorphic-type-menu");n.length?(n.is(":visible")||t(document).on("click",(function e(){n.hide(),t(document).off("click",e)})),n.show()):i.add()})),n.parent().find("> .polymorphic-type-menu a").off("click.djnesting").on("click.djnesting",(function(e){e.preventDefault(),e.stopPropagation();var n=t(this).attr("data-type");i.add(null,n);var o=t(e.target).closest(".polymorphic-type-menu");o.is(":visible")&&o.hide()})),e.find(this.opts.removeButtonSelector).filter((function(){return!t(this).closest(".djn-empty-form").length})).off("click.djnesting").on("click.djnesting",(function(e){e.preventDefault(),e.stopPropagation();var n=t(this).closest(i.opts.formClassSelector);i.remove(n)}));var o=function(e){e.preventDefault(),e.stopImmediatePropagation();var n=t(this).closest(i.opts.formClassSelector);t("#id_"+n.djangoFormPrefix()+"DELETE").is(":checked")?i.undelete(n):i.delete(n)},r=e.find(this.opts.deleteButtonSelector).filter((function(){return!t(this).closest(".djn-empty-form").length}));r.off("click.djnesting").on("click.djnesting",o),r.find('[id$="-DELETE"]').on("mousedown.djnesting",o)},n.remove=function(e){var i=t(e),n=this.mgmtVal("TOTAL_FORMS"),o=this.mgmtVal("MIN_NUM_FORMS"),r=this.mgmtVal("MAX_NUM_FORMS"),s=i.djangoFormIndex(),a=i.data("isInitial");i[0].innerHTML="",i.remove(),n-=1,this.mgmtVal("TOTAL_FORMS",n),r-n>=0&&this.$inline.find(this.opts.addButtonSelector).parents(".djn-add-item").show(),this._fillGap(s,a);var l=this,h=n<=o;this.$inline.djangoFormsetForms().each((function(){var e=h?"hide":"show";t(this).find(l.opts.removeButtonSelector)[e]()})),b.updatePositions(this.prefix),t(document).trigger("djnesting:mutate",[this.$inline]),t(document).trigger("formset:removed",[i,this.prefix])},n.delete=function(e){var i=this,n=t(e),o=n.djangoFormPrefix(),r=t("#id_"+o+"DELETE");n.hasClass(this.opts.predeleteClass)||n.data("isInitial")&&(r.attr("checked","checked"),r.length&&(r[0].checked=!0),n.addClass(this.opts.predeleteClass),n.find(".djn-group").each((function(){var e=t(this),n=e.djangoFormset();e.djangoFormsetForms().each((function(){t(this).hasClass(i.opts.predeleteClass)?t(this).data("alreadyDeleted",!0):n.delete(this)}))})),n.find(".cropduster-form").each((function(){var e=t(this).djangoFormsetPrefix()+"-0-",i=t("#id_"+e+"DELETE");i.attr("checked","checked"),i.length&&(i[0].checked=!0)})),b.updatePositions(this.prefix),t(document).trigger("djnesting:mutate",[this.$inline]),t(document).trigger("formset:deleted",[n,this.prefix]))},n.undelete=function(e){var i=t(e),n=i.djangoFormPrefix(),o=t("#id_"+n+"DELETE");i.parent().closest("."+this.opts.predeleteClass).length||(i.hasClass("has_original")&&(o.removeAttr("checked"),o.length&&(o[0].checked=!1),i.removeClass(this.opts.predeleteClass)),i.data("alreadyDeleted",!1),i.find(".djn-group").each((function(){var e=t(this),i=e.djangoFormset();e.djangoFormsetForms().each((function(){t(this).data("alreadyDeleted")?t(this).data("alreadyDeleted",!1):i.undelete(this)}))})),i.find(".cropduster-form").each((function(){var e=t(this).djangoFormsetPrefix()+"-0-",i=t("#id_"+e+"DELETE");i.removeAttr("checked"),i.length&&(i[0].checked=!1)})),b.updatePositions(this.prefix),t(document).trigger("djnesting:mutate",[this.$inline]),t(document).trigger("formset:undeleted",[i,this.prefix]))},n.add=function(i,n){var o=this,r=n?t("#"+this.prefix+"-empty-"+n):this._$template,s=r.clone(!0);v(r).find(":data(dependency_ids)").each((function(){var e=t(this).attr("id"),i=s.find("#"+e);v(i).data(t.extend({},i.data(),v(this).data()))}));var a=this.mgmtVal("TOTAL_FORMS"),l=this.mgmtVal("MAX_NUM_FORMS"),h=this.$inline.hasClass("djn-group-nested");t(document).trigger("djnesting:beforeadded",[this.$inline,s]),s.removeClass(this.opts.emptyClass),s.addClass("djn-item"),s.attr("id",s.attr("id").replace(/\-empty.*?$/,"-"+a)),h&&s.append(b.createContainerElement()),b.updateFormAttributes(s,new RegExp('([#_]id_|[\\#]|^id_|"|^)'+d(this.prefix)+"\\-(?:__prefix__|empty)\\-","g"),"$1"+this.prefix+"-"+a+"-");var c=this._$template;if(this.opts.childTypes&&(c=r.closest(".djn-group").find('> .djn-items > [id*="-empty"], > .djn-fieldset > .djn-items > [id*="-empty"]').eq(0)),this.opts.childTypes){var u=this.$inline.djnData("compatibleParents")||{};s.find("> .djn-group").each((function(e,i){var o=t(i).djnData("formsetFkModel"),r=u[n]||[],s=t(i),a=s.djnData("inlineParentModel"),l=!!s.data("inlineFormset").options.childTypes;s.data("inlineFormset").options.prefix,(a!==n||l&&o!==n&&-1===r.indexOf(o))&&(s.find('input[id$="_FORMS"]').each((function(t,e){e.value=0,e.setAttribute("value","0"),i.parentNode.appendChild(e)})),i.parentNode.removeChild(i))}))}if(s.insertBefore(c),this.mgmtVal("TOTAL_FORMS",a+1),l-(a+1)<=0&&this.$inline.find(this.opts.addButtonSelector).parents(".djn-add-item").hide(),b.updatePositions(this.prefix),t.isNumeric(i)?this.spliceInto(s,i,!0):t(document).trigger("djnesting:mutate",[this.$inline]),e&&e.reinitDateTimeFields(v(s)),b.DjangoInlines.initPrepopulatedFields(s),b.DjangoInlines.reinitDateTimeShortCuts(),b.DjangoInlines.updateSelectFilter(s),b.initRelatedFields(this.prefix),b.initAutocompleteFields(this.prefix),w()&&w().jQuery.fn.grp_collapsible){var f=w().jQuery.fn.addBack?"addBack":"andSelf";v(s).find('.grp-collapse:not([id$="-empty"]):not([id*="-empty-"])')[f]().grp_collapsible({toggle_handler_slctr:".grp-collapse-handler:first",closed_css:"closed grp-closed",open_css:"open grp-open",on_toggle:function(){t(document).trigger("djnesting:toggle",[o.$inline])}})}if("function"==typeof t.fn.curated_content_type&&s.find(".curated-content-type-select").each((function(){t(this).curated_content_type()})),this._initializeForm(s),this._bindEvents(s),n){var p=this.$inline.djnData("inlineModel"),m=s.attr("data-inline-model");s.find(".djn-model-"+p).addClass("djn-model-"+m),s.addClass("djn-dynamic-form-"+m)}return s.find('.djn-group[id$="-group"][id^="'+this.prefix+'"][data-inline-formset]:not([id*="-empty"])').each((function(){t(this)[j]()})),t(document).trigger("djnesting:added",[this.$inline,s]),t(document).trigger("formset:added",[s,this.prefix]),s},n._fillGap=function(e,i){var n,o,r=this.$inline.djangoFormsetForms().toArray();r.sort((function(e,i){return t(e).djangoFormIndex()-t(i).djangoFormIndex()})),r.forEach((function(i){var r=t(i);r.djangoFormIndex()<=e||(r.data("isInitial")?n=r:o=r)}));var s=i&&n||o;if(s){var a=s.djangoFormIndex(),l=new RegExp("([\\#_]|^)"+d(this.prefix+"-"+a)+"(?!\\-\\d)");s.attr("id",this.prefix+"-"+e),b.updateFormAttributes(s,l,"$1"+this.prefix+"-"+e),s.find(".djn-group").each((function(){var e=t(this);e.djangoFormset().prefix=e.djangoFormsetPrefix()})),t(document).trigger("djnesting:attrchange",[this.$inline,s]),i&&n&&o&&this._fillGap(a,!1)}},n._makeRoomForInsert=function(){var e=this.mgmtVal("INITIAL_FORMS"),i=this.mgmtVal("TOTAL_FORMS"),n=e,o=t("#"+this.prefix+"-"+n);if(o.length){var r=new RegExp("([\\#_]|^)"+d(this.prefix)+"-"+n+"(?!\\-\\d)");o.attr("id",this.prefix+"-"+i),b.updateFormAttributes(o,r,"$1"+this.prefix+"-"+i),o.find(".djn-group").each((function(){var e=t(this);e.djangoFormset().prefix=e.djangoFormsetPrefix()})),t(document).trigger("djnesting:attrchange",[this.$inline,o])}},n.spliceInto=function(e,i,n){var o,r=this.mgmtVal("INITIAL_FORMS"),s=this.mgmtVal("TOTAL_FORMS"),a=e.djangoFormsetPrefix(),l=this.prefix,h=e.data("isInitial");if(e.djangoFormsetPrefix()==this.prefix){if(e.prevAll(".djn-item:not(.djn-no-drag,.djn-thead)").length===i||void 0===i)return void b.updatePositions(l);this.$inline.find("> .djn-items, > .tabular > .module > .djn-items").find("> .djn-item:not(#"+e.attr("id")+")").eq(i).after(e)}else{var c=t("#"+a+"-group");e.closest(".djn-group").djangoFormsetPrefix()!=l&&this.$inline.find("> .djn-items, > .tabular > .module > .djn-items").find("> .djn-item").eq(i).after(e);var u=c.djangoFormset();if(u.mgmtVal("TOTAL_FORMS",u.mgmtVal("TOTAL_FORMS")-1),u._fillGap(e.djangoFormIndex(),h),h){u.mgmtVal("INITIAL_FORMS",u.mgmtVal("INITIAL_FORMS")-1);var f=this.$inline.parent().closest(".djn-group");if(f.length){var p=this.$inline.closest(".djn-inline-form"),m=(f.djnData("fieldNames")||{}).pk;p.djangoFormField(m).val()||(e.data("isInitial",!1),e.attr("data-is-initial","false"),h=!1,setTimeout((function(){e.find('[name^="'+e.djangoFormPrefix()+'"][name$="-INITIAL_FORMS"]').val("0").trigger("change")}),0))}}h&&this._makeRoomForInsert();var g=new RegExp("([\\#_]|^)"+d(e.attr("id"))+"(?!\\-\\d)");o=h?r:s,e.attr("id",l+"-"+o),b.updateFormAttributes(e,g,"$1"+l+"-"+o),e.find(".djn-group").each((function(){var e=t(this);e.djangoFormset().prefix=e.djangoFormsetPrefix()})),t(document).trigger("djnesting:attrchange",[this.$inline,e]),h&&this.mgmtVal("INITIAL_FORMS",r+1),this.mgmtVal("TOTAL_FORMS",s+1),b.updatePositions(a),t(document).trigger("djnesting:mutate",[c])}b.updatePositions(l),n||t(document).trigger("djnesting:mutate",[this.$inline])},n.mgmtVal=function(t,e){var i=this.$inline.find("#id_"+this.prefix+"-"+t);return void 0===e?parseInt(i.val(),10):parseInt(i.val(e).trigger("change").val(),10)},i}();t.fn[j]=function(){var e,i,n,o=this.eq(0);if(0===arguments.length||1===arguments.length&&"string"!=t.type(arguments[0])){e=arguments[0];var r=o.data(j);return r||(r=new P(o,e),o.data(j,r)),r}if(i=arguments[0],n=t.makeArray(arguments).slice(1),i in P.prototype)return o.data(j)[i](n);throw new Error("Unknown function call "+i+" for $.fn."+j)};var S=P;b.DjangoFormset=S,t(document).ready((function(){t("fieldset.grp-module, fieldset.module").filter((function(t,e){return 0==e.childNodes.length})).css("border-width","0"),t('input[name$="-DELETE"]:checked').not('[name*="__prefix__"]').closest(".djn-inline-form").addClass("grp-predelete"),t(document).on("djnesting:initialized djnesting:mutate",(function(e,i){var n=i.find("> .djn-items, > .tabular > .module > .djn-items").children(".djn-tbody");n.removeClass("row1 row2"),n.each((function(e,i){var n=1+e%2;t(i).addClass("row"+n)}))})),t(".djn-group-root").each((function(e,i){t(i).djangoFormset()})),t("form").on("submit.djnesting",(function(e){t(".djn-group").each((function(){b.updatePositions(t(this).djangoFormsetPrefix()),t(document).trigger("djnesting:mutate",[t(this).djangoFormset().$inline])}))}))}));var I=b}(),window.DJNesting=n}();
+//# sourceMappingURL=nested_admin.min.js.map
\ No newline at end of file
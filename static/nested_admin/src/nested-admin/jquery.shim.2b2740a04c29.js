@@ -0,0 +1 @@
+export default window.django.jQuery;
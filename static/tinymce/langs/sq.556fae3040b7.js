@@ -0,0 +1,219 @@
+tinymce.addI18n('sq',{
+"Cut": "prerje",
+"Heading 5": "titull 5",
+"Header 2": "titull 2",
+"Your browser doesn't support direct access to the clipboard. Please use the Ctrl+X\/C\/V keyboard shortcuts instead.": "Shfletuesi juaj nuk supurton qasje t\u00eb drejtp\u00ebrdrejt\u00eb n\u00eb clipboard. Ju lutemi p\u00ebrdorni Ctrl+X\/C\/V shkurtesat e tastier\u00ebs n\u00eb vend. ",
+"Heading 4": "titull 4",
+"Div": "ndarje",
+"Heading 2": "titull 2",
+"Paste": "ngjit",
+"Close": "Mbylle",
+"Font Family": "soj g\u00ebrmave",
+"Pre": "para",
+"Align right": "Radhit djathtas",
+"New document": "Dokument i ri",
+"Blockquote": "citat",
+"Numbered list": "list\u00eb e num\u00ebruara",
+"Heading 1": "titull 1",
+"Headings": "titull",
+"Increase indent": "rrit gjurm\u00eb",
+"Formats": "form\u00eb",
+"Headers": "titull",
+"Select all": "Selektoj t\u00eb gjitha",
+"Header 3": "titull 3",
+"Blocks": "bllok",
+"Undo": "Anuloj",
+"Strikethrough": "Vij\u00eb nga",
+"Bullet list": "list\u00eb plumb",
+"Header 1": "titull 1",
+"Superscript": "indeks i sip\u00ebrm",
+"Clear formatting": "spastroj formate",
+"Font Sizes": "p\u00ebrmasa e germave",
+"Subscript": "Indeksin e",
+"Header 6": "titull 6",
+"Redo": "rib\u00ebj",
+"Paragraph": "paragraf",
+"Ok": "Ok",
+"Bold": "i zi",
+"Code": "kod",
+"Italic": "kursiv",
+"Align center": "Radhit n\u00eb mes",
+"Header 5": "titull 5",
+"Heading 6": "titull 6",
+"Heading 3": "titull 3",
+"Decrease indent": "ulja gjurm\u00eb",
+"Header 4": "titull 4",
+"Paste is now in plain text mode. Contents will now be pasted as plain text until you toggle this option off.": "Paste is now in plain text mode. Contents will now be pasted as plain text until you toggle this option off.",
+"Underline": "n\u00ebnvizoj",
+"Cancel": "Moho",
+"Justify": "justifikuar",
+"Inline": "nj\u00ebshkolon\u00eb",
+"Copy": "kopjoj",
+"Align left": "Radhit majtas",
+"Visual aids": "ndihm\u00ebsit vizuale",
+"Lower Greek": "Lower Greek",
+"Square": "Katror",
+"Default": "Default",
+"Lower Alpha": "Lower Alpha",
+"Circle": "Rreth",
+"Disc": "Disc",
+"Upper Alpha": "Upper Alpha",
+"Upper Roman": "Upper Roman",
+"Lower Roman": "Lower Roman",
+"Name": "Emri",
+"Anchor": "Anchor",
+"You have unsaved changes are you sure you want to navigate away?": "You have unsaved changes are you sure you want to navigate away?",
+"Restore last draft": "Restore last draft",
+"Special character": "Karakter i veqant",
+"Source code": "Kodi burimor",
+"B": "Kalt\u00ebr",
+"R": "Kuqe",
+"G": "Gjelb\u00ebr",
+"Color": "Ngjyra",
+"Right to left": "Nga e djathta n\u00eb t\u00eb majt\u00eb",
+"Left to right": "Nga e majta n\u00eb t\u00eb djatht\u00eb",
+"Emoticons": "Emoticons",
+"Robots": "Robot\u00ebt",
+"Document properties": "Vetit\u00eb e dokumentit",
+"Title": "Titulli",
+"Keywords": "Fjal\u00ebt kyqe",
+"Encoding": "Encoding",
+"Description": "Description",
+"Author": "Autori",
+"Fullscreen": "Fullscreen",
+"Horizontal line": "Vij\u00eb horizontale",
+"Horizontal space": "Hapsir\u00eb horizontale",
+"Insert\/edit image": "Shto\/ndrysho imazh",
+"General": "General",
+"Advanced": "T\u00eb p\u00ebrparuar",
+"Source": "Burimi",
+"Border": "Border",
+"Constrain proportions": "Constrain proportions",
+"Vertical space": "Hapsir\u00eb vertikale",
+"Image description": "P\u00ebrshkrimi i imazhit",
+"Style": "Stili",
+"Dimensions": "Dimensions",
+"Insert image": "Shto imazh",
+"Zoom in": "Zoom in",
+"Contrast": "Contrast",
+"Back": "Back",
+"Gamma": "Gamma",
+"Flip horizontally": "Flip horizontally",
+"Resize": "Resize",
+"Sharpen": "Sharpen",
+"Zoom out": "Zoom out",
+"Image options": "Image options",
+"Apply": "Apply",
+"Brightness": "Brightness",
+"Rotate clockwise": "Rotate clockwise",
+"Rotate counterclockwise": "Rotate counterclockwise",
+"Edit image": "Edit image",
+"Color levels": "Color levels",
+"Crop": "Crop",
+"Orientation": "Orientation",
+"Flip vertically": "Flip vertically",
+"Invert": "Invert",
+"Insert date\/time": "Insert date\/time",
+"Remove link": "Remove link",
+"Url": "Url",
+"Text to display": "Text to display",
+"Anchors": "Anchors",
+"Insert link": "Insert link",
+"New window": "New window",
+"None": "None",
+"The URL you entered seems to be an external link. Do you want to add the required http:\/\/ prefix?": "The URL you entered seems to be an external link. Do you want to add the required http:\/\/ prefix?",
+"Target": "Target",
+"The URL you entered seems to be an email address. Do you want to add the required mailto: prefix?": "The URL you entered seems to be an email address. Do you want to add the required mailto: prefix?",
+"Insert\/edit link": "Insert\/edit link",
+"Insert\/edit video": "Insert\/edit video",
+"Poster": "Poster",
+"Alternative source": "Alternative source",
+"Paste your embed code below:": "Paste your embed code below:",
+"Insert video": "Insert video",
+"Embed": "Embed",
+"Nonbreaking space": "Nonbreaking space",
+"Page break": "Page break",
+"Paste as text": "Paste as text",
+"Preview": "Preview",
+"Print": "Print",
+"Save": "Save",
+"Could not find the specified string.": "Could not find the specified string.",
+"Replace": "Replace",
+"Next": "Next",
+"Whole words": "Whole words",
+"Find and replace": "Find and replace",
+"Replace with": "Replace with",
+"Find": "Find",
+"Replace all": "Replace all",
+"Match case": "Match case",
+"Prev": "Prev",
+"Spellcheck": "Spellcheck",
+"Finish": "Finish",
+"Ignore all": "Ignore all",
+"Ignore": "Ignore",
+"Add to Dictionary": "Add to Dictionary",
+"Insert row before": "Insert row before",
+"Rows": "Rows",
+"Height": "Height",
+"Paste row after": "Paste row after",
+"Alignment": "Alignment",
+"Border color": "Border color",
+"Column group": "Column group",
+"Row": "Row",
+"Insert column before": "Insert column before",
+"Split cell": "Split cell",
+"Cell padding": "Cell padding",
+"Cell spacing": "Cell spacing",
+"Row type": "Row type",
+"Insert table": "Insert table",
+"Body": "Body",
+"Caption": "Caption",
+"Footer": "Footer",
+"Delete row": "Delete row",
+"Paste row before": "Paste row before",
+"Scope": "Scope",
+"Delete table": "Delete table",
+"H Align": "H Align",
+"Top": "Top",
+"Header cell": "Header cell",
+"Column": "Column",
+"Row group": "Row group",
+"Cell": "Cell",
+"Middle": "Middle",
+"Cell type": "Cell type",
+"Copy row": "Copy row",
+"Row properties": "Row properties",
+"Table properties": "Table properties",
+"Bottom": "Bottom",
+"V Align": "V Align",
+"Header": "Header",
+"Right": "Right",
+"Insert column after": "Insert column after",
+"Cols": "Cols",
+"Insert row after": "Insert row after",
+"Width": "Width",
+"Cell properties": "Cell properties",
+"Left": "Left",
+"Cut row": "Cut row",
+"Delete column": "Delete column",
+"Center": "Center",
+"Merge cells": "Merge cells",
+"Insert template": "Insert template",
+"Templates": "Templates",
+"Background color": "Background color",
+"Custom...": "Custom...",
+"Custom color": "Custom color",
+"No color": "No color",
+"Text color": "Text color",
+"Show blocks": "Show blocks",
+"Show invisible characters": "Show invisible characters",
+"Words: {0}": "Words: {0}",
+"Insert": "Insert",
+"File": "File",
+"Edit": "Edit",
+"Rich Text Area. Press ALT-F9 for menu. Press ALT-F10 for toolbar. Press ALT-0 for help": "Rich Text Area. Press ALT-F9 for menu. Press ALT-F10 for toolbar. Press ALT-0 for help",
+"Tools": "Tools",
+"View": "View",
+"Table": "Table",
+"Format": "Format"
+});
\ No newline at end of file
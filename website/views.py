@@ -4,7 +4,8 @@ Webite public views
 
 from django.views.generic import TemplateView, DetailView
 
-from core.models import Company, FAQConfig, AcceptanceTerm
+from core.company import get_company
+from core.models import FAQConfig, AcceptanceTerm
 from products.models import Product
 from products.views import products as producs_views
 
@@ -25,13 +26,13 @@ class ProducsMixin:
 
         for product in products:
             product.application_info = product.application.application_class.get_application_info(
-                product.application, self.request.theme)
+                product.application, str(self.request.theme))
 
         context['products'] = products
 
         context['categories'] = Product.group_by_category(products)
 
-        if company := Company.objects.all().last():
+        if company := get_company():
             context['company'] = company
         return context
 